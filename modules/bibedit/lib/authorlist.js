@@ -78,6 +78,15 @@ Authorlist.CSS = {
     'Icon'              : 'ui-icon'
 }
 
+/*
+* Variable: Authorlist.CONFLICT_ERROR
+* Purpose:  Error text for changes rejected because the sheet was modified by 
+*           someone else in the meantime.
+*
+*/
+Authorlist.CONFLICT_ERROR = [ 'The sheet was modified by someone else',
+                              'Please reload the sheet and redo your changes' ];
+
 /*
 * Variable: Authorlist.DEFAULT_ERROR
 * Purpose:  Default error text for unsuccessful AJAX requests.
@@ -128,11 +137,13 @@ Authorlist.URLS = {
     'AuthorsXML'        : '/record/edit/authorlist?state=export&format=authorsxml',
     'Clone'             : '/record/edit/authorlist?state=clone',
     'Delete'            : '/record/edit/authorlist?state=delete',
+    'Import'            : '/record/edit/authorlist?state=import',
     'Itemize'           : '/record/edit/authorlist?state=itemize',
     'Latex'             : '/record/edit/authorlist?state=export&format=latex',
     'Load'              : '/record/edit/authorlist?state=load',
     'MainPage'          : '/record/edit/authorlist',
     'Open'              : '/record/edit/authorlist?state=open',
+    'Patch'             : '/record/edit/authorlist?state=patch',
     'Record'            : '/record/edit/authorlist?state=record',
     'Save'              : '/record/edit/authorlist?state=save'
 }
@@ -158,6 +169,8 @@ function Authorlist( sId ) {
     this._nParent.addClass( Authorlist.CSS.Authorlist );
 
     this._sId = this._fnGetId();
+    this._sSaved = null;
+    this._iLastModified = null;
 
     this._oPaper = this._fnCreatePaper( this._nParent );
     this._oAuthors = this._fnCreateAuthors( this._nParent );
@@ -498,6 +511,7 @@ Authorlist.prototype._fnCreateMenu = function( nParent ) {
     var nSave = this._fnCreateButton( nMenu, 'Save', Authorlist.CSS.SaveIcon );
     var nDeleteButton = this._fnCreateButton( nMenu, 'Delete', Authorlist.CSS.DeleteIcon );
     var nAuthorsXML = this._fnCreateButton( nMenu, 'AuthorsXML', Authorlist.CSS.ExportIcon );
+    var nLatex = this._fnCreateButton( nMenu, 'Latex', Authorlist.CSS.ExportIcon );
     var nRecord = this._fnCreateButton( nMenu, 'Record', Authorlist.CSS.ExportIcon );
     
     // Add classes   
@@ -505,6 +519,7 @@ Authorlist.prototype._fnCreateMenu = function( nParent ) {
     nSave.addClass( Authorlist.CSS.Save );
     nDeleteButton.addClass( Authorlist.CSS.Delete );
     nAuthorsXML.addClass( Authorlist.CSS.Export );
+    nLatex.addClass( Authorlist.CSS.Export );
     nRecord.addClass( Authorlist.CSS.Export );
     
     // Register callbacks for the buttons
@@ -579,6 +594,8 @@ Authorlist.prototype._fnDelete = function() {
 * Function: _fnExport
 * Purpose:  Exports the data of the authorlist instance on the server as long as 
 *           there are no errors, which will be displayed in a dialog otherwise.
+*           If the sheet is unchanged since it was loaded or saved, only its id
+*           is sent, so that the server can answer from its export cache.
 * Input(s): node:nButton - the pressed export button
 * Returns:  void
 *
@@ -587,6 +604,7 @@ Authorlist.prototype._fnExport = function( nButton ) {
     nButton = jQuery( nButton );
 
     var oData = this.fnGetData();
+    var sData = JSON.stringify( oData );
     var asErrors = this.fnValidate( oData );
     var sButtonText = nButton.find( '.' + Authorlist.CSS.ButtonText ).text();
     var sURL = Authorlist.URLS[ sButtonText ];
@@ -598,7 +616,12 @@ Authorlist.prototype._fnExport = function( nButton ) {
         nForm.append( nInput );
         nForm.appendTo( jQuery( 'body' ) );
         
-        nInput.val( JSON.stringify( oData ) );
+        if ( this._sId !== null && sData === this._sSaved ) {
+            nForm.attr( 'action', sURL + '&id=' + this._sId );
+            nInput.remove();
+        } else {
+            nInput.val( sData );
+        }
         nForm.submit();
         nForm.remove();
         
@@ -607,6 +630,99 @@ Authorlist.prototype._fnExport = function( nButton ) {
     }
 }
 
+/*
+* Function: _fnDiff
+* Purpose:  Computes the row level patch operations that turn the passed old 
+*           fnGetData() object into the new one. Rows are compared by their 
+*           position, so changed rows become updates, additional rows are 
+*           inserted and missing rows deleted from the end of the tables.
+* Input(s): object:oOld - the fnGetData() object at the last load or save
+*           object:oNew - the current fnGetData() object
+* Returns:  array object:aoPatch - the patch operations
+*
+*/
+Authorlist.prototype._fnDiff = function( oOld, oNew ) {
+    var aoPatch = [];
+    var asPaper = [ 'paper_title', 'collaboration', 'experiment_number' ];
+    
+    for ( var i = 0; i < asPaper.length; i++ ) {
+        if ( oOld[ asPaper[ i ] ] !== oNew[ asPaper[ i ] ] ) {
+            aoPatch.push( { 'op'    : 'update', 
+                            'table' : 'paper', 
+                            'row'   : { 'paper_title'       : oNew.paper_title,
+                                        'collaboration'     : oNew.collaboration,
+                                        'experiment_number' : oNew.experiment_number } } );
+            break;
+        }
+    }
+    
+    this._fnDiffRows( aoPatch, 'reference_ids', oOld.reference_ids, oNew.reference_ids );
+    this._fnDiffRows( aoPatch, 'affiliations', oOld.affiliations, oNew.affiliations );
+    this._fnDiffRows( aoPatch, 'authors', oOld.authors, oNew.authors );
+    
+    return aoPatch;
+}
+
+/*
+* Function: _fnDiffRows
+* Purpose:  Appends the patch operations for one table to the passed patch. See
+*           _fnDiff for details.
+* Input(s): array object:aoPatch - the patch to append the operations to
+*           string:sTable - the name of the table as in fnGetData()
+*           array:aOld - the old rows of the table
+*           array:aNew - the new rows of the table
+* Returns:  void
+*
+*/
+Authorlist.prototype._fnDiffRows = function( aoPatch, sTable, aOld, aNew ) {
+    var iCommon = Math.min( aOld.length, aNew.length );
+    var i;
+    
+    for ( i = 0; i < iCommon; i++ ) {
+        var oRow = this._fnPatchRow( sTable, aOld[ i ], aNew[ i ] );
+        if ( oRow !== null ) {
+            aoPatch.push( { 'op' : 'update', 'table' : sTable, 'index' : i, 'row' : oRow } );
+        }
+    }
+    for ( i = iCommon; i < aNew.length; i++ ) {
+        aoPatch.push( { 'op' : 'insert', 'table' : sTable, 'index' : i, 'row' : aNew[ i ] } );
+    }
+    for ( i = aOld.length - 1; i >= iCommon; i-- ) {
+        aoPatch.push( { 'op' : 'delete', 'table' : sTable, 'index' : i } );
+    }
+}
+
+/*
+* Function: _fnPatchRow
+* Purpose:  Compares an old and a new row of a table ignoring the index and edit
+*           columns. Returns null if they are equal, else the row to be sent. 
+*           Author rows with unchanged affiliations are sent with null 
+*           affiliations, so that the server leaves them untouched.
+* Input(s): string:sTable - the name of the table as in fnGetData()
+*           object:oOld - the old row
+*           object:oNew - the new row
+* Returns:  object:oRow - the row to be sent or null if unchanged
+*
+*/
+Authorlist.prototype._fnPatchRow = function( sTable, oOld, oNew ) {
+    if ( sTable === 'reference_ids' ) {
+        return oOld === oNew ? null : oNew;
+    }
+    if ( JSON.stringify( oOld.slice( 2 ) ) === JSON.stringify( oNew.slice( 2 ) ) ) {
+        return null;
+    }
+    
+    var iAffiliations = Authorlist.INDICES.Affiliations;
+    if ( sTable === 'authors' &&
+         JSON.stringify( oOld[ iAffiliations ] ) === JSON.stringify( oNew[ iAffiliations ] ) ) {
+        var aRow = oNew.slice( 0 );
+        aRow[ iAffiliations ] = null;
+        return aRow;
+    }
+    
+    return oNew;
+}
+
 /*
 * Function: _fnGetId
 * Purpose:  Get the current URL id and returns it, null if not set.
@@ -632,6 +748,56 @@ Authorlist.prototype._fnProgress = function() {
     nBody.addClass( Authorlist.CSS.Progress );
 }
 
+/*
+* Function: _fnPatch
+* Purpose:  Sends only the row level changes since the last load or save to the
+*           server. The server rejects them if the sheet was modified by 
+*           someone else in the meantime, which is shown as an error.
+* Input(s): object:oData - the current fnGetData() object
+*           string:sData - the JSON string of oData
+* Returns:  void
+*
+*/
+Authorlist.prototype._fnPatch = function( oData, sData ) {
+    var self = this;
+    var aoPatch = this._fnDiff( JSON.parse( this._sSaved ), oData );
+    
+    // Nothing changed, nothing to send
+    if ( aoPatch.length === 0 ) return;
+    
+    this._fnProgress();
+    jQuery.ajax( {
+        'type'    : 'POST',
+        'url'     : Authorlist.URLS.Patch + '&id=' + this._sId,
+        'data'    : { 'last_modified' : this._iLastModified,
+                      'patch'         : JSON.stringify( aoPatch ) },
+        'success' : function( oResult ) {
+            self._fnProgressDone();
+            if ( oResult.conflict ) {
+                var sPreamble = 'Could not save data on the server:';
+                self._fnShowErrors( sPreamble, Authorlist.CONFLICT_ERROR );
+                return;
+            }
+            // Rejected by the server side validation? Show its findings
+            if ( oResult.errors ) {
+                var asErrors = jQuery.map( oResult.errors, function( sError ) {
+                    return jQuery( '<div>' ).text( sError ).html();
+                } );
+                self._fnShowErrors( 'The following errors prevent saving:', 
+                                    asErrors );
+                return;
+            }
+            self._iLastModified = oResult.last_modified;
+            self._sSaved = sData;
+        },
+        'error'   : function() {
+            var sPreamble = 'Could not save data on the server:';
+            self._fnProgressDone();
+            self._fnShowErrors( sPreamble, Authorlist.DEFAULT_ERROR );
+        }
+    } );
+}
+
 /*
 * Function: _fnProgressDone
 * Purpose:  Remove the progressing cursor from the body and the loading bar on 
@@ -666,6 +832,8 @@ Authorlist.prototype._fnRetrieve = function( sId ) {
         'url'     : sURL,
         'success' : function( oData ) {
             self.fnLoadData( oData );
+            self._sSaved = JSON.stringify( self.fnGetData() );
+            self._iLastModified = oData.last_modified;
             self._fnProgressDone();
         },
         'error'   : function() {
@@ -686,10 +854,17 @@ Authorlist.prototype._fnRetrieve = function( sId ) {
 */
 Authorlist.prototype._fnSave = function() {
     var oData = this.fnGetData();
+    var sData = JSON.stringify( oData );
     var asErrors = this.fnValidate( oData );
     var self = this;
     
     if ( asErrors.length === 0 ) {
+        // Stored and saved/loaded before? Only send the changes since then
+        if ( this._sId !== null && this._sSaved !== null ) {
+            this._fnPatch( oData, sData );
+            return;
+        }
+    
         sURL = Authorlist.URLS.Save;
         // Append the id of this sheet to the save URL if present
         sURL += this._sId !== null ? '&id=' + this._sId : '';
@@ -699,10 +874,21 @@ Authorlist.prototype._fnSave = function() {
         jQuery.ajax( {
             'type'    : 'POST',
             'url'     : sURL,
-            'data'    : { 'data' : JSON.stringify( oData ) },
+            'data'    : { 'data' : sData },
             'success' : function( oData ) {
                 self._fnProgressDone();
+                // Rejected by the server side validation? Show its findings
+                if ( oData.errors ) {
+                    var asErrors = jQuery.map( oData.errors, function( sError ) {
+                        return jQuery( '<div>' ).text( sError ).html();
+                    } );
+                    self._fnShowErrors( 'The following errors prevent saving:', 
+                                        asErrors );
+                    return;
+                }
                 self._sId = oData.paper_id;
+                self._sSaved = sData;
+                self._iLastModified = oData.last_modified;
             },
             'error'   : function() {
                 var sPreamble = 'Could not save data on the server:';
@@ -932,6 +1118,13 @@ Authorlist.prototype._fnValidateUmbrellas = function( aaoAffiliations, asAcronym
 */
 AuthorlistIndex.TO_MILLIS = 1000;
 
+/*
+* Variable: AuthorlistIndex.IMPORT_ERRORS
+* Purpose:  RegEx that parses the import_errors URL parameter and groups it
+*
+*/
+AuthorlistIndex.IMPORT_ERRORS = /import_errors=([^&]*)/;
+
 /*
 * Variable: AuthorlistIndex.CSS
 * Purpose:  Central enumeration and mapping for the CSS classes used in the 
@@ -945,11 +1138,19 @@ AuthorlistIndex.CSS = {
     'Detail'            : 'AuthorlistIndexDetail',
     'DetailLabel'       : 'AuthorlistIndexDetailLabel',
     'EditLink'          : 'AuthorlistIndexEditLink',
+    'Import'            : 'AuthorlistIndexImport',
+    'ImportIcon'        : 'ui-icon-arrowthickstop-1-n',
     'Link'              : 'AuthorlistIndexLink',
+    'More'              : 'AuthorlistIndexMore',
+    'MoreIcon'          : 'ui-icon-triangle-1-s',
     'Paper'             : 'AuthorlistIndexPaper',
+    'Papers'            : 'AuthorlistIndexPapers',
     'PaperTitle'        : 'AuthorlistIndexPaperTitle',
     'New'               : 'AuthorlistIndexNew',
     'NewIcon'           : 'ui-icon-document',
+    'Search'            : 'AuthorlistIndexSearch',
+    'SearchIcon'        : 'ui-icon-search',
+    'SearchInput'       : 'AuthorlistIndexSearchInput',
     'Seperator'         : 'AuthorlistIndexSeperator',
     'Timestamp'         : 'AuthorlistIndexTimestamp',
     'URL'               : 'AuthorlistIndexURL'
@@ -977,7 +1178,19 @@ function AuthorlistIndex( sId ) {
     this._nParent = jQuery( '#' + sId );
     this._nParent.addClass( AuthorlistIndex.CSS.AuthorlistIndex );
     
-    this._fnRetrieve( this._nParent );
+    // Cursor of the next page and the currently applied search filter
+    this._sCursor = null;
+    this._oFilter = {};
+    
+    this._fnCreateSearch( this._nParent );
+    this._nPapers = jQuery( '<div>' ).addClass( AuthorlistIndex.CSS.Papers );
+    this._nPapers.appendTo( this._nParent );
+    this._fnCreateMoreButton( this._nParent );
+    this._fnCreateNewButton( this._nParent );
+    this._fnCreateImport( this._nParent );
+    
+    this._fnRetrieve( false );
+    this._fnShowImportErrors();
 }
 
 AuthorlistIndex.prototype._fnConfirm = Authorlist.prototype._fnConfirm
@@ -1045,6 +1258,96 @@ AuthorlistIndex.prototype._fnCreateEditLinks = function( nParent, sId ) {
     nParent.append( nClone, nSeperator, nDelete );
 }
 
+/*
+* Function: _fnCreateImport
+* Purpose:  Creates the upload form that imports an authors.xml or CSV file as a
+*           new paper. Collaboration and experiment number override the ones of
+*           the file if given, CSV files need the collaboration. The server 
+*           opens the imported paper right away or returns to this page with 
+*           the errors if the file could not be imported.
+* Input(s): node:nParent - the parent node
+* Returns:  void
+*
+*/
+AuthorlistIndex.prototype._fnCreateImport = function( nParent ) {
+    var self = this;
+    var nForm = jQuery( '<form method="post" enctype="multipart/form-data">' );
+    var nTitle = jQuery( '<input type="text" name="title">' );
+    var nCollaboration = jQuery( '<input type="text" name="collaboration">' );
+    var nExperiment = jQuery( '<input type="text" name="experiment_number">' );
+    var nFile = jQuery( '<input type="file" name="file">' );
+    
+    nForm.attr( 'action', Authorlist.URLS.Import );
+    nForm.addClass( AuthorlistIndex.CSS.Import );
+    nTitle.attr( 'placeholder', 'Paper Title' );
+    nCollaboration.attr( 'placeholder', 'Collaboration' );
+    nExperiment.attr( 'placeholder', 'Experiment Number' );
+    nForm.append( nTitle, nCollaboration, nExperiment, nFile );
+    nForm.appendTo( nParent );
+    
+    var nButton = this._fnCreateButton( nForm, 'Import', 
+                                        AuthorlistIndex.CSS.ImportIcon );
+    nButton.click( function() {
+        if ( nFile.val() !== '' ) {
+            self._fnProgress();
+            nForm.submit();
+        }
+        return false;
+    } );
+}
+
+/*
+* Function: _fnShowImportErrors
+* Purpose:  Shows the errors of a failed import the server passed in the 
+*           import_errors URL parameter as JSON encoded list, if any. The 
+*           messages are plain text and escaped before they are displayed.
+* Input(s): void
+* Returns:  void
+*
+*/
+AuthorlistIndex.prototype._fnShowImportErrors = function() {
+    var aMatch = window.location.search.match( AuthorlistIndex.IMPORT_ERRORS );
+    if ( aMatch === null ) {
+        return;
+    }
+    
+    var asErrors;
+    try {
+        asErrors = JSON.parse( decodeURIComponent( aMatch[ 1 ] ) );
+    } catch ( oError ) {
+        asErrors = [];
+    }
+    if ( !jQuery.isArray( asErrors ) || asErrors.length === 0 ) {
+        asErrors = Authorlist.DEFAULT_ERROR;
+    }
+    
+    asErrors = jQuery.map( asErrors, function( sError ) {
+        return jQuery( '<span>' ).text( String( sError ) ).html();
+    } );
+    this._fnShowErrors( 'Could not import paper:', asErrors );
+}
+
+/*
+* Function: _fnCreateMoreButton
+* Purpose:  Creates the button that loads the next page of papers and appends 
+*           them to the already displayed ones. The button is hidden as long as 
+*           there is no further page.
+* Input(s): node:nParent - the parent node
+* Returns:  void
+*
+*/
+AuthorlistIndex.prototype._fnCreateMoreButton = function( nParent ) {
+    var self = this;
+    this._nMore = this._fnCreateButton( nParent, 'More', 
+                                        AuthorlistIndex.CSS.MoreIcon );
+                                        
+    this._nMore.addClass( AuthorlistIndex.CSS.More );
+    this._nMore.click( function() {
+        self._fnRetrieve( true );
+    } );
+    this._nMore.hide();
+}
+
 /*
 * Function: _fnCreateNewButton
 * Purpose:  Creates the new button that allows users to create a new document. 
@@ -1144,6 +1447,44 @@ AuthorlistIndex.prototype._fnCreatePaperDetail = function( sLabel, sDetail ) {
     return nWrapper;
 }
 
+/*
+* Function: _fnCreateSearch
+* Purpose:  Creates the search bar above the list of papers. It allows to filter
+*           the papers by a part of their title and by their exact collaboration
+*           and experiment number. Starting a search, either by clicking the 
+*           search button or pressing enter in one of the inputs, reloads the 
+*           list from its first page.
+* Input(s): node:nParent - the parent node
+* Returns:  void
+*
+*/
+AuthorlistIndex.prototype._fnCreateSearch = function( nParent ) {
+    var self = this;
+    var nSearch = jQuery( '<div>' ).addClass( AuthorlistIndex.CSS.Search );
+    var oInputs = {
+        'title'             : 'Title',
+        'collaboration'     : 'Collaboration',
+        'experiment_number' : 'Experiment Number'
+    };
+    
+    for ( var sKey in oInputs ) {
+        var nInput = jQuery( '<input type="text">' );
+        nInput.attr( 'name', sKey );
+        nInput.attr( 'title', oInputs[ sKey ] );
+        nInput.attr( 'placeholder', oInputs[ sKey ] );
+        nInput.addClass( AuthorlistIndex.CSS.SearchInput );
+        nInput.keyup( function( event ) {
+            if ( event.keyCode === 13 ) self._fnSearch( nSearch );
+        } );
+        nSearch.append( nInput );
+    }
+    nParent.append( nSearch );
+    
+    var nButton = this._fnCreateButton( nSearch, 'Search', 
+                                        AuthorlistIndex.CSS.SearchIcon );
+    nButton.click( function() { self._fnSearch( nSearch ) } );
+}
+
 /*
 * Function: _fnDeleteClicked
 * Purpose:  Defines the callback for clicking a delete link. On confirmation by 
@@ -1183,28 +1524,33 @@ AuthorlistIndex.prototype._fnDeleteClicked = function( nPaper, sId ) {
 /*
 * Function: _fnDisplay
 * Purpose:  Displays each of the passed papers in the oData object on the 
-*           nParent element.
-* Input(s): object:oData - the object containing all papers
+*           nParent element. Remembers the cursor of the next page and only 
+*           shows the more button if there is one.
+* Input(s): object:oData - the object containing one page of papers
 *           node:nParent - the element to display the papers on
+*           boolean:bAppend - whether the page is appended to the displayed 
+*                             papers or replaces them
 * Returns:  void
 *
 */
-AuthorlistIndex.prototype._fnDisplay = function( oData, nParent ) {
+AuthorlistIndex.prototype._fnDisplay = function( oData, nParent, bAppend ) {
     var oPapers = oData.data;
     
+    if ( !bAppend ) nParent.empty();
+    this._sCursor = oData.next;
+    this._nMore.toggle( this._sCursor !== null );
+    
     // No records available? Display a short note telling this
-    if ( oPapers.length === 0 ) {
+    if ( oPapers.length === 0 && !bAppend ) {
         this._fnDisplayEmptyDatabase( nParent );
         return
     }
     
     // Records available? Display them
-    var nPapers = jQuery( '<div>' );
     for ( var i = 0, iLen = oPapers.length; i < iLen; i++ ) {
         var nPaper = this._fnCreatePaper( oPapers[ i ] );
-        nPapers.append( nPaper );
+        nParent.append( nPaper );
     }
-    nPapers.appendTo( nParent );
 }
 
 /*
@@ -1231,8 +1577,12 @@ AuthorlistIndex.prototype._fnDisplayClonedPaper = function( nParent, oData ) {
 */
 AuthorlistIndex.prototype._fnDisplayEmptyDatabase = function( nParent ) {
     var nEmpty = jQuery( '<div>' );
+    var bFiltered = false;
+    
+    for ( var sKey in this._oFilter ) bFiltered = true;
 
-    nEmpty.html( 'No records in the database.' );
+    nEmpty.html( bFiltered ? 'No matching records.' 
+                           : 'No records in the database.' );
     nEmpty.addClass( AuthorlistIndex.CSS.Paper );
     nEmpty.appendTo( nParent );
 }
@@ -1265,23 +1615,30 @@ AuthorlistIndex.prototype._fnRemovePaper = function( nParent ) {
 
 /*
 * Function: _fnRetrieve
-* Purpose:  Retrieves all available papers from the database and displays them 
-*           nicely on the webpage on success.
-* Input(s): node:nParent - the parent element where to display the records
+* Purpose:  Retrieves a page of papers matching the current search filter from 
+*           the database and displays them nicely on the webpage on success. 
+* Input(s): boolean:bAppend - whether to retrieve the next page and append it to
+*                             the displayed papers or to start from the first 
+*                             page again
 * Returns:  void
 *
 */
-AuthorlistIndex.prototype._fnRetrieve = function( nParent ) {
+AuthorlistIndex.prototype._fnRetrieve = function( bAppend ) {
     var self = this;
+    var oParameters = jQuery.extend( {}, this._oFilter );
+    
+    if ( bAppend && this._sCursor !== null ) {
+        oParameters.cursor = this._sCursor;
+    }
 
     this._fnProgress();
     jQuery.ajax( {
         'type'    : 'GET',
         'url'     : Authorlist.URLS.Itemize,
+        'data'    : oParameters,
         'success' : function( oData ) {
             self._fnProgressDone();
-            self._fnDisplay( oData, nParent );
-            self._fnCreateNewButton( nParent );
+            self._fnDisplay( oData, self._nPapers, bAppend );
         },
         'error'   : function() {
             var sPreamble = 'Cannot display all papers:'
@@ -1291,6 +1648,28 @@ AuthorlistIndex.prototype._fnRetrieve = function( nParent ) {
     } );
 }
 
+/*
+* Function: _fnSearch
+* Purpose:  Reads the search filter from the inputs of the search bar and 
+*           reloads the list of papers from its first page. Empty inputs are 
+*           not part of the filter.
+* Input(s): node:nSearch - the search bar containing the filter inputs
+* Returns:  void
+*
+*/
+AuthorlistIndex.prototype._fnSearch = function( nSearch ) {
+    var oFilter = {};
+    
+    nSearch.find( '.' + AuthorlistIndex.CSS.SearchInput ).each( function() {
+        var nInput = jQuery( this );
+        var sValue = jQuery.trim( nInput.val() );
+        
+        if ( sValue !== '' ) oFilter[ nInput.attr( 'name' ) ] = sValue;
+    } );
+    this._oFilter = oFilter;
+    this._fnRetrieve( false );
+}
+
 /*
 * Function: _fnShowErrors
 * Purpose:  Method to display standard errors. We are doing the same as author-
@@ -0,0 +1,391 @@
+# -*- coding: utf-8 -*-
+##
+## This file is part of Invenio.
+## Copyright (C) 2011 CERN.
+##
+## Invenio is free software; you can redistribute it and/or
+## modify it under the terms of the GNU General Public License as
+## published by the Free Software Foundation; either version 2 of the
+## License, or (at your option) any later version.
+##
+## Invenio is distributed in the hope that it will be useful, but
+## WITHOUT ANY WARRANTY; without even the implied warranty of
+## MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+## General Public License for more details.
+##
+## You should have received a copy of the GNU General Public License
+## along with Invenio; if not, write to the Free Software Foundation, Inc.,
+## 59 Temple Place, Suite 330, Boston, MA 02111-1307, USA.
+
+"""
+Benchmarks for the Invenio Authorlist subsystem. Run this module directly to
+time the whole editing cycle of synthetic collaborations - save of a new
+paper, load, edit, save of the changes, patch, export, clone, materialise and
+delete - against the configured Invenio database. For each stage the number
+of SQL round trips, the wall time and the peak memory are reported:
+
+   $ python authorlist_benchmark.py [-s 100,1000,10000] [-j]
+
+Scratch papers are created for the run and deleted afterwards. With -j the
+results are printed as one JSON object per line so that they can be kept and
+compared across releases. The streaming AuthorsXML converter can still be
+compared with the minidom based one on its own:
+
+   $ python authorlist_benchmark.py -x [number_of_authors]
+"""
+
+__revision__ = "$Id$"
+
+import os
+import sys
+import time
+import getopt
+import resource
+import marshal
+import traceback
+import simplejson as json
+
+import invenio.authorlist_config as cfg
+from invenio.config import CFG_MISCUTIL_SQL_RUN_SQL_MANY_LIMIT
+from invenio import authorlist_dblayer
+from invenio import authorlist_engine
+
+STATUSES = ['Affiliated with', 'Also at', 'On leave from']
+SIZES = [100, 1000, 10000]
+EDITS = 10
+EXPORT_FORMATS = ['authorsxml', 'latex']
+
+class NullStream(object):
+    """File like object discarding everything written to it."""
+    def write(self, data):
+        pass
+
+def generate_paper(number_of_authors, number_of_affiliations=None):
+    """
+    Generates the JSON data dictionary of a synthetic collaboration paper with
+    the passed number of authors. Unless specified, there is one affiliation
+    per twenty authors. Each author gets one to three affiliations.
+    """
+    if number_of_affiliations is None:
+        number_of_affiliations = max(1, number_of_authors / 20)
+
+    affiliations = []
+    for index in range(number_of_affiliations):
+        affiliations.append([index + 1, '', u'INST%d' % index, u'',
+                             u'Institut N\xb0%d, Gen\xe8ve & Co' % index,
+                             u'inst%d.example.org' % index, index % 5 != 0,
+                             u'ICN%d' % index])
+
+    authors = []
+    for index in range(number_of_authors):
+        author_affiliations = []
+        for offset in range(index % 3 + 1):
+            acronym = u'INST%d' % ((index + offset) % number_of_affiliations)
+            author_affiliations.append([acronym, STATUSES[offset]])
+        authors.append([index + 1, '', u'M\xfcller%d' % index, u'J.',
+                        u'J. M\xfcller%d' % index, index % 97 != 0,
+                        author_affiliations, u'INSPIRE-%08d' % index])
+
+    return {cfg.JSON.PAPER_TITLE       : u'Observation of a synthetic boson',
+            cfg.JSON.COLLABORATION     : u'SYNTHETIC',
+            cfg.JSON.EXPERIMENT_NUMBER : u'CERN-SYN-1',
+            cfg.JSON.LAST_MODIFIED     : int(time.time()),
+            cfg.JSON.REFERENCE_IDS     : [u'arXiv:1111.0001'],
+            cfg.JSON.AFFILIATIONS_KEY  : affiliations,
+            cfg.JSON.AUTHORS_KEY       : authors}
+
+class QueryCounter(object):
+    """
+    Counts the SQL round trips of the Authorlist database layer by wrapping
+    its run_sql and run_sql_many functions while installed. A run_sql_many
+    call is counted once per statement actually sent to the server, i.e. once
+    per CFG_MISCUTIL_SQL_RUN_SQL_MANY_LIMIT parameter tuples.
+    """
+    def __init__(self):
+        self.queries = 0
+        self.original = None
+
+    def install(self):
+        self.original = (authorlist_dblayer.run_sql,
+                         authorlist_dblayer.run_sql_many)
+        run_sql, run_sql_many = self.original
+
+        def counting_run_sql(*args, **kwargs):
+            self.queries += 1
+            return run_sql(*args, **kwargs)
+
+        def counting_run_sql_many(query, params, *args, **kwargs):
+            limit = kwargs.get('limit', CFG_MISCUTIL_SQL_RUN_SQL_MANY_LIMIT)
+            if (args):
+                limit = args[0]
+            self.queries += (len(params) + limit - 1) / limit
+            return run_sql_many(query, params, *args, **kwargs)
+
+        authorlist_dblayer.run_sql = counting_run_sql
+        authorlist_dblayer.run_sql_many = counting_run_sql_many
+
+    def uninstall(self):
+        if (self.original is not None):
+            authorlist_dblayer.run_sql, authorlist_dblayer.run_sql_many = \
+                self.original
+            self.original = None
+
+def run_forked(function, *args):
+    """
+    Runs the passed function with the given arguments in a forked child process
+    and returns its result, which has to be serializable by marshal. Forking
+    isolates the memory peak of each run from the one of the benchmark process
+    itself. The child gets its own database connection and leaves without
+    running any cleanup so that the connection of the parent stays usable.
+    Raises a RuntimeError holding the traceback if the function failed.
+    """
+    read_end, write_end = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        try:
+            os.close(read_end)
+            try:
+                result = (True, function(*args))
+            except:
+                result = (False, traceback.format_exc())
+            os.write(write_end, marshal.dumps(result))
+            os.close(write_end)
+        finally:
+            os._exit(0)
+
+    os.close(write_end)
+    result = ''
+    while True:
+        piece = os.read(read_end, 4096)
+        if not piece:
+            break
+        result += piece
+    os.close(read_end)
+    os.waitpid(pid, 0)
+    if not result:
+        raise RuntimeError('The benchmark child process died')
+    success, value = marshal.loads(result)
+    if not success:
+        raise RuntimeError(value)
+    return value
+
+def profile(function, *args):
+    """
+    Runs the passed function with the given arguments and returns a tuple of
+    the number of SQL round trips of the Authorlist database layer, the wall
+    time in seconds, the peak resident memory of the process in kilobytes and
+    the result of the function. Meant to be run in a child process, see
+    run_forked().
+    """
+    counter = QueryCounter()
+    counter.install()
+    try:
+        start = time.time()
+        value = function(*args)
+        elapsed = time.time() - start
+    finally:
+        counter.uninstall()
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return counter.queries, elapsed, peak, value
+
+def measure(function, *args):
+    """
+    Runs the passed function with the given arguments in a forked child process
+    and returns a tuple of the wall time in seconds and the peak resident
+    memory of the child in kilobytes.
+    """
+    queries, elapsed, peak, value = run_forked(profile, function, *args)
+    return elapsed, peak
+
+def edit_paper(data, number_of_edits=EDITS):
+    """
+    Applies a typical editing session to a copy of the passed paper - renaming
+    number_of_edits authors spread over the list, inserting an author in the
+    middle and removing the last one. Returns a tuple of the edited data
+    dictionary and the same edits as list of patch operations (see
+    authorlist_dblayer.patch()).
+    """
+    authors = [list(author) for author in data[cfg.JSON.AUTHORS_KEY]]
+    operations = []
+    if not authors:
+        return dict(data), operations
+
+    step = max(1, len(authors) / number_of_edits)
+    for index in range(0, len(authors), step)[:number_of_edits]:
+        author = authors[index]
+        author[cfg.JSON.FAMILY_NAME] += u'-Edited'
+        author[cfg.JSON.PAPER_NAME] += u'-Edited'
+        operations.append({cfg.Patch.OPERATION : cfg.Patch.UPDATE,
+                           cfg.Patch.TABLE     : cfg.JSON.AUTHORS_KEY,
+                           cfg.Patch.INDEX     : index,
+                           cfg.Patch.ROW       : author})
+
+    middle = len(authors) / 2
+    inserted = list(authors[middle])
+    inserted[cfg.JSON.FAMILY_NAME] = u'Newcomer'
+    inserted[cfg.JSON.PAPER_NAME] = u'J. Newcomer'
+    inserted[cfg.JSON.INSPIRE_ID] = u''
+    authors.insert(middle, inserted)
+    operations.append({cfg.Patch.OPERATION : cfg.Patch.INSERT,
+                       cfg.Patch.TABLE     : cfg.JSON.AUTHORS_KEY,
+                       cfg.Patch.INDEX     : middle,
+                       cfg.Patch.ROW       : inserted})
+
+    authors.pop()
+    operations.append({cfg.Patch.OPERATION : cfg.Patch.DELETE,
+                       cfg.Patch.TABLE     : cfg.JSON.AUTHORS_KEY,
+                       cfg.Patch.INDEX     : len(authors)})
+
+    edited = dict(data)
+    edited[cfg.JSON.AUTHORS_KEY] = authors
+    return edited, operations
+
+def stage_load(paper_id):
+    """Loads the paper as the editor does and serializes it to JSON."""
+    return len(json.dumps(authorlist_dblayer.load(paper_id)))
+
+def stage_edit(data):
+    """Applies the benchmark edits to the paper in memory."""
+    return len(edit_paper(data)[1])
+
+def stage_patch(paper_id, operations):
+    """
+    Writes the benchmark edits as patch on top of the stored paper, validating
+    the patched rows like the editor's patch requests do.
+    """
+    last_modified = authorlist_dblayer.load_last_modified(paper_id)
+    return authorlist_dblayer.patch(paper_id, last_modified, operations,
+                                    authorlist_engine.validate_patch)
+
+def stage_export(paper_id, format):
+    """Loads the paper and converts it in the passed export format."""
+    data = json.dumps(authorlist_dblayer.load(paper_id))
+    authorlist_engine.dump(data, authorlist_engine.Converters.get(format),
+                           NullStream())
+
+def stage_clone(paper_id, copy_on_write):
+    """Clones the paper and returns the id of the clone."""
+    return authorlist_dblayer.clone(paper_id,
+                                    copy_on_write)[cfg.JSON.PAPER_ID]
+
+def benchmark_pipeline(number_of_authors):
+    """
+    Runs the editing cycle of a synthetic paper with the given number of
+    authors against the configured database, each stage in its own child
+    process. Returns a list of (stage, SQL round trips, seconds, peak
+    kilobytes) tuples. The papers created on the way are deleted again.
+    """
+    results = []
+
+    def run(stage, function, *args):
+        queries, elapsed, peak, value = run_forked(profile, function, *args)
+        results.append((stage, queries, elapsed, peak))
+        return value
+
+    data = generate_paper(number_of_authors)
+    paper_id = run('save new', authorlist_dblayer.save, None,
+                   data)[cfg.JSON.PAPER_ID]
+    patch_id = None
+    try:
+        run('load', stage_load, paper_id)
+        run('edit', stage_edit, data)
+        edited, operations = edit_paper(data)
+        run('save changes', authorlist_dblayer.save, paper_id, edited)
+        # the edits are patched onto an unedited copy of the paper, which is
+        # stored without being measured
+        patch_id = run_forked(authorlist_dblayer.save, None,
+                              data)[cfg.JSON.PAPER_ID]
+        patched = run('patch', stage_patch, patch_id, operations)
+        if cfg.JSON.LAST_MODIFIED not in patched:
+            raise RuntimeError('The benchmark patch was rejected: %s' %
+                               repr(patched))
+        for format in EXPORT_FORMATS:
+            run('export %s' % format, stage_export, paper_id, format)
+        clone_id = run('clone', stage_clone, paper_id, True)
+        run('materialise', authorlist_dblayer.materialise, clone_id)
+        run('delete clone', authorlist_dblayer.delete, clone_id)
+        clone_id = run('clone copy', stage_clone, paper_id, False)
+        run('delete clone copy', authorlist_dblayer.delete, clone_id)
+    finally:
+        if patch_id is not None:
+            run_forked(authorlist_dblayer.delete, patch_id)
+        run('delete', authorlist_dblayer.delete, paper_id)
+
+    return results
+
+def benchmark_authorsxml(number_of_authors=5000):
+    """
+    Converts a synthetic paper with the given number of authors with both the
+    streaming and the minidom AuthorsXML converter. Returns a list of
+    (converter name, seconds, peak kilobytes) tuples.
+    """
+    data = json.dumps(generate_paper(number_of_authors))
+    results = []
+    for converter in (authorlist_engine.AuthorsXML,
+                      authorlist_engine.AuthorsXMLDOM):
+        elapsed, peak = measure(authorlist_engine.dump, data, converter,
+                                NullStream())
+        results.append((converter.__name__, elapsed, peak))
+    return results
+
+def print_pipeline(sizes, as_json=False):
+    """
+    Runs the pipeline benchmark for each of the passed numbers of authors and
+    prints one line per stage, either as table or as JSON objects.
+    """
+    if not as_json:
+        print "%7s %-20s %8s %10s %12s" % ('authors', 'stage', 'queries',
+                                           'seconds', 'peak kB')
+    for number_of_authors in sizes:
+        for stage, queries, elapsed, peak in \
+                benchmark_pipeline(number_of_authors):
+            if as_json:
+                print json.dumps({'authors' : number_of_authors,
+                                  'stage'   : stage,
+                                  'queries' : queries,
+                                  'seconds' : round(elapsed, 6),
+                                  'peak_kb' : peak})
+            else:
+                print "%7d %-20s %8d %10.3f %12d" % (number_of_authors, stage,
+                                                     queries, elapsed, peak)
+        sys.stdout.flush()
+
+def print_authorsxml(number_of_authors):
+    """Runs the AuthorsXML benchmark and prints its results."""
+    print "AuthorsXML conversion of %d authors" % number_of_authors
+    for name, elapsed, peak in benchmark_authorsxml(number_of_authors):
+        print "%-15s %8.3f s %10d kB peak" % (name, elapsed, peak)
+
+def main():
+    """Parses the command line and runs the requested benchmark."""
+    try:
+        opts, args = getopt.getopt(sys.argv[1:], 'hs:jx',
+                                   ['help', 'sizes=', 'json', 'authorsxml'])
+        sizes = SIZES
+        as_json = False
+        authorsxml = False
+        for opt, value in opts:
+            if opt in ('-h', '--help'):
+                print __doc__
+                return
+            elif opt in ('-s', '--sizes'):
+                sizes = [int(size) for size in value.split(',')]
+            elif opt in ('-j', '--json'):
+                as_json = True
+            elif opt in ('-x', '--authorsxml'):
+                authorsxml = True
+    except (getopt.GetoptError, ValueError), err:
+        sys.stderr.write('%s\n' % err)
+        print __doc__
+        sys.exit(1)
+
+    if authorsxml:
+        number_of_authors = 5000
+        if args:
+            number_of_authors = int(args[0])
+        print_authorsxml(number_of_authors)
+    else:
+        print_pipeline(sizes, as_json)
+
+if __name__ == '__main__':
+    main()
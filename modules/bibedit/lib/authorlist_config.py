@@ -2,6 +2,12 @@ import re
 
 EMPTY                  = re.compile('^\s*$')
 UNDEFINED              = 'UNDEFINED'
+CHUNK_SIZE             = 500
+RENDER_CACHE_SIZE      = 10
+PAGE_SIZE              = 50
+MAX_PAGE_SIZE          = 500
+CURSOR_SEPARATOR       = '-'
+CLONE_COPY_ON_WRITE    = True
 
 class Resources:
     SCRIPTS            = ['jquery.min.js',
@@ -23,9 +29,13 @@ class JSON:
     AFFILIATIONS_KEY    = 'affiliations'
     AUTHORS_KEY         = 'authors'
     COLLABORATION       = 'collaboration'
+    CONFLICT            = 'conflict'
+    ERRORS              = 'errors'
     EXPERIMENT_NUMBER   = 'experiment_number'
     PAPER_ID            = 'paper_id'
     LAST_MODIFIED       = 'last_modified'
+    MATERIALISED        = 'materialised'
+    NEXT_CURSOR         = 'next'
     PAPER_TITLE         = 'paper_title'
     REFERENCE_IDS       = 'reference_ids'
 
@@ -51,6 +61,23 @@ class JSON:
     MEMBER              = 6
     SPIRES_ID           = 7
     
+class Patch:
+    # Keys of a patch operation
+    OPERATION           = 'op'
+    TABLE               = 'table'
+    INDEX               = 'index'
+    ROW                 = 'row'
+    TO                  = 'to'
+    
+    # Operations
+    INSERT              = 'insert'
+    UPDATE              = 'update'
+    DELETE              = 'delete'
+    MOVE                = 'move'
+    
+    # Table of the general paper information, only supports updates
+    PAPER               = 'paper'
+    
 class AuthorsXML:
     COLLABORATION_ID    = 'c1'
     DECEASED            = 'Deceased'
@@ -60,3 +87,43 @@ class AuthorsXML:
     ORGANIZATION_ID     = 'o'
     SPIRES              = 'SPIRES'
     TIME_FORMAT         = '%Y-%m-%d_%H:%M'
+    
+class Validation:
+    TITLE_MISSING       = 'Paper title required'
+    COLLABORATION_MISSING = 'Collaboration name required'
+    ACRONYMS_MISSING    = 'Affiliation acronym missing in line(s): %s'
+    NAMES_MISSING       = 'Affiliation name and address missing in line(s): %s'
+    DUPLICATE_ACRONYMS  = 'Duplicate affiliation acronym in line(s): %s'
+    UNKNOWN_UMBRELLAS   = 'Unknown umbrella organization in line(s): %s'
+    PAPER_NAMES_MISSING = 'Author paper name missing in line(s): %s'
+    UNKNOWN_ACRONYMS    = 'Unknown affiliation acronyms: %s'
+    UNUSED_ACRONYMS     = 'Unused acronyms: %s'
+    
+class Export:
+    INCOMPLETE          = 'Export failed, the output is incomplete'
+    
+class Import:
+    AFFILIATED          = 'Affiliated with'
+    AUTHORSXML          = 'authorsxml'
+    CSV                 = 'csv'
+    DECEASED            = ['0', 'false', 'no', 'deceased']
+    EXTENSIONS          = {'.xml' : 'authorsxml',
+                           '.csv' : 'csv'}
+    FAILED              = 'The file could not be imported'
+    AFFILIATION_SEPARATOR = ';'
+    STATUS_SEPARATOR    = ':'
+    
+class NA62Latex:
+    AFFILIATED          = 'Affiliated with'
+    DECEASED_SYMBOL     = '\\dagger'
+    ESCAPES             = {'\\' : '\\textbackslash{}',
+                           '{'  : '\\{',
+                           '}'  : '\\}',
+                           '$'  : '\\$',
+                           '&'  : '\\&',
+                           '#'  : '\\#',
+                           '%'  : '\\%',
+                           '_'  : '\\_',
+                           '^'  : '\\^{}',
+                           '~'  : '\\~{}'}
+    SPECIAL             = re.compile(r'[\\{}$&#%_^~]')
@@ -1,7 +1,20 @@
 import time
 import invenio.authorlist_config as cfg
 
-from invenio.dbquery import run_sql
+from invenio.config import CFG_MISCUTIL_SQL_RUN_SQL_MANY_LIMIT
+from invenio.dbquery import run_sql, run_sql_many
+
+# Value columns of the authorlist tables in the order of the JSON rows
+REFERENCE_COLUMNS          = ('reference',)
+AFFILIATION_COLUMNS        = ('acronym', 'umbrella', 'name_and_address', 
+                              'domain', 'member', 'spires_id')
+AUTHOR_COLUMNS             = ('family_name', 'given_name', 'name_on_paper', 
+                              'alive', 'inspire_id')
+AUTHOR_AFFILIATION_COLUMNS = ('affiliation_acronym', 'affiliation_status')
+
+# Tables holding the rows of a paper, shared by copy-on-write clones
+ROW_TABLES                 = ('aulREFERENCES', 'aulAFFILIATIONS', 'aulAUTHORS', 
+                              'aulAUTHOR_AFFILIATIONS')
 
 def now():
     """
@@ -9,43 +22,60 @@ def now():
     """
     return int(time.time())
 
-def clone(paper_id):
+def clone(paper_id, copy_on_write=cfg.CLONE_COPY_ON_WRITE):
     """
     Clones a whole paper data having the given id and returns the paper 
     information of the clone as a dictionary. If the paper_id was a falsy value 
     (None usually) or the id of the paper to be cloned does not exist in the 
     database. The function will create a new empty record, save it and return it
-    instead.
+    instead. In copy-on-write mode only the general paper information is 
+    copied, the clone references the references, affiliations and authors of 
+    the paper it was cloned from until one of both papers is modified - see 
+    detach(). Cloning is then a single statement, independent of the size of 
+    the author list. Otherwise all rows are copied right away.
     """
     data = {}
-    clone_id = clone_paper(paper_id)
+    
+    lock_tables()
+    try:
+        clone_id = clone_paper(paper_id, copy_on_write)
+        if (clone_id and not copy_on_write):
+            rows_id = rows_paper_id(paper_id)
+            clone_references(rows_id, clone_id)
+            clone_affiliations(rows_id, clone_id)
+            clone_authors(rows_id, clone_id)
+    finally:
+        unlock_tables()
     
     if (clone_id == 0):
         data = load(None)
-        clone_id = save(None, data)
-    else:
-        clone_references(paper_id, clone_id)
-        clone_affiliations(paper_id, clone_id)
-        clone_authors(paper_id, clone_id)
+        clone_id = save(None, data)[cfg.JSON.PAPER_ID]
     
     load_paper(clone_id, data)
     data[cfg.JSON.PAPER_ID] = clone_id
     
     return data
     
-def clone_paper(paper_id):
+def clone_paper(paper_id, copy_on_write=False):
     """
     Clones the general paper information - i.e. title, collaboration and 
     experiment number. Furthermore, the last modified timestamp will be set 
-    to the current time. All of this is only done, if the requested paper id 
+    to the current time. In copy-on-write mode the clone is made a child of the
+    paper owning the rows of the cloned one, so that clones of clones share the
+    same rows as well. All of this is only done, if the requested paper id 
     was found in the database, otherwise 0 is returned. This function 
     should NOT be called alone as long as you are really sure that you want 
     to do this. Refer to clone() instead.
     """
+    parent = '0'
+    if (copy_on_write):
+        parent = 'IF(parent_id = 0, id, parent_id)'
+        
     return run_sql("""INSERT INTO aulPAPERS (id, title, collaboration, 
-                      experiment_number, last_modified) SELECT %s, title, 
-                      collaboration, experiment_number, %s FROM aulPAPERS 
-                      WHERE id = %s;""", (None, now(), paper_id,))
+                      experiment_number, last_modified, parent_id) SELECT %%s, 
+                      title, collaboration, experiment_number, %%s, %s 
+                      FROM aulPAPERS AS source_papers 
+                      WHERE id = %%s;""" % parent, (None, now(), paper_id,))
                           
 def clone_references(paper_id, clone_id):
     """
@@ -55,8 +85,8 @@ def clone_references(paper_id, clone_id):
     want to do this. Have a look on clone() instead.
     """
     run_sql("""INSERT INTO aulREFERENCES (item, reference, paper_id) 
-               SELECT item, reference, %s FROM aulREFERENCES 
-               WHERE paper_id = %s;""", (clone_id, paper_id,))
+               SELECT item, reference, %s 
+               FROM aulREFERENCES AS source_references WHERE paper_id = %s;""", (clone_id, paper_id,))
     return clone_id
                
 def clone_affiliations(paper_id, clone_id):
@@ -69,8 +99,8 @@ def clone_affiliations(paper_id, clone_id):
     run_sql("""INSERT INTO aulAFFILIATIONS (item, acronym, umbrella, 
                name_and_address, domain, member, spires_id, paper_id) 
                SELECT item, acronym, umbrella, name_and_address, 
-               domain, member, spires_id, %s FROM aulAFFILIATIONS 
-               WHERE paper_id = %s;""", (clone_id, paper_id,))
+               domain, member, spires_id, %s 
+               FROM aulAFFILIATIONS AS source_affiliations WHERE paper_id = %s;""", (clone_id, paper_id,))
     return clone_id
                
 def clone_authors(paper_id, clone_id):
@@ -84,8 +114,7 @@ def clone_authors(paper_id, clone_id):
     run_sql("""INSERT INTO aulAUTHORS (item, family_name, given_name, 
                name_on_paper, alive, inspire_id, paper_id) 
                SELECT item, family_name, given_name, name_on_paper, 
-               alive, inspire_id, %s FROM aulAUTHORS 
-               WHERE paper_id = %s;""", (clone_id, paper_id,))
+               alive, inspire_id, %s FROM aulAUTHORS AS source_authors WHERE paper_id = %s;""", (clone_id, paper_id,))
     clone_author_affiliations(paper_id, clone_id)
     return clone_id
     
@@ -99,23 +128,125 @@ def clone_author_affiliations(paper_id, clone_id):
     run_sql("""INSERT INTO aulAUTHOR_AFFILIATIONS (item, affiliation_acronym, 
                affiliation_status, author_item, paper_id) 
                SELECT item, affiliation_acronym, affiliation_status, 
-               author_item, %s FROM aulAUTHOR_AFFILIATIONS 
+               author_item, %s 
+               FROM aulAUTHOR_AFFILIATIONS AS source_author_affiliations 
                WHERE paper_id = %s;""", (clone_id, paper_id,))
     return clone_id
     
+def rows_paper_id(paper_id):
+    """
+    Returns the id of the paper whose rows hold the references, affiliations 
+    and authors of the paper with the passed id. This is the paper it was 
+    cloned from in copy-on-write mode as long as neither of both was modified, 
+    otherwise the paper itself.
+    """
+    result = run_sql("""SELECT parent_id FROM aulPAPERS 
+                        WHERE id = %s;""", (paper_id,))
+    if (result and result[0][0]):
+        return result[0][0]
+        
+    return paper_id
+    
+def materialise(paper_id):
+    """
+    Gives the copy-on-write clone with the passed id its own copy of the rows 
+    it shares with the paper it was cloned from. Happens automatically on the 
+    first modification of the clone, but can be triggered explicitly, e.g. 
+    before the parent is archived. Returns True if rows were copied, False if 
+    the paper already owned its rows.
+    """
+    lock_tables()
+    try:
+        return materialise_rows(paper_id)
+    finally:
+        unlock_tables()
+        
+def materialise_rows(paper_id):
+    """
+    Copies the rows of the parent of the copy-on-write clone with the passed id
+    to the clone and detaches it from its parent. Does nothing for papers 
+    owning their rows. Should NOT be used alone, the tables have to be locked. 
+    Refer to materialise() instead. Returns True if rows were copied.
+    """
+    result = run_sql("""SELECT parent_id FROM aulPAPERS 
+                        WHERE id = %s;""", (paper_id,))
+    if (not result or not result[0][0]):
+        return False
+        
+    parent_id = result[0][0]
+    clone_references(parent_id, paper_id)
+    clone_affiliations(parent_id, paper_id)
+    clone_authors(parent_id, paper_id)
+    run_sql("""UPDATE aulPAPERS SET parent_id = 0 WHERE id = %s;""", 
+            (paper_id,))
+            
+    return True
+    
+def detach(paper_id):
+    """
+    Makes sure that modifying the rows of the paper with the passed id does not 
+    affect any other paper. A copy-on-write clone gets its own copy of the rows.
+    A paper with copy-on-write clones hands its rows over to its oldest clone 
+    and copies them back from there, so that only a single copy is made no 
+    matter how many clones share the rows. Should NOT be used alone, the tables 
+    have to be locked. Refer to save() and patch() instead. Returns the paper 
+    id.
+    """
+    if (materialise_rows(paper_id)):
+        return paper_id
+        
+    heir_id = promote_heir(paper_id)
+    if (heir_id is not None):
+        materialise_rows(paper_id)
+        
+    return paper_id
+    
+def promote_heir(paper_id):
+    """
+    Moves the rows of the paper with the passed id to its oldest copy-on-write 
+    clone, which becomes the parent of the other clones and of the paper 
+    itself. Rows are moved by updating their paper id, nothing is copied. 
+    Should NOT be used alone, the tables have to be locked. Refer to detach() 
+    and delete() instead. Returns the id of the heir or None if the paper has 
+    no clones.
+    """
+    result = run_sql("""SELECT id FROM aulPAPERS WHERE parent_id = %s 
+                        ORDER BY id LIMIT 1;""", (paper_id,))
+    if (not result):
+        return None
+        
+    heir_id = result[0][0]
+    for table in ROW_TABLES:
+        run_sql("""UPDATE %s SET paper_id = %%s 
+                   WHERE paper_id = %%s;""" % table, (heir_id, paper_id))
+    run_sql("""UPDATE aulPAPERS SET parent_id = %s 
+               WHERE parent_id = %s OR id = %s;""", 
+            (heir_id, paper_id, paper_id))
+    run_sql("""UPDATE aulPAPERS SET parent_id = 0 WHERE id = %s;""", 
+            (heir_id,))
+            
+    return heir_id
+    
 def delete(paper_id):
     """
     Deletes the paper with the given id completely from the database. There is 
-    no backup copy so better we sure that you want to do this :). Returns the 
-    id of the deleted paper again for convenience reasons.
+    no backup copy so better we sure that you want to do this :). If the paper 
+    has copy-on-write clones, its rows are handed over to the oldest of them 
+    instead of being deleted. Returns the id of the deleted paper again for 
+    convenience reasons.
     """
     data = {cfg.JSON.PAPER_ID : paper_id}
     
-    delete_paper(paper_id)
-    delete_references(paper_id)
-    delete_affiliations(paper_id)
-    delete_authors(paper_id)
-    delete_author_affiliations(paper_id)    
+    lock_tables()
+    try:
+        promote_heir(paper_id)
+        delete_paper(paper_id)
+        delete_references(paper_id)
+        delete_affiliations(paper_id)
+        delete_authors(paper_id)
+        delete_author_affiliations(paper_id)    
+    finally:
+        unlock_tables()
     
     return data
     
@@ -172,43 +303,134 @@ def delete_author_affiliations(paper_id):
                WHERE paper_id = %s;""", (paper_id,))
     return paper_id
                
-def itemize():
+def itemize(cursor=None, size=cfg.PAGE_SIZE, title='', collaboration='', 
+            experiment_number=''):
     """
-    Returns the general information of all papers ordered descending by the last
-    modification date. Each items is represented by a dictionary having the keys
-    as can be found in the authorlist_config.
+    Returns the general information of one page of papers ordered descending by 
+    the last modification date. Each items is represented by a dictionary having
+    the keys as can be found in the authorlist_config. The papers are paginated 
+    with keyset cursors - the returned dictionary contains besides the papers 
+    the cursor of the next page (or None if this is the last one) that has to be
+    passed to this function again in order to retrieve the next page. Compared 
+    to LIMIT/OFFSET pagination, this only touches the rows of the requested page
+    independent of how deep the user is paging. The papers can optionally be 
+    filtered by a substring of their title and by their exact collaboration and
+    experiment number. The listing is backed by the (last_modified, id), 
+    (collaboration, last_modified, id) and (experiment_number, last_modified, 
+    id) indexes of aulPAPERS.
     """
-    data = {}
+    size = max(1, min(size, cfg.MAX_PAGE_SIZE))
+    conditions = []
+    parameters = []
+    
+    if (title):
+        conditions.append('title LIKE %s')
+        parameters.append('%%%s%%' % escape_like(title))
+    if (collaboration):
+        conditions.append('collaboration = %s')
+        parameters.append(collaboration)
+    if (experiment_number):
+        conditions.append('experiment_number = %s')
+        parameters.append(experiment_number)
+        
+    position = decode_cursor(cursor)
+    if (position is not None):
+        last_modified, paper_id = position
+        conditions.append("""(last_modified < %s OR (last_modified = %s AND 
+                             id < %s))""")
+        parameters.extend([last_modified, last_modified, paper_id])
+        
+    where = ''
+    if (conditions):
+        where = 'WHERE ' + ' AND '.join(conditions)
+        
+    # Fetch one paper more than requested to know whether there is a next page
+    parameters.append(size + 1)
     papers = run_sql("""SELECT id, title, collaboration, experiment_number, 
-                        last_modified FROM aulPAPERS ORDER BY 
-                        last_modified DESC;""")           
+                        last_modified FROM aulPAPERS %s ORDER BY 
+                        last_modified DESC, id DESC LIMIT %%s;""" % where, 
+                     tuple(parameters))
+    
+    data = {cfg.JSON.NEXT_CURSOR: None}
     out_papers = data.setdefault('data', [])
-    for paper in papers:
+    for paper in papers[:size]:
         paper_id, title, collaboration, experiment_number, last_modified = paper
         out_papers.append({cfg.JSON.PAPER_ID          : paper_id,
                            cfg.JSON.PAPER_TITLE       : title,
                            cfg.JSON.COLLABORATION     : collaboration,
                            cfg.JSON.EXPERIMENT_NUMBER : experiment_number,
                            cfg.JSON.LAST_MODIFIED     : last_modified})
+                           
+    if (len(papers) > size):
+        last = papers[size - 1]
+        data[cfg.JSON.NEXT_CURSOR] = encode_cursor(last[4], last[0])
     return data
+    
+def encode_cursor(last_modified, paper_id):
+    """
+    Encodes the position of a paper in the listing - i.e. its last modification
+    timestamp and its id - as opaque cursor string for the next page.
+    """
+    return '%d%s%d' % (last_modified, cfg.CURSOR_SEPARATOR, paper_id)
+    
+def decode_cursor(cursor):
+    """
+    Decodes a cursor string as created by encode_cursor() back to a tuple of 
+    the last modification timestamp and the paper id. Falsy or malformed 
+    cursors result in None - i.e. the listing starts from the first page.
+    """
+    if (not cursor):
+        return None
+    try:
+        last_modified, paper_id = cursor.split(cfg.CURSOR_SEPARATOR)
+        return int(last_modified), int(paper_id)
+    except ValueError:
+        return None
+        
+def escape_like(value):
+    """
+    Escapes the wildcard characters of the LIKE operator in the passed value, so
+    that a user supplied search string is matched literally.
+    """
+    for character in ('\\', '%', '_'):
+        value = value.replace(character, '\\' + character)
+    return value
 
-def load(paper_id):
+def load(paper_id, with_authors=True):
     """
     Loads all data of a paper data set with the given paper id. If the paper id 
     is a falsy value or is not yet in the database the function will create a 
     basic empty paper object and return it including the requested id (a falsy 
     value will just be reused without any modification). The returned object is 
-    a dictionary using the standard keys as defined in authorlist_config.
+    a dictionary using the standard keys as defined in authorlist_config. If 
+    with_authors is falsy the authors are not loaded, so that they can be 
+    streamed afterwards using iterate_authors().
     """
     data = {}
     load_id = load_paper(paper_id, data)
     data[cfg.JSON.PAPER_ID] = load_id
-    load_references(paper_id, data)
-    load_affiliations(paper_id, data)
-    load_authors(paper_id, data)
+    
+    rows_id = rows_paper_id(paper_id)
+    load_references(rows_id, data)
+    load_affiliations(rows_id, data)
+    if (with_authors):
+        load_authors(rows_id, data)
     
     return data
     
+def load_last_modified(paper_id):
+    """
+    Returns the last modified timestamp of the paper with the passed id or None
+    if there is no such paper. Cheaper than load_paper() when only checking 
+    whether a paper has changed.
+    """
+    result = run_sql("""SELECT last_modified FROM aulPAPERS 
+                        WHERE id = %s;""", (paper_id,))
+    if (not result):
+        return None
+        
+    return result[0][0]
+    
 def load_paper(paper_id, data):
     """
     Loads only the general paper information of the given id and adds them to 
@@ -244,7 +466,7 @@ def load_references(paper_id, data):
     id for convenience reasons.
     """
     references = run_sql("""SELECT reference FROM aulREFERENCES 
-                            WHERE paper_id = %s;""", (paper_id,))
+                            WHERE paper_id = %s ORDER BY item;""", (paper_id,))
     reference_ids = [reference[0] for reference in references]
     data[cfg.JSON.REFERENCE_IDS] = reference_ids
     
@@ -259,7 +481,7 @@ def load_affiliations(paper_id, data):
     """
     result = run_sql("""SELECT item, acronym, umbrella, name_and_address, domain,
                         member, spires_id FROM aulAFFILIATIONS 
-                        WHERE paper_id = %s;""", (paper_id,))
+                        WHERE paper_id = %s ORDER BY item;""", (paper_id,))
     affiliations = data.setdefault(cfg.JSON.AFFILIATIONS_KEY, [])
     
     for affiliation in result:
@@ -273,22 +495,90 @@ def load_authors(paper_id, data):
     """
     Loads the authors information of the paper with the passed id and adds them 
     to the passed data dicitionary. This function will automatically also load 
-    all affiliations of the respective author. Should NOT be used alone as long 
-    as you do not know what you are doing. Refer to load() instead. Returns the 
-    passed id for convenience reasons.
+    all affiliations of the respective author. Both are fetched with a single 
+    query each, independent of the number of authors. Should NOT be used alone 
+    as long as you do not know what you are doing. Refer to load() instead. 
+    Returns the passed id for convenience reasons.
     """
     result = run_sql("""SELECT item, family_name, given_name, name_on_paper, 
                         alive, inspire_id FROM aulAUTHORS 
-                        WHERE paper_id = %s;""", (paper_id,))
+                        WHERE paper_id = %s ORDER BY item;""", (paper_id,))
+    result_affiliations = run_sql("""SELECT author_item, affiliation_acronym, 
+                                     affiliation_status 
+                                     FROM aulAUTHOR_AFFILIATIONS 
+                                     WHERE paper_id = %s 
+                                     ORDER BY author_item, item;""", 
+                                  (paper_id,))
     authors = data.setdefault(cfg.JSON.AUTHORS_KEY, [])
+    authors.extend(build_authors(result, 
+                                 group_author_affiliations(result_affiliations)))
+        
+    return data
+    
+def iterate_authors(paper_id, chunk_size=cfg.CHUNK_SIZE):
+    """
+    Generator yielding the authors of the paper with the passed id in lists of 
+    at most chunk_size authors. Each author is represented exactly as in the 
+    list load_authors() builds. Only two queries per chunk are issued and 
+    never more than one chunk is held in memory, which allows to start 
+    sending huge author lists before all rows are read. Refer to load() with 
+    with_authors set to False for the rest of the paper. The authors of a 
+    copy-on-write clone are read from the paper sharing its rows.
+    """
+    paper_id = rows_paper_id(paper_id)
+    start = 0
+    while True:
+        result = run_sql("""SELECT item, family_name, given_name, name_on_paper, 
+                            alive, inspire_id FROM aulAUTHORS 
+                            WHERE paper_id = %s AND item >= %s 
+                            ORDER BY item LIMIT %s;""", 
+                         (paper_id, start, chunk_size))
+        if (not result):
+            break
+            
+        first, last = result[0][0], result[-1][0]
+        result_affiliations = run_sql("""SELECT author_item, affiliation_acronym, 
+                                         affiliation_status 
+                                         FROM aulAUTHOR_AFFILIATIONS 
+                                         WHERE paper_id = %s AND author_item 
+                                         BETWEEN %s AND %s 
+                                         ORDER BY author_item, item;""", 
+                                      (paper_id, first, last))
+        yield build_authors(result, 
+                            group_author_affiliations(result_affiliations))
+                            
+        if (len(result) < chunk_size):
+            break
+        start = last + 1
+        
+def build_authors(result, author_affiliations):
+    """
+    Turns the passed aulAUTHORS rows into the author lists of the JSON data, 
+    attaching the affiliations of each author from the passed dictionary as 
+    returned by group_author_affiliations(). Returns the list of authors.
+    """
+    authors = []
     
     for author in result:
         item, family_name, given_name, paper_name, alive, inspire_id = author
-        author_affiliations = load_author_affiliations(paper_id, item)
         authors.append([item + 1, '', family_name, given_name, paper_name, 
-                        bool(alive), author_affiliations, inspire_id])
+                        bool(alive), author_affiliations.get(item, []), 
+                        inspire_id])
         
-    return data
+    return authors
+    
+def group_author_affiliations(result):
+    """
+    Groups the passed (author_item, acronym, status) rows by their author in 
+    memory. Returns a dictionary mapping each author item to the list of its 
+    affiliations in the JSON format, preserving the order of the rows.
+    """
+    grouped = {}
+    
+    for author_item, acronym, status in result:
+        grouped.setdefault(author_item, []).append([acronym, status])
+        
+    return grouped
     
 def load_author_affiliations(paper_id, author_id):
     """
@@ -299,7 +589,8 @@ def load_author_affiliations(paper_id, author_id):
     """
     result = run_sql("""SELECT affiliation_acronym, affiliation_status 
                         FROM aulAUTHOR_AFFILIATIONS WHERE author_item = %s 
-                        AND paper_id = %s;""", (author_id, paper_id,))
+                        AND paper_id = %s ORDER BY item;""", 
+                     (author_id, paper_id,))
     author_affiliations = []
     
     for author_affiliation in result:
@@ -313,28 +604,68 @@ def save(paper_id, in_data):
     Saves the passed data dictionary using the standard authorlist_config keys 
     in the database using the passed paper_id. If the id is falsy or not yet in 
     the database a new data set is created, otherwise the old data set will be 
-    overwritten. Returns a dictionary the holds the id of the saved data set.
+    overwritten. Only the rows that actually changed are written, using one 
+    multi-row statement per table, so that the number of queries does not grow 
+    with the size of the author list. The aul tables are locked during the 
+    whole save so that readers never see a half written paper. Returns a 
+    dictionary the holds the id and the new last modified timestamp of the 
+    saved data set.
     """
     out_data = {}
     
-    new_paper_id = save_paper(paper_id, in_data)
-    if (paper_id is None):
-        paper_id = new_paper_id	
-    out_data[cfg.JSON.PAPER_ID] = paper_id
-    
-    save_references(paper_id, in_data)
-    save_affliations(paper_id, in_data)
-    save_authors(paper_id, in_data)
+    lock_tables()
+    try:
+        new_paper_id = save_paper(paper_id, in_data)
+        if (paper_id is None):
+            paper_id = new_paper_id	
+        else:
+            detach(paper_id)
+        out_data[cfg.JSON.PAPER_ID] = paper_id
+        
+        save_references(paper_id, in_data)
+        save_affliations(paper_id, in_data)
+        save_authors(paper_id, in_data)
+        out_data[cfg.JSON.LAST_MODIFIED] = load_last_modified(paper_id)
+    finally:
+        unlock_tables()
     
     return out_data
     
+def lock_tables():
+    """
+    Acquires a write lock on all authorlist tables for the current database 
+    connection. The tables are MyISAM tables, so the lock is what makes a save 
+    atomic for all other readers and writers. The source aliases used by the 
+    cloning INSERT ... SELECT statements are locked as well, as MySQL requires 
+    a separate lock for each name a locked table is referred to by. Should NOT 
+    be used alone, always pair it with unlock_tables() in a finally clause. 
+    Refer to save() instead.
+    """
+    run_sql("""LOCK TABLES aulPAPERS WRITE, aulREFERENCES WRITE, 
+               aulAFFILIATIONS WRITE, aulAUTHORS WRITE, 
+               aulAUTHOR_AFFILIATIONS WRITE, 
+               aulPAPERS AS source_papers READ, 
+               aulREFERENCES AS source_references READ, 
+               aulAFFILIATIONS AS source_affiliations READ, 
+               aulAUTHORS AS source_authors READ, 
+               aulAUTHOR_AFFILIATIONS AS source_author_affiliations READ;""")
+               
+def unlock_tables():
+    """
+    Releases the table locks acquired by lock_tables(). Should NOT be used 
+    alone. Refer to save() instead.
+    """
+    run_sql("""UNLOCK TABLES;""")
+    
 def save_paper(paper_id, data):
     """
     Saves the general paper information from the passed data dictionary using 
     the standard authorlist_config keys of the paper with the given id. Updates 
     the last modified timestamp. Should NOT be used alone as long as you are not
-    sure what you are doing. Refer to save() instead. Returns the paper if of 
-    the dataset.
+    sure what you are doing. Refer to save() instead. The timestamp is strictly 
+    increased on every save, even within the same second, so that it can be 
+    used to identify a version of the paper. Returns the paper if of the 
+    dataset.
     """
     if (not paper_id):
         paper_id = None
@@ -360,84 +691,62 @@ def save_paper(paper_id, data):
                       title = %s,
                       collaboration = %s,
                       experiment_number = %s,
-                      last_modified = %s;""", data_tuple)
+                      last_modified = GREATEST(%s, last_modified + 1);""", 
+                   data_tuple)
                       
 def save_references(paper_id, data):
     """
     Saves the references of the passed data dictionary using the standard 
-    authorlist_config keys of the paper data set with the given id. Should NOT 
-    be used alone as long as you are not sure what you are doing. Refer to 
-    save() instead. Returns the paper id.
+    authorlist_config keys of the paper data set with the given id. Only new 
+    and modified references are written, references that are out of bounds 
+    are deleted. Should NOT be used alone as long as you are not sure what you 
+    are doing. Refer to save() instead. Returns the paper id.
     """
     reference_ids = data[cfg.JSON.REFERENCE_IDS]
-
-    # Insert or update old references
+    
+    result = run_sql("""SELECT item, reference FROM aulREFERENCES 
+                        WHERE paper_id = %s;""", (paper_id,))
+    stored = {}
+    for item, reference in result:
+        stored[(item,)] = wash_row((reference,))
+        
+    incoming = {}
     for index, reference in enumerate(reference_ids):
-        data_tuple = (# insert values
-                      index,
-                      reference,
-                      paper_id,
-                      
-                      # update values
-                      reference)
-    
-        run_sql("""INSERT INTO 
-                   aulREFERENCES (item, reference, paper_id)
-                   VALUES (%s, %s, %s)
-                   ON DUPLICATE KEY UPDATE
-                   reference = %s;""", data_tuple)
-                   
-    # Delete old references that are out of bounds - i.e. have a higher index 
-    # than the length of the reference list
-    run_sql("""DELETE FROM aulREFERENCES WHERE item >= %s AND paper_id = %s;""", 
-            (len(reference_ids), paper_id))
+        incoming[(index,)] = reference_values(reference)
+        
+    upsert_rows('aulREFERENCES', ('item',), REFERENCE_COLUMNS, paper_id, 
+                changed_rows(stored, incoming))
+    delete_out_of_bounds('aulREFERENCES', paper_id, 
+                         removed_keys(stored, incoming), len(reference_ids))
             
     return paper_id
 
 def save_affliations(paper_id, data):
     """
     Saves the affiliations of the passed data dictionary using the standard 
-    authorlist_config keys to the data set of the paper with the given id. 
-    Should NOT be used alone as long as you are not sure what you are doing. 
-    Refer to save() instead. Returns the paper_id for convenience reasons.
+    authorlist_config keys to the data set of the paper with the given id. Only 
+    new and modified affiliations are written, affiliations that are out of 
+    bounds are deleted. Should NOT be used alone as long as you are not sure 
+    what you are doing. Refer to save() instead. Returns the paper_id for 
+    convenience reasons.
     """
     affiliations = data[cfg.JSON.AFFILIATIONS_KEY]
     
+    result = run_sql("""SELECT item, acronym, umbrella, name_and_address, domain,
+                        member, spires_id FROM aulAFFILIATIONS 
+                        WHERE paper_id = %s;""", (paper_id,))
+    stored = {}
+    for affiliation in result:
+        stored[(affiliation[0],)] = wash_row(affiliation[1:])
+        
+    incoming = {}
     for index, affiliation in enumerate(affiliations):
-        data_tuple = (# insert values
-                      index,
-                      affiliation[cfg.JSON.ACRONYM],
-                      affiliation[cfg.JSON.UMBRELLA],
-                      affiliation[cfg.JSON.NAME],
-                      affiliation[cfg.JSON.DOMAIN],
-                      affiliation[cfg.JSON.MEMBER],
-                      affiliation[cfg.JSON.SPIRES_ID],
-                      paper_id,
-                      
-                      # update values
-                      affiliation[cfg.JSON.ACRONYM],
-                      affiliation[cfg.JSON.UMBRELLA],
-                      affiliation[cfg.JSON.NAME],
-                      affiliation[cfg.JSON.DOMAIN],
-                      affiliation[cfg.JSON.MEMBER],
-                      affiliation[cfg.JSON.SPIRES_ID])
-    
-        run_sql("""INSERT INTO 
-                   aulAFFILIATIONS (item, acronym, umbrella, name_and_address, 
-                                    domain, member, spires_id, paper_id)
-                   VALUES(%s, %s, %s, %s, %s, %s, %s, %s)
-                   ON DUPLICATE KEY UPDATE
-                   acronym = %s,
-                   umbrella = %s,
-                   name_and_address = %s,
-                   domain = %s,
-                   member = %s,
-                   spires_id = %s;""", data_tuple)
-                   
-    # Delete old affiliations that are out of bounds - i.e. have a higher index 
-    # than the length of the affiliations list
-    run_sql("""DELETE FROM aulAFFILIATIONS WHERE item >= %s AND paper_id = %s;""", 
-            (len(affiliations), paper_id))
+        incoming[(index,)] = affiliation_values(affiliation)
+                                       
+    upsert_rows('aulAFFILIATIONS', ('item',), AFFILIATION_COLUMNS, paper_id, 
+                changed_rows(stored, incoming))
+    delete_out_of_bounds('aulAFFILIATIONS', paper_id, 
+                         removed_keys(stored, incoming), len(affiliations))
             
     return paper_id
     
@@ -445,86 +754,612 @@ def save_authors(paper_id, data):
     """
     Saves the authors of the passed data dictionary using the standard 
     authorlist_config keys in the database of the paper with the given id. 
-    Should NOT be used alone as long as you do not know what you are doing. 
-    Refer to save() instead. Returns the paper_id.
+    Only new and modified authors are written, authors that are out of bounds 
+    are deleted. Invokes the saving of the author affiliations as well. Should 
+    NOT be used alone as long as you do not know what you are doing. Refer to 
+    save() instead. Returns the paper_id.
     """
     authors = data[cfg.JSON.AUTHORS_KEY]
     
+    result = run_sql("""SELECT item, family_name, given_name, name_on_paper, 
+                        alive, inspire_id FROM aulAUTHORS 
+                        WHERE paper_id = %s;""", (paper_id,))
+    stored = {}
+    for author in result:
+        stored[(author[0],)] = wash_row(author[1:])
+        
+    incoming = {}
     for index, author in enumerate(authors):
-        data_tuple = (# insert values
-                      index,
-                      author[cfg.JSON.FAMILY_NAME],
-                      author[cfg.JSON.GIVEN_NAME],
-                      author[cfg.JSON.PAPER_NAME],
-                      author[cfg.JSON.ALIVE],
-                      author[cfg.JSON.INSPIRE_ID],
-                      paper_id,
-                      
-                      # update values
-                      author[cfg.JSON.FAMILY_NAME],
-                      author[cfg.JSON.GIVEN_NAME],
-                      author[cfg.JSON.PAPER_NAME],
-                      author[cfg.JSON.ALIVE],
-                      author[cfg.JSON.INSPIRE_ID])
-                      
-        run_sql("""INSERT INTO 
-                   aulAUTHORS (item, family_name, given_name, name_on_paper, 
-                               alive, inspire_id, paper_id) 
-                   VALUES(%s, %s, %s, %s, %s, %s, %s)
-                   ON DUPLICATE KEY UPDATE
-                   family_name = %s,
-                   given_name = %s,
-                   name_on_paper = %s,
-                   alive = %s,
-                   inspire_id = %s;""", data_tuple)
-                   
-        save_author_affiliations(paper_id, index, len(authors), 
-                                 author[cfg.JSON.AFFILIATIONS])
-                   
-    # Delete old authors that are out of bounds - i.e. have a higher index 
-    # than the length of the affiliations list
-    run_sql("""DELETE FROM aulAUTHORS WHERE item >= %s AND paper_id = %s;""", 
-            (len(authors), paper_id))
+        incoming[(index,)] = author_values(author)
+                                       
+    upsert_rows('aulAUTHORS', ('item',), AUTHOR_COLUMNS, paper_id, 
+                changed_rows(stored, incoming))
+    delete_out_of_bounds('aulAUTHORS', paper_id, 
+                         removed_keys(stored, incoming), len(authors))
+                         
+    save_author_affiliations(paper_id, authors)
+            
+    return paper_id
+        
+def save_author_affiliations(paper_id, authors):
+    """
+    Saves the affiliations of all passed authors using the standard 
+    authorlist_config keys and the paper id. Only new and modified author 
+    affiliations are written. Affiliations the authors do not have anymore and 
+    the ones of non existing authors are deleted. Should NOT be used alone as 
+    long as you do not exactly know what you are doing. Refer to save() 
+    instead. Returns the paper id.
+    """
+    result = run_sql("""SELECT author_item, item, affiliation_acronym, 
+                        affiliation_status FROM aulAUTHOR_AFFILIATIONS 
+                        WHERE paper_id = %s;""", (paper_id,))
+    stored = {}
+    for author_item, item, acronym, status in result:
+        stored[(author_item, item)] = wash_row((acronym, status))
+        
+    incoming = {}
+    for author_index, author in enumerate(authors):
+        for index, affiliation in enumerate(author[cfg.JSON.AFFILIATIONS]):
+            incoming[(author_index, index)] = author_affiliation_values(affiliation)
+            
+    upsert_rows('aulAUTHOR_AFFILIATIONS', ('author_item', 'item'), 
+                AUTHOR_AFFILIATION_COLUMNS, paper_id, 
+                changed_rows(stored, incoming))
+    delete_author_affiliation_rows(paper_id, removed_keys(stored, incoming))
             
     return paper_id
+    
+def wash_row(values):
+    """
+    Normalizes the passed column values so that rows coming from the JSON data 
+    compare equal to the ones stored in the database - i.e. unicode strings are 
+    encoded in UTF-8 and booleans are turned into integers. Returns the washed 
+    values as tuple.
+    """
+    washed = []
+    for value in values:
+        if (isinstance(value, unicode)):
+            value = value.encode('utf-8')
+        elif (isinstance(value, bool)):
+            value = int(value)
+        washed.append(value)
+        
+    return tuple(washed)
+    
+def reference_values(reference):
+    """
+    Returns the washed database values of the passed JSON reference.
+    """
+    return wash_row((reference,))
+    
+def affiliation_values(affiliation):
+    """
+    Returns the washed database values of the passed JSON affiliation row in 
+    the order of AFFILIATION_COLUMNS.
+    """
+    return wash_row((affiliation[cfg.JSON.ACRONYM],
+                     affiliation[cfg.JSON.UMBRELLA],
+                     affiliation[cfg.JSON.NAME],
+                     affiliation[cfg.JSON.DOMAIN],
+                     affiliation[cfg.JSON.MEMBER],
+                     affiliation[cfg.JSON.SPIRES_ID]))
+                     
+def author_values(author):
+    """
+    Returns the washed database values of the passed JSON author row in the 
+    order of AUTHOR_COLUMNS.
+    """
+    return wash_row((author[cfg.JSON.FAMILY_NAME],
+                     author[cfg.JSON.GIVEN_NAME],
+                     author[cfg.JSON.PAPER_NAME],
+                     author[cfg.JSON.ALIVE],
+                     author[cfg.JSON.INSPIRE_ID]))
+                     
+def author_affiliation_values(affiliation):
+    """
+    Returns the washed database values of the passed JSON author affiliation in
+    the order of AUTHOR_AFFILIATION_COLUMNS.
+    """
+    return wash_row((affiliation[cfg.JSON.AFFILIATION_ACRONYM],
+                     affiliation[cfg.JSON.AFFILIATION_STATUS]))
+    
+def changed_rows(stored, incoming):
+    """
+    Compares the incoming rows with the stored ones. Both are dictionaries 
+    mapping the key tuple of a row to the tuple of its washed values. Returns 
+    the rows that are new or differ from the stored ones as a list of key plus 
+    values tuples, ordered by their key.
+    """
+    changed = []
+    for key in sorted(incoming.keys()):
+        values = incoming[key]
+        if (stored.get(key) != values):
+            changed.append(key + values)
+            
+    return changed
+    
+def removed_keys(stored, incoming):
+    """
+    Returns the ordered list of the keys of all stored rows that are not part 
+    of the incoming rows anymore. See changed_rows() for the format of the 
+    passed dictionaries.
+    """
+    return [key for key in sorted(stored.keys()) if key not in incoming]
+    
+def upsert_rows(table, key_columns, value_columns, paper_id, rows):
+    """
+    Inserts or updates the passed rows of the given table for the paper with 
+    the passed id using multi-row INSERT ... ON DUPLICATE KEY UPDATE 
+    statements. Each row is a tuple of key and value columns as returned by 
+    changed_rows(). Should NOT be used alone. Refer to save() instead. Returns 
+    the number of affected rows.
+    """
+    if (not rows):
+        return 0
         
-def save_author_affiliations(paper_id, author_id, number_of_authors, data):
-    """
-    Saves the affiliations of the passed author using the data dictionary and 
-    the standard authorlist_config keys and the paper id. Deletes also all old 
-    entries that are 'out of bounds' facilitating the number_of_authors 
-    paramter. Should NOT be used alone as long as you do not exactly know what 
-    you are doing. Refer to save() instead. Returns the paper id.
-    """
-    for index, affiliation in enumerate(data):
-        data_tuple = (# insert values
-                      index,
-                      affiliation[cfg.JSON.AFFILIATION_ACRONYM],
-                      affiliation[cfg.JSON.AFFILIATION_STATUS],
-                      author_id,
-                      paper_id,
-        
-                      # update values
-                      affiliation[cfg.JSON.AFFILIATION_ACRONYM],
-                      affiliation[cfg.JSON.AFFILIATION_STATUS])
+    columns = key_columns + value_columns + ('paper_id',)
+    updates = ['%s = VALUES(%s)' % (column, column) for column in value_columns]
+    query = """INSERT INTO %s (%s) VALUES (%s) 
+               ON DUPLICATE KEY UPDATE %s;""" % (table, 
+                                                 ', '.join(columns), 
+                                                 ', '.join(['%s'] * len(columns)), 
+                                                 ', '.join(updates))
+                                                 
+    return run_sql_many(query, [row + (paper_id,) for row in rows])
+    
+def delete_out_of_bounds(table, paper_id, keys, length):
+    """
+    Deletes the rows of the passed table that are out of bounds - i.e. have a 
+    higher item index than the length of the respective list. Does nothing if 
+    the passed list of removed keys is empty. Should NOT be used alone. Refer 
+    to save() instead. Returns the paper id.
+    """
+    if (keys):
+        run_sql("""DELETE FROM %s WHERE item >= %%s 
+                   AND paper_id = %%s;""" % table, (length, paper_id))
+                   
+    return paper_id
+    
+def delete_author_affiliation_rows(paper_id, keys):
+    """
+    Deletes the author affiliations with the passed (author_item, item) keys of 
+    the paper with the given id. The rows are removed in chunks of 
+    CFG_MISCUTIL_SQL_RUN_SQL_MANY_LIMIT keys per statement. Should NOT be used 
+    alone. Refer to save() instead. Returns the paper id.
+    """
+    limit = CFG_MISCUTIL_SQL_RUN_SQL_MANY_LIMIT
+    
+    for start in range(0, len(keys), limit):
+        chunk = keys[start:start + limit]
+        params = [paper_id]
+        for key in chunk:
+            params.extend(key)
+        run_sql("""DELETE FROM aulAUTHOR_AFFILIATIONS WHERE paper_id = %%s 
+                   AND (author_item, item) IN (%s);""" % 
+                ', '.join(['(%s, %s)'] * len(chunk)), params)
+                
+    return paper_id
+
+# Item index rows are parked at while moving, maximum of the unsigned columns
+PARKED_ITEM = 4294967295
+
+# Patchable tables by their JSON key - table name, value columns and function 
+# returning the washed values of a JSON row
+PATCH_TABLES = {cfg.JSON.REFERENCE_IDS    : ('aulREFERENCES', REFERENCE_COLUMNS, 
+                                             reference_values),
+                cfg.JSON.AFFILIATIONS_KEY : ('aulAFFILIATIONS', 
+                                             AFFILIATION_COLUMNS, 
+                                             affiliation_values),
+                cfg.JSON.AUTHORS_KEY      : ('aulAUTHORS', AUTHOR_COLUMNS, 
+                                             author_values)}
+
+# Minimal length of the JSON rows of the patchable tables, None for the 
+# references which are plain values
+PATCH_ROW_LENGTHS = {cfg.JSON.REFERENCE_IDS    : None,
+                     cfg.JSON.AFFILIATIONS_KEY : cfg.JSON.SPIRES_ID + 1,
+                     cfg.JSON.AUTHORS_KEY      : cfg.JSON.INSPIRE_ID + 1}
+
+# Keys of the row of a paper update
+PATCH_PAPER_KEYS = (cfg.JSON.PAPER_TITLE, cfg.JSON.COLLABORATION, 
+                    cfg.JSON.EXPERIMENT_NUMBER)
+
+def patch(paper_id, last_modified, operations, validator=None):
+    """
+    Applies the passed list of row level patch operations to the stored paper 
+    with the given id instead of saving the whole paper. Each operation is a 
+    dictionary using the authorlist_config Patch keys, e.g.
+    
+        {'op': 'update', 'table': 'authors', 'index': 41, 'row': [...]}
+        
+    Supported operations are insert, update and delete of a row at the zero 
+    based index and move of the row at index to the position 'to', on the 
+    tables authors, affiliations and reference_ids. The general paper 
+    information can be updated using the table 'paper' and a row dictionary. If
+    the affiliations of an updated author are null, they are left untouched. 
+    Inserted authors always need their list of affiliations.
+    
+    The patch is only applied if the stored paper still has the passed last 
+    modified timestamp, otherwise nothing is written and the returned 
+    dictionary has the conflict key set. Returns a dictionary holding the paper
+    id and the new last modified timestamp. Raises a ValueError on malformed 
+    operations or indices out of the bounds of the stored rows, before 
+    anything is written.
+    
+    If a validator is passed, e.g. authorlist_engine.validate_patch(), it is 
+    called with the operations, the acronyms of the patched affiliations and 
+    the acronyms kept by the stored author affiliations that are removed from 
+    the affiliations, see load_patch_acronyms(), before anything is written. 
+    The patch is only applied if it returns no errors. Otherwise the returned 
+    dictionary holds the errors instead of the new timestamp.
+    """
+    for operation in operations:
+        check_patch_operation(operation)
+        
+    out_data = {cfg.JSON.PAPER_ID : paper_id}
+    
+    lock_tables()
+    try:
+        # the bounds only matter if there is no conflict, which is reported
+        # in the first place
+        if (load_last_modified(paper_id) == last_modified):
+            counts = load_row_counts(paper_id)
+            check_patch_bounds(operations, counts)
+            if (validator is not None):
+                acronyms, used = load_patch_acronyms(paper_id, operations, 
+                                                     counts)
+                errors = validator(operations, acronyms, used)
+                if (errors):
+                    out_data[cfg.JSON.ERRORS] = errors
+                    return out_data
+                    
+        new_last_modified = patch_last_modified(paper_id, last_modified)
+        if (new_last_modified is None):
+            out_data[cfg.JSON.CONFLICT] = True
+            out_data[cfg.JSON.LAST_MODIFIED] = load_last_modified(paper_id)
+            return out_data
+            
+        detach(paper_id)
+        for operation in operations:
+            patch_operation(paper_id, operation)
+            
+        out_data[cfg.JSON.LAST_MODIFIED] = new_last_modified
+    finally:
+        unlock_tables()
+        
+    return out_data
+    
+def check_patch_operation(operation):
+    """
+    Checks the passed patch operation for well-formedness. Raises a ValueError 
+    describing the problem if it is malformed. Should NOT be used alone. Refer 
+    to patch() instead.
+    """
+    kind = operation.get(cfg.Patch.OPERATION)
+    table = operation.get(cfg.Patch.TABLE)
+    
+    if (table == cfg.Patch.PAPER):
+        if (kind != cfg.Patch.UPDATE or 
+            not isinstance(operation.get(cfg.Patch.ROW), dict)):
+            raise ValueError('Only updates are allowed on the paper')
+        for key in PATCH_PAPER_KEYS:
+            if (key not in operation[cfg.Patch.ROW]):
+                raise ValueError('Missing %s in paper update' % key)
+        return
+        
+    if (table not in PATCH_TABLES):
+        raise ValueError('Unknown patch table %s' % repr(table))
+    if (kind not in (cfg.Patch.INSERT, cfg.Patch.UPDATE, 
+                     cfg.Patch.DELETE, cfg.Patch.MOVE)):
+        raise ValueError('Unknown patch operation %s' % repr(kind))
+        
+    indices = [operation.get(cfg.Patch.INDEX)]
+    if (kind == cfg.Patch.MOVE):
+        indices.append(operation.get(cfg.Patch.TO))
+    for index in indices:
+        if (not isinstance(index, (int, long)) or index < 0):
+            raise ValueError('Invalid patch index %s' % repr(index))
+            
+    if (kind in (cfg.Patch.INSERT, cfg.Patch.UPDATE)):
+        if (cfg.Patch.ROW not in operation):
+            raise ValueError('Missing row for %s operation' % kind)
+        check_patch_row(table, operation[cfg.Patch.ROW])
+        if (kind == cfg.Patch.INSERT and table == cfg.JSON.AUTHORS_KEY and 
+            operation[cfg.Patch.ROW][cfg.JSON.AFFILIATIONS] is None):
+            raise ValueError('Missing affiliations of inserted author')
+        
+def check_patch_row(table, row):
+    """
+    Checks the shape of the passed JSON row of an insert or update on the 
+    given patchable table. Raises a ValueError describing the problem if it 
+    does not have all the columns the row is written with. Should NOT be used 
+    alone. Refer to patch() instead.
+    """
+    length = PATCH_ROW_LENGTHS[table]
+    if (length is None):
+        if (isinstance(row, (list, tuple, dict))):
+            raise ValueError('Invalid %s row %s' % (table, repr(row)))
+        return
+        
+    if (not isinstance(row, (list, tuple)) or len(row) < length):
+        raise ValueError('Invalid %s row %s' % (table, repr(row)))
+        
+    if (table == cfg.JSON.AUTHORS_KEY):
+        affiliations = row[cfg.JSON.AFFILIATIONS]
+        if (affiliations is None):
+            return
+        if (not isinstance(affiliations, (list, tuple))):
+            raise ValueError('Invalid author affiliations %s' % 
+                             repr(affiliations))
+        for affiliation in affiliations:
+            if (not isinstance(affiliation, (list, tuple)) or 
+                len(affiliation) <= cfg.JSON.AFFILIATION_STATUS):
+                raise ValueError('Invalid author affiliation %s' % 
+                                 repr(affiliation))
+                                 
+def check_patch_bounds(operations, counts):
+    """
+    Checks the indices of the passed well-formed patch operations against the 
+    number of rows of the tables they apply to, given as dictionary mapping 
+    the patchable table keys to their row count, as they are applied one after 
+    the other. Raises a ValueError if an index is out of bounds - i.e. would 
+    address a row that does not exist or leave a gap in the positions. Should 
+    NOT be used alone. Refer to patch() instead.
+    """
+    counts = dict(counts)
+    for operation in operations:
+        table = operation[cfg.Patch.TABLE]
+        if (table == cfg.Patch.PAPER):
+            continue
+            
+        kind = operation[cfg.Patch.OPERATION]
+        index = operation[cfg.Patch.INDEX]
+        count = counts[table]
+        if (kind == cfg.Patch.INSERT):
+            bound = count + 1
+        else:
+            bound = count
+        if (index >= bound or (kind == cfg.Patch.MOVE and 
+                               operation[cfg.Patch.TO] >= bound)):
+            raise ValueError('Patch index out of bounds in %s' % 
+                             repr(operation))
+                             
+        if (kind == cfg.Patch.INSERT):
+            counts[table] = count + 1
+        elif (kind == cfg.Patch.DELETE):
+            counts[table] = count - 1
+            
+def apply_patch(data, operations):
+    """
+    Applies the passed checked patch operations to the data dictionary of a 
+    paper using the standard authorlist_config keys, the same way patch() 
+    applies them to the stored paper. Returns the modified data dictionary. 
+    Should NOT be used alone. Refer to patch() instead.
+    """
+    for operation in operations:
+        kind = operation[cfg.Patch.OPERATION]
+        table_key = operation[cfg.Patch.TABLE]
+        if (table_key == cfg.Patch.PAPER):
+            for key in PATCH_PAPER_KEYS:
+                data[key] = operation[cfg.Patch.ROW][key]
+            continue
+            
+        rows = data[table_key]
+        index = operation[cfg.Patch.INDEX]
+        if (kind == cfg.Patch.DELETE):
+            del rows[index]
+        elif (kind == cfg.Patch.MOVE):
+            rows.insert(operation[cfg.Patch.TO], rows.pop(index))
+        elif (kind == cfg.Patch.INSERT):
+            rows.insert(index, operation[cfg.Patch.ROW])
+        else:
+            row = operation[cfg.Patch.ROW]
+            if (table_key == cfg.JSON.AUTHORS_KEY and 
+                row[cfg.JSON.AFFILIATIONS] is None):
+                row = list(row)
+                row[cfg.JSON.AFFILIATIONS] = rows[index][cfg.JSON.AFFILIATIONS]
+            rows[index] = row
+            
+    return data
+    
+def load_patch_acronyms(paper_id, operations, counts):
+    """
+    Returns the acronyms the rows touched by the passed checked patch 
+    operations are validated against, without loading the whole paper with the
+    given id: the list of the acronyms of its affiliations once the patch is 
+    applied, and the list of those of its stored author affiliations that are 
+    kept by the patch, but whose acronym the patch removes from the 
+    affiliations. The latter are only read if the patch removes an acronym. 
+    The counts are the row counts as returned by load_row_counts(). Strings 
+    are unicode like in the JSON data. Should NOT be used alone, the tables 
+    have to be locked. Refer to patch() instead.
+    """
+    touched = dict([(operation[cfg.Patch.TABLE], True) 
+                    for operation in operations])
+    if (cfg.JSON.AFFILIATIONS_KEY not in touched and 
+        cfg.JSON.AUTHORS_KEY not in touched):
+        return [], []
+        
+    rows_id = rows_paper_id(paper_id)
+    stored = [acronym.decode('utf-8') for (acronym,) 
+              in run_sql("""SELECT acronym FROM aulAFFILIATIONS 
+                            WHERE paper_id = %s ORDER BY item;""", (rows_id,))]
+                            
+    # the patch is applied to placeholder rows holding only the acronyms of 
+    # the affiliations and the items of the stored authors in place of their 
+    # affiliations, which updates with null affiliations keep
+    affiliation = [None] * PATCH_ROW_LENGTHS[cfg.JSON.AFFILIATIONS_KEY]
+    author = [None] * PATCH_ROW_LENGTHS[cfg.JSON.AUTHORS_KEY]
+    data = {cfg.JSON.REFERENCE_IDS    : [None] * counts[cfg.JSON.REFERENCE_IDS],
+            cfg.JSON.AFFILIATIONS_KEY : [],
+            cfg.JSON.AUTHORS_KEY      : []}
+    for acronym in stored:
+        row = list(affiliation)
+        row[cfg.JSON.ACRONYM] = acronym
+        data[cfg.JSON.AFFILIATIONS_KEY].append(row)
+    for item in range(counts[cfg.JSON.AUTHORS_KEY]):
+        row = list(author)
+        row[cfg.JSON.AFFILIATIONS] = item
+        data[cfg.JSON.AUTHORS_KEY].append(row)
+    apply_patch(data, operations)
+    
+    acronyms = [row[cfg.JSON.ACRONYM] 
+                for row in data[cfg.JSON.AFFILIATIONS_KEY]]
+    patched = dict.fromkeys(acronyms)
+    removed = dict([(acronym, True) for acronym in stored 
+                    if (acronym not in patched)])
+    if (not removed):
+        return acronyms, []
+        
+    kept = dict([(row[cfg.JSON.AFFILIATIONS], True) 
+                 for row in data[cfg.JSON.AUTHORS_KEY] 
+                 if (isinstance(row[cfg.JSON.AFFILIATIONS], (int, long)))])
+    result = run_sql("""SELECT author_item, affiliation_acronym 
+                        FROM aulAUTHOR_AFFILIATIONS WHERE paper_id = %%s 
+                        AND affiliation_acronym IN (%s);""" % 
+                     ', '.join(['%s'] * len(removed)), 
+                     [rows_id] + [acronym.encode('utf-8') 
+                                  for acronym in removed])
+    used = {}
+    for author_item, acronym in result:
+        if (author_item in kept):
+            used[acronym.decode('utf-8')] = True
+            
+    return acronyms, used.keys()
+    
+def load_row_counts(paper_id):
+    """
+    Returns a dictionary mapping the keys of the patchable tables to the number
+    of rows of the paper with the given id. Should NOT be used alone, the 
+    tables have to be locked. Refer to patch() instead.
+    """
+    counts = {}
+    rows_id = rows_paper_id(paper_id)
+    for table_key, (table, columns, values) in PATCH_TABLES.items():
+        counts[table_key] = run_sql("""SELECT COUNT(*) FROM %s 
+                                       WHERE paper_id = %%s;""" % table, 
+                                    (rows_id,))[0][0]
+                                    
+    return counts
+        
+def patch_last_modified(paper_id, last_modified):
+    """
+    Increases the last modified timestamp of the paper with the given id, but 
+    only if it still is the passed one. Returns the new timestamp or None if 
+    the paper has been modified in the meantime. Should NOT be used alone. 
+    Refer to patch() instead.
+    """
+    new_last_modified = max(now(), last_modified + 1)
+    updated = run_sql("""UPDATE aulPAPERS SET last_modified = %s 
+                         WHERE id = %s AND last_modified = %s;""", 
+                      (new_last_modified, paper_id, last_modified))
+    if (not updated):
+        return None
+        
+    return new_last_modified
+    
+def patch_operation(paper_id, operation):
+    """
+    Applies a single checked patch operation to the paper with the given id. 
+    Should NOT be used alone. Refer to patch() instead. Returns the paper id.
+    """
+    kind = operation[cfg.Patch.OPERATION]
+    table_key = operation[cfg.Patch.TABLE]
+    
+    if (table_key == cfg.Patch.PAPER):
+        row = operation[cfg.Patch.ROW]
+        run_sql("""UPDATE aulPAPERS SET title = %s, collaboration = %s, 
+                   experiment_number = %s WHERE id = %s;""", 
+                (row[cfg.JSON.PAPER_TITLE], row[cfg.JSON.COLLABORATION], 
+                 row[cfg.JSON.EXPERIMENT_NUMBER], paper_id))
+        return paper_id
+        
+    table, columns, values = PATCH_TABLES[table_key]
+    index = operation[cfg.Patch.INDEX]
+    is_author = table_key == cfg.JSON.AUTHORS_KEY
+    
+    if (kind == cfg.Patch.DELETE):
+        run_sql("""DELETE FROM %s WHERE item = %%s 
+                   AND paper_id = %%s;""" % table, (index, paper_id))
+        shift_items(table, 'item', paper_id, index + 1, None, -1)
+        if (is_author):
+            run_sql("""DELETE FROM aulAUTHOR_AFFILIATIONS WHERE author_item = %s
+                       AND paper_id = %s;""", (index, paper_id))
+            shift_items('aulAUTHOR_AFFILIATIONS', 'author_item', paper_id, 
+                        index + 1, None, -1)
+                        
+    elif (kind == cfg.Patch.MOVE):
+        move_item(table, 'item', paper_id, index, operation[cfg.Patch.TO])
+        if (is_author):
+            move_item('aulAUTHOR_AFFILIATIONS', 'author_item', paper_id, index, 
+                      operation[cfg.Patch.TO])
                       
-        run_sql("""INSERT INTO
-                   aulAUTHOR_AFFILIATIONS (item, affiliation_acronym, 
-                                           affiliation_status, author_item, 
-                                           paper_id)
-                   VALUES(%s, %s, %s, %s, %s)
-                   ON DUPLICATE KEY UPDATE
-                   affiliation_acronym = %s,
-                   affiliation_status = %s;""", data_tuple)
-    
-    # Delete entries that the author does not have anymore               
-    run_sql("""DELETE FROM aulAUTHOR_AFFILIATIONS WHERE item >= %s 
-               AND author_item = %s AND paper_id = %s;""", 
-            (len(data), author_id, paper_id))
+    else:
+        row = operation[cfg.Patch.ROW]
+        if (kind == cfg.Patch.INSERT):
+            shift_items(table, 'item', paper_id, index, None, 1)
+            if (is_author):
+                shift_items('aulAUTHOR_AFFILIATIONS', 'author_item', paper_id, 
+                            index, None, 1)
+                            
+        upsert_rows(table, ('item',), columns, paper_id, 
+                    [(index,) + values(row)])
+                    
+        if (is_author and row[cfg.JSON.AFFILIATIONS] is not None):
+            if (kind == cfg.Patch.UPDATE):
+                run_sql("""DELETE FROM aulAUTHOR_AFFILIATIONS 
+                           WHERE author_item = %s AND paper_id = %s;""", 
+                        (index, paper_id))
+            rows = [(index, item) + author_affiliation_values(affiliation) 
+                    for item, affiliation 
+                    in enumerate(row[cfg.JSON.AFFILIATIONS])]
+            upsert_rows('aulAUTHOR_AFFILIATIONS', ('author_item', 'item'), 
+                        AUTHOR_AFFILIATION_COLUMNS, paper_id, rows)
+                        
+    return paper_id
+    
+def shift_items(table, column, paper_id, start, end, delta):
+    """
+    Adds delta to the passed item column of all rows of the table and paper 
+    whose item is at least start and, unless end is None, less than end. The 
+    rows are updated in an order that never violates the primary key. Should 
+    NOT be used alone. Refer to patch() instead. Returns the paper id.
+    """
+    params = [delta, paper_id, start]
+    condition = ''
+    if (end is not None):
+        condition = 'AND %s < %%s' % column
+        params.append(end)
+    direction = 'ASC'
+    if (delta > 0):
+        direction = 'DESC'
+        
+    run_sql("""UPDATE %s SET %s = %s + %%s WHERE paper_id = %%s 
+               AND %s >= %%s %s ORDER BY %s %s;""" % (table, column, column, 
+                                                      column, condition, 
+                                                      column, direction), 
+            params)
             
-    # Delete entries of non existing author
-    run_sql("""DELETE FROM aulAUTHOR_AFFILIATIONS WHERE author_item >= %s 
-                AND paper_id = %s;""",
-            (number_of_authors, paper_id))
+    return paper_id
+    
+def move_item(table, column, paper_id, index, to):
+    """
+    Moves the rows with the item index in the passed column of the table and 
+    paper to the item to, shifting the rows in between accordingly. The moved 
+    rows are parked at the highest possible item while shifting. Should NOT be 
+    used alone. Refer to patch() instead. Returns the paper id.
+    """
+    if (index == to):
+        return paper_id
+        
+    run_sql("""UPDATE %s SET %s = %%s WHERE paper_id = %%s 
+               AND %s = %%s;""" % (table, column, column), 
+            (PARKED_ITEM, paper_id, index))
+    if (index < to):
+        shift_items(table, column, paper_id, index + 1, to + 1, -1)
+    else:
+        shift_items(table, column, paper_id, to, index, 1)
+    run_sql("""UPDATE %s SET %s = %%s WHERE paper_id = %%s 
+               AND %s = %%s;""" % (table, column, column), 
+            (to, paper_id, PARKED_ITEM))
             
     return paper_id
@@ -0,0 +1,323 @@
+# -*- coding: utf-8 -*-
+##
+## This file is part of Invenio.
+## Copyright (C) 2011 CERN.
+##
+## Invenio is free software; you can redistribute it and/or
+## modify it under the terms of the GNU General Public License as
+## published by the Free Software Foundation; either version 2 of the
+## License, or (at your option) any later version.
+##
+## Invenio is distributed in the hope that it will be useful, but
+## WITHOUT ANY WARRANTY; without even the implied warranty of
+## MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+## General Public License for more details.
+##
+## You should have received a copy of the GNU General Public License
+## along with Invenio; if not, write to the Free Software Foundation, Inc.,
+## 59 Temple Place, Suite 330, Boston, MA 02111-1307, USA.
+
+"""Unit tests for the authorlist database layer."""
+
+__revision__ = "$Id$"
+
+import unittest
+
+import invenio.authorlist_config as cfg
+from invenio import authorlist_dblayer
+from invenio import authorlist_benchmark
+from invenio.testutils import make_test_suite, run_test_suite
+
+class AuthorlistRowDiffTest(unittest.TestCase):
+    """Test the row diffing used by the batched save."""
+
+    def test_wash_row(self):
+        """authorlist - washing of JSON values to database values"""
+        self.assertEqual(authorlist_dblayer.wash_row((u'M\xfcller', True, 'x')),
+                         ('M\xc3\xbcller', 1, 'x'))
+
+    def test_unchanged_rows(self):
+        """authorlist - unchanged rows are not written again"""
+        stored = {(0,): ('CERN', 1), (1,): ('DESY', 0)}
+        incoming = {(0,): ('CERN', 1), (1,): ('DESY', 0)}
+        self.assertEqual(authorlist_dblayer.changed_rows(stored, incoming), [])
+        self.assertEqual(authorlist_dblayer.removed_keys(stored, incoming), [])
+
+    def test_changed_and_new_rows(self):
+        """authorlist - only modified and new rows are written"""
+        stored = {(0,): ('CERN', 1), (1,): ('DESY', 0)}
+        incoming = {(0,): ('CERN', 1), (1,): ('DESY', 1), (2,): ('KEK', 0)}
+        self.assertEqual(authorlist_dblayer.changed_rows(stored, incoming),
+                         [(1, 'DESY', 1), (2, 'KEK', 0)])
+
+    def test_removed_keys(self):
+        """authorlist - rows missing from the incoming data are removed"""
+        stored = {(0, 0): ('CERN', 'Affiliated with'),
+                  (0, 1): ('DESY', 'Affiliated with'),
+                  (1, 0): ('KEK', 'Also at')}
+        incoming = {(0, 0): ('CERN', 'Affiliated with')}
+        self.assertEqual(authorlist_dblayer.removed_keys(stored, incoming),
+                         [(0, 1), (1, 0)])
+
+class AuthorlistAuthorLoadingTest(unittest.TestCase):
+    """Test the in memory grouping of the author affiliations."""
+
+    def test_group_author_affiliations(self):
+        """authorlist - grouping of author affiliation rows by author"""
+        rows = ((0, 'CERN', 'Affiliated with'),
+                (0, 'DESY', 'Also at'),
+                (2, 'KEK', 'Affiliated with'))
+        self.assertEqual(authorlist_dblayer.group_author_affiliations(rows),
+                         {0: [['CERN', 'Affiliated with'],
+                              ['DESY', 'Also at']],
+                          2: [['KEK', 'Affiliated with']]})
+
+    def test_build_authors(self):
+        """authorlist - authors without affiliation rows get an empty list"""
+        rows = ((0, 'Doe', 'John', 'J. Doe', 1, ''),
+                (1, 'Roe', 'Jane', 'J. Roe', 0, 'INSPIRE-1'))
+        affiliations = {0: [['CERN', 'Affiliated with']]}
+        self.assertEqual(authorlist_dblayer.build_authors(rows, affiliations),
+                         [[1, '', 'Doe', 'John', 'J. Doe', True,
+                           [['CERN', 'Affiliated with']], ''],
+                          [2, '', 'Roe', 'Jane', 'J. Roe', False, [],
+                           'INSPIRE-1']])
+
+class AuthorlistPatchCheckTest(unittest.TestCase):
+    """Test the checking of patch operations before they are applied."""
+
+    def test_valid_operations(self):
+        """authorlist - well-formed patch operations are accepted"""
+        for operation in ({'op': 'update', 'table': 'paper',
+                           'row': {'paper_title': 'A', 'collaboration': 'B',
+                                   'experiment_number': 'C'}},
+                          {'op': 'insert', 'table': 'authors', 'index': 0,
+                           'row': [1, '', 'Doe', 'J.', 'J. Doe', True, [], '']},
+                          {'op': 'update', 'table': 'authors', 'index': 0,
+                           'row': [1, '', 'Doe', 'J.', 'J. Doe', True, None,
+                                   '']},
+                          {'op': 'insert', 'table': 'reference_ids',
+                           'index': 0, 'row': 'ref'},
+                          {'op': 'update', 'table': 'affiliations', 'index': 0,
+                           'row': [1, '', 'CERN', '', 'CERN', 'cern.ch', True,
+                                   '']},
+                          {'op': 'delete', 'table': 'reference_ids', 'index': 3},
+                          {'op': 'move', 'table': 'affiliations', 'index': 3,
+                           'to': 0}):
+            authorlist_dblayer.check_patch_operation(operation)
+
+    def test_malformed_operations(self):
+        """authorlist - malformed patch operations are rejected"""
+        for operation in ({'op': 'delete', 'table': 'paper'},
+                          {'op': 'update', 'table': 'aulPAPERS', 'index': 0,
+                           'row': []},
+                          {'op': 'replace', 'table': 'authors', 'index': 0},
+                          {'op': 'delete', 'table': 'authors', 'index': -1},
+                          {'op': 'move', 'table': 'authors', 'index': 1},
+                          {'op': 'update', 'table': 'authors', 'index': 1},
+                          {'op': 'update', 'table': 'paper',
+                           'row': {'paper_title': 'A'}},
+                          {'op': 'update', 'table': 'authors', 'index': 1,
+                           'row': [1, '', 'Doe']},
+                          {'op': 'insert', 'table': 'authors', 'index': 1,
+                           'row': [1, '', 'Doe', 'J.', 'J. Doe', True,
+                                   [['CERN']], '']},
+                          {'op': 'insert', 'table': 'authors', 'index': 1,
+                           'row': [1, '', 'Doe', 'J.', 'J. Doe', True, 'CERN',
+                                   '']},
+                          {'op': 'insert', 'table': 'authors', 'index': 0,
+                           'row': [1, '', 'Doe', 'J.', 'J. Doe', True, None,
+                                   '']},
+                          {'op': 'update', 'table': 'affiliations', 'index': 0,
+                           'row': {'acronym': 'CERN'}},
+                          {'op': 'insert', 'table': 'reference_ids',
+                           'index': 0, 'row': ['ref']}):
+            self.assertRaises(ValueError,
+                              authorlist_dblayer.check_patch_operation,
+                              operation)
+
+    def test_bounds(self):
+        """authorlist - patch indices are checked against the row counts"""
+        counts = {'authors': 2, 'affiliations': 0, 'reference_ids': 1}
+        row = [1, '', 'Doe', 'J.', 'J. Doe', True, [], '']
+        for operations in ([{'op': 'insert', 'table': 'authors', 'index': 2,
+                             'row': row},
+                            {'op': 'update', 'table': 'authors', 'index': 2,
+                             'row': row},
+                            {'op': 'move', 'table': 'authors', 'index': 2,
+                             'to': 0}],
+                           [{'op': 'delete', 'table': 'reference_ids',
+                             'index': 0},
+                            {'op': 'insert', 'table': 'reference_ids',
+                             'index': 0, 'row': 'ref'}],
+                           [{'op': 'update', 'table': 'paper',
+                             'row': {}}]):
+            authorlist_dblayer.check_patch_bounds(operations, counts)
+        for operations in ([{'op': 'insert', 'table': 'authors', 'index': 3,
+                             'row': row}],
+                           [{'op': 'update', 'table': 'authors', 'index': 2,
+                             'row': row}],
+                           [{'op': 'delete', 'table': 'affiliations',
+                             'index': 0}],
+                           [{'op': 'move', 'table': 'authors', 'index': 0,
+                             'to': 2}],
+                           [{'op': 'delete', 'table': 'authors', 'index': 1},
+                            {'op': 'delete', 'table': 'authors', 'index': 1}]):
+            self.assertRaises(ValueError,
+                              authorlist_dblayer.check_patch_bounds,
+                              operations, counts)
+        self.assertEqual(counts['authors'], 2)
+
+    def test_apply_patch(self):
+        """authorlist - patch operations applied to the paper data"""
+        data = {'paper_title': 'A', 'collaboration': 'B',
+                'experiment_number': 'C', 'reference_ids': ['r1', 'r2'],
+                'affiliations': [],
+                'authors': [[1, '', 'Doe', 'J.', 'J. Doe', True,
+                             [['CERN', 'Affiliated with']], ''],
+                            [2, '', 'Roe', 'R.', 'R. Roe', True, [], '']]}
+        operations = [{'op': 'update', 'table': 'paper',
+                       'row': {'paper_title': 'D', 'collaboration': 'E',
+                               'experiment_number': 'F'}},
+                      {'op': 'update', 'table': 'authors', 'index': 0,
+                       'row': [1, '', 'Poe', 'J.', 'J. Poe', True, None, '']},
+                      {'op': 'move', 'table': 'authors', 'index': 0, 'to': 1},
+                      {'op': 'insert', 'table': 'reference_ids', 'index': 0,
+                       'row': 'r0'},
+                      {'op': 'delete', 'table': 'reference_ids', 'index': 2}]
+        for operation in operations:
+            authorlist_dblayer.check_patch_operation(operation)
+        patched = authorlist_dblayer.apply_patch(data, operations)
+        self.assertEqual((patched['paper_title'], patched['collaboration'],
+                          patched['experiment_number']), ('D', 'E', 'F'))
+        self.assertEqual(patched['reference_ids'], ['r0', 'r1'])
+        self.assertEqual(patched['authors'],
+                         [[2, '', 'Roe', 'R.', 'R. Roe', True, [], ''],
+                          [1, '', 'Poe', 'J.', 'J. Poe', True,
+                           [['CERN', 'Affiliated with']], '']])
+
+    def test_patch_acronyms(self):
+        """authorlist - acronyms a patch is validated against"""
+        queries = []
+        def run_sql(query, params=()):
+            queries.append(params)
+            if ('aulAUTHOR_AFFILIATIONS' in query):
+                return ((0, 'KEK'), (1, 'KEK'), (2, 'KEK'))
+            if ('aulAFFILIATIONS' in query):
+                return (('CERN',), ('KEK',), ('D\xc3\xa9sy',))
+            return ()
+        original = authorlist_dblayer.run_sql
+        authorlist_dblayer.run_sql = run_sql
+        try:
+            counts = {'reference_ids': 0, 'affiliations': 3, 'authors': 3}
+            author = [1, '', 'Doe', 'J.', 'J. Doe', True, None, '']
+            self.assertEqual(authorlist_dblayer.load_patch_acronyms(
+                             1, [{'op': 'update', 'table': 'paper',
+                                  'row': {}}], counts), ([], []))
+            self.assertEqual(queries, [])
+            operations = [{'op': 'insert', 'table': 'affiliations',
+                           'index': 0,
+                           'row': [1, '', u'IN2P3', u'', u'', u'', True,
+                                   u'']},
+                          {'op': 'update', 'table': 'authors', 'index': 0,
+                           'row': author}]
+            self.assertEqual(authorlist_dblayer.load_patch_acronyms(
+                             1, operations, counts),
+                             ([u'IN2P3', u'CERN', u'KEK', u'D\xe9sy'], []))
+            self.assertEqual(len(queries), 2)
+            operations = [{'op': 'delete', 'table': 'affiliations',
+                           'index': 1},
+                          {'op': 'update', 'table': 'authors', 'index': 0,
+                           'row': author},
+                          {'op': 'update', 'table': 'authors', 'index': 1,
+                           'row': author[:6] + [[], '']},
+                          {'op': 'delete', 'table': 'authors', 'index': 2}]
+            self.assertEqual(authorlist_dblayer.load_patch_acronyms(
+                             1, operations, counts),
+                             ([u'CERN', u'D\xe9sy'], [u'KEK']))
+            self.assertEqual(queries[-1], [1, 'KEK'])
+            operations = operations[:1] + operations[2:3] + \
+                [{'op': 'update', 'table': 'authors', 'index': 0,
+                  'row': author[:6] + [[], '']},
+                 {'op': 'delete', 'table': 'authors', 'index': 2}]
+            self.assertEqual(authorlist_dblayer.load_patch_acronyms(
+                             1, operations, counts),
+                             ([u'CERN', u'D\xe9sy'], []))
+        finally:
+            authorlist_dblayer.run_sql = original
+
+class AuthorlistListingTest(unittest.TestCase):
+    """Test the helpers of the paginated paper listing."""
+
+    def test_cursor_roundtrip(self):
+        """authorlist - listing cursors decode to their position"""
+        cursor = authorlist_dblayer.encode_cursor(1300000000, 42)
+        self.assertEqual(authorlist_dblayer.decode_cursor(cursor),
+                         (1300000000, 42))
+
+    def test_malformed_cursor(self):
+        """authorlist - malformed listing cursors start from the first page"""
+        for cursor in ('', None, 'foo', '1-2-3', '12-x'):
+            self.assertEqual(authorlist_dblayer.decode_cursor(cursor), None)
+
+    def test_escape_like(self):
+        """authorlist - title search matches wildcards literally"""
+        self.assertEqual(authorlist_dblayer.escape_like('50%_a\\b'),
+                         '50\\%\\_a\\\\b')
+
+class AuthorlistBenchmarkTest(unittest.TestCase):
+    """Test the helpers of the authorlist benchmark."""
+
+    def setUp(self):
+        self.original = (authorlist_dblayer.run_sql,
+                         authorlist_dblayer.run_sql_many)
+        authorlist_dblayer.run_sql = lambda *args, **kwargs: ()
+        authorlist_dblayer.run_sql_many = lambda *args, **kwargs: 0
+
+    def tearDown(self):
+        authorlist_dblayer.run_sql, authorlist_dblayer.run_sql_many = \
+            self.original
+
+    def test_query_counter(self):
+        """authorlist - benchmark counts statements sent to the server"""
+        counter = authorlist_benchmark.QueryCounter()
+        counter.install()
+        try:
+            authorlist_dblayer.run_sql('SELECT 1;')
+            authorlist_dblayer.run_sql_many('INSERT', [()] * 5, limit=2)
+            authorlist_dblayer.run_sql_many('INSERT', [])
+        finally:
+            counter.uninstall()
+        self.assertEqual(counter.queries, 4)
+        authorlist_dblayer.run_sql('SELECT 1;')
+        self.assertEqual(counter.queries, 4)
+
+    def test_edit_operations(self):
+        """authorlist - benchmark edits match their patch operations"""
+        data = authorlist_benchmark.generate_paper(35)
+        edited, operations = authorlist_benchmark.edit_paper(data, 4)
+        authors = [list(author) for author in data[cfg.JSON.AUTHORS_KEY]]
+        for operation in operations:
+            authorlist_dblayer.check_patch_operation(operation)
+            index = operation[cfg.Patch.INDEX]
+            kind = operation[cfg.Patch.OPERATION]
+            if (kind == cfg.Patch.UPDATE):
+                authors[index] = operation[cfg.Patch.ROW]
+            elif (kind == cfg.Patch.INSERT):
+                authors.insert(index, operation[cfg.Patch.ROW])
+            else:
+                del authors[index]
+        self.assertEqual(len(operations), 6)
+        self.assertEqual(authors, edited[cfg.JSON.AUTHORS_KEY])
+        self.assertEqual(len(data[cfg.JSON.AUTHORS_KEY]), 35)
+        self.assertEqual(data[cfg.JSON.AUTHORS_KEY][0][cfg.JSON.FAMILY_NAME],
+                         u'M\xfcller0')
+
+TEST_SUITE = make_test_suite(AuthorlistRowDiffTest,
+                             AuthorlistAuthorLoadingTest,
+                             AuthorlistPatchCheckTest,
+                             AuthorlistListingTest,
+                             AuthorlistBenchmarkTest)
+
+if __name__ == "__main__":
+    run_test_suite(TEST_SUITE)
@@ -17,42 +17,532 @@
 
 """ Invenio Authorlist Data Conversion Engine. """
 
+import os
 import time
 import simplejson as json
+from cStringIO import StringIO
 from xml.dom.minidom import getDOMImplementation
+from xml.sax.saxutils import escape
 
 import invenio.authorlist_config as cfg
+from invenio.config import CFG_PYLIBDIR
+from invenio.pluginutils import PluginContainer
 
 class Converter(object):
     CONTENT_TYPE = 'text/plain'
     FILE_NAME = 'converted.txt'
+    # format of a comment, e.g. to mark an incomplete output
+    COMMENT = '\n%s\n'
 
     def __init__(self):
         raise NotImplementedError
         
-    def dump(self, data):
-        raise NotImplementedError
+    def dump(self, data, stream):
+        parsed = json.loads(data)
+        index = AcronymIndex(parsed[cfg.JSON.AFFILIATIONS_KEY])
+        self.dump_parsed(parsed, index, stream)
         
-    def dumps(self, data):
+    def dump_parsed(self, parsed, index, stream):
         raise NotImplementedError
         
-        
-        
+    def dumps(self, data):
+        stream = StringIO()
+        self.dump(data, stream)
+        return stream.getvalue()
+        
+class AcronymIndex(object):
+    """
+    Lookup structure of the affiliations of a paper by their acronym, built 
+    with a single pass over the affiliations. It holds the organization ids 
+    used in authors.xml, the names of the affiliations and the line of their 
+    first appearance, and records the lines of repeated acronyms. The index is 
+    built once per request and shared by validate() and the converters. As 
+    before, a repeated acronym maps to the id and name of its last occurrence.
+    """
+    def __init__(self, affiliations):
+        self.ids = {}
+        self.names = {}
+        self.lines = {}
+        self.duplicates = []
+        
+        for index, affiliation in enumerate(affiliations):
+            acronym = affiliation[cfg.JSON.ACRONYM]
+            self.ids[acronym] = cfg.AuthorsXML.ORGANIZATION_ID + str(index)
+            self.names[acronym] = affiliation[cfg.JSON.NAME]
+            
+            if (cfg.EMPTY.match(acronym) is not None):
+                continue
+            if (acronym in self.lines):
+                self.duplicates.append(affiliation[cfg.JSON.INDEX])
+            else:
+                self.lines[acronym] = affiliation[cfg.JSON.INDEX]
+                
+    def __contains__(self, acronym):
+        return acronym in self.lines
+        
+def validate(parsed, index=None):
+    """
+    Checks the passed parsed JSON data of a paper the same way the editor does 
+    before saving and returns the list of all problems found, an empty list if 
+    there are none. Every author affiliation and umbrella organization is 
+    resolved through the acronym index, which is built if not passed, so the 
+    whole check is linear in the size of the paper. The messages are plain 
+    text.
+    """
+    affiliations = parsed[cfg.JSON.AFFILIATIONS_KEY]
+    if (index is None):
+        index = AcronymIndex(affiliations)
+        
+    errors = []
+    if (cfg.EMPTY.match(parsed[cfg.JSON.PAPER_TITLE]) is not None):
+        errors.append(cfg.Validation.TITLE_MISSING)
+    if (cfg.EMPTY.match(parsed[cfg.JSON.COLLABORATION]) is not None):
+        errors.append(cfg.Validation.COLLABORATION_MISSING)
+        
+    missing_acronyms = []
+    missing_names = []
+    unknown_umbrellas = []
+    for affiliation in affiliations:
+        line = affiliation[cfg.JSON.INDEX]
+        if (cfg.EMPTY.match(affiliation[cfg.JSON.ACRONYM]) is not None):
+            missing_acronyms.append(line)
+        if (cfg.EMPTY.match(affiliation[cfg.JSON.NAME]) is not None):
+            missing_names.append(line)
+        umbrella = affiliation[cfg.JSON.UMBRELLA]
+        if (cfg.EMPTY.match(umbrella) is None and umbrella not in index):
+            unknown_umbrellas.append(line)
+            
+    missing_paper_names = []
+    unknown_acronyms = []
+    used = {}
+    for author in parsed[cfg.JSON.AUTHORS_KEY]:
+        if (cfg.EMPTY.match(author[cfg.JSON.PAPER_NAME]) is not None):
+            missing_paper_names.append(author[cfg.JSON.INDEX])
+        for affiliation in author[cfg.JSON.AFFILIATIONS]:
+            acronym = affiliation[cfg.JSON.AFFILIATION_ACRONYM]
+            if (acronym in used):
+                continue
+            used[acronym] = True
+            if (acronym not in index):
+                unknown_acronyms.append(acronym)
+                
+    unused_acronyms = [affiliation[cfg.JSON.ACRONYM] 
+                       for affiliation in affiliations 
+                       if (affiliation[cfg.JSON.ACRONYM] in index and 
+                           affiliation[cfg.JSON.ACRONYM] not in used)]
+        
+    for message, values in ((cfg.Validation.ACRONYMS_MISSING, missing_acronyms),
+                            (cfg.Validation.NAMES_MISSING, missing_names),
+                            (cfg.Validation.DUPLICATE_ACRONYMS, 
+                             index.duplicates),
+                            (cfg.Validation.UNKNOWN_UMBRELLAS, 
+                             unknown_umbrellas),
+                            (cfg.Validation.PAPER_NAMES_MISSING, 
+                             missing_paper_names),
+                            (cfg.Validation.UNKNOWN_ACRONYMS, 
+                             unknown_acronyms),
+                            (cfg.Validation.UNUSED_ACRONYMS, 
+                             unused_acronyms)):
+        if (values):
+            errors.append(message % ', '.join(['%s' % value 
+                                               for value in values]))
+            
+    return errors
+    
+def validate_patch(operations, acronyms, used=()):
+    """
+    Checks only the rows inserted or updated by the passed patch operations, 
+    see authorlist_dblayer.patch(), and returns the list of problems found the 
+    same way validate() does. The acronyms are the ones of the affiliations of 
+    the patched paper in their order, used are the acronyms still referenced 
+    by stored author affiliations the patch keeps. Unlike validate() this does 
+    not need the whole paper, so problems that only show on the whole paper, 
+    e.g. unused acronyms, are left to the validation before saving.
+    """
+    counts = {}
+    for acronym in acronyms:
+        if (cfg.EMPTY.match(acronym) is None):
+            counts[acronym] = counts.get(acronym, 0) + 1
+        
+    errors = []
+    paper = None
+    missing_acronyms = []
+    missing_names = []
+    duplicates = []
+    unknown_umbrellas = []
+    missing_paper_names = []
+    unknown_acronyms = []
+    for acronym in used:
+        if (acronym not in counts and acronym not in unknown_acronyms):
+            unknown_acronyms.append(acronym)
+            
+    for operation in operations:
+        if (operation[cfg.Patch.OPERATION] not in (cfg.Patch.INSERT, 
+                                                   cfg.Patch.UPDATE)):
+            continue
+        table = operation[cfg.Patch.TABLE]
+        row = operation[cfg.Patch.ROW]
+        
+        if (table == cfg.Patch.PAPER):
+            paper = row
+            
+        elif (table == cfg.JSON.AFFILIATIONS_KEY):
+            line = row[cfg.JSON.INDEX]
+            acronym = row[cfg.JSON.ACRONYM]
+            umbrella = row[cfg.JSON.UMBRELLA]
+            if (cfg.EMPTY.match(acronym) is not None):
+                missing_acronyms.append(line)
+            elif (counts.get(acronym, 0) > 1):
+                duplicates.append(line)
+            if (cfg.EMPTY.match(row[cfg.JSON.NAME]) is not None):
+                missing_names.append(line)
+            if (cfg.EMPTY.match(umbrella) is None and umbrella not in counts):
+                unknown_umbrellas.append(line)
+                
+        elif (table == cfg.JSON.AUTHORS_KEY):
+            if (cfg.EMPTY.match(row[cfg.JSON.PAPER_NAME]) is not None):
+                missing_paper_names.append(row[cfg.JSON.INDEX])
+            for affiliation in row[cfg.JSON.AFFILIATIONS] or ():
+                acronym = affiliation[cfg.JSON.AFFILIATION_ACRONYM]
+                if (acronym not in counts and acronym not in unknown_acronyms):
+                    unknown_acronyms.append(acronym)
+                    
+    # only the last update of the paper information is written
+    if (paper is not None):
+        if (cfg.EMPTY.match(paper[cfg.JSON.PAPER_TITLE]) is not None):
+            errors.append(cfg.Validation.TITLE_MISSING)
+        if (cfg.EMPTY.match(paper[cfg.JSON.COLLABORATION]) is not None):
+            errors.append(cfg.Validation.COLLABORATION_MISSING)
+            
+    for message, values in ((cfg.Validation.ACRONYMS_MISSING, missing_acronyms),
+                            (cfg.Validation.NAMES_MISSING, missing_names),
+                            (cfg.Validation.DUPLICATE_ACRONYMS, duplicates),
+                            (cfg.Validation.UNKNOWN_UMBRELLAS, 
+                             unknown_umbrellas),
+                            (cfg.Validation.PAPER_NAMES_MISSING, 
+                             missing_paper_names),
+                            (cfg.Validation.UNKNOWN_ACRONYMS, 
+                             unknown_acronyms)):
+        if (values):
+            errors.append(message % ', '.join(['%s' % value 
+                                               for value in values]))
+            
+    return errors
+    
+class XMLWriter(object):
+    """
+    Minimal incremental XML writer. Elements are escaped, UTF-8 encoded and 
+    indented like minidom's toprettyxml() output, but instead of building a 
+    tree they are buffered and written to the stream in batches of 
+    cfg.CHUNK_SIZE pieces. Call close() to flush the remaining buffer.
+    """
+    INDENT = '    '
+    
+    def __init__(self, stream):
+        self.stream = stream
+        self.buffer = []
+        self.open_elements = []
+        
+    def attributes(self, attributes):
+        return ''.join([' %s="%s"' % (name, escape_xml(value))
+                        for name, value in attributes])
+        
+    def declaration(self):
+        self.write('<?xml version="1.0" encoding="utf-8"?>\n')
+        
+    def start(self, name, attributes=()):
+        self.write('%s<%s%s>\n' % (self.INDENT * len(self.open_elements), name,
+                                   self.attributes(attributes)))
+        self.open_elements.append(name)
+        
+    def end(self):
+        name = self.open_elements.pop()
+        self.write('%s</%s>\n' % (self.INDENT * len(self.open_elements), name))
+        
+    def element(self, name, text=None, attributes=()):
+        indent = self.INDENT * len(self.open_elements)
+        if (text is None):
+            self.write('%s<%s%s/>\n' % (indent, name, self.attributes(attributes)))
+        else:
+            self.write('%s<%s%s>%s</%s>\n' % (indent, name, 
+                                              self.attributes(attributes), 
+                                              escape_xml(text), name))
+        
+    def write(self, piece):
+        self.buffer.append(piece)
+        if (len(self.buffer) >= cfg.CHUNK_SIZE):
+            self.flush()
+            
+    def flush(self):
+        if (self.buffer):
+            self.stream.write(''.join(self.buffer))
+            self.buffer = []
+            
+    def close(self):
+        while (self.open_elements):
+            self.end()
+        self.flush()
+        
+def escape_xml(value):
+    """
+    Escapes the passed value for the use in XML text or attributes the same way 
+    minidom does and encodes it in UTF-8.
+    """
+    if (isinstance(value, unicode)):
+        value = value.encode('utf-8')
+    return escape(str(value), {'"': '&quot;'})
+    
 class NA62Latex(Converter):
+    """
+    Converts the authorlist JSON data into a LaTeX author list fragment in the 
+    style of the NA62 collaboration papers. Authors are listed with their name 
+    on paper, the affiliations they are affiliated with are numbered in order 
+    of their first appearance, all other affiliation statuses (also at, on 
+    leave from, ...) and deceased authors are marked with footnotes.
+    """
+    CONTENT_TYPE = 'application/x-latex'
     FILE_NAME = 'la.tex'
+    COMMENT = '\n%% %s\n'
     
     def __init__(self):
         pass
         
-    def dump(self, data):
-        pass
+    def dump_parsed(self, parsed, index, stream):
+        names = index.names
+        deceased = False
+        numbers = {}
+        footnotes = {}
+        ordered_affiliations = []
+        ordered_footnotes = []
+        authors = []
+        
+        for author in parsed[cfg.JSON.AUTHORS_KEY]:
+            marks = []
+            for affiliation in author[cfg.JSON.AFFILIATIONS]:
+                acronym = affiliation[cfg.JSON.AFFILIATION_ACRONYM]
+                status = affiliation[cfg.JSON.AFFILIATION_STATUS]
+                
+                if (status == cfg.NA62Latex.AFFILIATED):
+                    if (acronym not in numbers):
+                        ordered_affiliations.append(acronym)
+                        numbers[acronym] = str(len(ordered_affiliations))
+                    marks.append(numbers[acronym])
+                else:
+                    key = (status, acronym)
+                    if (key not in footnotes):
+                        ordered_footnotes.append(key)
+                        footnotes[key] = latex_footnote_symbol(len(footnotes))
+                    marks.append(footnotes[key])
+                    
+            if (not author[cfg.JSON.ALIVE]):
+                deceased = True
+                marks.append(cfg.NA62Latex.DECEASED_SYMBOL)
+                
+            name = latex_escape(author[cfg.JSON.PAPER_NAME]).replace(' ', '~')
+            if (marks):
+                name += '$^{%s}$' % ','.join(marks)
+            authors.append(name)
+            
+        out = []
+        out.append('%% %s author list, generated on %s\n' % 
+                   (latex_escape(parsed[cfg.JSON.COLLABORATION]), 
+                    time.strftime(cfg.AuthorsXML.TIME_FORMAT)))
+        out.append('\\begin{center}\n')
+        out.append('{\\Large The %s Collaboration}\\\\[0.5cm]\n' % 
+                   latex_escape(parsed[cfg.JSON.COLLABORATION]))
+        out.append(',\n'.join(authors))
+        out.append('\n\\end{center}\n\n')
+        
+        out.append('\\noindent\n')
+        for acronym in ordered_affiliations:
+            out.append('$^{%s}$%s\\\\\n' % (numbers[acronym], 
+                                            latex_escape(names.get(acronym, 
+                                                                   acronym))))
+        for key in ordered_footnotes:
+            status, acronym = key
+            out.append('$^{%s}$%s %s\\\\\n' % (footnotes[key], 
+                                              latex_escape(status), 
+                                              latex_escape(names.get(acronym, 
+                                                                     acronym))))
+        if (deceased):
+            out.append('$^{%s}$%s\\\\\n' % (cfg.NA62Latex.DECEASED_SYMBOL, 
+                                            cfg.AuthorsXML.DECEASED))
+                                            
+        stream.write(''.join(out))
+        
+def latex_escape(value):
+    """
+    Escapes the LaTeX special characters of the passed value and encodes it in 
+    UTF-8.
+    """
+    if (isinstance(value, unicode)):
+        value = value.encode('utf-8')
+    return cfg.NA62Latex.SPECIAL.sub(lambda match: 
+                                     cfg.NA62Latex.ESCAPES[match.group(0)], 
+                                     str(value))
+                                     
+def latex_footnote_symbol(index):
+    """
+    Returns the footnote letter for the passed zero based index - i.e. a, b, 
+    ..., z, aa, ab, ...
+    """
+    symbol = ''
+    index += 1
+    while (index > 0):
+        index, remainder = divmod(index - 1, 26)
+        symbol = chr(ord('a') + remainder) + symbol
+        
+    return symbol
         
-    def dumps(self, data):
+class AuthorsXML(Converter):
+    """
+    Converts the authorlist JSON data into the authors.xml format. The document 
+    is written incrementally to the passed stream, no DOM tree is kept in 
+    memory. See AuthorsXMLDOM for the minidom based implementation.
+    """
+    CONTENT_TYPE = 'text/xml'
+    FILE_NAME = 'authors.xml'
+    COMMENT = '\n<!-- %s -->\n'
+    
+    def __init__(self):
         pass
         
-class AuthorsXML(Converter):
+    def dump_parsed(self, parsed, index, stream):
+        organization_ids = index.ids
+        
+        writer = XMLWriter(stream)
+        writer.declaration()
+        writer.start('collaborationauthorlist', 
+                     [('xmlns:cal', 'http://www.slac.stanford.edu/spires/hepnames/authors_xml/'),
+                      ('xmlns:foaf', 'http://xmlns.com/foaf/0.1/')])
+                      
+        self.write_header(writer, parsed)
+        self.write_collaboration(writer, parsed)
+        self.write_organizations(writer, parsed, organization_ids)
+        self.write_authors(writer, parsed, organization_ids)
+        
+        writer.close()
+        
+    def write_author(self, writer, parsed, organization_ids):
+        writer.start('foaf:Person')
+        writer.element('cal:authorNamePaper', parsed[cfg.JSON.PAPER_NAME])
+        
+        given_name = parsed[cfg.JSON.GIVEN_NAME]
+        if (cfg.EMPTY.match(given_name) is None):
+            writer.element('foaf:givenName', given_name)
+            
+        family_name = parsed[cfg.JSON.FAMILY_NAME]
+        if (cfg.EMPTY.match(family_name) is None):
+            writer.element('foaf:familyName', family_name)
+            
+        if (not parsed[cfg.JSON.ALIVE]):
+            writer.element('cal:authorStatus', cfg.AuthorsXML.DECEASED)
+            
+        writer.element('cal:authorCollaboration', 
+                       attributes = [('collaborationid', 
+                                      cfg.AuthorsXML.COLLABORATION_ID)])
+                                      
+        affiliations = parsed[cfg.JSON.AFFILIATIONS]
+        if (affiliations):
+            writer.start('cal:authorAffiliations')
+            for affiliation in affiliations:
+                acronym = affiliation[cfg.JSON.AFFILIATION_ACRONYM]
+                status = affiliation[cfg.JSON.AFFILIATION_STATUS]
+                writer.element('cal:authorAffiliation', 
+                               attributes = [('connection', status),
+                                             ('organizationid', 
+                                              organization_ids[acronym])])
+            writer.end()
+        else:
+            writer.element('cal:authorAffiliations')
+            
+        author_id = parsed[cfg.JSON.INSPIRE_ID]
+        if (cfg.EMPTY.match(author_id) is None):
+            writer.start('cal:authorids')
+            writer.element('cal:authorid', author_id, 
+                           [('source', cfg.AuthorsXML.INSPIRE)])
+            writer.end()
+            
+        writer.end()
+        
+    def write_authors(self, writer, parsed, organization_ids):
+        authors = parsed[cfg.JSON.AUTHORS_KEY]
+        
+        if (not authors):
+            writer.element('cal:authors')
+            return
+            
+        writer.start('cal:authors')
+        for author in authors:
+            self.write_author(writer, author, organization_ids)
+        writer.end()
+        
+    def write_collaboration(self, writer, parsed):
+        writer.start('cal:collaborations')
+        writer.start('cal:collaboration', 
+                     [('id', cfg.AuthorsXML.COLLABORATION_ID)])
+        writer.element('foaf:name', parsed[cfg.JSON.COLLABORATION])
+        writer.end()
+        writer.end()
+        
+        experiment_number = parsed[cfg.JSON.EXPERIMENT_NUMBER]
+        if (cfg.EMPTY.match(experiment_number) is None):
+            writer.element('cal:experimentNumber', experiment_number)
+            
+    def write_header(self, writer, parsed):
+        writer.element('cal:creationDate', 
+                       time.strftime(cfg.AuthorsXML.TIME_FORMAT))
+        for reference in parsed[cfg.JSON.REFERENCE_IDS]:
+            writer.element('cal:publicationReference', reference)
+            
+    def write_organization(self, writer, parsed, ids):
+        acronym = parsed[cfg.JSON.ACRONYM]
+        writer.start('foaf:Organization', [('id', ids[acronym])])
+        
+        domain = parsed[cfg.JSON.DOMAIN]
+        if (cfg.EMPTY.match(domain) is None):
+            writer.element('cal:orgDomain', domain)
+            
+        # organization name, no presence check, already done on the client side
+        writer.element('foaf:name', parsed[cfg.JSON.NAME])
+        
+        spires_id = parsed[cfg.JSON.SPIRES_ID]
+        if (cfg.EMPTY.match(spires_id) is None):
+            writer.element('cal:orgName', spires_id, 
+                           [('source', cfg.AuthorsXML.SPIRES)])
+                           
+        if (parsed[cfg.JSON.MEMBER]):
+            writer.element('cal:orgStatus', cfg.AuthorsXML.MEMBER)
+        else:
+            writer.element('cal:orgStatus', cfg.AuthorsXML.NONMEMBER)
+            
+        group = parsed[cfg.JSON.UMBRELLA]
+        if (cfg.EMPTY.match(group) is None):
+            writer.element('cal:group', attributes = [('with', ids[group])])
+            
+        writer.end()
+        
+    def write_organizations(self, writer, parsed, ids):
+        organizations = parsed[cfg.JSON.AFFILIATIONS_KEY]
+        
+        if (not organizations):
+            writer.element('cal:organizations')
+            return
+            
+        writer.start('cal:organizations')
+        for organization in organizations:
+            self.write_organization(writer, organization, ids)
+        writer.end()
+        
+class AuthorsXMLDOM(Converter):
+    """
+    The minidom based authors.xml converter. It builds the whole document tree 
+    in memory before serializing it and is only kept as reference for 
+    AuthorsXML, which should be preferred.
+    """
     CONTENT_TYPE = 'text/xml'
     FILE_NAME = 'authors.xml'
+    COMMENT = '\n<!-- %s -->\n'
     
     def __init__(self):
         pass
@@ -145,6 +635,7 @@ class AuthorsXML(Converter):
         collaboration = document.createElement('cal:collaboration')
         collaboration.setAttribute('id', cfg.AuthorsXML.COLLABORATION_ID)
         collaborations.appendChild(collaboration)
+        root.appendChild(collaborations)
         
         # name
         name = document.createElement('foaf:name')
@@ -243,16 +734,16 @@ class AuthorsXML(Converter):
         if (cfg.EMPTY.match(group_info) is None):
             group = document.createElement('cal:group')
             group.setAttribute('with', ids[group_info])
-            organizatio.appendChild(group)
+            organization.appendChild(group)
         
         return organization
         
-    def dump(self, data):
+    def build(self, data):
         parsed = json.loads(data)
         document, root = self.create_document()
         affiliations = parsed[cfg.JSON.AFFILIATIONS_KEY]
         
-        organization_ids = self.generate_organization_ids(affiliations)
+        organization_ids = AcronymIndex(affiliations).ids
         
         self.create_header(document, root, parsed)
         self.create_collaboration(document, root, parsed)
@@ -261,27 +752,138 @@ class AuthorsXML(Converter):
         
         return document
         
-    def dumps(self, data):
-        return self.dump(data).toprettyxml(indent = '    ', encoding = 'utf-8')
-        
-    def generate_organization_ids(self, organizations):
-        ids = {}        
-        # Map each organization acronym to an id of the kind 'o[index]'
-        for index, organization in enumerate(organizations):
-            acronym = organization[cfg.JSON.ACRONYM]
-            ids[acronym] = cfg.AuthorsXML.ORGANIZATION_ID + str(index)
+    def dump(self, data, stream):
+        stream.write(self.dumps(data))
         
-        return ids
+    def dumps(self, data):
+        return self.build(data).toprettyxml(indent = '    ', encoding = 'utf-8')
         
 class Converters:
-    __converters__ = {'authorsxml' : AuthorsXML}
+    """
+    Registry of the available converters by their format name, as used in the 
+    export URLs. Further converters can be added with register() or by 
+    plugins. A plugin is a module named authorlist_converter_*.py in the 
+    Invenio library directory defining a CONVERTERS dictionary mapping format 
+    names to Converter subclasses. Plugins are loaded on first use.
+    """
+    __converters__ = {'authorsxml' : AuthorsXML,
+                      'latex'      : NA62Latex}
+    __plugins_loaded__ = False
     
     @classmethod
     def get(cls, format):
+        cls.load_plugins()
         return cls.__converters__.get(format)
+        
+    @classmethod
+    def register(cls, format, converter):
+        cls.__converters__[format] = converter
+        
+    @classmethod
+    def load_plugins(cls):
+        if (cls.__plugins_loaded__):
+            return
+        cls.__plugins_loaded__ = True
+        
+        plugins = PluginContainer(os.path.join(CFG_PYLIBDIR, 'invenio', 
+                                               'authorlist_converter_*.py'),
+                                  plugin_builder = converters_plugin_builder)
+        for converters in plugins.values():
+            for format, converter in converters.items():
+                cls.register(format, converter)
+                
+def converters_plugin_builder(plugin_name, plugin_code):
+    """
+    Extracts the CONVERTERS dictionary of an authorlist converter plugin 
+    module.
+    """
+    return getattr(plugin_code, 'CONVERTERS')
+    
+class RenderCache(object):
+    """
+    Bounded in memory cache of rendered exports. Entries are keyed by 
+    (paper_id, last_modified, format), so a new save of a paper implicitly 
+    invalidates its entries. The oldest entry is dropped when the cache is 
+    full.
+    """
+    def __init__(self, size):
+        self.size = size
+        self.keys = []
+        self.entries = {}
+        
+    def get(self, key):
+        return self.entries.get(key)
+        
+    def set(self, key, value):
+        if (self.size <= 0):
+            return
+        if (key not in self.entries):
+            self.keys.append(key)
+        self.entries[key] = value
+        while (len(self.keys) > self.size):
+            del self.entries[self.keys.pop(0)]
+            
+RENDER_CACHE = RenderCache(cfg.RENDER_CACHE_SIZE)
       
-def dump(data, converter):
-    return converter().dump(data)
+def dump(data, converter, stream):
+    return converter().dump(data, stream)
     
 def dumps(data, converter):
     return converter().dumps(data)
+    
+def dump_parsed(parsed, index, converter, stream):
+    return converter().dump_parsed(parsed, index, stream)
+    
+def dump_cached(key, load, converter, stream):
+    """
+    Writes the output of the passed converter to the stream, taking it from the 
+    render cache if present under the passed (paper_id, last_modified, format) 
+    key. Otherwise the JSON data is obtained by calling load() and the 
+    rendered output is stored in the cache. The exports carry their creation 
+    date, so the output is cached split around the first occurrence of the 
+    date it was rendered with and the current date is written in between.
+    """
+    entry = RENDER_CACHE.get(key)
+    if (entry is None):
+        before = time.strftime(cfg.AuthorsXML.TIME_FORMAT)
+        output = dumps(load(), converter)
+        # the minute may have changed while rendering
+        for date in (before, time.strftime(cfg.AuthorsXML.TIME_FORMAT)):
+            position = output.find(date)
+            if (position >= 0):
+                entry = (output[:position], output[position + len(date):])
+                break
+        else:
+            entry = (output, None)
+        RENDER_CACHE.set(key, entry)
+        
+    head, tail = entry
+    stream.write(head)
+    if (tail is not None):
+        stream.write(time.strftime(cfg.AuthorsXML.TIME_FORMAT))
+        stream.write(tail)
+    
+def dumps_chunked(data, key, chunks):
+    """
+    Generator serializing the passed data dictionary to JSON piece by piece. 
+    The list stored under the passed key is not taken from the dictionary but 
+    assembled from the lists yielded by the chunks iterable, e.g. 
+    authorlist_dblayer.iterate_authors(). Joining all yielded strings results 
+    in a document equivalent to json.dumps() of the complete dictionary.
+    """
+    head = json.dumps(data)
+    yield head[:-1]
+    if (data):
+        yield ', '
+    yield '%s: [' % json.dumps(key)
+    
+    first = True
+    for chunk in chunks:
+        if (not chunk):
+            continue
+        if (not first):
+            yield ', '
+        yield json.dumps(chunk)[1:-1]
+        first = False
+        
+    yield ']}'
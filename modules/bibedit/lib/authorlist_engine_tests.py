@@ -0,0 +1,232 @@
+# -*- coding: utf-8 -*-
+##
+## This file is part of Invenio.
+## Copyright (C) 2011 CERN.
+##
+## Invenio is free software; you can redistribute it and/or
+## modify it under the terms of the GNU General Public License as
+## published by the Free Software Foundation; either version 2 of the
+## License, or (at your option) any later version.
+##
+## Invenio is distributed in the hope that it will be useful, but
+## WITHOUT ANY WARRANTY; without even the implied warranty of
+## MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+## General Public License for more details.
+##
+## You should have received a copy of the GNU General Public License
+## along with Invenio; if not, write to the Free Software Foundation, Inc.,
+## 59 Temple Place, Suite 330, Boston, MA 02111-1307, USA.
+
+"""Unit tests for the authorlist conversion engine."""
+
+__revision__ = "$Id$"
+
+import re
+import time
+import unittest
+import simplejson as json
+from cStringIO import StringIO
+
+from invenio import authorlist_engine
+from invenio.authorlist_benchmark import generate_paper
+from invenio.testutils import make_test_suite, run_test_suite
+
+def strip_creation_date(document):
+    """Removes the time dependent creation date from an authors.xml string."""
+    return re.sub('<cal:creationDate>.*?</cal:creationDate>', '', document)
+
+class AuthorsXMLTest(unittest.TestCase):
+    """Test the streaming authors.xml converter."""
+
+    def test_same_output_as_minidom(self):
+        """authorlist - streaming and minidom authors.xml are identical"""
+        data = json.dumps(generate_paper(50))
+        self.assertEqual(
+            strip_creation_date(authorlist_engine.AuthorsXML().dumps(data)),
+            strip_creation_date(authorlist_engine.AuthorsXMLDOM().dumps(data)))
+
+    def test_umbrella_organizations(self):
+        """authorlist - umbrella organizations in authors.xml"""
+        paper = generate_paper(20, 3)
+        paper['affiliations'][1][3] = u'INST0'
+        data = json.dumps(paper)
+        output = authorlist_engine.AuthorsXML().dumps(data)
+        self.failUnless('<cal:group with="o0"/>' in output)
+        self.assertEqual(strip_creation_date(output),
+            strip_creation_date(authorlist_engine.AuthorsXMLDOM().dumps(data)))
+
+    def test_escaping(self):
+        """authorlist - special characters are escaped in authors.xml"""
+        paper = generate_paper(1)
+        paper['collaboration'] = u'A & <B> "C"'
+        output = authorlist_engine.AuthorsXML().dumps(json.dumps(paper))
+        self.failUnless('<foaf:name>A &amp; &lt;B&gt; &quot;C&quot;</foaf:name>'
+                        in output)
+
+class NA62LatexTest(unittest.TestCase):
+    """Test the NA62 LaTeX converter."""
+
+    def test_latex_escape(self):
+        """authorlist - escaping of LaTeX special characters"""
+        self.assertEqual(authorlist_engine.latex_escape(u'A & B_1 50% $\\'),
+                         'A \\& B\\_1 50\\% \\$\\textbackslash{}')
+
+    def test_footnote_symbols(self):
+        """authorlist - LaTeX footnote letters"""
+        self.assertEqual([authorlist_engine.latex_footnote_symbol(index)
+                          for index in (0, 1, 25, 26, 27)],
+                         ['a', 'b', 'z', 'aa', 'ab'])
+
+    def test_affiliation_marks(self):
+        """authorlist - numbered affiliations and lettered footnotes"""
+        paper = generate_paper(3, 2)
+        output = authorlist_engine.NA62Latex().dumps(json.dumps(paper))
+        self.failUnless('J.~M\xc3\xbcller0$^{1,\\dagger}$,' in output)
+        self.failUnless('J.~M\xc3\xbcller1$^{2,a}$,' in output)
+        self.failUnless('$^{a}$Also at Institut' in output)
+        self.failUnless('$^{\\dagger}$Deceased' in output)
+
+class ConvertersTest(unittest.TestCase):
+    """Test the converter registry and the render cache."""
+
+    def test_register(self):
+        """authorlist - registering a converter"""
+        class Dummy(authorlist_engine.Converter):
+            def __init__(self):
+                pass
+            def dump(self, data, stream):
+                stream.write('dummy')
+        authorlist_engine.Converters.register('dummy', Dummy)
+        converter = authorlist_engine.Converters.get('dummy')
+        self.assertEqual(authorlist_engine.dumps('{}', converter), 'dummy')
+
+    def test_render_cache(self):
+        """authorlist - rendering is skipped for cached papers"""
+        calls = []
+        def load():
+            calls.append(1)
+            return json.dumps(generate_paper(2))
+        converter = authorlist_engine.Converters.get('latex')
+        first, second = StringIO(), StringIO()
+        key = ('test', 1, 'latex')
+        authorlist_engine.dump_cached(key, load, converter, first)
+        authorlist_engine.dump_cached(key, load, converter, second)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(first.getvalue(), second.getvalue())
+
+    def test_render_cache_creation_date(self):
+        """authorlist - cached exports carry the current creation date"""
+        calls = []
+        def load():
+            calls.append(1)
+            return json.dumps(generate_paper(2))
+        converter = authorlist_engine.Converters.get('authorsxml')
+        original = time.strftime
+        key = ('test', 2, 'authorsxml')
+        outputs = []
+        try:
+            for date in ('2011-01-01_00:00', '2011-01-01_00:01'):
+                time.strftime = lambda format, date=date: date
+                output = StringIO()
+                authorlist_engine.dump_cached(key, load, converter, output)
+                outputs.append(output.getvalue())
+        finally:
+            time.strftime = original
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(outputs[0].replace('2011-01-01_00:00',
+                                            '2011-01-01_00:01'), outputs[1])
+        self.failUnless('2011-01-01_00:01' in outputs[1])
+        self.failIf('2011-01-01_00:00' in outputs[1])
+
+    def test_render_cache_bounded(self):
+        """authorlist - the render cache drops its oldest entries"""
+        cache = authorlist_engine.RenderCache(2)
+        for index in range(3):
+            cache.set((index, 0, 'latex'), str(index))
+        self.assertEqual(cache.get((0, 0, 'latex')), None)
+        self.assertEqual(cache.get((2, 0, 'latex')), '2')
+
+class ValidationTest(unittest.TestCase):
+    """Test the server side validation and the acronym index."""
+
+    def test_valid_paper(self):
+        """authorlist - a consistent paper passes the validation"""
+        self.assertEqual(authorlist_engine.validate(generate_paper(100)), [])
+
+    def test_acronym_index(self):
+        """authorlist - acronyms are resolved through the index"""
+        paper = generate_paper(10, 3)
+        paper['affiliations'].append([4, '', u'INST0', u'', u'Other', u'',
+                                      True, u''])
+        index = authorlist_engine.AcronymIndex(paper['affiliations'])
+        self.failUnless(u'INST1' in index)
+        self.failIf(u'INST9' in index)
+        self.assertEqual(index.ids[u'INST0'], 'o3')
+        self.assertEqual(index.names[u'INST0'], u'Other')
+        self.assertEqual(index.duplicates, [4])
+
+    def test_all_problems_reported(self):
+        """authorlist - every problem is reported at once"""
+        paper = generate_paper(10, 3)
+        paper['paper_title'] = u' '
+        paper['affiliations'][0][2] = u''
+        paper['affiliations'][1][4] = u''
+        paper['affiliations'][2][3] = u'NOWHERE'
+        paper['authors'][4][4] = u''
+        paper['authors'][5][6].append([u'UNKNOWN', u'Also at'])
+        self.assertEqual(authorlist_engine.validate(paper),
+                         ['Paper title required',
+                          'Affiliation acronym missing in line(s): 1',
+                          'Affiliation name and address missing in line(s): 2',
+                          'Unknown umbrella organization in line(s): 3',
+                          'Author paper name missing in line(s): 5',
+                          'Unknown affiliation acronyms: INST0, UNKNOWN'])
+
+    def test_unused_acronyms(self):
+        """authorlist - affiliations without authors are reported"""
+        paper = generate_paper(1, 3)
+        self.assertEqual(authorlist_engine.validate(paper),
+                         ['Unused acronyms: INST1, INST2'])
+
+    def test_validate_patch(self):
+        """authorlist - only the patched rows are validated"""
+        acronyms = [u'CERN', u'DESY', u'DESY', u'']
+        operations = [{'op': 'update', 'table': 'paper',
+                       'row': {'paper_title': u'', 'collaboration': u'B',
+                               'experiment_number': u''}},
+                      {'op': 'update', 'table': 'affiliations', 'index': 1,
+                       'row': [2, '', u'DESY', u'CERN', u'DESY', u'', True,
+                               u'']},
+                      {'op': 'insert', 'table': 'affiliations', 'index': 3,
+                       'row': [4, '', u'', u'NOWHERE', u'', u'', True, u'']},
+                      {'op': 'update', 'table': 'authors', 'index': 0,
+                       'row': [1, '', u'Doe', u'J.', u'', True, None, u'']},
+                      {'op': 'insert', 'table': 'authors', 'index': 1,
+                       'row': [2, '', u'Roe', u'R.', u'R. Roe', True,
+                               [[u'CERN', u'Affiliated with'],
+                                [u'UNKNOWN', u'Also at']], u'']},
+                      {'op': 'delete', 'table': 'authors', 'index': 5}]
+        self.assertEqual(authorlist_engine.validate_patch(operations,
+                                                          acronyms,
+                                                          [u'KEK']),
+                         ['Paper title required',
+                          'Affiliation acronym missing in line(s): 4',
+                          'Affiliation name and address missing in line(s): 4',
+                          'Duplicate affiliation acronym in line(s): 2',
+                          'Unknown umbrella organization in line(s): 4',
+                          'Author paper name missing in line(s): 1',
+                          'Unknown affiliation acronyms: KEK, UNKNOWN'])
+        operations = [{'op': 'update', 'table': 'authors', 'index': 0,
+                       'row': [1, '', u'Doe', u'J.', u'J. Doe', True,
+                               [[u'CERN', u'Affiliated with']], u'']},
+                      {'op': 'delete', 'table': 'affiliations', 'index': 5}]
+        self.assertEqual(authorlist_engine.validate_patch(operations,
+                                                          acronyms), [])
+
+TEST_SUITE = make_test_suite(AuthorsXMLTest,
+                             NA62LatexTest,
+                             ConvertersTest,
+                             ValidationTest)
+
+if __name__ == "__main__":
+    run_test_suite(TEST_SUITE)
@@ -0,0 +1,473 @@
+# -*- coding: utf-8 -*-
+##
+## This file is part of Invenio.
+## Copyright (C) 2011 CERN.
+##
+## Invenio is free software; you can redistribute it and/or
+## modify it under the terms of the GNU General Public License as
+## published by the Free Software Foundation; either version 2 of the
+## License, or (at your option) any later version.
+##
+## Invenio is distributed in the hope that it will be useful, but
+## WITHOUT ANY WARRANTY; without even the implied warranty of
+## MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+## General Public License for more details.
+##
+## You should have received a copy of the GNU General Public License
+## along with Invenio; if not, write to the Free Software Foundation, Inc.,
+## 59 Temple Place, Suite 330, Boston, MA 02111-1307, USA.
+
+"""
+Invenio Authorlist bulk import. Reads an authors.xml document - as written by
+the AuthorsXML converter - or a CSV file of authors into the authorlist JSON
+structure and stores it as a new paper.
+
+Usage: authorlistimport [options] file
+
+Options:
+    -t, --title=TITLE                  title of the imported paper, required
+    -f, --format=FORMAT                authorsxml or csv, guessed from the file
+                                       extension by default
+    -c, --collaboration=NAME           collaboration of the paper, required for
+                                       CSV files, overrides the imported one
+                                       of authors.xml documents
+    -e, --experiment-number=NUMBER     overrides the imported experiment number
+    -h, --help                         print this help
+    -V, --version                      print version number
+
+The CSV file needs a header row naming its columns. Recognized are
+family_name, given_name, name_on_paper, alive, inspire_id and affiliations.
+The affiliations of an author are separated by semicolons, each one being an
+acronym optionally followed by a colon and the affiliation status, e.g.
+'CERN;DESY:Also at'.
+"""
+
+__revision__ = "$Id$"
+
+import csv
+import getopt
+import os
+import sys
+import xml.sax
+import xml.sax.handler
+
+import invenio.authorlist_config as cfg
+from invenio import authorlist_dblayer, authorlist_engine
+
+def empty_paper():
+    """
+    Returns the data dictionary of a paper without any references, affiliations
+    and authors using the standard authorlist_config keys. Unlike loading an
+    unknown paper id from the database no query is issued.
+    """
+    return {cfg.JSON.PAPER_TITLE       : '',
+            cfg.JSON.COLLABORATION     : '',
+            cfg.JSON.EXPERIMENT_NUMBER : '',
+            cfg.JSON.REFERENCE_IDS     : [],
+            cfg.JSON.AFFILIATIONS_KEY  : [],
+            cfg.JSON.AUTHORS_KEY       : []}
+
+def empty_affiliation(index):
+    """
+    Returns an affiliation row of the JSON data having the passed index and
+    empty values otherwise.
+    """
+    return [index, '', '', '', '', '', False, '']
+
+def empty_author(index):
+    """
+    Returns an alive author row of the JSON data having the passed index, no
+    affiliations and empty values otherwise.
+    """
+    return [index, '', '', '', '', True, [], '']
+
+class AuthorsXMLHandler(xml.sax.handler.ContentHandler):
+    """
+    SAX content handler filling the passed data dictionary with the content of
+    an authors.xml document. Elements are matched by their local name, so that
+    documents using other namespace prefixes than the AuthorsXML converter are
+    understood as well. Only the element currently parsed and the resulting
+    rows are kept in memory. As organizations are referenced by their document
+    id and might be referenced before they are defined, the acronyms of
+    umbrella organizations and author affiliations are resolved at the end of
+    the document.
+    """
+
+    def __init__(self, data):
+        xml.sax.handler.ContentHandler.__init__(self)
+        self.data = data
+        self.path = []
+        self.text = []
+        self.organization = None
+        self.author = None
+        self.organizations = []
+        self.umbrellas = []
+        self.affiliations = []
+
+    def characters(self, content):
+        self.text.append(content)
+
+    def startElementNS(self, name, qname, attributes):
+        local = name[1]
+        self.path.append((local, get_attribute(attributes, 'source')))
+        self.text = []
+
+        if (local == 'Organization'):
+            index = len(self.data[cfg.JSON.AFFILIATIONS_KEY]) + 1
+            self.organization = empty_affiliation(index)
+            self.organizations.append((get_attribute(attributes, 'id'),
+                                       self.organization))
+        elif (local == 'group' and self.organization is not None):
+            self.umbrellas.append((self.organization,
+                                   get_attribute(attributes, 'with')))
+        elif (local == 'Person'):
+            index = len(self.data[cfg.JSON.AUTHORS_KEY]) + 1
+            self.author = empty_author(index)
+        elif (local == 'authorAffiliation' and self.author is not None):
+            affiliation = ['', get_attribute(attributes, 'connection') or
+                               cfg.Import.AFFILIATED]
+            self.author[cfg.JSON.AFFILIATIONS].append(affiliation)
+            self.affiliations.append((affiliation,
+                                      get_attribute(attributes,
+                                                    'organizationid')))
+
+    def endElementNS(self, name, qname):
+        local, source = self.path.pop()
+        text = ''.join(self.text).strip()
+        self.text = []
+        parent = None
+        if (self.path):
+            parent = self.path[-1][0]
+
+        if (self.organization is not None):
+            self.end_organization_element(local, parent, source, text)
+        elif (self.author is not None):
+            self.end_author_element(local, source, text)
+        elif (local == 'publicationReference'):
+            self.data[cfg.JSON.REFERENCE_IDS].append(text)
+        elif (local == 'name' and parent == 'collaboration'):
+            self.data[cfg.JSON.COLLABORATION] = text
+        elif (local == 'experimentNumber'):
+            self.data[cfg.JSON.EXPERIMENT_NUMBER] = text
+
+    def end_organization_element(self, local, parent, source, text):
+        organization = self.organization
+
+        if (local == 'Organization'):
+            self.data[cfg.JSON.AFFILIATIONS_KEY].append(organization)
+            self.organization = None
+        elif (local == 'name' and parent == 'Organization'):
+            organization[cfg.JSON.NAME] = text
+        elif (local == 'orgAcronym'):
+            organization[cfg.JSON.ACRONYM] = text
+        elif (local == 'orgDomain'):
+            organization[cfg.JSON.DOMAIN] = text
+        elif (local == 'orgName' and source == cfg.AuthorsXML.SPIRES):
+            organization[cfg.JSON.SPIRES_ID] = text
+        elif (local == 'orgStatus'):
+            organization[cfg.JSON.MEMBER] = (text == cfg.AuthorsXML.MEMBER)
+
+    def end_author_element(self, local, source, text):
+        author = self.author
+
+        if (local == 'Person'):
+            self.data[cfg.JSON.AUTHORS_KEY].append(author)
+            self.author = None
+        elif (local == 'authorNamePaper'):
+            author[cfg.JSON.PAPER_NAME] = text
+        elif (local == 'givenName'):
+            author[cfg.JSON.GIVEN_NAME] = text
+        elif (local == 'familyName'):
+            author[cfg.JSON.FAMILY_NAME] = text
+        elif (local == 'authorStatus'):
+            author[cfg.JSON.ALIVE] = (text != cfg.AuthorsXML.DECEASED)
+        elif (local == 'authorid' and source == cfg.AuthorsXML.INSPIRE):
+            author[cfg.JSON.INSPIRE_ID] = text
+
+    def endDocument(self):
+        # authors.xml does not carry the acronyms of the organizations, use the
+        # SPIRES name or, as last resort, the document id of the organization
+        acronyms = {}
+        used = {}
+        for organization_id, organization in self.organizations:
+            acronym = organization[cfg.JSON.ACRONYM] or \
+                      organization[cfg.JSON.SPIRES_ID]
+            if (not acronym or acronym in used):
+                acronym = organization_id
+            organization[cfg.JSON.ACRONYM] = acronym
+            acronyms[organization_id] = acronym
+            used[acronym] = True
+
+        for organization, umbrella_id in self.umbrellas:
+            organization[cfg.JSON.UMBRELLA] = acronyms.get(umbrella_id, '')
+        for affiliation, organization_id in self.affiliations:
+            affiliation[cfg.JSON.AFFILIATION_ACRONYM] = \
+                acronyms.get(organization_id, organization_id)
+
+def get_attribute(attributes, local):
+    """
+    Returns the value of the attribute with the passed local name from the SAX
+    attributes object, regardless of its namespace, or an empty string if the
+    element does not have such an attribute.
+    """
+    for (uri, name), value in attributes.items():
+        if (name == local):
+            return value
+
+    return ''
+
+class DoctypeRejectingHandler:
+    """
+    SAX lexical handler refusing documents with a document type declaration.
+    authors.xml documents do not have one and uploaded documents must not be
+    able to declare entities, neither external ones reading files of the
+    server nor nested internal ones expanding to huge texts.
+    """
+
+    def startDTD(self, name, public_id, system_id):
+        """Rejects the document."""
+        raise ValueError('Document type declarations are not allowed in '
+                         'authors.xml documents')
+
+    def endDTD(self):
+        """Called at the end of the declaration, never reached."""
+        pass
+
+    def startEntity(self, name):
+        """Called at the start of an entity, nothing to do."""
+        pass
+
+    def endEntity(self, name):
+        """Called at the end of an entity, nothing to do."""
+        pass
+
+    def startCDATA(self):
+        """Called at the start of a CDATA section, nothing to do."""
+        pass
+
+    def endCDATA(self):
+        """Called at the end of a CDATA section, nothing to do."""
+        pass
+
+    def comment(self, content):
+        """Called for comments, nothing to do."""
+        pass
+
+def read_authorsxml(stream):
+    """
+    Reads the authors.xml document from the passed file-like object and returns
+    it as data dictionary using the standard authorlist_config keys. The
+    document is parsed incrementally, the whole file is never held in memory.
+    External entities are never resolved. Raises ValueError if the document is
+    not well-formed or has a document type declaration.
+    """
+    data = empty_paper()
+    parser = xml.sax.make_parser()
+    parser.setFeature(xml.sax.handler.feature_namespaces, True)
+    parser.setFeature(xml.sax.handler.feature_external_ges, False)
+    parser.setFeature(xml.sax.handler.feature_external_pes, False)
+    parser.setProperty(xml.sax.handler.property_lexical_handler,
+                       DoctypeRejectingHandler())
+    parser.setContentHandler(AuthorsXMLHandler(data))
+
+    try:
+        parser.parse(stream)
+    except xml.sax.SAXParseException, error:
+        raise ValueError('Malformed authors.xml document: %s' % error)
+
+    return data
+
+def read_csv(stream):
+    """
+    Reads a CSV file of authors from the passed file-like object and returns
+    it as data dictionary using the standard authorlist_config keys. The first
+    row has to name the columns, see the module documentation for the known
+    ones. The rows are read one by one. An affiliation is created for each
+    distinct acronym in the order of their first appearance, using the acronym
+    as name. Raises ValueError if the header row is missing.
+    """
+    data = empty_paper()
+    affiliations = data[cfg.JSON.AFFILIATIONS_KEY]
+    authors = data[cfg.JSON.AUTHORS_KEY]
+    acronyms = {}
+
+    reader = csv.reader(stream)
+    try:
+        header = [column.strip().lower() for column in reader.next()]
+    except StopIteration:
+        raise ValueError('CSV file without header row')
+
+    for row in reader:
+        values = dict(zip(header, [value.decode('utf-8').strip()
+                                   for value in row]))
+        if (not [value for value in values.values() if value]):
+            continue
+
+        author = empty_author(len(authors) + 1)
+        given_name = values.get('given_name', '')
+        family_name = values.get('family_name', '')
+        author[cfg.JSON.GIVEN_NAME] = given_name
+        author[cfg.JSON.FAMILY_NAME] = family_name
+        author[cfg.JSON.PAPER_NAME] = values.get('name_on_paper') or \
+                                      ('%s %s' % (given_name, family_name)).strip()
+        author[cfg.JSON.ALIVE] = values.get('alive', '').lower() not in \
+                                 cfg.Import.DECEASED
+        author[cfg.JSON.INSPIRE_ID] = values.get('inspire_id', '')
+
+        for entry in values.get('affiliations', '').split(
+                                            cfg.Import.AFFILIATION_SEPARATOR):
+            acronym, status = parse_csv_affiliation(entry)
+            if (not acronym):
+                continue
+            if (acronym not in acronyms):
+                affiliation = empty_affiliation(len(affiliations) + 1)
+                affiliation[cfg.JSON.ACRONYM] = acronym
+                affiliation[cfg.JSON.NAME] = acronym
+                affiliation[cfg.JSON.MEMBER] = True
+                affiliations.append(affiliation)
+                acronyms[acronym] = True
+            author[cfg.JSON.AFFILIATIONS].append([acronym, status])
+
+        authors.append(author)
+
+    return data
+
+def parse_csv_affiliation(entry):
+    """
+    Splits a single affiliation entry of the CSV affiliations column into its
+    acronym and status. Entries without status are affiliated with the
+    organization. Returns the tuple of acronym and status.
+    """
+    parts = entry.split(cfg.Import.STATUS_SEPARATOR, 1)
+    acronym = parts[0].strip()
+    status = cfg.Import.AFFILIATED
+    if (len(parts) > 1 and parts[1].strip()):
+        status = parts[1].strip()
+
+    return acronym, status
+
+READERS = {cfg.Import.AUTHORSXML : read_authorsxml,
+           cfg.Import.CSV        : read_csv}
+
+def guess_format(file_name):
+    """
+    Guesses the import format of the file with the passed name from its
+    extension. Returns None if the format is not known.
+    """
+    extension = os.path.splitext(file_name or '')[1].lower()
+
+    return cfg.Import.EXTENSIONS.get(extension)
+
+def read(stream, import_format):
+    """
+    Reads the passed file-like object in the given format into a data
+    dictionary using the standard authorlist_config keys. Raises ValueError if
+    the format is unknown or the file cannot be read.
+    """
+    if (import_format not in READERS):
+        raise ValueError('Unknown import format: %s' % import_format)
+
+    return READERS[import_format](stream)
+
+def import_paper(stream, import_format, title='', collaboration=None,
+                 experiment_number=None):
+    """
+    Imports the passed file-like object in the given format as a new paper. The
+    title has to be given as the formats do not contain it, collaboration and
+    experiment number override the imported ones if given. The paper is checked
+    with authorlist_engine.validate() like the papers saved by the editor and
+    only stored if there are no errors, with a single save(), which writes all
+    rows of a table with multi-row inserts. Returns a tuple of the dictionary
+    save() returns, or a dictionary holding the errors, and the imported data.
+    """
+    data = read(stream, import_format)
+    data[cfg.JSON.PAPER_TITLE] = title
+    if (collaboration is not None):
+        data[cfg.JSON.COLLABORATION] = collaboration
+    if (experiment_number is not None):
+        data[cfg.JSON.EXPERIMENT_NUMBER] = experiment_number
+
+    errors = authorlist_engine.validate(data)
+    if (errors):
+        return {cfg.JSON.ERRORS: errors}, data
+
+    return authorlist_dblayer.save(None, data), data
+
+def print_usage():
+    """Print help."""
+    print __doc__
+
+def print_version():
+    """Print version information."""
+    print __revision__
+
+def main():
+    """Main entry point of the authorlistimport command line tool."""
+    try:
+        opts, args = getopt.getopt(sys.argv[1:], 'ht:f:c:e:V',
+                                   ['help', 'title=', 'format=',
+                                    'collaboration=', 'experiment-number=',
+                                    'version'])
+    except getopt.GetoptError:
+        print_usage()
+        sys.exit(1)
+
+    title = ''
+    import_format = None
+    collaboration = None
+    experiment_number = None
+    for opt, value in opts:
+        if opt in ('-h', '--help'):
+            print_usage()
+            sys.exit(0)
+        elif opt in ('-V', '--version'):
+            print_version()
+            sys.exit(0)
+        elif opt in ('-t', '--title'):
+            title = value
+        elif opt in ('-f', '--format'):
+            import_format = value
+        elif opt in ('-c', '--collaboration'):
+            collaboration = value
+        elif opt in ('-e', '--experiment-number'):
+            experiment_number = value
+
+    if len(args) != 1:
+        print_usage()
+        sys.exit(1)
+    file_name = args[0]
+    if import_format is None:
+        import_format = guess_format(file_name)
+    # the formats carry no title and CSV files no collaboration
+    if not title:
+        print >> sys.stderr, "Error: the title of the paper is required (-t)"
+        sys.exit(1)
+    if import_format == cfg.Import.CSV and not collaboration:
+        print >> sys.stderr, "Error: the collaboration is required for CSV " \
+                             "files (-c)"
+        sys.exit(1)
+
+    try:
+        stream = open(file_name)
+    except IOError, error:
+        print >> sys.stderr, "Error: %s" % error
+        sys.exit(1)
+    try:
+        try:
+            saved, data = import_paper(stream, import_format, title,
+                                       collaboration, experiment_number)
+        except ValueError, error:
+            print >> sys.stderr, "Error: %s" % error
+            sys.exit(1)
+    finally:
+        stream.close()
+
+    if cfg.JSON.ERRORS in saved:
+        for error in saved[cfg.JSON.ERRORS]:
+            print >> sys.stderr, "Error: %s" % error
+        sys.exit(1)
+
+    print "Imported %d authors and %d affiliations as paper %s" % \
+          (len(data[cfg.JSON.AUTHORS_KEY]),
+           len(data[cfg.JSON.AFFILIATIONS_KEY]),
+           saved[cfg.JSON.PAPER_ID])
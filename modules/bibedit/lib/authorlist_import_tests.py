@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+##
+## This file is part of Invenio.
+## Copyright (C) 2011 CERN.
+##
+## Invenio is free software; you can redistribute it and/or
+## modify it under the terms of the GNU General Public License as
+## published by the Free Software Foundation; either version 2 of the
+## License, or (at your option) any later version.
+##
+## Invenio is distributed in the hope that it will be useful, but
+## WITHOUT ANY WARRANTY; without even the implied warranty of
+## MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+## General Public License for more details.
+##
+## You should have received a copy of the GNU General Public License
+## along with Invenio; if not, write to the Free Software Foundation, Inc.,
+## 59 Temple Place, Suite 330, Boston, MA 02111-1307, USA.
+
+"""Unit tests for the authorlist bulk import."""
+
+__revision__ = "$Id$"
+
+import sys
+import tempfile
+import unittest
+import simplejson as json
+from cStringIO import StringIO
+
+from invenio import authorlist_import
+from invenio.authorlist_engine import AuthorsXML
+from invenio.authorlist_benchmark import generate_paper
+from invenio.testutils import make_test_suite, run_test_suite
+
+class AuthorsXMLImportTest(unittest.TestCase):
+    """Test reading authors.xml documents."""
+
+    def setUp(self):
+        self.paper = generate_paper(20)
+        document = AuthorsXML().dumps(json.dumps(self.paper))
+        self.imported = authorlist_import.read_authorsxml(StringIO(document))
+
+    def test_paper_information(self):
+        """authorlist - import of collaboration, experiment and references"""
+        for key in ('collaboration', 'experiment_number', 'reference_ids'):
+            self.assertEqual(self.imported[key], self.paper[key])
+
+    def test_authors(self):
+        """authorlist - import of exported authors"""
+        # acronyms are not part of authors.xml, the SPIRES names are used
+        acronyms = {}
+        for affiliation in self.paper['affiliations']:
+            acronyms[affiliation[2]] = affiliation[7]
+
+        self.assertEqual(len(self.imported['authors']),
+                         len(self.paper['authors']))
+        for imported, author in zip(self.imported['authors'],
+                                    self.paper['authors']):
+            self.assertEqual(imported[2:6], author[2:6])
+            self.assertEqual(imported[7], author[7])
+            self.assertEqual(imported[6],
+                             [[acronyms[acronym], status]
+                              for acronym, status in author[6]])
+
+    def test_affiliations(self):
+        """authorlist - import of exported organizations"""
+        self.assertEqual(len(self.imported['affiliations']),
+                         len(self.paper['affiliations']))
+        for imported, affiliation in zip(self.imported['affiliations'],
+                                         self.paper['affiliations']):
+            self.assertEqual(imported[4:], affiliation[4:])
+
+    def test_malformed_document(self):
+        """authorlist - malformed authors.xml documents are rejected"""
+        self.assertRaises(ValueError, authorlist_import.read_authorsxml,
+                          StringIO('<collaborationauthorlist>'))
+
+    def test_external_entity(self):
+        """authorlist - external entities of authors.xml are not resolved"""
+        secret = tempfile.NamedTemporaryFile()
+        secret.write('secret')
+        secret.flush()
+        document = '<?xml version="1.0"?>' \
+            '<!DOCTYPE collaborationauthorlist [' \
+            '<!ENTITY e SYSTEM "file://%s">]>' \
+            '<collaborationauthorlist ' \
+            'xmlns:cal="http://www.slac.stanford.edu/spires/hepnames/' \
+            'authors_xml/"><cal:collaborations><cal:collaboration id="c1">' \
+            '<foaf:name xmlns:foaf="http://xmlns.com/foaf/0.1/">&e;' \
+            '</foaf:name></cal:collaboration></cal:collaborations>' \
+            '</collaborationauthorlist>' % secret.name
+        try:
+            self.assertRaises(ValueError, authorlist_import.read_authorsxml,
+                              StringIO(document))
+        finally:
+            secret.close()
+
+    def test_internal_entities(self):
+        """authorlist - entity declarations of authors.xml are rejected"""
+        document = '<?xml version="1.0"?>' \
+            '<!DOCTYPE collaborationauthorlist [' \
+            '<!ENTITY a "aaaaaaaaaa"><!ENTITY b "&a;&a;&a;&a;&a;">]>' \
+            '<collaborationauthorlist>&b;</collaborationauthorlist>'
+        self.assertRaises(ValueError, authorlist_import.read_authorsxml,
+                          StringIO(document))
+
+class CSVImportTest(unittest.TestCase):
+    """Test reading CSV files of authors."""
+
+    def test_authors_and_affiliations(self):
+        """authorlist - import of authors from CSV"""
+        data = authorlist_import.read_csv(StringIO(
+            'family_name, given_name, alive, affiliations\n'
+            'M\xc3\xbcller,Hans,yes,CERN;DESY:Also at\n'
+            'Doe,J.,deceased,DESY\n'
+            ',,,\n'))
+        self.assertEqual(data['affiliations'],
+                         [[1, '', u'CERN', '', u'CERN', '', True, ''],
+                          [2, '', u'DESY', '', u'DESY', '', True, '']])
+        self.assertEqual(data['authors'],
+                         [[1, '', u'M\xfcller', u'Hans', u'Hans M\xfcller',
+                           True, [[u'CERN', 'Affiliated with'],
+                                  [u'DESY', u'Also at']], ''],
+                          [2, '', u'Doe', u'J.', u'J. Doe', False,
+                           [[u'DESY', 'Affiliated with']], '']])
+
+    def test_missing_header(self):
+        """authorlist - CSV files without header are rejected"""
+        self.assertRaises(ValueError, authorlist_import.read_csv, StringIO(''))
+
+    def test_guess_format(self):
+        """authorlist - import format guessed from the file name"""
+        self.assertEqual(authorlist_import.guess_format('a/authors.XML'),
+                         'authorsxml')
+        self.assertEqual(authorlist_import.guess_format('list.csv'), 'csv')
+        self.assertEqual(authorlist_import.guess_format('list.txt'), None)
+
+class ImportValidationTest(unittest.TestCase):
+    """Test the validation of imported papers before they are stored."""
+
+    def setUp(self):
+        self.saved = []
+        self.original = authorlist_import.authorlist_dblayer.save
+        def save(paper_id, data):
+            """Records the saved paper instead of storing it."""
+            self.saved.append(data)
+            return {'paper_id': 1, 'last_modified': 1}
+        authorlist_import.authorlist_dblayer.save = save
+
+    def tearDown(self):
+        authorlist_import.authorlist_dblayer.save = self.original
+
+    def test_invalid_paper(self):
+        """authorlist - imported papers with errors are not stored"""
+        saved, data = authorlist_import.import_paper(StringIO(
+            'family_name, given_name, affiliations\n'
+            'Doe,J.,CERN\n'), 'csv')
+        self.failUnless(saved['errors'])
+        self.assertEqual(self.saved, [])
+
+    def test_valid_paper(self):
+        """authorlist - imported papers without errors are stored"""
+        saved, data = authorlist_import.import_paper(StringIO(
+            'family_name, given_name, affiliations\n'
+            'Doe,J.,CERN\n'), 'csv', 'Title', 'Collaboration')
+        self.assertEqual(saved['paper_id'], 1)
+        self.assertEqual(self.saved, [data])
+
+    def test_command_line_requirements(self):
+        """authorlist - the command line needs title and CSV collaboration"""
+        original = sys.argv, sys.stderr
+        try:
+            for argv, message in ((['-c', 'C', 'a.csv'], 'title'),
+                                  (['-t', 'T', 'a.csv'], 'collaboration'),
+                                  (['-t', 'T', '-f', 'csv', 'a.txt'],
+                                   'collaboration')):
+                sys.argv = ['authorlistimport'] + argv
+                sys.stderr = StringIO()
+                self.assertRaises(SystemExit, authorlist_import.main)
+                self.failUnless(message in sys.stderr.getvalue())
+        finally:
+            sys.argv, sys.stderr = original
+        self.assertEqual(self.saved, [])
+
+TEST_SUITE = make_test_suite(AuthorsXMLImportTest,
+                             CSVImportTest,
+                             ImportValidationTest)
+
+if __name__ == "__main__":
+    run_test_suite(TEST_SUITE)
@@ -23,6 +23,7 @@ __revision__ = "$Id"
 __lastupdated__ = """$Date: 2008/08/12 09:26:46 $"""
 
 import sys
+import urllib
 if sys.hexversion < 0x2060000:
     try:
         import simplejson as json
@@ -40,6 +41,7 @@ from invenio.bibedit_engine import perform_request_ajax, perform_request_init, \
     perform_request_newticket, perform_request_compare
 from invenio.bibedit_utils import json_unicode_to_utf8, user_can_edit_record_collection
 from invenio.config import CFG_SITE_LANG, CFG_SITE_URL, CFG_SITE_RECORD
+from invenio.errorlib import register_exception
 from invenio.messages import gettext_set_language
 from invenio.urlutils import redirect_to_url
 from invenio.webinterface_handler import WebInterfaceDirectory, wash_urlargd
@@ -52,10 +54,25 @@ import invenio.template
 authorlist_templates = invenio.template.load('authorlist')
 import invenio.authorlist_engine as authorlist_engine
 import invenio.authorlist_dblayer as authorlist_db
+import invenio.authorlist_config as authorlist_config
+import invenio.authorlist_import as authorlist_import
 
 navtrail = (' <a class="navtrail" href=\"%s/help/admin\">Admin Area</a> '
             ) % CFG_SITE_URL
 
+class ResponseStream(object):
+    """
+    Writes to the passed request and remembers whether the response was 
+    started, since a started response can not be redirected anymore.
+    """
+    def __init__(self, req):
+        self.req = req
+        self.started = False
+
+    def write(self, data):
+        self.started = True
+        self.req.write(data)
+
 
 class WebInterfaceEditPages(WebInterfaceDirectory):
     """Defines the set of /edit pages."""
@@ -245,7 +262,17 @@ class WebInterfaceEditPages(WebInterfaceDirectory):
             
             
         elif state == 'itemize':
-            data = authorlist_db.itemize()
+            received = wash_urlargd(form, {'cursor': (str, ''),
+                                           'size': (int, 
+                                                    authorlist_config.PAGE_SIZE),
+                                           'title': (str, ''),
+                                           'collaboration': (str, ''),
+                                           'experiment_number': (str, '')})
+            data = authorlist_db.itemize(received['cursor'], 
+                                         received['size'],
+                                         received['title'],
+                                         received['collaboration'],
+                                         received['experiment_number'])
         
             req.content_type = 'application/json'
             req.write(json.dumps(data))
@@ -266,18 +293,35 @@ class WebInterfaceEditPages(WebInterfaceDirectory):
                         
         # On load state we will answer with the JSON encoded data of the passed 
         # paper id. Should usually not be directly surfed by the user.
+        # If the stream parameter is set, the authors are read and sent in 
+        # chunks, so that the response starts before all rows are loaded. An 
+        # error after the response started leaves the JSON document truncated,
+        # which the editor reports as failed load.
         elif state == 'load':
+            stream = ResponseStream(req)
             try:
-                received = wash_urlargd(form, {'id': (str, None)})
+                received = wash_urlargd(form, {'id': (str, None),
+                                               'stream': (int, 0)})
                 paper_id = received['id']
-                data = authorlist_db.load(paper_id)
                 
                 req.content_type = 'application/json'
-                req.write(json.dumps(data))
+                if received['stream']:
+                    data = authorlist_db.load(paper_id, with_authors = False)
+                    chunks = authorlist_db.iterate_authors(paper_id)
+                    for piece in authorlist_engine.dumps_chunked(data, 
+                                 authorlist_config.JSON.AUTHORS_KEY, chunks):
+                        stream.write(piece)
+                else:
+                    data = authorlist_db.load(paper_id)
+                    stream.write(json.dumps(data))
             except:
-                # redirect to the main page if weird stuff happens
-                redirect_to_url(req, '%s/%s/edit/authorlist' % (CFG_SITE_URL, 
-                                                               CFG_SITE_RECORD))
+                if stream.started:
+                    # too late to redirect
+                    register_exception(req=req)
+                else:
+                    # redirect to the main page if weird stuff happens
+                    redirect_to_url(req, '%s/%s/edit/authorlist' % 
+                                    (CFG_SITE_URL, CFG_SITE_RECORD))
         
         # The save state saves the send data in the database using the passed 
         # paper id. Responds with a JSON object containing the id of the paper 
@@ -289,7 +333,36 @@ class WebInterfaceEditPages(WebInterfaceDirectory):
                                                'data': (str, '')})
                 paper_id = received['id']
                 in_data = json.loads(received['data'])
-                out_data = authorlist_db.save(paper_id, in_data)
+                errors = authorlist_engine.validate(in_data)
+                if errors:
+                    out_data = {authorlist_config.JSON.ERRORS: errors}
+                else:
+                    out_data = authorlist_db.save(paper_id, in_data)
+                
+                req.content_type = 'application/json'
+                req.write(json.dumps(out_data))
+            except:
+                # redirect to the main page if something weird happens
+                redirect_to_url(req, '%s/%s/edit/authorlist' % (CFG_SITE_URL, 
+                                                               CFG_SITE_RECORD))
+        
+        # The patch state applies a list of row level changes to the stored 
+        # paper with the passed id, as long as it was not modified since the 
+        # passed last modified timestamp. Responds with a JSON object 
+        # containing the paper id, the new timestamp and a conflict flag if the
+        # patch was rejected, or the errors of the server side validation of 
+        # the patched rows. Should usually not be surfed directly by the user
+        elif state == 'patch':
+            try:
+                received = wash_urlargd(form, {'id': (str, None),
+                                               'last_modified': (int, 0),
+                                               'patch': (str, '[]')})
+                paper_id = received['id']
+                operations = json.loads(received['patch'])
+                out_data = authorlist_db.patch(paper_id, 
+                                               received['last_modified'], 
+                                               operations, 
+                                               authorlist_engine.validate_patch)
                 
                 req.content_type = 'application/json'
                 req.write(json.dumps(out_data))
@@ -314,25 +387,121 @@ class WebInterfaceEditPages(WebInterfaceDirectory):
                 redirect_to_url(req, '%s/%s/edit/authorlist' % (CFG_SITE_URL, 
                                                                CFG_SITE_RECORD))
         
+        # Imports an uploaded authors.xml or CSV file as a new paper and opens 
+        # it on success. The format is guessed from the file name if it is not 
+        # passed explicitly, collaboration and experiment number override the 
+        # imported ones if given. If the upload cannot be imported, e.g. does 
+        # not pass the server side validation, redirects to the main page 
+        # passing the JSON encoded errors, which are shown there.
+        elif state == 'import':
+            paper_id = None
+            errors = [authorlist_config.Import.FAILED]
+            try:
+                received = wash_urlargd(form, {'format': (str, ''),
+                                               'title': (str, ''),
+                                               'collaboration': (str, ''),
+                                               'experiment_number': (str, '')})
+                upload = form.get('file')
+                if hasattr(upload, 'file'):
+                    import_format = received['format'] or \
+                        authorlist_import.guess_format(upload.filename)
+                    # empty fields do not override the imported values
+                    collaboration = received['collaboration'] or None
+                    experiment_number = received['experiment_number'] or None
+                    saved, dummy = authorlist_import.import_paper(upload.file, 
+                                                          import_format, 
+                                                          received['title'], 
+                                                          collaboration, 
+                                                          experiment_number)
+                    errors = saved.get(authorlist_config.JSON.ERRORS, [])
+                    paper_id = saved.get(authorlist_config.JSON.PAPER_ID)
+            except ValueError, error:
+                errors = [str(error)]
+            except:
+                register_exception(req=req)
+                
+            if paper_id is None:
+                redirect_to_url(req, '%s/%s/edit/authorlist?import_errors=%s' % 
+                                     (CFG_SITE_URL, CFG_SITE_RECORD, 
+                                      urllib.quote(json.dumps(errors))))
+            redirect_to_url(req, '%s/%s/edit/authorlist?state=open&id=%s' % 
+                                 (CFG_SITE_URL, CFG_SITE_RECORD, paper_id))
+        
+        # Gives a copy-on-write clone its own copy of the rows it shares with
+        # the paper it was cloned from. Responds with a JSON object containing
+        # the paper id and whether rows were copied.
+        elif state == 'materialise':
+            try:
+                received = wash_urlargd(form, {'id': (str, None)})
+                paper_id = received['id']
+                copied = authorlist_db.materialise(paper_id)
+                out_data = {authorlist_config.JSON.PAPER_ID     : paper_id,
+                            authorlist_config.JSON.MATERIALISED : copied}
+                
+                req.content_type = 'application/json'
+                req.write(json.dumps(out_data))
+            except:
+                # redirect to the main page if something weird happens
+                redirect_to_url(req, '%s/%s/edit/authorlist' % (CFG_SITE_URL, 
+                                                               CFG_SITE_RECORD))
+        
         # Transform the sent data into the format passed in the URL using a 
         # authorlist_engine converter. Reponds with the MIME type of the 
-        # converter and offers it as a download (content-disposition header).    
+        # converter and offers it as a download (content-disposition header).
+        # If no data but a paper id is sent, the stored paper is exported and 
+        # the result is cached until the paper is modified again. Sent data is 
+        # validated and its acronyms resolved before the response starts; if 
+        # the conversion still fails afterwards, the output ends with a 
+        # comment saying that it is incomplete.
         elif state == 'export':
+            stream = ResponseStream(req)
             try:
                 received = wash_urlargd(form, {'format': (str, None),
-                                               'data': (str, '')})
+                                               'data': (str, ''),
+                                               'id': (str, None)})
                 format = received['format']
-                data = received['data']            
+                data = received['data']
+                paper_id = received['id']
                 converter = authorlist_engine.Converters.get(format)
                 
                 attachement = 'attachement; filename="%s"' % converter.FILE_NAME
-                req.headers_out['Content-Type'] = converter.CONTENT_TYPE
-                req.headers_out['Content-Disposition'] = attachement
-                req.write(authorlist_engine.dumps(data, converter))
+                
+                last_modified = None
+                if not data and paper_id:
+                    last_modified = authorlist_db.load_last_modified(paper_id)
+                    
+                if last_modified is not None:
+                    # rendered completely before anything is written
+                    key = (paper_id, last_modified, format)
+                    load = lambda: json.dumps(authorlist_db.load(paper_id))
+                    req.headers_out['Content-Type'] = converter.CONTENT_TYPE
+                    req.headers_out['Content-Disposition'] = attachement
+                    authorlist_engine.dump_cached(key, load, converter, stream)
+                else:
+                    # validate and convert sharing one acronym index
+                    parsed = json.loads(data)
+                    affiliations = parsed[authorlist_config.JSON.AFFILIATIONS_KEY]
+                    index = authorlist_engine.AcronymIndex(affiliations)
+                    errors = authorlist_engine.validate(parsed, index)
+                    if errors:
+                        req.status = HTTP_BAD_REQUEST
+                        req.headers_out['Content-Type'] = 'text/plain'
+                        stream.write('\n'.join(errors).encode('utf-8'))
+                    else:
+                        req.headers_out['Content-Type'] = converter.CONTENT_TYPE
+                        req.headers_out['Content-Disposition'] = attachement
+                        authorlist_engine.dump_parsed(parsed, index, 
+                                                      converter, stream)
             except:
-                # redirect to the main page if something weird happens
-                redirect_to_url(req, '%s/%s/edit/authorlist' % (CFG_SITE_URL, 
-                                                               CFG_SITE_RECORD))
+                if stream.started:
+                    # too late to redirect, mark the output as incomplete
+                    register_exception(req=req)
+                    req.write(converter.COMMENT % 
+                              authorlist_config.Export.INCOMPLETE)
+                else:
+                    # redirect to the main page if something weird happens
+                    redirect_to_url(req, '%s/%s/edit/authorlist' % 
+                                    (CFG_SITE_URL, CFG_SITE_RECORD))
                                                                
         elif state == 'delete':
             try:
@@ -23,6 +23,7 @@ Format records using chosen format.
 The main APIs are:
   - format_record
   - format_records
+  - iterate_formatted_records
   - create_excel
   - get_output_format_content_type
 
@@ -59,7 +60,8 @@ import sys
 ##
 
 def format_record(recID, of, ln=CFG_SITE_LANG, verbose=0, search_pattern=None,
-                  xml_record=None, user_info=None, on_the_fly=False):
+                  xml_record=None, user_info=None, on_the_fly=False,
+                  record=None):
     """
     Format a record in given output format.
 
@@ -97,6 +99,7 @@ def format_record(recID, of, ln=CFG_SITE_LANG, verbose=0, search_pattern=None,
     @param user_info: the information of the user who will view the formatted page (if applicable)
     @param on_the_fly: if False, try to return an already preformatted version of the record in the database
     @type on_the_fly: boolean
+    @param record: the already fetched record structure of recID, if any
     @return: formatted record
     @rtype: string
     """
@@ -160,7 +163,8 @@ def format_record(recID, of, ln=CFG_SITE_LANG, verbose=0, search_pattern=None,
                                               verbose=verbose,
                                               search_pattern=search_pattern,
                                               xml_record=xml_record,
-                                              user_info=user_info)
+                                              user_info=user_info,
+                                              record=record)
         if of.lower() == 'xm':
             out = filter_hidden_fields(out, user_info)
         return out
@@ -192,6 +196,65 @@ def format_record(recID, of, ln=CFG_SITE_LANG, verbose=0, search_pattern=None,
                                                                  recID = recID,
                                                                  )
 
+def iterate_formatted_records(recIDs, of, ln=CFG_SITE_LANG, verbose=0,
+                              search_pattern=None, user_info=None,
+                              on_the_fly=False, record_existence=None):
+    """
+    Format the records given by a list of record IDs in given output
+    format, yielding the formatted records one after the other.
+
+    Return the same as format_record() would for each record, but
+    fetch what is needed from the database for all records at once:
+    the preformatted outputs with one query, then the structures of
+    the records that must be formatted on-the-fly with another one.
+    The BibFormat objects are built from these prefetched structures.
+
+    This function takes the same parameters as 'format_record' except for:
+    @param recIDs: a list of record IDs
+    @type recIDs: list(int)
+    @param record_existence: the result of search_engine.records_exist(recIDs), if already known
+    @type record_existence: dict
+    @return: iterator over the formatted records
+    @rtype: iterator(string)
+    """
+    from invenio.search_engine import records_exist, get_records
+
+    if verbose == 9 or (CFG_BIBFORMAT_USE_OLD_BIBFORMAT and CFG_PATH_PHP):
+        # debug and old BibFormat modes are not worth batching
+        for recID in recIDs:
+            yield format_record(recID, of, ln, verbose, search_pattern,
+                                user_info=user_info, on_the_fly=on_the_fly)
+        return
+
+    if record_existence is None:
+        record_existence = records_exist(recIDs)
+
+    # Fetch preformatted records, under the conditions of format_record()
+    preformatted = {}
+    if not on_the_fly and \
+       (ln == CFG_SITE_LANG or \
+        of.lower() == 'xm' or \
+        CFG_BIBFORMAT_USE_OLD_BIBFORMAT or \
+        (CFG_BIBFORMAT_ENABLE_I18N_BRIEF_FORMAT == False and of.lower() == 'hb')):
+        preformatted = bibformat_dblayer.get_preformatted_records(
+            [recID for recID in recIDs if record_existence.get(recID) != -1],
+            of)
+
+    # Fetch the structures of the records to format on-the-fly
+    records = get_records([recID for recID in recIDs
+                           if not preformatted.has_key(recID)])
+
+    for recID in recIDs:
+        if preformatted.has_key(recID):
+            out = preformatted[recID]
+            if of.lower() == 'xm':
+                out = filter_hidden_fields(out, user_info)
+            yield out
+        else:
+            yield format_record(recID, of, ln, verbose, search_pattern,
+                                user_info=user_info, on_the_fly=True,
+                                record=records.get(recID))
+
 def record_get_xml(recID, format='xm', decompress=zlib.decompress):
     """
     Returns an XML string of the record given by recID.
@@ -291,8 +354,12 @@ def format_records(recIDs, of, ln=CFG_SITE_LANG, verbose=0, search_pattern=None,
     #Fill one of the lists with Nones
     if xml_records is not None:
         recIDs = map(lambda x:None, xml_records)
+        formatted_records_iterator = None
     else:
         xml_records = map(lambda x:None, recIDs)
+        # Records given by ID are fetched from the database in batch
+        formatted_records_iterator = iterate_formatted_records(
+            recIDs, of, ln, verbose, search_pattern, user_info, on_the_fly)
 
     total_rec = len(recIDs)
     last_iteration = False
@@ -313,9 +380,12 @@ def format_records(recIDs, of, ln=CFG_SITE_LANG, verbose=0, search_pattern=None,
                     req.write(string_prefix)
 
         #Print formatted record
-        formatted_record = format_record(recIDs[i], of, ln, verbose, \
-                                         search_pattern, xml_records[i],\
-                                         user_info, on_the_fly)
+        if formatted_records_iterator is not None:
+            formatted_record = formatted_records_iterator.next()
+        else:
+            formatted_record = format_record(recIDs[i], of, ln, verbose, \
+                                             search_pattern, xml_records[i],\
+                                             user_info, on_the_fly)
         formatted_records += formatted_record
         if req is not None:
             req.write(formatted_record)
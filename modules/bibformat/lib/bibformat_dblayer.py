@@ -466,6 +466,29 @@ def get_preformatted_record(recID, of, decompress=zlib.decompress):
     else:
         return None
 
+def get_preformatted_records(recIDs, of, decompress=zlib.decompress):
+    """
+    Returns the preformatted records with ids in 'recIDs' and format
+    'of', fetched with a single query.
+
+    Records that are not preformatted in given output format are
+    missing from the returned dictionary.
+
+    @param recIDs: the list of ids of the records to fetch
+    @param of: the output format code
+    @param decompress: the method used to decompress the preformatted record in database
+    @return: dictionary of formatted records as String, by record id
+    """
+    out = {}
+    if not recIDs:
+        return out
+    query = "SELECT id_bibrec, value FROM bibfmt WHERE format=%%s AND " \
+            "id_bibrec IN (%s)" % ','.join(['%s'] * len(recIDs))
+    params = tuple([of] + list(recIDs))
+    for recID, value in run_sql(query, params):
+        out[recID] = "%s" % decompress(value)
+    return out
+
 def get_preformatted_record_date(recID, of):
     """
     Returns the date of the last update of the cache for the considered
@@ -290,7 +290,8 @@ def call_old_bibformat(recID, of="HD", on_the_fly=False, verbose=0):
         return out
 
 def format_record(recID, of, ln=CFG_SITE_LANG, verbose=0,
-                  search_pattern=None, xml_record=None, user_info=None):
+                  search_pattern=None, xml_record=None, user_info=None,
+                  record=None):
     """
     Formats a record given output format. Main entry function of
     bibformat engine.
@@ -317,6 +318,7 @@ def format_record(recID, of, ln=CFG_SITE_LANG, verbose=0,
     @param search_pattern: list of strings representing the user request in web interface
     @param xml_record: an xml string representing the record to format
     @param user_info: the information of the user who will view the formatted page
+    @param record: the already fetched record structure of recID, if any
     @return: formatted record
     """
     if search_pattern is None:
@@ -329,7 +331,8 @@ def format_record(recID, of, ln=CFG_SITE_LANG, verbose=0,
     # But if format not found for new BibFormat, then call old BibFormat
 
     #Create a BibFormat Object to pass that contain record and context
-    bfo = BibFormatObject(recID, ln, search_pattern, xml_record, user_info, of)
+    bfo = BibFormatObject(recID, ln, search_pattern, xml_record, user_info, of,
+                          record)
 
     if of.lower() != 'xm' and \
            (not bfo.get_record() or len(bfo.get_record()) <= 1):
@@ -1750,7 +1753,8 @@ class BibFormatObject:
     req = None # DEPRECATED: use bfo.user_info instead. Used by WebJournal.
 
     def __init__(self, recID, ln=CFG_SITE_LANG, search_pattern=None,
-                 xml_record=None, user_info=None, output_format=''):
+                 xml_record=None, user_info=None, output_format='',
+                 record=None):
         """
         Creates a new bibformat object, with given record.
 
@@ -1780,6 +1784,7 @@ class BibFormatObject:
         @param xml_record: a xml string of the record to format
         @param user_info: the information of the user who will view the formatted page
         @param output_format: the output_format used for formatting this record
+        @param record: the record structure of recID, if already fetched
         """
         self.xml_record = None # *Must* remain empty if recid is given
         if xml_record is not None:
@@ -1787,6 +1792,9 @@ class BibFormatObject:
             self.xml_record = xml_record
             self.record = create_record(xml_record)[0]
             recID = record_get_field_value(self.record, "001")
+        elif record is not None:
+            # If record structure was prefetched, e.g. by format_records()
+            self.record = record
 
         self.lang = wash_language(ln)
         if search_pattern is None:
@@ -27,7 +27,7 @@ from invenio.config import CFG_SITE_URL, CFG_SITE_LANG, CFG_SITE_RECORD
 from invenio.testutils import make_test_suite, \
                               run_test_suite, \
                               test_web_page_content
-from invenio.bibformat import format_record
+from invenio.bibformat import format_record, iterate_formatted_records
 from invenio.bibformat_engine import BibFormatObject
 
 class BibFormatAPITest(unittest.TestCase):
@@ -48,6 +48,21 @@ class BibFormatAPITest(unittest.TestCase):
         result = test_web_page_content(pageurl,
                                        expected_text=result)
 
+    def test_iterate_formatted_records(self):
+        """bibformat - Checking records formatted at once"""
+        # existing records and a missing one
+        recids = range(1, 105) + [1234567809]
+        for of, ln, on_the_fly in (('hb', CFG_SITE_LANG, False),
+                                   ('hb', 'fr', False),
+                                   ('hx', CFG_SITE_LANG, False),
+                                   ('xm', CFG_SITE_LANG, False),
+                                   ('hd', CFG_SITE_LANG, True)):
+            expected = [format_record(recid, of, ln=ln, on_the_fly=on_the_fly)
+                        for recid in recids]
+            self.assertEqual(list(iterate_formatted_records(recids, of, ln=ln,
+                                                            on_the_fly=on_the_fly)),
+                             expected)
+
 class BibFormatObjectAPITest(unittest.TestCase):
     """Check BibFormatObject (bfo) APIs"""
 
@@ -39,6 +39,7 @@ from invenio.config import \
      CFG_BIBINDEX_REMOVE_LATEX_MARKUP, \
      CFG_BIBINDEX_AUTHOR_WORD_INDEX_EXCLUDE_FIRST_NAMES, \
      CFG_BIBINDEX_SYNONYM_KBRS, \
+     CFG_BIBINDEX_CONTAINER_HITLISTS, \
      CFG_CERN_SITE, CFG_INSPIRE_SITE, \
      CFG_BIBINDEX_PERFORM_OCR_ON_DOCNAMES, \
      CFG_BIBINDEX_SPLASH_PAGES, \
@@ -900,14 +901,14 @@ class WordTable:
                 # yes there were some new words:
                 write_message("......... updating hitlist for ``%s''" % word, verbose=9)
                 run_sql("UPDATE %s SET hitlist=%%s WHERE term=%%s" % self.tablename,
-                    (set.fastdump(), word))
+                    (set.fastdump(containers=CFG_BIBINDEX_CONTAINER_HITLISTS), word))
 
         else: # the word is new, will create new set:
             write_message("......... inserting hitlist for ``%s''" % word, verbose=9)
             set = intbitset(self.value[word].keys())
             try:
                 run_sql("INSERT INTO %s (term, hitlist) VALUES (%%s, %%s)" % self.tablename,
-                        (word, set.fastdump()))
+                        (word, set.fastdump(containers=CFG_BIBINDEX_CONTAINER_HITLISTS)))
             except Exception, e:
                 ## We send this exception to the admin only when is not
                 ## already reparing the problem.
@@ -34,6 +34,7 @@ from invenio.dbquery import run_sql, serialize_via_marshal, \
                             deserialize_via_marshal
 from invenio.search_engine import search_pattern, search_unit
 from invenio.search_engine_utils import get_fieldvalues
+from invenio.bibrank_citation_searcher import create_citation_count_vector
 from invenio.bibformat_utils import parse_tag
 from invenio.bibtask import write_message, task_get_option, \
                      task_update_progress, task_sleep_now_if_required, \
@@ -923,6 +924,8 @@ def insert_cit_ref_list_intodb(citation_dic, reference_dic, selfcbdic,
     """Insert the reference and citation list into the database"""
     insert_into_cit_db(reference_dic,"reversedict")
     insert_into_cit_db(citation_dic,"citationdict")
+    insert_into_cit_db(create_citation_count_vector(citation_dic).tostring(),
+                       "citationcounts")
     insert_into_cit_db(selfcbdic,"selfcitedbydict")
     insert_into_cit_db(selfdic,"selfcitdict")
 
@@ -20,16 +20,29 @@
 __revision__ = "$Id$"
 
 import re
+from array import array
 
 from invenio.dbquery import run_sql, get_table_update_time, OperationalError, \
         deserialize_via_marshal
 from invenio.intbitset import intbitset
 from invenio.data_cacher import DataCacher
 
+def create_citation_count_vector(citationdict):
+    """Return the array of the numbers of citations of the records,
+       indexed by record ID, for the citation dictionary CITATIONDICT.
+    """
+    if not citationdict:
+        return array('I')
+    counts = array('I', [0]) * (max(citationdict.keys()) + 1)
+    for recid, citers in citationdict.iteritems():
+        counts[recid] = len(citers)
+    return counts
+
 class CitationDictsDataCacher(DataCacher):
     """
     Cache holding all citation dictionaries (citationdict,
-    reversedict, selfcitdict, selfcitedbydict).
+    reversedict, selfcitdict, selfcitedbydict) and the citation count
+    vector (citationcounts).
     """
     def __init__(self):
         def cache_filler():
@@ -52,6 +65,14 @@ class CitationDictsDataCacher(DataCacher):
                     # some preprocessed citationdict:
                     alldicts['citationdict_keys'] = object_value_dict.keys()
                     alldicts['citationdict_keys_intbitset'] = intbitset(object_value_dict.keys())
+            # the citation count vector is stored by the citation
+            # indexer, but compute it if not there yet:
+            counts = array('I')
+            try:
+                counts.fromstring(alldicts['citationcounts'])
+            except (KeyError, TypeError, ValueError):
+                counts = create_citation_count_vector(alldicts.get('citationdict', {}))
+            alldicts['citationcounts'] = counts
             return alldicts
         def timestamp_verifier():
             res = run_sql("""SELECT DATE_FORMAT(last_updated, '%Y-%m-%d %H:%i:%s')
@@ -70,7 +91,8 @@ except Exception:
 
 def get_citation_dict(dictname):
     """Return cached value of a citation dictionary. DICTNAME can be
-       citationdict, reversedict, selfcitdict, selfcitedbydict.
+       citationdict, reversedict, selfcitdict, selfcitedbydict, or
+       citationcounts for the citation count vector.
     """
     cache_citation_dicts.recreate_cache_if_needed()
     return cache_citation_dicts.cache.get(dictname, {})
@@ -148,6 +170,14 @@ def get_records_with_num_cites(numstr, allrecs = intbitset([])):
                 matches.add(k)
     return matches
 
+def get_cited_by_counts(recordlist):
+    """Return the list of the numbers of citations of the records in
+       RECORDLIST, in the same order.
+    """
+    counts = get_citation_dict("citationcounts")
+    size = len(counts)
+    return [recid < size and counts[recid] or 0 for recid in recordlist]
+
 def get_cited_by_list(recordlist):
     """Return a tuple of ([recid,list_of_citing_records],...) for all the
        records in recordlist.
@@ -168,8 +198,10 @@ def get_refersto_hitset(ahitset):
     out = intbitset()
     if ahitset:
         try:
+            # add the recids straight into the result, without a
+            # temporary set per record:
             for recid in ahitset:
-                out = out | intbitset(cache_cited_by_dictionary.get(recid, []))
+                out += cache_cited_by_dictionary.get(recid, [])
         except OverflowError:
             # ignore attempt to iterate over infinite ahitset
             pass
@@ -184,8 +216,10 @@ def get_citedby_hitset(ahitset):
     out = intbitset()
     if ahitset:
         try:
+            # add the recids straight into the result, without a
+            # temporary set per record:
             for recid in ahitset:
-                out = out | intbitset(cache_cited_by_dictionary.get(recid, []))
+                out += cache_cited_by_dictionary.get(recid, [])
         except OverflowError:
             # ignore attempt to iterate over infinite ahitset
             pass
@@ -23,6 +23,7 @@ __revision__ = "$Id$"
 
 import unittest
 
+from invenio.bibrank_citation_searcher import create_citation_count_vector
 from invenio.testutils import make_test_suite, run_test_suite
 
 class TestCitationSearcher(unittest.TestCase):
@@ -52,6 +53,12 @@ class TestCitationSearcher(unittest.TestCase):
         """bibrank citation searcher - get co-cited-with data"""
         # FIXME: test postponed
 
+    def test_create_citation_count_vector(self):
+        """bibrank citation searcher - citation count vector"""
+        counts = create_citation_count_vector({2: [3, 4, 5], 5: [2], 3: []})
+        self.assertEqual(counts.tolist(), [0, 0, 3, 0, 0, 1])
+        self.assertEqual(len(create_citation_count_vector({})), 0)
+
 TEST_SUITE = make_test_suite(TestCitationSearcher,)
 
 if __name__ == "__main__":
@@ -76,6 +76,50 @@ class DataCacher:
         if self.timestamp_verifier() > self.timestamp:
             self.create_cache()
 
+class IntervalDataCacher(DataCacher):
+    """
+    IntervalDataCacher is a cacher system verifying its timestamp at
+    most every check_interval seconds, for caches consulted far more
+    often than their data change.
+
+    The .timestamp is the one the timestamp verifier returned when
+    the cache was created, and the cache is recreated as soon as the
+    verifier returns another one, so any timestamp that can be
+    compared for equality will do.
+    """
+    def __init__(self, cache_filler, timestamp_verifier, check_interval):
+        """ @param cache_filler: a function that fills the cache dictionary.
+            @param timestamp_verifier: a function that returns a timestamp for
+                   checking if something has changed after cache creation.
+            @param check_interval: the minimal number of seconds between two
+                   calls of the timestamp verifier.
+        """
+        self.check_interval = check_interval
+        self.last_check = 0
+        DataCacher.__init__(self, cache_filler, timestamp_verifier)
+
+    def create_cache(self):
+        """
+        Create and populate cache by calling cache filler, after
+        having noted the timestamp of the data it is filled from.
+        """
+        self.last_check = time.time()
+        self.timestamp = self.timestamp_verifier()
+        self.cache = self.cache_filler()
+
+    def recreate_cache_if_needed(self):
+        """
+        Recreate cache if needed, by verifying the cache timestamp
+        against the timestamp verifier function, unless it was
+        verified less than check_interval seconds ago.
+        """
+        now = time.time()
+        if now - self.last_check < self.check_interval:
+            return
+        self.last_check = now
+        if self.timestamp_verifier() != self.timestamp:
+            self.create_cache()
+
 class SQLDataCacher(DataCacher):
     """
     SQLDataCacher is a cacher system, for caching single queries and
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+
+## This file is part of Invenio.
+## Copyright (C) 2011 CERN.
+##
+## Invenio is free software; you can redistribute it and/or
+## modify it under the terms of the GNU General Public License as
+## published by the Free Software Foundation; either version 2 of the
+## License, or (at your option) any later version.
+##
+## Invenio is distributed in the hope that it will be useful, but
+## WITHOUT ANY WARRANTY; without even the implied warranty of
+## MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+## General Public License for more details.
+##
+## You should have received a copy of the GNU General Public License
+## along with Invenio; if not, write to the Free Software Foundation, Inc.,
+## 59 Temple Place, Suite 330, Boston, MA 02111-1307, USA.
+
+"""Unit tests for the data cacher."""
+
+__revision__ = "$Id$"
+
+import unittest
+
+from invenio.data_cacher import IntervalDataCacher
+from invenio.testutils import make_test_suite, run_test_suite
+
+class TestIntervalDataCacher(unittest.TestCase):
+    """Test the data cacher verifying its timestamp at intervals."""
+
+    def setUp(self):
+        self.timestamp = 1
+        self.verified = 0
+        self.filled = 0
+
+    def cache_filler(self):
+        """Count the fillings and return their number."""
+        self.filled += 1
+        return self.filled
+
+    def timestamp_verifier(self):
+        """Count the verifications and return the current timestamp."""
+        self.verified += 1
+        return self.timestamp
+
+    def test_recreated_on_new_timestamp(self):
+        """data cacher - cache recreated when the timestamp changes"""
+        cacher = IntervalDataCacher(self.cache_filler,
+                                    self.timestamp_verifier, 0)
+        self.assertEqual((cacher.cache, cacher.timestamp), (1, 1))
+        cacher.recreate_cache_if_needed()
+        self.assertEqual(cacher.cache, 1)
+        self.timestamp = (2, 'any')
+        cacher.recreate_cache_if_needed()
+        self.assertEqual((cacher.cache, cacher.timestamp), (2, (2, 'any')))
+
+    def test_check_interval(self):
+        """data cacher - timestamp verified at most every interval"""
+        cacher = IntervalDataCacher(self.cache_filler,
+                                    self.timestamp_verifier, 3600)
+        self.timestamp = 2
+        cacher.recreate_cache_if_needed()
+        cacher.recreate_cache_if_needed()
+        self.assertEqual((self.verified, cacher.cache), (1, 1))
+        cacher.last_check -= 3600
+        cacher.recreate_cache_if_needed()
+        self.assertEqual((self.verified, cacher.cache), (3, 2))
+
+TEST_SUITE = make_test_suite(TestIntervalDataCacher)
+
+if __name__ == "__main__":
+    run_test_suite(TEST_SUITE)
@@ -33,15 +33,16 @@ from MySQLdb import Warning, Error, InterfaceError, DataError, \
                     InternalError, NotSupportedError, \
                     ProgrammingError
 import os
-import string
 import time
 import marshal
 import re
 from zlib import compress, decompress
-from thread import get_ident
+from thread import get_ident, allocate_lock
 from invenio.config import CFG_ACCESS_CONTROL_LEVEL_SITE, \
     CFG_MISCUTIL_SQL_USE_SQLALCHEMY, \
-    CFG_MISCUTIL_SQL_RUN_SQL_MANY_LIMIT
+    CFG_MISCUTIL_SQL_RUN_SQL_MANY_LIMIT, \
+    CFG_MISCUTIL_SQL_POOL_SIZE, \
+    CFG_MISCUTIL_SQL_POOL_IDLE_TIMEOUT
 
 if CFG_MISCUTIL_SQL_USE_SQLALCHEMY:
     try:
@@ -69,8 +70,20 @@ CFG_DATABASE_NAME = 'invenio'
 CFG_DATABASE_USER = 'invenio'
 CFG_DATABASE_PASS = 'my123p$ss'
 
+## Connections checked out by the threads, by (pid, thread ident):
 _DB_CONN = {}
 
+## Pool of the connections released by the threads, by pid: lists of
+## (connection, time of release) tuples, the most recently released last.
+_DB_POOL = {}
+_DB_POOL_LOCK = allocate_lock()
+
+## Kinds of the SQL statements run so far, by statement, and the
+## longest statement that is cached:
+_SQL_STATEMENT_KINDS = {}
+_SQL_STATEMENT_KINDS_MAX_SIZE = 1000
+_SQL_STATEMENT_MAX_LENGTH = 1000
+
 
 class InvenioDbQueryWildcardLimitError(Exception):
     """Exception raised when query limit reached."""
@@ -78,9 +91,8 @@ class InvenioDbQueryWildcardLimitError(Exception):
         """Initialization."""
         self.res = res
 
-def _db_login(relogin = 0):
-
-    """Login to the database."""
+def _db_connect():
+    """Open a new connection to the database."""
 
     ## Note: we are using "use_unicode=False", because we want to
     ## receive strings from MySQL as Python UTF-8 binary string
@@ -93,31 +105,74 @@ def _db_login(relogin = 0):
     ## older MySQLdb versions here, since we are recommending to
     ## upgrade to more recent versions anyway.
 
+    return connect(host=CFG_DATABASE_HOST, port=int(CFG_DATABASE_PORT),
+                   db=CFG_DATABASE_NAME, user=CFG_DATABASE_USER,
+                   passwd=CFG_DATABASE_PASS,
+                   use_unicode=False, charset='utf8')
+
+def _db_is_alive(db):
+    """Check whether connection DB still works, by pinging the server."""
+    try:
+        db.ping()
+        return True
+    except Error:
+        return False
+
+def _db_close(db):
+    """Close connection DB, ignoring the errors of a broken connection."""
+    try:
+        db.close()
+    except Error:
+        pass
+
+def _db_checkout():
+    """
+    Return a connection for the current thread: the most recently
+    released connection of the pool of the process that is still alive,
+    or a new connection if there is none.  The connections idle for more
+    than CFG_MISCUTIL_SQL_POOL_IDLE_TIMEOUT seconds are closed on the way.
+    """
+    pid = os.getpid()
+    now = time.time()
+    while True:
+        _DB_POOL_LOCK.acquire()
+        try:
+            pool = _DB_POOL.get(pid, [])
+            idle = [db for db, released in pool
+                    if now - released > CFG_MISCUTIL_SQL_POOL_IDLE_TIMEOUT]
+            if idle:
+                pool[:] = [(db, released) for db, released in pool
+                           if now - released <= CFG_MISCUTIL_SQL_POOL_IDLE_TIMEOUT]
+            db = None
+            if pool:
+                db = pool.pop()[0]
+        finally:
+            _DB_POOL_LOCK.release()
+        for idle_db in idle:
+            _db_close(idle_db)
+        if db is None:
+            return _db_connect()
+        if _db_is_alive(db):
+            return db
+        _db_close(db)
+
+def _db_login(relogin = 0):
+    """
+    Login to the database.  Return the connection checked out by the
+    current thread, checking one out of the pool first if needed.  With
+    RELOGIN, replace it with a new connection.
+    """
     if CFG_MISCUTIL_SQL_USE_SQLALCHEMY:
-        return connect(host=CFG_DATABASE_HOST, port=int(CFG_DATABASE_PORT),
-                       db=CFG_DATABASE_NAME, user=CFG_DATABASE_USER,
-                       passwd=CFG_DATABASE_PASS,
-                       use_unicode=False, charset='utf8')
-    else:
-        thread_ident = (os.getpid(), get_ident())
+        return _db_connect()
+    thread_ident = (os.getpid(), get_ident())
     if relogin:
-        _DB_CONN[thread_ident] = connect(host=CFG_DATABASE_HOST,
-                                         port=int(CFG_DATABASE_PORT),
-                                         db=CFG_DATABASE_NAME,
-                                         user=CFG_DATABASE_USER,
-                                         passwd=CFG_DATABASE_PASS,
-                                         use_unicode=False, charset='utf8')
+        _DB_CONN[thread_ident] = _db_connect()
         return _DB_CONN[thread_ident]
     else:
         if _DB_CONN.has_key(thread_ident):
             return _DB_CONN[thread_ident]
         else:
-            _DB_CONN[thread_ident] = connect(host=CFG_DATABASE_HOST,
-                                             port=int(CFG_DATABASE_PORT),
-                                             db=CFG_DATABASE_NAME,
-                                             user=CFG_DATABASE_USER,
-                                             passwd=CFG_DATABASE_PASS,
-                                             use_unicode=False, charset='utf8')
+            _DB_CONN[thread_ident] = _db_checkout()
             return _DB_CONN[thread_ident]
 
 def _db_logout():
@@ -138,6 +193,81 @@ def close_connection():
     except KeyError:
         pass
 
+def release_connection():
+    """
+    Return the connection checked out by the current thread to the pool
+    of the process, so that other threads can use it, e.g. at the end of
+    the processing of a web request.  At most CFG_MISCUTIL_SQL_POOL_SIZE
+    connections are kept in the pool; the others are closed.
+    """
+    pid = os.getpid()
+    try:
+        db = _DB_CONN.pop((pid, get_ident()))
+    except KeyError:
+        return
+    _DB_POOL_LOCK.acquire()
+    try:
+        pool = _DB_POOL.setdefault(pid, [])
+        pool.append((db, time.time()))
+        if len(pool) > CFG_MISCUTIL_SQL_POOL_SIZE:
+            # the least recently released connection goes away
+            db = pool.pop(0)[0]
+        else:
+            db = None
+    finally:
+        _DB_POOL_LOCK.release()
+    if db is not None:
+        _db_close(db)
+
+def _db_execute(sql, param=None, many=False):
+    """
+    Execute SQL with PARAM, via executemany() if MANY, on the connection
+    of the current thread and return the cursor and the result of the
+    execution.  If the connection turns out to be broken, the statement
+    is run again once on a new connection; the other errors are raised.
+    """
+    db = None
+    try:
+        db = _db_login()
+        cur = db.cursor()
+        if many:
+            rc = cur.executemany(sql, param)
+        else:
+            rc = cur.execute(sql, param)
+    except OperationalError: # unexpected disconnect, bad malloc error, etc
+        if db is not None and _db_is_alive(db):
+            raise
+        db = _db_login(relogin=1)
+        cur = db.cursor()
+        if many:
+            rc = cur.executemany(sql, param)
+        else:
+            rc = cur.execute(sql, param)
+    return cur, rc
+
+def _get_sql_statement_kind(sql):
+    """
+    Return the kind of SQL statement: 'select' for the statements
+    returning rows (SELECT, SHOW, DESC, DESCRIBE), 'insert' for INSERT
+    and None for the others.  The kinds of the statements are cached.
+    """
+    try:
+        return _SQL_STATEMENT_KINDS[sql]
+    except KeyError:
+        pass
+    verb = sql.split(None, 1)[0].upper()
+    if verb in ("SELECT", "SHOW", "DESC", "DESCRIBE"):
+        kind = 'select'
+    elif verb == "INSERT":
+        kind = 'insert'
+    else:
+        kind = None
+    if len(sql) <= _SQL_STATEMENT_MAX_LENGTH:
+        if len(_SQL_STATEMENT_KINDS) >= _SQL_STATEMENT_KINDS_MAX_SIZE:
+            _SQL_STATEMENT_KINDS.clear()
+        _SQL_STATEMENT_KINDS[sql] = kind
+    return kind
+
 def run_sql(sql, param=None, n=0, with_desc=0):
     """Run SQL on the server with PARAM and return result.
 
@@ -173,20 +303,10 @@ def run_sql(sql, param=None, n=0, with_desc=0):
     if param:
         param = tuple(param)
 
-    try:
-        db = _db_login()
-        cur = db.cursor()
-        rc = cur.execute(sql, param)
-    except OperationalError: # unexpected disconnect, bad malloc error, etc
-        # FIXME: now reconnect is always forced, we may perhaps want to ping() first?
-        try:
-            db = _db_login(relogin=1)
-            cur = db.cursor()
-            rc = cur.execute(sql, param)
-        except OperationalError: # again an unexpected disconnect, bad malloc error, etc
-            raise
+    cur, rc = _db_execute(sql, param)
 
-    if string.upper(string.split(sql)[0]) in ("SELECT", "SHOW", "DESC", "DESCRIBE"):
+    kind = _get_sql_statement_kind(sql)
+    if kind == 'select':
         if n:
             recset = cur.fetchmany(n)
         else:
@@ -196,7 +316,7 @@ def run_sql(sql, param=None, n=0, with_desc=0):
         else:
             return recset
     else:
-        if string.upper(string.split(sql)[0]) == "INSERT":
+        if kind == 'insert':
             rc = cur.lastrowid
         return rc
 
@@ -218,17 +338,7 @@ def run_sql_many(query, params, limit=CFG_MISCUTIL_SQL_RUN_SQL_MANY_LIMIT):
     r = None
     while i < len(params):
         ## make partial query safely (mimicking procedure from run_sql())
-        try:
-            db = _db_login()
-            cur = db.cursor()
-            rc = cur.executemany(query, params[i:i + limit])
-        except OperationalError:
-            try:
-                db = _db_login(relogin=1)
-                cur = db.cursor()
-                rc = cur.executemany(query, params[i:i + limit])
-            except OperationalError:
-                raise
+        dummy, rc = _db_execute(query, params[i:i + limit], many=True)
         ## collect its result:
         if r is None:
             r = rc
@@ -103,7 +103,36 @@ class WashTableColumnNameTest(unittest.TestCase):
         self.assertNotEqual(dbquery.real_escape_string(testcase_injection), testcase_injection)
 
 
-TEST_SUITE = make_test_suite(TableUpdateTimesTest, WashTableColumnNameTest)
+class ConnectionPoolTest(unittest.TestCase):
+    """Test the reuse of the DB connections released by the threads."""
+
+    def test_released_connection_is_reused(self):
+        """dbquery - released connection is checked out again"""
+        dbquery.release_connection()
+        db = dbquery._db_login()
+        dbquery.release_connection()
+        self.assertEqual(db, dbquery._db_login())
+        self.assertEqual(1, dbquery.run_sql("SELECT 1")[0][0])
+
+    def test_closed_connection_is_replaced(self):
+        """dbquery - connection closed in the pool is replaced on checkout"""
+        dbquery.release_connection()
+        db = dbquery._db_login()
+        dbquery.release_connection()
+        db.close()
+        self.assertNotEqual(db, dbquery._db_login())
+        self.assertEqual(1, dbquery.run_sql("SELECT 1")[0][0])
+
+    def test_statement_kinds(self):
+        """dbquery - kinds of SQL statements"""
+        self.assertEqual('select', dbquery._get_sql_statement_kind("SELECT 1"))
+        self.assertEqual('select', dbquery._get_sql_statement_kind(" show tables"))
+        self.assertEqual('select', dbquery._get_sql_statement_kind("DESC\ncollection"))
+        self.assertEqual('insert', dbquery._get_sql_statement_kind("insert INTO t VALUES (1)"))
+        self.assertEqual(None, dbquery._get_sql_statement_kind("UPDATE t SET a=1"))
+
+TEST_SUITE = make_test_suite(TableUpdateTimesTest, WashTableColumnNameTest,
+                             ConnectionPoolTest)
 
 if __name__ == "__main__":
     run_test_suite(TEST_SUITE)
@@ -1,4 +1,4 @@
-/* Generated by Cython 0.14.1 on Mon Feb 21 22:48:53 2011 */
+/* Generated by Cython 0.14.1 on Sun Oct 18 11:22:28 2026 */
 
 #define PY_SSIZE_T_CLEAN
 #include "Python.h"
@@ -219,8 +219,9 @@
 #define _USE_MATH_DEFINES
 #endif
 #include <math.h>
-#define __PYX_HAVE_API__lib__intbitset
+#define __PYX_HAVE_API__intbitset
 #include "intbitset.h"
+#include "sys/mman.h"
 
 #ifdef PYREX_WITHOUT_ASSERTIONS
 #define CYTHON_WITHOUT_ASSERTIONS
@@ -304,7 +305,7 @@ static const char *__pyx_f[] = {
 
 /* Type declarations */
 
-/* "lib/intbitset.pyx":738
+/* "intbitset.pyx":858
  *     cdef object __weakref__
  * 
  * cdef class intbitset_iterator:             # <<<<<<<<<<<<<<
@@ -312,7 +313,7 @@ static const char *__pyx_f[] = {
  *     cdef IntBitSet *bitset
  */
 
-struct __pyx_obj_3lib_9intbitset_intbitset_iterator {
+struct __pyx_obj_9intbitset_intbitset_iterator {
   PyObject_HEAD
   int last;
   IntBitSet *bitset;
@@ -320,21 +321,51 @@ struct __pyx_obj_3lib_9intbitset_intbitset_iterator {
   PyObject *__weakref__;
 };
 
-/* "lib/intbitset.pyx":95
- * __maxelem__ = maxelem
+/* "intbitset.pyx":891
+ *     cdef object __weakref__
+ * 
+ * cdef class intbitset_file:             # <<<<<<<<<<<<<<
+ *     """
+ *     Read-only memory map of a file holding container dumps (see
+ */
+
+struct __pyx_obj_9intbitset_intbitset_file {
+  PyObject_HEAD
+  struct __pyx_vtabstruct_9intbitset_intbitset_file *__pyx_vtab;
+  char *data;
+  Py_ssize_t size;
+};
+
+/* "intbitset.pyx":148
+ *     return False
  * 
  * cdef class intbitset:             # <<<<<<<<<<<<<<
  *     """
  *     Defines an intbitset data object to hold unordered sets of
  */
 
-struct __pyx_obj_3lib_9intbitset_intbitset {
+struct __pyx_obj_9intbitset_intbitset {
   PyObject_HEAD
   IntBitSet *bitset;
   int sanity_checks;
+  PyObject *dump;
   PyObject *__weakref__;
 };
 
+
+/* "intbitset.pyx":891
+ *     cdef object __weakref__
+ * 
+ * cdef class intbitset_file:             # <<<<<<<<<<<<<<
+ *     """
+ *     Read-only memory map of a file holding container dumps (see
+ */
+
+struct __pyx_vtabstruct_9intbitset_intbitset_file {
+  int (*_check_range)(struct __pyx_obj_9intbitset_intbitset_file *, Py_ssize_t, Py_ssize_t);
+};
+static struct __pyx_vtabstruct_9intbitset_intbitset_file *__pyx_vtabptr_9intbitset_intbitset_file;
+
 #ifndef CYTHON_REFNANNY
   #define CYTHON_REFNANNY 0
 #endif
@@ -396,6 +427,11 @@ static CYTHON_INLINE void __Pyx_ErrFetch(PyObject **type, PyObject **value, PyOb
 
 static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb); /*proto*/
 
+static CYTHON_INLINE long __Pyx_NegateNonNeg(long b) { return unlikely(b < 0) ? b : !b; }
+static CYTHON_INLINE PyObject* __Pyx_PyBoolOrNull_FromLong(long b) {
+    return unlikely(b < 0) ? NULL : __Pyx_PyBool_FromLong(b);
+}
+
 static CYTHON_INLINE Py_ssize_t __Pyx_mod_Py_ssize_t(Py_ssize_t, Py_ssize_t); /* proto */
 
 static int __Pyx_GetException(PyObject **type, PyObject **value, PyObject **tb); /*proto*/
@@ -488,6 +524,28 @@ static CYTHON_INLINE void __Pyx_RaiseTooManyValuesError(Py_ssize_t expected);
 static PyObject *__Pyx_UnpackItem(PyObject *, Py_ssize_t index); /*proto*/
 static int __Pyx_EndUnpack(PyObject *, Py_ssize_t expected); /*proto*/
 
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Append(PyObject* L, PyObject* x) {
+    if (likely(PyList_CheckExact(L))) {
+        if (PyList_Append(L, x) < 0) return NULL;
+        Py_INCREF(Py_None);
+        return Py_None; /* this is just to have an accurate signature */
+    }
+    else {
+        PyObject *r, *m;
+        m = __Pyx_GetAttrString(L, "append");
+        if (!m) return NULL;
+        r = PyObject_CallFunctionObjArgs(m, x, NULL);
+        Py_DECREF(m);
+        return r;
+    }
+}
+
+static double __Pyx__PyObject_AsDouble(PyObject* obj); /* proto */
+
+#define __Pyx_PyObject_AsDouble(obj) \
+    ((likely(PyFloat_CheckExact(obj))) ? \
+     PyFloat_AS_DOUBLE(obj) : __Pyx__PyObject_AsDouble(obj))
+
 static CYTHON_INLINE void __Pyx_ExceptionSave(PyObject **type, PyObject **value, PyObject **tb); /*proto*/
 static void __Pyx_ExceptionReset(PyObject *type, PyObject *value, PyObject *tb); /*proto*/
 
@@ -527,17 +585,25 @@ static CYTHON_INLINE signed long __Pyx_PyInt_AsSignedLong(PyObject *);
 
 static CYTHON_INLINE signed PY_LONG_LONG __Pyx_PyInt_AsSignedLongLong(PyObject *);
 
+static int __Pyx_SetVtable(PyObject *dict, void *vtable); /*proto*/
+
 static void __Pyx_AddTraceback(const char *funcname); /*proto*/
 
 static int __Pyx_InitStrings(__Pyx_StringTabEntry *t); /*proto*/
-/* Module declarations from lib.intbitset */
-
-static PyTypeObject *__pyx_ptype_3lib_9intbitset_intbitset = 0;
-static PyTypeObject *__pyx_ptype_3lib_9intbitset_intbitset_iterator = 0;
-#define __Pyx_MODULE_NAME "lib.intbitset"
-static int __pyx_module_is_main_lib__intbitset = 0;
-
-/* Implementation of lib.intbitset */
+/* Module declarations from intbitset */
+
+static PyTypeObject *__pyx_ptype_9intbitset_intbitset = 0;
+static PyTypeObject *__pyx_ptype_9intbitset_intbitset_iterator = 0;
+static PyTypeObject *__pyx_ptype_9intbitset_intbitset_file = 0;
+static int __pyx_f_9intbitset__is_immutable_buffer(PyObject *); /*proto*/
+static IntBitSet **__pyx_f_9intbitset__get_bitsets(PyObject *); /*proto*/
+#define __Pyx_MODULE_NAME "intbitset"
+static int __pyx_module_is_main_intbitset = 0;
+
+/* Implementation of intbitset */
+static PyObject *__pyx_builtin_buffer;
+static PyObject *__pyx_builtin_bytearray;
+static PyObject *__pyx_builtin_NameError;
 static PyObject *__pyx_builtin_ValueError;
 static PyObject *__pyx_builtin_Exception;
 static PyObject *__pyx_builtin_max;
@@ -548,143 +614,194 @@ static PyObject *__pyx_builtin_AttributeError;
 static PyObject *__pyx_builtin_IndexError;
 static PyObject *__pyx_builtin_StopIteration;
 static PyObject *__pyx_builtin_MemoryError;
+static PyObject *__pyx_builtin_open;
+static PyObject *__pyx_builtin_EnvironmentError;
 static char __pyx_k_2[] = "rhs can't be negative";
 static char __pyx_k_4[] = "Buffer error!!!";
-static char __pyx_k_6[] = "rhs is corrupted: %s";
-static char __pyx_k_7[] = "Can't store integers bigger than %s";
-static char __pyx_k_8[] = "Negative numbers, not allowed";
-static char __pyx_k_10[] = "Elements must be <= %s";
-static char __pyx_k_14[] = "retrieving integers from rhs is impossible: %s";
-static char __pyx_k_15[] = "rhs is of unknown type %s";
-static char __pyx_k_17[] = "Element must be <= %s";
-static char __pyx_k_18[] = "cannot compare intbitset using cmp()";
-static char __pyx_k_21[] = "rhs must be <= %s";
-static char __pyx_k_27[] = "intbitset(%s, trailing_bits=True)";
-static char __pyx_k_28[] = "intbitset(%s)";
-static char __pyx_k_30[] = "intbitset([";
-static char __pyx_k_31[] = "%i, ";
-static char __pyx_k_32[] = "...])";
-static char __pyx_k_34[] = "..., ";
-static char __pyx_k_35[] = "])";
-static char __pyx_k_36[] = "It's impossible to iterate over an infinite set.";
-static char __pyx_k_40[] = "strdump is corrupted";
-static char __pyx_k_42[] = "pop from an empty intbitset";
-static char __pyx_k_45[] = "It's impossible to print an infinite set.";
-static char __pyx_k_47[] = "";
-static char __pyx_k_49[] = "Elements must <= %s";
-static char __pyx_k_50[] = "rhs should be a valid dictionary with integers keys and integer values";
-static char __pyx_k_52[] = "It's impossible to retrieve a negative item from an infinite set.";
-static char __pyx_k_54[] = "Index must be <= %s";
-static char __pyx_k_55[] = "intbitset index out of range";
-static char __pyx_k_57[] = "It's impossible to retrieve a sublist using negative indices from an infinite set.";
-static char __pyx_k_59[] = "Indexes must be <= %s";
-static char __pyx_k_60[] = "up_to must be <= %s";
-static char __pyx_k_61[] = "It's impossible to retrieve a list of an infinite set";
-static char __pyx_k_63[] = "CFG_INTBITSET_ENABLE_SANITY_CHECKS";
-static char __pyx_k_64[] = "$Id$";
-static char __pyx_k_65[] = "invenio.config";
+static char __pyx_k_6[] = "Corrupted container dump";
+static char __pyx_k_9[] = "rhs is corrupted: %s";
+static char __pyx_k_10[] = "Can't store integers bigger than %s";
+static char __pyx_k_11[] = "Negative numbers, not allowed";
+static char __pyx_k_13[] = "Elements must be <= %s";
+static char __pyx_k_17[] = "retrieving integers from rhs is impossible: %s";
+static char __pyx_k_18[] = "rhs is of unknown type %s";
+static char __pyx_k_20[] = "Element must be <= %s";
+static char __pyx_k_21[] = "cannot compare intbitset using cmp()";
+static char __pyx_k_24[] = "rhs must be <= %s";
+static char __pyx_k_30[] = "intbitset(%s, trailing_bits=True)";
+static char __pyx_k_31[] = "intbitset(%s)";
+static char __pyx_k_33[] = "intbitset([";
+static char __pyx_k_34[] = "%i, ";
+static char __pyx_k_35[] = "...])";
+static char __pyx_k_37[] = "..., ";
+static char __pyx_k_38[] = "])";
+static char __pyx_k_39[] = "It's impossible to iterate over an infinite set.";
+static char __pyx_k_43[] = "strdump is corrupted";
+static char __pyx_k_45[] = "pop from an empty intbitset";
+static char __pyx_k_48[] = "It's impossible to print an infinite set.";
+static char __pyx_k_50[] = "";
+static char __pyx_k_52[] = "Elements must <= %s";
+static char __pyx_k_53[] = "rhs should be a valid dictionary with integers keys and integer values";
+static char __pyx_k_55[] = "It's impossible to retrieve a negative item from an infinite set.";
+static char __pyx_k_57[] = "Index must be <= %s";
+static char __pyx_k_58[] = "intbitset index out of range";
+static char __pyx_k_60[] = "It's impossible to retrieve a sublist using negative indices from an infinite set.";
+static char __pyx_k_62[] = "Indexes must be <= %s";
+static char __pyx_k_64[] = "up_to must be <= %s";
+static char __pyx_k_65[] = "It's impossible to retrieve a list of an infinite set";
+static char __pyx_k_67[] = "CFG_INTBITSET_ENABLE_SANITY_CHECKS";
+static char __pyx_k_68[] = "Cannot map %s";
+static char __pyx_k_69[] = "%s bytes at offset %s are out of the file";
+static char __pyx_k_70[] = "rhs is corrupted: Corrupted container dump";
+static char __pyx_k_72[] = "intbitset expected, got %s";
+static char __pyx_k_73[] = "It's impossible to count the elements of an infinite set";
+static char __pyx_k_75[] = "%s weights given for %s sets";
+static char __pyx_k_76[] = "$Id$";
+static char __pyx_k_77[] = "invenio.config";
 static char __pyx_k__0[] = "0";
 static char __pyx_k__1[] = "1";
 static char __pyx_k__i[] = "i";
 static char __pyx_k__j[] = "j";
+static char __pyx_k__os[] = "os";
+static char __pyx_k__rb[] = "rb";
 static char __pyx_k__max[] = "max";
 static char __pyx_k__rhs[] = "rhs";
 static char __pyx_k__sys[] = "sys";
+static char __pyx_k__data[] = "data";
+static char __pyx_k__dump[] = "dump";
 static char __pyx_k__join[] = "join";
 static char __pyx_k__last[] = "last";
+static char __pyx_k__mmap[] = "mmap";
+static char __pyx_k__open[] = "open";
+static char __pyx_k__path[] = "path";
+static char __pyx_k__read[] = "read";
+static char __pyx_k__sets[] = "sets";
 static char __pyx_k__size[] = "size";
 static char __pyx_k__zlib[] = "zlib";
 static char __pyx_k__Error[] = "Error";
 static char __pyx_k__array[] = "array";
+static char __pyx_k__close[] = "close";
+static char __pyx_k__fstat[] = "fstat";
 static char __pyx_k__up_to[] = "up_to";
 static char __pyx_k____ge__[] = "__ge__";
 static char __pyx_k____le__[] = "__le__";
 static char __pyx_k____or__[] = "__or__";
 static char __pyx_k__append[] = "append";
+static char __pyx_k__b_base[] = "b_base";
 static char __pyx_k__bitset[] = "bitset";
+static char __pyx_k__buffer[] = "buffer";
+static char __pyx_k__fileno[] = "fileno";
+static char __pyx_k__islice[] = "islice";
+static char __pyx_k__length[] = "length";
+static char __pyx_k__offset[] = "offset";
 static char __pyx_k____all__[] = "__all__";
 static char __pyx_k____and__[] = "__and__";
 static char __pyx_k____ior__[] = "__ior__";
 static char __pyx_k____sub__[] = "__sub__";
 static char __pyx_k____xor__[] = "__xor__";
+static char __pyx_k__st_size[] = "st_size";
+static char __pyx_k__weights[] = "weights";
 static char __pyx_k__KeyError[] = "KeyError";
 static char __pyx_k____iand__[] = "__iand__";
 static char __pyx_k____isub__[] = "__isub__";
 static char __pyx_k____iter__[] = "__iter__";
 static char __pyx_k____ixor__[] = "__ixor__";
 static char __pyx_k____main__[] = "__main__";
+static char __pyx_k____name__[] = "__name__";
 static char __pyx_k____repr__[] = "__repr__";
 static char __pyx_k____test__[] = "__test__";
 static char __pyx_k__compress[] = "compress";
 static char __pyx_k__tostring[] = "tostring";
 static char __pyx_k__Exception[] = "Exception";
+static char __pyx_k__NameError[] = "NameError";
 static char __pyx_k__TypeError[] = "TypeError";
 static char __pyx_k__allocated[] = "allocated";
+static char __pyx_k__bytearray[] = "bytearray";
 static char __pyx_k__intbitset[] = "intbitset";
 static char __pyx_k__iteritems[] = "iteritems";
+static char __pyx_k__itertools[] = "itertools";
 static char __pyx_k__IndexError[] = "IndexError";
 static char __pyx_k__ValueError[] = "ValueError";
+static char __pyx_k__containers[] = "containers";
+static char __pyx_k__count_many[] = "count_many";
 static char __pyx_k__decompress[] = "decompress";
+static char __pyx_k__union_many[] = "union_many";
 static char __pyx_k__MemoryError[] = "MemoryError";
+static char __pyx_k___MANY_BATCH[] = "_MANY_BATCH";
 static char __pyx_k____maxelem__[] = "__maxelem__";
 static char __pyx_k__no_allocate[] = "no_allocate";
 static char __pyx_k__preallocate[] = "preallocate";
 static char __pyx_k____apilevel__[] = "__apilevel__";
 static char __pyx_k____revision__[] = "__revision__";
+static char __pyx_k___check_range[] = "_check_range";
 static char __pyx_k__OverflowError[] = "OverflowError";
 static char __pyx_k__StopIteration[] = "StopIteration";
+static char __pyx_k___buffer_types[] = "_buffer_types";
 static char __pyx_k__sanity_checks[] = "sanity_checks";
 static char __pyx_k__trailing_bits[] = "trailing_bits";
 static char __pyx_k__AttributeError[] = "AttributeError";
+static char __pyx_k__intbitset_file[] = "intbitset_file";
 static char __pyx_k__to_sorted_list[] = "to_sorted_list";
+static char __pyx_k__EnvironmentError[] = "EnvironmentError";
+static char __pyx_k__intersection_many[] = "intersection_many";
 static char __pyx_k__extract_finite_list[] = "extract_finite_list";
 static PyObject *__pyx_kp_s_10;
-static PyObject *__pyx_kp_s_14;
-static PyObject *__pyx_kp_s_15;
+static PyObject *__pyx_kp_s_11;
+static PyObject *__pyx_kp_s_13;
 static PyObject *__pyx_kp_s_17;
 static PyObject *__pyx_kp_s_18;
 static PyObject *__pyx_kp_s_2;
+static PyObject *__pyx_kp_s_20;
 static PyObject *__pyx_kp_s_21;
-static PyObject *__pyx_kp_s_27;
-static PyObject *__pyx_kp_s_28;
+static PyObject *__pyx_kp_s_24;
 static PyObject *__pyx_kp_s_30;
 static PyObject *__pyx_kp_s_31;
-static PyObject *__pyx_kp_s_32;
+static PyObject *__pyx_kp_s_33;
 static PyObject *__pyx_kp_s_34;
 static PyObject *__pyx_kp_s_35;
-static PyObject *__pyx_kp_s_36;
+static PyObject *__pyx_kp_s_37;
+static PyObject *__pyx_kp_s_38;
+static PyObject *__pyx_kp_s_39;
 static PyObject *__pyx_kp_s_4;
-static PyObject *__pyx_kp_s_40;
-static PyObject *__pyx_kp_s_42;
+static PyObject *__pyx_kp_s_43;
 static PyObject *__pyx_kp_s_45;
-static PyObject *__pyx_kp_s_47;
-static PyObject *__pyx_kp_s_49;
+static PyObject *__pyx_kp_s_48;
 static PyObject *__pyx_kp_s_50;
 static PyObject *__pyx_kp_s_52;
-static PyObject *__pyx_kp_s_54;
+static PyObject *__pyx_kp_s_53;
 static PyObject *__pyx_kp_s_55;
 static PyObject *__pyx_kp_s_57;
-static PyObject *__pyx_kp_s_59;
+static PyObject *__pyx_kp_s_58;
 static PyObject *__pyx_kp_s_6;
 static PyObject *__pyx_kp_s_60;
-static PyObject *__pyx_kp_s_61;
-static PyObject *__pyx_n_s_63;
+static PyObject *__pyx_kp_s_62;
 static PyObject *__pyx_kp_s_64;
-static PyObject *__pyx_n_s_65;
-static PyObject *__pyx_kp_s_7;
-static PyObject *__pyx_kp_s_8;
+static PyObject *__pyx_kp_s_65;
+static PyObject *__pyx_n_s_67;
+static PyObject *__pyx_kp_s_68;
+static PyObject *__pyx_kp_s_69;
+static PyObject *__pyx_kp_s_70;
+static PyObject *__pyx_kp_s_72;
+static PyObject *__pyx_kp_s_73;
+static PyObject *__pyx_kp_s_75;
+static PyObject *__pyx_kp_s_76;
+static PyObject *__pyx_n_s_77;
+static PyObject *__pyx_kp_s_9;
 static PyObject *__pyx_kp_s__0;
 static PyObject *__pyx_kp_s__1;
 static PyObject *__pyx_n_s__AttributeError;
+static PyObject *__pyx_n_s__EnvironmentError;
 static PyObject *__pyx_n_s__Error;
 static PyObject *__pyx_n_s__Exception;
 static PyObject *__pyx_n_s__IndexError;
 static PyObject *__pyx_n_s__KeyError;
 static PyObject *__pyx_n_s__MemoryError;
+static PyObject *__pyx_n_s__NameError;
 static PyObject *__pyx_n_s__OverflowError;
 static PyObject *__pyx_n_s__StopIteration;
 static PyObject *__pyx_n_s__TypeError;
 static PyObject *__pyx_n_s__ValueError;
+static PyObject *__pyx_n_s___MANY_BATCH;
 static PyObject *__pyx_n_s____all__;
 static PyObject *__pyx_n_s____and__;
 static PyObject *__pyx_n_s____apilevel__;
@@ -697,82 +814,220 @@ static PyObject *__pyx_n_s____ixor__;
 static PyObject *__pyx_n_s____le__;
 static PyObject *__pyx_n_s____main__;
 static PyObject *__pyx_n_s____maxelem__;
+static PyObject *__pyx_n_s____name__;
 static PyObject *__pyx_n_s____or__;
 static PyObject *__pyx_n_s____repr__;
 static PyObject *__pyx_n_s____revision__;
 static PyObject *__pyx_n_s____sub__;
 static PyObject *__pyx_n_s____test__;
 static PyObject *__pyx_n_s____xor__;
+static PyObject *__pyx_n_s___buffer_types;
+static PyObject *__pyx_n_s___check_range;
 static PyObject *__pyx_n_s__allocated;
 static PyObject *__pyx_n_s__append;
 static PyObject *__pyx_n_s__array;
+static PyObject *__pyx_n_s__b_base;
 static PyObject *__pyx_n_s__bitset;
+static PyObject *__pyx_n_s__buffer;
+static PyObject *__pyx_n_s__bytearray;
+static PyObject *__pyx_n_s__close;
 static PyObject *__pyx_n_s__compress;
+static PyObject *__pyx_n_s__containers;
+static PyObject *__pyx_n_s__count_many;
+static PyObject *__pyx_n_s__data;
 static PyObject *__pyx_n_s__decompress;
+static PyObject *__pyx_n_s__dump;
 static PyObject *__pyx_n_s__extract_finite_list;
+static PyObject *__pyx_n_s__fileno;
+static PyObject *__pyx_n_s__fstat;
 static PyObject *__pyx_n_s__i;
 static PyObject *__pyx_n_s__intbitset;
+static PyObject *__pyx_n_s__intbitset_file;
+static PyObject *__pyx_n_s__intersection_many;
+static PyObject *__pyx_n_s__islice;
 static PyObject *__pyx_n_s__iteritems;
+static PyObject *__pyx_n_s__itertools;
 static PyObject *__pyx_n_s__j;
 static PyObject *__pyx_n_s__join;
 static PyObject *__pyx_n_s__last;
+static PyObject *__pyx_n_s__length;
 static PyObject *__pyx_n_s__max;
+static PyObject *__pyx_n_s__mmap;
 static PyObject *__pyx_n_s__no_allocate;
+static PyObject *__pyx_n_s__offset;
+static PyObject *__pyx_n_s__open;
+static PyObject *__pyx_n_s__os;
+static PyObject *__pyx_n_s__path;
 static PyObject *__pyx_n_s__preallocate;
+static PyObject *__pyx_n_s__rb;
+static PyObject *__pyx_n_s__read;
 static PyObject *__pyx_n_s__rhs;
 static PyObject *__pyx_n_s__sanity_checks;
+static PyObject *__pyx_n_s__sets;
 static PyObject *__pyx_n_s__size;
+static PyObject *__pyx_n_s__st_size;
 static PyObject *__pyx_n_s__sys;
 static PyObject *__pyx_n_s__to_sorted_list;
 static PyObject *__pyx_n_s__tostring;
 static PyObject *__pyx_n_s__trailing_bits;
+static PyObject *__pyx_n_s__union_many;
 static PyObject *__pyx_n_s__up_to;
+static PyObject *__pyx_n_s__weights;
 static PyObject *__pyx_n_s__zlib;
 static PyObject *__pyx_int_0;
 static PyObject *__pyx_int_1;
 static PyObject *__pyx_int_5;
 static PyObject *__pyx_int_10;
+static PyObject *__pyx_int_64;
 static int __pyx_k_1;
 static PyObject *__pyx_k_tuple_3;
 static PyObject *__pyx_k_tuple_5;
-static PyObject *__pyx_k_tuple_9;
-static PyObject *__pyx_k_tuple_11;
+static PyObject *__pyx_k_tuple_7;
+static PyObject *__pyx_k_tuple_8;
 static PyObject *__pyx_k_tuple_12;
-static PyObject *__pyx_k_tuple_13;
+static PyObject *__pyx_k_tuple_14;
+static PyObject *__pyx_k_tuple_15;
 static PyObject *__pyx_k_tuple_16;
 static PyObject *__pyx_k_tuple_19;
-static PyObject *__pyx_k_tuple_20;
 static PyObject *__pyx_k_tuple_22;
 static PyObject *__pyx_k_tuple_23;
-static PyObject *__pyx_k_tuple_24;
 static PyObject *__pyx_k_tuple_25;
 static PyObject *__pyx_k_tuple_26;
+static PyObject *__pyx_k_tuple_27;
+static PyObject *__pyx_k_tuple_28;
 static PyObject *__pyx_k_tuple_29;
-static PyObject *__pyx_k_tuple_33;
-static PyObject *__pyx_k_tuple_37;
-static PyObject *__pyx_k_tuple_38;
-static PyObject *__pyx_k_tuple_39;
+static PyObject *__pyx_k_tuple_32;
+static PyObject *__pyx_k_tuple_36;
+static PyObject *__pyx_k_tuple_40;
 static PyObject *__pyx_k_tuple_41;
-static PyObject *__pyx_k_tuple_43;
+static PyObject *__pyx_k_tuple_42;
 static PyObject *__pyx_k_tuple_44;
 static PyObject *__pyx_k_tuple_46;
-static PyObject *__pyx_k_tuple_48;
+static PyObject *__pyx_k_tuple_47;
+static PyObject *__pyx_k_tuple_49;
 static PyObject *__pyx_k_tuple_51;
-static PyObject *__pyx_k_tuple_53;
+static PyObject *__pyx_k_tuple_54;
 static PyObject *__pyx_k_tuple_56;
-static PyObject *__pyx_k_tuple_58;
-static PyObject *__pyx_k_tuple_62;
+static PyObject *__pyx_k_tuple_59;
+static PyObject *__pyx_k_tuple_61;
+static PyObject *__pyx_k_tuple_63;
+static PyObject *__pyx_k_tuple_66;
+static PyObject *__pyx_k_tuple_71;
+static PyObject *__pyx_k_tuple_74;
+
+/* "intbitset.pyx":134
+ * __maxelem__ = maxelem
+ * 
+ * cdef bint _is_immutable_buffer(rhs) except -1:             # <<<<<<<<<<<<<<
+ *     """Return whether the memory of the buffer object rhs can neither
+ *     change nor go away while rhs is alive, so that containers can be
+ */
 
-/* "lib/intbitset.pyx":136
- *     cdef bint sanity_checks
+static  int __pyx_f_9intbitset__is_immutable_buffer(PyObject *__pyx_v_rhs) {
+  void *__pyx_v_base;
+  int __pyx_r;
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  __Pyx_RefNannySetupContext("_is_immutable_buffer");
+
+  /* "intbitset.pyx":139
+ *     loaded from it without copying them."""
+ *     cdef void *base
+ *     if type(rhs) is str:             # <<<<<<<<<<<<<<
+ *         return True
+ *     if type(rhs) is buffer:
+ */
+  __pyx_t_1 = (((PyObject *)Py_TYPE(__pyx_v_rhs)) == ((PyObject *)((PyObject*)(&PyString_Type))));
+  if (__pyx_t_1) {
+
+    /* "intbitset.pyx":140
+ *     cdef void *base
+ *     if type(rhs) is str:
+ *         return True             # <<<<<<<<<<<<<<
+ *     if type(rhs) is buffer:
+ *         # a buffer reads the memory of its base object when accessed
+ */
+    __pyx_r = 1;
+    goto __pyx_L0;
+    goto __pyx_L3;
+  }
+  __pyx_L3:;
+
+  /* "intbitset.pyx":141
+ *     if type(rhs) is str:
+ *         return True
+ *     if type(rhs) is buffer:             # <<<<<<<<<<<<<<
+ *         # a buffer reads the memory of its base object when accessed
+ *         base = (<IntBitSetBufferObject *> <void *> rhs).b_base
+ */
+  __pyx_t_1 = (((PyObject *)Py_TYPE(__pyx_v_rhs)) == __pyx_builtin_buffer);
+  if (__pyx_t_1) {
+
+    /* "intbitset.pyx":143
+ *     if type(rhs) is buffer:
+ *         # a buffer reads the memory of its base object when accessed
+ *         base = (<IntBitSetBufferObject *> <void *> rhs).b_base             # <<<<<<<<<<<<<<
+ *         return base != NULL and _is_immutable_buffer(<object> base)
+ *     # a bytearray can be resized, an mmap, even a read-only one, closed
+ */
+    __pyx_v_base = ((IntBitSetBufferObject *)((void *)__pyx_v_rhs))->b_base;
+
+    /* "intbitset.pyx":144
+ *         # a buffer reads the memory of its base object when accessed
+ *         base = (<IntBitSetBufferObject *> <void *> rhs).b_base
+ *         return base != NULL and _is_immutable_buffer(<object> base)             # <<<<<<<<<<<<<<
+ *     # a bytearray can be resized, an mmap, even a read-only one, closed
+ *     return False
+ */
+    __pyx_t_1 = (__pyx_v_base != NULL);
+    if (__pyx_t_1) {
+      __pyx_t_2 = ((PyObject *)__pyx_v_base);
+      __Pyx_INCREF(__pyx_t_2);
+      __pyx_t_3 = __pyx_f_9intbitset__is_immutable_buffer(__pyx_t_2); if (unlikely(__pyx_t_3 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 144; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __pyx_t_4 = __pyx_t_3;
+    } else {
+      __pyx_t_4 = __pyx_t_1;
+    }
+    __pyx_r = __pyx_t_4;
+    goto __pyx_L0;
+    goto __pyx_L4;
+  }
+  __pyx_L4:;
+
+  /* "intbitset.pyx":146
+ *         return base != NULL and _is_immutable_buffer(<object> base)
+ *     # a bytearray can be resized, an mmap, even a read-only one, closed
+ *     return False             # <<<<<<<<<<<<<<
+ * 
+ * cdef class intbitset:
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("intbitset._is_immutable_buffer");
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "intbitset.pyx":205
+ *     cdef object dump
  * 
  *     def __cinit__(self, rhs=0, int preallocate=-1, int trailing_bits=0, bint sanity_checks=CFG_INTBITSET_ENABLE_SANITY_CHECKS, int no_allocate=0):             # <<<<<<<<<<<<<<
  *         """
  *         Initialize intbitset.
  */
 
-static int __pyx_pf_3lib_9intbitset_9intbitset___cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static int __pyx_pf_3lib_9intbitset_9intbitset___cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+static int __pyx_pf_9intbitset_9intbitset___cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static int __pyx_pf_9intbitset_9intbitset___cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   PyObject *__pyx_v_rhs = 0;
   int __pyx_v_preallocate;
   int __pyx_v_trailing_bits;
@@ -784,6 +1039,7 @@ static int __pyx_pf_3lib_9intbitset_9intbitset___cinit__(PyObject *__pyx_v_self,
   int __pyx_v_last;
   int __pyx_v_remelem;
   int __pyx_v_tuple_of_tuples;
+  int __pyx_v_borrow;
   PyObject *__pyx_v_msg;
   PyObject *__pyx_v_tmp;
   PyObject *__pyx_v_tmp_tuple;
@@ -841,26 +1097,26 @@ static int __pyx_pf_3lib_9intbitset_9intbitset___cinit__(PyObject *__pyx_v_self,
       }
     }
     if (unlikely(kw_args > 0)) {
-      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "__cinit__") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 136; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "__cinit__") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 205; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
     }
     __pyx_v_rhs = values[0];
     if (values[1]) {
-      __pyx_v_preallocate = __Pyx_PyInt_AsInt(values[1]); if (unlikely((__pyx_v_preallocate == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 136; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      __pyx_v_preallocate = __Pyx_PyInt_AsInt(values[1]); if (unlikely((__pyx_v_preallocate == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 205; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
     } else {
       __pyx_v_preallocate = ((int)-1);
     }
     if (values[2]) {
-      __pyx_v_trailing_bits = __Pyx_PyInt_AsInt(values[2]); if (unlikely((__pyx_v_trailing_bits == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 136; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      __pyx_v_trailing_bits = __Pyx_PyInt_AsInt(values[2]); if (unlikely((__pyx_v_trailing_bits == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 205; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
     } else {
       __pyx_v_trailing_bits = ((int)0);
     }
     if (values[3]) {
-      __pyx_v_sanity_checks = __Pyx_PyObject_IsTrue(values[3]); if (unlikely((__pyx_v_sanity_checks == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 136; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      __pyx_v_sanity_checks = __Pyx_PyObject_IsTrue(values[3]); if (unlikely((__pyx_v_sanity_checks == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 205; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
     } else {
       __pyx_v_sanity_checks = __pyx_k_1;
     }
     if (values[4]) {
-      __pyx_v_no_allocate = __Pyx_PyInt_AsInt(values[4]); if (unlikely((__pyx_v_no_allocate == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 136; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      __pyx_v_no_allocate = __Pyx_PyInt_AsInt(values[4]); if (unlikely((__pyx_v_no_allocate == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 205; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
     } else {
       __pyx_v_no_allocate = ((int)0);
     }
@@ -871,10 +1127,10 @@ static int __pyx_pf_3lib_9intbitset_9intbitset___cinit__(PyObject *__pyx_v_self,
     __pyx_v_sanity_checks = __pyx_k_1;
     __pyx_v_no_allocate = ((int)0);
     switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  5: __pyx_v_no_allocate = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 4)); if (unlikely((__pyx_v_no_allocate == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 136; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      case  4: __pyx_v_sanity_checks = __Pyx_PyObject_IsTrue(PyTuple_GET_ITEM(__pyx_args, 3)); if (unlikely((__pyx_v_sanity_checks == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 136; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      case  3: __pyx_v_trailing_bits = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 2)); if (unlikely((__pyx_v_trailing_bits == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 136; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      case  2: __pyx_v_preallocate = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 1)); if (unlikely((__pyx_v_preallocate == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 136; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      case  5: __pyx_v_no_allocate = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 4)); if (unlikely((__pyx_v_no_allocate == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 205; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      case  4: __pyx_v_sanity_checks = __Pyx_PyObject_IsTrue(PyTuple_GET_ITEM(__pyx_args, 3)); if (unlikely((__pyx_v_sanity_checks == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 205; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      case  3: __pyx_v_trailing_bits = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 2)); if (unlikely((__pyx_v_trailing_bits == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 205; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      case  2: __pyx_v_preallocate = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 1)); if (unlikely((__pyx_v_preallocate == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 205; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       case  1: __pyx_v_rhs = PyTuple_GET_ITEM(__pyx_args, 0);
       case  0: break;
       default: goto __pyx_L5_argtuple_error;
@@ -882,9 +1138,9 @@ static int __pyx_pf_3lib_9intbitset_9intbitset___cinit__(PyObject *__pyx_v_self,
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__cinit__", 0, 0, 5, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 136; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __Pyx_RaiseArgtupleInvalid("__cinit__", 0, 0, 5, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 205; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   __pyx_L3_error:;
-  __Pyx_AddTraceback("lib.intbitset.intbitset.__cinit__");
+  __Pyx_AddTraceback("intbitset.intbitset.__cinit__");
   __Pyx_RefNannyFinishContext();
   return -1;
   __pyx_L4_argument_unpacking_done:;
@@ -893,16 +1149,16 @@ static int __pyx_pf_3lib_9intbitset_9intbitset___cinit__(PyObject *__pyx_v_self,
   __pyx_v_tmp = Py_None; __Pyx_INCREF(Py_None);
   __pyx_v_tmp_tuple = Py_None; __Pyx_INCREF(Py_None);
 
-  /* "lib/intbitset.pyx":163
- *         cdef int remelem
+  /* "intbitset.pyx":235
  *         cdef bint tuple_of_tuples
+ *         cdef bint borrow
  *         self.sanity_checks = sanity_checks             # <<<<<<<<<<<<<<
  *         #print >> sys.stderr, "intbitset.__cinit__ is called"
  *         msg = "Error"
  */
-  ((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->sanity_checks = __pyx_v_sanity_checks;
+  ((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->sanity_checks = __pyx_v_sanity_checks;
 
-  /* "lib/intbitset.pyx":165
+  /* "intbitset.pyx":237
  *         self.sanity_checks = sanity_checks
  *         #print >> sys.stderr, "intbitset.__cinit__ is called"
  *         msg = "Error"             # <<<<<<<<<<<<<<
@@ -913,16 +1169,16 @@ static int __pyx_pf_3lib_9intbitset_9intbitset___cinit__(PyObject *__pyx_v_self,
   __Pyx_DECREF(__pyx_v_msg);
   __pyx_v_msg = ((PyObject *)__pyx_n_s__Error);
 
-  /* "lib/intbitset.pyx":166
+  /* "intbitset.pyx":238
  *         #print >> sys.stderr, "intbitset.__cinit__ is called"
  *         msg = "Error"
  *         self.bitset = NULL             # <<<<<<<<<<<<<<
  *         try:
  *             if no_allocate:
  */
-  ((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->bitset = NULL;
+  ((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->bitset = NULL;
 
-  /* "lib/intbitset.pyx":167
+  /* "intbitset.pyx":239
  *         msg = "Error"
  *         self.bitset = NULL
  *         try:             # <<<<<<<<<<<<<<
@@ -937,7 +1193,7 @@ static int __pyx_pf_3lib_9intbitset_9intbitset___cinit__(PyObject *__pyx_v_self,
     __Pyx_XGOTREF(__pyx_save_exc_tb);
     /*try:*/ {
 
-      /* "lib/intbitset.pyx":168
+      /* "intbitset.pyx":240
  *         self.bitset = NULL
  *         try:
  *             if no_allocate:             # <<<<<<<<<<<<<<
@@ -946,7 +1202,7 @@ static int __pyx_pf_3lib_9intbitset_9intbitset___cinit__(PyObject *__pyx_v_self,
  */
       if (__pyx_v_no_allocate) {
 
-        /* "lib/intbitset.pyx":169
+        /* "intbitset.pyx":241
  *         try:
  *             if no_allocate:
  *                 return             # <<<<<<<<<<<<<<
@@ -959,7 +1215,7 @@ static int __pyx_pf_3lib_9intbitset_9intbitset___cinit__(PyObject *__pyx_v_self,
       }
       __pyx_L14:;
 
-      /* "lib/intbitset.pyx":170
+      /* "intbitset.pyx":242
  *             if no_allocate:
  *                 return
  *             if type(rhs) in (int, long):             # <<<<<<<<<<<<<<
@@ -968,121 +1224,101 @@ static int __pyx_pf_3lib_9intbitset_9intbitset___cinit__(PyObject *__pyx_v_self,
  */
       __Pyx_INCREF(((PyObject *)Py_TYPE(__pyx_v_rhs)));
       __pyx_t_1 = ((PyObject *)Py_TYPE(__pyx_v_rhs));
-      __pyx_t_2 = PyObject_RichCompare(((PyObject *)__pyx_t_1), ((PyObject *)((PyObject*)(&PyInt_Type))), Py_EQ); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 170; __pyx_clineno = __LINE__; goto __pyx_L6_error;}
+      __pyx_t_2 = PyObject_RichCompare(((PyObject *)__pyx_t_1), ((PyObject *)((PyObject*)(&PyInt_Type))), Py_EQ); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 242; __pyx_clineno = __LINE__; goto __pyx_L6_error;}
       __Pyx_GOTREF(__pyx_t_2);
-      __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely((__pyx_t_3 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 170; __pyx_clineno = __LINE__; goto __pyx_L6_error;}
+      __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely((__pyx_t_3 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 242; __pyx_clineno = __LINE__; goto __pyx_L6_error;}
       __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __pyx_t_4 = __pyx_t_3;
-      if (!__pyx_t_4) {
-        __pyx_t_2 = PyObject_RichCompare(((PyObject *)__pyx_t_1), ((PyObject *)((PyObject*)(&PyLong_Type))), Py_EQ); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 170; __pyx_clineno = __LINE__; goto __pyx_L6_error;}
+      if (!__pyx_t_3) {
+        __pyx_t_2 = PyObject_RichCompare(((PyObject *)__pyx_t_1), ((PyObject *)((PyObject*)(&PyLong_Type))), Py_EQ); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 242; __pyx_clineno = __LINE__; goto __pyx_L6_error;}
         __Pyx_GOTREF(__pyx_t_2);
-        __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely((__pyx_t_3 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 170; __pyx_clineno = __LINE__; goto __pyx_L6_error;}
+        __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely((__pyx_t_4 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 242; __pyx_clineno = __LINE__; goto __pyx_L6_error;}
         __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-        __pyx_t_5 = __pyx_t_3;
-        __pyx_t_3 = __pyx_t_5;
+        __pyx_t_5 = __pyx_t_4;
       } else {
-        __pyx_t_3 = __pyx_t_4;
+        __pyx_t_5 = __pyx_t_3;
       }
       __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      __pyx_t_4 = __pyx_t_3;
-      if (__pyx_t_4) {
+      __pyx_t_3 = __pyx_t_5;
+      if (__pyx_t_3) {
 
-        /* "lib/intbitset.pyx":171
+        /* "intbitset.pyx":243
  *                 return
  *             if type(rhs) in (int, long):
  *                 if rhs < 0:             # <<<<<<<<<<<<<<
  *                     raise ValueError("rhs can't be negative")
  *                 self.bitset = intBitSetCreate(rhs, trailing_bits)
  */
-        __pyx_t_1 = PyObject_RichCompare(__pyx_v_rhs, __pyx_int_0, Py_LT); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 171; __pyx_clineno = __LINE__; goto __pyx_L6_error;}
+        __pyx_t_1 = PyObject_RichCompare(__pyx_v_rhs, __pyx_int_0, Py_LT); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 243; __pyx_clineno = __LINE__; goto __pyx_L6_error;}
         __Pyx_GOTREF(__pyx_t_1);
-        __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_4 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 171; __pyx_clineno = __LINE__; goto __pyx_L6_error;}
+        __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_3 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 243; __pyx_clineno = __LINE__; goto __pyx_L6_error;}
         __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-        if (__pyx_t_4) {
+        if (__pyx_t_3) {
 
-          /* "lib/intbitset.pyx":172
+          /* "intbitset.pyx":244
  *             if type(rhs) in (int, long):
  *                 if rhs < 0:
  *                     raise ValueError("rhs can't be negative")             # <<<<<<<<<<<<<<
  *                 self.bitset = intBitSetCreate(rhs, trailing_bits)
  *             elif type(rhs) is intbitset:
  */
-          __pyx_t_1 = PyObject_Call(__pyx_builtin_ValueError, ((PyObject *)__pyx_k_tuple_3), NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 172; __pyx_clineno = __LINE__; goto __pyx_L6_error;}
+          __pyx_t_1 = PyObject_Call(__pyx_builtin_ValueError, ((PyObject *)__pyx_k_tuple_3), NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 244; __pyx_clineno = __LINE__; goto __pyx_L6_error;}
           __Pyx_GOTREF(__pyx_t_1);
           __Pyx_Raise(__pyx_t_1, 0, 0);
           __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-          {__pyx_filename = __pyx_f[0]; __pyx_lineno = 172; __pyx_clineno = __LINE__; goto __pyx_L6_error;}
+          {__pyx_filename = __pyx_f[0]; __pyx_lineno = 244; __pyx_clineno = __LINE__; goto __pyx_L6_error;}
           goto __pyx_L16;
         }
         __pyx_L16:;
 
-        /* "lib/intbitset.pyx":173
+        /* "intbitset.pyx":245
  *                 if rhs < 0:
  *                     raise ValueError("rhs can't be negative")
  *                 self.bitset = intBitSetCreate(rhs, trailing_bits)             # <<<<<<<<<<<<<<
  *             elif type(rhs) is intbitset:
  *                 self.bitset = intBitSetClone((<intbitset>rhs).bitset)
  */
-        __pyx_t_6 = __Pyx_PyInt_AsInt(__pyx_v_rhs); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 173; __pyx_clineno = __LINE__; goto __pyx_L6_error;}
-        ((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->bitset = intBitSetCreate(__pyx_t_6, __pyx_v_trailing_bits);
+        __pyx_t_6 = __Pyx_PyInt_AsInt(__pyx_v_rhs); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 245; __pyx_clineno = __LINE__; goto __pyx_L6_error;}
+        ((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->bitset = intBitSetCreate(__pyx_t_6, __pyx_v_trailing_bits);
         goto __pyx_L15;
       }
 
-      /* "lib/intbitset.pyx":174
+      /* "intbitset.pyx":246
  *                     raise ValueError("rhs can't be negative")
  *                 self.bitset = intBitSetCreate(rhs, trailing_bits)
  *             elif type(rhs) is intbitset:             # <<<<<<<<<<<<<<
  *                 self.bitset = intBitSetClone((<intbitset>rhs).bitset)
- *             elif type(rhs) in (str, array):
+ *             elif type(rhs) in _buffer_types:
  */
-      __pyx_t_4 = (((PyObject *)Py_TYPE(__pyx_v_rhs)) == ((PyObject *)((PyObject*)__pyx_ptype_3lib_9intbitset_intbitset)));
-      if (__pyx_t_4) {
+      __pyx_t_3 = (((PyObject *)Py_TYPE(__pyx_v_rhs)) == ((PyObject *)((PyObject*)__pyx_ptype_9intbitset_intbitset)));
+      if (__pyx_t_3) {
 
-        /* "lib/intbitset.pyx":175
+        /* "intbitset.pyx":247
  *                 self.bitset = intBitSetCreate(rhs, trailing_bits)
  *             elif type(rhs) is intbitset:
  *                 self.bitset = intBitSetClone((<intbitset>rhs).bitset)             # <<<<<<<<<<<<<<
- *             elif type(rhs) in (str, array):
+ *             elif type(rhs) in _buffer_types:
  *                 try:
  */
-        ((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->bitset = intBitSetClone(((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_rhs)->bitset);
+        ((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->bitset = intBitSetClone(((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_rhs)->bitset);
         goto __pyx_L15;
       }
 
-      /* "lib/intbitset.pyx":176
+      /* "intbitset.pyx":248
  *             elif type(rhs) is intbitset:
  *                 self.bitset = intBitSetClone((<intbitset>rhs).bitset)
- *             elif type(rhs) in (str, array):             # <<<<<<<<<<<<<<
+ *             elif type(rhs) in _buffer_types:             # <<<<<<<<<<<<<<
  *                 try:
  *                     if type(rhs) is array:
  */
-      __Pyx_INCREF(((PyObject *)Py_TYPE(__pyx_v_rhs)));
-      __pyx_t_1 = ((PyObject *)Py_TYPE(__pyx_v_rhs));
-      __pyx_t_2 = PyObject_RichCompare(((PyObject *)__pyx_t_1), ((PyObject *)((PyObject*)(&PyString_Type))), Py_EQ); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 176; __pyx_clineno = __LINE__; goto __pyx_L6_error;}
-      __Pyx_GOTREF(__pyx_t_2);
-      __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely((__pyx_t_4 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 176; __pyx_clineno = __LINE__; goto __pyx_L6_error;}
-      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __pyx_t_3 = __pyx_t_4;
-      if (!__pyx_t_3) {
-        __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s__array); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 176; __pyx_clineno = __LINE__; goto __pyx_L6_error;}
-        __Pyx_GOTREF(__pyx_t_2);
-        __pyx_t_7 = PyObject_RichCompare(((PyObject *)__pyx_t_1), __pyx_t_2, Py_EQ); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 176; __pyx_clineno = __LINE__; goto __pyx_L6_error;}
-        __Pyx_GOTREF(__pyx_t_7);
-        __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-        __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_t_7); if (unlikely((__pyx_t_4 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 176; __pyx_clineno = __LINE__; goto __pyx_L6_error;}
-        __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-        __pyx_t_5 = __pyx_t_4;
-        __pyx_t_4 = __pyx_t_5;
-      } else {
-        __pyx_t_4 = __pyx_t_3;
-      }
+      __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s___buffer_types); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 248; __pyx_clineno = __LINE__; goto __pyx_L6_error;}
+      __Pyx_GOTREF(__pyx_t_1);
+      __pyx_t_3 = ((PySequence_Contains(__pyx_t_1, ((PyObject *)Py_TYPE(__pyx_v_rhs))))); if (unlikely(__pyx_t_3 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 248; __pyx_clineno = __LINE__; goto __pyx_L6_error;}
       __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      __pyx_t_3 = __pyx_t_4;
       if (__pyx_t_3) {
 
-        /* "lib/intbitset.pyx":177
+        /* "intbitset.pyx":249
  *                 self.bitset = intBitSetClone((<intbitset>rhs).bitset)
- *             elif type(rhs) in (str, array):
+ *             elif type(rhs) in _buffer_types:
  *                 try:             # <<<<<<<<<<<<<<
  *                     if type(rhs) is array:
  *                         rhs = rhs.tostring()
@@ -1095,127 +1331,244 @@ static int __pyx_pf_3lib_9intbitset_9intbitset___cinit__(PyObject *__pyx_v_self,
           __Pyx_XGOTREF(__pyx_save_exc_tb);
           /*try:*/ {
 
-            /* "lib/intbitset.pyx":178
- *             elif type(rhs) in (str, array):
+            /* "intbitset.pyx":250
+ *             elif type(rhs) in _buffer_types:
  *                 try:
  *                     if type(rhs) is array:             # <<<<<<<<<<<<<<
  *                         rhs = rhs.tostring()
- *                     tmp = zlib.decompress(rhs)
+ *                     if PyObject_AsReadBuffer(rhs, &buf, &size) < 0:
  */
-            __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__array); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 178; __pyx_clineno = __LINE__; goto __pyx_L17_error;}
+            __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__array); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 250; __pyx_clineno = __LINE__; goto __pyx_L17_error;}
             __Pyx_GOTREF(__pyx_t_1);
             __pyx_t_3 = (((PyObject *)Py_TYPE(__pyx_v_rhs)) == __pyx_t_1);
             __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
             if (__pyx_t_3) {
 
-              /* "lib/intbitset.pyx":179
+              /* "intbitset.pyx":251
  *                 try:
  *                     if type(rhs) is array:
  *                         rhs = rhs.tostring()             # <<<<<<<<<<<<<<
- *                     tmp = zlib.decompress(rhs)
- *                     if PyObject_AsReadBuffer(tmp, &buf, &size) < 0:
+ *                     if PyObject_AsReadBuffer(rhs, &buf, &size) < 0:
+ *                         raise Exception("Buffer error!!!")
  */
-              __pyx_t_1 = PyObject_GetAttr(__pyx_v_rhs, __pyx_n_s__tostring); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 179; __pyx_clineno = __LINE__; goto __pyx_L17_error;}
+              __pyx_t_1 = PyObject_GetAttr(__pyx_v_rhs, __pyx_n_s__tostring); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 251; __pyx_clineno = __LINE__; goto __pyx_L17_error;}
               __Pyx_GOTREF(__pyx_t_1);
-              __pyx_t_7 = PyObject_Call(__pyx_t_1, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 179; __pyx_clineno = __LINE__; goto __pyx_L17_error;}
-              __Pyx_GOTREF(__pyx_t_7);
+              __pyx_t_2 = PyObject_Call(__pyx_t_1, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 251; __pyx_clineno = __LINE__; goto __pyx_L17_error;}
+              __Pyx_GOTREF(__pyx_t_2);
               __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
               __Pyx_DECREF(__pyx_v_rhs);
-              __pyx_v_rhs = __pyx_t_7;
-              __pyx_t_7 = 0;
+              __pyx_v_rhs = __pyx_t_2;
+              __pyx_t_2 = 0;
               goto __pyx_L25;
             }
             __pyx_L25:;
 
-            /* "lib/intbitset.pyx":180
+            /* "intbitset.pyx":252
  *                     if type(rhs) is array:
  *                         rhs = rhs.tostring()
- *                     tmp = zlib.decompress(rhs)             # <<<<<<<<<<<<<<
- *                     if PyObject_AsReadBuffer(tmp, &buf, &size) < 0:
- *                         raise Exception("Buffer error!!!")
- */
-            __pyx_t_7 = __Pyx_GetName(__pyx_m, __pyx_n_s__zlib); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 180; __pyx_clineno = __LINE__; goto __pyx_L17_error;}
-            __Pyx_GOTREF(__pyx_t_7);
-            __pyx_t_1 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__decompress); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 180; __pyx_clineno = __LINE__; goto __pyx_L17_error;}
-            __Pyx_GOTREF(__pyx_t_1);
-            __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-            __pyx_t_7 = PyTuple_New(1); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 180; __pyx_clineno = __LINE__; goto __pyx_L17_error;}
-            __Pyx_GOTREF(((PyObject *)__pyx_t_7));
-            __Pyx_INCREF(__pyx_v_rhs);
-            PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_v_rhs);
-            __Pyx_GIVEREF(__pyx_v_rhs);
-            __pyx_t_2 = PyObject_Call(__pyx_t_1, ((PyObject *)__pyx_t_7), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 180; __pyx_clineno = __LINE__; goto __pyx_L17_error;}
-            __Pyx_GOTREF(__pyx_t_2);
-            __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-            __Pyx_DECREF(((PyObject *)__pyx_t_7)); __pyx_t_7 = 0;
-            __Pyx_DECREF(__pyx_v_tmp);
-            __pyx_v_tmp = __pyx_t_2;
-            __pyx_t_2 = 0;
-
-            /* "lib/intbitset.pyx":181
- *                         rhs = rhs.tostring()
- *                     tmp = zlib.decompress(rhs)
- *                     if PyObject_AsReadBuffer(tmp, &buf, &size) < 0:             # <<<<<<<<<<<<<<
+ *                     if PyObject_AsReadBuffer(rhs, &buf, &size) < 0:             # <<<<<<<<<<<<<<
  *                         raise Exception("Buffer error!!!")
- *                     if (size % wordbytesize):
+ *                     if intBitSetIsContainerBuffer(buf, size):
  */
-            __pyx_t_3 = (PyObject_AsReadBuffer(__pyx_v_tmp, (&__pyx_v_buf), (&__pyx_v_size)) < 0);
+            __pyx_t_2 = __pyx_v_rhs;
+            __Pyx_INCREF(__pyx_t_2);
+            __pyx_t_3 = (PyObject_AsReadBuffer(__pyx_t_2, (&__pyx_v_buf), (&__pyx_v_size)) < 0);
+            __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
             if (__pyx_t_3) {
 
-              /* "lib/intbitset.pyx":182
- *                     tmp = zlib.decompress(rhs)
- *                     if PyObject_AsReadBuffer(tmp, &buf, &size) < 0:
+              /* "intbitset.pyx":253
+ *                         rhs = rhs.tostring()
+ *                     if PyObject_AsReadBuffer(rhs, &buf, &size) < 0:
  *                         raise Exception("Buffer error!!!")             # <<<<<<<<<<<<<<
- *                     if (size % wordbytesize):
- *                         ## Wrong size!
+ *                     if intBitSetIsContainerBuffer(buf, size):
+ *                         borrow = _is_immutable_buffer(rhs)
  */
-              __pyx_t_2 = PyObject_Call(__pyx_builtin_Exception, ((PyObject *)__pyx_k_tuple_5), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 182; __pyx_clineno = __LINE__; goto __pyx_L17_error;}
+              __pyx_t_2 = PyObject_Call(__pyx_builtin_Exception, ((PyObject *)__pyx_k_tuple_5), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 253; __pyx_clineno = __LINE__; goto __pyx_L17_error;}
               __Pyx_GOTREF(__pyx_t_2);
               __Pyx_Raise(__pyx_t_2, 0, 0);
               __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-              {__pyx_filename = __pyx_f[0]; __pyx_lineno = 182; __pyx_clineno = __LINE__; goto __pyx_L17_error;}
+              {__pyx_filename = __pyx_f[0]; __pyx_lineno = 253; __pyx_clineno = __LINE__; goto __pyx_L17_error;}
               goto __pyx_L26;
             }
             __pyx_L26:;
 
-            /* "lib/intbitset.pyx":183
- *                     if PyObject_AsReadBuffer(tmp, &buf, &size) < 0:
+            /* "intbitset.pyx":254
+ *                     if PyObject_AsReadBuffer(rhs, &buf, &size) < 0:
+ *                         raise Exception("Buffer error!!!")
+ *                     if intBitSetIsContainerBuffer(buf, size):             # <<<<<<<<<<<<<<
+ *                         borrow = _is_immutable_buffer(rhs)
+ *                         self.bitset = intBitSetCreateFromContainerBuffer(buf, size, borrow)
+ */
+            __pyx_t_3 = intBitSetIsContainerBuffer(__pyx_v_buf, __pyx_v_size);
+            if (__pyx_t_3) {
+
+              /* "intbitset.pyx":255
  *                         raise Exception("Buffer error!!!")
- *                     if (size % wordbytesize):             # <<<<<<<<<<<<<<
- *                         ## Wrong size!
- *                         raise Exception()
+ *                     if intBitSetIsContainerBuffer(buf, size):
+ *                         borrow = _is_immutable_buffer(rhs)             # <<<<<<<<<<<<<<
+ *                         self.bitset = intBitSetCreateFromContainerBuffer(buf, size, borrow)
+ *                         if self.bitset == NULL:
+ */
+              __pyx_t_2 = __pyx_v_rhs;
+              __Pyx_INCREF(__pyx_t_2);
+              __pyx_t_3 = __pyx_f_9intbitset__is_immutable_buffer(__pyx_t_2); if (unlikely(__pyx_t_3 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 255; __pyx_clineno = __LINE__; goto __pyx_L17_error;}
+              __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+              __pyx_v_borrow = __pyx_t_3;
+
+              /* "intbitset.pyx":256
+ *                     if intBitSetIsContainerBuffer(buf, size):
+ *                         borrow = _is_immutable_buffer(rhs)
+ *                         self.bitset = intBitSetCreateFromContainerBuffer(buf, size, borrow)             # <<<<<<<<<<<<<<
+ *                         if self.bitset == NULL:
+ *                             raise Exception("Corrupted container dump")
+ */
+              ((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->bitset = intBitSetCreateFromContainerBuffer(__pyx_v_buf, __pyx_v_size, __pyx_v_borrow);
+
+              /* "intbitset.pyx":257
+ *                         borrow = _is_immutable_buffer(rhs)
+ *                         self.bitset = intBitSetCreateFromContainerBuffer(buf, size, borrow)
+ *                         if self.bitset == NULL:             # <<<<<<<<<<<<<<
+ *                             raise Exception("Corrupted container dump")
+ *                         if borrow:
+ */
+              __pyx_t_3 = (((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->bitset == NULL);
+              if (__pyx_t_3) {
+
+                /* "intbitset.pyx":258
+ *                         self.bitset = intBitSetCreateFromContainerBuffer(buf, size, borrow)
+ *                         if self.bitset == NULL:
+ *                             raise Exception("Corrupted container dump")             # <<<<<<<<<<<<<<
+ *                         if borrow:
+ *                             self.dump = rhs
+ */
+                __pyx_t_2 = PyObject_Call(__pyx_builtin_Exception, ((PyObject *)__pyx_k_tuple_7), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 258; __pyx_clineno = __LINE__; goto __pyx_L17_error;}
+                __Pyx_GOTREF(__pyx_t_2);
+                __Pyx_Raise(__pyx_t_2, 0, 0);
+                __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+                {__pyx_filename = __pyx_f[0]; __pyx_lineno = 258; __pyx_clineno = __LINE__; goto __pyx_L17_error;}
+                goto __pyx_L28;
+              }
+              __pyx_L28:;
+
+              /* "intbitset.pyx":259
+ *                         if self.bitset == NULL:
+ *                             raise Exception("Corrupted container dump")
+ *                         if borrow:             # <<<<<<<<<<<<<<
+ *                             self.dump = rhs
+ *                     else:
+ */
+              if (__pyx_v_borrow) {
+
+                /* "intbitset.pyx":260
+ *                             raise Exception("Corrupted container dump")
+ *                         if borrow:
+ *                             self.dump = rhs             # <<<<<<<<<<<<<<
+ *                     else:
+ *                         tmp = zlib.decompress(rhs)
  */
-            if (unlikely(wordbytesize == 0)) {
-              PyErr_Format(PyExc_ZeroDivisionError, "integer division or modulo by zero");
-              {__pyx_filename = __pyx_f[0]; __pyx_lineno = 183; __pyx_clineno = __LINE__; goto __pyx_L17_error;}
+                __Pyx_INCREF(__pyx_v_rhs);
+                __Pyx_GIVEREF(__pyx_v_rhs);
+                __Pyx_GOTREF(((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->dump);
+                __Pyx_DECREF(((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->dump);
+                ((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->dump = __pyx_v_rhs;
+                goto __pyx_L29;
+              }
+              __pyx_L29:;
+              goto __pyx_L27;
             }
-            __pyx_t_8 = __Pyx_mod_Py_ssize_t(__pyx_v_size, wordbytesize);
-            if (__pyx_t_8) {
-
-              /* "lib/intbitset.pyx":185
- *                     if (size % wordbytesize):
- *                         ## Wrong size!
- *                         raise Exception()             # <<<<<<<<<<<<<<
- *                     self.bitset = intBitSetCreateFromBuffer(buf, size)
- *                 except Exception, msg:
+            /*else*/ {
+
+              /* "intbitset.pyx":262
+ *                             self.dump = rhs
+ *                     else:
+ *                         tmp = zlib.decompress(rhs)             # <<<<<<<<<<<<<<
+ *                         if PyObject_AsReadBuffer(tmp, &buf, &size) < 0:
+ *                             raise Exception("Buffer error!!!")
  */
-              __pyx_t_2 = PyObject_Call(__pyx_builtin_Exception, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 185; __pyx_clineno = __LINE__; goto __pyx_L17_error;}
+              __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s__zlib); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 262; __pyx_clineno = __LINE__; goto __pyx_L17_error;}
               __Pyx_GOTREF(__pyx_t_2);
-              __Pyx_Raise(__pyx_t_2, 0, 0);
+              __pyx_t_1 = PyObject_GetAttr(__pyx_t_2, __pyx_n_s__decompress); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 262; __pyx_clineno = __LINE__; goto __pyx_L17_error;}
+              __Pyx_GOTREF(__pyx_t_1);
               __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-              {__pyx_filename = __pyx_f[0]; __pyx_lineno = 185; __pyx_clineno = __LINE__; goto __pyx_L17_error;}
-              goto __pyx_L27;
-            }
-            __pyx_L27:;
+              __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 262; __pyx_clineno = __LINE__; goto __pyx_L17_error;}
+              __Pyx_GOTREF(((PyObject *)__pyx_t_2));
+              __Pyx_INCREF(__pyx_v_rhs);
+              PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v_rhs);
+              __Pyx_GIVEREF(__pyx_v_rhs);
+              __pyx_t_7 = PyObject_Call(__pyx_t_1, ((PyObject *)__pyx_t_2), NULL); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 262; __pyx_clineno = __LINE__; goto __pyx_L17_error;}
+              __Pyx_GOTREF(__pyx_t_7);
+              __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+              __Pyx_DECREF(((PyObject *)__pyx_t_2)); __pyx_t_2 = 0;
+              __Pyx_DECREF(__pyx_v_tmp);
+              __pyx_v_tmp = __pyx_t_7;
+              __pyx_t_7 = 0;
+
+              /* "intbitset.pyx":263
+ *                     else:
+ *                         tmp = zlib.decompress(rhs)
+ *                         if PyObject_AsReadBuffer(tmp, &buf, &size) < 0:             # <<<<<<<<<<<<<<
+ *                             raise Exception("Buffer error!!!")
+ *                         if (size % wordbytesize):
+ */
+              __pyx_t_3 = (PyObject_AsReadBuffer(__pyx_v_tmp, (&__pyx_v_buf), (&__pyx_v_size)) < 0);
+              if (__pyx_t_3) {
+
+                /* "intbitset.pyx":264
+ *                         tmp = zlib.decompress(rhs)
+ *                         if PyObject_AsReadBuffer(tmp, &buf, &size) < 0:
+ *                             raise Exception("Buffer error!!!")             # <<<<<<<<<<<<<<
+ *                         if (size % wordbytesize):
+ *                             ## Wrong size!
+ */
+                __pyx_t_7 = PyObject_Call(__pyx_builtin_Exception, ((PyObject *)__pyx_k_tuple_8), NULL); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 264; __pyx_clineno = __LINE__; goto __pyx_L17_error;}
+                __Pyx_GOTREF(__pyx_t_7);
+                __Pyx_Raise(__pyx_t_7, 0, 0);
+                __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+                {__pyx_filename = __pyx_f[0]; __pyx_lineno = 264; __pyx_clineno = __LINE__; goto __pyx_L17_error;}
+                goto __pyx_L30;
+              }
+              __pyx_L30:;
+
+              /* "intbitset.pyx":265
+ *                         if PyObject_AsReadBuffer(tmp, &buf, &size) < 0:
+ *                             raise Exception("Buffer error!!!")
+ *                         if (size % wordbytesize):             # <<<<<<<<<<<<<<
+ *                             ## Wrong size!
+ *                             raise Exception()
+ */
+              if (unlikely(wordbytesize == 0)) {
+                PyErr_Format(PyExc_ZeroDivisionError, "integer division or modulo by zero");
+                {__pyx_filename = __pyx_f[0]; __pyx_lineno = 265; __pyx_clineno = __LINE__; goto __pyx_L17_error;}
+              }
+              __pyx_t_8 = __Pyx_mod_Py_ssize_t(__pyx_v_size, wordbytesize);
+              if (__pyx_t_8) {
+
+                /* "intbitset.pyx":267
+ *                         if (size % wordbytesize):
+ *                             ## Wrong size!
+ *                             raise Exception()             # <<<<<<<<<<<<<<
+ *                         self.bitset = intBitSetCreateFromBuffer(buf, size)
+ *                 except Exception, msg:
+ */
+                __pyx_t_7 = PyObject_Call(__pyx_builtin_Exception, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 267; __pyx_clineno = __LINE__; goto __pyx_L17_error;}
+                __Pyx_GOTREF(__pyx_t_7);
+                __Pyx_Raise(__pyx_t_7, 0, 0);
+                __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+                {__pyx_filename = __pyx_f[0]; __pyx_lineno = 267; __pyx_clineno = __LINE__; goto __pyx_L17_error;}
+                goto __pyx_L31;
+              }
+              __pyx_L31:;
 
-            /* "lib/intbitset.pyx":186
- *                         ## Wrong size!
- *                         raise Exception()
- *                     self.bitset = intBitSetCreateFromBuffer(buf, size)             # <<<<<<<<<<<<<<
+              /* "intbitset.pyx":268
+ *                             ## Wrong size!
+ *                             raise Exception()
+ *                         self.bitset = intBitSetCreateFromBuffer(buf, size)             # <<<<<<<<<<<<<<
  *                 except Exception, msg:
  *                     raise ValueError("rhs is corrupted: %s" % msg)
  */
-            ((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->bitset = intBitSetCreateFromBuffer(__pyx_v_buf, __pyx_v_size);
+              ((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->bitset = intBitSetCreateFromBuffer(__pyx_v_buf, __pyx_v_size);
+            }
+            __pyx_L27:;
           }
           __Pyx_XDECREF(__pyx_save_exc_type); __pyx_save_exc_type = 0;
           __Pyx_XDECREF(__pyx_save_exc_value); __pyx_save_exc_value = 0;
@@ -1223,49 +1576,49 @@ static int __pyx_pf_3lib_9intbitset_9intbitset___cinit__(PyObject *__pyx_v_self,
           goto __pyx_L24_try_end;
           __pyx_L17_error:;
           __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
-          __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
           __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+          __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
 
-          /* "lib/intbitset.pyx":187
- *                         raise Exception()
- *                     self.bitset = intBitSetCreateFromBuffer(buf, size)
+          /* "intbitset.pyx":269
+ *                             raise Exception()
+ *                         self.bitset = intBitSetCreateFromBuffer(buf, size)
  *                 except Exception, msg:             # <<<<<<<<<<<<<<
  *                     raise ValueError("rhs is corrupted: %s" % msg)
  *             elif hasattr(rhs, '__iter__'):
  */
           __pyx_t_6 = PyErr_ExceptionMatches(__pyx_builtin_Exception);
           if (__pyx_t_6) {
-            __Pyx_AddTraceback("lib.intbitset.intbitset.__cinit__");
-            if (__Pyx_GetException(&__pyx_t_2, &__pyx_t_7, &__pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 187; __pyx_clineno = __LINE__; goto __pyx_L19_except_error;}
-            __Pyx_GOTREF(__pyx_t_2);
+            __Pyx_AddTraceback("intbitset.intbitset.__cinit__");
+            if (__Pyx_GetException(&__pyx_t_7, &__pyx_t_2, &__pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 269; __pyx_clineno = __LINE__; goto __pyx_L19_except_error;}
             __Pyx_GOTREF(__pyx_t_7);
+            __Pyx_GOTREF(__pyx_t_2);
             __Pyx_GOTREF(__pyx_t_1);
-            __Pyx_INCREF(__pyx_t_7);
+            __Pyx_INCREF(__pyx_t_2);
             __Pyx_DECREF(__pyx_v_msg);
-            __pyx_v_msg = __pyx_t_7;
+            __pyx_v_msg = __pyx_t_2;
 
-            /* "lib/intbitset.pyx":188
- *                     self.bitset = intBitSetCreateFromBuffer(buf, size)
+            /* "intbitset.pyx":270
+ *                         self.bitset = intBitSetCreateFromBuffer(buf, size)
  *                 except Exception, msg:
  *                     raise ValueError("rhs is corrupted: %s" % msg)             # <<<<<<<<<<<<<<
  *             elif hasattr(rhs, '__iter__'):
  *                 tuple_of_tuples = rhs and type(rhs[0]) is tuple
  */
-            __pyx_t_9 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_6), __pyx_v_msg); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 188; __pyx_clineno = __LINE__; goto __pyx_L19_except_error;}
+            __pyx_t_9 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_9), __pyx_v_msg); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 270; __pyx_clineno = __LINE__; goto __pyx_L19_except_error;}
             __Pyx_GOTREF(((PyObject *)__pyx_t_9));
-            __pyx_t_10 = PyTuple_New(1); if (unlikely(!__pyx_t_10)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 188; __pyx_clineno = __LINE__; goto __pyx_L19_except_error;}
+            __pyx_t_10 = PyTuple_New(1); if (unlikely(!__pyx_t_10)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 270; __pyx_clineno = __LINE__; goto __pyx_L19_except_error;}
             __Pyx_GOTREF(((PyObject *)__pyx_t_10));
             PyTuple_SET_ITEM(__pyx_t_10, 0, ((PyObject *)__pyx_t_9));
             __Pyx_GIVEREF(((PyObject *)__pyx_t_9));
             __pyx_t_9 = 0;
-            __pyx_t_9 = PyObject_Call(__pyx_builtin_ValueError, ((PyObject *)__pyx_t_10), NULL); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 188; __pyx_clineno = __LINE__; goto __pyx_L19_except_error;}
+            __pyx_t_9 = PyObject_Call(__pyx_builtin_ValueError, ((PyObject *)__pyx_t_10), NULL); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 270; __pyx_clineno = __LINE__; goto __pyx_L19_except_error;}
             __Pyx_GOTREF(__pyx_t_9);
             __Pyx_DECREF(((PyObject *)__pyx_t_10)); __pyx_t_10 = 0;
             __Pyx_Raise(__pyx_t_9, 0, 0);
             __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-            {__pyx_filename = __pyx_f[0]; __pyx_lineno = 188; __pyx_clineno = __LINE__; goto __pyx_L19_except_error;}
-            __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+            {__pyx_filename = __pyx_f[0]; __pyx_lineno = 270; __pyx_clineno = __LINE__; goto __pyx_L19_except_error;}
             __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+            __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
             __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
             goto __pyx_L18_exception_handled;
           }
@@ -1285,42 +1638,48 @@ static int __pyx_pf_3lib_9intbitset_9intbitset___cinit__(PyObject *__pyx_v_self,
         goto __pyx_L15;
       }
 
-      /* "lib/intbitset.pyx":189
+      /* "intbitset.pyx":271
  *                 except Exception, msg:
  *                     raise ValueError("rhs is corrupted: %s" % msg)
  *             elif hasattr(rhs, '__iter__'):             # <<<<<<<<<<<<<<
  *                 tuple_of_tuples = rhs and type(rhs[0]) is tuple
  *                 try:
  */
-      __pyx_t_3 = PyObject_HasAttr(__pyx_v_rhs, ((PyObject *)__pyx_n_s____iter__)); if (unlikely(__pyx_t_3 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 189; __pyx_clineno = __LINE__; goto __pyx_L6_error;}
+      __pyx_t_1 = __pyx_v_rhs;
+      __Pyx_INCREF(__pyx_t_1);
+      __pyx_t_2 = ((PyObject *)__pyx_n_s____iter__);
+      __Pyx_INCREF(__pyx_t_2);
+      __pyx_t_3 = PyObject_HasAttr(__pyx_t_1, __pyx_t_2); if (unlikely(__pyx_t_3 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 271; __pyx_clineno = __LINE__; goto __pyx_L6_error;}
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
       if (__pyx_t_3) {
 
-        /* "lib/intbitset.pyx":190
+        /* "intbitset.pyx":272
  *                     raise ValueError("rhs is corrupted: %s" % msg)
  *             elif hasattr(rhs, '__iter__'):
  *                 tuple_of_tuples = rhs and type(rhs[0]) is tuple             # <<<<<<<<<<<<<<
  *                 try:
  *                     if preallocate < 0:
  */
-        __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_v_rhs); if (unlikely(__pyx_t_3 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 190; __pyx_clineno = __LINE__; goto __pyx_L6_error;}
+        __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_v_rhs); if (unlikely(__pyx_t_3 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 272; __pyx_clineno = __LINE__; goto __pyx_L6_error;}
         if (__pyx_t_3) {
-          __pyx_t_1 = __Pyx_GetItemInt(__pyx_v_rhs, 0, sizeof(long), PyInt_FromLong); if (!__pyx_t_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 190; __pyx_clineno = __LINE__; goto __pyx_L6_error;}
-          __Pyx_GOTREF(__pyx_t_1);
-          __pyx_t_3 = (((PyObject *)Py_TYPE(__pyx_t_1)) == ((PyObject *)((PyObject*)(&PyTuple_Type))));
-          __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-          __pyx_t_1 = __Pyx_PyBool_FromLong(__pyx_t_3); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 190; __pyx_clineno = __LINE__; goto __pyx_L6_error;}
-          __Pyx_GOTREF(__pyx_t_1);
-          __pyx_t_7 = __pyx_t_1;
-          __pyx_t_1 = 0;
+          __pyx_t_2 = __Pyx_GetItemInt(__pyx_v_rhs, 0, sizeof(long), PyInt_FromLong); if (!__pyx_t_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 272; __pyx_clineno = __LINE__; goto __pyx_L6_error;}
+          __Pyx_GOTREF(__pyx_t_2);
+          __pyx_t_3 = (((PyObject *)Py_TYPE(__pyx_t_2)) == ((PyObject *)((PyObject*)(&PyTuple_Type))));
+          __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+          __pyx_t_2 = __Pyx_PyBool_FromLong(__pyx_t_3); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 272; __pyx_clineno = __LINE__; goto __pyx_L6_error;}
+          __Pyx_GOTREF(__pyx_t_2);
+          __pyx_t_1 = __pyx_t_2;
+          __pyx_t_2 = 0;
         } else {
           __Pyx_INCREF(__pyx_v_rhs);
-          __pyx_t_7 = __pyx_v_rhs;
+          __pyx_t_1 = __pyx_v_rhs;
         }
-        __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_7); if (unlikely((__pyx_t_3 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 190; __pyx_clineno = __LINE__; goto __pyx_L6_error;}
-        __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+        __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely((__pyx_t_3 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 272; __pyx_clineno = __LINE__; goto __pyx_L6_error;}
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
         __pyx_v_tuple_of_tuples = __pyx_t_3;
 
-        /* "lib/intbitset.pyx":191
+        /* "intbitset.pyx":273
  *             elif hasattr(rhs, '__iter__'):
  *                 tuple_of_tuples = rhs and type(rhs[0]) is tuple
  *                 try:             # <<<<<<<<<<<<<<
@@ -1335,7 +1694,7 @@ static int __pyx_pf_3lib_9intbitset_9intbitset___cinit__(PyObject *__pyx_v_self,
           __Pyx_XGOTREF(__pyx_save_exc_tb);
           /*try:*/ {
 
-            /* "lib/intbitset.pyx":192
+            /* "intbitset.pyx":274
  *                 tuple_of_tuples = rhs and type(rhs[0]) is tuple
  *                 try:
  *                     if preallocate < 0:             # <<<<<<<<<<<<<<
@@ -1345,48 +1704,48 @@ static int __pyx_pf_3lib_9intbitset_9intbitset___cinit__(PyObject *__pyx_v_self,
             __pyx_t_3 = (__pyx_v_preallocate < 0);
             if (__pyx_t_3) {
 
-              /* "lib/intbitset.pyx":193
+              /* "intbitset.pyx":275
  *                 try:
  *                     if preallocate < 0:
  *                         if rhs and type(rhs[0]) is int:             # <<<<<<<<<<<<<<
  *                             preallocate = max(rhs)
  *                         else:
  */
-              __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_v_rhs); if (unlikely(__pyx_t_3 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 193; __pyx_clineno = __LINE__; goto __pyx_L30_error;}
+              __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_v_rhs); if (unlikely(__pyx_t_3 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 275; __pyx_clineno = __LINE__; goto __pyx_L34_error;}
               if (__pyx_t_3) {
-                __pyx_t_7 = __Pyx_GetItemInt(__pyx_v_rhs, 0, sizeof(long), PyInt_FromLong); if (!__pyx_t_7) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 193; __pyx_clineno = __LINE__; goto __pyx_L30_error;}
-                __Pyx_GOTREF(__pyx_t_7);
-                __pyx_t_4 = (((PyObject *)Py_TYPE(__pyx_t_7)) == ((PyObject *)((PyObject*)(&PyInt_Type))));
-                __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-                __pyx_t_5 = __pyx_t_4;
+                __pyx_t_1 = __Pyx_GetItemInt(__pyx_v_rhs, 0, sizeof(long), PyInt_FromLong); if (!__pyx_t_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 275; __pyx_clineno = __LINE__; goto __pyx_L34_error;}
+                __Pyx_GOTREF(__pyx_t_1);
+                __pyx_t_5 = (((PyObject *)Py_TYPE(__pyx_t_1)) == ((PyObject *)((PyObject*)(&PyInt_Type))));
+                __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+                __pyx_t_4 = __pyx_t_5;
               } else {
-                __pyx_t_5 = __pyx_t_3;
+                __pyx_t_4 = __pyx_t_3;
               }
-              if (__pyx_t_5) {
+              if (__pyx_t_4) {
 
-                /* "lib/intbitset.pyx":194
+                /* "intbitset.pyx":276
  *                     if preallocate < 0:
  *                         if rhs and type(rhs[0]) is int:
  *                             preallocate = max(rhs)             # <<<<<<<<<<<<<<
  *                         else:
  *                             preallocate = 0
  */
-                __pyx_t_7 = PyTuple_New(1); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 194; __pyx_clineno = __LINE__; goto __pyx_L30_error;}
-                __Pyx_GOTREF(((PyObject *)__pyx_t_7));
+                __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 276; __pyx_clineno = __LINE__; goto __pyx_L34_error;}
+                __Pyx_GOTREF(((PyObject *)__pyx_t_1));
                 __Pyx_INCREF(__pyx_v_rhs);
-                PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_v_rhs);
+                PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_rhs);
                 __Pyx_GIVEREF(__pyx_v_rhs);
-                __pyx_t_1 = PyObject_Call(__pyx_builtin_max, ((PyObject *)__pyx_t_7), NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 194; __pyx_clineno = __LINE__; goto __pyx_L30_error;}
-                __Pyx_GOTREF(__pyx_t_1);
-                __Pyx_DECREF(((PyObject *)__pyx_t_7)); __pyx_t_7 = 0;
-                __pyx_t_6 = __Pyx_PyInt_AsInt(__pyx_t_1); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 194; __pyx_clineno = __LINE__; goto __pyx_L30_error;}
-                __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+                __pyx_t_2 = PyObject_Call(__pyx_builtin_max, ((PyObject *)__pyx_t_1), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 276; __pyx_clineno = __LINE__; goto __pyx_L34_error;}
+                __Pyx_GOTREF(__pyx_t_2);
+                __Pyx_DECREF(((PyObject *)__pyx_t_1)); __pyx_t_1 = 0;
+                __pyx_t_6 = __Pyx_PyInt_AsInt(__pyx_t_2); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 276; __pyx_clineno = __LINE__; goto __pyx_L34_error;}
+                __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
                 __pyx_v_preallocate = __pyx_t_6;
-                goto __pyx_L39;
+                goto __pyx_L43;
               }
               /*else*/ {
 
-                /* "lib/intbitset.pyx":196
+                /* "intbitset.pyx":278
  *                             preallocate = max(rhs)
  *                         else:
  *                             preallocate = 0             # <<<<<<<<<<<<<<
@@ -1395,74 +1754,74 @@ static int __pyx_pf_3lib_9intbitset_9intbitset___cinit__(PyObject *__pyx_v_self,
  */
                 __pyx_v_preallocate = 0;
               }
-              __pyx_L39:;
-              goto __pyx_L38;
+              __pyx_L43:;
+              goto __pyx_L42;
             }
-            __pyx_L38:;
+            __pyx_L42:;
 
-            /* "lib/intbitset.pyx":197
+            /* "intbitset.pyx":279
  *                         else:
  *                             preallocate = 0
  *                     if self.sanity_checks:             # <<<<<<<<<<<<<<
  *                         if not (0 <= preallocate < maxelem):
  *                             raise OverflowError("Can't store integers bigger than %s" % maxelem)
  */
-            if (((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->sanity_checks) {
+            if (((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->sanity_checks) {
 
-              /* "lib/intbitset.pyx":198
+              /* "intbitset.pyx":280
  *                             preallocate = 0
  *                     if self.sanity_checks:
  *                         if not (0 <= preallocate < maxelem):             # <<<<<<<<<<<<<<
  *                             raise OverflowError("Can't store integers bigger than %s" % maxelem)
  *                     self.bitset = intBitSetCreate(preallocate, trailing_bits)
  */
-              __pyx_t_5 = (0 <= __pyx_v_preallocate);
-              if (__pyx_t_5) {
-                __pyx_t_5 = (__pyx_v_preallocate < maxelem);
+              __pyx_t_4 = (0 <= __pyx_v_preallocate);
+              if (__pyx_t_4) {
+                __pyx_t_4 = (__pyx_v_preallocate < maxelem);
               }
-              __pyx_t_3 = (!__pyx_t_5);
+              __pyx_t_3 = (!__pyx_t_4);
               if (__pyx_t_3) {
 
-                /* "lib/intbitset.pyx":199
+                /* "intbitset.pyx":281
  *                     if self.sanity_checks:
  *                         if not (0 <= preallocate < maxelem):
  *                             raise OverflowError("Can't store integers bigger than %s" % maxelem)             # <<<<<<<<<<<<<<
  *                     self.bitset = intBitSetCreate(preallocate, trailing_bits)
  *                     if trailing_bits:
  */
-                __pyx_t_1 = PyInt_FromLong(maxelem); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 199; __pyx_clineno = __LINE__; goto __pyx_L30_error;}
+                __pyx_t_2 = PyInt_FromLong(maxelem); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 281; __pyx_clineno = __LINE__; goto __pyx_L34_error;}
+                __Pyx_GOTREF(__pyx_t_2);
+                __pyx_t_1 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_10), __pyx_t_2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 281; __pyx_clineno = __LINE__; goto __pyx_L34_error;}
+                __Pyx_GOTREF(((PyObject *)__pyx_t_1));
+                __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+                __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 281; __pyx_clineno = __LINE__; goto __pyx_L34_error;}
+                __Pyx_GOTREF(((PyObject *)__pyx_t_2));
+                PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_t_1));
+                __Pyx_GIVEREF(((PyObject *)__pyx_t_1));
+                __pyx_t_1 = 0;
+                __pyx_t_1 = PyObject_Call(__pyx_builtin_OverflowError, ((PyObject *)__pyx_t_2), NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 281; __pyx_clineno = __LINE__; goto __pyx_L34_error;}
                 __Pyx_GOTREF(__pyx_t_1);
-                __pyx_t_7 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_7), __pyx_t_1); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 199; __pyx_clineno = __LINE__; goto __pyx_L30_error;}
-                __Pyx_GOTREF(((PyObject *)__pyx_t_7));
+                __Pyx_DECREF(((PyObject *)__pyx_t_2)); __pyx_t_2 = 0;
+                __Pyx_Raise(__pyx_t_1, 0, 0);
                 __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-                __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 199; __pyx_clineno = __LINE__; goto __pyx_L30_error;}
-                __Pyx_GOTREF(((PyObject *)__pyx_t_1));
-                PyTuple_SET_ITEM(__pyx_t_1, 0, ((PyObject *)__pyx_t_7));
-                __Pyx_GIVEREF(((PyObject *)__pyx_t_7));
-                __pyx_t_7 = 0;
-                __pyx_t_7 = PyObject_Call(__pyx_builtin_OverflowError, ((PyObject *)__pyx_t_1), NULL); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 199; __pyx_clineno = __LINE__; goto __pyx_L30_error;}
-                __Pyx_GOTREF(__pyx_t_7);
-                __Pyx_DECREF(((PyObject *)__pyx_t_1)); __pyx_t_1 = 0;
-                __Pyx_Raise(__pyx_t_7, 0, 0);
-                __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-                {__pyx_filename = __pyx_f[0]; __pyx_lineno = 199; __pyx_clineno = __LINE__; goto __pyx_L30_error;}
-                goto __pyx_L41;
+                {__pyx_filename = __pyx_f[0]; __pyx_lineno = 281; __pyx_clineno = __LINE__; goto __pyx_L34_error;}
+                goto __pyx_L45;
               }
-              __pyx_L41:;
-              goto __pyx_L40;
+              __pyx_L45:;
+              goto __pyx_L44;
             }
-            __pyx_L40:;
+            __pyx_L44:;
 
-            /* "lib/intbitset.pyx":200
+            /* "intbitset.pyx":282
  *                         if not (0 <= preallocate < maxelem):
  *                             raise OverflowError("Can't store integers bigger than %s" % maxelem)
  *                     self.bitset = intBitSetCreate(preallocate, trailing_bits)             # <<<<<<<<<<<<<<
  *                     if trailing_bits:
  *                         last = 0
  */
-            ((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->bitset = intBitSetCreate(__pyx_v_preallocate, __pyx_v_trailing_bits);
+            ((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->bitset = intBitSetCreate(__pyx_v_preallocate, __pyx_v_trailing_bits);
 
-            /* "lib/intbitset.pyx":201
+            /* "intbitset.pyx":283
  *                             raise OverflowError("Can't store integers bigger than %s" % maxelem)
  *                     self.bitset = intBitSetCreate(preallocate, trailing_bits)
  *                     if trailing_bits:             # <<<<<<<<<<<<<<
@@ -1471,7 +1830,7 @@ static int __pyx_pf_3lib_9intbitset_9intbitset___cinit__(PyObject *__pyx_v_self,
  */
             if (__pyx_v_trailing_bits) {
 
-              /* "lib/intbitset.pyx":202
+              /* "intbitset.pyx":284
  *                     self.bitset = intBitSetCreate(preallocate, trailing_bits)
  *                     if trailing_bits:
  *                         last = 0             # <<<<<<<<<<<<<<
@@ -1480,16 +1839,16 @@ static int __pyx_pf_3lib_9intbitset_9intbitset___cinit__(PyObject *__pyx_v_self,
  */
               __pyx_v_last = 0;
 
-              /* "lib/intbitset.pyx":203
+              /* "intbitset.pyx":285
  *                     if trailing_bits:
  *                         last = 0
  *                         if self.sanity_checks:             # <<<<<<<<<<<<<<
  *                             if tuple_of_tuples:
  *                                 for tmp_tuple in rhs:
  */
-              if (((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->sanity_checks) {
+              if (((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->sanity_checks) {
 
-                /* "lib/intbitset.pyx":204
+                /* "intbitset.pyx":286
  *                         last = 0
  *                         if self.sanity_checks:
  *                             if tuple_of_tuples:             # <<<<<<<<<<<<<<
@@ -1498,7 +1857,7 @@ static int __pyx_pf_3lib_9intbitset_9intbitset___cinit__(PyObject *__pyx_v_self,
  */
                 if (__pyx_v_tuple_of_tuples) {
 
-                  /* "lib/intbitset.pyx":205
+                  /* "intbitset.pyx":287
  *                         if self.sanity_checks:
  *                             if tuple_of_tuples:
  *                                 for tmp_tuple in rhs:             # <<<<<<<<<<<<<<
@@ -1506,44 +1865,44 @@ static int __pyx_pf_3lib_9intbitset_9intbitset___cinit__(PyObject *__pyx_v_self,
  *                                     if elem < 0:
  */
                   if (PyList_CheckExact(__pyx_v_rhs) || PyTuple_CheckExact(__pyx_v_rhs)) {
-                    __pyx_t_8 = 0; __pyx_t_7 = __pyx_v_rhs; __Pyx_INCREF(__pyx_t_7);
+                    __pyx_t_8 = 0; __pyx_t_1 = __pyx_v_rhs; __Pyx_INCREF(__pyx_t_1);
                   } else {
-                    __pyx_t_8 = -1; __pyx_t_7 = PyObject_GetIter(__pyx_v_rhs); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 205; __pyx_clineno = __LINE__; goto __pyx_L30_error;}
-                    __Pyx_GOTREF(__pyx_t_7);
+                    __pyx_t_8 = -1; __pyx_t_1 = PyObject_GetIter(__pyx_v_rhs); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 287; __pyx_clineno = __LINE__; goto __pyx_L34_error;}
+                    __Pyx_GOTREF(__pyx_t_1);
                   }
                   for (;;) {
-                    if (likely(PyList_CheckExact(__pyx_t_7))) {
-                      if (__pyx_t_8 >= PyList_GET_SIZE(__pyx_t_7)) break;
-                      __pyx_t_1 = PyList_GET_ITEM(__pyx_t_7, __pyx_t_8); __Pyx_INCREF(__pyx_t_1); __pyx_t_8++;
-                    } else if (likely(PyTuple_CheckExact(__pyx_t_7))) {
-                      if (__pyx_t_8 >= PyTuple_GET_SIZE(__pyx_t_7)) break;
-                      __pyx_t_1 = PyTuple_GET_ITEM(__pyx_t_7, __pyx_t_8); __Pyx_INCREF(__pyx_t_1); __pyx_t_8++;
+                    if (likely(PyList_CheckExact(__pyx_t_1))) {
+                      if (__pyx_t_8 >= PyList_GET_SIZE(__pyx_t_1)) break;
+                      __pyx_t_2 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_8); __Pyx_INCREF(__pyx_t_2); __pyx_t_8++;
+                    } else if (likely(PyTuple_CheckExact(__pyx_t_1))) {
+                      if (__pyx_t_8 >= PyTuple_GET_SIZE(__pyx_t_1)) break;
+                      __pyx_t_2 = PyTuple_GET_ITEM(__pyx_t_1, __pyx_t_8); __Pyx_INCREF(__pyx_t_2); __pyx_t_8++;
                     } else {
-                      __pyx_t_1 = PyIter_Next(__pyx_t_7);
-                      if (!__pyx_t_1) {
-                        if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 205; __pyx_clineno = __LINE__; goto __pyx_L30_error;}
+                      __pyx_t_2 = PyIter_Next(__pyx_t_1);
+                      if (!__pyx_t_2) {
+                        if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 287; __pyx_clineno = __LINE__; goto __pyx_L34_error;}
                         break;
                       }
-                      __Pyx_GOTREF(__pyx_t_1);
+                      __Pyx_GOTREF(__pyx_t_2);
                     }
                     __Pyx_DECREF(__pyx_v_tmp_tuple);
-                    __pyx_v_tmp_tuple = __pyx_t_1;
-                    __pyx_t_1 = 0;
+                    __pyx_v_tmp_tuple = __pyx_t_2;
+                    __pyx_t_2 = 0;
 
-                    /* "lib/intbitset.pyx":206
+                    /* "intbitset.pyx":288
  *                             if tuple_of_tuples:
  *                                 for tmp_tuple in rhs:
  *                                     elem = tmp_tuple[0]             # <<<<<<<<<<<<<<
  *                                     if elem < 0:
  *                                         raise ValueError("Negative numbers, not allowed")
  */
-                    __pyx_t_1 = __Pyx_GetItemInt(__pyx_v_tmp_tuple, 0, sizeof(long), PyInt_FromLong); if (!__pyx_t_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 206; __pyx_clineno = __LINE__; goto __pyx_L30_error;}
-                    __Pyx_GOTREF(__pyx_t_1);
-                    __pyx_t_6 = __Pyx_PyInt_AsInt(__pyx_t_1); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 206; __pyx_clineno = __LINE__; goto __pyx_L30_error;}
-                    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+                    __pyx_t_2 = __Pyx_GetItemInt(__pyx_v_tmp_tuple, 0, sizeof(long), PyInt_FromLong); if (!__pyx_t_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 288; __pyx_clineno = __LINE__; goto __pyx_L34_error;}
+                    __Pyx_GOTREF(__pyx_t_2);
+                    __pyx_t_6 = __Pyx_PyInt_AsInt(__pyx_t_2); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 288; __pyx_clineno = __LINE__; goto __pyx_L34_error;}
+                    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
                     __pyx_v_elem = __pyx_t_6;
 
-                    /* "lib/intbitset.pyx":207
+                    /* "intbitset.pyx":289
  *                                 for tmp_tuple in rhs:
  *                                     elem = tmp_tuple[0]
  *                                     if elem < 0:             # <<<<<<<<<<<<<<
@@ -1553,22 +1912,22 @@ static int __pyx_pf_3lib_9intbitset_9intbitset___cinit__(PyObject *__pyx_v_self,
                     __pyx_t_3 = (__pyx_v_elem < 0);
                     if (__pyx_t_3) {
 
-                      /* "lib/intbitset.pyx":208
+                      /* "intbitset.pyx":290
  *                                     elem = tmp_tuple[0]
  *                                     if elem < 0:
  *                                         raise ValueError("Negative numbers, not allowed")             # <<<<<<<<<<<<<<
  *                                     elif elem > maxelem:
  *                                         raise OverflowError("Elements must be <= %s" % maxelem)
  */
-                      __pyx_t_1 = PyObject_Call(__pyx_builtin_ValueError, ((PyObject *)__pyx_k_tuple_9), NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 208; __pyx_clineno = __LINE__; goto __pyx_L30_error;}
-                      __Pyx_GOTREF(__pyx_t_1);
-                      __Pyx_Raise(__pyx_t_1, 0, 0);
-                      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-                      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 208; __pyx_clineno = __LINE__; goto __pyx_L30_error;}
-                      goto __pyx_L47;
+                      __pyx_t_2 = PyObject_Call(__pyx_builtin_ValueError, ((PyObject *)__pyx_k_tuple_12), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 290; __pyx_clineno = __LINE__; goto __pyx_L34_error;}
+                      __Pyx_GOTREF(__pyx_t_2);
+                      __Pyx_Raise(__pyx_t_2, 0, 0);
+                      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+                      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 290; __pyx_clineno = __LINE__; goto __pyx_L34_error;}
+                      goto __pyx_L51;
                     }
 
-                    /* "lib/intbitset.pyx":209
+                    /* "intbitset.pyx":291
  *                                     if elem < 0:
  *                                         raise ValueError("Negative numbers, not allowed")
  *                                     elif elem > maxelem:             # <<<<<<<<<<<<<<
@@ -1578,34 +1937,34 @@ static int __pyx_pf_3lib_9intbitset_9intbitset___cinit__(PyObject *__pyx_v_self,
                     __pyx_t_3 = (__pyx_v_elem > maxelem);
                     if (__pyx_t_3) {
 
-                      /* "lib/intbitset.pyx":210
+                      /* "intbitset.pyx":292
  *                                         raise ValueError("Negative numbers, not allowed")
  *                                     elif elem > maxelem:
  *                                         raise OverflowError("Elements must be <= %s" % maxelem)             # <<<<<<<<<<<<<<
  *                                     for remelem from last <= remelem < elem:
  *                                         intBitSetDelElem(self.bitset, remelem)
  */
-                      __pyx_t_1 = PyInt_FromLong(maxelem); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 210; __pyx_clineno = __LINE__; goto __pyx_L30_error;}
-                      __Pyx_GOTREF(__pyx_t_1);
-                      __pyx_t_2 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_10), __pyx_t_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 210; __pyx_clineno = __LINE__; goto __pyx_L30_error;}
-                      __Pyx_GOTREF(((PyObject *)__pyx_t_2));
-                      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-                      __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 210; __pyx_clineno = __LINE__; goto __pyx_L30_error;}
-                      __Pyx_GOTREF(((PyObject *)__pyx_t_1));
-                      PyTuple_SET_ITEM(__pyx_t_1, 0, ((PyObject *)__pyx_t_2));
-                      __Pyx_GIVEREF(((PyObject *)__pyx_t_2));
-                      __pyx_t_2 = 0;
-                      __pyx_t_2 = PyObject_Call(__pyx_builtin_OverflowError, ((PyObject *)__pyx_t_1), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 210; __pyx_clineno = __LINE__; goto __pyx_L30_error;}
+                      __pyx_t_2 = PyInt_FromLong(maxelem); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 292; __pyx_clineno = __LINE__; goto __pyx_L34_error;}
                       __Pyx_GOTREF(__pyx_t_2);
-                      __Pyx_DECREF(((PyObject *)__pyx_t_1)); __pyx_t_1 = 0;
-                      __Pyx_Raise(__pyx_t_2, 0, 0);
+                      __pyx_t_7 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_13), __pyx_t_2); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 292; __pyx_clineno = __LINE__; goto __pyx_L34_error;}
+                      __Pyx_GOTREF(((PyObject *)__pyx_t_7));
                       __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-                      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 210; __pyx_clineno = __LINE__; goto __pyx_L30_error;}
-                      goto __pyx_L47;
+                      __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 292; __pyx_clineno = __LINE__; goto __pyx_L34_error;}
+                      __Pyx_GOTREF(((PyObject *)__pyx_t_2));
+                      PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_t_7));
+                      __Pyx_GIVEREF(((PyObject *)__pyx_t_7));
+                      __pyx_t_7 = 0;
+                      __pyx_t_7 = PyObject_Call(__pyx_builtin_OverflowError, ((PyObject *)__pyx_t_2), NULL); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 292; __pyx_clineno = __LINE__; goto __pyx_L34_error;}
+                      __Pyx_GOTREF(__pyx_t_7);
+                      __Pyx_DECREF(((PyObject *)__pyx_t_2)); __pyx_t_2 = 0;
+                      __Pyx_Raise(__pyx_t_7, 0, 0);
+                      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+                      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 292; __pyx_clineno = __LINE__; goto __pyx_L34_error;}
+                      goto __pyx_L51;
                     }
-                    __pyx_L47:;
+                    __pyx_L51:;
 
-                    /* "lib/intbitset.pyx":211
+                    /* "intbitset.pyx":293
  *                                     elif elem > maxelem:
  *                                         raise OverflowError("Elements must be <= %s" % maxelem)
  *                                     for remelem from last <= remelem < elem:             # <<<<<<<<<<<<<<
@@ -1615,17 +1974,17 @@ static int __pyx_pf_3lib_9intbitset_9intbitset___cinit__(PyObject *__pyx_v_self,
                     __pyx_t_6 = __pyx_v_elem;
                     for (__pyx_v_remelem = __pyx_v_last; __pyx_v_remelem < __pyx_t_6; __pyx_v_remelem++) {
 
-                      /* "lib/intbitset.pyx":212
+                      /* "intbitset.pyx":294
  *                                         raise OverflowError("Elements must be <= %s" % maxelem)
  *                                     for remelem from last <= remelem < elem:
  *                                         intBitSetDelElem(self.bitset, remelem)             # <<<<<<<<<<<<<<
  *                                     last = elem + 1
  *                             else:
  */
-                      intBitSetDelElem(((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->bitset, __pyx_v_remelem);
+                      intBitSetDelElem(((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->bitset, __pyx_v_remelem);
                     }
 
-                    /* "lib/intbitset.pyx":213
+                    /* "intbitset.pyx":295
  *                                     for remelem from last <= remelem < elem:
  *                                         intBitSetDelElem(self.bitset, remelem)
  *                                     last = elem + 1             # <<<<<<<<<<<<<<
@@ -1634,12 +1993,12 @@ static int __pyx_pf_3lib_9intbitset_9intbitset___cinit__(PyObject *__pyx_v_self,
  */
                     __pyx_v_last = (__pyx_v_elem + 1);
                   }
-                  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-                  goto __pyx_L44;
+                  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+                  goto __pyx_L48;
                 }
                 /*else*/ {
 
-                  /* "lib/intbitset.pyx":215
+                  /* "intbitset.pyx":297
  *                                     last = elem + 1
  *                             else:
  *                                 for elem in rhs:             # <<<<<<<<<<<<<<
@@ -1647,31 +2006,31 @@ static int __pyx_pf_3lib_9intbitset_9intbitset___cinit__(PyObject *__pyx_v_self,
  *                                         raise ValueError("Negative numbers, not allowed")
  */
                   if (PyList_CheckExact(__pyx_v_rhs) || PyTuple_CheckExact(__pyx_v_rhs)) {
-                    __pyx_t_8 = 0; __pyx_t_7 = __pyx_v_rhs; __Pyx_INCREF(__pyx_t_7);
+                    __pyx_t_8 = 0; __pyx_t_1 = __pyx_v_rhs; __Pyx_INCREF(__pyx_t_1);
                   } else {
-                    __pyx_t_8 = -1; __pyx_t_7 = PyObject_GetIter(__pyx_v_rhs); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 215; __pyx_clineno = __LINE__; goto __pyx_L30_error;}
-                    __Pyx_GOTREF(__pyx_t_7);
+                    __pyx_t_8 = -1; __pyx_t_1 = PyObject_GetIter(__pyx_v_rhs); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 297; __pyx_clineno = __LINE__; goto __pyx_L34_error;}
+                    __Pyx_GOTREF(__pyx_t_1);
                   }
                   for (;;) {
-                    if (likely(PyList_CheckExact(__pyx_t_7))) {
-                      if (__pyx_t_8 >= PyList_GET_SIZE(__pyx_t_7)) break;
-                      __pyx_t_2 = PyList_GET_ITEM(__pyx_t_7, __pyx_t_8); __Pyx_INCREF(__pyx_t_2); __pyx_t_8++;
-                    } else if (likely(PyTuple_CheckExact(__pyx_t_7))) {
-                      if (__pyx_t_8 >= PyTuple_GET_SIZE(__pyx_t_7)) break;
-                      __pyx_t_2 = PyTuple_GET_ITEM(__pyx_t_7, __pyx_t_8); __Pyx_INCREF(__pyx_t_2); __pyx_t_8++;
+                    if (likely(PyList_CheckExact(__pyx_t_1))) {
+                      if (__pyx_t_8 >= PyList_GET_SIZE(__pyx_t_1)) break;
+                      __pyx_t_7 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_8); __Pyx_INCREF(__pyx_t_7); __pyx_t_8++;
+                    } else if (likely(PyTuple_CheckExact(__pyx_t_1))) {
+                      if (__pyx_t_8 >= PyTuple_GET_SIZE(__pyx_t_1)) break;
+                      __pyx_t_7 = PyTuple_GET_ITEM(__pyx_t_1, __pyx_t_8); __Pyx_INCREF(__pyx_t_7); __pyx_t_8++;
                     } else {
-                      __pyx_t_2 = PyIter_Next(__pyx_t_7);
-                      if (!__pyx_t_2) {
-                        if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 215; __pyx_clineno = __LINE__; goto __pyx_L30_error;}
+                      __pyx_t_7 = PyIter_Next(__pyx_t_1);
+                      if (!__pyx_t_7) {
+                        if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 297; __pyx_clineno = __LINE__; goto __pyx_L34_error;}
                         break;
                       }
-                      __Pyx_GOTREF(__pyx_t_2);
+                      __Pyx_GOTREF(__pyx_t_7);
                     }
-                    __pyx_t_6 = __Pyx_PyInt_AsInt(__pyx_t_2); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 215; __pyx_clineno = __LINE__; goto __pyx_L30_error;}
-                    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+                    __pyx_t_6 = __Pyx_PyInt_AsInt(__pyx_t_7); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 297; __pyx_clineno = __LINE__; goto __pyx_L34_error;}
+                    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
                     __pyx_v_elem = __pyx_t_6;
 
-                    /* "lib/intbitset.pyx":216
+                    /* "intbitset.pyx":298
  *                             else:
  *                                 for elem in rhs:
  *                                     if elem < 0:             # <<<<<<<<<<<<<<
@@ -1681,22 +2040,22 @@ static int __pyx_pf_3lib_9intbitset_9intbitset___cinit__(PyObject *__pyx_v_self,
                     __pyx_t_3 = (__pyx_v_elem < 0);
                     if (__pyx_t_3) {
 
-                      /* "lib/intbitset.pyx":217
+                      /* "intbitset.pyx":299
  *                                 for elem in rhs:
  *                                     if elem < 0:
  *                                         raise ValueError("Negative numbers, not allowed")             # <<<<<<<<<<<<<<
  *                                     elif elem > maxelem:
  *                                         raise OverflowError("Elements must be <= %s" % maxelem)
  */
-                      __pyx_t_2 = PyObject_Call(__pyx_builtin_ValueError, ((PyObject *)__pyx_k_tuple_11), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 217; __pyx_clineno = __LINE__; goto __pyx_L30_error;}
-                      __Pyx_GOTREF(__pyx_t_2);
-                      __Pyx_Raise(__pyx_t_2, 0, 0);
-                      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-                      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 217; __pyx_clineno = __LINE__; goto __pyx_L30_error;}
-                      goto __pyx_L52;
+                      __pyx_t_7 = PyObject_Call(__pyx_builtin_ValueError, ((PyObject *)__pyx_k_tuple_14), NULL); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 299; __pyx_clineno = __LINE__; goto __pyx_L34_error;}
+                      __Pyx_GOTREF(__pyx_t_7);
+                      __Pyx_Raise(__pyx_t_7, 0, 0);
+                      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+                      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 299; __pyx_clineno = __LINE__; goto __pyx_L34_error;}
+                      goto __pyx_L56;
                     }
 
-                    /* "lib/intbitset.pyx":218
+                    /* "intbitset.pyx":300
  *                                     if elem < 0:
  *                                         raise ValueError("Negative numbers, not allowed")
  *                                     elif elem > maxelem:             # <<<<<<<<<<<<<<
@@ -1706,34 +2065,34 @@ static int __pyx_pf_3lib_9intbitset_9intbitset___cinit__(PyObject *__pyx_v_self,
                     __pyx_t_3 = (__pyx_v_elem > maxelem);
                     if (__pyx_t_3) {
 
-                      /* "lib/intbitset.pyx":219
+                      /* "intbitset.pyx":301
  *                                         raise ValueError("Negative numbers, not allowed")
  *                                     elif elem > maxelem:
  *                                         raise OverflowError("Elements must be <= %s" % maxelem)             # <<<<<<<<<<<<<<
  *                                     for remelem from last <= remelem < elem:
  *                                         intBitSetDelElem(self.bitset, remelem)
  */
-                      __pyx_t_2 = PyInt_FromLong(maxelem); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 219; __pyx_clineno = __LINE__; goto __pyx_L30_error;}
+                      __pyx_t_7 = PyInt_FromLong(maxelem); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 301; __pyx_clineno = __LINE__; goto __pyx_L34_error;}
+                      __Pyx_GOTREF(__pyx_t_7);
+                      __pyx_t_2 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_13), __pyx_t_7); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 301; __pyx_clineno = __LINE__; goto __pyx_L34_error;}
+                      __Pyx_GOTREF(((PyObject *)__pyx_t_2));
+                      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+                      __pyx_t_7 = PyTuple_New(1); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 301; __pyx_clineno = __LINE__; goto __pyx_L34_error;}
+                      __Pyx_GOTREF(((PyObject *)__pyx_t_7));
+                      PyTuple_SET_ITEM(__pyx_t_7, 0, ((PyObject *)__pyx_t_2));
+                      __Pyx_GIVEREF(((PyObject *)__pyx_t_2));
+                      __pyx_t_2 = 0;
+                      __pyx_t_2 = PyObject_Call(__pyx_builtin_OverflowError, ((PyObject *)__pyx_t_7), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 301; __pyx_clineno = __LINE__; goto __pyx_L34_error;}
                       __Pyx_GOTREF(__pyx_t_2);
-                      __pyx_t_1 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_10), __pyx_t_2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 219; __pyx_clineno = __LINE__; goto __pyx_L30_error;}
-                      __Pyx_GOTREF(((PyObject *)__pyx_t_1));
+                      __Pyx_DECREF(((PyObject *)__pyx_t_7)); __pyx_t_7 = 0;
+                      __Pyx_Raise(__pyx_t_2, 0, 0);
                       __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-                      __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 219; __pyx_clineno = __LINE__; goto __pyx_L30_error;}
-                      __Pyx_GOTREF(((PyObject *)__pyx_t_2));
-                      PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_t_1));
-                      __Pyx_GIVEREF(((PyObject *)__pyx_t_1));
-                      __pyx_t_1 = 0;
-                      __pyx_t_1 = PyObject_Call(__pyx_builtin_OverflowError, ((PyObject *)__pyx_t_2), NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 219; __pyx_clineno = __LINE__; goto __pyx_L30_error;}
-                      __Pyx_GOTREF(__pyx_t_1);
-                      __Pyx_DECREF(((PyObject *)__pyx_t_2)); __pyx_t_2 = 0;
-                      __Pyx_Raise(__pyx_t_1, 0, 0);
-                      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-                      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 219; __pyx_clineno = __LINE__; goto __pyx_L30_error;}
-                      goto __pyx_L52;
+                      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 301; __pyx_clineno = __LINE__; goto __pyx_L34_error;}
+                      goto __pyx_L56;
                     }
-                    __pyx_L52:;
+                    __pyx_L56:;
 
-                    /* "lib/intbitset.pyx":220
+                    /* "intbitset.pyx":302
  *                                     elif elem > maxelem:
  *                                         raise OverflowError("Elements must be <= %s" % maxelem)
  *                                     for remelem from last <= remelem < elem:             # <<<<<<<<<<<<<<
@@ -1743,17 +2102,17 @@ static int __pyx_pf_3lib_9intbitset_9intbitset___cinit__(PyObject *__pyx_v_self,
                     __pyx_t_6 = __pyx_v_elem;
                     for (__pyx_v_remelem = __pyx_v_last; __pyx_v_remelem < __pyx_t_6; __pyx_v_remelem++) {
 
-                      /* "lib/intbitset.pyx":221
+                      /* "intbitset.pyx":303
  *                                         raise OverflowError("Elements must be <= %s" % maxelem)
  *                                     for remelem from last <= remelem < elem:
  *                                         intBitSetDelElem(self.bitset, remelem)             # <<<<<<<<<<<<<<
  *                                     last = elem + 1
  *                         else:
  */
-                      intBitSetDelElem(((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->bitset, __pyx_v_remelem);
+                      intBitSetDelElem(((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->bitset, __pyx_v_remelem);
                     }
 
-                    /* "lib/intbitset.pyx":222
+                    /* "intbitset.pyx":304
  *                                     for remelem from last <= remelem < elem:
  *                                         intBitSetDelElem(self.bitset, remelem)
  *                                     last = elem + 1             # <<<<<<<<<<<<<<
@@ -1762,14 +2121,14 @@ static int __pyx_pf_3lib_9intbitset_9intbitset___cinit__(PyObject *__pyx_v_self,
  */
                     __pyx_v_last = (__pyx_v_elem + 1);
                   }
-                  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+                  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
                 }
-                __pyx_L44:;
-                goto __pyx_L43;
+                __pyx_L48:;
+                goto __pyx_L47;
               }
               /*else*/ {
 
-                /* "lib/intbitset.pyx":224
+                /* "intbitset.pyx":306
  *                                     last = elem + 1
  *                         else:
  *                             if tuple_of_tuples:             # <<<<<<<<<<<<<<
@@ -1778,7 +2137,7 @@ static int __pyx_pf_3lib_9intbitset_9intbitset___cinit__(PyObject *__pyx_v_self,
  */
                 if (__pyx_v_tuple_of_tuples) {
 
-                  /* "lib/intbitset.pyx":225
+                  /* "intbitset.pyx":307
  *                         else:
  *                             if tuple_of_tuples:
  *                                 for tmp_tuple in rhs:             # <<<<<<<<<<<<<<
@@ -1786,44 +2145,44 @@ static int __pyx_pf_3lib_9intbitset_9intbitset___cinit__(PyObject *__pyx_v_self,
  *                                     for remelem from last <= remelem < elem:
  */
                   if (PyList_CheckExact(__pyx_v_rhs) || PyTuple_CheckExact(__pyx_v_rhs)) {
-                    __pyx_t_8 = 0; __pyx_t_7 = __pyx_v_rhs; __Pyx_INCREF(__pyx_t_7);
+                    __pyx_t_8 = 0; __pyx_t_1 = __pyx_v_rhs; __Pyx_INCREF(__pyx_t_1);
                   } else {
-                    __pyx_t_8 = -1; __pyx_t_7 = PyObject_GetIter(__pyx_v_rhs); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 225; __pyx_clineno = __LINE__; goto __pyx_L30_error;}
-                    __Pyx_GOTREF(__pyx_t_7);
+                    __pyx_t_8 = -1; __pyx_t_1 = PyObject_GetIter(__pyx_v_rhs); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 307; __pyx_clineno = __LINE__; goto __pyx_L34_error;}
+                    __Pyx_GOTREF(__pyx_t_1);
                   }
                   for (;;) {
-                    if (likely(PyList_CheckExact(__pyx_t_7))) {
-                      if (__pyx_t_8 >= PyList_GET_SIZE(__pyx_t_7)) break;
-                      __pyx_t_1 = PyList_GET_ITEM(__pyx_t_7, __pyx_t_8); __Pyx_INCREF(__pyx_t_1); __pyx_t_8++;
-                    } else if (likely(PyTuple_CheckExact(__pyx_t_7))) {
-                      if (__pyx_t_8 >= PyTuple_GET_SIZE(__pyx_t_7)) break;
-                      __pyx_t_1 = PyTuple_GET_ITEM(__pyx_t_7, __pyx_t_8); __Pyx_INCREF(__pyx_t_1); __pyx_t_8++;
+                    if (likely(PyList_CheckExact(__pyx_t_1))) {
+                      if (__pyx_t_8 >= PyList_GET_SIZE(__pyx_t_1)) break;
+                      __pyx_t_2 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_8); __Pyx_INCREF(__pyx_t_2); __pyx_t_8++;
+                    } else if (likely(PyTuple_CheckExact(__pyx_t_1))) {
+                      if (__pyx_t_8 >= PyTuple_GET_SIZE(__pyx_t_1)) break;
+                      __pyx_t_2 = PyTuple_GET_ITEM(__pyx_t_1, __pyx_t_8); __Pyx_INCREF(__pyx_t_2); __pyx_t_8++;
                     } else {
-                      __pyx_t_1 = PyIter_Next(__pyx_t_7);
-                      if (!__pyx_t_1) {
-                        if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 225; __pyx_clineno = __LINE__; goto __pyx_L30_error;}
+                      __pyx_t_2 = PyIter_Next(__pyx_t_1);
+                      if (!__pyx_t_2) {
+                        if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 307; __pyx_clineno = __LINE__; goto __pyx_L34_error;}
                         break;
                       }
-                      __Pyx_GOTREF(__pyx_t_1);
+                      __Pyx_GOTREF(__pyx_t_2);
                     }
                     __Pyx_DECREF(__pyx_v_tmp_tuple);
-                    __pyx_v_tmp_tuple = __pyx_t_1;
-                    __pyx_t_1 = 0;
+                    __pyx_v_tmp_tuple = __pyx_t_2;
+                    __pyx_t_2 = 0;
 
-                    /* "lib/intbitset.pyx":226
+                    /* "intbitset.pyx":308
  *                             if tuple_of_tuples:
  *                                 for tmp_tuple in rhs:
  *                                     elem = tmp_tuple[0]             # <<<<<<<<<<<<<<
  *                                     for remelem from last <= remelem < elem:
  *                                         intBitSetDelElem(self.bitset, remelem)
  */
-                    __pyx_t_1 = __Pyx_GetItemInt(__pyx_v_tmp_tuple, 0, sizeof(long), PyInt_FromLong); if (!__pyx_t_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 226; __pyx_clineno = __LINE__; goto __pyx_L30_error;}
-                    __Pyx_GOTREF(__pyx_t_1);
-                    __pyx_t_6 = __Pyx_PyInt_AsInt(__pyx_t_1); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 226; __pyx_clineno = __LINE__; goto __pyx_L30_error;}
-                    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+                    __pyx_t_2 = __Pyx_GetItemInt(__pyx_v_tmp_tuple, 0, sizeof(long), PyInt_FromLong); if (!__pyx_t_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 308; __pyx_clineno = __LINE__; goto __pyx_L34_error;}
+                    __Pyx_GOTREF(__pyx_t_2);
+                    __pyx_t_6 = __Pyx_PyInt_AsInt(__pyx_t_2); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 308; __pyx_clineno = __LINE__; goto __pyx_L34_error;}
+                    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
                     __pyx_v_elem = __pyx_t_6;
 
-                    /* "lib/intbitset.pyx":227
+                    /* "intbitset.pyx":309
  *                                 for tmp_tuple in rhs:
  *                                     elem = tmp_tuple[0]
  *                                     for remelem from last <= remelem < elem:             # <<<<<<<<<<<<<<
@@ -1833,17 +2192,17 @@ static int __pyx_pf_3lib_9intbitset_9intbitset___cinit__(PyObject *__pyx_v_self,
                     __pyx_t_6 = __pyx_v_elem;
                     for (__pyx_v_remelem = __pyx_v_last; __pyx_v_remelem < __pyx_t_6; __pyx_v_remelem++) {
 
-                      /* "lib/intbitset.pyx":228
+                      /* "intbitset.pyx":310
  *                                     elem = tmp_tuple[0]
  *                                     for remelem from last <= remelem < elem:
  *                                         intBitSetDelElem(self.bitset, remelem)             # <<<<<<<<<<<<<<
  *                                     last = elem + 1
  *                             else:
  */
-                      intBitSetDelElem(((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->bitset, __pyx_v_remelem);
+                      intBitSetDelElem(((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->bitset, __pyx_v_remelem);
                     }
 
-                    /* "lib/intbitset.pyx":229
+                    /* "intbitset.pyx":311
  *                                     for remelem from last <= remelem < elem:
  *                                         intBitSetDelElem(self.bitset, remelem)
  *                                     last = elem + 1             # <<<<<<<<<<<<<<
@@ -1852,12 +2211,12 @@ static int __pyx_pf_3lib_9intbitset_9intbitset___cinit__(PyObject *__pyx_v_self,
  */
                     __pyx_v_last = (__pyx_v_elem + 1);
                   }
-                  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-                  goto __pyx_L55;
+                  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+                  goto __pyx_L59;
                 }
                 /*else*/ {
 
-                  /* "lib/intbitset.pyx":231
+                  /* "intbitset.pyx":313
  *                                     last = elem + 1
  *                             else:
  *                                 for elem in rhs:             # <<<<<<<<<<<<<<
@@ -1865,31 +2224,31 @@ static int __pyx_pf_3lib_9intbitset_9intbitset___cinit__(PyObject *__pyx_v_self,
  *                                         intBitSetDelElem(self.bitset, remelem)
  */
                   if (PyList_CheckExact(__pyx_v_rhs) || PyTuple_CheckExact(__pyx_v_rhs)) {
-                    __pyx_t_8 = 0; __pyx_t_7 = __pyx_v_rhs; __Pyx_INCREF(__pyx_t_7);
+                    __pyx_t_8 = 0; __pyx_t_1 = __pyx_v_rhs; __Pyx_INCREF(__pyx_t_1);
                   } else {
-                    __pyx_t_8 = -1; __pyx_t_7 = PyObject_GetIter(__pyx_v_rhs); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 231; __pyx_clineno = __LINE__; goto __pyx_L30_error;}
-                    __Pyx_GOTREF(__pyx_t_7);
+                    __pyx_t_8 = -1; __pyx_t_1 = PyObject_GetIter(__pyx_v_rhs); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 313; __pyx_clineno = __LINE__; goto __pyx_L34_error;}
+                    __Pyx_GOTREF(__pyx_t_1);
                   }
                   for (;;) {
-                    if (likely(PyList_CheckExact(__pyx_t_7))) {
-                      if (__pyx_t_8 >= PyList_GET_SIZE(__pyx_t_7)) break;
-                      __pyx_t_1 = PyList_GET_ITEM(__pyx_t_7, __pyx_t_8); __Pyx_INCREF(__pyx_t_1); __pyx_t_8++;
-                    } else if (likely(PyTuple_CheckExact(__pyx_t_7))) {
-                      if (__pyx_t_8 >= PyTuple_GET_SIZE(__pyx_t_7)) break;
-                      __pyx_t_1 = PyTuple_GET_ITEM(__pyx_t_7, __pyx_t_8); __Pyx_INCREF(__pyx_t_1); __pyx_t_8++;
+                    if (likely(PyList_CheckExact(__pyx_t_1))) {
+                      if (__pyx_t_8 >= PyList_GET_SIZE(__pyx_t_1)) break;
+                      __pyx_t_2 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_8); __Pyx_INCREF(__pyx_t_2); __pyx_t_8++;
+                    } else if (likely(PyTuple_CheckExact(__pyx_t_1))) {
+                      if (__pyx_t_8 >= PyTuple_GET_SIZE(__pyx_t_1)) break;
+                      __pyx_t_2 = PyTuple_GET_ITEM(__pyx_t_1, __pyx_t_8); __Pyx_INCREF(__pyx_t_2); __pyx_t_8++;
                     } else {
-                      __pyx_t_1 = PyIter_Next(__pyx_t_7);
-                      if (!__pyx_t_1) {
-                        if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 231; __pyx_clineno = __LINE__; goto __pyx_L30_error;}
+                      __pyx_t_2 = PyIter_Next(__pyx_t_1);
+                      if (!__pyx_t_2) {
+                        if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 313; __pyx_clineno = __LINE__; goto __pyx_L34_error;}
                         break;
                       }
-                      __Pyx_GOTREF(__pyx_t_1);
+                      __Pyx_GOTREF(__pyx_t_2);
                     }
-                    __pyx_t_6 = __Pyx_PyInt_AsInt(__pyx_t_1); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 231; __pyx_clineno = __LINE__; goto __pyx_L30_error;}
-                    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+                    __pyx_t_6 = __Pyx_PyInt_AsInt(__pyx_t_2); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 313; __pyx_clineno = __LINE__; goto __pyx_L34_error;}
+                    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
                     __pyx_v_elem = __pyx_t_6;
 
-                    /* "lib/intbitset.pyx":232
+                    /* "intbitset.pyx":314
  *                             else:
  *                                 for elem in rhs:
  *                                     for remelem from last <= remelem < elem:             # <<<<<<<<<<<<<<
@@ -1899,17 +2258,17 @@ static int __pyx_pf_3lib_9intbitset_9intbitset___cinit__(PyObject *__pyx_v_self,
                     __pyx_t_6 = __pyx_v_elem;
                     for (__pyx_v_remelem = __pyx_v_last; __pyx_v_remelem < __pyx_t_6; __pyx_v_remelem++) {
 
-                      /* "lib/intbitset.pyx":233
+                      /* "intbitset.pyx":315
  *                                 for elem in rhs:
  *                                     for remelem from last <= remelem < elem:
  *                                         intBitSetDelElem(self.bitset, remelem)             # <<<<<<<<<<<<<<
  *                                     last = elem + 1
  * 
  */
-                      intBitSetDelElem(((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->bitset, __pyx_v_remelem);
+                      intBitSetDelElem(((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->bitset, __pyx_v_remelem);
                     }
 
-                    /* "lib/intbitset.pyx":234
+                    /* "intbitset.pyx":316
  *                                     for remelem from last <= remelem < elem:
  *                                         intBitSetDelElem(self.bitset, remelem)
  *                                     last = elem + 1             # <<<<<<<<<<<<<<
@@ -1918,25 +2277,25 @@ static int __pyx_pf_3lib_9intbitset_9intbitset___cinit__(PyObject *__pyx_v_self,
  */
                     __pyx_v_last = (__pyx_v_elem + 1);
                   }
-                  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+                  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
                 }
-                __pyx_L55:;
+                __pyx_L59:;
               }
-              __pyx_L43:;
-              goto __pyx_L42;
+              __pyx_L47:;
+              goto __pyx_L46;
             }
             /*else*/ {
 
-              /* "lib/intbitset.pyx":237
+              /* "intbitset.pyx":319
  * 
  *                     else:
  *                         if self.sanity_checks:             # <<<<<<<<<<<<<<
  *                             if tuple_of_tuples:
  *                                 for tmp_tuple in rhs:
  */
-              if (((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->sanity_checks) {
+              if (((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->sanity_checks) {
 
-                /* "lib/intbitset.pyx":238
+                /* "intbitset.pyx":320
  *                     else:
  *                         if self.sanity_checks:
  *                             if tuple_of_tuples:             # <<<<<<<<<<<<<<
@@ -1945,7 +2304,7 @@ static int __pyx_pf_3lib_9intbitset_9intbitset___cinit__(PyObject *__pyx_v_self,
  */
                 if (__pyx_v_tuple_of_tuples) {
 
-                  /* "lib/intbitset.pyx":239
+                  /* "intbitset.pyx":321
  *                         if self.sanity_checks:
  *                             if tuple_of_tuples:
  *                                 for tmp_tuple in rhs:             # <<<<<<<<<<<<<<
@@ -1953,44 +2312,44 @@ static int __pyx_pf_3lib_9intbitset_9intbitset___cinit__(PyObject *__pyx_v_self,
  *                                     if elem < 0:
  */
                   if (PyList_CheckExact(__pyx_v_rhs) || PyTuple_CheckExact(__pyx_v_rhs)) {
-                    __pyx_t_8 = 0; __pyx_t_7 = __pyx_v_rhs; __Pyx_INCREF(__pyx_t_7);
+                    __pyx_t_8 = 0; __pyx_t_1 = __pyx_v_rhs; __Pyx_INCREF(__pyx_t_1);
                   } else {
-                    __pyx_t_8 = -1; __pyx_t_7 = PyObject_GetIter(__pyx_v_rhs); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 239; __pyx_clineno = __LINE__; goto __pyx_L30_error;}
-                    __Pyx_GOTREF(__pyx_t_7);
+                    __pyx_t_8 = -1; __pyx_t_1 = PyObject_GetIter(__pyx_v_rhs); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 321; __pyx_clineno = __LINE__; goto __pyx_L34_error;}
+                    __Pyx_GOTREF(__pyx_t_1);
                   }
                   for (;;) {
-                    if (likely(PyList_CheckExact(__pyx_t_7))) {
-                      if (__pyx_t_8 >= PyList_GET_SIZE(__pyx_t_7)) break;
-                      __pyx_t_1 = PyList_GET_ITEM(__pyx_t_7, __pyx_t_8); __Pyx_INCREF(__pyx_t_1); __pyx_t_8++;
-                    } else if (likely(PyTuple_CheckExact(__pyx_t_7))) {
-                      if (__pyx_t_8 >= PyTuple_GET_SIZE(__pyx_t_7)) break;
-                      __pyx_t_1 = PyTuple_GET_ITEM(__pyx_t_7, __pyx_t_8); __Pyx_INCREF(__pyx_t_1); __pyx_t_8++;
+                    if (likely(PyList_CheckExact(__pyx_t_1))) {
+                      if (__pyx_t_8 >= PyList_GET_SIZE(__pyx_t_1)) break;
+                      __pyx_t_2 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_8); __Pyx_INCREF(__pyx_t_2); __pyx_t_8++;
+                    } else if (likely(PyTuple_CheckExact(__pyx_t_1))) {
+                      if (__pyx_t_8 >= PyTuple_GET_SIZE(__pyx_t_1)) break;
+                      __pyx_t_2 = PyTuple_GET_ITEM(__pyx_t_1, __pyx_t_8); __Pyx_INCREF(__pyx_t_2); __pyx_t_8++;
                     } else {
-                      __pyx_t_1 = PyIter_Next(__pyx_t_7);
-                      if (!__pyx_t_1) {
-                        if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 239; __pyx_clineno = __LINE__; goto __pyx_L30_error;}
+                      __pyx_t_2 = PyIter_Next(__pyx_t_1);
+                      if (!__pyx_t_2) {
+                        if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 321; __pyx_clineno = __LINE__; goto __pyx_L34_error;}
                         break;
                       }
-                      __Pyx_GOTREF(__pyx_t_1);
+                      __Pyx_GOTREF(__pyx_t_2);
                     }
                     __Pyx_DECREF(__pyx_v_tmp_tuple);
-                    __pyx_v_tmp_tuple = __pyx_t_1;
-                    __pyx_t_1 = 0;
+                    __pyx_v_tmp_tuple = __pyx_t_2;
+                    __pyx_t_2 = 0;
 
-                    /* "lib/intbitset.pyx":240
+                    /* "intbitset.pyx":322
  *                             if tuple_of_tuples:
  *                                 for tmp_tuple in rhs:
  *                                     elem = tmp_tuple[0]             # <<<<<<<<<<<<<<
  *                                     if elem < 0:
  *                                         raise ValueError("Negative numbers, not allowed")
  */
-                    __pyx_t_1 = __Pyx_GetItemInt(__pyx_v_tmp_tuple, 0, sizeof(long), PyInt_FromLong); if (!__pyx_t_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 240; __pyx_clineno = __LINE__; goto __pyx_L30_error;}
-                    __Pyx_GOTREF(__pyx_t_1);
-                    __pyx_t_6 = __Pyx_PyInt_AsInt(__pyx_t_1); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 240; __pyx_clineno = __LINE__; goto __pyx_L30_error;}
-                    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+                    __pyx_t_2 = __Pyx_GetItemInt(__pyx_v_tmp_tuple, 0, sizeof(long), PyInt_FromLong); if (!__pyx_t_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 322; __pyx_clineno = __LINE__; goto __pyx_L34_error;}
+                    __Pyx_GOTREF(__pyx_t_2);
+                    __pyx_t_6 = __Pyx_PyInt_AsInt(__pyx_t_2); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 322; __pyx_clineno = __LINE__; goto __pyx_L34_error;}
+                    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
                     __pyx_v_elem = __pyx_t_6;
 
-                    /* "lib/intbitset.pyx":241
+                    /* "intbitset.pyx":323
  *                                 for tmp_tuple in rhs:
  *                                     elem = tmp_tuple[0]
  *                                     if elem < 0:             # <<<<<<<<<<<<<<
@@ -2000,22 +2359,22 @@ static int __pyx_pf_3lib_9intbitset_9intbitset___cinit__(PyObject *__pyx_v_self,
                     __pyx_t_3 = (__pyx_v_elem < 0);
                     if (__pyx_t_3) {
 
-                      /* "lib/intbitset.pyx":242
+                      /* "intbitset.pyx":324
  *                                     elem = tmp_tuple[0]
  *                                     if elem < 0:
  *                                         raise ValueError("Negative numbers, not allowed")             # <<<<<<<<<<<<<<
  *                                     elif elem > maxelem:
  *                                         raise OverflowError("Elements must be <= %s" % maxelem)
  */
-                      __pyx_t_1 = PyObject_Call(__pyx_builtin_ValueError, ((PyObject *)__pyx_k_tuple_12), NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 242; __pyx_clineno = __LINE__; goto __pyx_L30_error;}
-                      __Pyx_GOTREF(__pyx_t_1);
-                      __Pyx_Raise(__pyx_t_1, 0, 0);
-                      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-                      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 242; __pyx_clineno = __LINE__; goto __pyx_L30_error;}
-                      goto __pyx_L68;
+                      __pyx_t_2 = PyObject_Call(__pyx_builtin_ValueError, ((PyObject *)__pyx_k_tuple_15), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 324; __pyx_clineno = __LINE__; goto __pyx_L34_error;}
+                      __Pyx_GOTREF(__pyx_t_2);
+                      __Pyx_Raise(__pyx_t_2, 0, 0);
+                      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+                      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 324; __pyx_clineno = __LINE__; goto __pyx_L34_error;}
+                      goto __pyx_L72;
                     }
 
-                    /* "lib/intbitset.pyx":243
+                    /* "intbitset.pyx":325
  *                                     if elem < 0:
  *                                         raise ValueError("Negative numbers, not allowed")
  *                                     elif elem > maxelem:             # <<<<<<<<<<<<<<
@@ -2025,48 +2384,48 @@ static int __pyx_pf_3lib_9intbitset_9intbitset___cinit__(PyObject *__pyx_v_self,
                     __pyx_t_3 = (__pyx_v_elem > maxelem);
                     if (__pyx_t_3) {
 
-                      /* "lib/intbitset.pyx":244
+                      /* "intbitset.pyx":326
  *                                         raise ValueError("Negative numbers, not allowed")
  *                                     elif elem > maxelem:
  *                                         raise OverflowError("Elements must be <= %s" % maxelem)             # <<<<<<<<<<<<<<
  *                                     intBitSetAddElem(self.bitset, elem)
  *                             else:
  */
-                      __pyx_t_1 = PyInt_FromLong(maxelem); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 244; __pyx_clineno = __LINE__; goto __pyx_L30_error;}
-                      __Pyx_GOTREF(__pyx_t_1);
-                      __pyx_t_2 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_10), __pyx_t_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 244; __pyx_clineno = __LINE__; goto __pyx_L30_error;}
-                      __Pyx_GOTREF(((PyObject *)__pyx_t_2));
-                      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-                      __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 244; __pyx_clineno = __LINE__; goto __pyx_L30_error;}
-                      __Pyx_GOTREF(((PyObject *)__pyx_t_1));
-                      PyTuple_SET_ITEM(__pyx_t_1, 0, ((PyObject *)__pyx_t_2));
-                      __Pyx_GIVEREF(((PyObject *)__pyx_t_2));
-                      __pyx_t_2 = 0;
-                      __pyx_t_2 = PyObject_Call(__pyx_builtin_OverflowError, ((PyObject *)__pyx_t_1), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 244; __pyx_clineno = __LINE__; goto __pyx_L30_error;}
+                      __pyx_t_2 = PyInt_FromLong(maxelem); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 326; __pyx_clineno = __LINE__; goto __pyx_L34_error;}
                       __Pyx_GOTREF(__pyx_t_2);
-                      __Pyx_DECREF(((PyObject *)__pyx_t_1)); __pyx_t_1 = 0;
-                      __Pyx_Raise(__pyx_t_2, 0, 0);
+                      __pyx_t_7 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_13), __pyx_t_2); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 326; __pyx_clineno = __LINE__; goto __pyx_L34_error;}
+                      __Pyx_GOTREF(((PyObject *)__pyx_t_7));
                       __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-                      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 244; __pyx_clineno = __LINE__; goto __pyx_L30_error;}
-                      goto __pyx_L68;
+                      __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 326; __pyx_clineno = __LINE__; goto __pyx_L34_error;}
+                      __Pyx_GOTREF(((PyObject *)__pyx_t_2));
+                      PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_t_7));
+                      __Pyx_GIVEREF(((PyObject *)__pyx_t_7));
+                      __pyx_t_7 = 0;
+                      __pyx_t_7 = PyObject_Call(__pyx_builtin_OverflowError, ((PyObject *)__pyx_t_2), NULL); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 326; __pyx_clineno = __LINE__; goto __pyx_L34_error;}
+                      __Pyx_GOTREF(__pyx_t_7);
+                      __Pyx_DECREF(((PyObject *)__pyx_t_2)); __pyx_t_2 = 0;
+                      __Pyx_Raise(__pyx_t_7, 0, 0);
+                      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+                      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 326; __pyx_clineno = __LINE__; goto __pyx_L34_error;}
+                      goto __pyx_L72;
                     }
-                    __pyx_L68:;
+                    __pyx_L72:;
 
-                    /* "lib/intbitset.pyx":245
+                    /* "intbitset.pyx":327
  *                                     elif elem > maxelem:
  *                                         raise OverflowError("Elements must be <= %s" % maxelem)
  *                                     intBitSetAddElem(self.bitset, elem)             # <<<<<<<<<<<<<<
  *                             else:
  *                                 for elem in rhs:
  */
-                    intBitSetAddElem(((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->bitset, __pyx_v_elem);
+                    intBitSetAddElem(((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->bitset, __pyx_v_elem);
                   }
-                  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-                  goto __pyx_L65;
+                  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+                  goto __pyx_L69;
                 }
                 /*else*/ {
 
-                  /* "lib/intbitset.pyx":247
+                  /* "intbitset.pyx":329
  *                                     intBitSetAddElem(self.bitset, elem)
  *                             else:
  *                                 for elem in rhs:             # <<<<<<<<<<<<<<
@@ -2074,31 +2433,31 @@ static int __pyx_pf_3lib_9intbitset_9intbitset___cinit__(PyObject *__pyx_v_self,
  *                                         raise ValueError("Negative numbers, not allowed")
  */
                   if (PyList_CheckExact(__pyx_v_rhs) || PyTuple_CheckExact(__pyx_v_rhs)) {
-                    __pyx_t_8 = 0; __pyx_t_7 = __pyx_v_rhs; __Pyx_INCREF(__pyx_t_7);
+                    __pyx_t_8 = 0; __pyx_t_1 = __pyx_v_rhs; __Pyx_INCREF(__pyx_t_1);
                   } else {
-                    __pyx_t_8 = -1; __pyx_t_7 = PyObject_GetIter(__pyx_v_rhs); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 247; __pyx_clineno = __LINE__; goto __pyx_L30_error;}
-                    __Pyx_GOTREF(__pyx_t_7);
+                    __pyx_t_8 = -1; __pyx_t_1 = PyObject_GetIter(__pyx_v_rhs); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 329; __pyx_clineno = __LINE__; goto __pyx_L34_error;}
+                    __Pyx_GOTREF(__pyx_t_1);
                   }
                   for (;;) {
-                    if (likely(PyList_CheckExact(__pyx_t_7))) {
-                      if (__pyx_t_8 >= PyList_GET_SIZE(__pyx_t_7)) break;
-                      __pyx_t_2 = PyList_GET_ITEM(__pyx_t_7, __pyx_t_8); __Pyx_INCREF(__pyx_t_2); __pyx_t_8++;
-                    } else if (likely(PyTuple_CheckExact(__pyx_t_7))) {
-                      if (__pyx_t_8 >= PyTuple_GET_SIZE(__pyx_t_7)) break;
-                      __pyx_t_2 = PyTuple_GET_ITEM(__pyx_t_7, __pyx_t_8); __Pyx_INCREF(__pyx_t_2); __pyx_t_8++;
+                    if (likely(PyList_CheckExact(__pyx_t_1))) {
+                      if (__pyx_t_8 >= PyList_GET_SIZE(__pyx_t_1)) break;
+                      __pyx_t_7 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_8); __Pyx_INCREF(__pyx_t_7); __pyx_t_8++;
+                    } else if (likely(PyTuple_CheckExact(__pyx_t_1))) {
+                      if (__pyx_t_8 >= PyTuple_GET_SIZE(__pyx_t_1)) break;
+                      __pyx_t_7 = PyTuple_GET_ITEM(__pyx_t_1, __pyx_t_8); __Pyx_INCREF(__pyx_t_7); __pyx_t_8++;
                     } else {
-                      __pyx_t_2 = PyIter_Next(__pyx_t_7);
-                      if (!__pyx_t_2) {
-                        if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 247; __pyx_clineno = __LINE__; goto __pyx_L30_error;}
+                      __pyx_t_7 = PyIter_Next(__pyx_t_1);
+                      if (!__pyx_t_7) {
+                        if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 329; __pyx_clineno = __LINE__; goto __pyx_L34_error;}
                         break;
                       }
-                      __Pyx_GOTREF(__pyx_t_2);
+                      __Pyx_GOTREF(__pyx_t_7);
                     }
-                    __pyx_t_6 = __Pyx_PyInt_AsInt(__pyx_t_2); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 247; __pyx_clineno = __LINE__; goto __pyx_L30_error;}
-                    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+                    __pyx_t_6 = __Pyx_PyInt_AsInt(__pyx_t_7); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 329; __pyx_clineno = __LINE__; goto __pyx_L34_error;}
+                    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
                     __pyx_v_elem = __pyx_t_6;
 
-                    /* "lib/intbitset.pyx":248
+                    /* "intbitset.pyx":330
  *                             else:
  *                                 for elem in rhs:
  *                                     if elem < 0:             # <<<<<<<<<<<<<<
@@ -2108,22 +2467,22 @@ static int __pyx_pf_3lib_9intbitset_9intbitset___cinit__(PyObject *__pyx_v_self,
                     __pyx_t_3 = (__pyx_v_elem < 0);
                     if (__pyx_t_3) {
 
-                      /* "lib/intbitset.pyx":249
+                      /* "intbitset.pyx":331
  *                                 for elem in rhs:
  *                                     if elem < 0:
  *                                         raise ValueError("Negative numbers, not allowed")             # <<<<<<<<<<<<<<
  *                                     elif elem > maxelem:
  *                                         raise OverflowError("Elements must be <= %s" % maxelem)
  */
-                      __pyx_t_2 = PyObject_Call(__pyx_builtin_ValueError, ((PyObject *)__pyx_k_tuple_13), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 249; __pyx_clineno = __LINE__; goto __pyx_L30_error;}
-                      __Pyx_GOTREF(__pyx_t_2);
-                      __Pyx_Raise(__pyx_t_2, 0, 0);
-                      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-                      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 249; __pyx_clineno = __LINE__; goto __pyx_L30_error;}
-                      goto __pyx_L71;
+                      __pyx_t_7 = PyObject_Call(__pyx_builtin_ValueError, ((PyObject *)__pyx_k_tuple_16), NULL); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 331; __pyx_clineno = __LINE__; goto __pyx_L34_error;}
+                      __Pyx_GOTREF(__pyx_t_7);
+                      __Pyx_Raise(__pyx_t_7, 0, 0);
+                      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+                      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 331; __pyx_clineno = __LINE__; goto __pyx_L34_error;}
+                      goto __pyx_L75;
                     }
 
-                    /* "lib/intbitset.pyx":250
+                    /* "intbitset.pyx":332
  *                                     if elem < 0:
  *                                         raise ValueError("Negative numbers, not allowed")
  *                                     elif elem > maxelem:             # <<<<<<<<<<<<<<
@@ -2133,50 +2492,50 @@ static int __pyx_pf_3lib_9intbitset_9intbitset___cinit__(PyObject *__pyx_v_self,
                     __pyx_t_3 = (__pyx_v_elem > maxelem);
                     if (__pyx_t_3) {
 
-                      /* "lib/intbitset.pyx":251
+                      /* "intbitset.pyx":333
  *                                         raise ValueError("Negative numbers, not allowed")
  *                                     elif elem > maxelem:
  *                                         raise OverflowError("Elements must be <= %s" % maxelem)             # <<<<<<<<<<<<<<
  *                                     intBitSetAddElem(self.bitset, elem)
  *                         else:
  */
-                      __pyx_t_2 = PyInt_FromLong(maxelem); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 251; __pyx_clineno = __LINE__; goto __pyx_L30_error;}
+                      __pyx_t_7 = PyInt_FromLong(maxelem); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 333; __pyx_clineno = __LINE__; goto __pyx_L34_error;}
+                      __Pyx_GOTREF(__pyx_t_7);
+                      __pyx_t_2 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_13), __pyx_t_7); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 333; __pyx_clineno = __LINE__; goto __pyx_L34_error;}
+                      __Pyx_GOTREF(((PyObject *)__pyx_t_2));
+                      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+                      __pyx_t_7 = PyTuple_New(1); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 333; __pyx_clineno = __LINE__; goto __pyx_L34_error;}
+                      __Pyx_GOTREF(((PyObject *)__pyx_t_7));
+                      PyTuple_SET_ITEM(__pyx_t_7, 0, ((PyObject *)__pyx_t_2));
+                      __Pyx_GIVEREF(((PyObject *)__pyx_t_2));
+                      __pyx_t_2 = 0;
+                      __pyx_t_2 = PyObject_Call(__pyx_builtin_OverflowError, ((PyObject *)__pyx_t_7), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 333; __pyx_clineno = __LINE__; goto __pyx_L34_error;}
                       __Pyx_GOTREF(__pyx_t_2);
-                      __pyx_t_1 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_10), __pyx_t_2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 251; __pyx_clineno = __LINE__; goto __pyx_L30_error;}
-                      __Pyx_GOTREF(((PyObject *)__pyx_t_1));
+                      __Pyx_DECREF(((PyObject *)__pyx_t_7)); __pyx_t_7 = 0;
+                      __Pyx_Raise(__pyx_t_2, 0, 0);
                       __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-                      __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 251; __pyx_clineno = __LINE__; goto __pyx_L30_error;}
-                      __Pyx_GOTREF(((PyObject *)__pyx_t_2));
-                      PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_t_1));
-                      __Pyx_GIVEREF(((PyObject *)__pyx_t_1));
-                      __pyx_t_1 = 0;
-                      __pyx_t_1 = PyObject_Call(__pyx_builtin_OverflowError, ((PyObject *)__pyx_t_2), NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 251; __pyx_clineno = __LINE__; goto __pyx_L30_error;}
-                      __Pyx_GOTREF(__pyx_t_1);
-                      __Pyx_DECREF(((PyObject *)__pyx_t_2)); __pyx_t_2 = 0;
-                      __Pyx_Raise(__pyx_t_1, 0, 0);
-                      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-                      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 251; __pyx_clineno = __LINE__; goto __pyx_L30_error;}
-                      goto __pyx_L71;
+                      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 333; __pyx_clineno = __LINE__; goto __pyx_L34_error;}
+                      goto __pyx_L75;
                     }
-                    __pyx_L71:;
+                    __pyx_L75:;
 
-                    /* "lib/intbitset.pyx":252
+                    /* "intbitset.pyx":334
  *                                     elif elem > maxelem:
  *                                         raise OverflowError("Elements must be <= %s" % maxelem)
  *                                     intBitSetAddElem(self.bitset, elem)             # <<<<<<<<<<<<<<
  *                         else:
  *                             if tuple_of_tuples:
  */
-                    intBitSetAddElem(((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->bitset, __pyx_v_elem);
+                    intBitSetAddElem(((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->bitset, __pyx_v_elem);
                   }
-                  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+                  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
                 }
-                __pyx_L65:;
-                goto __pyx_L64;
+                __pyx_L69:;
+                goto __pyx_L68;
               }
               /*else*/ {
 
-                /* "lib/intbitset.pyx":254
+                /* "intbitset.pyx":336
  *                                     intBitSetAddElem(self.bitset, elem)
  *                         else:
  *                             if tuple_of_tuples:             # <<<<<<<<<<<<<<
@@ -2185,7 +2544,7 @@ static int __pyx_pf_3lib_9intbitset_9intbitset___cinit__(PyObject *__pyx_v_self,
  */
                 if (__pyx_v_tuple_of_tuples) {
 
-                  /* "lib/intbitset.pyx":255
+                  /* "intbitset.pyx":337
  *                         else:
  *                             if tuple_of_tuples:
  *                                 for tmp_tuple in rhs:             # <<<<<<<<<<<<<<
@@ -2193,58 +2552,58 @@ static int __pyx_pf_3lib_9intbitset_9intbitset___cinit__(PyObject *__pyx_v_self,
  *                                     intBitSetAddElem(self.bitset, elem)
  */
                   if (PyList_CheckExact(__pyx_v_rhs) || PyTuple_CheckExact(__pyx_v_rhs)) {
-                    __pyx_t_8 = 0; __pyx_t_7 = __pyx_v_rhs; __Pyx_INCREF(__pyx_t_7);
+                    __pyx_t_8 = 0; __pyx_t_1 = __pyx_v_rhs; __Pyx_INCREF(__pyx_t_1);
                   } else {
-                    __pyx_t_8 = -1; __pyx_t_7 = PyObject_GetIter(__pyx_v_rhs); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 255; __pyx_clineno = __LINE__; goto __pyx_L30_error;}
-                    __Pyx_GOTREF(__pyx_t_7);
+                    __pyx_t_8 = -1; __pyx_t_1 = PyObject_GetIter(__pyx_v_rhs); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 337; __pyx_clineno = __LINE__; goto __pyx_L34_error;}
+                    __Pyx_GOTREF(__pyx_t_1);
                   }
                   for (;;) {
-                    if (likely(PyList_CheckExact(__pyx_t_7))) {
-                      if (__pyx_t_8 >= PyList_GET_SIZE(__pyx_t_7)) break;
-                      __pyx_t_1 = PyList_GET_ITEM(__pyx_t_7, __pyx_t_8); __Pyx_INCREF(__pyx_t_1); __pyx_t_8++;
-                    } else if (likely(PyTuple_CheckExact(__pyx_t_7))) {
-                      if (__pyx_t_8 >= PyTuple_GET_SIZE(__pyx_t_7)) break;
-                      __pyx_t_1 = PyTuple_GET_ITEM(__pyx_t_7, __pyx_t_8); __Pyx_INCREF(__pyx_t_1); __pyx_t_8++;
+                    if (likely(PyList_CheckExact(__pyx_t_1))) {
+                      if (__pyx_t_8 >= PyList_GET_SIZE(__pyx_t_1)) break;
+                      __pyx_t_2 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_8); __Pyx_INCREF(__pyx_t_2); __pyx_t_8++;
+                    } else if (likely(PyTuple_CheckExact(__pyx_t_1))) {
+                      if (__pyx_t_8 >= PyTuple_GET_SIZE(__pyx_t_1)) break;
+                      __pyx_t_2 = PyTuple_GET_ITEM(__pyx_t_1, __pyx_t_8); __Pyx_INCREF(__pyx_t_2); __pyx_t_8++;
                     } else {
-                      __pyx_t_1 = PyIter_Next(__pyx_t_7);
-                      if (!__pyx_t_1) {
-                        if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 255; __pyx_clineno = __LINE__; goto __pyx_L30_error;}
+                      __pyx_t_2 = PyIter_Next(__pyx_t_1);
+                      if (!__pyx_t_2) {
+                        if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 337; __pyx_clineno = __LINE__; goto __pyx_L34_error;}
                         break;
                       }
-                      __Pyx_GOTREF(__pyx_t_1);
+                      __Pyx_GOTREF(__pyx_t_2);
                     }
                     __Pyx_DECREF(__pyx_v_tmp_tuple);
-                    __pyx_v_tmp_tuple = __pyx_t_1;
-                    __pyx_t_1 = 0;
+                    __pyx_v_tmp_tuple = __pyx_t_2;
+                    __pyx_t_2 = 0;
 
-                    /* "lib/intbitset.pyx":256
+                    /* "intbitset.pyx":338
  *                             if tuple_of_tuples:
  *                                 for tmp_tuple in rhs:
  *                                     elem = tmp_tuple[0]             # <<<<<<<<<<<<<<
  *                                     intBitSetAddElem(self.bitset, elem)
  *                             else:
  */
-                    __pyx_t_1 = __Pyx_GetItemInt(__pyx_v_tmp_tuple, 0, sizeof(long), PyInt_FromLong); if (!__pyx_t_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 256; __pyx_clineno = __LINE__; goto __pyx_L30_error;}
-                    __Pyx_GOTREF(__pyx_t_1);
-                    __pyx_t_6 = __Pyx_PyInt_AsInt(__pyx_t_1); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 256; __pyx_clineno = __LINE__; goto __pyx_L30_error;}
-                    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+                    __pyx_t_2 = __Pyx_GetItemInt(__pyx_v_tmp_tuple, 0, sizeof(long), PyInt_FromLong); if (!__pyx_t_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 338; __pyx_clineno = __LINE__; goto __pyx_L34_error;}
+                    __Pyx_GOTREF(__pyx_t_2);
+                    __pyx_t_6 = __Pyx_PyInt_AsInt(__pyx_t_2); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 338; __pyx_clineno = __LINE__; goto __pyx_L34_error;}
+                    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
                     __pyx_v_elem = __pyx_t_6;
 
-                    /* "lib/intbitset.pyx":257
+                    /* "intbitset.pyx":339
  *                                 for tmp_tuple in rhs:
  *                                     elem = tmp_tuple[0]
  *                                     intBitSetAddElem(self.bitset, elem)             # <<<<<<<<<<<<<<
  *                             else:
  *                                 for elem in rhs:
  */
-                    intBitSetAddElem(((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->bitset, __pyx_v_elem);
+                    intBitSetAddElem(((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->bitset, __pyx_v_elem);
                   }
-                  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-                  goto __pyx_L72;
+                  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+                  goto __pyx_L76;
                 }
                 /*else*/ {
 
-                  /* "lib/intbitset.pyx":259
+                  /* "intbitset.pyx":341
  *                                     intBitSetAddElem(self.bitset, elem)
  *                             else:
  *                                 for elem in rhs:             # <<<<<<<<<<<<<<
@@ -2252,59 +2611,59 @@ static int __pyx_pf_3lib_9intbitset_9intbitset___cinit__(PyObject *__pyx_v_self,
  *                 except Exception, msg:
  */
                   if (PyList_CheckExact(__pyx_v_rhs) || PyTuple_CheckExact(__pyx_v_rhs)) {
-                    __pyx_t_8 = 0; __pyx_t_7 = __pyx_v_rhs; __Pyx_INCREF(__pyx_t_7);
+                    __pyx_t_8 = 0; __pyx_t_1 = __pyx_v_rhs; __Pyx_INCREF(__pyx_t_1);
                   } else {
-                    __pyx_t_8 = -1; __pyx_t_7 = PyObject_GetIter(__pyx_v_rhs); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 259; __pyx_clineno = __LINE__; goto __pyx_L30_error;}
-                    __Pyx_GOTREF(__pyx_t_7);
+                    __pyx_t_8 = -1; __pyx_t_1 = PyObject_GetIter(__pyx_v_rhs); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 341; __pyx_clineno = __LINE__; goto __pyx_L34_error;}
+                    __Pyx_GOTREF(__pyx_t_1);
                   }
                   for (;;) {
-                    if (likely(PyList_CheckExact(__pyx_t_7))) {
-                      if (__pyx_t_8 >= PyList_GET_SIZE(__pyx_t_7)) break;
-                      __pyx_t_1 = PyList_GET_ITEM(__pyx_t_7, __pyx_t_8); __Pyx_INCREF(__pyx_t_1); __pyx_t_8++;
-                    } else if (likely(PyTuple_CheckExact(__pyx_t_7))) {
-                      if (__pyx_t_8 >= PyTuple_GET_SIZE(__pyx_t_7)) break;
-                      __pyx_t_1 = PyTuple_GET_ITEM(__pyx_t_7, __pyx_t_8); __Pyx_INCREF(__pyx_t_1); __pyx_t_8++;
+                    if (likely(PyList_CheckExact(__pyx_t_1))) {
+                      if (__pyx_t_8 >= PyList_GET_SIZE(__pyx_t_1)) break;
+                      __pyx_t_2 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_8); __Pyx_INCREF(__pyx_t_2); __pyx_t_8++;
+                    } else if (likely(PyTuple_CheckExact(__pyx_t_1))) {
+                      if (__pyx_t_8 >= PyTuple_GET_SIZE(__pyx_t_1)) break;
+                      __pyx_t_2 = PyTuple_GET_ITEM(__pyx_t_1, __pyx_t_8); __Pyx_INCREF(__pyx_t_2); __pyx_t_8++;
                     } else {
-                      __pyx_t_1 = PyIter_Next(__pyx_t_7);
-                      if (!__pyx_t_1) {
-                        if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 259; __pyx_clineno = __LINE__; goto __pyx_L30_error;}
+                      __pyx_t_2 = PyIter_Next(__pyx_t_1);
+                      if (!__pyx_t_2) {
+                        if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 341; __pyx_clineno = __LINE__; goto __pyx_L34_error;}
                         break;
                       }
-                      __Pyx_GOTREF(__pyx_t_1);
+                      __Pyx_GOTREF(__pyx_t_2);
                     }
-                    __pyx_t_6 = __Pyx_PyInt_AsInt(__pyx_t_1); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 259; __pyx_clineno = __LINE__; goto __pyx_L30_error;}
-                    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+                    __pyx_t_6 = __Pyx_PyInt_AsInt(__pyx_t_2); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 341; __pyx_clineno = __LINE__; goto __pyx_L34_error;}
+                    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
                     __pyx_v_elem = __pyx_t_6;
 
-                    /* "lib/intbitset.pyx":260
+                    /* "intbitset.pyx":342
  *                             else:
  *                                 for elem in rhs:
  *                                     intBitSetAddElem(self.bitset, elem)             # <<<<<<<<<<<<<<
  *                 except Exception, msg:
  *                     raise ValueError("retrieving integers from rhs is impossible: %s" % msg)
  */
-                    intBitSetAddElem(((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->bitset, __pyx_v_elem);
+                    intBitSetAddElem(((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->bitset, __pyx_v_elem);
                   }
-                  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+                  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
                 }
-                __pyx_L72:;
+                __pyx_L76:;
               }
-              __pyx_L64:;
+              __pyx_L68:;
             }
-            __pyx_L42:;
+            __pyx_L46:;
           }
           __Pyx_XDECREF(__pyx_save_exc_type); __pyx_save_exc_type = 0;
           __Pyx_XDECREF(__pyx_save_exc_value); __pyx_save_exc_value = 0;
           __Pyx_XDECREF(__pyx_save_exc_tb); __pyx_save_exc_tb = 0;
-          goto __pyx_L37_try_end;
-          __pyx_L30_error:;
+          goto __pyx_L41_try_end;
+          __pyx_L34_error:;
           __Pyx_XDECREF(__pyx_t_10); __pyx_t_10 = 0;
           __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
+          __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
           __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
           __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
-          __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
 
-          /* "lib/intbitset.pyx":261
+          /* "intbitset.pyx":343
  *                                 for elem in rhs:
  *                                     intBitSetAddElem(self.bitset, elem)
  *                 except Exception, msg:             # <<<<<<<<<<<<<<
@@ -2313,77 +2672,77 @@ static int __pyx_pf_3lib_9intbitset_9intbitset___cinit__(PyObject *__pyx_v_self,
  */
           __pyx_t_6 = PyErr_ExceptionMatches(__pyx_builtin_Exception);
           if (__pyx_t_6) {
-            __Pyx_AddTraceback("lib.intbitset.intbitset.__cinit__");
-            if (__Pyx_GetException(&__pyx_t_7, &__pyx_t_1, &__pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 261; __pyx_clineno = __LINE__; goto __pyx_L32_except_error;}
-            __Pyx_GOTREF(__pyx_t_7);
+            __Pyx_AddTraceback("intbitset.intbitset.__cinit__");
+            if (__Pyx_GetException(&__pyx_t_1, &__pyx_t_2, &__pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 343; __pyx_clineno = __LINE__; goto __pyx_L36_except_error;}
             __Pyx_GOTREF(__pyx_t_1);
             __Pyx_GOTREF(__pyx_t_2);
-            __Pyx_INCREF(__pyx_t_1);
+            __Pyx_GOTREF(__pyx_t_7);
+            __Pyx_INCREF(__pyx_t_2);
             __Pyx_DECREF(__pyx_v_msg);
-            __pyx_v_msg = __pyx_t_1;
+            __pyx_v_msg = __pyx_t_2;
 
-            /* "lib/intbitset.pyx":262
+            /* "intbitset.pyx":344
  *                                     intBitSetAddElem(self.bitset, elem)
  *                 except Exception, msg:
  *                     raise ValueError("retrieving integers from rhs is impossible: %s" % msg)             # <<<<<<<<<<<<<<
  *             else:
  *                 raise TypeError("rhs is of unknown type %s" % type(rhs))
  */
-            __pyx_t_9 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_14), __pyx_v_msg); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 262; __pyx_clineno = __LINE__; goto __pyx_L32_except_error;}
+            __pyx_t_9 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_17), __pyx_v_msg); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 344; __pyx_clineno = __LINE__; goto __pyx_L36_except_error;}
             __Pyx_GOTREF(((PyObject *)__pyx_t_9));
-            __pyx_t_10 = PyTuple_New(1); if (unlikely(!__pyx_t_10)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 262; __pyx_clineno = __LINE__; goto __pyx_L32_except_error;}
+            __pyx_t_10 = PyTuple_New(1); if (unlikely(!__pyx_t_10)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 344; __pyx_clineno = __LINE__; goto __pyx_L36_except_error;}
             __Pyx_GOTREF(((PyObject *)__pyx_t_10));
             PyTuple_SET_ITEM(__pyx_t_10, 0, ((PyObject *)__pyx_t_9));
             __Pyx_GIVEREF(((PyObject *)__pyx_t_9));
             __pyx_t_9 = 0;
-            __pyx_t_9 = PyObject_Call(__pyx_builtin_ValueError, ((PyObject *)__pyx_t_10), NULL); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 262; __pyx_clineno = __LINE__; goto __pyx_L32_except_error;}
+            __pyx_t_9 = PyObject_Call(__pyx_builtin_ValueError, ((PyObject *)__pyx_t_10), NULL); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 344; __pyx_clineno = __LINE__; goto __pyx_L36_except_error;}
             __Pyx_GOTREF(__pyx_t_9);
             __Pyx_DECREF(((PyObject *)__pyx_t_10)); __pyx_t_10 = 0;
             __Pyx_Raise(__pyx_t_9, 0, 0);
             __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-            {__pyx_filename = __pyx_f[0]; __pyx_lineno = 262; __pyx_clineno = __LINE__; goto __pyx_L32_except_error;}
-            __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+            {__pyx_filename = __pyx_f[0]; __pyx_lineno = 344; __pyx_clineno = __LINE__; goto __pyx_L36_except_error;}
             __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
             __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-            goto __pyx_L31_exception_handled;
+            __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+            goto __pyx_L35_exception_handled;
           }
-          __pyx_L32_except_error:;
+          __pyx_L36_except_error:;
           __Pyx_XGIVEREF(__pyx_save_exc_type);
           __Pyx_XGIVEREF(__pyx_save_exc_value);
           __Pyx_XGIVEREF(__pyx_save_exc_tb);
           __Pyx_ExceptionReset(__pyx_save_exc_type, __pyx_save_exc_value, __pyx_save_exc_tb);
           goto __pyx_L6_error;
-          __pyx_L31_exception_handled:;
+          __pyx_L35_exception_handled:;
           __Pyx_XGIVEREF(__pyx_save_exc_type);
           __Pyx_XGIVEREF(__pyx_save_exc_value);
           __Pyx_XGIVEREF(__pyx_save_exc_tb);
           __Pyx_ExceptionReset(__pyx_save_exc_type, __pyx_save_exc_value, __pyx_save_exc_tb);
-          __pyx_L37_try_end:;
+          __pyx_L41_try_end:;
         }
         goto __pyx_L15;
       }
       /*else*/ {
 
-        /* "lib/intbitset.pyx":264
+        /* "intbitset.pyx":346
  *                     raise ValueError("retrieving integers from rhs is impossible: %s" % msg)
  *             else:
  *                 raise TypeError("rhs is of unknown type %s" % type(rhs))             # <<<<<<<<<<<<<<
  *         except:
  *             intBitSetDestroy(self.bitset)
  */
-        __pyx_t_2 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_15), ((PyObject *)Py_TYPE(__pyx_v_rhs))); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 264; __pyx_clineno = __LINE__; goto __pyx_L6_error;}
+        __pyx_t_7 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_18), ((PyObject *)Py_TYPE(__pyx_v_rhs))); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 346; __pyx_clineno = __LINE__; goto __pyx_L6_error;}
+        __Pyx_GOTREF(((PyObject *)__pyx_t_7));
+        __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 346; __pyx_clineno = __LINE__; goto __pyx_L6_error;}
         __Pyx_GOTREF(((PyObject *)__pyx_t_2));
-        __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 264; __pyx_clineno = __LINE__; goto __pyx_L6_error;}
-        __Pyx_GOTREF(((PyObject *)__pyx_t_1));
-        PyTuple_SET_ITEM(__pyx_t_1, 0, ((PyObject *)__pyx_t_2));
-        __Pyx_GIVEREF(((PyObject *)__pyx_t_2));
-        __pyx_t_2 = 0;
-        __pyx_t_2 = PyObject_Call(__pyx_builtin_TypeError, ((PyObject *)__pyx_t_1), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 264; __pyx_clineno = __LINE__; goto __pyx_L6_error;}
-        __Pyx_GOTREF(__pyx_t_2);
-        __Pyx_DECREF(((PyObject *)__pyx_t_1)); __pyx_t_1 = 0;
-        __Pyx_Raise(__pyx_t_2, 0, 0);
-        __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-        {__pyx_filename = __pyx_f[0]; __pyx_lineno = 264; __pyx_clineno = __LINE__; goto __pyx_L6_error;}
+        PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_t_7));
+        __Pyx_GIVEREF(((PyObject *)__pyx_t_7));
+        __pyx_t_7 = 0;
+        __pyx_t_7 = PyObject_Call(__pyx_builtin_TypeError, ((PyObject *)__pyx_t_2), NULL); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 346; __pyx_clineno = __LINE__; goto __pyx_L6_error;}
+        __Pyx_GOTREF(__pyx_t_7);
+        __Pyx_DECREF(((PyObject *)__pyx_t_2)); __pyx_t_2 = 0;
+        __Pyx_Raise(__pyx_t_7, 0, 0);
+        __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+        {__pyx_filename = __pyx_f[0]; __pyx_lineno = 346; __pyx_clineno = __LINE__; goto __pyx_L6_error;}
       }
       __pyx_L15:;
     }
@@ -2400,11 +2759,11 @@ static int __pyx_pf_3lib_9intbitset_9intbitset___cinit__(PyObject *__pyx_v_self,
     __pyx_L6_error:;
     __Pyx_XDECREF(__pyx_t_10); __pyx_t_10 = 0;
     __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
-    __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
     __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
     __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
 
-    /* "lib/intbitset.pyx":265
+    /* "intbitset.pyx":347
  *             else:
  *                 raise TypeError("rhs is of unknown type %s" % type(rhs))
  *         except:             # <<<<<<<<<<<<<<
@@ -2412,37 +2771,37 @@ static int __pyx_pf_3lib_9intbitset_9intbitset___cinit__(PyObject *__pyx_v_self,
  *             raise
  */
     /*except:*/ {
-      __Pyx_AddTraceback("lib.intbitset.intbitset.__cinit__");
-      if (__Pyx_GetException(&__pyx_t_2, &__pyx_t_1, &__pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 265; __pyx_clineno = __LINE__; goto __pyx_L8_except_error;}
+      __Pyx_AddTraceback("intbitset.intbitset.__cinit__");
+      if (__Pyx_GetException(&__pyx_t_7, &__pyx_t_2, &__pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 347; __pyx_clineno = __LINE__; goto __pyx_L8_except_error;}
+      __Pyx_GOTREF(__pyx_t_7);
       __Pyx_GOTREF(__pyx_t_2);
       __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_GOTREF(__pyx_t_7);
 
-      /* "lib/intbitset.pyx":266
+      /* "intbitset.pyx":348
  *                 raise TypeError("rhs is of unknown type %s" % type(rhs))
  *         except:
  *             intBitSetDestroy(self.bitset)             # <<<<<<<<<<<<<<
  *             raise
  * 
  */
-      intBitSetDestroy(((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->bitset);
+      intBitSetDestroy(((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->bitset);
 
-      /* "lib/intbitset.pyx":267
+      /* "intbitset.pyx":349
  *         except:
  *             intBitSetDestroy(self.bitset)
  *             raise             # <<<<<<<<<<<<<<
  * 
  *     def __dealloc__(self):
  */
+      __Pyx_GIVEREF(__pyx_t_7);
       __Pyx_GIVEREF(__pyx_t_2);
       __Pyx_GIVEREF(__pyx_t_1);
-      __Pyx_GIVEREF(__pyx_t_7);
-      __Pyx_ErrRestore(__pyx_t_2, __pyx_t_1, __pyx_t_7);
-      __pyx_t_2 = 0; __pyx_t_1 = 0; __pyx_t_7 = 0; 
-      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 267; __pyx_clineno = __LINE__; goto __pyx_L8_except_error;}
+      __Pyx_ErrRestore(__pyx_t_7, __pyx_t_2, __pyx_t_1);
+      __pyx_t_7 = 0; __pyx_t_2 = 0; __pyx_t_1 = 0; 
+      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 349; __pyx_clineno = __LINE__; goto __pyx_L8_except_error;}
+      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
       __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
       __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
       goto __pyx_L7_exception_handled;
     }
     __pyx_L8_except_error:;
@@ -2467,7 +2826,7 @@ static int __pyx_pf_3lib_9intbitset_9intbitset___cinit__(PyObject *__pyx_v_self,
   __Pyx_XDECREF(__pyx_t_7);
   __Pyx_XDECREF(__pyx_t_9);
   __Pyx_XDECREF(__pyx_t_10);
-  __Pyx_AddTraceback("lib.intbitset.intbitset.__cinit__");
+  __Pyx_AddTraceback("intbitset.intbitset.__cinit__");
   __pyx_r = -1;
   __pyx_L0:;
   __Pyx_DECREF(__pyx_v_msg);
@@ -2478,7 +2837,7 @@ static int __pyx_pf_3lib_9intbitset_9intbitset___cinit__(PyObject *__pyx_v_self,
   return __pyx_r;
 }
 
-/* "lib/intbitset.pyx":269
+/* "intbitset.pyx":351
  *             raise
  * 
  *     def __dealloc__(self):             # <<<<<<<<<<<<<<
@@ -2486,23 +2845,23 @@ static int __pyx_pf_3lib_9intbitset_9intbitset___cinit__(PyObject *__pyx_v_self,
  *         intBitSetDestroy(self.bitset)
  */
 
-static void __pyx_pf_3lib_9intbitset_9intbitset_1__dealloc__(PyObject *__pyx_v_self); /*proto*/
-static void __pyx_pf_3lib_9intbitset_9intbitset_1__dealloc__(PyObject *__pyx_v_self) {
+static void __pyx_pf_9intbitset_9intbitset_1__dealloc__(PyObject *__pyx_v_self); /*proto*/
+static void __pyx_pf_9intbitset_9intbitset_1__dealloc__(PyObject *__pyx_v_self) {
   __Pyx_RefNannySetupContext("__dealloc__");
 
-  /* "lib/intbitset.pyx":271
+  /* "intbitset.pyx":353
  *     def __dealloc__(self):
  *         #print >> sys.stderr, "intbitset.__dealloc__ is called"
  *         intBitSetDestroy(self.bitset)             # <<<<<<<<<<<<<<
  * 
  *     def __contains__(self, int elem):
  */
-  intBitSetDestroy(((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->bitset);
+  intBitSetDestroy(((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->bitset);
 
   __Pyx_RefNannyFinishContext();
 }
 
-/* "lib/intbitset.pyx":273
+/* "intbitset.pyx":355
  *         intBitSetDestroy(self.bitset)
  * 
  *     def __contains__(self, int elem):             # <<<<<<<<<<<<<<
@@ -2510,8 +2869,8 @@ static void __pyx_pf_3lib_9intbitset_9intbitset_1__dealloc__(PyObject *__pyx_v_s
  *             if elem < 0:
  */
 
-static int __pyx_pf_3lib_9intbitset_9intbitset_2__contains__(PyObject *__pyx_v_self, PyObject *__pyx_arg_elem); /*proto*/
-static int __pyx_pf_3lib_9intbitset_9intbitset_2__contains__(PyObject *__pyx_v_self, PyObject *__pyx_arg_elem) {
+static int __pyx_pf_9intbitset_9intbitset_2__contains__(PyObject *__pyx_v_self, PyObject *__pyx_arg_elem); /*proto*/
+static int __pyx_pf_9intbitset_9intbitset_2__contains__(PyObject *__pyx_v_self, PyObject *__pyx_arg_elem) {
   int __pyx_v_elem;
   int __pyx_r;
   int __pyx_t_1;
@@ -2519,25 +2878,25 @@ static int __pyx_pf_3lib_9intbitset_9intbitset_2__contains__(PyObject *__pyx_v_s
   PyObject *__pyx_t_3 = NULL;
   __Pyx_RefNannySetupContext("__contains__");
   assert(__pyx_arg_elem); {
-    __pyx_v_elem = __Pyx_PyInt_AsInt(__pyx_arg_elem); if (unlikely((__pyx_v_elem == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_elem = __Pyx_PyInt_AsInt(__pyx_arg_elem); if (unlikely((__pyx_v_elem == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 355; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
-  __Pyx_AddTraceback("lib.intbitset.intbitset.__contains__");
+  __Pyx_AddTraceback("intbitset.intbitset.__contains__");
   __Pyx_RefNannyFinishContext();
   return -1;
   __pyx_L4_argument_unpacking_done:;
 
-  /* "lib/intbitset.pyx":274
+  /* "intbitset.pyx":356
  * 
  *     def __contains__(self, int elem):
  *         if self.sanity_checks:             # <<<<<<<<<<<<<<
  *             if elem < 0:
  *                 raise ValueError("Negative numbers, not allowed")
  */
-  if (((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->sanity_checks) {
+  if (((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->sanity_checks) {
 
-    /* "lib/intbitset.pyx":275
+    /* "intbitset.pyx":357
  *     def __contains__(self, int elem):
  *         if self.sanity_checks:
  *             if elem < 0:             # <<<<<<<<<<<<<<
@@ -2547,22 +2906,22 @@ static int __pyx_pf_3lib_9intbitset_9intbitset_2__contains__(PyObject *__pyx_v_s
     __pyx_t_1 = (__pyx_v_elem < 0);
     if (__pyx_t_1) {
 
-      /* "lib/intbitset.pyx":276
+      /* "intbitset.pyx":358
  *         if self.sanity_checks:
  *             if elem < 0:
  *                 raise ValueError("Negative numbers, not allowed")             # <<<<<<<<<<<<<<
  *             elif elem > maxelem:
  *                 raise OverflowError("Element must be <= %s" % maxelem)
  */
-      __pyx_t_2 = PyObject_Call(__pyx_builtin_ValueError, ((PyObject *)__pyx_k_tuple_16), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 276; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_2 = PyObject_Call(__pyx_builtin_ValueError, ((PyObject *)__pyx_k_tuple_19), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 358; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_2);
       __Pyx_Raise(__pyx_t_2, 0, 0);
       __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 276; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 358; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       goto __pyx_L6;
     }
 
-    /* "lib/intbitset.pyx":277
+    /* "intbitset.pyx":359
  *             if elem < 0:
  *                 raise ValueError("Negative numbers, not allowed")
  *             elif elem > maxelem:             # <<<<<<<<<<<<<<
@@ -2572,29 +2931,29 @@ static int __pyx_pf_3lib_9intbitset_9intbitset_2__contains__(PyObject *__pyx_v_s
     __pyx_t_1 = (__pyx_v_elem > maxelem);
     if (__pyx_t_1) {
 
-      /* "lib/intbitset.pyx":278
+      /* "intbitset.pyx":360
  *                 raise ValueError("Negative numbers, not allowed")
  *             elif elem > maxelem:
  *                 raise OverflowError("Element must be <= %s" % maxelem)             # <<<<<<<<<<<<<<
  *         return intBitSetIsInElem(self.bitset, elem) != 0
  * 
  */
-      __pyx_t_2 = PyInt_FromLong(maxelem); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 278; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_2 = PyInt_FromLong(maxelem); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 360; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_2);
-      __pyx_t_3 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_17), __pyx_t_2); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 278; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_3 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_20), __pyx_t_2); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 360; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(((PyObject *)__pyx_t_3));
       __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 278; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 360; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(((PyObject *)__pyx_t_2));
       PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_t_3));
       __Pyx_GIVEREF(((PyObject *)__pyx_t_3));
       __pyx_t_3 = 0;
-      __pyx_t_3 = PyObject_Call(__pyx_builtin_OverflowError, ((PyObject *)__pyx_t_2), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 278; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_3 = PyObject_Call(__pyx_builtin_OverflowError, ((PyObject *)__pyx_t_2), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 360; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_3);
       __Pyx_DECREF(((PyObject *)__pyx_t_2)); __pyx_t_2 = 0;
       __Pyx_Raise(__pyx_t_3, 0, 0);
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 278; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 360; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       goto __pyx_L6;
     }
     __pyx_L6:;
@@ -2602,14 +2961,14 @@ static int __pyx_pf_3lib_9intbitset_9intbitset_2__contains__(PyObject *__pyx_v_s
   }
   __pyx_L5:;
 
-  /* "lib/intbitset.pyx":279
+  /* "intbitset.pyx":361
  *             elif elem > maxelem:
  *                 raise OverflowError("Element must be <= %s" % maxelem)
  *         return intBitSetIsInElem(self.bitset, elem) != 0             # <<<<<<<<<<<<<<
  * 
  *     def __cmp__(self, intbitset rhs not None):
  */
-  __pyx_r = (intBitSetIsInElem(((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->bitset, __pyx_v_elem) != 0);
+  __pyx_r = (intBitSetIsInElem(((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->bitset, __pyx_v_elem) != 0);
   goto __pyx_L0;
 
   __pyx_r = 0;
@@ -2617,14 +2976,14 @@ static int __pyx_pf_3lib_9intbitset_9intbitset_2__contains__(PyObject *__pyx_v_s
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_AddTraceback("lib.intbitset.intbitset.__contains__");
+  __Pyx_AddTraceback("intbitset.intbitset.__contains__");
   __pyx_r = -1;
   __pyx_L0:;
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "lib/intbitset.pyx":281
+/* "intbitset.pyx":363
  *         return intBitSetIsInElem(self.bitset, elem) != 0
  * 
  *     def __cmp__(self, intbitset rhs not None):             # <<<<<<<<<<<<<<
@@ -2633,31 +2992,31 @@ static int __pyx_pf_3lib_9intbitset_9intbitset_2__contains__(PyObject *__pyx_v_s
  */
 
 #if PY_MAJOR_VERSION < 3
-static int __pyx_pf_3lib_9intbitset_9intbitset_3__cmp__(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs); /*proto*/
-static int __pyx_pf_3lib_9intbitset_9intbitset_3__cmp__(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs) {
+static int __pyx_pf_9intbitset_9intbitset_3__cmp__(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs); /*proto*/
+static int __pyx_pf_9intbitset_9intbitset_3__cmp__(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs) {
   int __pyx_r;
   PyObject *__pyx_t_1 = NULL;
   __Pyx_RefNannySetupContext("__cmp__");
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_rhs), __pyx_ptype_3lib_9intbitset_intbitset, 0, "rhs", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 281; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_rhs), __pyx_ptype_9intbitset_intbitset, 0, "rhs", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 363; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-  /* "lib/intbitset.pyx":282
+  /* "intbitset.pyx":364
  * 
  *     def __cmp__(self, intbitset rhs not None):
  *         raise TypeError("cannot compare intbitset using cmp()")             # <<<<<<<<<<<<<<
  * 
  *     def __richcmp__(self, intbitset rhs not None, int op):
  */
-  __pyx_t_1 = PyObject_Call(__pyx_builtin_TypeError, ((PyObject *)__pyx_k_tuple_19), NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 282; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyObject_Call(__pyx_builtin_TypeError, ((PyObject *)__pyx_k_tuple_22), NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 364; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_Raise(__pyx_t_1, 0, 0);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  {__pyx_filename = __pyx_f[0]; __pyx_lineno = 282; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  {__pyx_filename = __pyx_f[0]; __pyx_lineno = 364; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
   __pyx_r = 0;
   goto __pyx_L0;
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("lib.intbitset.intbitset.__cmp__");
+  __Pyx_AddTraceback("intbitset.intbitset.__cmp__");
   __pyx_r = -1;
   __pyx_L0:;
   __Pyx_RefNannyFinishContext();
@@ -2665,7 +3024,7 @@ static int __pyx_pf_3lib_9intbitset_9intbitset_3__cmp__(PyObject *__pyx_v_self,
 }
 #endif /*!(#if PY_MAJOR_VERSION < 3)*/
 
-/* "lib/intbitset.pyx":284
+/* "intbitset.pyx":366
  *         raise TypeError("cannot compare intbitset using cmp()")
  * 
  *     def __richcmp__(self, intbitset rhs not None, int op):             # <<<<<<<<<<<<<<
@@ -2673,26 +3032,26 @@ static int __pyx_pf_3lib_9intbitset_9intbitset_3__cmp__(PyObject *__pyx_v_self,
  *         tmp = intBitSetCmp((<intbitset>self).bitset, rhs.bitset)
  */
 
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_4__richcmp__(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs, int __pyx_v_op); /*proto*/
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_4__richcmp__(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs, int __pyx_v_op) {
+static PyObject *__pyx_pf_9intbitset_9intbitset_4__richcmp__(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs, int __pyx_v_op); /*proto*/
+static PyObject *__pyx_pf_9intbitset_9intbitset_4__richcmp__(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs, int __pyx_v_op) {
   unsigned short __pyx_v_tmp;
   PyObject *__pyx_r = NULL;
   int __pyx_t_1;
   PyObject *__pyx_t_2 = NULL;
   unsigned short __pyx_t_3;
   __Pyx_RefNannySetupContext("__richcmp__");
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_rhs), __pyx_ptype_3lib_9intbitset_intbitset, 0, "rhs", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 284; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_rhs), __pyx_ptype_9intbitset_intbitset, 0, "rhs", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 366; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-  /* "lib/intbitset.pyx":286
+  /* "intbitset.pyx":368
  *     def __richcmp__(self, intbitset rhs not None, int op):
  *         cdef short unsigned int tmp
  *         tmp = intBitSetCmp((<intbitset>self).bitset, rhs.bitset)             # <<<<<<<<<<<<<<
  *         if op == 0: # <
  *             return tmp == 1
  */
-  __pyx_v_tmp = intBitSetCmp(((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->bitset, ((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_rhs)->bitset);
+  __pyx_v_tmp = intBitSetCmp(((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->bitset, ((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_rhs)->bitset);
 
-  /* "lib/intbitset.pyx":287
+  /* "intbitset.pyx":369
  *         cdef short unsigned int tmp
  *         tmp = intBitSetCmp((<intbitset>self).bitset, rhs.bitset)
  *         if op == 0: # <             # <<<<<<<<<<<<<<
@@ -2702,7 +3061,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_4__richcmp__(PyObject *__py
   __pyx_t_1 = (__pyx_v_op == 0);
   if (__pyx_t_1) {
 
-    /* "lib/intbitset.pyx":288
+    /* "intbitset.pyx":370
  *         tmp = intBitSetCmp((<intbitset>self).bitset, rhs.bitset)
  *         if op == 0: # <
  *             return tmp == 1             # <<<<<<<<<<<<<<
@@ -2710,7 +3069,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_4__richcmp__(PyObject *__py
  *             return tmp <= 1
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = __Pyx_PyBool_FromLong((__pyx_v_tmp == 1)); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 288; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = __Pyx_PyBool_FromLong((__pyx_v_tmp == 1)); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 370; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
@@ -2719,7 +3078,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_4__richcmp__(PyObject *__py
   }
   __pyx_L5:;
 
-  /* "lib/intbitset.pyx":289
+  /* "intbitset.pyx":371
  *         if op == 0: # <
  *             return tmp == 1
  *         if op == 1: # <=             # <<<<<<<<<<<<<<
@@ -2729,7 +3088,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_4__richcmp__(PyObject *__py
   __pyx_t_1 = (__pyx_v_op == 1);
   if (__pyx_t_1) {
 
-    /* "lib/intbitset.pyx":290
+    /* "intbitset.pyx":372
  *             return tmp == 1
  *         if op == 1: # <=
  *             return tmp <= 1             # <<<<<<<<<<<<<<
@@ -2737,7 +3096,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_4__richcmp__(PyObject *__py
  *             return tmp == 0
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = __Pyx_PyBool_FromLong((__pyx_v_tmp <= 1)); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 290; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = __Pyx_PyBool_FromLong((__pyx_v_tmp <= 1)); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 372; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
@@ -2746,7 +3105,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_4__richcmp__(PyObject *__py
   }
   __pyx_L6:;
 
-  /* "lib/intbitset.pyx":291
+  /* "intbitset.pyx":373
  *         if op == 1: # <=
  *             return tmp <= 1
  *         if op == 2: # ==             # <<<<<<<<<<<<<<
@@ -2756,7 +3115,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_4__richcmp__(PyObject *__py
   __pyx_t_1 = (__pyx_v_op == 2);
   if (__pyx_t_1) {
 
-    /* "lib/intbitset.pyx":292
+    /* "intbitset.pyx":374
  *             return tmp <= 1
  *         if op == 2: # ==
  *             return tmp == 0             # <<<<<<<<<<<<<<
@@ -2764,7 +3123,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_4__richcmp__(PyObject *__py
  *             return tmp > 0
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = __Pyx_PyBool_FromLong((__pyx_v_tmp == 0)); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 292; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = __Pyx_PyBool_FromLong((__pyx_v_tmp == 0)); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 374; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
@@ -2773,7 +3132,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_4__richcmp__(PyObject *__py
   }
   __pyx_L7:;
 
-  /* "lib/intbitset.pyx":293
+  /* "intbitset.pyx":375
  *         if op == 2: # ==
  *             return tmp == 0
  *         if op == 3: # !=             # <<<<<<<<<<<<<<
@@ -2783,7 +3142,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_4__richcmp__(PyObject *__py
   __pyx_t_1 = (__pyx_v_op == 3);
   if (__pyx_t_1) {
 
-    /* "lib/intbitset.pyx":294
+    /* "intbitset.pyx":376
  *             return tmp == 0
  *         if op == 3: # !=
  *             return tmp > 0             # <<<<<<<<<<<<<<
@@ -2791,7 +3150,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_4__richcmp__(PyObject *__py
  *             return tmp == 2
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = __Pyx_PyBool_FromLong((__pyx_v_tmp > 0)); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 294; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = __Pyx_PyBool_FromLong((__pyx_v_tmp > 0)); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 376; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
@@ -2800,7 +3159,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_4__richcmp__(PyObject *__py
   }
   __pyx_L8:;
 
-  /* "lib/intbitset.pyx":295
+  /* "intbitset.pyx":377
  *         if op == 3: # !=
  *             return tmp > 0
  *         if op == 4: # >             # <<<<<<<<<<<<<<
@@ -2810,7 +3169,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_4__richcmp__(PyObject *__py
   __pyx_t_1 = (__pyx_v_op == 4);
   if (__pyx_t_1) {
 
-    /* "lib/intbitset.pyx":296
+    /* "intbitset.pyx":378
  *             return tmp > 0
  *         if op == 4: # >
  *             return tmp == 2             # <<<<<<<<<<<<<<
@@ -2818,7 +3177,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_4__richcmp__(PyObject *__py
  *             return tmp in (0, 2)
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = __Pyx_PyBool_FromLong((__pyx_v_tmp == 2)); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 296; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = __Pyx_PyBool_FromLong((__pyx_v_tmp == 2)); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 378; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
@@ -2827,7 +3186,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_4__richcmp__(PyObject *__py
   }
   __pyx_L9:;
 
-  /* "lib/intbitset.pyx":297
+  /* "intbitset.pyx":379
  *         if op == 4: # >
  *             return tmp == 2
  *         if op == 5: # >=             # <<<<<<<<<<<<<<
@@ -2837,7 +3196,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_4__richcmp__(PyObject *__py
   __pyx_t_1 = (__pyx_v_op == 5);
   if (__pyx_t_1) {
 
-    /* "lib/intbitset.pyx":298
+    /* "intbitset.pyx":380
  *             return tmp == 2
  *         if op == 5: # >=
  *             return tmp in (0, 2)             # <<<<<<<<<<<<<<
@@ -2855,7 +3214,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_4__richcmp__(PyObject *__py
       __pyx_t_1 = 0;
       break;
     }
-    __pyx_t_2 = __Pyx_PyBool_FromLong(__pyx_t_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 298; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = __Pyx_PyBool_FromLong(__pyx_t_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 380; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
@@ -2868,7 +3227,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_4__richcmp__(PyObject *__py
   goto __pyx_L0;
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_AddTraceback("lib.intbitset.intbitset.__richcmp__");
+  __Pyx_AddTraceback("intbitset.intbitset.__richcmp__");
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -2876,7 +3235,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_4__richcmp__(PyObject *__py
   return __pyx_r;
 }
 
-/* "lib/intbitset.pyx":300
+/* "intbitset.pyx":382
  *             return tmp in (0, 2)
  * 
  *     def __len__(self):             # <<<<<<<<<<<<<<
@@ -2884,19 +3243,19 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_4__richcmp__(PyObject *__py
  * 
  */
 
-static Py_ssize_t __pyx_pf_3lib_9intbitset_9intbitset_5__len__(PyObject *__pyx_v_self); /*proto*/
-static Py_ssize_t __pyx_pf_3lib_9intbitset_9intbitset_5__len__(PyObject *__pyx_v_self) {
+static Py_ssize_t __pyx_pf_9intbitset_9intbitset_5__len__(PyObject *__pyx_v_self); /*proto*/
+static Py_ssize_t __pyx_pf_9intbitset_9intbitset_5__len__(PyObject *__pyx_v_self) {
   Py_ssize_t __pyx_r;
   __Pyx_RefNannySetupContext("__len__");
 
-  /* "lib/intbitset.pyx":301
+  /* "intbitset.pyx":383
  * 
  *     def __len__(self):
  *         return intBitSetGetTot(self.bitset)             # <<<<<<<<<<<<<<
  * 
  *     def __hash__(self):
  */
-  __pyx_r = intBitSetGetTot(((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->bitset);
+  __pyx_r = intBitSetGetTot(((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->bitset);
   goto __pyx_L0;
 
   __pyx_r = 0;
@@ -2905,41 +3264,50 @@ static Py_ssize_t __pyx_pf_3lib_9intbitset_9intbitset_5__len__(PyObject *__pyx_v
   return __pyx_r;
 }
 
-/* "lib/intbitset.pyx":303
+/* "intbitset.pyx":385
  *         return intBitSetGetTot(self.bitset)
  * 
  *     def __hash__(self):             # <<<<<<<<<<<<<<
+ *         intBitSetExpand(self.bitset)
  *         return hash(PyString_FromStringAndSize(<char *>self.bitset.bitset, wordbytesize * (intBitSetGetTot(self.bitset) / wordbitsize + 1)))
- * 
  */
 
-static long __pyx_pf_3lib_9intbitset_9intbitset_6__hash__(PyObject *__pyx_v_self); /*proto*/
-static long __pyx_pf_3lib_9intbitset_9intbitset_6__hash__(PyObject *__pyx_v_self) {
+static long __pyx_pf_9intbitset_9intbitset_6__hash__(PyObject *__pyx_v_self); /*proto*/
+static long __pyx_pf_9intbitset_9intbitset_6__hash__(PyObject *__pyx_v_self) {
   long __pyx_r;
   int __pyx_t_1;
   PyObject *__pyx_t_2 = NULL;
   long __pyx_t_3;
   __Pyx_RefNannySetupContext("__hash__");
 
-  /* "lib/intbitset.pyx":304
+  /* "intbitset.pyx":386
  * 
  *     def __hash__(self):
+ *         intBitSetExpand(self.bitset)             # <<<<<<<<<<<<<<
+ *         return hash(PyString_FromStringAndSize(<char *>self.bitset.bitset, wordbytesize * (intBitSetGetTot(self.bitset) / wordbitsize + 1)))
+ * 
+ */
+  intBitSetExpand(((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->bitset);
+
+  /* "intbitset.pyx":387
+ *     def __hash__(self):
+ *         intBitSetExpand(self.bitset)
  *         return hash(PyString_FromStringAndSize(<char *>self.bitset.bitset, wordbytesize * (intBitSetGetTot(self.bitset) / wordbitsize + 1)))             # <<<<<<<<<<<<<<
  * 
  *     def __nonzero__(self):
  */
-  __pyx_t_1 = intBitSetGetTot(((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->bitset);
+  __pyx_t_1 = intBitSetGetTot(((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->bitset);
   if (unlikely(wordbitsize == 0)) {
     PyErr_Format(PyExc_ZeroDivisionError, "integer division or modulo by zero");
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 304; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 387; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   }
   else if (sizeof(int) == sizeof(long) && unlikely(wordbitsize == -1) && unlikely(UNARY_NEG_WOULD_OVERFLOW(__pyx_t_1))) {
     PyErr_Format(PyExc_OverflowError, "value too large to perform division");
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 304; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 387; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   }
-  __pyx_t_2 = PyString_FromStringAndSize(((char *)((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->bitset->bitset), (wordbytesize * (__Pyx_div_int(__pyx_t_1, wordbitsize) + 1))); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 304; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyString_FromStringAndSize(((char *)((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->bitset->bitset), (wordbytesize * (__Pyx_div_int(__pyx_t_1, wordbitsize) + 1))); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 387; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = PyObject_Hash(__pyx_t_2); if (unlikely(__pyx_t_3 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 304; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = PyObject_Hash(__pyx_t_2); if (unlikely(__pyx_t_3 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 387; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_r = __pyx_t_3;
   goto __pyx_L0;
@@ -2948,7 +3316,7 @@ static long __pyx_pf_3lib_9intbitset_9intbitset_6__hash__(PyObject *__pyx_v_self
   goto __pyx_L0;
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_AddTraceback("lib.intbitset.intbitset.__hash__");
+  __Pyx_AddTraceback("intbitset.intbitset.__hash__");
   __pyx_r = -1;
   __pyx_L0:;
   if (unlikely(__pyx_r == -1) && !PyErr_Occurred()) __pyx_r = -2;
@@ -2956,7 +3324,7 @@ static long __pyx_pf_3lib_9intbitset_9intbitset_6__hash__(PyObject *__pyx_v_self
   return __pyx_r;
 }
 
-/* "lib/intbitset.pyx":306
+/* "intbitset.pyx":389
  *         return hash(PyString_FromStringAndSize(<char *>self.bitset.bitset, wordbytesize * (intBitSetGetTot(self.bitset) / wordbitsize + 1)))
  * 
  *     def __nonzero__(self):             # <<<<<<<<<<<<<<
@@ -2964,19 +3332,19 @@ static long __pyx_pf_3lib_9intbitset_9intbitset_6__hash__(PyObject *__pyx_v_self
  * 
  */
 
-static int __pyx_pf_3lib_9intbitset_9intbitset_7__nonzero__(PyObject *__pyx_v_self); /*proto*/
-static int __pyx_pf_3lib_9intbitset_9intbitset_7__nonzero__(PyObject *__pyx_v_self) {
+static int __pyx_pf_9intbitset_9intbitset_7__nonzero__(PyObject *__pyx_v_self); /*proto*/
+static int __pyx_pf_9intbitset_9intbitset_7__nonzero__(PyObject *__pyx_v_self) {
   int __pyx_r;
   __Pyx_RefNannySetupContext("__nonzero__");
 
-  /* "lib/intbitset.pyx":307
+  /* "intbitset.pyx":390
  * 
  *     def __nonzero__(self):
  *         return not intBitSetEmpty(self.bitset)             # <<<<<<<<<<<<<<
  * 
  *     def __iadd__(self, rhs):
  */
-  __pyx_r = (!intBitSetEmpty(((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->bitset));
+  __pyx_r = (!intBitSetEmpty(((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->bitset));
   goto __pyx_L0;
 
   __pyx_r = 0;
@@ -2985,7 +3353,7 @@ static int __pyx_pf_3lib_9intbitset_9intbitset_7__nonzero__(PyObject *__pyx_v_se
   return __pyx_r;
 }
 
-/* "lib/intbitset.pyx":309
+/* "intbitset.pyx":392
  *         return not intBitSetEmpty(self.bitset)
  * 
  *     def __iadd__(self, rhs):             # <<<<<<<<<<<<<<
@@ -2993,8 +3361,8 @@ static int __pyx_pf_3lib_9intbitset_9intbitset_7__nonzero__(PyObject *__pyx_v_se
  *         if isinstance(rhs, (int, long)):
  */
 
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_8__iadd__(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs); /*proto*/
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_8__iadd__(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs) {
+static PyObject *__pyx_pf_9intbitset_9intbitset_8__iadd__(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs); /*proto*/
+static PyObject *__pyx_pf_9intbitset_9intbitset_8__iadd__(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs) {
   int __pyx_v_elem;
   PyObject *__pyx_r = NULL;
   PyObject *__pyx_t_1 = NULL;
@@ -3002,20 +3370,21 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_8__iadd__(PyObject *__pyx_v
   int __pyx_t_3;
   int __pyx_t_4;
   PyObject *__pyx_t_5 = NULL;
-  int __pyx_t_6;
-  Py_ssize_t __pyx_t_7;
-  PyObject *__pyx_t_8 = NULL;
+  IntBitSet *__pyx_t_6;
+  int __pyx_t_7;
+  Py_ssize_t __pyx_t_8;
+  PyObject *__pyx_t_9 = NULL;
   __Pyx_RefNannySetupContext("__iadd__");
 
-  /* "lib/intbitset.pyx":311
+  /* "intbitset.pyx":394
  *     def __iadd__(self, rhs):
  *         cdef int elem
  *         if isinstance(rhs, (int, long)):             # <<<<<<<<<<<<<<
  *             if self.sanity_checks:
  *                 if rhs < 0:
  */
-  __Pyx_INCREF(__pyx_v_rhs);
   __pyx_t_1 = __pyx_v_rhs;
+  __Pyx_INCREF(__pyx_t_1);
   __pyx_t_2 = PyInt_Check(__pyx_t_1); 
   if (!__pyx_t_2) {
     __pyx_t_3 = PyLong_Check(__pyx_t_1); 
@@ -3026,82 +3395,82 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_8__iadd__(PyObject *__pyx_v
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   if (__pyx_t_4) {
 
-    /* "lib/intbitset.pyx":312
+    /* "intbitset.pyx":395
  *         cdef int elem
  *         if isinstance(rhs, (int, long)):
  *             if self.sanity_checks:             # <<<<<<<<<<<<<<
  *                 if rhs < 0:
  *                     raise ValueError("Negative numbers, not allowed")
  */
-    if (((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->sanity_checks) {
+    if (((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->sanity_checks) {
 
-      /* "lib/intbitset.pyx":313
+      /* "intbitset.pyx":396
  *         if isinstance(rhs, (int, long)):
  *             if self.sanity_checks:
  *                 if rhs < 0:             # <<<<<<<<<<<<<<
  *                     raise ValueError("Negative numbers, not allowed")
  *                 elif rhs > maxelem:
  */
-      __pyx_t_1 = PyObject_RichCompare(__pyx_v_rhs, __pyx_int_0, Py_LT); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 313; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_1 = PyObject_RichCompare(__pyx_v_rhs, __pyx_int_0, Py_LT); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 396; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_1);
-      __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_4 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 313; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_4 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 396; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
       if (__pyx_t_4) {
 
-        /* "lib/intbitset.pyx":314
+        /* "intbitset.pyx":397
  *             if self.sanity_checks:
  *                 if rhs < 0:
  *                     raise ValueError("Negative numbers, not allowed")             # <<<<<<<<<<<<<<
  *                 elif rhs > maxelem:
  *                     raise OverflowError("rhs must be <= %s" % maxelem)
  */
-        __pyx_t_1 = PyObject_Call(__pyx_builtin_ValueError, ((PyObject *)__pyx_k_tuple_20), NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 314; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        __pyx_t_1 = PyObject_Call(__pyx_builtin_ValueError, ((PyObject *)__pyx_k_tuple_23), NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 397; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
         __Pyx_GOTREF(__pyx_t_1);
         __Pyx_Raise(__pyx_t_1, 0, 0);
         __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-        {__pyx_filename = __pyx_f[0]; __pyx_lineno = 314; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        {__pyx_filename = __pyx_f[0]; __pyx_lineno = 397; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
         goto __pyx_L7;
       }
 
-      /* "lib/intbitset.pyx":315
+      /* "intbitset.pyx":398
  *                 if rhs < 0:
  *                     raise ValueError("Negative numbers, not allowed")
  *                 elif rhs > maxelem:             # <<<<<<<<<<<<<<
  *                     raise OverflowError("rhs must be <= %s" % maxelem)
  *             intBitSetAddElem(self.bitset, rhs)
  */
-      __pyx_t_1 = PyInt_FromLong(maxelem); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 315; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_1 = PyInt_FromLong(maxelem); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 398; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_1);
-      __pyx_t_5 = PyObject_RichCompare(__pyx_v_rhs, __pyx_t_1, Py_GT); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 315; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_5 = PyObject_RichCompare(__pyx_v_rhs, __pyx_t_1, Py_GT); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 398; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_5);
       __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_4 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 315; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_4 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 398; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
       if (__pyx_t_4) {
 
-        /* "lib/intbitset.pyx":316
+        /* "intbitset.pyx":399
  *                     raise ValueError("Negative numbers, not allowed")
  *                 elif rhs > maxelem:
  *                     raise OverflowError("rhs must be <= %s" % maxelem)             # <<<<<<<<<<<<<<
  *             intBitSetAddElem(self.bitset, rhs)
  *         elif isinstance(rhs, intbitset):
  */
-        __pyx_t_5 = PyInt_FromLong(maxelem); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 316; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        __pyx_t_5 = PyInt_FromLong(maxelem); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 399; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
         __Pyx_GOTREF(__pyx_t_5);
-        __pyx_t_1 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_21), __pyx_t_5); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 316; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        __pyx_t_1 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_24), __pyx_t_5); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 399; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
         __Pyx_GOTREF(((PyObject *)__pyx_t_1));
         __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-        __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 316; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 399; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
         __Pyx_GOTREF(((PyObject *)__pyx_t_5));
         PyTuple_SET_ITEM(__pyx_t_5, 0, ((PyObject *)__pyx_t_1));
         __Pyx_GIVEREF(((PyObject *)__pyx_t_1));
         __pyx_t_1 = 0;
-        __pyx_t_1 = PyObject_Call(__pyx_builtin_OverflowError, ((PyObject *)__pyx_t_5), NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 316; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        __pyx_t_1 = PyObject_Call(__pyx_builtin_OverflowError, ((PyObject *)__pyx_t_5), NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 399; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
         __Pyx_GOTREF(__pyx_t_1);
         __Pyx_DECREF(((PyObject *)__pyx_t_5)); __pyx_t_5 = 0;
         __Pyx_Raise(__pyx_t_1, 0, 0);
         __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-        {__pyx_filename = __pyx_f[0]; __pyx_lineno = 316; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        {__pyx_filename = __pyx_f[0]; __pyx_lineno = 399; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
         goto __pyx_L7;
       }
       __pyx_L7:;
@@ -3109,50 +3478,57 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_8__iadd__(PyObject *__pyx_v
     }
     __pyx_L6:;
 
-    /* "lib/intbitset.pyx":317
+    /* "intbitset.pyx":400
  *                 elif rhs > maxelem:
  *                     raise OverflowError("rhs must be <= %s" % maxelem)
  *             intBitSetAddElem(self.bitset, rhs)             # <<<<<<<<<<<<<<
  *         elif isinstance(rhs, intbitset):
  *             intBitSetIUnion(self.bitset, (<intbitset> rhs).bitset)
  */
-    __pyx_t_6 = __Pyx_PyInt_AsInt(__pyx_v_rhs); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 317; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    intBitSetAddElem(((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->bitset, __pyx_t_6);
+    __pyx_t_6 = ((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->bitset;
+    __pyx_t_7 = __Pyx_PyInt_AsInt(__pyx_v_rhs); if (unlikely((__pyx_t_7 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 400; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    intBitSetAddElem(__pyx_t_6, __pyx_t_7);
     goto __pyx_L5;
   }
 
-  /* "lib/intbitset.pyx":318
+  /* "intbitset.pyx":401
  *                     raise OverflowError("rhs must be <= %s" % maxelem)
  *             intBitSetAddElem(self.bitset, rhs)
  *         elif isinstance(rhs, intbitset):             # <<<<<<<<<<<<<<
  *             intBitSetIUnion(self.bitset, (<intbitset> rhs).bitset)
  *         else:
  */
-  __pyx_t_4 = __Pyx_TypeCheck(__pyx_v_rhs, ((PyObject*)__pyx_ptype_3lib_9intbitset_intbitset)); 
+  __pyx_t_1 = __pyx_v_rhs;
+  __Pyx_INCREF(__pyx_t_1);
+  __pyx_t_5 = ((PyObject *)((PyObject*)__pyx_ptype_9intbitset_intbitset));
+  __Pyx_INCREF(__pyx_t_5);
+  __pyx_t_4 = __Pyx_TypeCheck(__pyx_t_1, __pyx_t_5); 
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
   if (__pyx_t_4) {
 
-    /* "lib/intbitset.pyx":319
+    /* "intbitset.pyx":402
  *             intBitSetAddElem(self.bitset, rhs)
  *         elif isinstance(rhs, intbitset):
  *             intBitSetIUnion(self.bitset, (<intbitset> rhs).bitset)             # <<<<<<<<<<<<<<
  *         else:
  *             if self.sanity_checks:
  */
-    intBitSetIUnion(((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->bitset, ((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_rhs)->bitset);
+    intBitSetIUnion(((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->bitset, ((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_rhs)->bitset);
     goto __pyx_L5;
   }
   /*else*/ {
 
-    /* "lib/intbitset.pyx":321
+    /* "intbitset.pyx":404
  *             intBitSetIUnion(self.bitset, (<intbitset> rhs).bitset)
  *         else:
  *             if self.sanity_checks:             # <<<<<<<<<<<<<<
  *                 for elem in rhs:
  *                     if elem < 0:
  */
-    if (((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->sanity_checks) {
+    if (((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->sanity_checks) {
 
-      /* "lib/intbitset.pyx":322
+      /* "intbitset.pyx":405
  *         else:
  *             if self.sanity_checks:
  *                 for elem in rhs:             # <<<<<<<<<<<<<<
@@ -3160,31 +3536,31 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_8__iadd__(PyObject *__pyx_v
  *                         raise ValueError("Negative numbers, not allowed")
  */
       if (PyList_CheckExact(__pyx_v_rhs) || PyTuple_CheckExact(__pyx_v_rhs)) {
-        __pyx_t_7 = 0; __pyx_t_1 = __pyx_v_rhs; __Pyx_INCREF(__pyx_t_1);
+        __pyx_t_8 = 0; __pyx_t_5 = __pyx_v_rhs; __Pyx_INCREF(__pyx_t_5);
       } else {
-        __pyx_t_7 = -1; __pyx_t_1 = PyObject_GetIter(__pyx_v_rhs); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 322; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __Pyx_GOTREF(__pyx_t_1);
+        __pyx_t_8 = -1; __pyx_t_5 = PyObject_GetIter(__pyx_v_rhs); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 405; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        __Pyx_GOTREF(__pyx_t_5);
       }
       for (;;) {
-        if (likely(PyList_CheckExact(__pyx_t_1))) {
-          if (__pyx_t_7 >= PyList_GET_SIZE(__pyx_t_1)) break;
-          __pyx_t_5 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_7); __Pyx_INCREF(__pyx_t_5); __pyx_t_7++;
-        } else if (likely(PyTuple_CheckExact(__pyx_t_1))) {
-          if (__pyx_t_7 >= PyTuple_GET_SIZE(__pyx_t_1)) break;
-          __pyx_t_5 = PyTuple_GET_ITEM(__pyx_t_1, __pyx_t_7); __Pyx_INCREF(__pyx_t_5); __pyx_t_7++;
+        if (likely(PyList_CheckExact(__pyx_t_5))) {
+          if (__pyx_t_8 >= PyList_GET_SIZE(__pyx_t_5)) break;
+          __pyx_t_1 = PyList_GET_ITEM(__pyx_t_5, __pyx_t_8); __Pyx_INCREF(__pyx_t_1); __pyx_t_8++;
+        } else if (likely(PyTuple_CheckExact(__pyx_t_5))) {
+          if (__pyx_t_8 >= PyTuple_GET_SIZE(__pyx_t_5)) break;
+          __pyx_t_1 = PyTuple_GET_ITEM(__pyx_t_5, __pyx_t_8); __Pyx_INCREF(__pyx_t_1); __pyx_t_8++;
         } else {
-          __pyx_t_5 = PyIter_Next(__pyx_t_1);
-          if (!__pyx_t_5) {
-            if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 322; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+          __pyx_t_1 = PyIter_Next(__pyx_t_5);
+          if (!__pyx_t_1) {
+            if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 405; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
             break;
           }
-          __Pyx_GOTREF(__pyx_t_5);
+          __Pyx_GOTREF(__pyx_t_1);
         }
-        __pyx_t_6 = __Pyx_PyInt_AsInt(__pyx_t_5); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 322; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-        __pyx_v_elem = __pyx_t_6;
+        __pyx_t_7 = __Pyx_PyInt_AsInt(__pyx_t_1); if (unlikely((__pyx_t_7 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 405; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        __pyx_v_elem = __pyx_t_7;
 
-        /* "lib/intbitset.pyx":323
+        /* "intbitset.pyx":406
  *             if self.sanity_checks:
  *                 for elem in rhs:
  *                     if elem < 0:             # <<<<<<<<<<<<<<
@@ -3194,22 +3570,22 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_8__iadd__(PyObject *__pyx_v
         __pyx_t_4 = (__pyx_v_elem < 0);
         if (__pyx_t_4) {
 
-          /* "lib/intbitset.pyx":324
+          /* "intbitset.pyx":407
  *                 for elem in rhs:
  *                     if elem < 0:
  *                         raise ValueError("Negative numbers, not allowed")             # <<<<<<<<<<<<<<
  *                     elif elem > maxelem:
  *                         raise OverflowError("Elements must be <= %s" % maxelem)
  */
-          __pyx_t_5 = PyObject_Call(__pyx_builtin_ValueError, ((PyObject *)__pyx_k_tuple_22), NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 324; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-          __Pyx_GOTREF(__pyx_t_5);
-          __Pyx_Raise(__pyx_t_5, 0, 0);
-          __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-          {__pyx_filename = __pyx_f[0]; __pyx_lineno = 324; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+          __pyx_t_1 = PyObject_Call(__pyx_builtin_ValueError, ((PyObject *)__pyx_k_tuple_25), NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 407; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+          __Pyx_GOTREF(__pyx_t_1);
+          __Pyx_Raise(__pyx_t_1, 0, 0);
+          __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+          {__pyx_filename = __pyx_f[0]; __pyx_lineno = 407; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
           goto __pyx_L11;
         }
 
-        /* "lib/intbitset.pyx":325
+        /* "intbitset.pyx":408
  *                     if elem < 0:
  *                         raise ValueError("Negative numbers, not allowed")
  *                     elif elem > maxelem:             # <<<<<<<<<<<<<<
@@ -3219,48 +3595,48 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_8__iadd__(PyObject *__pyx_v
         __pyx_t_4 = (__pyx_v_elem > maxelem);
         if (__pyx_t_4) {
 
-          /* "lib/intbitset.pyx":326
+          /* "intbitset.pyx":409
  *                         raise ValueError("Negative numbers, not allowed")
  *                     elif elem > maxelem:
  *                         raise OverflowError("Elements must be <= %s" % maxelem)             # <<<<<<<<<<<<<<
  *                     intBitSetAddElem(self.bitset, elem)
  *             else:
  */
-          __pyx_t_5 = PyInt_FromLong(maxelem); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 326; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-          __Pyx_GOTREF(__pyx_t_5);
-          __pyx_t_8 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_10), __pyx_t_5); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 326; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-          __Pyx_GOTREF(((PyObject *)__pyx_t_8));
-          __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-          __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 326; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-          __Pyx_GOTREF(((PyObject *)__pyx_t_5));
-          PyTuple_SET_ITEM(__pyx_t_5, 0, ((PyObject *)__pyx_t_8));
-          __Pyx_GIVEREF(((PyObject *)__pyx_t_8));
-          __pyx_t_8 = 0;
-          __pyx_t_8 = PyObject_Call(__pyx_builtin_OverflowError, ((PyObject *)__pyx_t_5), NULL); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 326; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-          __Pyx_GOTREF(__pyx_t_8);
-          __Pyx_DECREF(((PyObject *)__pyx_t_5)); __pyx_t_5 = 0;
-          __Pyx_Raise(__pyx_t_8, 0, 0);
-          __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-          {__pyx_filename = __pyx_f[0]; __pyx_lineno = 326; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+          __pyx_t_1 = PyInt_FromLong(maxelem); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 409; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+          __Pyx_GOTREF(__pyx_t_1);
+          __pyx_t_9 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_13), __pyx_t_1); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 409; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+          __Pyx_GOTREF(((PyObject *)__pyx_t_9));
+          __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+          __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 409; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+          __Pyx_GOTREF(((PyObject *)__pyx_t_1));
+          PyTuple_SET_ITEM(__pyx_t_1, 0, ((PyObject *)__pyx_t_9));
+          __Pyx_GIVEREF(((PyObject *)__pyx_t_9));
+          __pyx_t_9 = 0;
+          __pyx_t_9 = PyObject_Call(__pyx_builtin_OverflowError, ((PyObject *)__pyx_t_1), NULL); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 409; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+          __Pyx_GOTREF(__pyx_t_9);
+          __Pyx_DECREF(((PyObject *)__pyx_t_1)); __pyx_t_1 = 0;
+          __Pyx_Raise(__pyx_t_9, 0, 0);
+          __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+          {__pyx_filename = __pyx_f[0]; __pyx_lineno = 409; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
           goto __pyx_L11;
         }
         __pyx_L11:;
 
-        /* "lib/intbitset.pyx":327
+        /* "intbitset.pyx":410
  *                     elif elem > maxelem:
  *                         raise OverflowError("Elements must be <= %s" % maxelem)
  *                     intBitSetAddElem(self.bitset, elem)             # <<<<<<<<<<<<<<
  *             else:
  *                 for elem in rhs:
  */
-        intBitSetAddElem(((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->bitset, __pyx_v_elem);
+        intBitSetAddElem(((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->bitset, __pyx_v_elem);
       }
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
       goto __pyx_L8;
     }
     /*else*/ {
 
-      /* "lib/intbitset.pyx":329
+      /* "intbitset.pyx":412
  *                     intBitSetAddElem(self.bitset, elem)
  *             else:
  *                 for elem in rhs:             # <<<<<<<<<<<<<<
@@ -3268,31 +3644,31 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_8__iadd__(PyObject *__pyx_v
  *                         raise ValueError("Negative numbers, not allowed")
  */
       if (PyList_CheckExact(__pyx_v_rhs) || PyTuple_CheckExact(__pyx_v_rhs)) {
-        __pyx_t_7 = 0; __pyx_t_1 = __pyx_v_rhs; __Pyx_INCREF(__pyx_t_1);
+        __pyx_t_8 = 0; __pyx_t_5 = __pyx_v_rhs; __Pyx_INCREF(__pyx_t_5);
       } else {
-        __pyx_t_7 = -1; __pyx_t_1 = PyObject_GetIter(__pyx_v_rhs); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 329; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __Pyx_GOTREF(__pyx_t_1);
+        __pyx_t_8 = -1; __pyx_t_5 = PyObject_GetIter(__pyx_v_rhs); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 412; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        __Pyx_GOTREF(__pyx_t_5);
       }
       for (;;) {
-        if (likely(PyList_CheckExact(__pyx_t_1))) {
-          if (__pyx_t_7 >= PyList_GET_SIZE(__pyx_t_1)) break;
-          __pyx_t_8 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_7); __Pyx_INCREF(__pyx_t_8); __pyx_t_7++;
-        } else if (likely(PyTuple_CheckExact(__pyx_t_1))) {
-          if (__pyx_t_7 >= PyTuple_GET_SIZE(__pyx_t_1)) break;
-          __pyx_t_8 = PyTuple_GET_ITEM(__pyx_t_1, __pyx_t_7); __Pyx_INCREF(__pyx_t_8); __pyx_t_7++;
+        if (likely(PyList_CheckExact(__pyx_t_5))) {
+          if (__pyx_t_8 >= PyList_GET_SIZE(__pyx_t_5)) break;
+          __pyx_t_9 = PyList_GET_ITEM(__pyx_t_5, __pyx_t_8); __Pyx_INCREF(__pyx_t_9); __pyx_t_8++;
+        } else if (likely(PyTuple_CheckExact(__pyx_t_5))) {
+          if (__pyx_t_8 >= PyTuple_GET_SIZE(__pyx_t_5)) break;
+          __pyx_t_9 = PyTuple_GET_ITEM(__pyx_t_5, __pyx_t_8); __Pyx_INCREF(__pyx_t_9); __pyx_t_8++;
         } else {
-          __pyx_t_8 = PyIter_Next(__pyx_t_1);
-          if (!__pyx_t_8) {
-            if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 329; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+          __pyx_t_9 = PyIter_Next(__pyx_t_5);
+          if (!__pyx_t_9) {
+            if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 412; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
             break;
           }
-          __Pyx_GOTREF(__pyx_t_8);
+          __Pyx_GOTREF(__pyx_t_9);
         }
-        __pyx_t_6 = __Pyx_PyInt_AsInt(__pyx_t_8); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 329; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-        __pyx_v_elem = __pyx_t_6;
+        __pyx_t_7 = __Pyx_PyInt_AsInt(__pyx_t_9); if (unlikely((__pyx_t_7 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 412; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+        __pyx_v_elem = __pyx_t_7;
 
-        /* "lib/intbitset.pyx":330
+        /* "intbitset.pyx":413
  *             else:
  *                 for elem in rhs:
  *                     if elem < 0:             # <<<<<<<<<<<<<<
@@ -3302,22 +3678,22 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_8__iadd__(PyObject *__pyx_v
         __pyx_t_4 = (__pyx_v_elem < 0);
         if (__pyx_t_4) {
 
-          /* "lib/intbitset.pyx":331
+          /* "intbitset.pyx":414
  *                 for elem in rhs:
  *                     if elem < 0:
  *                         raise ValueError("Negative numbers, not allowed")             # <<<<<<<<<<<<<<
  *                     elif elem > maxelem:
  *                         raise OverflowError("Elements must be <= %s" % maxelem)
  */
-          __pyx_t_8 = PyObject_Call(__pyx_builtin_ValueError, ((PyObject *)__pyx_k_tuple_23), NULL); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 331; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-          __Pyx_GOTREF(__pyx_t_8);
-          __Pyx_Raise(__pyx_t_8, 0, 0);
-          __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-          {__pyx_filename = __pyx_f[0]; __pyx_lineno = 331; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+          __pyx_t_9 = PyObject_Call(__pyx_builtin_ValueError, ((PyObject *)__pyx_k_tuple_26), NULL); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 414; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+          __Pyx_GOTREF(__pyx_t_9);
+          __Pyx_Raise(__pyx_t_9, 0, 0);
+          __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+          {__pyx_filename = __pyx_f[0]; __pyx_lineno = 414; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
           goto __pyx_L14;
         }
 
-        /* "lib/intbitset.pyx":332
+        /* "intbitset.pyx":415
  *                     if elem < 0:
  *                         raise ValueError("Negative numbers, not allowed")
  *                     elif elem > maxelem:             # <<<<<<<<<<<<<<
@@ -3327,49 +3703,49 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_8__iadd__(PyObject *__pyx_v
         __pyx_t_4 = (__pyx_v_elem > maxelem);
         if (__pyx_t_4) {
 
-          /* "lib/intbitset.pyx":333
+          /* "intbitset.pyx":416
  *                         raise ValueError("Negative numbers, not allowed")
  *                     elif elem > maxelem:
  *                         raise OverflowError("Elements must be <= %s" % maxelem)             # <<<<<<<<<<<<<<
  *                     intBitSetAddElem(self.bitset, elem)
  *         return self
  */
-          __pyx_t_8 = PyInt_FromLong(maxelem); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 333; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-          __Pyx_GOTREF(__pyx_t_8);
-          __pyx_t_5 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_10), __pyx_t_8); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 333; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-          __Pyx_GOTREF(((PyObject *)__pyx_t_5));
-          __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-          __pyx_t_8 = PyTuple_New(1); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 333; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-          __Pyx_GOTREF(((PyObject *)__pyx_t_8));
-          PyTuple_SET_ITEM(__pyx_t_8, 0, ((PyObject *)__pyx_t_5));
-          __Pyx_GIVEREF(((PyObject *)__pyx_t_5));
-          __pyx_t_5 = 0;
-          __pyx_t_5 = PyObject_Call(__pyx_builtin_OverflowError, ((PyObject *)__pyx_t_8), NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 333; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-          __Pyx_GOTREF(__pyx_t_5);
-          __Pyx_DECREF(((PyObject *)__pyx_t_8)); __pyx_t_8 = 0;
-          __Pyx_Raise(__pyx_t_5, 0, 0);
-          __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-          {__pyx_filename = __pyx_f[0]; __pyx_lineno = 333; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+          __pyx_t_9 = PyInt_FromLong(maxelem); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 416; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+          __Pyx_GOTREF(__pyx_t_9);
+          __pyx_t_1 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_13), __pyx_t_9); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 416; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+          __Pyx_GOTREF(((PyObject *)__pyx_t_1));
+          __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+          __pyx_t_9 = PyTuple_New(1); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 416; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+          __Pyx_GOTREF(((PyObject *)__pyx_t_9));
+          PyTuple_SET_ITEM(__pyx_t_9, 0, ((PyObject *)__pyx_t_1));
+          __Pyx_GIVEREF(((PyObject *)__pyx_t_1));
+          __pyx_t_1 = 0;
+          __pyx_t_1 = PyObject_Call(__pyx_builtin_OverflowError, ((PyObject *)__pyx_t_9), NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 416; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+          __Pyx_GOTREF(__pyx_t_1);
+          __Pyx_DECREF(((PyObject *)__pyx_t_9)); __pyx_t_9 = 0;
+          __Pyx_Raise(__pyx_t_1, 0, 0);
+          __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+          {__pyx_filename = __pyx_f[0]; __pyx_lineno = 416; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
           goto __pyx_L14;
         }
         __pyx_L14:;
 
-        /* "lib/intbitset.pyx":334
+        /* "intbitset.pyx":417
  *                     elif elem > maxelem:
  *                         raise OverflowError("Elements must be <= %s" % maxelem)
  *                     intBitSetAddElem(self.bitset, elem)             # <<<<<<<<<<<<<<
  *         return self
  * 
  */
-        intBitSetAddElem(((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->bitset, __pyx_v_elem);
+        intBitSetAddElem(((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->bitset, __pyx_v_elem);
       }
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
     }
     __pyx_L8:;
   }
   __pyx_L5:;
 
-  /* "lib/intbitset.pyx":335
+  /* "intbitset.pyx":418
  *                         raise OverflowError("Elements must be <= %s" % maxelem)
  *                     intBitSetAddElem(self.bitset, elem)
  *         return self             # <<<<<<<<<<<<<<
@@ -3386,8 +3762,8 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_8__iadd__(PyObject *__pyx_v
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_XDECREF(__pyx_t_8);
-  __Pyx_AddTraceback("lib.intbitset.intbitset.__iadd__");
+  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_AddTraceback("intbitset.intbitset.__iadd__");
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -3395,7 +3771,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_8__iadd__(PyObject *__pyx_v
   return __pyx_r;
 }
 
-/* "lib/intbitset.pyx":337
+/* "intbitset.pyx":420
  *         return self
  * 
  *     def __isub__(self, rhs):             # <<<<<<<<<<<<<<
@@ -3403,8 +3779,8 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_8__iadd__(PyObject *__pyx_v
  *         if isinstance(rhs, (int, long)):
  */
 
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_9__isub__(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs); /*proto*/
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_9__isub__(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs) {
+static PyObject *__pyx_pf_9intbitset_9intbitset_9__isub__(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs); /*proto*/
+static PyObject *__pyx_pf_9intbitset_9intbitset_9__isub__(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs) {
   int __pyx_v_elem;
   PyObject *__pyx_r = NULL;
   PyObject *__pyx_t_1 = NULL;
@@ -3412,20 +3788,21 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_9__isub__(PyObject *__pyx_v
   int __pyx_t_3;
   int __pyx_t_4;
   PyObject *__pyx_t_5 = NULL;
-  int __pyx_t_6;
-  Py_ssize_t __pyx_t_7;
-  PyObject *__pyx_t_8 = NULL;
+  IntBitSet *__pyx_t_6;
+  int __pyx_t_7;
+  Py_ssize_t __pyx_t_8;
+  PyObject *__pyx_t_9 = NULL;
   __Pyx_RefNannySetupContext("__isub__");
 
-  /* "lib/intbitset.pyx":339
+  /* "intbitset.pyx":422
  *     def __isub__(self, rhs):
  *         cdef int elem
  *         if isinstance(rhs, (int, long)):             # <<<<<<<<<<<<<<
  *             if self.sanity_checks:
  *                 if rhs < 0:
  */
-  __Pyx_INCREF(__pyx_v_rhs);
   __pyx_t_1 = __pyx_v_rhs;
+  __Pyx_INCREF(__pyx_t_1);
   __pyx_t_2 = PyInt_Check(__pyx_t_1); 
   if (!__pyx_t_2) {
     __pyx_t_3 = PyLong_Check(__pyx_t_1); 
@@ -3436,82 +3813,82 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_9__isub__(PyObject *__pyx_v
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   if (__pyx_t_4) {
 
-    /* "lib/intbitset.pyx":340
+    /* "intbitset.pyx":423
  *         cdef int elem
  *         if isinstance(rhs, (int, long)):
  *             if self.sanity_checks:             # <<<<<<<<<<<<<<
  *                 if rhs < 0:
  *                     raise ValueError("Negative numbers, not allowed")
  */
-    if (((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->sanity_checks) {
+    if (((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->sanity_checks) {
 
-      /* "lib/intbitset.pyx":341
+      /* "intbitset.pyx":424
  *         if isinstance(rhs, (int, long)):
  *             if self.sanity_checks:
  *                 if rhs < 0:             # <<<<<<<<<<<<<<
  *                     raise ValueError("Negative numbers, not allowed")
  *                 elif rhs > maxelem:
  */
-      __pyx_t_1 = PyObject_RichCompare(__pyx_v_rhs, __pyx_int_0, Py_LT); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 341; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_1 = PyObject_RichCompare(__pyx_v_rhs, __pyx_int_0, Py_LT); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 424; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_1);
-      __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_4 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 341; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_4 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 424; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
       if (__pyx_t_4) {
 
-        /* "lib/intbitset.pyx":342
+        /* "intbitset.pyx":425
  *             if self.sanity_checks:
  *                 if rhs < 0:
  *                     raise ValueError("Negative numbers, not allowed")             # <<<<<<<<<<<<<<
  *                 elif rhs > maxelem:
  *                     raise OverflowError("rhs must be <= %s" % maxelem)
  */
-        __pyx_t_1 = PyObject_Call(__pyx_builtin_ValueError, ((PyObject *)__pyx_k_tuple_24), NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 342; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        __pyx_t_1 = PyObject_Call(__pyx_builtin_ValueError, ((PyObject *)__pyx_k_tuple_27), NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 425; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
         __Pyx_GOTREF(__pyx_t_1);
         __Pyx_Raise(__pyx_t_1, 0, 0);
         __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-        {__pyx_filename = __pyx_f[0]; __pyx_lineno = 342; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        {__pyx_filename = __pyx_f[0]; __pyx_lineno = 425; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
         goto __pyx_L7;
       }
 
-      /* "lib/intbitset.pyx":343
+      /* "intbitset.pyx":426
  *                 if rhs < 0:
  *                     raise ValueError("Negative numbers, not allowed")
  *                 elif rhs > maxelem:             # <<<<<<<<<<<<<<
  *                     raise OverflowError("rhs must be <= %s" % maxelem)
  *             intBitSetDelElem(self.bitset, rhs)
  */
-      __pyx_t_1 = PyInt_FromLong(maxelem); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 343; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_1 = PyInt_FromLong(maxelem); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 426; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_1);
-      __pyx_t_5 = PyObject_RichCompare(__pyx_v_rhs, __pyx_t_1, Py_GT); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 343; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_5 = PyObject_RichCompare(__pyx_v_rhs, __pyx_t_1, Py_GT); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 426; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_5);
       __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_4 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 343; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_4 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 426; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
       if (__pyx_t_4) {
 
-        /* "lib/intbitset.pyx":344
+        /* "intbitset.pyx":427
  *                     raise ValueError("Negative numbers, not allowed")
  *                 elif rhs > maxelem:
  *                     raise OverflowError("rhs must be <= %s" % maxelem)             # <<<<<<<<<<<<<<
  *             intBitSetDelElem(self.bitset, rhs)
  *         elif isinstance(rhs, intbitset):
  */
-        __pyx_t_5 = PyInt_FromLong(maxelem); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 344; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        __pyx_t_5 = PyInt_FromLong(maxelem); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 427; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
         __Pyx_GOTREF(__pyx_t_5);
-        __pyx_t_1 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_21), __pyx_t_5); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 344; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        __pyx_t_1 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_24), __pyx_t_5); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 427; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
         __Pyx_GOTREF(((PyObject *)__pyx_t_1));
         __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-        __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 344; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 427; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
         __Pyx_GOTREF(((PyObject *)__pyx_t_5));
         PyTuple_SET_ITEM(__pyx_t_5, 0, ((PyObject *)__pyx_t_1));
         __Pyx_GIVEREF(((PyObject *)__pyx_t_1));
         __pyx_t_1 = 0;
-        __pyx_t_1 = PyObject_Call(__pyx_builtin_OverflowError, ((PyObject *)__pyx_t_5), NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 344; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        __pyx_t_1 = PyObject_Call(__pyx_builtin_OverflowError, ((PyObject *)__pyx_t_5), NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 427; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
         __Pyx_GOTREF(__pyx_t_1);
         __Pyx_DECREF(((PyObject *)__pyx_t_5)); __pyx_t_5 = 0;
         __Pyx_Raise(__pyx_t_1, 0, 0);
         __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-        {__pyx_filename = __pyx_f[0]; __pyx_lineno = 344; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        {__pyx_filename = __pyx_f[0]; __pyx_lineno = 427; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
         goto __pyx_L7;
       }
       __pyx_L7:;
@@ -3519,50 +3896,57 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_9__isub__(PyObject *__pyx_v
     }
     __pyx_L6:;
 
-    /* "lib/intbitset.pyx":345
+    /* "intbitset.pyx":428
  *                 elif rhs > maxelem:
  *                     raise OverflowError("rhs must be <= %s" % maxelem)
  *             intBitSetDelElem(self.bitset, rhs)             # <<<<<<<<<<<<<<
  *         elif isinstance(rhs, intbitset):
  *             intBitSetISub(self.bitset, (<intbitset> rhs).bitset)
  */
-    __pyx_t_6 = __Pyx_PyInt_AsInt(__pyx_v_rhs); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 345; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    intBitSetDelElem(((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->bitset, __pyx_t_6);
+    __pyx_t_6 = ((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->bitset;
+    __pyx_t_7 = __Pyx_PyInt_AsInt(__pyx_v_rhs); if (unlikely((__pyx_t_7 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 428; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    intBitSetDelElem(__pyx_t_6, __pyx_t_7);
     goto __pyx_L5;
   }
 
-  /* "lib/intbitset.pyx":346
+  /* "intbitset.pyx":429
  *                     raise OverflowError("rhs must be <= %s" % maxelem)
  *             intBitSetDelElem(self.bitset, rhs)
  *         elif isinstance(rhs, intbitset):             # <<<<<<<<<<<<<<
  *             intBitSetISub(self.bitset, (<intbitset> rhs).bitset)
  *         else:
  */
-  __pyx_t_4 = __Pyx_TypeCheck(__pyx_v_rhs, ((PyObject*)__pyx_ptype_3lib_9intbitset_intbitset)); 
+  __pyx_t_1 = __pyx_v_rhs;
+  __Pyx_INCREF(__pyx_t_1);
+  __pyx_t_5 = ((PyObject *)((PyObject*)__pyx_ptype_9intbitset_intbitset));
+  __Pyx_INCREF(__pyx_t_5);
+  __pyx_t_4 = __Pyx_TypeCheck(__pyx_t_1, __pyx_t_5); 
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
   if (__pyx_t_4) {
 
-    /* "lib/intbitset.pyx":347
+    /* "intbitset.pyx":430
  *             intBitSetDelElem(self.bitset, rhs)
  *         elif isinstance(rhs, intbitset):
  *             intBitSetISub(self.bitset, (<intbitset> rhs).bitset)             # <<<<<<<<<<<<<<
  *         else:
  *             if self.sanity_checks:
  */
-    intBitSetISub(((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->bitset, ((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_rhs)->bitset);
+    intBitSetISub(((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->bitset, ((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_rhs)->bitset);
     goto __pyx_L5;
   }
   /*else*/ {
 
-    /* "lib/intbitset.pyx":349
+    /* "intbitset.pyx":432
  *             intBitSetISub(self.bitset, (<intbitset> rhs).bitset)
  *         else:
  *             if self.sanity_checks:             # <<<<<<<<<<<<<<
  *                 for elem in rhs:
  *                     if elem < 0:
  */
-    if (((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->sanity_checks) {
+    if (((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->sanity_checks) {
 
-      /* "lib/intbitset.pyx":350
+      /* "intbitset.pyx":433
  *         else:
  *             if self.sanity_checks:
  *                 for elem in rhs:             # <<<<<<<<<<<<<<
@@ -3570,31 +3954,31 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_9__isub__(PyObject *__pyx_v
  *                         raise ValueError("Negative numbers, not allowed")
  */
       if (PyList_CheckExact(__pyx_v_rhs) || PyTuple_CheckExact(__pyx_v_rhs)) {
-        __pyx_t_7 = 0; __pyx_t_1 = __pyx_v_rhs; __Pyx_INCREF(__pyx_t_1);
+        __pyx_t_8 = 0; __pyx_t_5 = __pyx_v_rhs; __Pyx_INCREF(__pyx_t_5);
       } else {
-        __pyx_t_7 = -1; __pyx_t_1 = PyObject_GetIter(__pyx_v_rhs); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 350; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __Pyx_GOTREF(__pyx_t_1);
+        __pyx_t_8 = -1; __pyx_t_5 = PyObject_GetIter(__pyx_v_rhs); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 433; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        __Pyx_GOTREF(__pyx_t_5);
       }
       for (;;) {
-        if (likely(PyList_CheckExact(__pyx_t_1))) {
-          if (__pyx_t_7 >= PyList_GET_SIZE(__pyx_t_1)) break;
-          __pyx_t_5 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_7); __Pyx_INCREF(__pyx_t_5); __pyx_t_7++;
-        } else if (likely(PyTuple_CheckExact(__pyx_t_1))) {
-          if (__pyx_t_7 >= PyTuple_GET_SIZE(__pyx_t_1)) break;
-          __pyx_t_5 = PyTuple_GET_ITEM(__pyx_t_1, __pyx_t_7); __Pyx_INCREF(__pyx_t_5); __pyx_t_7++;
+        if (likely(PyList_CheckExact(__pyx_t_5))) {
+          if (__pyx_t_8 >= PyList_GET_SIZE(__pyx_t_5)) break;
+          __pyx_t_1 = PyList_GET_ITEM(__pyx_t_5, __pyx_t_8); __Pyx_INCREF(__pyx_t_1); __pyx_t_8++;
+        } else if (likely(PyTuple_CheckExact(__pyx_t_5))) {
+          if (__pyx_t_8 >= PyTuple_GET_SIZE(__pyx_t_5)) break;
+          __pyx_t_1 = PyTuple_GET_ITEM(__pyx_t_5, __pyx_t_8); __Pyx_INCREF(__pyx_t_1); __pyx_t_8++;
         } else {
-          __pyx_t_5 = PyIter_Next(__pyx_t_1);
-          if (!__pyx_t_5) {
-            if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 350; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+          __pyx_t_1 = PyIter_Next(__pyx_t_5);
+          if (!__pyx_t_1) {
+            if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 433; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
             break;
           }
-          __Pyx_GOTREF(__pyx_t_5);
+          __Pyx_GOTREF(__pyx_t_1);
         }
-        __pyx_t_6 = __Pyx_PyInt_AsInt(__pyx_t_5); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 350; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-        __pyx_v_elem = __pyx_t_6;
+        __pyx_t_7 = __Pyx_PyInt_AsInt(__pyx_t_1); if (unlikely((__pyx_t_7 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 433; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        __pyx_v_elem = __pyx_t_7;
 
-        /* "lib/intbitset.pyx":351
+        /* "intbitset.pyx":434
  *             if self.sanity_checks:
  *                 for elem in rhs:
  *                     if elem < 0:             # <<<<<<<<<<<<<<
@@ -3604,22 +3988,22 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_9__isub__(PyObject *__pyx_v
         __pyx_t_4 = (__pyx_v_elem < 0);
         if (__pyx_t_4) {
 
-          /* "lib/intbitset.pyx":352
+          /* "intbitset.pyx":435
  *                 for elem in rhs:
  *                     if elem < 0:
  *                         raise ValueError("Negative numbers, not allowed")             # <<<<<<<<<<<<<<
  *                     elif elem > maxelem:
  *                         raise OverflowError("Elements must be <= %s" % maxelem)
  */
-          __pyx_t_5 = PyObject_Call(__pyx_builtin_ValueError, ((PyObject *)__pyx_k_tuple_25), NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 352; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-          __Pyx_GOTREF(__pyx_t_5);
-          __Pyx_Raise(__pyx_t_5, 0, 0);
-          __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-          {__pyx_filename = __pyx_f[0]; __pyx_lineno = 352; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+          __pyx_t_1 = PyObject_Call(__pyx_builtin_ValueError, ((PyObject *)__pyx_k_tuple_28), NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 435; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+          __Pyx_GOTREF(__pyx_t_1);
+          __Pyx_Raise(__pyx_t_1, 0, 0);
+          __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+          {__pyx_filename = __pyx_f[0]; __pyx_lineno = 435; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
           goto __pyx_L11;
         }
 
-        /* "lib/intbitset.pyx":353
+        /* "intbitset.pyx":436
  *                     if elem < 0:
  *                         raise ValueError("Negative numbers, not allowed")
  *                     elif elem > maxelem:             # <<<<<<<<<<<<<<
@@ -3629,48 +4013,48 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_9__isub__(PyObject *__pyx_v
         __pyx_t_4 = (__pyx_v_elem > maxelem);
         if (__pyx_t_4) {
 
-          /* "lib/intbitset.pyx":354
+          /* "intbitset.pyx":437
  *                         raise ValueError("Negative numbers, not allowed")
  *                     elif elem > maxelem:
  *                         raise OverflowError("Elements must be <= %s" % maxelem)             # <<<<<<<<<<<<<<
  *                     intBitSetDelElem(self.bitset, elem)
  *             else:
  */
-          __pyx_t_5 = PyInt_FromLong(maxelem); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 354; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-          __Pyx_GOTREF(__pyx_t_5);
-          __pyx_t_8 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_10), __pyx_t_5); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 354; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-          __Pyx_GOTREF(((PyObject *)__pyx_t_8));
-          __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-          __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 354; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-          __Pyx_GOTREF(((PyObject *)__pyx_t_5));
-          PyTuple_SET_ITEM(__pyx_t_5, 0, ((PyObject *)__pyx_t_8));
-          __Pyx_GIVEREF(((PyObject *)__pyx_t_8));
-          __pyx_t_8 = 0;
-          __pyx_t_8 = PyObject_Call(__pyx_builtin_OverflowError, ((PyObject *)__pyx_t_5), NULL); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 354; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-          __Pyx_GOTREF(__pyx_t_8);
-          __Pyx_DECREF(((PyObject *)__pyx_t_5)); __pyx_t_5 = 0;
-          __Pyx_Raise(__pyx_t_8, 0, 0);
-          __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-          {__pyx_filename = __pyx_f[0]; __pyx_lineno = 354; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+          __pyx_t_1 = PyInt_FromLong(maxelem); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 437; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+          __Pyx_GOTREF(__pyx_t_1);
+          __pyx_t_9 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_13), __pyx_t_1); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 437; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+          __Pyx_GOTREF(((PyObject *)__pyx_t_9));
+          __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+          __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 437; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+          __Pyx_GOTREF(((PyObject *)__pyx_t_1));
+          PyTuple_SET_ITEM(__pyx_t_1, 0, ((PyObject *)__pyx_t_9));
+          __Pyx_GIVEREF(((PyObject *)__pyx_t_9));
+          __pyx_t_9 = 0;
+          __pyx_t_9 = PyObject_Call(__pyx_builtin_OverflowError, ((PyObject *)__pyx_t_1), NULL); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 437; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+          __Pyx_GOTREF(__pyx_t_9);
+          __Pyx_DECREF(((PyObject *)__pyx_t_1)); __pyx_t_1 = 0;
+          __Pyx_Raise(__pyx_t_9, 0, 0);
+          __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+          {__pyx_filename = __pyx_f[0]; __pyx_lineno = 437; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
           goto __pyx_L11;
         }
         __pyx_L11:;
 
-        /* "lib/intbitset.pyx":355
+        /* "intbitset.pyx":438
  *                     elif elem > maxelem:
  *                         raise OverflowError("Elements must be <= %s" % maxelem)
  *                     intBitSetDelElem(self.bitset, elem)             # <<<<<<<<<<<<<<
  *             else:
  *                 for elem in rhs:
  */
-        intBitSetDelElem(((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->bitset, __pyx_v_elem);
+        intBitSetDelElem(((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->bitset, __pyx_v_elem);
       }
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
       goto __pyx_L8;
     }
     /*else*/ {
 
-      /* "lib/intbitset.pyx":357
+      /* "intbitset.pyx":440
  *                     intBitSetDelElem(self.bitset, elem)
  *             else:
  *                 for elem in rhs:             # <<<<<<<<<<<<<<
@@ -3678,46 +4062,46 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_9__isub__(PyObject *__pyx_v
  *         return self
  */
       if (PyList_CheckExact(__pyx_v_rhs) || PyTuple_CheckExact(__pyx_v_rhs)) {
-        __pyx_t_7 = 0; __pyx_t_1 = __pyx_v_rhs; __Pyx_INCREF(__pyx_t_1);
+        __pyx_t_8 = 0; __pyx_t_5 = __pyx_v_rhs; __Pyx_INCREF(__pyx_t_5);
       } else {
-        __pyx_t_7 = -1; __pyx_t_1 = PyObject_GetIter(__pyx_v_rhs); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 357; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __Pyx_GOTREF(__pyx_t_1);
+        __pyx_t_8 = -1; __pyx_t_5 = PyObject_GetIter(__pyx_v_rhs); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 440; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        __Pyx_GOTREF(__pyx_t_5);
       }
       for (;;) {
-        if (likely(PyList_CheckExact(__pyx_t_1))) {
-          if (__pyx_t_7 >= PyList_GET_SIZE(__pyx_t_1)) break;
-          __pyx_t_8 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_7); __Pyx_INCREF(__pyx_t_8); __pyx_t_7++;
-        } else if (likely(PyTuple_CheckExact(__pyx_t_1))) {
-          if (__pyx_t_7 >= PyTuple_GET_SIZE(__pyx_t_1)) break;
-          __pyx_t_8 = PyTuple_GET_ITEM(__pyx_t_1, __pyx_t_7); __Pyx_INCREF(__pyx_t_8); __pyx_t_7++;
+        if (likely(PyList_CheckExact(__pyx_t_5))) {
+          if (__pyx_t_8 >= PyList_GET_SIZE(__pyx_t_5)) break;
+          __pyx_t_9 = PyList_GET_ITEM(__pyx_t_5, __pyx_t_8); __Pyx_INCREF(__pyx_t_9); __pyx_t_8++;
+        } else if (likely(PyTuple_CheckExact(__pyx_t_5))) {
+          if (__pyx_t_8 >= PyTuple_GET_SIZE(__pyx_t_5)) break;
+          __pyx_t_9 = PyTuple_GET_ITEM(__pyx_t_5, __pyx_t_8); __Pyx_INCREF(__pyx_t_9); __pyx_t_8++;
         } else {
-          __pyx_t_8 = PyIter_Next(__pyx_t_1);
-          if (!__pyx_t_8) {
-            if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 357; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+          __pyx_t_9 = PyIter_Next(__pyx_t_5);
+          if (!__pyx_t_9) {
+            if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 440; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
             break;
           }
-          __Pyx_GOTREF(__pyx_t_8);
+          __Pyx_GOTREF(__pyx_t_9);
         }
-        __pyx_t_6 = __Pyx_PyInt_AsInt(__pyx_t_8); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 357; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-        __pyx_v_elem = __pyx_t_6;
+        __pyx_t_7 = __Pyx_PyInt_AsInt(__pyx_t_9); if (unlikely((__pyx_t_7 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 440; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+        __pyx_v_elem = __pyx_t_7;
 
-        /* "lib/intbitset.pyx":358
+        /* "intbitset.pyx":441
  *             else:
  *                 for elem in rhs:
  *                     intBitSetDelElem(self.bitset, elem)             # <<<<<<<<<<<<<<
  *         return self
  * 
  */
-        intBitSetDelElem(((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->bitset, __pyx_v_elem);
+        intBitSetDelElem(((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->bitset, __pyx_v_elem);
       }
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
     }
     __pyx_L8:;
   }
   __pyx_L5:;
 
-  /* "lib/intbitset.pyx":359
+  /* "intbitset.pyx":442
  *                 for elem in rhs:
  *                     intBitSetDelElem(self.bitset, elem)
  *         return self             # <<<<<<<<<<<<<<
@@ -3734,8 +4118,8 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_9__isub__(PyObject *__pyx_v
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_XDECREF(__pyx_t_8);
-  __Pyx_AddTraceback("lib.intbitset.intbitset.__isub__");
+  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_AddTraceback("intbitset.intbitset.__isub__");
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -3743,7 +4127,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_9__isub__(PyObject *__pyx_v
   return __pyx_r;
 }
 
-/* "lib/intbitset.pyx":361
+/* "intbitset.pyx":444
  *         return self
  * 
  *     def __deepcopy__(self, memo):             # <<<<<<<<<<<<<<
@@ -3751,14 +4135,14 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_9__isub__(PyObject *__pyx_v
  * 
  */
 
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_10__deepcopy__(PyObject *__pyx_v_self, PyObject *__pyx_v_memo); /*proto*/
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_10__deepcopy__(PyObject *__pyx_v_self, PyObject *__pyx_v_memo) {
+static PyObject *__pyx_pf_9intbitset_9intbitset_10__deepcopy__(PyObject *__pyx_v_self, PyObject *__pyx_v_memo); /*proto*/
+static PyObject *__pyx_pf_9intbitset_9intbitset_10__deepcopy__(PyObject *__pyx_v_self, PyObject *__pyx_v_memo) {
   PyObject *__pyx_r = NULL;
   PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
   __Pyx_RefNannySetupContext("__deepcopy__");
 
-  /* "lib/intbitset.pyx":362
+  /* "intbitset.pyx":445
  * 
  *     def __deepcopy__(self, memo):
  *         return intbitset(self)             # <<<<<<<<<<<<<<
@@ -3766,12 +4150,12 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_10__deepcopy__(PyObject *__
  *     def __del__(self, int elem):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 362; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 445; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(((PyObject *)__pyx_t_1));
   __Pyx_INCREF(__pyx_v_self);
   PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_self);
   __Pyx_GIVEREF(__pyx_v_self);
-  __pyx_t_2 = PyObject_Call(((PyObject *)((PyObject*)__pyx_ptype_3lib_9intbitset_intbitset)), ((PyObject *)__pyx_t_1), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 362; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyObject_Call(((PyObject *)((PyObject*)__pyx_ptype_9intbitset_intbitset)), ((PyObject *)__pyx_t_1), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 445; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(((PyObject *)__pyx_t_1)); __pyx_t_1 = 0;
   __pyx_r = __pyx_t_2;
@@ -3783,7 +4167,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_10__deepcopy__(PyObject *__
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_AddTraceback("lib.intbitset.intbitset.__deepcopy__");
+  __Pyx_AddTraceback("intbitset.intbitset.__deepcopy__");
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -3791,7 +4175,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_10__deepcopy__(PyObject *__
   return __pyx_r;
 }
 
-/* "lib/intbitset.pyx":364
+/* "intbitset.pyx":447
  *         return intbitset(self)
  * 
  *     def __del__(self, int elem):             # <<<<<<<<<<<<<<
@@ -3799,8 +4183,8 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_10__deepcopy__(PyObject *__
  *             if elem < 0:
  */
 
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_11__del__(PyObject *__pyx_v_self, PyObject *__pyx_arg_elem); /*proto*/
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_11__del__(PyObject *__pyx_v_self, PyObject *__pyx_arg_elem) {
+static PyObject *__pyx_pf_9intbitset_9intbitset_11__del__(PyObject *__pyx_v_self, PyObject *__pyx_arg_elem); /*proto*/
+static PyObject *__pyx_pf_9intbitset_9intbitset_11__del__(PyObject *__pyx_v_self, PyObject *__pyx_arg_elem) {
   int __pyx_v_elem;
   PyObject *__pyx_r = NULL;
   int __pyx_t_1;
@@ -3808,25 +4192,25 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_11__del__(PyObject *__pyx_v
   PyObject *__pyx_t_3 = NULL;
   __Pyx_RefNannySetupContext("__del__");
   assert(__pyx_arg_elem); {
-    __pyx_v_elem = __Pyx_PyInt_AsInt(__pyx_arg_elem); if (unlikely((__pyx_v_elem == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 364; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_elem = __Pyx_PyInt_AsInt(__pyx_arg_elem); if (unlikely((__pyx_v_elem == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 447; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
-  __Pyx_AddTraceback("lib.intbitset.intbitset.__del__");
+  __Pyx_AddTraceback("intbitset.intbitset.__del__");
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
 
-  /* "lib/intbitset.pyx":365
+  /* "intbitset.pyx":448
  * 
  *     def __del__(self, int elem):
  *         if self.sanity_checks:             # <<<<<<<<<<<<<<
  *             if elem < 0:
  *                 raise ValueError("Negative numbers, not allowed")
  */
-  if (((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->sanity_checks) {
+  if (((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->sanity_checks) {
 
-    /* "lib/intbitset.pyx":366
+    /* "intbitset.pyx":449
  *     def __del__(self, int elem):
  *         if self.sanity_checks:
  *             if elem < 0:             # <<<<<<<<<<<<<<
@@ -3836,22 +4220,22 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_11__del__(PyObject *__pyx_v
     __pyx_t_1 = (__pyx_v_elem < 0);
     if (__pyx_t_1) {
 
-      /* "lib/intbitset.pyx":367
+      /* "intbitset.pyx":450
  *         if self.sanity_checks:
  *             if elem < 0:
  *                 raise ValueError("Negative numbers, not allowed")             # <<<<<<<<<<<<<<
  *             elif elem > maxelem:
  *                 raise OverflowError("Element must be <= %s" % maxelem)
  */
-      __pyx_t_2 = PyObject_Call(__pyx_builtin_ValueError, ((PyObject *)__pyx_k_tuple_26), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 367; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_2 = PyObject_Call(__pyx_builtin_ValueError, ((PyObject *)__pyx_k_tuple_29), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 450; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_2);
       __Pyx_Raise(__pyx_t_2, 0, 0);
       __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 367; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 450; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       goto __pyx_L6;
     }
 
-    /* "lib/intbitset.pyx":368
+    /* "intbitset.pyx":451
  *             if elem < 0:
  *                 raise ValueError("Negative numbers, not allowed")
  *             elif elem > maxelem:             # <<<<<<<<<<<<<<
@@ -3861,29 +4245,29 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_11__del__(PyObject *__pyx_v
     __pyx_t_1 = (__pyx_v_elem > maxelem);
     if (__pyx_t_1) {
 
-      /* "lib/intbitset.pyx":369
+      /* "intbitset.pyx":452
  *                 raise ValueError("Negative numbers, not allowed")
  *             elif elem > maxelem:
  *                 raise OverflowError("Element must be <= %s" % maxelem)             # <<<<<<<<<<<<<<
  *         intBitSetDelElem(self.bitset, elem)
  * 
  */
-      __pyx_t_2 = PyInt_FromLong(maxelem); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 369; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_2 = PyInt_FromLong(maxelem); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 452; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_2);
-      __pyx_t_3 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_17), __pyx_t_2); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 369; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_3 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_20), __pyx_t_2); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 452; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(((PyObject *)__pyx_t_3));
       __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 369; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 452; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(((PyObject *)__pyx_t_2));
       PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_t_3));
       __Pyx_GIVEREF(((PyObject *)__pyx_t_3));
       __pyx_t_3 = 0;
-      __pyx_t_3 = PyObject_Call(__pyx_builtin_OverflowError, ((PyObject *)__pyx_t_2), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 369; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_3 = PyObject_Call(__pyx_builtin_OverflowError, ((PyObject *)__pyx_t_2), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 452; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_3);
       __Pyx_DECREF(((PyObject *)__pyx_t_2)); __pyx_t_2 = 0;
       __Pyx_Raise(__pyx_t_3, 0, 0);
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 369; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 452; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       goto __pyx_L6;
     }
     __pyx_L6:;
@@ -3891,21 +4275,21 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_11__del__(PyObject *__pyx_v
   }
   __pyx_L5:;
 
-  /* "lib/intbitset.pyx":370
+  /* "intbitset.pyx":453
  *             elif elem > maxelem:
  *                 raise OverflowError("Element must be <= %s" % maxelem)
  *         intBitSetDelElem(self.bitset, elem)             # <<<<<<<<<<<<<<
  * 
  *     def __and__(self, intbitset rhs not None):
  */
-  intBitSetDelElem(((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->bitset, __pyx_v_elem);
+  intBitSetDelElem(((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->bitset, __pyx_v_elem);
 
   __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_AddTraceback("lib.intbitset.intbitset.__del__");
+  __Pyx_AddTraceback("intbitset.intbitset.__del__");
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -3913,7 +4297,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_11__del__(PyObject *__pyx_v
   return __pyx_r;
 }
 
-/* "lib/intbitset.pyx":372
+/* "intbitset.pyx":455
  *         intBitSetDelElem(self.bitset, elem)
  * 
  *     def __and__(self, intbitset rhs not None):             # <<<<<<<<<<<<<<
@@ -3921,43 +4305,43 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_11__del__(PyObject *__pyx_v
  *         (<intbitset>ret).bitset = intBitSetIntersection((<intbitset> self).bitset, rhs.bitset)
  */
 
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_12__and__(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs); /*proto*/
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_12__and__(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs) {
+static PyObject *__pyx_pf_9intbitset_9intbitset_12__and__(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs); /*proto*/
+static PyObject *__pyx_pf_9intbitset_9intbitset_12__and__(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs) {
   PyObject *__pyx_v_ret;
   PyObject *__pyx_r = NULL;
   PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
   __Pyx_RefNannySetupContext("__and__");
   __pyx_v_ret = Py_None; __Pyx_INCREF(Py_None);
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_rhs), __pyx_ptype_3lib_9intbitset_intbitset, 0, "rhs", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 372; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_rhs), __pyx_ptype_9intbitset_intbitset, 0, "rhs", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 455; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-  /* "lib/intbitset.pyx":373
+  /* "intbitset.pyx":456
  * 
  *     def __and__(self, intbitset rhs not None):
  *         ret = intbitset(no_allocate=1)             # <<<<<<<<<<<<<<
  *         (<intbitset>ret).bitset = intBitSetIntersection((<intbitset> self).bitset, rhs.bitset)
  *         return ret
  */
-  __pyx_t_1 = PyDict_New(); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 373; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyDict_New(); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 456; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(((PyObject *)__pyx_t_1));
-  if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__no_allocate), __pyx_int_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 373; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_2 = PyEval_CallObjectWithKeywords(((PyObject *)((PyObject*)__pyx_ptype_3lib_9intbitset_intbitset)), ((PyObject *)__pyx_empty_tuple), ((PyObject *)__pyx_t_1)); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 373; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__no_allocate), __pyx_int_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 456; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyEval_CallObjectWithKeywords(((PyObject *)((PyObject*)__pyx_ptype_9intbitset_intbitset)), ((PyObject *)__pyx_empty_tuple), ((PyObject *)__pyx_t_1)); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 456; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(((PyObject *)__pyx_t_1)); __pyx_t_1 = 0;
   __Pyx_DECREF(__pyx_v_ret);
   __pyx_v_ret = __pyx_t_2;
   __pyx_t_2 = 0;
 
-  /* "lib/intbitset.pyx":374
+  /* "intbitset.pyx":457
  *     def __and__(self, intbitset rhs not None):
  *         ret = intbitset(no_allocate=1)
  *         (<intbitset>ret).bitset = intBitSetIntersection((<intbitset> self).bitset, rhs.bitset)             # <<<<<<<<<<<<<<
  *         return ret
  * 
  */
-  ((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_ret)->bitset = intBitSetIntersection(((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->bitset, ((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_rhs)->bitset);
+  ((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_ret)->bitset = intBitSetIntersection(((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->bitset, ((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_rhs)->bitset);
 
-  /* "lib/intbitset.pyx":375
+  /* "intbitset.pyx":458
  *         ret = intbitset(no_allocate=1)
  *         (<intbitset>ret).bitset = intBitSetIntersection((<intbitset> self).bitset, rhs.bitset)
  *         return ret             # <<<<<<<<<<<<<<
@@ -3974,7 +4358,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_12__and__(PyObject *__pyx_v
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_AddTraceback("lib.intbitset.intbitset.__and__");
+  __Pyx_AddTraceback("intbitset.intbitset.__and__");
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_DECREF(__pyx_v_ret);
@@ -3983,7 +4367,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_12__and__(PyObject *__pyx_v
   return __pyx_r;
 }
 
-/* "lib/intbitset.pyx":377
+/* "intbitset.pyx":460
  *         return ret
  * 
  *     def __or__(self, intbitset rhs not None):             # <<<<<<<<<<<<<<
@@ -3991,43 +4375,43 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_12__and__(PyObject *__pyx_v
  *         (<intbitset>ret).bitset = intBitSetUnion((<intbitset> self).bitset, rhs.bitset)
  */
 
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_13__or__(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs); /*proto*/
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_13__or__(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs) {
+static PyObject *__pyx_pf_9intbitset_9intbitset_13__or__(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs); /*proto*/
+static PyObject *__pyx_pf_9intbitset_9intbitset_13__or__(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs) {
   PyObject *__pyx_v_ret;
   PyObject *__pyx_r = NULL;
   PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
   __Pyx_RefNannySetupContext("__or__");
   __pyx_v_ret = Py_None; __Pyx_INCREF(Py_None);
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_rhs), __pyx_ptype_3lib_9intbitset_intbitset, 0, "rhs", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 377; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_rhs), __pyx_ptype_9intbitset_intbitset, 0, "rhs", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 460; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-  /* "lib/intbitset.pyx":378
+  /* "intbitset.pyx":461
  * 
  *     def __or__(self, intbitset rhs not None):
  *         ret = intbitset(no_allocate=1)             # <<<<<<<<<<<<<<
  *         (<intbitset>ret).bitset = intBitSetUnion((<intbitset> self).bitset, rhs.bitset)
  *         return ret
  */
-  __pyx_t_1 = PyDict_New(); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 378; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyDict_New(); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 461; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(((PyObject *)__pyx_t_1));
-  if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__no_allocate), __pyx_int_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 378; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_2 = PyEval_CallObjectWithKeywords(((PyObject *)((PyObject*)__pyx_ptype_3lib_9intbitset_intbitset)), ((PyObject *)__pyx_empty_tuple), ((PyObject *)__pyx_t_1)); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 378; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__no_allocate), __pyx_int_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 461; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyEval_CallObjectWithKeywords(((PyObject *)((PyObject*)__pyx_ptype_9intbitset_intbitset)), ((PyObject *)__pyx_empty_tuple), ((PyObject *)__pyx_t_1)); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 461; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(((PyObject *)__pyx_t_1)); __pyx_t_1 = 0;
   __Pyx_DECREF(__pyx_v_ret);
   __pyx_v_ret = __pyx_t_2;
   __pyx_t_2 = 0;
 
-  /* "lib/intbitset.pyx":379
+  /* "intbitset.pyx":462
  *     def __or__(self, intbitset rhs not None):
  *         ret = intbitset(no_allocate=1)
  *         (<intbitset>ret).bitset = intBitSetUnion((<intbitset> self).bitset, rhs.bitset)             # <<<<<<<<<<<<<<
  *         return ret
  * 
  */
-  ((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_ret)->bitset = intBitSetUnion(((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->bitset, ((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_rhs)->bitset);
+  ((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_ret)->bitset = intBitSetUnion(((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->bitset, ((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_rhs)->bitset);
 
-  /* "lib/intbitset.pyx":380
+  /* "intbitset.pyx":463
  *         ret = intbitset(no_allocate=1)
  *         (<intbitset>ret).bitset = intBitSetUnion((<intbitset> self).bitset, rhs.bitset)
  *         return ret             # <<<<<<<<<<<<<<
@@ -4044,7 +4428,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_13__or__(PyObject *__pyx_v_
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_AddTraceback("lib.intbitset.intbitset.__or__");
+  __Pyx_AddTraceback("intbitset.intbitset.__or__");
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_DECREF(__pyx_v_ret);
@@ -4053,7 +4437,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_13__or__(PyObject *__pyx_v_
   return __pyx_r;
 }
 
-/* "lib/intbitset.pyx":382
+/* "intbitset.pyx":465
  *         return ret
  * 
  *     def __xor__(self, intbitset rhs not None):             # <<<<<<<<<<<<<<
@@ -4061,43 +4445,43 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_13__or__(PyObject *__pyx_v_
  *         (<intbitset>ret).bitset = intBitSetXor((<intbitset> self).bitset, rhs.bitset)
  */
 
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_14__xor__(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs); /*proto*/
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_14__xor__(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs) {
+static PyObject *__pyx_pf_9intbitset_9intbitset_14__xor__(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs); /*proto*/
+static PyObject *__pyx_pf_9intbitset_9intbitset_14__xor__(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs) {
   PyObject *__pyx_v_ret;
   PyObject *__pyx_r = NULL;
   PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
   __Pyx_RefNannySetupContext("__xor__");
   __pyx_v_ret = Py_None; __Pyx_INCREF(Py_None);
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_rhs), __pyx_ptype_3lib_9intbitset_intbitset, 0, "rhs", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 382; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_rhs), __pyx_ptype_9intbitset_intbitset, 0, "rhs", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 465; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-  /* "lib/intbitset.pyx":383
+  /* "intbitset.pyx":466
  * 
  *     def __xor__(self, intbitset rhs not None):
  *         ret = intbitset(no_allocate=1)             # <<<<<<<<<<<<<<
  *         (<intbitset>ret).bitset = intBitSetXor((<intbitset> self).bitset, rhs.bitset)
  *         return ret
  */
-  __pyx_t_1 = PyDict_New(); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 383; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyDict_New(); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 466; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(((PyObject *)__pyx_t_1));
-  if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__no_allocate), __pyx_int_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 383; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_2 = PyEval_CallObjectWithKeywords(((PyObject *)((PyObject*)__pyx_ptype_3lib_9intbitset_intbitset)), ((PyObject *)__pyx_empty_tuple), ((PyObject *)__pyx_t_1)); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 383; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__no_allocate), __pyx_int_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 466; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyEval_CallObjectWithKeywords(((PyObject *)((PyObject*)__pyx_ptype_9intbitset_intbitset)), ((PyObject *)__pyx_empty_tuple), ((PyObject *)__pyx_t_1)); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 466; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(((PyObject *)__pyx_t_1)); __pyx_t_1 = 0;
   __Pyx_DECREF(__pyx_v_ret);
   __pyx_v_ret = __pyx_t_2;
   __pyx_t_2 = 0;
 
-  /* "lib/intbitset.pyx":384
+  /* "intbitset.pyx":467
  *     def __xor__(self, intbitset rhs not None):
  *         ret = intbitset(no_allocate=1)
  *         (<intbitset>ret).bitset = intBitSetXor((<intbitset> self).bitset, rhs.bitset)             # <<<<<<<<<<<<<<
  *         return ret
  * 
  */
-  ((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_ret)->bitset = intBitSetXor(((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->bitset, ((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_rhs)->bitset);
+  ((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_ret)->bitset = intBitSetXor(((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->bitset, ((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_rhs)->bitset);
 
-  /* "lib/intbitset.pyx":385
+  /* "intbitset.pyx":468
  *         ret = intbitset(no_allocate=1)
  *         (<intbitset>ret).bitset = intBitSetXor((<intbitset> self).bitset, rhs.bitset)
  *         return ret             # <<<<<<<<<<<<<<
@@ -4114,7 +4498,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_14__xor__(PyObject *__pyx_v
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_AddTraceback("lib.intbitset.intbitset.__xor__");
+  __Pyx_AddTraceback("intbitset.intbitset.__xor__");
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_DECREF(__pyx_v_ret);
@@ -4123,7 +4507,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_14__xor__(PyObject *__pyx_v
   return __pyx_r;
 }
 
-/* "lib/intbitset.pyx":387
+/* "intbitset.pyx":470
  *         return ret
  * 
  *     def __sub__(self, intbitset rhs not None):             # <<<<<<<<<<<<<<
@@ -4131,43 +4515,43 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_14__xor__(PyObject *__pyx_v
  *         (<intbitset>ret).bitset = intBitSetSub((<intbitset> self).bitset, rhs.bitset)
  */
 
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_15__sub__(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs); /*proto*/
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_15__sub__(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs) {
+static PyObject *__pyx_pf_9intbitset_9intbitset_15__sub__(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs); /*proto*/
+static PyObject *__pyx_pf_9intbitset_9intbitset_15__sub__(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs) {
   PyObject *__pyx_v_ret;
   PyObject *__pyx_r = NULL;
   PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
   __Pyx_RefNannySetupContext("__sub__");
   __pyx_v_ret = Py_None; __Pyx_INCREF(Py_None);
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_rhs), __pyx_ptype_3lib_9intbitset_intbitset, 0, "rhs", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 387; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_rhs), __pyx_ptype_9intbitset_intbitset, 0, "rhs", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 470; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-  /* "lib/intbitset.pyx":388
+  /* "intbitset.pyx":471
  * 
  *     def __sub__(self, intbitset rhs not None):
  *         ret = intbitset(no_allocate=1)             # <<<<<<<<<<<<<<
  *         (<intbitset>ret).bitset = intBitSetSub((<intbitset> self).bitset, rhs.bitset)
  *         return ret
  */
-  __pyx_t_1 = PyDict_New(); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 388; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyDict_New(); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 471; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(((PyObject *)__pyx_t_1));
-  if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__no_allocate), __pyx_int_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 388; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_2 = PyEval_CallObjectWithKeywords(((PyObject *)((PyObject*)__pyx_ptype_3lib_9intbitset_intbitset)), ((PyObject *)__pyx_empty_tuple), ((PyObject *)__pyx_t_1)); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 388; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__no_allocate), __pyx_int_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 471; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyEval_CallObjectWithKeywords(((PyObject *)((PyObject*)__pyx_ptype_9intbitset_intbitset)), ((PyObject *)__pyx_empty_tuple), ((PyObject *)__pyx_t_1)); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 471; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(((PyObject *)__pyx_t_1)); __pyx_t_1 = 0;
   __Pyx_DECREF(__pyx_v_ret);
   __pyx_v_ret = __pyx_t_2;
   __pyx_t_2 = 0;
 
-  /* "lib/intbitset.pyx":389
+  /* "intbitset.pyx":472
  *     def __sub__(self, intbitset rhs not None):
  *         ret = intbitset(no_allocate=1)
  *         (<intbitset>ret).bitset = intBitSetSub((<intbitset> self).bitset, rhs.bitset)             # <<<<<<<<<<<<<<
  *         return ret
  * 
  */
-  ((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_ret)->bitset = intBitSetSub(((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->bitset, ((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_rhs)->bitset);
+  ((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_ret)->bitset = intBitSetSub(((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->bitset, ((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_rhs)->bitset);
 
-  /* "lib/intbitset.pyx":390
+  /* "intbitset.pyx":473
  *         ret = intbitset(no_allocate=1)
  *         (<intbitset>ret).bitset = intBitSetSub((<intbitset> self).bitset, rhs.bitset)
  *         return ret             # <<<<<<<<<<<<<<
@@ -4184,7 +4568,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_15__sub__(PyObject *__pyx_v
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_AddTraceback("lib.intbitset.intbitset.__sub__");
+  __Pyx_AddTraceback("intbitset.intbitset.__sub__");
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_DECREF(__pyx_v_ret);
@@ -4193,7 +4577,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_15__sub__(PyObject *__pyx_v
   return __pyx_r;
 }
 
-/* "lib/intbitset.pyx":392
+/* "intbitset.pyx":475
  *         return ret
  * 
  *     def __iand__(self, intbitset rhs not None):             # <<<<<<<<<<<<<<
@@ -4201,22 +4585,22 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_15__sub__(PyObject *__pyx_v
  *         return self
  */
 
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_16__iand__(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs); /*proto*/
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_16__iand__(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs) {
+static PyObject *__pyx_pf_9intbitset_9intbitset_16__iand__(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs); /*proto*/
+static PyObject *__pyx_pf_9intbitset_9intbitset_16__iand__(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannySetupContext("__iand__");
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_rhs), __pyx_ptype_3lib_9intbitset_intbitset, 0, "rhs", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 392; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_rhs), __pyx_ptype_9intbitset_intbitset, 0, "rhs", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 475; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-  /* "lib/intbitset.pyx":393
+  /* "intbitset.pyx":476
  * 
  *     def __iand__(self, intbitset rhs not None):
  *         intBitSetIIntersection(self.bitset, rhs.bitset)             # <<<<<<<<<<<<<<
  *         return self
  * 
  */
-  intBitSetIIntersection(((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->bitset, ((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_rhs)->bitset);
+  intBitSetIIntersection(((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->bitset, ((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_rhs)->bitset);
 
-  /* "lib/intbitset.pyx":394
+  /* "intbitset.pyx":477
  *     def __iand__(self, intbitset rhs not None):
  *         intBitSetIIntersection(self.bitset, rhs.bitset)
  *         return self             # <<<<<<<<<<<<<<
@@ -4231,7 +4615,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_16__iand__(PyObject *__pyx_
   __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
   __pyx_L1_error:;
-  __Pyx_AddTraceback("lib.intbitset.intbitset.__iand__");
+  __Pyx_AddTraceback("intbitset.intbitset.__iand__");
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -4239,7 +4623,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_16__iand__(PyObject *__pyx_
   return __pyx_r;
 }
 
-/* "lib/intbitset.pyx":396
+/* "intbitset.pyx":479
  *         return self
  * 
  *     def __ior__(self, intbitset rhs not None):             # <<<<<<<<<<<<<<
@@ -4247,22 +4631,22 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_16__iand__(PyObject *__pyx_
  *         return self
  */
 
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_17__ior__(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs); /*proto*/
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_17__ior__(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs) {
+static PyObject *__pyx_pf_9intbitset_9intbitset_17__ior__(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs); /*proto*/
+static PyObject *__pyx_pf_9intbitset_9intbitset_17__ior__(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannySetupContext("__ior__");
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_rhs), __pyx_ptype_3lib_9intbitset_intbitset, 0, "rhs", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 396; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_rhs), __pyx_ptype_9intbitset_intbitset, 0, "rhs", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 479; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-  /* "lib/intbitset.pyx":397
+  /* "intbitset.pyx":480
  * 
  *     def __ior__(self, intbitset rhs not None):
  *         intBitSetIUnion(self.bitset, rhs.bitset)             # <<<<<<<<<<<<<<
  *         return self
  * 
  */
-  intBitSetIUnion(((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->bitset, ((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_rhs)->bitset);
+  intBitSetIUnion(((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->bitset, ((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_rhs)->bitset);
 
-  /* "lib/intbitset.pyx":398
+  /* "intbitset.pyx":481
  *     def __ior__(self, intbitset rhs not None):
  *         intBitSetIUnion(self.bitset, rhs.bitset)
  *         return self             # <<<<<<<<<<<<<<
@@ -4277,7 +4661,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_17__ior__(PyObject *__pyx_v
   __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
   __pyx_L1_error:;
-  __Pyx_AddTraceback("lib.intbitset.intbitset.__ior__");
+  __Pyx_AddTraceback("intbitset.intbitset.__ior__");
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -4285,7 +4669,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_17__ior__(PyObject *__pyx_v
   return __pyx_r;
 }
 
-/* "lib/intbitset.pyx":400
+/* "intbitset.pyx":483
  *         return self
  * 
  *     def __ixor__(self, intbitset rhs not None):             # <<<<<<<<<<<<<<
@@ -4293,22 +4677,22 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_17__ior__(PyObject *__pyx_v
  *         return self
  */
 
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_18__ixor__(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs); /*proto*/
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_18__ixor__(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs) {
+static PyObject *__pyx_pf_9intbitset_9intbitset_18__ixor__(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs); /*proto*/
+static PyObject *__pyx_pf_9intbitset_9intbitset_18__ixor__(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannySetupContext("__ixor__");
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_rhs), __pyx_ptype_3lib_9intbitset_intbitset, 0, "rhs", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 400; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_rhs), __pyx_ptype_9intbitset_intbitset, 0, "rhs", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 483; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-  /* "lib/intbitset.pyx":401
+  /* "intbitset.pyx":484
  * 
  *     def __ixor__(self, intbitset rhs not None):
  *         intBitSetIXor(self.bitset, rhs.bitset)             # <<<<<<<<<<<<<<
  *         return self
  * 
  */
-  intBitSetIXor(((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->bitset, ((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_rhs)->bitset);
+  intBitSetIXor(((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->bitset, ((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_rhs)->bitset);
 
-  /* "lib/intbitset.pyx":402
+  /* "intbitset.pyx":485
  *     def __ixor__(self, intbitset rhs not None):
  *         intBitSetIXor(self.bitset, rhs.bitset)
  *         return self             # <<<<<<<<<<<<<<
@@ -4323,7 +4707,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_18__ixor__(PyObject *__pyx_
   __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
   __pyx_L1_error:;
-  __Pyx_AddTraceback("lib.intbitset.intbitset.__ixor__");
+  __Pyx_AddTraceback("intbitset.intbitset.__ixor__");
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -4331,7 +4715,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_18__ixor__(PyObject *__pyx_
   return __pyx_r;
 }
 
-/* "lib/intbitset.pyx":404
+/* "intbitset.pyx":487
  *         return self
  * 
  *     def __repr__(self):             # <<<<<<<<<<<<<<
@@ -4339,8 +4723,8 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_18__ixor__(PyObject *__pyx_
  *         cdef int maxelem
  */
 
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_19__repr__(PyObject *__pyx_v_self); /*proto*/
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_19__repr__(PyObject *__pyx_v_self) {
+static PyObject *__pyx_pf_9intbitset_9intbitset_19__repr__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pf_9intbitset_9intbitset_19__repr__(PyObject *__pyx_v_self) {
   PyObject *__pyx_v_finite_list;
   PyObject *__pyx_r = NULL;
   PyObject *__pyx_t_1 = NULL;
@@ -4348,32 +4732,32 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_19__repr__(PyObject *__pyx_
   __Pyx_RefNannySetupContext("__repr__");
   __pyx_v_finite_list = Py_None; __Pyx_INCREF(Py_None);
 
-  /* "lib/intbitset.pyx":408
+  /* "intbitset.pyx":491
  *         cdef int maxelem
  *         cdef int next_last
  *         finite_list = self.extract_finite_list()             # <<<<<<<<<<<<<<
  *         if self.bitset.trailing_bits:
  *             return "intbitset(%s, trailing_bits=True)" % repr(finite_list)
  */
-  __pyx_t_1 = PyObject_GetAttr(__pyx_v_self, __pyx_n_s__extract_finite_list); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 408; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyObject_GetAttr(__pyx_v_self, __pyx_n_s__extract_finite_list); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 491; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyObject_Call(__pyx_t_1, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 408; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyObject_Call(__pyx_t_1, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 491; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __Pyx_DECREF(__pyx_v_finite_list);
   __pyx_v_finite_list = __pyx_t_2;
   __pyx_t_2 = 0;
 
-  /* "lib/intbitset.pyx":409
+  /* "intbitset.pyx":492
  *         cdef int next_last
  *         finite_list = self.extract_finite_list()
  *         if self.bitset.trailing_bits:             # <<<<<<<<<<<<<<
  *             return "intbitset(%s, trailing_bits=True)" % repr(finite_list)
  *         else:
  */
-  if (((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->bitset->trailing_bits) {
+  if (((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->bitset->trailing_bits) {
 
-    /* "lib/intbitset.pyx":410
+    /* "intbitset.pyx":493
  *         finite_list = self.extract_finite_list()
  *         if self.bitset.trailing_bits:
  *             return "intbitset(%s, trailing_bits=True)" % repr(finite_list)             # <<<<<<<<<<<<<<
@@ -4381,9 +4765,9 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_19__repr__(PyObject *__pyx_
  *             return "intbitset(%s)" % repr(finite_list)
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = PyObject_Repr(__pyx_v_finite_list); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 410; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = PyObject_Repr(__pyx_v_finite_list); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 493; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_1 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_27), __pyx_t_2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 410; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_1 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_30), __pyx_t_2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 493; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(((PyObject *)__pyx_t_1));
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     __pyx_r = ((PyObject *)__pyx_t_1);
@@ -4393,7 +4777,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_19__repr__(PyObject *__pyx_
   }
   /*else*/ {
 
-    /* "lib/intbitset.pyx":412
+    /* "intbitset.pyx":495
  *             return "intbitset(%s, trailing_bits=True)" % repr(finite_list)
  *         else:
  *             return "intbitset(%s)" % repr(finite_list)             # <<<<<<<<<<<<<<
@@ -4401,9 +4785,9 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_19__repr__(PyObject *__pyx_
  *     def __str__(self):
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_1 = PyObject_Repr(__pyx_v_finite_list); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 412; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_1 = PyObject_Repr(__pyx_v_finite_list); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 495; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_2 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_28), __pyx_t_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 412; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_31), __pyx_t_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 495; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(((PyObject *)__pyx_t_2));
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
     __pyx_r = ((PyObject *)__pyx_t_2);
@@ -4417,7 +4801,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_19__repr__(PyObject *__pyx_
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_AddTraceback("lib.intbitset.intbitset.__repr__");
+  __Pyx_AddTraceback("intbitset.intbitset.__repr__");
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_DECREF(__pyx_v_finite_list);
@@ -4426,7 +4810,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_19__repr__(PyObject *__pyx_
   return __pyx_r;
 }
 
-/* "lib/intbitset.pyx":414
+/* "intbitset.pyx":497
  *             return "intbitset(%s)" % repr(finite_list)
  * 
  *     def __str__(self):             # <<<<<<<<<<<<<<
@@ -4434,8 +4818,8 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_19__repr__(PyObject *__pyx_
  *         tot = intBitSetGetTot(self.bitset)
  */
 
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_20__str__(PyObject *__pyx_v_self); /*proto*/
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_20__str__(PyObject *__pyx_v_self) {
+static PyObject *__pyx_pf_9intbitset_9intbitset_20__str__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pf_9intbitset_9intbitset_20__str__(PyObject *__pyx_v_self) {
   int __pyx_v_tot;
   PyObject *__pyx_v_begin_list;
   PyObject *__pyx_v_ret;
@@ -4454,16 +4838,16 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_20__str__(PyObject *__pyx_v
   __pyx_v_n = Py_None; __Pyx_INCREF(Py_None);
   __pyx_v_end_list = Py_None; __Pyx_INCREF(Py_None);
 
-  /* "lib/intbitset.pyx":416
+  /* "intbitset.pyx":499
  *     def __str__(self):
  *         cdef int tot
  *         tot = intBitSetGetTot(self.bitset)             # <<<<<<<<<<<<<<
  *         if tot < 0:
  *             begin_list = self.to_sorted_list(0, 10)
  */
-  __pyx_v_tot = intBitSetGetTot(((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->bitset);
+  __pyx_v_tot = intBitSetGetTot(((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->bitset);
 
-  /* "lib/intbitset.pyx":417
+  /* "intbitset.pyx":500
  *         cdef int tot
  *         tot = intBitSetGetTot(self.bitset)
  *         if tot < 0:             # <<<<<<<<<<<<<<
@@ -4473,34 +4857,34 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_20__str__(PyObject *__pyx_v
   __pyx_t_1 = (__pyx_v_tot < 0);
   if (__pyx_t_1) {
 
-    /* "lib/intbitset.pyx":418
+    /* "intbitset.pyx":501
  *         tot = intBitSetGetTot(self.bitset)
  *         if tot < 0:
  *             begin_list = self.to_sorted_list(0, 10)             # <<<<<<<<<<<<<<
  *             ret = "intbitset(["
  *             for n in begin_list:
  */
-    __pyx_t_2 = PyObject_GetAttr(__pyx_v_self, __pyx_n_s__to_sorted_list); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 418; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = PyObject_GetAttr(__pyx_v_self, __pyx_n_s__to_sorted_list); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 501; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_3 = PyObject_Call(__pyx_t_2, ((PyObject *)__pyx_k_tuple_29), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 418; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = PyObject_Call(__pyx_t_2, ((PyObject *)__pyx_k_tuple_32), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 501; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     __Pyx_DECREF(__pyx_v_begin_list);
     __pyx_v_begin_list = __pyx_t_3;
     __pyx_t_3 = 0;
 
-    /* "lib/intbitset.pyx":419
+    /* "intbitset.pyx":502
  *         if tot < 0:
  *             begin_list = self.to_sorted_list(0, 10)
  *             ret = "intbitset(["             # <<<<<<<<<<<<<<
  *             for n in begin_list:
  *                 ret = ret + '%i, ' % n
  */
-    __Pyx_INCREF(((PyObject *)__pyx_kp_s_30));
+    __Pyx_INCREF(((PyObject *)__pyx_kp_s_33));
     __Pyx_DECREF(__pyx_v_ret);
-    __pyx_v_ret = ((PyObject *)__pyx_kp_s_30);
+    __pyx_v_ret = ((PyObject *)__pyx_kp_s_33);
 
-    /* "lib/intbitset.pyx":420
+    /* "intbitset.pyx":503
  *             begin_list = self.to_sorted_list(0, 10)
  *             ret = "intbitset(["
  *             for n in begin_list:             # <<<<<<<<<<<<<<
@@ -4510,7 +4894,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_20__str__(PyObject *__pyx_v
     if (PyList_CheckExact(__pyx_v_begin_list) || PyTuple_CheckExact(__pyx_v_begin_list)) {
       __pyx_t_4 = 0; __pyx_t_3 = __pyx_v_begin_list; __Pyx_INCREF(__pyx_t_3);
     } else {
-      __pyx_t_4 = -1; __pyx_t_3 = PyObject_GetIter(__pyx_v_begin_list); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 420; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_4 = -1; __pyx_t_3 = PyObject_GetIter(__pyx_v_begin_list); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 503; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_3);
     }
     for (;;) {
@@ -4523,7 +4907,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_20__str__(PyObject *__pyx_v
       } else {
         __pyx_t_2 = PyIter_Next(__pyx_t_3);
         if (!__pyx_t_2) {
-          if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 420; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+          if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 503; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
           break;
         }
         __Pyx_GOTREF(__pyx_t_2);
@@ -4532,16 +4916,16 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_20__str__(PyObject *__pyx_v
       __pyx_v_n = __pyx_t_2;
       __pyx_t_2 = 0;
 
-      /* "lib/intbitset.pyx":421
+      /* "intbitset.pyx":504
  *             ret = "intbitset(["
  *             for n in begin_list:
  *                 ret = ret + '%i, ' % n             # <<<<<<<<<<<<<<
  *             ret = ret + "...])"
  *             return ret
  */
-      __pyx_t_2 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_31), __pyx_v_n); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 421; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_2 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_34), __pyx_v_n); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 504; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(((PyObject *)__pyx_t_2));
-      __pyx_t_5 = PyNumber_Add(__pyx_v_ret, ((PyObject *)__pyx_t_2)); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 421; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_5 = PyNumber_Add(__pyx_v_ret, ((PyObject *)__pyx_t_2)); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 504; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_5);
       __Pyx_DECREF(((PyObject *)__pyx_t_2)); __pyx_t_2 = 0;
       __Pyx_DECREF(__pyx_v_ret);
@@ -4550,20 +4934,20 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_20__str__(PyObject *__pyx_v
     }
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-    /* "lib/intbitset.pyx":422
+    /* "intbitset.pyx":505
  *             for n in begin_list:
  *                 ret = ret + '%i, ' % n
  *             ret = ret + "...])"             # <<<<<<<<<<<<<<
  *             return ret
  *         elif tot > 10:
  */
-    __pyx_t_3 = PyNumber_Add(__pyx_v_ret, ((PyObject *)__pyx_kp_s_32)); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 422; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = PyNumber_Add(__pyx_v_ret, ((PyObject *)__pyx_kp_s_35)); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 505; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(__pyx_v_ret);
     __pyx_v_ret = __pyx_t_3;
     __pyx_t_3 = 0;
 
-    /* "lib/intbitset.pyx":423
+    /* "intbitset.pyx":506
  *                 ret = ret + '%i, ' % n
  *             ret = ret + "...])"
  *             return ret             # <<<<<<<<<<<<<<
@@ -4577,7 +4961,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_20__str__(PyObject *__pyx_v
     goto __pyx_L5;
   }
 
-  /* "lib/intbitset.pyx":424
+  /* "intbitset.pyx":507
  *             ret = ret + "...])"
  *             return ret
  *         elif tot > 10:             # <<<<<<<<<<<<<<
@@ -4587,36 +4971,36 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_20__str__(PyObject *__pyx_v
   __pyx_t_1 = (__pyx_v_tot > 10);
   if (__pyx_t_1) {
 
-    /* "lib/intbitset.pyx":425
+    /* "intbitset.pyx":508
  *             return ret
  *         elif tot > 10:
  *             begin_list = self.to_sorted_list(0, 5)             # <<<<<<<<<<<<<<
  *             end_list = self.to_sorted_list(tot - 5, tot)
  *             ret = "intbitset(["
  */
-    __pyx_t_3 = PyObject_GetAttr(__pyx_v_self, __pyx_n_s__to_sorted_list); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 425; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = PyObject_GetAttr(__pyx_v_self, __pyx_n_s__to_sorted_list); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 508; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_5 = PyObject_Call(__pyx_t_3, ((PyObject *)__pyx_k_tuple_33), NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 425; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_5 = PyObject_Call(__pyx_t_3, ((PyObject *)__pyx_k_tuple_36), NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 508; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_5);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_v_begin_list);
     __pyx_v_begin_list = __pyx_t_5;
     __pyx_t_5 = 0;
 
-    /* "lib/intbitset.pyx":426
+    /* "intbitset.pyx":509
  *         elif tot > 10:
  *             begin_list = self.to_sorted_list(0, 5)
  *             end_list = self.to_sorted_list(tot - 5, tot)             # <<<<<<<<<<<<<<
  *             ret = "intbitset(["
  *             for n in begin_list:
  */
-    __pyx_t_5 = PyObject_GetAttr(__pyx_v_self, __pyx_n_s__to_sorted_list); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 426; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_5 = PyObject_GetAttr(__pyx_v_self, __pyx_n_s__to_sorted_list); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 509; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_5);
-    __pyx_t_3 = PyInt_FromLong((__pyx_v_tot - 5)); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 426; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = PyInt_FromLong((__pyx_v_tot - 5)); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 509; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_2 = PyInt_FromLong(__pyx_v_tot); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 426; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = PyInt_FromLong(__pyx_v_tot); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 509; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_6 = PyTuple_New(2); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 426; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_6 = PyTuple_New(2); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 509; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(((PyObject *)__pyx_t_6));
     PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_3);
     __Pyx_GIVEREF(__pyx_t_3);
@@ -4624,7 +5008,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_20__str__(PyObject *__pyx_v
     __Pyx_GIVEREF(__pyx_t_2);
     __pyx_t_3 = 0;
     __pyx_t_2 = 0;
-    __pyx_t_2 = PyObject_Call(__pyx_t_5, ((PyObject *)__pyx_t_6), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 426; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = PyObject_Call(__pyx_t_5, ((PyObject *)__pyx_t_6), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 509; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
     __Pyx_DECREF(((PyObject *)__pyx_t_6)); __pyx_t_6 = 0;
@@ -4632,18 +5016,18 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_20__str__(PyObject *__pyx_v
     __pyx_v_end_list = __pyx_t_2;
     __pyx_t_2 = 0;
 
-    /* "lib/intbitset.pyx":427
+    /* "intbitset.pyx":510
  *             begin_list = self.to_sorted_list(0, 5)
  *             end_list = self.to_sorted_list(tot - 5, tot)
  *             ret = "intbitset(["             # <<<<<<<<<<<<<<
  *             for n in begin_list:
  *                 ret = ret + '%i, ' % n
  */
-    __Pyx_INCREF(((PyObject *)__pyx_kp_s_30));
+    __Pyx_INCREF(((PyObject *)__pyx_kp_s_33));
     __Pyx_DECREF(__pyx_v_ret);
-    __pyx_v_ret = ((PyObject *)__pyx_kp_s_30);
+    __pyx_v_ret = ((PyObject *)__pyx_kp_s_33);
 
-    /* "lib/intbitset.pyx":428
+    /* "intbitset.pyx":511
  *             end_list = self.to_sorted_list(tot - 5, tot)
  *             ret = "intbitset(["
  *             for n in begin_list:             # <<<<<<<<<<<<<<
@@ -4653,7 +5037,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_20__str__(PyObject *__pyx_v
     if (PyList_CheckExact(__pyx_v_begin_list) || PyTuple_CheckExact(__pyx_v_begin_list)) {
       __pyx_t_4 = 0; __pyx_t_2 = __pyx_v_begin_list; __Pyx_INCREF(__pyx_t_2);
     } else {
-      __pyx_t_4 = -1; __pyx_t_2 = PyObject_GetIter(__pyx_v_begin_list); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 428; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_4 = -1; __pyx_t_2 = PyObject_GetIter(__pyx_v_begin_list); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 511; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_2);
     }
     for (;;) {
@@ -4666,7 +5050,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_20__str__(PyObject *__pyx_v
       } else {
         __pyx_t_6 = PyIter_Next(__pyx_t_2);
         if (!__pyx_t_6) {
-          if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 428; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+          if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 511; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
           break;
         }
         __Pyx_GOTREF(__pyx_t_6);
@@ -4675,16 +5059,16 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_20__str__(PyObject *__pyx_v
       __pyx_v_n = __pyx_t_6;
       __pyx_t_6 = 0;
 
-      /* "lib/intbitset.pyx":429
+      /* "intbitset.pyx":512
  *             ret = "intbitset(["
  *             for n in begin_list:
  *                 ret = ret + '%i, ' % n             # <<<<<<<<<<<<<<
  *             ret = ret + "..., "
  *             for n in end_list:
  */
-      __pyx_t_6 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_31), __pyx_v_n); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 429; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_6 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_34), __pyx_v_n); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 512; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(((PyObject *)__pyx_t_6));
-      __pyx_t_5 = PyNumber_Add(__pyx_v_ret, ((PyObject *)__pyx_t_6)); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 429; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_5 = PyNumber_Add(__pyx_v_ret, ((PyObject *)__pyx_t_6)); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 512; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_5);
       __Pyx_DECREF(((PyObject *)__pyx_t_6)); __pyx_t_6 = 0;
       __Pyx_DECREF(__pyx_v_ret);
@@ -4693,20 +5077,20 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_20__str__(PyObject *__pyx_v
     }
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-    /* "lib/intbitset.pyx":430
+    /* "intbitset.pyx":513
  *             for n in begin_list:
  *                 ret = ret + '%i, ' % n
  *             ret = ret + "..., "             # <<<<<<<<<<<<<<
  *             for n in end_list:
  *                 ret = ret + '%i, ' % n
  */
-    __pyx_t_2 = PyNumber_Add(__pyx_v_ret, ((PyObject *)__pyx_kp_s_34)); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 430; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = PyNumber_Add(__pyx_v_ret, ((PyObject *)__pyx_kp_s_37)); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 513; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_DECREF(__pyx_v_ret);
     __pyx_v_ret = __pyx_t_2;
     __pyx_t_2 = 0;
 
-    /* "lib/intbitset.pyx":431
+    /* "intbitset.pyx":514
  *                 ret = ret + '%i, ' % n
  *             ret = ret + "..., "
  *             for n in end_list:             # <<<<<<<<<<<<<<
@@ -4716,7 +5100,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_20__str__(PyObject *__pyx_v
     if (PyList_CheckExact(__pyx_v_end_list) || PyTuple_CheckExact(__pyx_v_end_list)) {
       __pyx_t_4 = 0; __pyx_t_2 = __pyx_v_end_list; __Pyx_INCREF(__pyx_t_2);
     } else {
-      __pyx_t_4 = -1; __pyx_t_2 = PyObject_GetIter(__pyx_v_end_list); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 431; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_4 = -1; __pyx_t_2 = PyObject_GetIter(__pyx_v_end_list); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 514; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_2);
     }
     for (;;) {
@@ -4729,7 +5113,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_20__str__(PyObject *__pyx_v
       } else {
         __pyx_t_5 = PyIter_Next(__pyx_t_2);
         if (!__pyx_t_5) {
-          if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 431; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+          if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 514; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
           break;
         }
         __Pyx_GOTREF(__pyx_t_5);
@@ -4738,16 +5122,16 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_20__str__(PyObject *__pyx_v
       __pyx_v_n = __pyx_t_5;
       __pyx_t_5 = 0;
 
-      /* "lib/intbitset.pyx":432
+      /* "intbitset.pyx":515
  *             ret = ret + "..., "
  *             for n in end_list:
  *                 ret = ret + '%i, ' % n             # <<<<<<<<<<<<<<
  *             ret = ret[:-2]
  *             ret = ret + '])'
  */
-      __pyx_t_5 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_31), __pyx_v_n); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 432; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_5 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_34), __pyx_v_n); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 515; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(((PyObject *)__pyx_t_5));
-      __pyx_t_6 = PyNumber_Add(__pyx_v_ret, ((PyObject *)__pyx_t_5)); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 432; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_6 = PyNumber_Add(__pyx_v_ret, ((PyObject *)__pyx_t_5)); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 515; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_6);
       __Pyx_DECREF(((PyObject *)__pyx_t_5)); __pyx_t_5 = 0;
       __Pyx_DECREF(__pyx_v_ret);
@@ -4756,33 +5140,33 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_20__str__(PyObject *__pyx_v
     }
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-    /* "lib/intbitset.pyx":433
+    /* "intbitset.pyx":516
  *             for n in end_list:
  *                 ret = ret + '%i, ' % n
  *             ret = ret[:-2]             # <<<<<<<<<<<<<<
  *             ret = ret + '])'
  *             return ret
  */
-    __pyx_t_2 = __Pyx_PySequence_GetSlice(__pyx_v_ret, 0, -2); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 433; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = __Pyx_PySequence_GetSlice(__pyx_v_ret, 0, -2); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 516; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_DECREF(__pyx_v_ret);
     __pyx_v_ret = __pyx_t_2;
     __pyx_t_2 = 0;
 
-    /* "lib/intbitset.pyx":434
+    /* "intbitset.pyx":517
  *                 ret = ret + '%i, ' % n
  *             ret = ret[:-2]
  *             ret = ret + '])'             # <<<<<<<<<<<<<<
  *             return ret
  *         else:
  */
-    __pyx_t_2 = PyNumber_Add(__pyx_v_ret, ((PyObject *)__pyx_kp_s_35)); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 434; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = PyNumber_Add(__pyx_v_ret, ((PyObject *)__pyx_kp_s_38)); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 517; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_DECREF(__pyx_v_ret);
     __pyx_v_ret = __pyx_t_2;
     __pyx_t_2 = 0;
 
-    /* "lib/intbitset.pyx":435
+    /* "intbitset.pyx":518
  *             ret = ret[:-2]
  *             ret = ret + '])'
  *             return ret             # <<<<<<<<<<<<<<
@@ -4797,7 +5181,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_20__str__(PyObject *__pyx_v
   }
   /*else*/ {
 
-    /* "lib/intbitset.pyx":437
+    /* "intbitset.pyx":520
  *             return ret
  *         else:
  *             return self.__repr__()             # <<<<<<<<<<<<<<
@@ -4805,9 +5189,9 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_20__str__(PyObject *__pyx_v
  *     ## Buffer interface
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = PyObject_GetAttr(__pyx_v_self, __pyx_n_s____repr__); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 437; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = PyObject_GetAttr(__pyx_v_self, __pyx_n_s____repr__); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 520; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_6 = PyObject_Call(__pyx_t_2, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 437; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_6 = PyObject_Call(__pyx_t_2, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 520; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_6);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     __pyx_r = __pyx_t_6;
@@ -4823,7 +5207,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_20__str__(PyObject *__pyx_v
   __Pyx_XDECREF(__pyx_t_3);
   __Pyx_XDECREF(__pyx_t_5);
   __Pyx_XDECREF(__pyx_t_6);
-  __Pyx_AddTraceback("lib.intbitset.intbitset.__str__");
+  __Pyx_AddTraceback("intbitset.intbitset.__str__");
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_DECREF(__pyx_v_begin_list);
@@ -4835,7 +5219,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_20__str__(PyObject *__pyx_v
   return __pyx_r;
 }
 
-/* "lib/intbitset.pyx":464
+/* "intbitset.pyx":547
  * 
  *     # Iterator interface
  *     def __iter__(self):             # <<<<<<<<<<<<<<
@@ -4843,39 +5227,39 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_20__str__(PyObject *__pyx_v
  *             raise OverflowError("It's impossible to iterate over an infinite set.")
  */
 
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_21__iter__(PyObject *__pyx_v_self); /*proto*/
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_21__iter__(PyObject *__pyx_v_self) {
+static PyObject *__pyx_pf_9intbitset_9intbitset_21__iter__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pf_9intbitset_9intbitset_21__iter__(PyObject *__pyx_v_self) {
   PyObject *__pyx_r = NULL;
   PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
   __Pyx_RefNannySetupContext("__iter__");
 
-  /* "lib/intbitset.pyx":465
+  /* "intbitset.pyx":548
  *     # Iterator interface
  *     def __iter__(self):
  *         if self.bitset.trailing_bits:             # <<<<<<<<<<<<<<
  *             raise OverflowError("It's impossible to iterate over an infinite set.")
  *         return intbitset_iterator(self)
  */
-  if (((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->bitset->trailing_bits) {
+  if (((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->bitset->trailing_bits) {
 
-    /* "lib/intbitset.pyx":466
+    /* "intbitset.pyx":549
  *     def __iter__(self):
  *         if self.bitset.trailing_bits:
  *             raise OverflowError("It's impossible to iterate over an infinite set.")             # <<<<<<<<<<<<<<
  *         return intbitset_iterator(self)
  * 
  */
-    __pyx_t_1 = PyObject_Call(__pyx_builtin_OverflowError, ((PyObject *)__pyx_k_tuple_37), NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 466; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_1 = PyObject_Call(__pyx_builtin_OverflowError, ((PyObject *)__pyx_k_tuple_40), NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 549; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_Raise(__pyx_t_1, 0, 0);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 466; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 549; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     goto __pyx_L5;
   }
   __pyx_L5:;
 
-  /* "lib/intbitset.pyx":467
+  /* "intbitset.pyx":550
  *         if self.bitset.trailing_bits:
  *             raise OverflowError("It's impossible to iterate over an infinite set.")
  *         return intbitset_iterator(self)             # <<<<<<<<<<<<<<
@@ -4883,12 +5267,12 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_21__iter__(PyObject *__pyx_
  *     # Customized interface
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 467; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 550; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(((PyObject *)__pyx_t_1));
   __Pyx_INCREF(__pyx_v_self);
   PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_self);
   __Pyx_GIVEREF(__pyx_v_self);
-  __pyx_t_2 = PyObject_Call(((PyObject *)((PyObject*)__pyx_ptype_3lib_9intbitset_intbitset_iterator)), ((PyObject *)__pyx_t_1), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 467; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyObject_Call(((PyObject *)((PyObject*)__pyx_ptype_9intbitset_intbitset_iterator)), ((PyObject *)__pyx_t_1), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 550; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(((PyObject *)__pyx_t_1)); __pyx_t_1 = 0;
   __pyx_r = __pyx_t_2;
@@ -4900,7 +5284,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_21__iter__(PyObject *__pyx_
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_AddTraceback("lib.intbitset.intbitset.__iter__");
+  __Pyx_AddTraceback("intbitset.intbitset.__iter__");
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -4908,7 +5292,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_21__iter__(PyObject *__pyx_
   return __pyx_r;
 }
 
-/* "lib/intbitset.pyx":470
+/* "intbitset.pyx":553
  * 
  *     # Customized interface
  *     def add(self, int elem):             # <<<<<<<<<<<<<<
@@ -4916,9 +5300,9 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_21__iter__(PyObject *__pyx_
  *         This has no effect if the element is already present."""
  */
 
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_22add(PyObject *__pyx_v_self, PyObject *__pyx_arg_elem); /*proto*/
-static char __pyx_doc_3lib_9intbitset_9intbitset_22add[] = "Add an element to a set.\n        This has no effect if the element is already present.";
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_22add(PyObject *__pyx_v_self, PyObject *__pyx_arg_elem) {
+static PyObject *__pyx_pf_9intbitset_9intbitset_22add(PyObject *__pyx_v_self, PyObject *__pyx_arg_elem); /*proto*/
+static char __pyx_doc_9intbitset_9intbitset_22add[] = "Add an element to a set.\n        This has no effect if the element is already present.";
+static PyObject *__pyx_pf_9intbitset_9intbitset_22add(PyObject *__pyx_v_self, PyObject *__pyx_arg_elem) {
   int __pyx_v_elem;
   PyObject *__pyx_r = NULL;
   int __pyx_t_1;
@@ -4926,25 +5310,25 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_22add(PyObject *__pyx_v_sel
   PyObject *__pyx_t_3 = NULL;
   __Pyx_RefNannySetupContext("add");
   assert(__pyx_arg_elem); {
-    __pyx_v_elem = __Pyx_PyInt_AsInt(__pyx_arg_elem); if (unlikely((__pyx_v_elem == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 470; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_elem = __Pyx_PyInt_AsInt(__pyx_arg_elem); if (unlikely((__pyx_v_elem == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 553; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
-  __Pyx_AddTraceback("lib.intbitset.intbitset.add");
+  __Pyx_AddTraceback("intbitset.intbitset.add");
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
 
-  /* "lib/intbitset.pyx":473
+  /* "intbitset.pyx":556
  *         """Add an element to a set.
  *         This has no effect if the element is already present."""
  *         if self.sanity_checks:             # <<<<<<<<<<<<<<
  *             if elem < 0:
  *                 raise ValueError("Negative numbers, not allowed")
  */
-  if (((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->sanity_checks) {
+  if (((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->sanity_checks) {
 
-    /* "lib/intbitset.pyx":474
+    /* "intbitset.pyx":557
  *         This has no effect if the element is already present."""
  *         if self.sanity_checks:
  *             if elem < 0:             # <<<<<<<<<<<<<<
@@ -4954,22 +5338,22 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_22add(PyObject *__pyx_v_sel
     __pyx_t_1 = (__pyx_v_elem < 0);
     if (__pyx_t_1) {
 
-      /* "lib/intbitset.pyx":475
+      /* "intbitset.pyx":558
  *         if self.sanity_checks:
  *             if elem < 0:
  *                 raise ValueError("Negative numbers, not allowed")             # <<<<<<<<<<<<<<
  *             elif elem > maxelem:
  *                 raise OverflowError("Element must be <= %s" % maxelem)
  */
-      __pyx_t_2 = PyObject_Call(__pyx_builtin_ValueError, ((PyObject *)__pyx_k_tuple_38), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 475; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_2 = PyObject_Call(__pyx_builtin_ValueError, ((PyObject *)__pyx_k_tuple_41), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 558; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_2);
       __Pyx_Raise(__pyx_t_2, 0, 0);
       __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 475; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 558; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       goto __pyx_L6;
     }
 
-    /* "lib/intbitset.pyx":476
+    /* "intbitset.pyx":559
  *             if elem < 0:
  *                 raise ValueError("Negative numbers, not allowed")
  *             elif elem > maxelem:             # <<<<<<<<<<<<<<
@@ -4979,29 +5363,29 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_22add(PyObject *__pyx_v_sel
     __pyx_t_1 = (__pyx_v_elem > maxelem);
     if (__pyx_t_1) {
 
-      /* "lib/intbitset.pyx":477
+      /* "intbitset.pyx":560
  *                 raise ValueError("Negative numbers, not allowed")
  *             elif elem > maxelem:
  *                 raise OverflowError("Element must be <= %s" % maxelem)             # <<<<<<<<<<<<<<
  *         intBitSetAddElem(self.bitset, elem)
  * 
  */
-      __pyx_t_2 = PyInt_FromLong(maxelem); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 477; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_2 = PyInt_FromLong(maxelem); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 560; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_2);
-      __pyx_t_3 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_17), __pyx_t_2); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 477; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_3 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_20), __pyx_t_2); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 560; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(((PyObject *)__pyx_t_3));
       __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 477; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 560; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(((PyObject *)__pyx_t_2));
       PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_t_3));
       __Pyx_GIVEREF(((PyObject *)__pyx_t_3));
       __pyx_t_3 = 0;
-      __pyx_t_3 = PyObject_Call(__pyx_builtin_OverflowError, ((PyObject *)__pyx_t_2), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 477; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_3 = PyObject_Call(__pyx_builtin_OverflowError, ((PyObject *)__pyx_t_2), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 560; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_3);
       __Pyx_DECREF(((PyObject *)__pyx_t_2)); __pyx_t_2 = 0;
       __Pyx_Raise(__pyx_t_3, 0, 0);
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 477; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 560; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       goto __pyx_L6;
     }
     __pyx_L6:;
@@ -5009,21 +5393,21 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_22add(PyObject *__pyx_v_sel
   }
   __pyx_L5:;
 
-  /* "lib/intbitset.pyx":478
+  /* "intbitset.pyx":561
  *             elif elem > maxelem:
  *                 raise OverflowError("Element must be <= %s" % maxelem)
  *         intBitSetAddElem(self.bitset, elem)             # <<<<<<<<<<<<<<
  * 
  *     def clear(self):
  */
-  intBitSetAddElem(((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->bitset, __pyx_v_elem);
+  intBitSetAddElem(((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->bitset, __pyx_v_elem);
 
   __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_AddTraceback("lib.intbitset.intbitset.add");
+  __Pyx_AddTraceback("intbitset.intbitset.add");
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -5031,7 +5415,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_22add(PyObject *__pyx_v_sel
   return __pyx_r;
 }
 
-/* "lib/intbitset.pyx":480
+/* "intbitset.pyx":563
  *         intBitSetAddElem(self.bitset, elem)
  * 
  *     def clear(self):             # <<<<<<<<<<<<<<
@@ -5039,19 +5423,19 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_22add(PyObject *__pyx_v_sel
  * 
  */
 
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_23clear(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_23clear(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+static PyObject *__pyx_pf_9intbitset_9intbitset_23clear(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pf_9intbitset_9intbitset_23clear(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannySetupContext("clear");
 
-  /* "lib/intbitset.pyx":481
+  /* "intbitset.pyx":564
  * 
  *     def clear(self):
  *         intBitSetReset(self.bitset)             # <<<<<<<<<<<<<<
  * 
  *     def difference(intbitset self, rhs):
  */
-  intBitSetReset(((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->bitset);
+  intBitSetReset(((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->bitset);
 
   __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   __Pyx_XGIVEREF(__pyx_r);
@@ -5059,7 +5443,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_23clear(PyObject *__pyx_v_s
   return __pyx_r;
 }
 
-/* "lib/intbitset.pyx":483
+/* "intbitset.pyx":566
  *         intBitSetReset(self.bitset)
  * 
  *     def difference(intbitset self, rhs):             # <<<<<<<<<<<<<<
@@ -5067,16 +5451,16 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_23clear(PyObject *__pyx_v_s
  *         (i.e. all elements that are in this intbitset but not the other.)
  */
 
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_24difference(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs); /*proto*/
-static char __pyx_doc_3lib_9intbitset_9intbitset_24difference[] = "Return the difference of two intbitsets as a new set.\n        (i.e. all elements that are in this intbitset but not the other.)\n        ";
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_24difference(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs) {
+static PyObject *__pyx_pf_9intbitset_9intbitset_24difference(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs); /*proto*/
+static char __pyx_doc_9intbitset_9intbitset_24difference[] = "Return the difference of two intbitsets as a new set.\n        (i.e. all elements that are in this intbitset but not the other.)\n        ";
+static PyObject *__pyx_pf_9intbitset_9intbitset_24difference(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs) {
   PyObject *__pyx_r = NULL;
   PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
   PyObject *__pyx_t_3 = NULL;
   __Pyx_RefNannySetupContext("difference");
 
-  /* "lib/intbitset.pyx":487
+  /* "intbitset.pyx":570
  *         (i.e. all elements that are in this intbitset but not the other.)
  *         """
  *         return self.__sub__(rhs)             # <<<<<<<<<<<<<<
@@ -5084,14 +5468,14 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_24difference(PyObject *__py
  *     def difference_update(self, rhs):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyObject_GetAttr(__pyx_v_self, __pyx_n_s____sub__); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 487; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyObject_GetAttr(__pyx_v_self, __pyx_n_s____sub__); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 570; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 487; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 570; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(((PyObject *)__pyx_t_2));
   __Pyx_INCREF(__pyx_v_rhs);
   PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v_rhs);
   __Pyx_GIVEREF(__pyx_v_rhs);
-  __pyx_t_3 = PyObject_Call(__pyx_t_1, ((PyObject *)__pyx_t_2), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 487; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = PyObject_Call(__pyx_t_1, ((PyObject *)__pyx_t_2), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 570; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __Pyx_DECREF(((PyObject *)__pyx_t_2)); __pyx_t_2 = 0;
@@ -5105,7 +5489,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_24difference(PyObject *__py
   __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_AddTraceback("lib.intbitset.intbitset.difference");
+  __Pyx_AddTraceback("intbitset.intbitset.difference");
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -5113,7 +5497,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_24difference(PyObject *__py
   return __pyx_r;
 }
 
-/* "lib/intbitset.pyx":489
+/* "intbitset.pyx":572
  *         return self.__sub__(rhs)
  * 
  *     def difference_update(self, rhs):             # <<<<<<<<<<<<<<
@@ -5121,30 +5505,30 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_24difference(PyObject *__py
  *         self.__isub__(rhs)
  */
 
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_25difference_update(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs); /*proto*/
-static char __pyx_doc_3lib_9intbitset_9intbitset_25difference_update[] = "Remove all elements of another set from this set.";
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_25difference_update(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs) {
+static PyObject *__pyx_pf_9intbitset_9intbitset_25difference_update(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs); /*proto*/
+static char __pyx_doc_9intbitset_9intbitset_25difference_update[] = "Remove all elements of another set from this set.";
+static PyObject *__pyx_pf_9intbitset_9intbitset_25difference_update(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs) {
   PyObject *__pyx_r = NULL;
   PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
   PyObject *__pyx_t_3 = NULL;
   __Pyx_RefNannySetupContext("difference_update");
 
-  /* "lib/intbitset.pyx":491
+  /* "intbitset.pyx":574
  *     def difference_update(self, rhs):
  *         """Remove all elements of another set from this set."""
  *         self.__isub__(rhs)             # <<<<<<<<<<<<<<
  * 
  *     def discard(self, int elem):
  */
-  __pyx_t_1 = PyObject_GetAttr(__pyx_v_self, __pyx_n_s____isub__); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 491; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyObject_GetAttr(__pyx_v_self, __pyx_n_s____isub__); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 574; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 491; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 574; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(((PyObject *)__pyx_t_2));
   __Pyx_INCREF(__pyx_v_rhs);
   PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v_rhs);
   __Pyx_GIVEREF(__pyx_v_rhs);
-  __pyx_t_3 = PyObject_Call(__pyx_t_1, ((PyObject *)__pyx_t_2), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 491; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = PyObject_Call(__pyx_t_1, ((PyObject *)__pyx_t_2), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 574; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __Pyx_DECREF(((PyObject *)__pyx_t_2)); __pyx_t_2 = 0;
@@ -5156,7 +5540,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_25difference_update(PyObjec
   __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_AddTraceback("lib.intbitset.intbitset.difference_update");
+  __Pyx_AddTraceback("intbitset.intbitset.difference_update");
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -5164,7 +5548,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_25difference_update(PyObjec
   return __pyx_r;
 }
 
-/* "lib/intbitset.pyx":493
+/* "intbitset.pyx":576
  *         self.__isub__(rhs)
  * 
  *     def discard(self, int elem):             # <<<<<<<<<<<<<<
@@ -5172,9 +5556,9 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_25difference_update(PyObjec
  *         If the element is not a member, do nothing."""
  */
 
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_26discard(PyObject *__pyx_v_self, PyObject *__pyx_arg_elem); /*proto*/
-static char __pyx_doc_3lib_9intbitset_9intbitset_26discard[] = "Remove an element from a intbitset if it is a member.\n        If the element is not a member, do nothing.";
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_26discard(PyObject *__pyx_v_self, PyObject *__pyx_arg_elem) {
+static PyObject *__pyx_pf_9intbitset_9intbitset_26discard(PyObject *__pyx_v_self, PyObject *__pyx_arg_elem); /*proto*/
+static char __pyx_doc_9intbitset_9intbitset_26discard[] = "Remove an element from a intbitset if it is a member.\n        If the element is not a member, do nothing.";
+static PyObject *__pyx_pf_9intbitset_9intbitset_26discard(PyObject *__pyx_v_self, PyObject *__pyx_arg_elem) {
   int __pyx_v_elem;
   PyObject *__pyx_r = NULL;
   int __pyx_t_1;
@@ -5182,25 +5566,25 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_26discard(PyObject *__pyx_v
   PyObject *__pyx_t_3 = NULL;
   __Pyx_RefNannySetupContext("discard");
   assert(__pyx_arg_elem); {
-    __pyx_v_elem = __Pyx_PyInt_AsInt(__pyx_arg_elem); if (unlikely((__pyx_v_elem == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 493; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_elem = __Pyx_PyInt_AsInt(__pyx_arg_elem); if (unlikely((__pyx_v_elem == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 576; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
-  __Pyx_AddTraceback("lib.intbitset.intbitset.discard");
+  __Pyx_AddTraceback("intbitset.intbitset.discard");
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
 
-  /* "lib/intbitset.pyx":496
+  /* "intbitset.pyx":579
  *         """Remove an element from a intbitset if it is a member.
  *         If the element is not a member, do nothing."""
  *         if self.sanity_checks:             # <<<<<<<<<<<<<<
  *             if elem < 0:
  *                 raise ValueError("Negative numbers, not allowed")
  */
-  if (((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->sanity_checks) {
+  if (((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->sanity_checks) {
 
-    /* "lib/intbitset.pyx":497
+    /* "intbitset.pyx":580
  *         If the element is not a member, do nothing."""
  *         if self.sanity_checks:
  *             if elem < 0:             # <<<<<<<<<<<<<<
@@ -5210,22 +5594,22 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_26discard(PyObject *__pyx_v
     __pyx_t_1 = (__pyx_v_elem < 0);
     if (__pyx_t_1) {
 
-      /* "lib/intbitset.pyx":498
+      /* "intbitset.pyx":581
  *         if self.sanity_checks:
  *             if elem < 0:
  *                 raise ValueError("Negative numbers, not allowed")             # <<<<<<<<<<<<<<
  *             elif elem > maxelem:
  *                 raise OverflowError("Element must be <= %s" % maxelem)
  */
-      __pyx_t_2 = PyObject_Call(__pyx_builtin_ValueError, ((PyObject *)__pyx_k_tuple_39), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 498; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_2 = PyObject_Call(__pyx_builtin_ValueError, ((PyObject *)__pyx_k_tuple_42), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 581; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_2);
       __Pyx_Raise(__pyx_t_2, 0, 0);
       __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 498; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 581; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       goto __pyx_L6;
     }
 
-    /* "lib/intbitset.pyx":499
+    /* "intbitset.pyx":582
  *             if elem < 0:
  *                 raise ValueError("Negative numbers, not allowed")
  *             elif elem > maxelem:             # <<<<<<<<<<<<<<
@@ -5235,29 +5619,29 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_26discard(PyObject *__pyx_v
     __pyx_t_1 = (__pyx_v_elem > maxelem);
     if (__pyx_t_1) {
 
-      /* "lib/intbitset.pyx":500
+      /* "intbitset.pyx":583
  *                 raise ValueError("Negative numbers, not allowed")
  *             elif elem > maxelem:
  *                 raise OverflowError("Element must be <= %s" % maxelem)             # <<<<<<<<<<<<<<
  *         intBitSetDelElem(self.bitset, elem)
  * 
  */
-      __pyx_t_2 = PyInt_FromLong(maxelem); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 500; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_2 = PyInt_FromLong(maxelem); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 583; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_2);
-      __pyx_t_3 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_17), __pyx_t_2); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 500; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_3 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_20), __pyx_t_2); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 583; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(((PyObject *)__pyx_t_3));
       __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 500; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 583; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(((PyObject *)__pyx_t_2));
       PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_t_3));
       __Pyx_GIVEREF(((PyObject *)__pyx_t_3));
       __pyx_t_3 = 0;
-      __pyx_t_3 = PyObject_Call(__pyx_builtin_OverflowError, ((PyObject *)__pyx_t_2), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 500; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_3 = PyObject_Call(__pyx_builtin_OverflowError, ((PyObject *)__pyx_t_2), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 583; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_3);
       __Pyx_DECREF(((PyObject *)__pyx_t_2)); __pyx_t_2 = 0;
       __Pyx_Raise(__pyx_t_3, 0, 0);
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 500; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 583; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       goto __pyx_L6;
     }
     __pyx_L6:;
@@ -5265,21 +5649,21 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_26discard(PyObject *__pyx_v
   }
   __pyx_L5:;
 
-  /* "lib/intbitset.pyx":501
+  /* "intbitset.pyx":584
  *             elif elem > maxelem:
  *                 raise OverflowError("Element must be <= %s" % maxelem)
  *         intBitSetDelElem(self.bitset, elem)             # <<<<<<<<<<<<<<
  * 
  *     def intersection(self, rhs):
  */
-  intBitSetDelElem(((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->bitset, __pyx_v_elem);
+  intBitSetDelElem(((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->bitset, __pyx_v_elem);
 
   __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_AddTraceback("lib.intbitset.intbitset.discard");
+  __Pyx_AddTraceback("intbitset.intbitset.discard");
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -5287,7 +5671,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_26discard(PyObject *__pyx_v
   return __pyx_r;
 }
 
-/* "lib/intbitset.pyx":503
+/* "intbitset.pyx":586
  *         intBitSetDelElem(self.bitset, elem)
  * 
  *     def intersection(self, rhs):             # <<<<<<<<<<<<<<
@@ -5295,16 +5679,16 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_26discard(PyObject *__pyx_v
  *         (i.e. all elements that are in both intbitsets.)
  */
 
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_27intersection(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs); /*proto*/
-static char __pyx_doc_3lib_9intbitset_9intbitset_27intersection[] = "Return the intersection of two intbitsets as a new set.\n        (i.e. all elements that are in both intbitsets.)\n        ";
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_27intersection(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs) {
+static PyObject *__pyx_pf_9intbitset_9intbitset_27intersection(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs); /*proto*/
+static char __pyx_doc_9intbitset_9intbitset_27intersection[] = "Return the intersection of two intbitsets as a new set.\n        (i.e. all elements that are in both intbitsets.)\n        ";
+static PyObject *__pyx_pf_9intbitset_9intbitset_27intersection(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs) {
   PyObject *__pyx_r = NULL;
   PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
   PyObject *__pyx_t_3 = NULL;
   __Pyx_RefNannySetupContext("intersection");
 
-  /* "lib/intbitset.pyx":507
+  /* "intbitset.pyx":590
  *         (i.e. all elements that are in both intbitsets.)
  *         """
  *         return self.__and__(rhs)             # <<<<<<<<<<<<<<
@@ -5312,14 +5696,14 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_27intersection(PyObject *__
  *     def intersection_update(self, rhs):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyObject_GetAttr(__pyx_v_self, __pyx_n_s____and__); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 507; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyObject_GetAttr(__pyx_v_self, __pyx_n_s____and__); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 590; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 507; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 590; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(((PyObject *)__pyx_t_2));
   __Pyx_INCREF(__pyx_v_rhs);
   PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v_rhs);
   __Pyx_GIVEREF(__pyx_v_rhs);
-  __pyx_t_3 = PyObject_Call(__pyx_t_1, ((PyObject *)__pyx_t_2), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 507; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = PyObject_Call(__pyx_t_1, ((PyObject *)__pyx_t_2), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 590; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __Pyx_DECREF(((PyObject *)__pyx_t_2)); __pyx_t_2 = 0;
@@ -5333,7 +5717,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_27intersection(PyObject *__
   __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_AddTraceback("lib.intbitset.intbitset.intersection");
+  __Pyx_AddTraceback("intbitset.intbitset.intersection");
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -5341,7 +5725,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_27intersection(PyObject *__
   return __pyx_r;
 }
 
-/* "lib/intbitset.pyx":509
+/* "intbitset.pyx":592
  *         return self.__and__(rhs)
  * 
  *     def intersection_update(self, rhs):             # <<<<<<<<<<<<<<
@@ -5349,30 +5733,30 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_27intersection(PyObject *__
  *         self.__iand__(rhs)
  */
 
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_28intersection_update(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs); /*proto*/
-static char __pyx_doc_3lib_9intbitset_9intbitset_28intersection_update[] = "Update a intbitset with the intersection of itself and another.";
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_28intersection_update(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs) {
+static PyObject *__pyx_pf_9intbitset_9intbitset_28intersection_update(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs); /*proto*/
+static char __pyx_doc_9intbitset_9intbitset_28intersection_update[] = "Update a intbitset with the intersection of itself and another.";
+static PyObject *__pyx_pf_9intbitset_9intbitset_28intersection_update(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs) {
   PyObject *__pyx_r = NULL;
   PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
   PyObject *__pyx_t_3 = NULL;
   __Pyx_RefNannySetupContext("intersection_update");
 
-  /* "lib/intbitset.pyx":511
+  /* "intbitset.pyx":594
  *     def intersection_update(self, rhs):
  *         """Update a intbitset with the intersection of itself and another."""
  *         self.__iand__(rhs)             # <<<<<<<<<<<<<<
  * 
  *     def union(self, rhs):
  */
-  __pyx_t_1 = PyObject_GetAttr(__pyx_v_self, __pyx_n_s____iand__); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 511; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyObject_GetAttr(__pyx_v_self, __pyx_n_s____iand__); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 594; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 511; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 594; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(((PyObject *)__pyx_t_2));
   __Pyx_INCREF(__pyx_v_rhs);
   PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v_rhs);
   __Pyx_GIVEREF(__pyx_v_rhs);
-  __pyx_t_3 = PyObject_Call(__pyx_t_1, ((PyObject *)__pyx_t_2), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 511; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = PyObject_Call(__pyx_t_1, ((PyObject *)__pyx_t_2), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 594; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __Pyx_DECREF(((PyObject *)__pyx_t_2)); __pyx_t_2 = 0;
@@ -5384,7 +5768,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_28intersection_update(PyObj
   __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_AddTraceback("lib.intbitset.intbitset.intersection_update");
+  __Pyx_AddTraceback("intbitset.intbitset.intersection_update");
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -5392,7 +5776,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_28intersection_update(PyObj
   return __pyx_r;
 }
 
-/* "lib/intbitset.pyx":513
+/* "intbitset.pyx":596
  *         self.__iand__(rhs)
  * 
  *     def union(self, rhs):             # <<<<<<<<<<<<<<
@@ -5400,16 +5784,16 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_28intersection_update(PyObj
  *         (i.e. all elements that are in either intbitsets.)
  */
 
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_29union(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs); /*proto*/
-static char __pyx_doc_3lib_9intbitset_9intbitset_29union[] = "Return the union of two intbitsets as a new set.\n        (i.e. all elements that are in either intbitsets.)\n        ";
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_29union(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs) {
+static PyObject *__pyx_pf_9intbitset_9intbitset_29union(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs); /*proto*/
+static char __pyx_doc_9intbitset_9intbitset_29union[] = "Return the union of two intbitsets as a new set.\n        (i.e. all elements that are in either intbitsets.)\n        ";
+static PyObject *__pyx_pf_9intbitset_9intbitset_29union(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs) {
   PyObject *__pyx_r = NULL;
   PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
   PyObject *__pyx_t_3 = NULL;
   __Pyx_RefNannySetupContext("union");
 
-  /* "lib/intbitset.pyx":517
+  /* "intbitset.pyx":600
  *         (i.e. all elements that are in either intbitsets.)
  *         """
  *         return self.__or__(rhs)             # <<<<<<<<<<<<<<
@@ -5417,14 +5801,14 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_29union(PyObject *__pyx_v_s
  *     def union_update(self, rhs):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyObject_GetAttr(__pyx_v_self, __pyx_n_s____or__); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 517; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyObject_GetAttr(__pyx_v_self, __pyx_n_s____or__); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 600; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 517; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 600; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(((PyObject *)__pyx_t_2));
   __Pyx_INCREF(__pyx_v_rhs);
   PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v_rhs);
   __Pyx_GIVEREF(__pyx_v_rhs);
-  __pyx_t_3 = PyObject_Call(__pyx_t_1, ((PyObject *)__pyx_t_2), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 517; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = PyObject_Call(__pyx_t_1, ((PyObject *)__pyx_t_2), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 600; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __Pyx_DECREF(((PyObject *)__pyx_t_2)); __pyx_t_2 = 0;
@@ -5438,7 +5822,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_29union(PyObject *__pyx_v_s
   __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_AddTraceback("lib.intbitset.intbitset.union");
+  __Pyx_AddTraceback("intbitset.intbitset.union");
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -5446,7 +5830,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_29union(PyObject *__pyx_v_s
   return __pyx_r;
 }
 
-/* "lib/intbitset.pyx":519
+/* "intbitset.pyx":602
  *         return self.__or__(rhs)
  * 
  *     def union_update(self, rhs):             # <<<<<<<<<<<<<<
@@ -5454,30 +5838,30 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_29union(PyObject *__pyx_v_s
  *         self.__ior__(rhs)
  */
 
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_30union_update(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs); /*proto*/
-static char __pyx_doc_3lib_9intbitset_9intbitset_30union_update[] = "Update a intbitset with the union of itself and another.";
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_30union_update(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs) {
+static PyObject *__pyx_pf_9intbitset_9intbitset_30union_update(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs); /*proto*/
+static char __pyx_doc_9intbitset_9intbitset_30union_update[] = "Update a intbitset with the union of itself and another.";
+static PyObject *__pyx_pf_9intbitset_9intbitset_30union_update(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs) {
   PyObject *__pyx_r = NULL;
   PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
   PyObject *__pyx_t_3 = NULL;
   __Pyx_RefNannySetupContext("union_update");
 
-  /* "lib/intbitset.pyx":521
+  /* "intbitset.pyx":604
  *     def union_update(self, rhs):
  *         """Update a intbitset with the union of itself and another."""
  *         self.__ior__(rhs)             # <<<<<<<<<<<<<<
  * 
  *     def issubset(self, rhs):
  */
-  __pyx_t_1 = PyObject_GetAttr(__pyx_v_self, __pyx_n_s____ior__); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 521; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyObject_GetAttr(__pyx_v_self, __pyx_n_s____ior__); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 604; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 521; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 604; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(((PyObject *)__pyx_t_2));
   __Pyx_INCREF(__pyx_v_rhs);
   PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v_rhs);
   __Pyx_GIVEREF(__pyx_v_rhs);
-  __pyx_t_3 = PyObject_Call(__pyx_t_1, ((PyObject *)__pyx_t_2), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 521; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = PyObject_Call(__pyx_t_1, ((PyObject *)__pyx_t_2), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 604; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __Pyx_DECREF(((PyObject *)__pyx_t_2)); __pyx_t_2 = 0;
@@ -5489,7 +5873,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_30union_update(PyObject *__
   __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_AddTraceback("lib.intbitset.intbitset.union_update");
+  __Pyx_AddTraceback("intbitset.intbitset.union_update");
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -5497,7 +5881,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_30union_update(PyObject *__
   return __pyx_r;
 }
 
-/* "lib/intbitset.pyx":523
+/* "intbitset.pyx":606
  *         self.__ior__(rhs)
  * 
  *     def issubset(self, rhs):             # <<<<<<<<<<<<<<
@@ -5505,16 +5889,16 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_30union_update(PyObject *__
  *         return self.__le__(rhs)
  */
 
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_31issubset(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs); /*proto*/
-static char __pyx_doc_3lib_9intbitset_9intbitset_31issubset[] = "Report whether another set contains this set.";
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_31issubset(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs) {
+static PyObject *__pyx_pf_9intbitset_9intbitset_31issubset(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs); /*proto*/
+static char __pyx_doc_9intbitset_9intbitset_31issubset[] = "Report whether another set contains this set.";
+static PyObject *__pyx_pf_9intbitset_9intbitset_31issubset(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs) {
   PyObject *__pyx_r = NULL;
   PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
   PyObject *__pyx_t_3 = NULL;
   __Pyx_RefNannySetupContext("issubset");
 
-  /* "lib/intbitset.pyx":525
+  /* "intbitset.pyx":608
  *     def issubset(self, rhs):
  *         """Report whether another set contains this set."""
  *         return self.__le__(rhs)             # <<<<<<<<<<<<<<
@@ -5522,14 +5906,14 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_31issubset(PyObject *__pyx_
  *     def issuperset(self, rhs):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyObject_GetAttr(__pyx_v_self, __pyx_n_s____le__); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 525; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyObject_GetAttr(__pyx_v_self, __pyx_n_s____le__); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 608; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 525; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 608; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(((PyObject *)__pyx_t_2));
   __Pyx_INCREF(__pyx_v_rhs);
   PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v_rhs);
   __Pyx_GIVEREF(__pyx_v_rhs);
-  __pyx_t_3 = PyObject_Call(__pyx_t_1, ((PyObject *)__pyx_t_2), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 525; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = PyObject_Call(__pyx_t_1, ((PyObject *)__pyx_t_2), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 608; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __Pyx_DECREF(((PyObject *)__pyx_t_2)); __pyx_t_2 = 0;
@@ -5543,7 +5927,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_31issubset(PyObject *__pyx_
   __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_AddTraceback("lib.intbitset.intbitset.issubset");
+  __Pyx_AddTraceback("intbitset.intbitset.issubset");
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -5551,7 +5935,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_31issubset(PyObject *__pyx_
   return __pyx_r;
 }
 
-/* "lib/intbitset.pyx":527
+/* "intbitset.pyx":610
  *         return self.__le__(rhs)
  * 
  *     def issuperset(self, rhs):             # <<<<<<<<<<<<<<
@@ -5559,16 +5943,16 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_31issubset(PyObject *__pyx_
  *         return self.__ge__(rhs)
  */
 
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_32issuperset(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs); /*proto*/
-static char __pyx_doc_3lib_9intbitset_9intbitset_32issuperset[] = "Report whether this set contains another set.";
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_32issuperset(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs) {
+static PyObject *__pyx_pf_9intbitset_9intbitset_32issuperset(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs); /*proto*/
+static char __pyx_doc_9intbitset_9intbitset_32issuperset[] = "Report whether this set contains another set.";
+static PyObject *__pyx_pf_9intbitset_9intbitset_32issuperset(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs) {
   PyObject *__pyx_r = NULL;
   PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
   PyObject *__pyx_t_3 = NULL;
   __Pyx_RefNannySetupContext("issuperset");
 
-  /* "lib/intbitset.pyx":529
+  /* "intbitset.pyx":612
  *     def issuperset(self, rhs):
  *         """Report whether this set contains another set."""
  *         return self.__ge__(rhs)             # <<<<<<<<<<<<<<
@@ -5576,14 +5960,14 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_32issuperset(PyObject *__py
  *     def symmetric_difference(self, rhs):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyObject_GetAttr(__pyx_v_self, __pyx_n_s____ge__); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 529; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyObject_GetAttr(__pyx_v_self, __pyx_n_s____ge__); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 612; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 529; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 612; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(((PyObject *)__pyx_t_2));
   __Pyx_INCREF(__pyx_v_rhs);
   PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v_rhs);
   __Pyx_GIVEREF(__pyx_v_rhs);
-  __pyx_t_3 = PyObject_Call(__pyx_t_1, ((PyObject *)__pyx_t_2), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 529; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = PyObject_Call(__pyx_t_1, ((PyObject *)__pyx_t_2), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 612; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __Pyx_DECREF(((PyObject *)__pyx_t_2)); __pyx_t_2 = 0;
@@ -5597,7 +5981,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_32issuperset(PyObject *__py
   __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_AddTraceback("lib.intbitset.intbitset.issuperset");
+  __Pyx_AddTraceback("intbitset.intbitset.issuperset");
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -5605,7 +5989,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_32issuperset(PyObject *__py
   return __pyx_r;
 }
 
-/* "lib/intbitset.pyx":531
+/* "intbitset.pyx":614
  *         return self.__ge__(rhs)
  * 
  *     def symmetric_difference(self, rhs):             # <<<<<<<<<<<<<<
@@ -5613,16 +5997,16 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_32issuperset(PyObject *__py
  *         (i.e. all elements that are in exactly one of the sets.)
  */
 
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_33symmetric_difference(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs); /*proto*/
-static char __pyx_doc_3lib_9intbitset_9intbitset_33symmetric_difference[] = "Return the symmetric difference of two sets as a new set.\n        (i.e. all elements that are in exactly one of the sets.)\n        ";
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_33symmetric_difference(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs) {
+static PyObject *__pyx_pf_9intbitset_9intbitset_33symmetric_difference(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs); /*proto*/
+static char __pyx_doc_9intbitset_9intbitset_33symmetric_difference[] = "Return the symmetric difference of two sets as a new set.\n        (i.e. all elements that are in exactly one of the sets.)\n        ";
+static PyObject *__pyx_pf_9intbitset_9intbitset_33symmetric_difference(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs) {
   PyObject *__pyx_r = NULL;
   PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
   PyObject *__pyx_t_3 = NULL;
   __Pyx_RefNannySetupContext("symmetric_difference");
 
-  /* "lib/intbitset.pyx":535
+  /* "intbitset.pyx":618
  *         (i.e. all elements that are in exactly one of the sets.)
  *         """
  *         return self.__xor__(rhs)             # <<<<<<<<<<<<<<
@@ -5630,14 +6014,14 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_33symmetric_difference(PyOb
  *     def symmetric_difference_update(self, rhs):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyObject_GetAttr(__pyx_v_self, __pyx_n_s____xor__); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 535; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyObject_GetAttr(__pyx_v_self, __pyx_n_s____xor__); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 618; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 535; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 618; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(((PyObject *)__pyx_t_2));
   __Pyx_INCREF(__pyx_v_rhs);
   PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v_rhs);
   __Pyx_GIVEREF(__pyx_v_rhs);
-  __pyx_t_3 = PyObject_Call(__pyx_t_1, ((PyObject *)__pyx_t_2), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 535; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = PyObject_Call(__pyx_t_1, ((PyObject *)__pyx_t_2), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 618; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __Pyx_DECREF(((PyObject *)__pyx_t_2)); __pyx_t_2 = 0;
@@ -5651,7 +6035,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_33symmetric_difference(PyOb
   __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_AddTraceback("lib.intbitset.intbitset.symmetric_difference");
+  __Pyx_AddTraceback("intbitset.intbitset.symmetric_difference");
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -5659,7 +6043,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_33symmetric_difference(PyOb
   return __pyx_r;
 }
 
-/* "lib/intbitset.pyx":537
+/* "intbitset.pyx":620
  *         return self.__xor__(rhs)
  * 
  *     def symmetric_difference_update(self, rhs):             # <<<<<<<<<<<<<<
@@ -5667,30 +6051,30 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_33symmetric_difference(PyOb
  *         """
  */
 
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_34symmetric_difference_update(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs); /*proto*/
-static char __pyx_doc_3lib_9intbitset_9intbitset_34symmetric_difference_update[] = "Update an intbitset with the symmetric difference of itself and another.\n        ";
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_34symmetric_difference_update(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs) {
+static PyObject *__pyx_pf_9intbitset_9intbitset_34symmetric_difference_update(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs); /*proto*/
+static char __pyx_doc_9intbitset_9intbitset_34symmetric_difference_update[] = "Update an intbitset with the symmetric difference of itself and another.\n        ";
+static PyObject *__pyx_pf_9intbitset_9intbitset_34symmetric_difference_update(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs) {
   PyObject *__pyx_r = NULL;
   PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
   PyObject *__pyx_t_3 = NULL;
   __Pyx_RefNannySetupContext("symmetric_difference_update");
 
-  /* "lib/intbitset.pyx":540
+  /* "intbitset.pyx":623
  *         """Update an intbitset with the symmetric difference of itself and another.
  *         """
  *         self.__ixor__(rhs)             # <<<<<<<<<<<<<<
  * 
  *     # Dumping & Loading
  */
-  __pyx_t_1 = PyObject_GetAttr(__pyx_v_self, __pyx_n_s____ixor__); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 540; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyObject_GetAttr(__pyx_v_self, __pyx_n_s____ixor__); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 623; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 540; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 623; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(((PyObject *)__pyx_t_2));
   __Pyx_INCREF(__pyx_v_rhs);
   PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v_rhs);
   __Pyx_GIVEREF(__pyx_v_rhs);
-  __pyx_t_3 = PyObject_Call(__pyx_t_1, ((PyObject *)__pyx_t_2), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 540; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = PyObject_Call(__pyx_t_1, ((PyObject *)__pyx_t_2), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 623; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __Pyx_DECREF(((PyObject *)__pyx_t_2)); __pyx_t_2 = 0;
@@ -5702,7 +6086,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_34symmetric_difference_upda
   __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_AddTraceback("lib.intbitset.intbitset.symmetric_difference_update");
+  __Pyx_AddTraceback("intbitset.intbitset.symmetric_difference_update");
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -5710,49 +6094,198 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_34symmetric_difference_upda
   return __pyx_r;
 }
 
-/* "lib/intbitset.pyx":543
+/* "intbitset.pyx":626
  * 
  *     # Dumping & Loading
- *     def fastdump(self):             # <<<<<<<<<<<<<<
+ *     def fastdump(self, bint containers=False):             # <<<<<<<<<<<<<<
  *         """Return a compressed string representation suitable to be saved
- *         somewhere."""
+ *         somewhere.  If containers is True and the set is finite, the
  */
 
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_35fastdump(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static char __pyx_doc_3lib_9intbitset_9intbitset_35fastdump[] = "Return a compressed string representation suitable to be saved\n        somewhere.";
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_35fastdump(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+static PyObject *__pyx_pf_9intbitset_9intbitset_35fastdump(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_9intbitset_9intbitset_35fastdump[] = "Return a compressed string representation suitable to be saved\n        somewhere.  If containers is True and the set is finite, the\n        representation is a container dump, that is loaded without zlib\n        decompression into a compressed set.";
+static PyObject *__pyx_pf_9intbitset_9intbitset_35fastdump(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  int __pyx_v_containers;
   Py_ssize_t __pyx_v_size;
+  IntBitSet *__pyx_v_compressed;
   PyObject *__pyx_v_tmp;
   PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
+  int __pyx_t_1;
+  int __pyx_t_2;
   PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__containers,0};
   __Pyx_RefNannySetupContext("fastdump");
+  if (unlikely(__pyx_kwds)) {
+    Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
+    PyObject* values[1] = {0};
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      case  0: break;
+      default: goto __pyx_L5_argtuple_error;
+    }
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  0:
+      if (kw_args > 0) {
+        PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s__containers);
+        if (value) { values[0] = value; kw_args--; }
+      }
+    }
+    if (unlikely(kw_args > 0)) {
+      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "fastdump") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 626; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    }
+    if (values[0]) {
+      __pyx_v_containers = __Pyx_PyObject_IsTrue(values[0]); if (unlikely((__pyx_v_containers == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 626; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    } else {
+      __pyx_v_containers = ((int)0);
+    }
+  } else {
+    __pyx_v_containers = ((int)0);
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  1: __pyx_v_containers = __Pyx_PyObject_IsTrue(PyTuple_GET_ITEM(__pyx_args, 0)); if (unlikely((__pyx_v_containers == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 626; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      case  0: break;
+      default: goto __pyx_L5_argtuple_error;
+    }
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("fastdump", 0, 0, 1, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 626; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("intbitset.intbitset.fastdump");
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
   __pyx_v_tmp = Py_None; __Pyx_INCREF(Py_None);
 
-  /* "lib/intbitset.pyx":547
- *         somewhere."""
+  /* "intbitset.pyx":633
  *         cdef Py_ssize_t size
+ *         cdef IntBitSet *compressed
+ *         if containers and not self.bitset.trailing_bits:             # <<<<<<<<<<<<<<
+ *             compressed = self.bitset
+ *             if compressed.bitset != NULL:
+ */
+  if (__pyx_v_containers) {
+    __pyx_t_1 = (!((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->bitset->trailing_bits);
+    __pyx_t_2 = __pyx_t_1;
+  } else {
+    __pyx_t_2 = __pyx_v_containers;
+  }
+  if (__pyx_t_2) {
+
+    /* "intbitset.pyx":634
+ *         cdef IntBitSet *compressed
+ *         if containers and not self.bitset.trailing_bits:
+ *             compressed = self.bitset             # <<<<<<<<<<<<<<
+ *             if compressed.bitset != NULL:
+ *                 compressed = intBitSetCompress(self.bitset)
+ */
+    __pyx_v_compressed = ((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->bitset;
+
+    /* "intbitset.pyx":635
+ *         if containers and not self.bitset.trailing_bits:
+ *             compressed = self.bitset
+ *             if compressed.bitset != NULL:             # <<<<<<<<<<<<<<
+ *                 compressed = intBitSetCompress(self.bitset)
+ *             tmp = PyString_FromStringAndSize(NULL, intBitSetGetContainerDumpSize(compressed))
+ */
+    __pyx_t_2 = (__pyx_v_compressed->bitset != NULL);
+    if (__pyx_t_2) {
+
+      /* "intbitset.pyx":636
+ *             compressed = self.bitset
+ *             if compressed.bitset != NULL:
+ *                 compressed = intBitSetCompress(self.bitset)             # <<<<<<<<<<<<<<
+ *             tmp = PyString_FromStringAndSize(NULL, intBitSetGetContainerDumpSize(compressed))
+ *             intBitSetContainerDump(compressed, PyString_AsString(tmp))
+ */
+      __pyx_v_compressed = intBitSetCompress(((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->bitset);
+      goto __pyx_L7;
+    }
+    __pyx_L7:;
+
+    /* "intbitset.pyx":637
+ *             if compressed.bitset != NULL:
+ *                 compressed = intBitSetCompress(self.bitset)
+ *             tmp = PyString_FromStringAndSize(NULL, intBitSetGetContainerDumpSize(compressed))             # <<<<<<<<<<<<<<
+ *             intBitSetContainerDump(compressed, PyString_AsString(tmp))
+ *             if compressed != self.bitset:
+ */
+    __pyx_t_3 = PyString_FromStringAndSize(NULL, intBitSetGetContainerDumpSize(__pyx_v_compressed)); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 637; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_v_tmp);
+    __pyx_v_tmp = __pyx_t_3;
+    __pyx_t_3 = 0;
+
+    /* "intbitset.pyx":638
+ *                 compressed = intBitSetCompress(self.bitset)
+ *             tmp = PyString_FromStringAndSize(NULL, intBitSetGetContainerDumpSize(compressed))
+ *             intBitSetContainerDump(compressed, PyString_AsString(tmp))             # <<<<<<<<<<<<<<
+ *             if compressed != self.bitset:
+ *                 intBitSetDestroy(compressed)
+ */
+    intBitSetContainerDump(__pyx_v_compressed, PyString_AsString(__pyx_v_tmp));
+
+    /* "intbitset.pyx":639
+ *             tmp = PyString_FromStringAndSize(NULL, intBitSetGetContainerDumpSize(compressed))
+ *             intBitSetContainerDump(compressed, PyString_AsString(tmp))
+ *             if compressed != self.bitset:             # <<<<<<<<<<<<<<
+ *                 intBitSetDestroy(compressed)
+ *             return tmp
+ */
+    __pyx_t_2 = (__pyx_v_compressed != ((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->bitset);
+    if (__pyx_t_2) {
+
+      /* "intbitset.pyx":640
+ *             intBitSetContainerDump(compressed, PyString_AsString(tmp))
+ *             if compressed != self.bitset:
+ *                 intBitSetDestroy(compressed)             # <<<<<<<<<<<<<<
+ *             return tmp
+ *         size = intBitSetGetSize((<intbitset> self).bitset)
+ */
+      intBitSetDestroy(__pyx_v_compressed);
+      goto __pyx_L8;
+    }
+    __pyx_L8:;
+
+    /* "intbitset.pyx":641
+ *             if compressed != self.bitset:
+ *                 intBitSetDestroy(compressed)
+ *             return tmp             # <<<<<<<<<<<<<<
+ *         size = intBitSetGetSize((<intbitset> self).bitset)
+ *         tmp = PyString_FromStringAndSize(<char *>self.bitset.bitset, ( size + 1) * wordbytesize)
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(__pyx_v_tmp);
+    __pyx_r = __pyx_v_tmp;
+    goto __pyx_L0;
+    goto __pyx_L6;
+  }
+  __pyx_L6:;
+
+  /* "intbitset.pyx":642
+ *                 intBitSetDestroy(compressed)
+ *             return tmp
  *         size = intBitSetGetSize((<intbitset> self).bitset)             # <<<<<<<<<<<<<<
  *         tmp = PyString_FromStringAndSize(<char *>self.bitset.bitset, ( size + 1) * wordbytesize)
  *         return zlib.compress(tmp)
  */
-  __pyx_v_size = intBitSetGetSize(((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->bitset);
+  __pyx_v_size = intBitSetGetSize(((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->bitset);
 
-  /* "lib/intbitset.pyx":548
- *         cdef Py_ssize_t size
+  /* "intbitset.pyx":643
+ *             return tmp
  *         size = intBitSetGetSize((<intbitset> self).bitset)
  *         tmp = PyString_FromStringAndSize(<char *>self.bitset.bitset, ( size + 1) * wordbytesize)             # <<<<<<<<<<<<<<
  *         return zlib.compress(tmp)
  * 
  */
-  __pyx_t_1 = PyString_FromStringAndSize(((char *)((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->bitset->bitset), ((__pyx_v_size + 1) * wordbytesize)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 548; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_3 = PyString_FromStringAndSize(((char *)((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->bitset->bitset), ((__pyx_v_size + 1) * wordbytesize)); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 643; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_v_tmp);
-  __pyx_v_tmp = __pyx_t_1;
-  __pyx_t_1 = 0;
+  __pyx_v_tmp = __pyx_t_3;
+  __pyx_t_3 = 0;
 
-  /* "lib/intbitset.pyx":549
+  /* "intbitset.pyx":644
  *         size = intBitSetGetSize((<intbitset> self).bitset)
  *         tmp = PyString_FromStringAndSize(<char *>self.bitset.bitset, ( size + 1) * wordbytesize)
  *         return zlib.compress(tmp)             # <<<<<<<<<<<<<<
@@ -5760,31 +6293,31 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_35fastdump(PyObject *__pyx_
  *     def fastload(self, strdump):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__zlib); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 549; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyObject_GetAttr(__pyx_t_1, __pyx_n_s__compress); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 549; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 549; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_t_1));
+  __pyx_t_3 = __Pyx_GetName(__pyx_m, __pyx_n_s__zlib); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 644; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = PyObject_GetAttr(__pyx_t_3, __pyx_n_s__compress); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 644; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 644; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_t_3));
   __Pyx_INCREF(__pyx_v_tmp);
-  PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_tmp);
+  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_v_tmp);
   __Pyx_GIVEREF(__pyx_v_tmp);
-  __pyx_t_3 = PyObject_Call(__pyx_t_2, ((PyObject *)__pyx_t_1), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 549; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __Pyx_DECREF(((PyObject *)__pyx_t_1)); __pyx_t_1 = 0;
-  __pyx_r = __pyx_t_3;
-  __pyx_t_3 = 0;
+  __pyx_t_5 = PyObject_Call(__pyx_t_4, ((PyObject *)__pyx_t_3), NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 644; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(((PyObject *)__pyx_t_3)); __pyx_t_3 = 0;
+  __pyx_r = __pyx_t_5;
+  __pyx_t_5 = 0;
   goto __pyx_L0;
 
   __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_AddTraceback("lib.intbitset.intbitset.fastdump");
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("intbitset.intbitset.fastdump");
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_DECREF(__pyx_v_tmp);
@@ -5793,7 +6326,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_35fastdump(PyObject *__pyx_
   return __pyx_r;
 }
 
-/* "lib/intbitset.pyx":551
+/* "intbitset.pyx":646
  *         return zlib.compress(tmp)
  * 
  *     def fastload(self, strdump):             # <<<<<<<<<<<<<<
@@ -5801,11 +6334,13 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_35fastdump(PyObject *__pyx_
  *         to the fastdump method into the current intbitset. The previous content
  */
 
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_36fastload(PyObject *__pyx_v_self, PyObject *__pyx_v_strdump); /*proto*/
-static char __pyx_doc_3lib_9intbitset_9intbitset_36fastload[] = "Load a compressed string representation produced by a previous call\n        to the fastdump method into the current intbitset. The previous content\n        will be replaced.";
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_36fastload(PyObject *__pyx_v_self, PyObject *__pyx_v_strdump) {
+static PyObject *__pyx_pf_9intbitset_9intbitset_36fastload(PyObject *__pyx_v_self, PyObject *__pyx_v_strdump); /*proto*/
+static char __pyx_doc_9intbitset_9intbitset_36fastload[] = "Load a compressed string representation produced by a previous call\n        to the fastdump method into the current intbitset. The previous content\n        will be replaced.";
+static PyObject *__pyx_pf_9intbitset_9intbitset_36fastload(PyObject *__pyx_v_self, PyObject *__pyx_v_strdump) {
   Py_ssize_t __pyx_v_size;
   void *__pyx_v_buf;
+  IntBitSet *__pyx_v_tmpbitset;
+  int __pyx_v_borrow;
   PyObject *__pyx_v_tmp;
   PyObject *__pyx_r = NULL;
   PyObject *__pyx_t_1 = NULL;
@@ -5818,17 +6353,17 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_36fastload(PyObject *__pyx_
   __Pyx_INCREF(__pyx_v_strdump);
   __pyx_v_tmp = Py_None; __Pyx_INCREF(Py_None);
 
-  /* "lib/intbitset.pyx":557
- *         cdef Py_ssize_t size
- *         cdef void *buf
+  /* "intbitset.pyx":654
+ *         cdef IntBitSet *tmpbitset
+ *         cdef bint borrow
  *         buf = NULL             # <<<<<<<<<<<<<<
  *         size = 0
  *         try:
  */
   __pyx_v_buf = NULL;
 
-  /* "lib/intbitset.pyx":558
- *         cdef void *buf
+  /* "intbitset.pyx":655
+ *         cdef bint borrow
  *         buf = NULL
  *         size = 0             # <<<<<<<<<<<<<<
  *         try:
@@ -5836,7 +6371,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_36fastload(PyObject *__pyx_
  */
   __pyx_v_size = 0;
 
-  /* "lib/intbitset.pyx":559
+  /* "intbitset.pyx":656
  *         buf = NULL
  *         size = 0
  *         try:             # <<<<<<<<<<<<<<
@@ -5851,29 +6386,29 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_36fastload(PyObject *__pyx_
     __Pyx_XGOTREF(__pyx_save_exc_tb);
     /*try:*/ {
 
-      /* "lib/intbitset.pyx":560
+      /* "intbitset.pyx":657
  *         size = 0
  *         try:
  *             if type(strdump) is array:             # <<<<<<<<<<<<<<
  *                 strdump = strdump.tostring()
- *             # tmp needed to not be garbage collected
+ *             if PyObject_AsReadBuffer(strdump, &buf, &size) < 0:
  */
-      __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__array); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 560; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
+      __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__array); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 657; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
       __Pyx_GOTREF(__pyx_t_1);
       __pyx_t_2 = (((PyObject *)Py_TYPE(__pyx_v_strdump)) == __pyx_t_1);
       __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
       if (__pyx_t_2) {
 
-        /* "lib/intbitset.pyx":561
+        /* "intbitset.pyx":658
  *         try:
  *             if type(strdump) is array:
  *                 strdump = strdump.tostring()             # <<<<<<<<<<<<<<
- *             # tmp needed to not be garbage collected
- *             tmp = zlib.decompress(strdump)
+ *             if PyObject_AsReadBuffer(strdump, &buf, &size) < 0:
+ *                 raise Exception()
  */
-        __pyx_t_1 = PyObject_GetAttr(__pyx_v_strdump, __pyx_n_s__tostring); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 561; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
+        __pyx_t_1 = PyObject_GetAttr(__pyx_v_strdump, __pyx_n_s__tostring); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 658; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
         __Pyx_GOTREF(__pyx_t_1);
-        __pyx_t_3 = PyObject_Call(__pyx_t_1, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 561; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
+        __pyx_t_3 = PyObject_Call(__pyx_t_1, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 658; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
         __Pyx_GOTREF(__pyx_t_3);
         __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
         __Pyx_DECREF(__pyx_v_strdump);
@@ -5883,58 +6418,216 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_36fastload(PyObject *__pyx_
       }
       __pyx_L13:;
 
-      /* "lib/intbitset.pyx":563
+      /* "intbitset.pyx":659
+ *             if type(strdump) is array:
  *                 strdump = strdump.tostring()
- *             # tmp needed to not be garbage collected
- *             tmp = zlib.decompress(strdump)             # <<<<<<<<<<<<<<
- *             if PyObject_AsReadBuffer(tmp, &buf, &size) < 0:
+ *             if PyObject_AsReadBuffer(strdump, &buf, &size) < 0:             # <<<<<<<<<<<<<<
  *                 raise Exception()
+ *             if intBitSetIsContainerBuffer(buf, size):
  */
-      __pyx_t_3 = __Pyx_GetName(__pyx_m, __pyx_n_s__zlib); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 563; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
-      __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_1 = PyObject_GetAttr(__pyx_t_3, __pyx_n_s__decompress); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 563; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
-      __Pyx_GOTREF(__pyx_t_1);
+      __pyx_t_3 = __pyx_v_strdump;
+      __Pyx_INCREF(__pyx_t_3);
+      __pyx_t_2 = (PyObject_AsReadBuffer(__pyx_t_3, (&__pyx_v_buf), (&__pyx_v_size)) < 0);
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 563; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
-      __Pyx_GOTREF(((PyObject *)__pyx_t_3));
-      __Pyx_INCREF(__pyx_v_strdump);
-      PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_v_strdump);
-      __Pyx_GIVEREF(__pyx_v_strdump);
-      __pyx_t_4 = PyObject_Call(__pyx_t_1, ((PyObject *)__pyx_t_3), NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 563; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
-      __Pyx_GOTREF(__pyx_t_4);
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      __Pyx_DECREF(((PyObject *)__pyx_t_3)); __pyx_t_3 = 0;
-      __Pyx_DECREF(__pyx_v_tmp);
-      __pyx_v_tmp = __pyx_t_4;
-      __pyx_t_4 = 0;
+      if (__pyx_t_2) {
 
-      /* "lib/intbitset.pyx":564
- *             # tmp needed to not be garbage collected
- *             tmp = zlib.decompress(strdump)
- *             if PyObject_AsReadBuffer(tmp, &buf, &size) < 0:             # <<<<<<<<<<<<<<
- *                 raise Exception()
- *             if (size % wordbytesize):
+        /* "intbitset.pyx":660
+ *                 strdump = strdump.tostring()
+ *             if PyObject_AsReadBuffer(strdump, &buf, &size) < 0:
+ *                 raise Exception()             # <<<<<<<<<<<<<<
+ *             if intBitSetIsContainerBuffer(buf, size):
+ *                 borrow = _is_immutable_buffer(strdump)
+ */
+        __pyx_t_3 = PyObject_Call(__pyx_builtin_Exception, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 660; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
+        __Pyx_GOTREF(__pyx_t_3);
+        __Pyx_Raise(__pyx_t_3, 0, 0);
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        {__pyx_filename = __pyx_f[0]; __pyx_lineno = 660; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
+        goto __pyx_L14;
+      }
+      __pyx_L14:;
+
+      /* "intbitset.pyx":661
+ *             if PyObject_AsReadBuffer(strdump, &buf, &size) < 0:
+ *                 raise Exception()
+ *             if intBitSetIsContainerBuffer(buf, size):             # <<<<<<<<<<<<<<
+ *                 borrow = _is_immutable_buffer(strdump)
+ *                 tmpbitset = intBitSetCreateFromContainerBuffer(buf, size, borrow)
+ */
+      __pyx_t_2 = intBitSetIsContainerBuffer(__pyx_v_buf, __pyx_v_size);
+      if (__pyx_t_2) {
+
+        /* "intbitset.pyx":662
+ *                 raise Exception()
+ *             if intBitSetIsContainerBuffer(buf, size):
+ *                 borrow = _is_immutable_buffer(strdump)             # <<<<<<<<<<<<<<
+ *                 tmpbitset = intBitSetCreateFromContainerBuffer(buf, size, borrow)
+ *                 if tmpbitset == NULL:
+ */
+        __pyx_t_3 = __pyx_v_strdump;
+        __Pyx_INCREF(__pyx_t_3);
+        __pyx_t_2 = __pyx_f_9intbitset__is_immutable_buffer(__pyx_t_3); if (unlikely(__pyx_t_2 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 662; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __pyx_v_borrow = __pyx_t_2;
+
+        /* "intbitset.pyx":663
+ *             if intBitSetIsContainerBuffer(buf, size):
+ *                 borrow = _is_immutable_buffer(strdump)
+ *                 tmpbitset = intBitSetCreateFromContainerBuffer(buf, size, borrow)             # <<<<<<<<<<<<<<
+ *                 if tmpbitset == NULL:
+ *                     raise Exception()
+ */
+        __pyx_v_tmpbitset = intBitSetCreateFromContainerBuffer(__pyx_v_buf, __pyx_v_size, __pyx_v_borrow);
+
+        /* "intbitset.pyx":664
+ *                 borrow = _is_immutable_buffer(strdump)
+ *                 tmpbitset = intBitSetCreateFromContainerBuffer(buf, size, borrow)
+ *                 if tmpbitset == NULL:             # <<<<<<<<<<<<<<
+ *                     raise Exception()
+ *                 intBitSetDestroy(self.bitset)
+ */
+        __pyx_t_2 = (__pyx_v_tmpbitset == NULL);
+        if (__pyx_t_2) {
+
+          /* "intbitset.pyx":665
+ *                 tmpbitset = intBitSetCreateFromContainerBuffer(buf, size, borrow)
+ *                 if tmpbitset == NULL:
+ *                     raise Exception()             # <<<<<<<<<<<<<<
+ *                 intBitSetDestroy(self.bitset)
+ *                 self.bitset = tmpbitset
+ */
+          __pyx_t_3 = PyObject_Call(__pyx_builtin_Exception, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 665; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
+          __Pyx_GOTREF(__pyx_t_3);
+          __Pyx_Raise(__pyx_t_3, 0, 0);
+          __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+          {__pyx_filename = __pyx_f[0]; __pyx_lineno = 665; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
+          goto __pyx_L16;
+        }
+        __pyx_L16:;
+
+        /* "intbitset.pyx":666
+ *                 if tmpbitset == NULL:
+ *                     raise Exception()
+ *                 intBitSetDestroy(self.bitset)             # <<<<<<<<<<<<<<
+ *                 self.bitset = tmpbitset
+ *                 self.dump = None
+ */
+        intBitSetDestroy(((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->bitset);
+
+        /* "intbitset.pyx":667
+ *                     raise Exception()
+ *                 intBitSetDestroy(self.bitset)
+ *                 self.bitset = tmpbitset             # <<<<<<<<<<<<<<
+ *                 self.dump = None
+ *                 if borrow:
+ */
+        ((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->bitset = __pyx_v_tmpbitset;
+
+        /* "intbitset.pyx":668
+ *                 intBitSetDestroy(self.bitset)
+ *                 self.bitset = tmpbitset
+ *                 self.dump = None             # <<<<<<<<<<<<<<
+ *                 if borrow:
+ *                     self.dump = strdump
+ */
+        __Pyx_INCREF(Py_None);
+        __Pyx_GIVEREF(Py_None);
+        __Pyx_GOTREF(((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->dump);
+        __Pyx_DECREF(((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->dump);
+        ((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->dump = Py_None;
+
+        /* "intbitset.pyx":669
+ *                 self.bitset = tmpbitset
+ *                 self.dump = None
+ *                 if borrow:             # <<<<<<<<<<<<<<
+ *                     self.dump = strdump
+ *                 return self
+ */
+        if (__pyx_v_borrow) {
+
+          /* "intbitset.pyx":670
+ *                 self.dump = None
+ *                 if borrow:
+ *                     self.dump = strdump             # <<<<<<<<<<<<<<
+ *                 return self
+ *             # tmp needed to not be garbage collected
+ */
+          __Pyx_INCREF(__pyx_v_strdump);
+          __Pyx_GIVEREF(__pyx_v_strdump);
+          __Pyx_GOTREF(((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->dump);
+          __Pyx_DECREF(((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->dump);
+          ((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->dump = __pyx_v_strdump;
+          goto __pyx_L17;
+        }
+        __pyx_L17:;
+
+        /* "intbitset.pyx":671
+ *                 if borrow:
+ *                     self.dump = strdump
+ *                 return self             # <<<<<<<<<<<<<<
+ *             # tmp needed to not be garbage collected
+ *             tmp = zlib.decompress(strdump)
+ */
+        __Pyx_XDECREF(__pyx_r);
+        __Pyx_INCREF(__pyx_v_self);
+        __pyx_r = __pyx_v_self;
+        goto __pyx_L9_try_return;
+        goto __pyx_L15;
+      }
+      __pyx_L15:;
+
+      /* "intbitset.pyx":673
+ *                 return self
+ *             # tmp needed to not be garbage collected
+ *             tmp = zlib.decompress(strdump)             # <<<<<<<<<<<<<<
+ *             if PyObject_AsReadBuffer(tmp, &buf, &size) < 0:
+ *                 raise Exception()
+ */
+      __pyx_t_3 = __Pyx_GetName(__pyx_m, __pyx_n_s__zlib); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 673; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_1 = PyObject_GetAttr(__pyx_t_3, __pyx_n_s__decompress); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 673; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 673; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
+      __Pyx_GOTREF(((PyObject *)__pyx_t_3));
+      __Pyx_INCREF(__pyx_v_strdump);
+      PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_v_strdump);
+      __Pyx_GIVEREF(__pyx_v_strdump);
+      __pyx_t_4 = PyObject_Call(__pyx_t_1, ((PyObject *)__pyx_t_3), NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 673; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __Pyx_DECREF(((PyObject *)__pyx_t_3)); __pyx_t_3 = 0;
+      __Pyx_DECREF(__pyx_v_tmp);
+      __pyx_v_tmp = __pyx_t_4;
+      __pyx_t_4 = 0;
+
+      /* "intbitset.pyx":674
+ *             # tmp needed to not be garbage collected
+ *             tmp = zlib.decompress(strdump)
+ *             if PyObject_AsReadBuffer(tmp, &buf, &size) < 0:             # <<<<<<<<<<<<<<
+ *                 raise Exception()
+ *             if (size % wordbytesize):
  */
       __pyx_t_2 = (PyObject_AsReadBuffer(__pyx_v_tmp, (&__pyx_v_buf), (&__pyx_v_size)) < 0);
       if (__pyx_t_2) {
 
-        /* "lib/intbitset.pyx":565
+        /* "intbitset.pyx":675
  *             tmp = zlib.decompress(strdump)
  *             if PyObject_AsReadBuffer(tmp, &buf, &size) < 0:
  *                 raise Exception()             # <<<<<<<<<<<<<<
  *             if (size % wordbytesize):
  *                 ## Wrong size!
  */
-        __pyx_t_4 = PyObject_Call(__pyx_builtin_Exception, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 565; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
+        __pyx_t_4 = PyObject_Call(__pyx_builtin_Exception, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 675; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
         __Pyx_GOTREF(__pyx_t_4);
         __Pyx_Raise(__pyx_t_4, 0, 0);
         __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-        {__pyx_filename = __pyx_f[0]; __pyx_lineno = 565; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
-        goto __pyx_L14;
+        {__pyx_filename = __pyx_f[0]; __pyx_lineno = 675; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
+        goto __pyx_L18;
       }
-      __pyx_L14:;
+      __pyx_L18:;
 
-      /* "lib/intbitset.pyx":566
+      /* "intbitset.pyx":676
  *             if PyObject_AsReadBuffer(tmp, &buf, &size) < 0:
  *                 raise Exception()
  *             if (size % wordbytesize):             # <<<<<<<<<<<<<<
@@ -5943,46 +6636,52 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_36fastload(PyObject *__pyx_
  */
       if (unlikely(wordbytesize == 0)) {
         PyErr_Format(PyExc_ZeroDivisionError, "integer division or modulo by zero");
-        {__pyx_filename = __pyx_f[0]; __pyx_lineno = 566; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
+        {__pyx_filename = __pyx_f[0]; __pyx_lineno = 676; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
       }
       __pyx_t_5 = __Pyx_mod_Py_ssize_t(__pyx_v_size, wordbytesize);
       if (__pyx_t_5) {
 
-        /* "lib/intbitset.pyx":568
+        /* "intbitset.pyx":678
  *             if (size % wordbytesize):
  *                 ## Wrong size!
  *                 raise Exception()             # <<<<<<<<<<<<<<
  *             intBitSetResetFromBuffer((<intbitset> self).bitset, buf, size)
  *         except:
  */
-        __pyx_t_4 = PyObject_Call(__pyx_builtin_Exception, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 568; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
+        __pyx_t_4 = PyObject_Call(__pyx_builtin_Exception, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 678; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
         __Pyx_GOTREF(__pyx_t_4);
         __Pyx_Raise(__pyx_t_4, 0, 0);
         __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-        {__pyx_filename = __pyx_f[0]; __pyx_lineno = 568; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
-        goto __pyx_L15;
+        {__pyx_filename = __pyx_f[0]; __pyx_lineno = 678; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
+        goto __pyx_L19;
       }
-      __pyx_L15:;
+      __pyx_L19:;
 
-      /* "lib/intbitset.pyx":569
+      /* "intbitset.pyx":679
  *                 ## Wrong size!
  *                 raise Exception()
  *             intBitSetResetFromBuffer((<intbitset> self).bitset, buf, size)             # <<<<<<<<<<<<<<
  *         except:
  *             raise ValueError("strdump is corrupted")
  */
-      intBitSetResetFromBuffer(((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->bitset, __pyx_v_buf, __pyx_v_size);
+      intBitSetResetFromBuffer(((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->bitset, __pyx_v_buf, __pyx_v_size);
     }
     __Pyx_XDECREF(__pyx_save_exc_type); __pyx_save_exc_type = 0;
     __Pyx_XDECREF(__pyx_save_exc_value); __pyx_save_exc_value = 0;
     __Pyx_XDECREF(__pyx_save_exc_tb); __pyx_save_exc_tb = 0;
     goto __pyx_L12_try_end;
+    __pyx_L9_try_return:;
+    __Pyx_XGIVEREF(__pyx_save_exc_type);
+    __Pyx_XGIVEREF(__pyx_save_exc_value);
+    __Pyx_XGIVEREF(__pyx_save_exc_tb);
+    __Pyx_ExceptionReset(__pyx_save_exc_type, __pyx_save_exc_value, __pyx_save_exc_tb);
+    goto __pyx_L0;
     __pyx_L5_error:;
     __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
     __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
 
-    /* "lib/intbitset.pyx":570
+    /* "intbitset.pyx":680
  *                 raise Exception()
  *             intBitSetResetFromBuffer((<intbitset> self).bitset, buf, size)
  *         except:             # <<<<<<<<<<<<<<
@@ -5990,24 +6689,24 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_36fastload(PyObject *__pyx_
  *         return self
  */
     /*except:*/ {
-      __Pyx_AddTraceback("lib.intbitset.intbitset.fastload");
-      if (__Pyx_GetException(&__pyx_t_4, &__pyx_t_3, &__pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 570; __pyx_clineno = __LINE__; goto __pyx_L7_except_error;}
+      __Pyx_AddTraceback("intbitset.intbitset.fastload");
+      if (__Pyx_GetException(&__pyx_t_4, &__pyx_t_3, &__pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 680; __pyx_clineno = __LINE__; goto __pyx_L7_except_error;}
       __Pyx_GOTREF(__pyx_t_4);
       __Pyx_GOTREF(__pyx_t_3);
       __Pyx_GOTREF(__pyx_t_1);
 
-      /* "lib/intbitset.pyx":571
+      /* "intbitset.pyx":681
  *             intBitSetResetFromBuffer((<intbitset> self).bitset, buf, size)
  *         except:
  *             raise ValueError("strdump is corrupted")             # <<<<<<<<<<<<<<
  *         return self
  * 
  */
-      __pyx_t_6 = PyObject_Call(__pyx_builtin_ValueError, ((PyObject *)__pyx_k_tuple_41), NULL); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 571; __pyx_clineno = __LINE__; goto __pyx_L7_except_error;}
+      __pyx_t_6 = PyObject_Call(__pyx_builtin_ValueError, ((PyObject *)__pyx_k_tuple_44), NULL); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 681; __pyx_clineno = __LINE__; goto __pyx_L7_except_error;}
       __Pyx_GOTREF(__pyx_t_6);
       __Pyx_Raise(__pyx_t_6, 0, 0);
       __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 571; __pyx_clineno = __LINE__; goto __pyx_L7_except_error;}
+      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 681; __pyx_clineno = __LINE__; goto __pyx_L7_except_error;}
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
       __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
@@ -6027,7 +6726,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_36fastload(PyObject *__pyx_
     __pyx_L12_try_end:;
   }
 
-  /* "lib/intbitset.pyx":572
+  /* "intbitset.pyx":682
  *         except:
  *             raise ValueError("strdump is corrupted")
  *         return self             # <<<<<<<<<<<<<<
@@ -6046,7 +6745,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_36fastload(PyObject *__pyx_
   __Pyx_XDECREF(__pyx_t_3);
   __Pyx_XDECREF(__pyx_t_4);
   __Pyx_XDECREF(__pyx_t_6);
-  __Pyx_AddTraceback("lib.intbitset.intbitset.fastload");
+  __Pyx_AddTraceback("intbitset.intbitset.fastload");
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_DECREF(__pyx_v_tmp);
@@ -6056,7 +6755,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_36fastload(PyObject *__pyx_
   return __pyx_r;
 }
 
-/* "lib/intbitset.pyx":574
+/* "intbitset.pyx":684
  *         return self
  * 
  *     def copy(self):             # <<<<<<<<<<<<<<
@@ -6064,15 +6763,15 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_36fastload(PyObject *__pyx_
  *         return intbitset(self)
  */
 
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_37copy(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static char __pyx_doc_3lib_9intbitset_9intbitset_37copy[] = "Return a shallow copy of a set.";
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_37copy(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+static PyObject *__pyx_pf_9intbitset_9intbitset_37copy(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static char __pyx_doc_9intbitset_9intbitset_37copy[] = "Return a shallow copy of a set.";
+static PyObject *__pyx_pf_9intbitset_9intbitset_37copy(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
   PyObject *__pyx_r = NULL;
   PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
   __Pyx_RefNannySetupContext("copy");
 
-  /* "lib/intbitset.pyx":576
+  /* "intbitset.pyx":686
  *     def copy(self):
  *         """Return a shallow copy of a set."""
  *         return intbitset(self)             # <<<<<<<<<<<<<<
@@ -6080,12 +6779,12 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_37copy(PyObject *__pyx_v_se
  *     def pop(self):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 576; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 686; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(((PyObject *)__pyx_t_1));
   __Pyx_INCREF(__pyx_v_self);
   PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_self);
   __Pyx_GIVEREF(__pyx_v_self);
-  __pyx_t_2 = PyObject_Call(((PyObject *)((PyObject*)__pyx_ptype_3lib_9intbitset_intbitset)), ((PyObject *)__pyx_t_1), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 576; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyObject_Call(((PyObject *)((PyObject*)__pyx_ptype_9intbitset_intbitset)), ((PyObject *)__pyx_t_1), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 686; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(((PyObject *)__pyx_t_1)); __pyx_t_1 = 0;
   __pyx_r = __pyx_t_2;
@@ -6097,7 +6796,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_37copy(PyObject *__pyx_v_se
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_AddTraceback("lib.intbitset.intbitset.copy");
+  __Pyx_AddTraceback("intbitset.intbitset.copy");
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -6105,7 +6804,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_37copy(PyObject *__pyx_v_se
   return __pyx_r;
 }
 
-/* "lib/intbitset.pyx":578
+/* "intbitset.pyx":688
  *         return intbitset(self)
  * 
  *     def pop(self):             # <<<<<<<<<<<<<<
@@ -6113,25 +6812,25 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_37copy(PyObject *__pyx_v_se
  *         cdef int ret
  */
 
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_38pop(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static char __pyx_doc_3lib_9intbitset_9intbitset_38pop[] = "Remove and return an arbitrary set element.";
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_38pop(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+static PyObject *__pyx_pf_9intbitset_9intbitset_38pop(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static char __pyx_doc_9intbitset_9intbitset_38pop[] = "Remove and return an arbitrary set element.";
+static PyObject *__pyx_pf_9intbitset_9intbitset_38pop(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
   int __pyx_v_ret;
   PyObject *__pyx_r = NULL;
   int __pyx_t_1;
   PyObject *__pyx_t_2 = NULL;
   __Pyx_RefNannySetupContext("pop");
 
-  /* "lib/intbitset.pyx":581
+  /* "intbitset.pyx":691
  *         """Remove and return an arbitrary set element."""
  *         cdef int ret
  *         ret = intBitSetGetNext(self.bitset, -1)             # <<<<<<<<<<<<<<
  *         if ret < 0:
  *             raise KeyError("pop from an empty intbitset")
  */
-  __pyx_v_ret = intBitSetGetNext(((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->bitset, -1);
+  __pyx_v_ret = intBitSetGetNext(((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->bitset, -1);
 
-  /* "lib/intbitset.pyx":582
+  /* "intbitset.pyx":692
  *         cdef int ret
  *         ret = intBitSetGetNext(self.bitset, -1)
  *         if ret < 0:             # <<<<<<<<<<<<<<
@@ -6141,32 +6840,32 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_38pop(PyObject *__pyx_v_sel
   __pyx_t_1 = (__pyx_v_ret < 0);
   if (__pyx_t_1) {
 
-    /* "lib/intbitset.pyx":583
+    /* "intbitset.pyx":693
  *         ret = intBitSetGetNext(self.bitset, -1)
  *         if ret < 0:
  *             raise KeyError("pop from an empty intbitset")             # <<<<<<<<<<<<<<
  *         intBitSetDelElem(self.bitset, ret)
  *         return ret
  */
-    __pyx_t_2 = PyObject_Call(__pyx_builtin_KeyError, ((PyObject *)__pyx_k_tuple_43), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 583; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = PyObject_Call(__pyx_builtin_KeyError, ((PyObject *)__pyx_k_tuple_46), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 693; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_Raise(__pyx_t_2, 0, 0);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 583; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 693; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     goto __pyx_L5;
   }
   __pyx_L5:;
 
-  /* "lib/intbitset.pyx":584
+  /* "intbitset.pyx":694
  *         if ret < 0:
  *             raise KeyError("pop from an empty intbitset")
  *         intBitSetDelElem(self.bitset, ret)             # <<<<<<<<<<<<<<
  *         return ret
  * 
  */
-  intBitSetDelElem(((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->bitset, __pyx_v_ret);
+  intBitSetDelElem(((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->bitset, __pyx_v_ret);
 
-  /* "lib/intbitset.pyx":585
+  /* "intbitset.pyx":695
  *             raise KeyError("pop from an empty intbitset")
  *         intBitSetDelElem(self.bitset, ret)
  *         return ret             # <<<<<<<<<<<<<<
@@ -6174,7 +6873,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_38pop(PyObject *__pyx_v_sel
  *     def remove(self, int elem):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_2 = PyInt_FromLong(__pyx_v_ret); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 585; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyInt_FromLong(__pyx_v_ret); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 695; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
   __pyx_r = __pyx_t_2;
   __pyx_t_2 = 0;
@@ -6184,7 +6883,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_38pop(PyObject *__pyx_v_sel
   goto __pyx_L0;
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_AddTraceback("lib.intbitset.intbitset.pop");
+  __Pyx_AddTraceback("intbitset.intbitset.pop");
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -6192,7 +6891,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_38pop(PyObject *__pyx_v_sel
   return __pyx_r;
 }
 
-/* "lib/intbitset.pyx":587
+/* "intbitset.pyx":697
  *         return ret
  * 
  *     def remove(self, int elem):             # <<<<<<<<<<<<<<
@@ -6200,9 +6899,9 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_38pop(PyObject *__pyx_v_sel
  *         If the element is not a member, raise a KeyError.
  */
 
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_39remove(PyObject *__pyx_v_self, PyObject *__pyx_arg_elem); /*proto*/
-static char __pyx_doc_3lib_9intbitset_9intbitset_39remove[] = "Remove an element from a set; it must be a member.\n        If the element is not a member, raise a KeyError.\n        ";
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_39remove(PyObject *__pyx_v_self, PyObject *__pyx_arg_elem) {
+static PyObject *__pyx_pf_9intbitset_9intbitset_39remove(PyObject *__pyx_v_self, PyObject *__pyx_arg_elem); /*proto*/
+static char __pyx_doc_9intbitset_9intbitset_39remove[] = "Remove an element from a set; it must be a member.\n        If the element is not a member, raise a KeyError.\n        ";
+static PyObject *__pyx_pf_9intbitset_9intbitset_39remove(PyObject *__pyx_v_self, PyObject *__pyx_arg_elem) {
   int __pyx_v_elem;
   PyObject *__pyx_r = NULL;
   int __pyx_t_1;
@@ -6210,25 +6909,25 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_39remove(PyObject *__pyx_v_
   PyObject *__pyx_t_3 = NULL;
   __Pyx_RefNannySetupContext("remove");
   assert(__pyx_arg_elem); {
-    __pyx_v_elem = __Pyx_PyInt_AsInt(__pyx_arg_elem); if (unlikely((__pyx_v_elem == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 587; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_elem = __Pyx_PyInt_AsInt(__pyx_arg_elem); if (unlikely((__pyx_v_elem == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 697; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
-  __Pyx_AddTraceback("lib.intbitset.intbitset.remove");
+  __Pyx_AddTraceback("intbitset.intbitset.remove");
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
 
-  /* "lib/intbitset.pyx":591
+  /* "intbitset.pyx":701
  *         If the element is not a member, raise a KeyError.
  *         """
  *         if self.sanity_checks:             # <<<<<<<<<<<<<<
  *             if elem < 0:
  *                 raise ValueError("Negative numbers, not allowed")
  */
-  if (((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->sanity_checks) {
+  if (((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->sanity_checks) {
 
-    /* "lib/intbitset.pyx":592
+    /* "intbitset.pyx":702
  *         """
  *         if self.sanity_checks:
  *             if elem < 0:             # <<<<<<<<<<<<<<
@@ -6238,22 +6937,22 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_39remove(PyObject *__pyx_v_
     __pyx_t_1 = (__pyx_v_elem < 0);
     if (__pyx_t_1) {
 
-      /* "lib/intbitset.pyx":593
+      /* "intbitset.pyx":703
  *         if self.sanity_checks:
  *             if elem < 0:
  *                 raise ValueError("Negative numbers, not allowed")             # <<<<<<<<<<<<<<
  *             elif elem > maxelem:
  *                 raise OverflowError("Elements must be <= %s" % maxelem)
  */
-      __pyx_t_2 = PyObject_Call(__pyx_builtin_ValueError, ((PyObject *)__pyx_k_tuple_44), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 593; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_2 = PyObject_Call(__pyx_builtin_ValueError, ((PyObject *)__pyx_k_tuple_47), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 703; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_2);
       __Pyx_Raise(__pyx_t_2, 0, 0);
       __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 593; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 703; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       goto __pyx_L6;
     }
 
-    /* "lib/intbitset.pyx":594
+    /* "intbitset.pyx":704
  *             if elem < 0:
  *                 raise ValueError("Negative numbers, not allowed")
  *             elif elem > maxelem:             # <<<<<<<<<<<<<<
@@ -6263,29 +6962,29 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_39remove(PyObject *__pyx_v_
     __pyx_t_1 = (__pyx_v_elem > maxelem);
     if (__pyx_t_1) {
 
-      /* "lib/intbitset.pyx":595
+      /* "intbitset.pyx":705
  *                 raise ValueError("Negative numbers, not allowed")
  *             elif elem > maxelem:
  *                 raise OverflowError("Elements must be <= %s" % maxelem)             # <<<<<<<<<<<<<<
  *         if intBitSetIsInElem(self.bitset, elem):
  *             intBitSetDelElem(self.bitset, elem)
  */
-      __pyx_t_2 = PyInt_FromLong(maxelem); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 595; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_2 = PyInt_FromLong(maxelem); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 705; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_2);
-      __pyx_t_3 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_10), __pyx_t_2); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 595; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_3 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_13), __pyx_t_2); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 705; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(((PyObject *)__pyx_t_3));
       __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 595; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 705; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(((PyObject *)__pyx_t_2));
       PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_t_3));
       __Pyx_GIVEREF(((PyObject *)__pyx_t_3));
       __pyx_t_3 = 0;
-      __pyx_t_3 = PyObject_Call(__pyx_builtin_OverflowError, ((PyObject *)__pyx_t_2), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 595; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_3 = PyObject_Call(__pyx_builtin_OverflowError, ((PyObject *)__pyx_t_2), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 705; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_3);
       __Pyx_DECREF(((PyObject *)__pyx_t_2)); __pyx_t_2 = 0;
       __Pyx_Raise(__pyx_t_3, 0, 0);
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 595; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 705; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       goto __pyx_L6;
     }
     __pyx_L6:;
@@ -6293,48 +6992,48 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_39remove(PyObject *__pyx_v_
   }
   __pyx_L5:;
 
-  /* "lib/intbitset.pyx":596
+  /* "intbitset.pyx":706
  *             elif elem > maxelem:
  *                 raise OverflowError("Elements must be <= %s" % maxelem)
  *         if intBitSetIsInElem(self.bitset, elem):             # <<<<<<<<<<<<<<
  *             intBitSetDelElem(self.bitset, elem)
  *         else:
  */
-  __pyx_t_1 = intBitSetIsInElem(((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->bitset, __pyx_v_elem);
+  __pyx_t_1 = intBitSetIsInElem(((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->bitset, __pyx_v_elem);
   if (__pyx_t_1) {
 
-    /* "lib/intbitset.pyx":597
+    /* "intbitset.pyx":707
  *                 raise OverflowError("Elements must be <= %s" % maxelem)
  *         if intBitSetIsInElem(self.bitset, elem):
  *             intBitSetDelElem(self.bitset, elem)             # <<<<<<<<<<<<<<
  *         else:
  *             raise KeyError(elem)
  */
-    intBitSetDelElem(((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->bitset, __pyx_v_elem);
+    intBitSetDelElem(((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->bitset, __pyx_v_elem);
     goto __pyx_L7;
   }
   /*else*/ {
 
-    /* "lib/intbitset.pyx":599
+    /* "intbitset.pyx":709
  *             intBitSetDelElem(self.bitset, elem)
  *         else:
  *             raise KeyError(elem)             # <<<<<<<<<<<<<<
  * 
  *     def strbits(self):
  */
-    __pyx_t_3 = PyInt_FromLong(__pyx_v_elem); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 599; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = PyInt_FromLong(__pyx_v_elem); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 709; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 599; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 709; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(((PyObject *)__pyx_t_2));
     PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_3);
     __Pyx_GIVEREF(__pyx_t_3);
     __pyx_t_3 = 0;
-    __pyx_t_3 = PyObject_Call(__pyx_builtin_KeyError, ((PyObject *)__pyx_t_2), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 599; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = PyObject_Call(__pyx_builtin_KeyError, ((PyObject *)__pyx_t_2), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 709; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(((PyObject *)__pyx_t_2)); __pyx_t_2 = 0;
     __Pyx_Raise(__pyx_t_3, 0, 0);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 599; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 709; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   }
   __pyx_L7:;
 
@@ -6343,7 +7042,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_39remove(PyObject *__pyx_v_
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_AddTraceback("lib.intbitset.intbitset.remove");
+  __Pyx_AddTraceback("intbitset.intbitset.remove");
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -6351,7 +7050,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_39remove(PyObject *__pyx_v_
   return __pyx_r;
 }
 
-/* "lib/intbitset.pyx":601
+/* "intbitset.pyx":711
  *             raise KeyError(elem)
  * 
  *     def strbits(self):             # <<<<<<<<<<<<<<
@@ -6359,49 +7058,47 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_39remove(PyObject *__pyx_v_
  *         of the intbitset.
  */
 
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_40strbits(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static char __pyx_doc_3lib_9intbitset_9intbitset_40strbits[] = "Return a string of 0s and 1s representing the content in memory\n        of the intbitset.\n        ";
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_40strbits(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+static PyObject *__pyx_pf_9intbitset_9intbitset_40strbits(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static char __pyx_doc_9intbitset_9intbitset_40strbits[] = "Return a string of 0s and 1s representing the content in memory\n        of the intbitset.\n        ";
+static PyObject *__pyx_pf_9intbitset_9intbitset_40strbits(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
   int __pyx_v_i;
   int __pyx_v_last;
   PyObject *__pyx_v_ret;
   PyObject *__pyx_r = NULL;
-  word_t __pyx_t_1;
-  PyObject *__pyx_t_2 = NULL;
-  Py_ssize_t __pyx_t_3;
-  PyObject *__pyx_t_4 = NULL;
-  int __pyx_t_5;
-  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_1 = NULL;
+  Py_ssize_t __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
   __Pyx_RefNannySetupContext("strbits");
   __pyx_v_ret = ((PyObject*)Py_None); __Pyx_INCREF(Py_None);
 
-  /* "lib/intbitset.pyx":607
+  /* "intbitset.pyx":717
  *         cdef int i
  *         cdef int last
  *         if (<intbitset> self).bitset.trailing_bits:             # <<<<<<<<<<<<<<
  *             raise OverflowError("It's impossible to print an infinite set.")
  *         last = 0
  */
-  __pyx_t_1 = ((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->bitset->trailing_bits;
-  if (__pyx_t_1) {
+  if (((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->bitset->trailing_bits) {
 
-    /* "lib/intbitset.pyx":608
+    /* "intbitset.pyx":718
  *         cdef int last
  *         if (<intbitset> self).bitset.trailing_bits:
  *             raise OverflowError("It's impossible to print an infinite set.")             # <<<<<<<<<<<<<<
  *         last = 0
  *         ret = []
  */
-    __pyx_t_2 = PyObject_Call(__pyx_builtin_OverflowError, ((PyObject *)__pyx_k_tuple_46), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 608; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_Raise(__pyx_t_2, 0, 0);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 608; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_1 = PyObject_Call(__pyx_builtin_OverflowError, ((PyObject *)__pyx_k_tuple_49), NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 718; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_Raise(__pyx_t_1, 0, 0);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 718; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     goto __pyx_L5;
   }
   __pyx_L5:;
 
-  /* "lib/intbitset.pyx":609
+  /* "intbitset.pyx":719
  *         if (<intbitset> self).bitset.trailing_bits:
  *             raise OverflowError("It's impossible to print an infinite set.")
  *         last = 0             # <<<<<<<<<<<<<<
@@ -6410,20 +7107,20 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_40strbits(PyObject *__pyx_v
  */
   __pyx_v_last = 0;
 
-  /* "lib/intbitset.pyx":610
+  /* "intbitset.pyx":720
  *             raise OverflowError("It's impossible to print an infinite set.")
  *         last = 0
  *         ret = []             # <<<<<<<<<<<<<<
  *         for i in self:
  *             ret.append('0'*(i-last)+'1')
  */
-  __pyx_t_2 = PyList_New(0); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 610; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_t_2));
+  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 720; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_t_1));
   __Pyx_DECREF(((PyObject *)__pyx_v_ret));
-  __pyx_v_ret = __pyx_t_2;
-  __pyx_t_2 = 0;
+  __pyx_v_ret = __pyx_t_1;
+  __pyx_t_1 = 0;
 
-  /* "lib/intbitset.pyx":611
+  /* "intbitset.pyx":721
  *         last = 0
  *         ret = []
  *         for i in self:             # <<<<<<<<<<<<<<
@@ -6431,31 +7128,31 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_40strbits(PyObject *__pyx_v
  *             last = i+1
  */
   if (PyList_CheckExact(__pyx_v_self) || PyTuple_CheckExact(__pyx_v_self)) {
-    __pyx_t_3 = 0; __pyx_t_2 = __pyx_v_self; __Pyx_INCREF(__pyx_t_2);
+    __pyx_t_2 = 0; __pyx_t_1 = __pyx_v_self; __Pyx_INCREF(__pyx_t_1);
   } else {
-    __pyx_t_3 = -1; __pyx_t_2 = PyObject_GetIter(__pyx_v_self); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 611; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_2 = -1; __pyx_t_1 = PyObject_GetIter(__pyx_v_self); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 721; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
   }
   for (;;) {
-    if (likely(PyList_CheckExact(__pyx_t_2))) {
-      if (__pyx_t_3 >= PyList_GET_SIZE(__pyx_t_2)) break;
-      __pyx_t_4 = PyList_GET_ITEM(__pyx_t_2, __pyx_t_3); __Pyx_INCREF(__pyx_t_4); __pyx_t_3++;
-    } else if (likely(PyTuple_CheckExact(__pyx_t_2))) {
-      if (__pyx_t_3 >= PyTuple_GET_SIZE(__pyx_t_2)) break;
-      __pyx_t_4 = PyTuple_GET_ITEM(__pyx_t_2, __pyx_t_3); __Pyx_INCREF(__pyx_t_4); __pyx_t_3++;
+    if (likely(PyList_CheckExact(__pyx_t_1))) {
+      if (__pyx_t_2 >= PyList_GET_SIZE(__pyx_t_1)) break;
+      __pyx_t_3 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_2); __Pyx_INCREF(__pyx_t_3); __pyx_t_2++;
+    } else if (likely(PyTuple_CheckExact(__pyx_t_1))) {
+      if (__pyx_t_2 >= PyTuple_GET_SIZE(__pyx_t_1)) break;
+      __pyx_t_3 = PyTuple_GET_ITEM(__pyx_t_1, __pyx_t_2); __Pyx_INCREF(__pyx_t_3); __pyx_t_2++;
     } else {
-      __pyx_t_4 = PyIter_Next(__pyx_t_2);
-      if (!__pyx_t_4) {
-        if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 611; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_3 = PyIter_Next(__pyx_t_1);
+      if (!__pyx_t_3) {
+        if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 721; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
         break;
       }
-      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_GOTREF(__pyx_t_3);
     }
-    __pyx_t_5 = __Pyx_PyInt_AsInt(__pyx_t_4); if (unlikely((__pyx_t_5 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 611; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __pyx_v_i = __pyx_t_5;
+    __pyx_t_4 = __Pyx_PyInt_AsInt(__pyx_t_3); if (unlikely((__pyx_t_4 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 721; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_v_i = __pyx_t_4;
 
-    /* "lib/intbitset.pyx":612
+    /* "intbitset.pyx":722
  *         ret = []
  *         for i in self:
  *             ret.append('0'*(i-last)+'1')             # <<<<<<<<<<<<<<
@@ -6463,20 +7160,20 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_40strbits(PyObject *__pyx_v
  *         return ''.join(ret)
  */
     if (unlikely(__pyx_v_ret == Py_None)) {
-      PyErr_SetString(PyExc_AttributeError, "'NoneType' object has no attribute 'append'"); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 612; __pyx_clineno = __LINE__; goto __pyx_L1_error;} 
+      PyErr_SetString(PyExc_AttributeError, "'NoneType' object has no attribute 'append'"); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 722; __pyx_clineno = __LINE__; goto __pyx_L1_error;} 
     }
-    __pyx_t_4 = PyInt_FromLong((__pyx_v_i - __pyx_v_last)); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 612; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_6 = PyNumber_Multiply(((PyObject *)__pyx_kp_s__0), __pyx_t_4); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 612; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(((PyObject *)__pyx_t_6));
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __pyx_t_4 = PyNumber_Add(((PyObject *)__pyx_t_6), ((PyObject *)__pyx_kp_s__1)); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 612; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(((PyObject *)__pyx_t_4));
-    __Pyx_DECREF(((PyObject *)__pyx_t_6)); __pyx_t_6 = 0;
-    __pyx_t_5 = PyList_Append(__pyx_v_ret, ((PyObject *)__pyx_t_4)); if (unlikely(__pyx_t_5 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 612; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_DECREF(((PyObject *)__pyx_t_4)); __pyx_t_4 = 0;
+    __pyx_t_3 = PyInt_FromLong((__pyx_v_i - __pyx_v_last)); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 722; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_5 = PyNumber_Multiply(((PyObject *)__pyx_kp_s__0), __pyx_t_3); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 722; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(((PyObject *)__pyx_t_5));
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_t_3 = PyNumber_Add(((PyObject *)__pyx_t_5), ((PyObject *)__pyx_kp_s__1)); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 722; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(((PyObject *)__pyx_t_3));
+    __Pyx_DECREF(((PyObject *)__pyx_t_5)); __pyx_t_5 = 0;
+    __pyx_t_4 = PyList_Append(__pyx_v_ret, ((PyObject *)__pyx_t_3)); if (unlikely(__pyx_t_4 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 722; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_DECREF(((PyObject *)__pyx_t_3)); __pyx_t_3 = 0;
 
-    /* "lib/intbitset.pyx":613
+    /* "intbitset.pyx":723
  *         for i in self:
  *             ret.append('0'*(i-last)+'1')
  *             last = i+1             # <<<<<<<<<<<<<<
@@ -6485,9 +7182,9 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_40strbits(PyObject *__pyx_v
  */
     __pyx_v_last = (__pyx_v_i + 1);
   }
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "lib/intbitset.pyx":614
+  /* "intbitset.pyx":724
  *             ret.append('0'*(i-last)+'1')
  *             last = i+1
  *         return ''.join(ret)             # <<<<<<<<<<<<<<
@@ -6495,28 +7192,28 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_40strbits(PyObject *__pyx_v
  *     def update_with_signs(self, rhs):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_2 = PyObject_GetAttr(((PyObject *)__pyx_kp_s_47), __pyx_n_s__join); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 614; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 614; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_t_4));
+  __pyx_t_1 = PyObject_GetAttr(((PyObject *)__pyx_kp_s_50), __pyx_n_s__join); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 724; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 724; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_t_3));
   __Pyx_INCREF(((PyObject *)__pyx_v_ret));
-  PyTuple_SET_ITEM(__pyx_t_4, 0, ((PyObject *)__pyx_v_ret));
+  PyTuple_SET_ITEM(__pyx_t_3, 0, ((PyObject *)__pyx_v_ret));
   __Pyx_GIVEREF(((PyObject *)__pyx_v_ret));
-  __pyx_t_6 = PyObject_Call(__pyx_t_2, ((PyObject *)__pyx_t_4), NULL); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 614; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_6);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __Pyx_DECREF(((PyObject *)__pyx_t_4)); __pyx_t_4 = 0;
-  __pyx_r = __pyx_t_6;
-  __pyx_t_6 = 0;
+  __pyx_t_5 = PyObject_Call(__pyx_t_1, ((PyObject *)__pyx_t_3), NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 724; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(((PyObject *)__pyx_t_3)); __pyx_t_3 = 0;
+  __pyx_r = __pyx_t_5;
+  __pyx_t_5 = 0;
   goto __pyx_L0;
 
   __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_6);
-  __Pyx_AddTraceback("lib.intbitset.intbitset.strbits");
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("intbitset.intbitset.strbits");
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_DECREF(__pyx_v_ret);
@@ -6525,7 +7222,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_40strbits(PyObject *__pyx_v
   return __pyx_r;
 }
 
-/* "lib/intbitset.pyx":616
+/* "intbitset.pyx":726
  *         return ''.join(ret)
  * 
  *     def update_with_signs(self, rhs):             # <<<<<<<<<<<<<<
@@ -6533,9 +7230,9 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_40strbits(PyObject *__pyx_v
  *         whose value are less than 0 and add every integer whose value is 0 or more"""
  */
 
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_41update_with_signs(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs); /*proto*/
-static char __pyx_doc_3lib_9intbitset_9intbitset_41update_with_signs[] = "Given a dictionary rhs whose keys are integers, remove all the integers\n        whose value are less than 0 and add every integer whose value is 0 or more";
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_41update_with_signs(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs) {
+static PyObject *__pyx_pf_9intbitset_9intbitset_41update_with_signs(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs); /*proto*/
+static char __pyx_doc_9intbitset_9intbitset_41update_with_signs[] = "Given a dictionary rhs whose keys are integers, remove all the integers\n        whose value are less than 0 and add every integer whose value is 0 or more";
+static PyObject *__pyx_pf_9intbitset_9intbitset_41update_with_signs(PyObject *__pyx_v_self, PyObject *__pyx_v_rhs) {
   int __pyx_v_value;
   PyObject *__pyx_v_sign;
   PyObject *__pyx_r = NULL;
@@ -6550,7 +7247,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_41update_with_signs(PyObjec
   __Pyx_RefNannySetupContext("update_with_signs");
   __pyx_v_sign = Py_None; __Pyx_INCREF(Py_None);
 
-  /* "lib/intbitset.pyx":620
+  /* "intbitset.pyx":730
  *         whose value are less than 0 and add every integer whose value is 0 or more"""
  *         cdef int value
  *         try:             # <<<<<<<<<<<<<<
@@ -6565,31 +7262,31 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_41update_with_signs(PyObjec
     __Pyx_XGOTREF(__pyx_save_exc_tb);
     /*try:*/ {
 
-      /* "lib/intbitset.pyx":621
+      /* "intbitset.pyx":731
  *         cdef int value
  *         try:
  *             if self.sanity_checks:             # <<<<<<<<<<<<<<
  *                 for value, sign in rhs.iteritems():
  *                     if value < 0:
  */
-      if (((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->sanity_checks) {
+      if (((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->sanity_checks) {
 
-        /* "lib/intbitset.pyx":622
+        /* "intbitset.pyx":732
  *         try:
  *             if self.sanity_checks:
  *                 for value, sign in rhs.iteritems():             # <<<<<<<<<<<<<<
  *                     if value < 0:
  *                         raise ValueError("Negative numbers, not allowed")
  */
-        __pyx_t_2 = PyObject_GetAttr(__pyx_v_rhs, __pyx_n_s__iteritems); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 622; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
+        __pyx_t_2 = PyObject_GetAttr(__pyx_v_rhs, __pyx_n_s__iteritems); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 732; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
         __Pyx_GOTREF(__pyx_t_2);
-        __pyx_t_3 = PyObject_Call(__pyx_t_2, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 622; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
+        __pyx_t_3 = PyObject_Call(__pyx_t_2, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 732; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
         __Pyx_GOTREF(__pyx_t_3);
         __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
         if (PyList_CheckExact(__pyx_t_3) || PyTuple_CheckExact(__pyx_t_3)) {
           __pyx_t_1 = 0; __pyx_t_2 = __pyx_t_3; __Pyx_INCREF(__pyx_t_2);
         } else {
-          __pyx_t_1 = -1; __pyx_t_2 = PyObject_GetIter(__pyx_t_3); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 622; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
+          __pyx_t_1 = -1; __pyx_t_2 = PyObject_GetIter(__pyx_t_3); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 732; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
           __Pyx_GOTREF(__pyx_t_2);
         }
         __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -6603,7 +7300,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_41update_with_signs(PyObjec
           } else {
             __pyx_t_3 = PyIter_Next(__pyx_t_2);
             if (!__pyx_t_3) {
-              if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 622; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
+              if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 732; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
               break;
             }
             __Pyx_GOTREF(__pyx_t_3);
@@ -6611,7 +7308,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_41update_with_signs(PyObjec
           if (PyTuple_CheckExact(__pyx_t_3) && likely(PyTuple_GET_SIZE(__pyx_t_3) == 2)) {
             PyObject* tuple = __pyx_t_3;
             __pyx_t_4 = PyTuple_GET_ITEM(tuple, 0); __Pyx_INCREF(__pyx_t_4);
-            __pyx_t_6 = __Pyx_PyInt_AsInt(__pyx_t_4); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 622; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
+            __pyx_t_6 = __Pyx_PyInt_AsInt(__pyx_t_4); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 732; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
             __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
             __pyx_t_5 = PyTuple_GET_ITEM(tuple, 1); __Pyx_INCREF(__pyx_t_5);
             __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -6620,16 +7317,16 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_41update_with_signs(PyObjec
             __pyx_v_sign = __pyx_t_5;
             __pyx_t_5 = 0;
           } else {
-            __pyx_t_7 = PyObject_GetIter(__pyx_t_3); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 622; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
+            __pyx_t_7 = PyObject_GetIter(__pyx_t_3); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 732; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
             __Pyx_GOTREF(__pyx_t_7);
             __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-            __pyx_t_4 = __Pyx_UnpackItem(__pyx_t_7, 0); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 622; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
+            __pyx_t_4 = __Pyx_UnpackItem(__pyx_t_7, 0); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 732; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
             __Pyx_GOTREF(__pyx_t_4);
-            __pyx_t_6 = __Pyx_PyInt_AsInt(__pyx_t_4); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 622; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
+            __pyx_t_6 = __Pyx_PyInt_AsInt(__pyx_t_4); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 732; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
             __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-            __pyx_t_5 = __Pyx_UnpackItem(__pyx_t_7, 1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 622; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
+            __pyx_t_5 = __Pyx_UnpackItem(__pyx_t_7, 1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 732; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
             __Pyx_GOTREF(__pyx_t_5);
-            if (__Pyx_EndUnpack(__pyx_t_7, 2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 622; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
+            if (__Pyx_EndUnpack(__pyx_t_7, 2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 732; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
             __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
             __pyx_v_value = __pyx_t_6;
             __Pyx_DECREF(__pyx_v_sign);
@@ -6637,7 +7334,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_41update_with_signs(PyObjec
             __pyx_t_5 = 0;
           }
 
-          /* "lib/intbitset.pyx":623
+          /* "intbitset.pyx":733
  *             if self.sanity_checks:
  *                 for value, sign in rhs.iteritems():
  *                     if value < 0:             # <<<<<<<<<<<<<<
@@ -6647,22 +7344,22 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_41update_with_signs(PyObjec
           __pyx_t_8 = (__pyx_v_value < 0);
           if (__pyx_t_8) {
 
-            /* "lib/intbitset.pyx":624
+            /* "intbitset.pyx":734
  *                 for value, sign in rhs.iteritems():
  *                     if value < 0:
  *                         raise ValueError("Negative numbers, not allowed")             # <<<<<<<<<<<<<<
  *                     elif value > maxelem:
  *                         raise OverflowError("Elements must <= %s" % maxelem)
  */
-            __pyx_t_3 = PyObject_Call(__pyx_builtin_ValueError, ((PyObject *)__pyx_k_tuple_48), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 624; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
+            __pyx_t_3 = PyObject_Call(__pyx_builtin_ValueError, ((PyObject *)__pyx_k_tuple_51), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 734; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
             __Pyx_GOTREF(__pyx_t_3);
             __Pyx_Raise(__pyx_t_3, 0, 0);
             __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-            {__pyx_filename = __pyx_f[0]; __pyx_lineno = 624; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
+            {__pyx_filename = __pyx_f[0]; __pyx_lineno = 734; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
             goto __pyx_L16;
           }
 
-          /* "lib/intbitset.pyx":625
+          /* "intbitset.pyx":735
  *                     if value < 0:
  *                         raise ValueError("Negative numbers, not allowed")
  *                     elif value > maxelem:             # <<<<<<<<<<<<<<
@@ -6672,66 +7369,66 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_41update_with_signs(PyObjec
           __pyx_t_8 = (__pyx_v_value > maxelem);
           if (__pyx_t_8) {
 
-            /* "lib/intbitset.pyx":626
+            /* "intbitset.pyx":736
  *                         raise ValueError("Negative numbers, not allowed")
  *                     elif value > maxelem:
  *                         raise OverflowError("Elements must <= %s" % maxelem)             # <<<<<<<<<<<<<<
  *                     if sign < 0:
  *                         intBitSetDelElem(self.bitset, value)
  */
-            __pyx_t_3 = PyInt_FromLong(maxelem); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 626; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
+            __pyx_t_3 = PyInt_FromLong(maxelem); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 736; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
             __Pyx_GOTREF(__pyx_t_3);
-            __pyx_t_5 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_49), __pyx_t_3); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 626; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
+            __pyx_t_5 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_52), __pyx_t_3); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 736; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
             __Pyx_GOTREF(((PyObject *)__pyx_t_5));
             __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-            __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 626; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
+            __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 736; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
             __Pyx_GOTREF(((PyObject *)__pyx_t_3));
             PyTuple_SET_ITEM(__pyx_t_3, 0, ((PyObject *)__pyx_t_5));
             __Pyx_GIVEREF(((PyObject *)__pyx_t_5));
             __pyx_t_5 = 0;
-            __pyx_t_5 = PyObject_Call(__pyx_builtin_OverflowError, ((PyObject *)__pyx_t_3), NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 626; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
+            __pyx_t_5 = PyObject_Call(__pyx_builtin_OverflowError, ((PyObject *)__pyx_t_3), NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 736; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
             __Pyx_GOTREF(__pyx_t_5);
             __Pyx_DECREF(((PyObject *)__pyx_t_3)); __pyx_t_3 = 0;
             __Pyx_Raise(__pyx_t_5, 0, 0);
             __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-            {__pyx_filename = __pyx_f[0]; __pyx_lineno = 626; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
+            {__pyx_filename = __pyx_f[0]; __pyx_lineno = 736; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
             goto __pyx_L16;
           }
           __pyx_L16:;
 
-          /* "lib/intbitset.pyx":627
+          /* "intbitset.pyx":737
  *                     elif value > maxelem:
  *                         raise OverflowError("Elements must <= %s" % maxelem)
  *                     if sign < 0:             # <<<<<<<<<<<<<<
  *                         intBitSetDelElem(self.bitset, value)
  *                     else:
  */
-          __pyx_t_5 = PyObject_RichCompare(__pyx_v_sign, __pyx_int_0, Py_LT); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 627; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
+          __pyx_t_5 = PyObject_RichCompare(__pyx_v_sign, __pyx_int_0, Py_LT); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 737; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
           __Pyx_GOTREF(__pyx_t_5);
-          __pyx_t_8 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_8 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 627; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
+          __pyx_t_8 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_8 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 737; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
           __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
           if (__pyx_t_8) {
 
-            /* "lib/intbitset.pyx":628
+            /* "intbitset.pyx":738
  *                         raise OverflowError("Elements must <= %s" % maxelem)
  *                     if sign < 0:
  *                         intBitSetDelElem(self.bitset, value)             # <<<<<<<<<<<<<<
  *                     else:
  *                         intBitSetAddElem(self.bitset, value)
  */
-            intBitSetDelElem(((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->bitset, __pyx_v_value);
+            intBitSetDelElem(((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->bitset, __pyx_v_value);
             goto __pyx_L17;
           }
           /*else*/ {
 
-            /* "lib/intbitset.pyx":630
+            /* "intbitset.pyx":740
  *                         intBitSetDelElem(self.bitset, value)
  *                     else:
  *                         intBitSetAddElem(self.bitset, value)             # <<<<<<<<<<<<<<
  *             else:
  *                 for value, sign in rhs.iteritems():
  */
-            intBitSetAddElem(((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->bitset, __pyx_v_value);
+            intBitSetAddElem(((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->bitset, __pyx_v_value);
           }
           __pyx_L17:;
         }
@@ -6740,22 +7437,22 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_41update_with_signs(PyObjec
       }
       /*else*/ {
 
-        /* "lib/intbitset.pyx":632
+        /* "intbitset.pyx":742
  *                         intBitSetAddElem(self.bitset, value)
  *             else:
  *                 for value, sign in rhs.iteritems():             # <<<<<<<<<<<<<<
  *                     if sign < 0:
  *                         intBitSetDelElem(self.bitset, value)
  */
-        __pyx_t_2 = PyObject_GetAttr(__pyx_v_rhs, __pyx_n_s__iteritems); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 632; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
+        __pyx_t_2 = PyObject_GetAttr(__pyx_v_rhs, __pyx_n_s__iteritems); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 742; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
         __Pyx_GOTREF(__pyx_t_2);
-        __pyx_t_5 = PyObject_Call(__pyx_t_2, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 632; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
+        __pyx_t_5 = PyObject_Call(__pyx_t_2, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 742; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
         __Pyx_GOTREF(__pyx_t_5);
         __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
         if (PyList_CheckExact(__pyx_t_5) || PyTuple_CheckExact(__pyx_t_5)) {
           __pyx_t_1 = 0; __pyx_t_2 = __pyx_t_5; __Pyx_INCREF(__pyx_t_2);
         } else {
-          __pyx_t_1 = -1; __pyx_t_2 = PyObject_GetIter(__pyx_t_5); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 632; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
+          __pyx_t_1 = -1; __pyx_t_2 = PyObject_GetIter(__pyx_t_5); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 742; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
           __Pyx_GOTREF(__pyx_t_2);
         }
         __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
@@ -6769,7 +7466,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_41update_with_signs(PyObjec
           } else {
             __pyx_t_5 = PyIter_Next(__pyx_t_2);
             if (!__pyx_t_5) {
-              if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 632; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
+              if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 742; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
               break;
             }
             __Pyx_GOTREF(__pyx_t_5);
@@ -6777,7 +7474,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_41update_with_signs(PyObjec
           if (PyTuple_CheckExact(__pyx_t_5) && likely(PyTuple_GET_SIZE(__pyx_t_5) == 2)) {
             PyObject* tuple = __pyx_t_5;
             __pyx_t_3 = PyTuple_GET_ITEM(tuple, 0); __Pyx_INCREF(__pyx_t_3);
-            __pyx_t_6 = __Pyx_PyInt_AsInt(__pyx_t_3); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 632; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
+            __pyx_t_6 = __Pyx_PyInt_AsInt(__pyx_t_3); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 742; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
             __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
             __pyx_t_4 = PyTuple_GET_ITEM(tuple, 1); __Pyx_INCREF(__pyx_t_4);
             __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
@@ -6786,16 +7483,16 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_41update_with_signs(PyObjec
             __pyx_v_sign = __pyx_t_4;
             __pyx_t_4 = 0;
           } else {
-            __pyx_t_7 = PyObject_GetIter(__pyx_t_5); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 632; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
+            __pyx_t_7 = PyObject_GetIter(__pyx_t_5); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 742; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
             __Pyx_GOTREF(__pyx_t_7);
             __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-            __pyx_t_3 = __Pyx_UnpackItem(__pyx_t_7, 0); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 632; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
+            __pyx_t_3 = __Pyx_UnpackItem(__pyx_t_7, 0); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 742; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
             __Pyx_GOTREF(__pyx_t_3);
-            __pyx_t_6 = __Pyx_PyInt_AsInt(__pyx_t_3); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 632; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
+            __pyx_t_6 = __Pyx_PyInt_AsInt(__pyx_t_3); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 742; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
             __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-            __pyx_t_4 = __Pyx_UnpackItem(__pyx_t_7, 1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 632; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
+            __pyx_t_4 = __Pyx_UnpackItem(__pyx_t_7, 1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 742; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
             __Pyx_GOTREF(__pyx_t_4);
-            if (__Pyx_EndUnpack(__pyx_t_7, 2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 632; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
+            if (__Pyx_EndUnpack(__pyx_t_7, 2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 742; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
             __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
             __pyx_v_value = __pyx_t_6;
             __Pyx_DECREF(__pyx_v_sign);
@@ -6803,39 +7500,39 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_41update_with_signs(PyObjec
             __pyx_t_4 = 0;
           }
 
-          /* "lib/intbitset.pyx":633
+          /* "intbitset.pyx":743
  *             else:
  *                 for value, sign in rhs.iteritems():
  *                     if sign < 0:             # <<<<<<<<<<<<<<
  *                         intBitSetDelElem(self.bitset, value)
  *                     else:
  */
-          __pyx_t_5 = PyObject_RichCompare(__pyx_v_sign, __pyx_int_0, Py_LT); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 633; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
+          __pyx_t_5 = PyObject_RichCompare(__pyx_v_sign, __pyx_int_0, Py_LT); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 743; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
           __Pyx_GOTREF(__pyx_t_5);
-          __pyx_t_8 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_8 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 633; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
+          __pyx_t_8 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_8 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 743; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
           __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
           if (__pyx_t_8) {
 
-            /* "lib/intbitset.pyx":634
+            /* "intbitset.pyx":744
  *                 for value, sign in rhs.iteritems():
  *                     if sign < 0:
  *                         intBitSetDelElem(self.bitset, value)             # <<<<<<<<<<<<<<
  *                     else:
  *                         intBitSetAddElem(self.bitset, value)
  */
-            intBitSetDelElem(((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->bitset, __pyx_v_value);
+            intBitSetDelElem(((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->bitset, __pyx_v_value);
             goto __pyx_L20;
           }
           /*else*/ {
 
-            /* "lib/intbitset.pyx":636
+            /* "intbitset.pyx":746
  *                         intBitSetDelElem(self.bitset, value)
  *                     else:
  *                         intBitSetAddElem(self.bitset, value)             # <<<<<<<<<<<<<<
  *         except AttributeError:
  *             raise TypeError("rhs should be a valid dictionary with integers keys and integer values")
  */
-            intBitSetAddElem(((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->bitset, __pyx_v_value);
+            intBitSetAddElem(((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->bitset, __pyx_v_value);
           }
           __pyx_L20:;
         }
@@ -6854,7 +7551,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_41update_with_signs(PyObjec
     __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
     __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-    /* "lib/intbitset.pyx":637
+    /* "intbitset.pyx":747
  *                     else:
  *                         intBitSetAddElem(self.bitset, value)
  *         except AttributeError:             # <<<<<<<<<<<<<<
@@ -6863,24 +7560,24 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_41update_with_signs(PyObjec
  */
     __pyx_t_6 = PyErr_ExceptionMatches(__pyx_builtin_AttributeError);
     if (__pyx_t_6) {
-      __Pyx_AddTraceback("lib.intbitset.intbitset.update_with_signs");
-      if (__Pyx_GetException(&__pyx_t_2, &__pyx_t_5, &__pyx_t_4) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 637; __pyx_clineno = __LINE__; goto __pyx_L7_except_error;}
+      __Pyx_AddTraceback("intbitset.intbitset.update_with_signs");
+      if (__Pyx_GetException(&__pyx_t_2, &__pyx_t_5, &__pyx_t_4) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 747; __pyx_clineno = __LINE__; goto __pyx_L7_except_error;}
       __Pyx_GOTREF(__pyx_t_2);
       __Pyx_GOTREF(__pyx_t_5);
       __Pyx_GOTREF(__pyx_t_4);
 
-      /* "lib/intbitset.pyx":638
+      /* "intbitset.pyx":748
  *                         intBitSetAddElem(self.bitset, value)
  *         except AttributeError:
  *             raise TypeError("rhs should be a valid dictionary with integers keys and integer values")             # <<<<<<<<<<<<<<
  * 
  *     def get_size(self):
  */
-      __pyx_t_3 = PyObject_Call(__pyx_builtin_TypeError, ((PyObject *)__pyx_k_tuple_51), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 638; __pyx_clineno = __LINE__; goto __pyx_L7_except_error;}
+      __pyx_t_3 = PyObject_Call(__pyx_builtin_TypeError, ((PyObject *)__pyx_k_tuple_54), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 748; __pyx_clineno = __LINE__; goto __pyx_L7_except_error;}
       __Pyx_GOTREF(__pyx_t_3);
       __Pyx_Raise(__pyx_t_3, 0, 0);
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 638; __pyx_clineno = __LINE__; goto __pyx_L7_except_error;}
+      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 748; __pyx_clineno = __LINE__; goto __pyx_L7_except_error;}
       __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
       __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
@@ -6908,7 +7605,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_41update_with_signs(PyObjec
   __Pyx_XDECREF(__pyx_t_4);
   __Pyx_XDECREF(__pyx_t_5);
   __Pyx_XDECREF(__pyx_t_7);
-  __Pyx_AddTraceback("lib.intbitset.intbitset.update_with_signs");
+  __Pyx_AddTraceback("intbitset.intbitset.update_with_signs");
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_DECREF(__pyx_v_sign);
@@ -6917,7 +7614,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_41update_with_signs(PyObjec
   return __pyx_r;
 }
 
-/* "lib/intbitset.pyx":640
+/* "intbitset.pyx":750
  *             raise TypeError("rhs should be a valid dictionary with integers keys and integer values")
  * 
  *     def get_size(self):             # <<<<<<<<<<<<<<
@@ -6925,13 +7622,13 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_41update_with_signs(PyObjec
  * 
  */
 
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_42get_size(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_42get_size(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+static PyObject *__pyx_pf_9intbitset_9intbitset_42get_size(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pf_9intbitset_9intbitset_42get_size(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
   PyObject *__pyx_r = NULL;
   PyObject *__pyx_t_1 = NULL;
   __Pyx_RefNannySetupContext("get_size");
 
-  /* "lib/intbitset.pyx":641
+  /* "intbitset.pyx":751
  * 
  *     def get_size(self):
  *         return intBitSetGetSize(self.bitset)             # <<<<<<<<<<<<<<
@@ -6939,7 +7636,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_42get_size(PyObject *__pyx_
  *     def get_allocated(self):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyInt_FromLong(intBitSetGetSize(((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->bitset)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 641; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyInt_FromLong(intBitSetGetSize(((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->bitset)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 751; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -6949,7 +7646,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_42get_size(PyObject *__pyx_
   goto __pyx_L0;
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("lib.intbitset.intbitset.get_size");
+  __Pyx_AddTraceback("intbitset.intbitset.get_size");
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -6957,7 +7654,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_42get_size(PyObject *__pyx_
   return __pyx_r;
 }
 
-/* "lib/intbitset.pyx":643
+/* "intbitset.pyx":753
  *         return intBitSetGetSize(self.bitset)
  * 
  *     def get_allocated(self):             # <<<<<<<<<<<<<<
@@ -6965,13 +7662,13 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_42get_size(PyObject *__pyx_
  * 
  */
 
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_43get_allocated(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_43get_allocated(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+static PyObject *__pyx_pf_9intbitset_9intbitset_43get_allocated(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pf_9intbitset_9intbitset_43get_allocated(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
   PyObject *__pyx_r = NULL;
   PyObject *__pyx_t_1 = NULL;
   __Pyx_RefNannySetupContext("get_allocated");
 
-  /* "lib/intbitset.pyx":644
+  /* "intbitset.pyx":754
  * 
  *     def get_allocated(self):
  *         return intBitSetGetAllocated(self.bitset)             # <<<<<<<<<<<<<<
@@ -6979,7 +7676,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_43get_allocated(PyObject *_
  *     def get_sorted_element(self, int index):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyInt_FromLong(intBitSetGetAllocated(((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->bitset)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 644; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyInt_FromLong(intBitSetGetAllocated(((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->bitset)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 754; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -6989,7 +7686,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_43get_allocated(PyObject *_
   goto __pyx_L0;
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("lib.intbitset.intbitset.get_allocated");
+  __Pyx_AddTraceback("intbitset.intbitset.get_allocated");
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -6997,7 +7694,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_43get_allocated(PyObject *_
   return __pyx_r;
 }
 
-/* "lib/intbitset.pyx":646
+/* "intbitset.pyx":756
  *         return intBitSetGetAllocated(self.bitset)
  * 
  *     def get_sorted_element(self, int index):             # <<<<<<<<<<<<<<
@@ -7005,40 +7702,37 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_43get_allocated(PyObject *_
  *         set. Note that index must be less than len(self)"""
  */
 
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_44get_sorted_element(PyObject *__pyx_v_self, PyObject *__pyx_arg_index); /*proto*/
-static char __pyx_doc_3lib_9intbitset_9intbitset_44get_sorted_element[] = "Return element at position index in the sorted representation of the\n        set. Note that index must be less than len(self)";
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_44get_sorted_element(PyObject *__pyx_v_self, PyObject *__pyx_arg_index) {
+static PyObject *__pyx_pf_9intbitset_9intbitset_44get_sorted_element(PyObject *__pyx_v_self, PyObject *__pyx_arg_index); /*proto*/
+static char __pyx_doc_9intbitset_9intbitset_44get_sorted_element[] = "Return element at position index in the sorted representation of the\n        set. Note that index must be less than len(self)";
+static PyObject *__pyx_pf_9intbitset_9intbitset_44get_sorted_element(PyObject *__pyx_v_self, PyObject *__pyx_arg_index) {
   int __pyx_v_index;
   int __pyx_v_l;
-  int __pyx_v_last;
-  int __pyx_v_i;
   PyObject *__pyx_r = NULL;
   int __pyx_t_1;
   PyObject *__pyx_t_2 = NULL;
   PyObject *__pyx_t_3 = NULL;
-  int __pyx_t_4;
   __Pyx_RefNannySetupContext("get_sorted_element");
   assert(__pyx_arg_index); {
-    __pyx_v_index = __Pyx_PyInt_AsInt(__pyx_arg_index); if (unlikely((__pyx_v_index == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 646; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_index = __Pyx_PyInt_AsInt(__pyx_arg_index); if (unlikely((__pyx_v_index == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 756; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
-  __Pyx_AddTraceback("lib.intbitset.intbitset.get_sorted_element");
+  __Pyx_AddTraceback("intbitset.intbitset.get_sorted_element");
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
 
-  /* "lib/intbitset.pyx":652
- *         cdef int last
- *         cdef int i
+  /* "intbitset.pyx":760
+ *         set. Note that index must be less than len(self)"""
+ *         cdef int l
  *         l = intBitSetGetTot(self.bitset)             # <<<<<<<<<<<<<<
  *         if index < 0:
  *             if self.bitset.trailing_bits:
  */
-  __pyx_v_l = intBitSetGetTot(((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->bitset);
+  __pyx_v_l = intBitSetGetTot(((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->bitset);
 
-  /* "lib/intbitset.pyx":653
- *         cdef int i
+  /* "intbitset.pyx":761
+ *         cdef int l
  *         l = intBitSetGetTot(self.bitset)
  *         if index < 0:             # <<<<<<<<<<<<<<
  *             if self.bitset.trailing_bits:
@@ -7047,32 +7741,32 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_44get_sorted_element(PyObje
   __pyx_t_1 = (__pyx_v_index < 0);
   if (__pyx_t_1) {
 
-    /* "lib/intbitset.pyx":654
+    /* "intbitset.pyx":762
  *         l = intBitSetGetTot(self.bitset)
  *         if index < 0:
  *             if self.bitset.trailing_bits:             # <<<<<<<<<<<<<<
  *                 raise OverflowError("It's impossible to retrieve a negative item from an infinite set.")
  *             index = index + l
  */
-    if (((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->bitset->trailing_bits) {
+    if (((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->bitset->trailing_bits) {
 
-      /* "lib/intbitset.pyx":655
+      /* "intbitset.pyx":763
  *         if index < 0:
  *             if self.bitset.trailing_bits:
  *                 raise OverflowError("It's impossible to retrieve a negative item from an infinite set.")             # <<<<<<<<<<<<<<
  *             index = index + l
  *         elif index > maxelem:
  */
-      __pyx_t_2 = PyObject_Call(__pyx_builtin_OverflowError, ((PyObject *)__pyx_k_tuple_53), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 655; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_2 = PyObject_Call(__pyx_builtin_OverflowError, ((PyObject *)__pyx_k_tuple_56), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 763; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_2);
       __Pyx_Raise(__pyx_t_2, 0, 0);
       __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 655; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 763; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       goto __pyx_L6;
     }
     __pyx_L6:;
 
-    /* "lib/intbitset.pyx":656
+    /* "intbitset.pyx":764
  *             if self.bitset.trailing_bits:
  *                 raise OverflowError("It's impossible to retrieve a negative item from an infinite set.")
  *             index = index + l             # <<<<<<<<<<<<<<
@@ -7083,7 +7777,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_44get_sorted_element(PyObje
     goto __pyx_L5;
   }
 
-  /* "lib/intbitset.pyx":657
+  /* "intbitset.pyx":765
  *                 raise OverflowError("It's impossible to retrieve a negative item from an infinite set.")
  *             index = index + l
  *         elif index > maxelem:             # <<<<<<<<<<<<<<
@@ -7093,39 +7787,39 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_44get_sorted_element(PyObje
   __pyx_t_1 = (__pyx_v_index > maxelem);
   if (__pyx_t_1) {
 
-    /* "lib/intbitset.pyx":658
+    /* "intbitset.pyx":766
  *             index = index + l
  *         elif index > maxelem:
  *             raise OverflowError("Index must be <= %s" % maxelem)             # <<<<<<<<<<<<<<
  *         if 0 <= index < l:
- *             last = intBitSetGetNext(self.bitset, -1)
+ *             return intBitSetSelect(self.bitset, index)
  */
-    __pyx_t_2 = PyInt_FromLong(maxelem); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 658; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = PyInt_FromLong(maxelem); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 766; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_3 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_54), __pyx_t_2); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 658; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_57), __pyx_t_2); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 766; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(((PyObject *)__pyx_t_3));
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 658; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 766; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(((PyObject *)__pyx_t_2));
     PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_t_3));
     __Pyx_GIVEREF(((PyObject *)__pyx_t_3));
     __pyx_t_3 = 0;
-    __pyx_t_3 = PyObject_Call(__pyx_builtin_OverflowError, ((PyObject *)__pyx_t_2), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 658; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = PyObject_Call(__pyx_builtin_OverflowError, ((PyObject *)__pyx_t_2), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 766; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(((PyObject *)__pyx_t_2)); __pyx_t_2 = 0;
     __Pyx_Raise(__pyx_t_3, 0, 0);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 658; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 766; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     goto __pyx_L5;
   }
   __pyx_L5:;
 
-  /* "lib/intbitset.pyx":659
+  /* "intbitset.pyx":767
  *         elif index > maxelem:
  *             raise OverflowError("Index must be <= %s" % maxelem)
  *         if 0 <= index < l:             # <<<<<<<<<<<<<<
- *             last = intBitSetGetNext(self.bitset, -1)
- *             for i from 0 <= i < index:
+ *             return intBitSetSelect(self.bitset, index)
+ *         else:
  */
   __pyx_t_1 = (0 <= __pyx_v_index);
   if (__pyx_t_1) {
@@ -7133,73 +7827,44 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_44get_sorted_element(PyObje
   }
   if (__pyx_t_1) {
 
-    /* "lib/intbitset.pyx":660
+    /* "intbitset.pyx":768
  *             raise OverflowError("Index must be <= %s" % maxelem)
  *         if 0 <= index < l:
- *             last = intBitSetGetNext(self.bitset, -1)             # <<<<<<<<<<<<<<
- *             for i from 0 <= i < index:
- *                 last = intBitSetGetNext(self.bitset, last)
- */
-    __pyx_v_last = intBitSetGetNext(((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->bitset, -1);
-
-    /* "lib/intbitset.pyx":661
- *         if 0 <= index < l:
- *             last = intBitSetGetNext(self.bitset, -1)
- *             for i from 0 <= i < index:             # <<<<<<<<<<<<<<
- *                 last = intBitSetGetNext(self.bitset, last)
- *         else:
- */
-    __pyx_t_4 = __pyx_v_index;
-    for (__pyx_v_i = 0; __pyx_v_i < __pyx_t_4; __pyx_v_i++) {
-
-      /* "lib/intbitset.pyx":662
- *             last = intBitSetGetNext(self.bitset, -1)
- *             for i from 0 <= i < index:
- *                 last = intBitSetGetNext(self.bitset, last)             # <<<<<<<<<<<<<<
+ *             return intBitSetSelect(self.bitset, index)             # <<<<<<<<<<<<<<
  *         else:
  *             raise IndexError("intbitset index out of range")
  */
-      __pyx_v_last = intBitSetGetNext(((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->bitset, __pyx_v_last);
-    }
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_3 = PyInt_FromLong(intBitSetSelect(((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->bitset, __pyx_v_index)); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 768; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_r = __pyx_t_3;
+    __pyx_t_3 = 0;
+    goto __pyx_L0;
     goto __pyx_L7;
   }
   /*else*/ {
 
-    /* "lib/intbitset.pyx":664
- *                 last = intBitSetGetNext(self.bitset, last)
+    /* "intbitset.pyx":770
+ *             return intBitSetSelect(self.bitset, index)
  *         else:
  *             raise IndexError("intbitset index out of range")             # <<<<<<<<<<<<<<
- *         return last
  * 
+ *     def to_sorted_list(self, int i, int j):
  */
-    __pyx_t_3 = PyObject_Call(__pyx_builtin_IndexError, ((PyObject *)__pyx_k_tuple_56), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 664; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = PyObject_Call(__pyx_builtin_IndexError, ((PyObject *)__pyx_k_tuple_59), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 770; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_Raise(__pyx_t_3, 0, 0);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 664; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 770; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   }
   __pyx_L7:;
 
-  /* "lib/intbitset.pyx":665
- *         else:
- *             raise IndexError("intbitset index out of range")
- *         return last             # <<<<<<<<<<<<<<
- * 
- *     def to_sorted_list(self, int i, int j):
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_3 = PyInt_FromLong(__pyx_v_last); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 665; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_r = __pyx_t_3;
-  __pyx_t_3 = 0;
-  goto __pyx_L0;
-
   __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_AddTraceback("lib.intbitset.intbitset.get_sorted_element");
+  __Pyx_AddTraceback("intbitset.intbitset.get_sorted_element");
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -7207,23 +7872,23 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_44get_sorted_element(PyObje
   return __pyx_r;
 }
 
-/* "lib/intbitset.pyx":667
- *         return last
+/* "intbitset.pyx":772
+ *             raise IndexError("intbitset index out of range")
  * 
  *     def to_sorted_list(self, int i, int j):             # <<<<<<<<<<<<<<
  *         """Return a sublist of the sorted representation of the set.
  *         Note, negative indices are not supported."""
  */
 
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_45to_sorted_list(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_3lib_9intbitset_9intbitset_45to_sorted_list[] = "Return a sublist of the sorted representation of the set.\n        Note, negative indices are not supported.";
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_45to_sorted_list(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+static PyObject *__pyx_pf_9intbitset_9intbitset_45to_sorted_list(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_9intbitset_9intbitset_45to_sorted_list[] = "Return a sublist of the sorted representation of the set.\n        Note, negative indices are not supported.";
+static PyObject *__pyx_pf_9intbitset_9intbitset_45to_sorted_list(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   int __pyx_v_i;
   int __pyx_v_j;
   int __pyx_v_l;
   int __pyx_v_last;
   int __pyx_v_cnt;
-  struct __pyx_obj_3lib_9intbitset_intbitset *__pyx_v_ret;
+  struct __pyx_obj_9intbitset_intbitset *__pyx_v_ret;
   PyObject *__pyx_r = NULL;
   int __pyx_t_1;
   int __pyx_t_2;
@@ -7251,38 +7916,38 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_45to_sorted_list(PyObject *
       values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__j);
       if (likely(values[1])) kw_args--;
       else {
-        __Pyx_RaiseArgtupleInvalid("to_sorted_list", 1, 2, 2, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 667; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        __Pyx_RaiseArgtupleInvalid("to_sorted_list", 1, 2, 2, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 772; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
     }
     if (unlikely(kw_args > 0)) {
-      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "to_sorted_list") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 667; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "to_sorted_list") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 772; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
     }
-    __pyx_v_i = __Pyx_PyInt_AsInt(values[0]); if (unlikely((__pyx_v_i == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 667; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __pyx_v_j = __Pyx_PyInt_AsInt(values[1]); if (unlikely((__pyx_v_j == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 667; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_i = __Pyx_PyInt_AsInt(values[0]); if (unlikely((__pyx_v_i == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 772; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_j = __Pyx_PyInt_AsInt(values[1]); if (unlikely((__pyx_v_j == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 772; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
     goto __pyx_L5_argtuple_error;
   } else {
-    __pyx_v_i = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 0)); if (unlikely((__pyx_v_i == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 667; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __pyx_v_j = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 1)); if (unlikely((__pyx_v_j == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 667; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_i = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 0)); if (unlikely((__pyx_v_i == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 772; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_j = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 1)); if (unlikely((__pyx_v_j == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 772; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("to_sorted_list", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 667; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __Pyx_RaiseArgtupleInvalid("to_sorted_list", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 772; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   __pyx_L3_error:;
-  __Pyx_AddTraceback("lib.intbitset.intbitset.to_sorted_list");
+  __Pyx_AddTraceback("intbitset.intbitset.to_sorted_list");
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_v_ret = ((struct __pyx_obj_3lib_9intbitset_intbitset *)Py_None); __Pyx_INCREF(Py_None);
+  __pyx_v_ret = ((struct __pyx_obj_9intbitset_intbitset *)Py_None); __Pyx_INCREF(Py_None);
 
-  /* "lib/intbitset.pyx":673
+  /* "intbitset.pyx":778
  *         cdef int last
  *         cdef int cnt
  *         if self.bitset.trailing_bits and (i < 0 or j < 0):             # <<<<<<<<<<<<<<
  *             raise OverflowError("It's impossible to retrieve a sublist using negative indices from an infinite set.")
  *         elif (i > maxelem or j > maxelem):
  */
-  if (((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->bitset->trailing_bits) {
+  if (((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->bitset->trailing_bits) {
     __pyx_t_1 = (__pyx_v_i < 0);
     if (!__pyx_t_1) {
       __pyx_t_2 = (__pyx_v_j < 0);
@@ -7292,26 +7957,26 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_45to_sorted_list(PyObject *
     }
     __pyx_t_1 = __pyx_t_3;
   } else {
-    __pyx_t_1 = ((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->bitset->trailing_bits;
+    __pyx_t_1 = ((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->bitset->trailing_bits;
   }
   if (__pyx_t_1) {
 
-    /* "lib/intbitset.pyx":674
+    /* "intbitset.pyx":779
  *         cdef int cnt
  *         if self.bitset.trailing_bits and (i < 0 or j < 0):
  *             raise OverflowError("It's impossible to retrieve a sublist using negative indices from an infinite set.")             # <<<<<<<<<<<<<<
  *         elif (i > maxelem or j > maxelem):
  *             raise OverflowError("Indexes must be <= %s" % maxelem)
  */
-    __pyx_t_4 = PyObject_Call(__pyx_builtin_OverflowError, ((PyObject *)__pyx_k_tuple_58), NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 674; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_4 = PyObject_Call(__pyx_builtin_OverflowError, ((PyObject *)__pyx_k_tuple_61), NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 779; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_4);
     __Pyx_Raise(__pyx_t_4, 0, 0);
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 674; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 779; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     goto __pyx_L6;
   }
 
-  /* "lib/intbitset.pyx":675
+  /* "intbitset.pyx":780
  *         if self.bitset.trailing_bits and (i < 0 or j < 0):
  *             raise OverflowError("It's impossible to retrieve a sublist using negative indices from an infinite set.")
  *         elif (i > maxelem or j > maxelem):             # <<<<<<<<<<<<<<
@@ -7327,43 +7992,43 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_45to_sorted_list(PyObject *
   }
   if (__pyx_t_2) {
 
-    /* "lib/intbitset.pyx":676
+    /* "intbitset.pyx":781
  *             raise OverflowError("It's impossible to retrieve a sublist using negative indices from an infinite set.")
  *         elif (i > maxelem or j > maxelem):
  *             raise OverflowError("Indexes must be <= %s" % maxelem)             # <<<<<<<<<<<<<<
  *         l = intBitSetGetTot(self.bitset)
  *         if i == 0 and j == -1:
  */
-    __pyx_t_4 = PyInt_FromLong(maxelem); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 676; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_4 = PyInt_FromLong(maxelem); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 781; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_5 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_59), __pyx_t_4); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 676; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_5 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_62), __pyx_t_4); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 781; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(((PyObject *)__pyx_t_5));
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 676; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 781; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(((PyObject *)__pyx_t_4));
     PyTuple_SET_ITEM(__pyx_t_4, 0, ((PyObject *)__pyx_t_5));
     __Pyx_GIVEREF(((PyObject *)__pyx_t_5));
     __pyx_t_5 = 0;
-    __pyx_t_5 = PyObject_Call(__pyx_builtin_OverflowError, ((PyObject *)__pyx_t_4), NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 676; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_5 = PyObject_Call(__pyx_builtin_OverflowError, ((PyObject *)__pyx_t_4), NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 781; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_5);
     __Pyx_DECREF(((PyObject *)__pyx_t_4)); __pyx_t_4 = 0;
     __Pyx_Raise(__pyx_t_5, 0, 0);
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 676; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 781; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     goto __pyx_L6;
   }
   __pyx_L6:;
 
-  /* "lib/intbitset.pyx":677
+  /* "intbitset.pyx":782
  *         elif (i > maxelem or j > maxelem):
  *             raise OverflowError("Indexes must be <= %s" % maxelem)
  *         l = intBitSetGetTot(self.bitset)             # <<<<<<<<<<<<<<
  *         if i == 0 and j == -1:
  *             return intbitset(self)
  */
-  __pyx_v_l = intBitSetGetTot(((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->bitset);
+  __pyx_v_l = intBitSetGetTot(((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->bitset);
 
-  /* "lib/intbitset.pyx":678
+  /* "intbitset.pyx":783
  *             raise OverflowError("Indexes must be <= %s" % maxelem)
  *         l = intBitSetGetTot(self.bitset)
  *         if i == 0 and j == -1:             # <<<<<<<<<<<<<<
@@ -7379,7 +8044,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_45to_sorted_list(PyObject *
   }
   if (__pyx_t_3) {
 
-    /* "lib/intbitset.pyx":679
+    /* "intbitset.pyx":784
  *         l = intBitSetGetTot(self.bitset)
  *         if i == 0 and j == -1:
  *             return intbitset(self)             # <<<<<<<<<<<<<<
@@ -7387,12 +8052,12 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_45to_sorted_list(PyObject *
  *         if i < 0:
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 679; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 784; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(((PyObject *)__pyx_t_5));
     __Pyx_INCREF(__pyx_v_self);
     PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_v_self);
     __Pyx_GIVEREF(__pyx_v_self);
-    __pyx_t_4 = PyObject_Call(((PyObject *)((PyObject*)__pyx_ptype_3lib_9intbitset_intbitset)), ((PyObject *)__pyx_t_5), NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 679; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_4 = PyObject_Call(((PyObject *)((PyObject*)__pyx_ptype_9intbitset_intbitset)), ((PyObject *)__pyx_t_5), NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 784; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_4);
     __Pyx_DECREF(((PyObject *)__pyx_t_5)); __pyx_t_5 = 0;
     __pyx_r = __pyx_t_4;
@@ -7402,20 +8067,20 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_45to_sorted_list(PyObject *
   }
   __pyx_L7:;
 
-  /* "lib/intbitset.pyx":680
+  /* "intbitset.pyx":785
  *         if i == 0 and j == -1:
  *             return intbitset(self)
  *         ret = intbitset()             # <<<<<<<<<<<<<<
  *         if i < 0:
  *             i = i + l
  */
-  __pyx_t_4 = PyObject_Call(((PyObject *)((PyObject*)__pyx_ptype_3lib_9intbitset_intbitset)), ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 680; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_4 = PyObject_Call(((PyObject *)((PyObject*)__pyx_ptype_9intbitset_intbitset)), ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 785; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_DECREF(((PyObject *)__pyx_v_ret));
-  __pyx_v_ret = ((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_t_4);
+  __pyx_v_ret = ((struct __pyx_obj_9intbitset_intbitset *)__pyx_t_4);
   __pyx_t_4 = 0;
 
-  /* "lib/intbitset.pyx":681
+  /* "intbitset.pyx":786
  *             return intbitset(self)
  *         ret = intbitset()
  *         if i < 0:             # <<<<<<<<<<<<<<
@@ -7425,7 +8090,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_45to_sorted_list(PyObject *
   __pyx_t_3 = (__pyx_v_i < 0);
   if (__pyx_t_3) {
 
-    /* "lib/intbitset.pyx":682
+    /* "intbitset.pyx":787
  *         ret = intbitset()
  *         if i < 0:
  *             i = i + l             # <<<<<<<<<<<<<<
@@ -7437,7 +8102,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_45to_sorted_list(PyObject *
   }
   __pyx_L8:;
 
-  /* "lib/intbitset.pyx":683
+  /* "intbitset.pyx":788
  *         if i < 0:
  *             i = i + l
  *         if j < 0:             # <<<<<<<<<<<<<<
@@ -7447,7 +8112,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_45to_sorted_list(PyObject *
   __pyx_t_3 = (__pyx_v_j < 0);
   if (__pyx_t_3) {
 
-    /* "lib/intbitset.pyx":684
+    /* "intbitset.pyx":789
  *             i = i + l
  *         if j < 0:
  *             j = j + l             # <<<<<<<<<<<<<<
@@ -7459,7 +8124,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_45to_sorted_list(PyObject *
   }
   __pyx_L9:;
 
-  /* "lib/intbitset.pyx":685
+  /* "intbitset.pyx":790
  *         if j < 0:
  *             j = j + l
  *         if i >= l:             # <<<<<<<<<<<<<<
@@ -7469,7 +8134,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_45to_sorted_list(PyObject *
   __pyx_t_3 = (__pyx_v_i >= __pyx_v_l);
   if (__pyx_t_3) {
 
-    /* "lib/intbitset.pyx":686
+    /* "intbitset.pyx":791
  *             j = j + l
  *         if i >= l:
  *             i = l             # <<<<<<<<<<<<<<
@@ -7481,7 +8146,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_45to_sorted_list(PyObject *
   }
   __pyx_L10:;
 
-  /* "lib/intbitset.pyx":687
+  /* "intbitset.pyx":792
  *         if i >= l:
  *             i = l
  *         if j >= l:             # <<<<<<<<<<<<<<
@@ -7491,50 +8156,52 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_45to_sorted_list(PyObject *
   __pyx_t_3 = (__pyx_v_j >= __pyx_v_l);
   if (__pyx_t_3) {
 
-    /* "lib/intbitset.pyx":688
+    /* "intbitset.pyx":793
  *             i = l
  *         if j >= l:
  *             j = l             # <<<<<<<<<<<<<<
  *         last = -1
- *         for cnt from 0 <= cnt < i:
+ *         if i > 0:
  */
     __pyx_v_j = __pyx_v_l;
     goto __pyx_L11;
   }
   __pyx_L11:;
 
-  /* "lib/intbitset.pyx":689
+  /* "intbitset.pyx":794
  *         if j >= l:
  *             j = l
  *         last = -1             # <<<<<<<<<<<<<<
- *         for cnt from 0 <= cnt < i:
- *             last = intBitSetGetNext(self.bitset, last)
+ *         if i > 0:
+ *             last = intBitSetSelect(self.bitset, i - 1)
  */
   __pyx_v_last = -1;
 
-  /* "lib/intbitset.pyx":690
+  /* "intbitset.pyx":795
  *             j = l
  *         last = -1
- *         for cnt from 0 <= cnt < i:             # <<<<<<<<<<<<<<
- *             last = intBitSetGetNext(self.bitset, last)
+ *         if i > 0:             # <<<<<<<<<<<<<<
+ *             last = intBitSetSelect(self.bitset, i - 1)
  *         for cnt from i <= cnt < j:
  */
-  __pyx_t_6 = __pyx_v_i;
-  for (__pyx_v_cnt = 0; __pyx_v_cnt < __pyx_t_6; __pyx_v_cnt++) {
+  __pyx_t_3 = (__pyx_v_i > 0);
+  if (__pyx_t_3) {
 
-    /* "lib/intbitset.pyx":691
+    /* "intbitset.pyx":796
  *         last = -1
- *         for cnt from 0 <= cnt < i:
- *             last = intBitSetGetNext(self.bitset, last)             # <<<<<<<<<<<<<<
+ *         if i > 0:
+ *             last = intBitSetSelect(self.bitset, i - 1)             # <<<<<<<<<<<<<<
  *         for cnt from i <= cnt < j:
  *             last = intBitSetGetNext(self.bitset, last)
  */
-    __pyx_v_last = intBitSetGetNext(((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->bitset, __pyx_v_last);
+    __pyx_v_last = intBitSetSelect(((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->bitset, (__pyx_v_i - 1));
+    goto __pyx_L12;
   }
+  __pyx_L12:;
 
-  /* "lib/intbitset.pyx":692
- *         for cnt from 0 <= cnt < i:
- *             last = intBitSetGetNext(self.bitset, last)
+  /* "intbitset.pyx":797
+ *         if i > 0:
+ *             last = intBitSetSelect(self.bitset, i - 1)
  *         for cnt from i <= cnt < j:             # <<<<<<<<<<<<<<
  *             last = intBitSetGetNext(self.bitset, last)
  *             intBitSetAddElem((<intbitset> ret).bitset, last)
@@ -7542,16 +8209,16 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_45to_sorted_list(PyObject *
   __pyx_t_6 = __pyx_v_j;
   for (__pyx_v_cnt = __pyx_v_i; __pyx_v_cnt < __pyx_t_6; __pyx_v_cnt++) {
 
-    /* "lib/intbitset.pyx":693
- *             last = intBitSetGetNext(self.bitset, last)
+    /* "intbitset.pyx":798
+ *             last = intBitSetSelect(self.bitset, i - 1)
  *         for cnt from i <= cnt < j:
  *             last = intBitSetGetNext(self.bitset, last)             # <<<<<<<<<<<<<<
  *             intBitSetAddElem((<intbitset> ret).bitset, last)
  *         return ret
  */
-    __pyx_v_last = intBitSetGetNext(((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->bitset, __pyx_v_last);
+    __pyx_v_last = intBitSetGetNext(((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->bitset, __pyx_v_last);
 
-    /* "lib/intbitset.pyx":694
+    /* "intbitset.pyx":799
  *         for cnt from i <= cnt < j:
  *             last = intBitSetGetNext(self.bitset, last)
  *             intBitSetAddElem((<intbitset> ret).bitset, last)             # <<<<<<<<<<<<<<
@@ -7561,12 +8228,12 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_45to_sorted_list(PyObject *
     intBitSetAddElem(__pyx_v_ret->bitset, __pyx_v_last);
   }
 
-  /* "lib/intbitset.pyx":695
+  /* "intbitset.pyx":800
  *             last = intBitSetGetNext(self.bitset, last)
  *             intBitSetAddElem((<intbitset> ret).bitset, last)
  *         return ret             # <<<<<<<<<<<<<<
  * 
- *     def is_infinite(self):
+ *     def rank(self, int elem):
  */
   __Pyx_XDECREF(__pyx_r);
   __Pyx_INCREF(((PyObject *)__pyx_v_ret));
@@ -7578,7 +8245,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_45to_sorted_list(PyObject *
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_4);
   __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_AddTraceback("lib.intbitset.intbitset.to_sorted_list");
+  __Pyx_AddTraceback("intbitset.intbitset.to_sorted_list");
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_DECREF((PyObject *)__pyx_v_ret);
@@ -7587,22 +8254,150 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_45to_sorted_list(PyObject *
   return __pyx_r;
 }
 
-/* "lib/intbitset.pyx":697
+/* "intbitset.pyx":802
  *         return ret
  * 
+ *     def rank(self, int elem):             # <<<<<<<<<<<<<<
+ *         """Return the number of elements of the set smaller than elem,
+ *         i.e. the position of elem in the sorted representation of the set
+ */
+
+static PyObject *__pyx_pf_9intbitset_9intbitset_46rank(PyObject *__pyx_v_self, PyObject *__pyx_arg_elem); /*proto*/
+static char __pyx_doc_9intbitset_9intbitset_46rank[] = "Return the number of elements of the set smaller than elem,\n        i.e. the position of elem in the sorted representation of the set\n        if elem is in the set.";
+static PyObject *__pyx_pf_9intbitset_9intbitset_46rank(PyObject *__pyx_v_self, PyObject *__pyx_arg_elem) {
+  int __pyx_v_elem;
+  PyObject *__pyx_r = NULL;
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  __Pyx_RefNannySetupContext("rank");
+  assert(__pyx_arg_elem); {
+    __pyx_v_elem = __Pyx_PyInt_AsInt(__pyx_arg_elem); if (unlikely((__pyx_v_elem == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 802; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("intbitset.intbitset.rank");
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+
+  /* "intbitset.pyx":806
+ *         i.e. the position of elem in the sorted representation of the set
+ *         if elem is in the set."""
+ *         if self.sanity_checks:             # <<<<<<<<<<<<<<
+ *             if elem < 0:
+ *                 raise ValueError("Negative numbers, not allowed")
+ */
+  if (((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->sanity_checks) {
+
+    /* "intbitset.pyx":807
+ *         if elem is in the set."""
+ *         if self.sanity_checks:
+ *             if elem < 0:             # <<<<<<<<<<<<<<
+ *                 raise ValueError("Negative numbers, not allowed")
+ *             elif elem > maxelem:
+ */
+    __pyx_t_1 = (__pyx_v_elem < 0);
+    if (__pyx_t_1) {
+
+      /* "intbitset.pyx":808
+ *         if self.sanity_checks:
+ *             if elem < 0:
+ *                 raise ValueError("Negative numbers, not allowed")             # <<<<<<<<<<<<<<
+ *             elif elem > maxelem:
+ *                 raise OverflowError("Element must be <= %s" % maxelem)
+ */
+      __pyx_t_2 = PyObject_Call(__pyx_builtin_ValueError, ((PyObject *)__pyx_k_tuple_63), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 808; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_Raise(__pyx_t_2, 0, 0);
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 808; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      goto __pyx_L6;
+    }
+
+    /* "intbitset.pyx":809
+ *             if elem < 0:
+ *                 raise ValueError("Negative numbers, not allowed")
+ *             elif elem > maxelem:             # <<<<<<<<<<<<<<
+ *                 raise OverflowError("Element must be <= %s" % maxelem)
+ *         return intBitSetRank(self.bitset, elem)
+ */
+    __pyx_t_1 = (__pyx_v_elem > maxelem);
+    if (__pyx_t_1) {
+
+      /* "intbitset.pyx":810
+ *                 raise ValueError("Negative numbers, not allowed")
+ *             elif elem > maxelem:
+ *                 raise OverflowError("Element must be <= %s" % maxelem)             # <<<<<<<<<<<<<<
+ *         return intBitSetRank(self.bitset, elem)
+ * 
+ */
+      __pyx_t_2 = PyInt_FromLong(maxelem); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 810; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_2);
+      __pyx_t_3 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_20), __pyx_t_2); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 810; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(((PyObject *)__pyx_t_3));
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 810; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(((PyObject *)__pyx_t_2));
+      PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_t_3));
+      __Pyx_GIVEREF(((PyObject *)__pyx_t_3));
+      __pyx_t_3 = 0;
+      __pyx_t_3 = PyObject_Call(__pyx_builtin_OverflowError, ((PyObject *)__pyx_t_2), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 810; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_DECREF(((PyObject *)__pyx_t_2)); __pyx_t_2 = 0;
+      __Pyx_Raise(__pyx_t_3, 0, 0);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 810; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      goto __pyx_L6;
+    }
+    __pyx_L6:;
+    goto __pyx_L5;
+  }
+  __pyx_L5:;
+
+  /* "intbitset.pyx":811
+ *             elif elem > maxelem:
+ *                 raise OverflowError("Element must be <= %s" % maxelem)
+ *         return intBitSetRank(self.bitset, elem)             # <<<<<<<<<<<<<<
+ * 
+ *     def is_infinite(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_3 = PyInt_FromLong(intBitSetRank(((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->bitset, __pyx_v_elem)); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 811; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_r = __pyx_t_3;
+  __pyx_t_3 = 0;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("intbitset.intbitset.rank");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "intbitset.pyx":813
+ *         return intBitSetRank(self.bitset, elem)
+ * 
  *     def is_infinite(self):             # <<<<<<<<<<<<<<
  *         """Return True if the intbitset is infinite. (i.e. trailing_bits=True
  *         was used in the constructor.)"""
  */
 
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_46is_infinite(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static char __pyx_doc_3lib_9intbitset_9intbitset_46is_infinite[] = "Return True if the intbitset is infinite. (i.e. trailing_bits=True\n        was used in the constructor.)";
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_46is_infinite(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+static PyObject *__pyx_pf_9intbitset_9intbitset_47is_infinite(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static char __pyx_doc_9intbitset_9intbitset_47is_infinite[] = "Return True if the intbitset is infinite. (i.e. trailing_bits=True\n        was used in the constructor.)";
+static PyObject *__pyx_pf_9intbitset_9intbitset_47is_infinite(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
   PyObject *__pyx_r = NULL;
   PyObject *__pyx_t_1 = NULL;
   __Pyx_RefNannySetupContext("is_infinite");
 
-  /* "lib/intbitset.pyx":700
+  /* "intbitset.pyx":816
  *         """Return True if the intbitset is infinite. (i.e. trailing_bits=True
  *         was used in the constructor.)"""
  *         return self.bitset.trailing_bits != 0             # <<<<<<<<<<<<<<
@@ -7610,7 +8405,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_46is_infinite(PyObject *__p
  *     def extract_finite_list(self, int up_to=-1):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyBool_FromLong((((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->bitset->trailing_bits != 0)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 700; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_PyBool_FromLong((((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->bitset->trailing_bits != 0)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 816; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -7620,7 +8415,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_46is_infinite(PyObject *__p
   goto __pyx_L0;
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("lib.intbitset.intbitset.is_infinite");
+  __Pyx_AddTraceback("intbitset.intbitset.is_infinite");
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -7628,7 +8423,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_46is_infinite(PyObject *__p
   return __pyx_r;
 }
 
-/* "lib/intbitset.pyx":702
+/* "intbitset.pyx":818
  *         return self.bitset.trailing_bits != 0
  * 
  *     def extract_finite_list(self, int up_to=-1):             # <<<<<<<<<<<<<<
@@ -7636,9 +8431,9 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_46is_infinite(PyObject *__p
  *         constructor toghether with the proper value of trailing_bits in order
  */
 
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_47extract_finite_list(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_3lib_9intbitset_9intbitset_47extract_finite_list[] = "Return a finite list of elements sufficient to be passed to intbitset\n        constructor toghether with the proper value of trailing_bits in order\n        to reproduce this intbitset. At least up_to integer are looked for when\n        they are inside the intbitset but not necessarily needed to build the\n        intbitset";
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_47extract_finite_list(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+static PyObject *__pyx_pf_9intbitset_9intbitset_48extract_finite_list(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_9intbitset_9intbitset_48extract_finite_list[] = "Return a finite list of elements sufficient to be passed to intbitset\n        constructor toghether with the proper value of trailing_bits in order\n        to reproduce this intbitset. At least up_to integer are looked for when\n        they are inside the intbitset but not necessarily needed to build the\n        intbitset";
+static PyObject *__pyx_pf_9intbitset_9intbitset_48extract_finite_list(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   int __pyx_v_up_to;
   int __pyx_v_true_up_to;
   int __pyx_v_last;
@@ -7669,113 +8464,137 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_47extract_finite_list(PyObj
       }
     }
     if (unlikely(kw_args > 0)) {
-      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "extract_finite_list") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 702; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "extract_finite_list") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 818; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
     }
     if (values[0]) {
-      __pyx_v_up_to = __Pyx_PyInt_AsInt(values[0]); if (unlikely((__pyx_v_up_to == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 702; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      __pyx_v_up_to = __Pyx_PyInt_AsInt(values[0]); if (unlikely((__pyx_v_up_to == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 818; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
     } else {
       __pyx_v_up_to = ((int)-1);
     }
   } else {
     __pyx_v_up_to = ((int)-1);
     switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  1: __pyx_v_up_to = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 0)); if (unlikely((__pyx_v_up_to == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 702; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      case  1: __pyx_v_up_to = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 0)); if (unlikely((__pyx_v_up_to == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 818; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       case  0: break;
       default: goto __pyx_L5_argtuple_error;
     }
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("extract_finite_list", 0, 0, 1, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 702; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __Pyx_RaiseArgtupleInvalid("extract_finite_list", 0, 0, 1, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 818; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   __pyx_L3_error:;
-  __Pyx_AddTraceback("lib.intbitset.intbitset.extract_finite_list");
+  __Pyx_AddTraceback("intbitset.intbitset.extract_finite_list");
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
   __pyx_v_ret = ((PyObject*)Py_None); __Pyx_INCREF(Py_None);
 
-  /* "lib/intbitset.pyx":710
+  /* "intbitset.pyx":826
  *         cdef int true_up_to
  *         cdef int last
  *         if self.sanity_checks and up_to > maxelem:             # <<<<<<<<<<<<<<
  *             raise OverflowError("up_to must be <= %s" % maxelem)
  *         ret = []
  */
-  if (((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->sanity_checks) {
+  if (((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->sanity_checks) {
     __pyx_t_1 = (__pyx_v_up_to > maxelem);
     __pyx_t_2 = __pyx_t_1;
   } else {
-    __pyx_t_2 = ((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->sanity_checks;
+    __pyx_t_2 = ((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->sanity_checks;
   }
   if (__pyx_t_2) {
 
-    /* "lib/intbitset.pyx":711
+    /* "intbitset.pyx":827
  *         cdef int last
  *         if self.sanity_checks and up_to > maxelem:
  *             raise OverflowError("up_to must be <= %s" % maxelem)             # <<<<<<<<<<<<<<
  *         ret = []
- *         true_up_to = max(up_to, (intBitSetGetSize(self.bitset)) * wordbitsize)
+ *         if self.bitset.bitset == NULL:
  */
-    __pyx_t_3 = PyInt_FromLong(maxelem); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 711; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = PyInt_FromLong(maxelem); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 827; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_4 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_60), __pyx_t_3); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 711; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_4 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_64), __pyx_t_3); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 827; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(((PyObject *)__pyx_t_4));
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 711; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 827; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(((PyObject *)__pyx_t_3));
     PyTuple_SET_ITEM(__pyx_t_3, 0, ((PyObject *)__pyx_t_4));
     __Pyx_GIVEREF(((PyObject *)__pyx_t_4));
     __pyx_t_4 = 0;
-    __pyx_t_4 = PyObject_Call(__pyx_builtin_OverflowError, ((PyObject *)__pyx_t_3), NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 711; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_4 = PyObject_Call(__pyx_builtin_OverflowError, ((PyObject *)__pyx_t_3), NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 827; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_4);
     __Pyx_DECREF(((PyObject *)__pyx_t_3)); __pyx_t_3 = 0;
     __Pyx_Raise(__pyx_t_4, 0, 0);
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 711; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 827; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     goto __pyx_L6;
   }
   __pyx_L6:;
 
-  /* "lib/intbitset.pyx":712
+  /* "intbitset.pyx":828
  *         if self.sanity_checks and up_to > maxelem:
  *             raise OverflowError("up_to must be <= %s" % maxelem)
  *         ret = []             # <<<<<<<<<<<<<<
- *         true_up_to = max(up_to, (intBitSetGetSize(self.bitset)) * wordbitsize)
- *         last = -1
+ *         if self.bitset.bitset == NULL:
+ *             # compressed sets are finite
  */
-  __pyx_t_4 = PyList_New(0); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 712; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_4 = PyList_New(0); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 828; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(((PyObject *)__pyx_t_4));
   __Pyx_DECREF(((PyObject *)__pyx_v_ret));
   __pyx_v_ret = __pyx_t_4;
   __pyx_t_4 = 0;
 
-  /* "lib/intbitset.pyx":713
+  /* "intbitset.pyx":829
  *             raise OverflowError("up_to must be <= %s" % maxelem)
  *         ret = []
- *         true_up_to = max(up_to, (intBitSetGetSize(self.bitset)) * wordbitsize)             # <<<<<<<<<<<<<<
- *         last = -1
- *         while last < true_up_to:
+ *         if self.bitset.bitset == NULL:             # <<<<<<<<<<<<<<
+ *             # compressed sets are finite
+ *             true_up_to = maxelem
  */
-  __pyx_t_5 = (intBitSetGetSize(((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->bitset) * wordbitsize);
-  __pyx_t_6 = __pyx_v_up_to;
-  if ((__pyx_t_5 > __pyx_t_6)) {
-    __pyx_t_7 = __pyx_t_5;
-  } else {
-    __pyx_t_7 = __pyx_t_6;
+  __pyx_t_2 = (((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->bitset->bitset == NULL);
+  if (__pyx_t_2) {
+
+    /* "intbitset.pyx":831
+ *         if self.bitset.bitset == NULL:
+ *             # compressed sets are finite
+ *             true_up_to = maxelem             # <<<<<<<<<<<<<<
+ *         else:
+ *             true_up_to = max(up_to, (intBitSetGetSize(self.bitset)) * wordbitsize)
+ */
+    __pyx_v_true_up_to = maxelem;
+    goto __pyx_L7;
   }
-  __pyx_v_true_up_to = __pyx_t_7;
+  /*else*/ {
 
-  /* "lib/intbitset.pyx":714
- *         ret = []
- *         true_up_to = max(up_to, (intBitSetGetSize(self.bitset)) * wordbitsize)
+    /* "intbitset.pyx":833
+ *             true_up_to = maxelem
+ *         else:
+ *             true_up_to = max(up_to, (intBitSetGetSize(self.bitset)) * wordbitsize)             # <<<<<<<<<<<<<<
+ *         last = -1
+ *         while last < true_up_to:
+ */
+    __pyx_t_5 = (intBitSetGetSize(((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->bitset) * wordbitsize);
+    __pyx_t_6 = __pyx_v_up_to;
+    if ((__pyx_t_5 > __pyx_t_6)) {
+      __pyx_t_7 = __pyx_t_5;
+    } else {
+      __pyx_t_7 = __pyx_t_6;
+    }
+    __pyx_v_true_up_to = __pyx_t_7;
+  }
+  __pyx_L7:;
+
+  /* "intbitset.pyx":834
+ *         else:
+ *             true_up_to = max(up_to, (intBitSetGetSize(self.bitset)) * wordbitsize)
  *         last = -1             # <<<<<<<<<<<<<<
  *         while last < true_up_to:
  *             last = intBitSetGetNext(self.bitset, last)
  */
   __pyx_v_last = -1;
 
-  /* "lib/intbitset.pyx":715
- *         true_up_to = max(up_to, (intBitSetGetSize(self.bitset)) * wordbitsize)
+  /* "intbitset.pyx":835
+ *             true_up_to = max(up_to, (intBitSetGetSize(self.bitset)) * wordbitsize)
  *         last = -1
  *         while last < true_up_to:             # <<<<<<<<<<<<<<
  *             last = intBitSetGetNext(self.bitset, last)
@@ -7785,16 +8604,16 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_47extract_finite_list(PyObj
     __pyx_t_2 = (__pyx_v_last < __pyx_v_true_up_to);
     if (!__pyx_t_2) break;
 
-    /* "lib/intbitset.pyx":716
+    /* "intbitset.pyx":836
  *         last = -1
  *         while last < true_up_to:
  *             last = intBitSetGetNext(self.bitset, last)             # <<<<<<<<<<<<<<
  *             if last == -2:
  *                 break
  */
-    __pyx_v_last = intBitSetGetNext(((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->bitset, __pyx_v_last);
+    __pyx_v_last = intBitSetGetNext(((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->bitset, __pyx_v_last);
 
-    /* "lib/intbitset.pyx":717
+    /* "intbitset.pyx":837
  *         while last < true_up_to:
  *             last = intBitSetGetNext(self.bitset, last)
  *             if last == -2:             # <<<<<<<<<<<<<<
@@ -7804,19 +8623,19 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_47extract_finite_list(PyObj
     __pyx_t_2 = (__pyx_v_last == -2);
     if (__pyx_t_2) {
 
-      /* "lib/intbitset.pyx":718
+      /* "intbitset.pyx":838
  *             last = intBitSetGetNext(self.bitset, last)
  *             if last == -2:
  *                 break             # <<<<<<<<<<<<<<
  *             ret.append(last)
  *         return ret
  */
-      goto __pyx_L8_break;
-      goto __pyx_L9;
+      goto __pyx_L9_break;
+      goto __pyx_L10;
     }
-    __pyx_L9:;
+    __pyx_L10:;
 
-    /* "lib/intbitset.pyx":719
+    /* "intbitset.pyx":839
  *             if last == -2:
  *                 break
  *             ret.append(last)             # <<<<<<<<<<<<<<
@@ -7824,16 +8643,16 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_47extract_finite_list(PyObj
  * 
  */
     if (unlikely(__pyx_v_ret == Py_None)) {
-      PyErr_SetString(PyExc_AttributeError, "'NoneType' object has no attribute 'append'"); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 719; __pyx_clineno = __LINE__; goto __pyx_L1_error;} 
+      PyErr_SetString(PyExc_AttributeError, "'NoneType' object has no attribute 'append'"); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 839; __pyx_clineno = __LINE__; goto __pyx_L1_error;} 
     }
-    __pyx_t_4 = PyInt_FromLong(__pyx_v_last); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 719; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_4 = PyInt_FromLong(__pyx_v_last); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 839; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_7 = PyList_Append(__pyx_v_ret, __pyx_t_4); if (unlikely(__pyx_t_7 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 719; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_7 = PyList_Append(__pyx_v_ret, __pyx_t_4); if (unlikely(__pyx_t_7 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 839; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
   }
-  __pyx_L8_break:;
+  __pyx_L9_break:;
 
-  /* "lib/intbitset.pyx":720
+  /* "intbitset.pyx":840
  *                 break
  *             ret.append(last)
  *         return ret             # <<<<<<<<<<<<<<
@@ -7850,7 +8669,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_47extract_finite_list(PyObj
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_3);
   __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_AddTraceback("lib.intbitset.intbitset.extract_finite_list");
+  __Pyx_AddTraceback("intbitset.intbitset.extract_finite_list");
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_DECREF(__pyx_v_ret);
@@ -7859,7 +8678,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_47extract_finite_list(PyObj
   return __pyx_r;
 }
 
-/* "lib/intbitset.pyx":722
+/* "intbitset.pyx":842
  *         return ret
  * 
  *     def get_wordbitsize(self):             # <<<<<<<<<<<<<<
@@ -7867,13 +8686,13 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_47extract_finite_list(PyObj
  * 
  */
 
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_48get_wordbitsize(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_48get_wordbitsize(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+static PyObject *__pyx_pf_9intbitset_9intbitset_49get_wordbitsize(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pf_9intbitset_9intbitset_49get_wordbitsize(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
   PyObject *__pyx_r = NULL;
   PyObject *__pyx_t_1 = NULL;
   __Pyx_RefNannySetupContext("get_wordbitsize");
 
-  /* "lib/intbitset.pyx":723
+  /* "intbitset.pyx":843
  * 
  *     def get_wordbitsize(self):
  *         return wordbitsize             # <<<<<<<<<<<<<<
@@ -7881,7 +8700,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_48get_wordbitsize(PyObject
  *     def get_wordbytsize(self):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyInt_FromLong(wordbitsize); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 723; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyInt_FromLong(wordbitsize); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 843; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -7891,7 +8710,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_48get_wordbitsize(PyObject
   goto __pyx_L0;
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("lib.intbitset.intbitset.get_wordbitsize");
+  __Pyx_AddTraceback("intbitset.intbitset.get_wordbitsize");
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -7899,7 +8718,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_48get_wordbitsize(PyObject
   return __pyx_r;
 }
 
-/* "lib/intbitset.pyx":725
+/* "intbitset.pyx":845
  *         return wordbitsize
  * 
  *     def get_wordbytsize(self):             # <<<<<<<<<<<<<<
@@ -7907,13 +8726,13 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_48get_wordbitsize(PyObject
  * 
  */
 
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_49get_wordbytsize(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_49get_wordbytsize(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+static PyObject *__pyx_pf_9intbitset_9intbitset_50get_wordbytsize(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pf_9intbitset_9intbitset_50get_wordbytsize(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
   PyObject *__pyx_r = NULL;
   PyObject *__pyx_t_1 = NULL;
   __Pyx_RefNannySetupContext("get_wordbytsize");
 
-  /* "lib/intbitset.pyx":726
+  /* "intbitset.pyx":846
  * 
  *     def get_wordbytsize(self):
  *         return wordbytesize             # <<<<<<<<<<<<<<
@@ -7921,7 +8740,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_49get_wordbytsize(PyObject
  *     def tolist(self):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyInt_FromLong(wordbytesize); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 726; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyInt_FromLong(wordbytesize); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 846; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -7931,7 +8750,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_49get_wordbytsize(PyObject
   goto __pyx_L0;
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("lib.intbitset.intbitset.get_wordbytsize");
+  __Pyx_AddTraceback("intbitset.intbitset.get_wordbytsize");
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -7939,7 +8758,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_49get_wordbytsize(PyObject
   return __pyx_r;
 }
 
-/* "lib/intbitset.pyx":728
+/* "intbitset.pyx":848
  *         return wordbytesize
  * 
  *     def tolist(self):             # <<<<<<<<<<<<<<
@@ -7947,40 +8766,40 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_49get_wordbytsize(PyObject
  *         intbitset.
  */
 
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_50tolist(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static char __pyx_doc_3lib_9intbitset_9intbitset_50tolist[] = "Legacy method to retrieve a list of all the elements inside an\n        intbitset.\n        ";
-static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_50tolist(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+static PyObject *__pyx_pf_9intbitset_9intbitset_51tolist(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static char __pyx_doc_9intbitset_9intbitset_51tolist[] = "Legacy method to retrieve a list of all the elements inside an\n        intbitset.\n        ";
+static PyObject *__pyx_pf_9intbitset_9intbitset_51tolist(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
   PyObject *__pyx_r = NULL;
   PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
   __Pyx_RefNannySetupContext("tolist");
 
-  /* "lib/intbitset.pyx":732
+  /* "intbitset.pyx":852
  *         intbitset.
  *         """
  *         if self.bitset.trailing_bits:             # <<<<<<<<<<<<<<
  *             raise OverflowError("It's impossible to retrieve a list of an infinite set")
  *         return self.extract_finite_list()
  */
-  if (((struct __pyx_obj_3lib_9intbitset_intbitset *)__pyx_v_self)->bitset->trailing_bits) {
+  if (((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_self)->bitset->trailing_bits) {
 
-    /* "lib/intbitset.pyx":733
+    /* "intbitset.pyx":853
  *         """
  *         if self.bitset.trailing_bits:
  *             raise OverflowError("It's impossible to retrieve a list of an infinite set")             # <<<<<<<<<<<<<<
  *         return self.extract_finite_list()
  * 
  */
-    __pyx_t_1 = PyObject_Call(__pyx_builtin_OverflowError, ((PyObject *)__pyx_k_tuple_62), NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 733; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_1 = PyObject_Call(__pyx_builtin_OverflowError, ((PyObject *)__pyx_k_tuple_66), NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 853; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_Raise(__pyx_t_1, 0, 0);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 733; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 853; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     goto __pyx_L5;
   }
   __pyx_L5:;
 
-  /* "lib/intbitset.pyx":734
+  /* "intbitset.pyx":854
  *         if self.bitset.trailing_bits:
  *             raise OverflowError("It's impossible to retrieve a list of an infinite set")
  *         return self.extract_finite_list()             # <<<<<<<<<<<<<<
@@ -7988,9 +8807,9 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_50tolist(PyObject *__pyx_v_
  *     cdef object __weakref__
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyObject_GetAttr(__pyx_v_self, __pyx_n_s__extract_finite_list); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 734; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyObject_GetAttr(__pyx_v_self, __pyx_n_s__extract_finite_list); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 854; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyObject_Call(__pyx_t_1, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 734; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyObject_Call(__pyx_t_1, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 854; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __pyx_r = __pyx_t_2;
@@ -8002,7 +8821,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_50tolist(PyObject *__pyx_v_
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_AddTraceback("lib.intbitset.intbitset.tolist");
+  __Pyx_AddTraceback("intbitset.intbitset.tolist");
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -8010,7 +8829,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_50tolist(PyObject *__pyx_v_
   return __pyx_r;
 }
 
-/* "lib/intbitset.pyx":743
+/* "intbitset.pyx":863
  *     cdef bint sanity_checks
  * 
  *     def __cinit__(self, intbitset bitset not None):             # <<<<<<<<<<<<<<
@@ -8018,9 +8837,9 @@ static PyObject *__pyx_pf_3lib_9intbitset_9intbitset_50tolist(PyObject *__pyx_v_
  *         self.last = -1
  */
 
-static int __pyx_pf_3lib_9intbitset_18intbitset_iterator___cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static int __pyx_pf_3lib_9intbitset_18intbitset_iterator___cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  struct __pyx_obj_3lib_9intbitset_intbitset *__pyx_v_bitset = 0;
+static int __pyx_pf_9intbitset_18intbitset_iterator___cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static int __pyx_pf_9intbitset_18intbitset_iterator___cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  struct __pyx_obj_9intbitset_intbitset *__pyx_v_bitset = 0;
   int __pyx_r;
   PyObject *__pyx_t_1 = NULL;
   int __pyx_t_2;
@@ -8041,67 +8860,67 @@ static int __pyx_pf_3lib_9intbitset_18intbitset_iterator___cinit__(PyObject *__p
       else goto __pyx_L5_argtuple_error;
     }
     if (unlikely(kw_args > 0)) {
-      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "__cinit__") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 743; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "__cinit__") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 863; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
     }
-    __pyx_v_bitset = ((struct __pyx_obj_3lib_9intbitset_intbitset *)values[0]);
+    __pyx_v_bitset = ((struct __pyx_obj_9intbitset_intbitset *)values[0]);
   } else if (PyTuple_GET_SIZE(__pyx_args) != 1) {
     goto __pyx_L5_argtuple_error;
   } else {
-    __pyx_v_bitset = ((struct __pyx_obj_3lib_9intbitset_intbitset *)PyTuple_GET_ITEM(__pyx_args, 0));
+    __pyx_v_bitset = ((struct __pyx_obj_9intbitset_intbitset *)PyTuple_GET_ITEM(__pyx_args, 0));
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__cinit__", 1, 1, 1, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 743; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __Pyx_RaiseArgtupleInvalid("__cinit__", 1, 1, 1, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 863; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   __pyx_L3_error:;
-  __Pyx_AddTraceback("lib.intbitset.intbitset_iterator.__cinit__");
+  __Pyx_AddTraceback("intbitset.intbitset_iterator.__cinit__");
   __Pyx_RefNannyFinishContext();
   return -1;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_bitset), __pyx_ptype_3lib_9intbitset_intbitset, 0, "bitset", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 743; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_bitset), __pyx_ptype_9intbitset_intbitset, 0, "bitset", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 863; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-  /* "lib/intbitset.pyx":745
+  /* "intbitset.pyx":865
  *     def __cinit__(self, intbitset bitset not None):
  *         #print >> sys.stderr, "intbitset_iterator.__cinit__ is called"
  *         self.last = -1             # <<<<<<<<<<<<<<
  *         ## A copy should be performed, in case the original bitset disappears
  *         ## as in "for x in intbitset([1,2,3])"!
  */
-  ((struct __pyx_obj_3lib_9intbitset_intbitset_iterator *)__pyx_v_self)->last = -1;
+  ((struct __pyx_obj_9intbitset_intbitset_iterator *)__pyx_v_self)->last = -1;
 
-  /* "lib/intbitset.pyx":748
+  /* "intbitset.pyx":868
  *         ## A copy should be performed, in case the original bitset disappears
  *         ## as in "for x in intbitset([1,2,3])"!
  *         self.bitset = intBitSetClone(bitset.bitset)             # <<<<<<<<<<<<<<
  *         self.sanity_checks = CFG_INTBITSET_ENABLE_SANITY_CHECKS
  * 
  */
-  ((struct __pyx_obj_3lib_9intbitset_intbitset_iterator *)__pyx_v_self)->bitset = intBitSetClone(__pyx_v_bitset->bitset);
+  ((struct __pyx_obj_9intbitset_intbitset_iterator *)__pyx_v_self)->bitset = intBitSetClone(__pyx_v_bitset->bitset);
 
-  /* "lib/intbitset.pyx":749
+  /* "intbitset.pyx":869
  *         ## as in "for x in intbitset([1,2,3])"!
  *         self.bitset = intBitSetClone(bitset.bitset)
  *         self.sanity_checks = CFG_INTBITSET_ENABLE_SANITY_CHECKS             # <<<<<<<<<<<<<<
  * 
  *     def __dealloc__(self):
  */
-  __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s_63); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 749; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s_67); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 869; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely((__pyx_t_2 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 749; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely((__pyx_t_2 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 869; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  ((struct __pyx_obj_3lib_9intbitset_intbitset_iterator *)__pyx_v_self)->sanity_checks = __pyx_t_2;
+  ((struct __pyx_obj_9intbitset_intbitset_iterator *)__pyx_v_self)->sanity_checks = __pyx_t_2;
 
   __pyx_r = 0;
   goto __pyx_L0;
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("lib.intbitset.intbitset_iterator.__cinit__");
+  __Pyx_AddTraceback("intbitset.intbitset_iterator.__cinit__");
   __pyx_r = -1;
   __pyx_L0:;
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "lib/intbitset.pyx":751
+/* "intbitset.pyx":871
  *         self.sanity_checks = CFG_INTBITSET_ENABLE_SANITY_CHECKS
  * 
  *     def __dealloc__(self):             # <<<<<<<<<<<<<<
@@ -8109,23 +8928,23 @@ static int __pyx_pf_3lib_9intbitset_18intbitset_iterator___cinit__(PyObject *__p
  *         intBitSetDestroy(self.bitset)
  */
 
-static void __pyx_pf_3lib_9intbitset_18intbitset_iterator_1__dealloc__(PyObject *__pyx_v_self); /*proto*/
-static void __pyx_pf_3lib_9intbitset_18intbitset_iterator_1__dealloc__(PyObject *__pyx_v_self) {
+static void __pyx_pf_9intbitset_18intbitset_iterator_1__dealloc__(PyObject *__pyx_v_self); /*proto*/
+static void __pyx_pf_9intbitset_18intbitset_iterator_1__dealloc__(PyObject *__pyx_v_self) {
   __Pyx_RefNannySetupContext("__dealloc__");
 
-  /* "lib/intbitset.pyx":753
+  /* "intbitset.pyx":873
  *     def __dealloc__(self):
  *         #print >> sys.stderr, "intbitset_iterator.__dealloc__ is called"
  *         intBitSetDestroy(self.bitset)             # <<<<<<<<<<<<<<
  * 
  *     def __next__(self):
  */
-  intBitSetDestroy(((struct __pyx_obj_3lib_9intbitset_intbitset_iterator *)__pyx_v_self)->bitset);
+  intBitSetDestroy(((struct __pyx_obj_9intbitset_intbitset_iterator *)__pyx_v_self)->bitset);
 
   __Pyx_RefNannyFinishContext();
 }
 
-/* "lib/intbitset.pyx":755
+/* "intbitset.pyx":875
  *         intBitSetDestroy(self.bitset)
  * 
  *     def __next__(self):             # <<<<<<<<<<<<<<
@@ -8133,112 +8952,112 @@ static void __pyx_pf_3lib_9intbitset_18intbitset_iterator_1__dealloc__(PyObject
  *             raise StopIteration()
  */
 
-static PyObject *__pyx_pf_3lib_9intbitset_18intbitset_iterator_2__next__(PyObject *__pyx_v_self); /*proto*/
-static PyObject *__pyx_pf_3lib_9intbitset_18intbitset_iterator_2__next__(PyObject *__pyx_v_self) {
+static PyObject *__pyx_pf_9intbitset_18intbitset_iterator_2__next__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pf_9intbitset_18intbitset_iterator_2__next__(PyObject *__pyx_v_self) {
   PyObject *__pyx_r = NULL;
   int __pyx_t_1;
   PyObject *__pyx_t_2 = NULL;
   int __pyx_t_3;
   __Pyx_RefNannySetupContext("__next__");
 
-  /* "lib/intbitset.pyx":756
+  /* "intbitset.pyx":876
  * 
  *     def __next__(self):
  *         if self.last == -2:             # <<<<<<<<<<<<<<
  *             raise StopIteration()
  *         self.last = intBitSetGetNext(self.bitset, self.last)
  */
-  __pyx_t_1 = (((struct __pyx_obj_3lib_9intbitset_intbitset_iterator *)__pyx_v_self)->last == -2);
+  __pyx_t_1 = (((struct __pyx_obj_9intbitset_intbitset_iterator *)__pyx_v_self)->last == -2);
   if (__pyx_t_1) {
 
-    /* "lib/intbitset.pyx":757
+    /* "intbitset.pyx":877
  *     def __next__(self):
  *         if self.last == -2:
  *             raise StopIteration()             # <<<<<<<<<<<<<<
  *         self.last = intBitSetGetNext(self.bitset, self.last)
  *         if self.sanity_checks and (self.bitset.allocated < self.bitset.size):
  */
-    __pyx_t_2 = PyObject_Call(__pyx_builtin_StopIteration, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 757; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = PyObject_Call(__pyx_builtin_StopIteration, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 877; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_Raise(__pyx_t_2, 0, 0);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 757; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 877; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     goto __pyx_L5;
   }
   __pyx_L5:;
 
-  /* "lib/intbitset.pyx":758
+  /* "intbitset.pyx":878
  *         if self.last == -2:
  *             raise StopIteration()
  *         self.last = intBitSetGetNext(self.bitset, self.last)             # <<<<<<<<<<<<<<
  *         if self.sanity_checks and (self.bitset.allocated < self.bitset.size):
  *             raise MemoryError("intbitset corrupted: allocated: %s, size: %s" % (self.bitset.allocated, self.bitset.size))
  */
-  ((struct __pyx_obj_3lib_9intbitset_intbitset_iterator *)__pyx_v_self)->last = intBitSetGetNext(((struct __pyx_obj_3lib_9intbitset_intbitset_iterator *)__pyx_v_self)->bitset, ((struct __pyx_obj_3lib_9intbitset_intbitset_iterator *)__pyx_v_self)->last);
+  ((struct __pyx_obj_9intbitset_intbitset_iterator *)__pyx_v_self)->last = intBitSetGetNext(((struct __pyx_obj_9intbitset_intbitset_iterator *)__pyx_v_self)->bitset, ((struct __pyx_obj_9intbitset_intbitset_iterator *)__pyx_v_self)->last);
 
-  /* "lib/intbitset.pyx":759
+  /* "intbitset.pyx":879
  *             raise StopIteration()
  *         self.last = intBitSetGetNext(self.bitset, self.last)
  *         if self.sanity_checks and (self.bitset.allocated < self.bitset.size):             # <<<<<<<<<<<<<<
  *             raise MemoryError("intbitset corrupted: allocated: %s, size: %s" % (self.bitset.allocated, self.bitset.size))
  *         if self.last < 0:
  */
-  if (((struct __pyx_obj_3lib_9intbitset_intbitset_iterator *)__pyx_v_self)->sanity_checks) {
-    __pyx_t_1 = (((struct __pyx_obj_3lib_9intbitset_intbitset_iterator *)__pyx_v_self)->bitset->allocated < ((struct __pyx_obj_3lib_9intbitset_intbitset_iterator *)__pyx_v_self)->bitset->size);
+  if (((struct __pyx_obj_9intbitset_intbitset_iterator *)__pyx_v_self)->sanity_checks) {
+    __pyx_t_1 = (((struct __pyx_obj_9intbitset_intbitset_iterator *)__pyx_v_self)->bitset->allocated < ((struct __pyx_obj_9intbitset_intbitset_iterator *)__pyx_v_self)->bitset->size);
     __pyx_t_3 = __pyx_t_1;
   } else {
-    __pyx_t_3 = ((struct __pyx_obj_3lib_9intbitset_intbitset_iterator *)__pyx_v_self)->sanity_checks;
+    __pyx_t_3 = ((struct __pyx_obj_9intbitset_intbitset_iterator *)__pyx_v_self)->sanity_checks;
   }
   if (__pyx_t_3) {
 
-    /* "lib/intbitset.pyx":760
+    /* "intbitset.pyx":880
  *         self.last = intBitSetGetNext(self.bitset, self.last)
  *         if self.sanity_checks and (self.bitset.allocated < self.bitset.size):
  *             raise MemoryError("intbitset corrupted: allocated: %s, size: %s" % (self.bitset.allocated, self.bitset.size))             # <<<<<<<<<<<<<<
  *         if self.last < 0:
  *             self.last = -2
  */
-    PyErr_NoMemory(); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 760; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    PyErr_NoMemory(); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 880; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     goto __pyx_L6;
   }
   __pyx_L6:;
 
-  /* "lib/intbitset.pyx":761
+  /* "intbitset.pyx":881
  *         if self.sanity_checks and (self.bitset.allocated < self.bitset.size):
  *             raise MemoryError("intbitset corrupted: allocated: %s, size: %s" % (self.bitset.allocated, self.bitset.size))
  *         if self.last < 0:             # <<<<<<<<<<<<<<
  *             self.last = -2
  *             raise StopIteration()
  */
-  __pyx_t_3 = (((struct __pyx_obj_3lib_9intbitset_intbitset_iterator *)__pyx_v_self)->last < 0);
+  __pyx_t_3 = (((struct __pyx_obj_9intbitset_intbitset_iterator *)__pyx_v_self)->last < 0);
   if (__pyx_t_3) {
 
-    /* "lib/intbitset.pyx":762
+    /* "intbitset.pyx":882
  *             raise MemoryError("intbitset corrupted: allocated: %s, size: %s" % (self.bitset.allocated, self.bitset.size))
  *         if self.last < 0:
  *             self.last = -2             # <<<<<<<<<<<<<<
  *             raise StopIteration()
  *         return self.last
  */
-    ((struct __pyx_obj_3lib_9intbitset_intbitset_iterator *)__pyx_v_self)->last = -2;
+    ((struct __pyx_obj_9intbitset_intbitset_iterator *)__pyx_v_self)->last = -2;
 
-    /* "lib/intbitset.pyx":763
+    /* "intbitset.pyx":883
  *         if self.last < 0:
  *             self.last = -2
  *             raise StopIteration()             # <<<<<<<<<<<<<<
  *         return self.last
  * 
  */
-    __pyx_t_2 = PyObject_Call(__pyx_builtin_StopIteration, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 763; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = PyObject_Call(__pyx_builtin_StopIteration, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 883; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_Raise(__pyx_t_2, 0, 0);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 763; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 883; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     goto __pyx_L7;
   }
   __pyx_L7:;
 
-  /* "lib/intbitset.pyx":764
+  /* "intbitset.pyx":884
  *             self.last = -2
  *             raise StopIteration()
  *         return self.last             # <<<<<<<<<<<<<<
@@ -8246,7 +9065,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_18intbitset_iterator_2__next__(PyObjec
  *     def __iter__(self):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_2 = PyInt_FromLong(((struct __pyx_obj_3lib_9intbitset_intbitset_iterator *)__pyx_v_self)->last); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 764; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyInt_FromLong(((struct __pyx_obj_9intbitset_intbitset_iterator *)__pyx_v_self)->last); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 884; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
   __pyx_r = __pyx_t_2;
   __pyx_t_2 = 0;
@@ -8256,7 +9075,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_18intbitset_iterator_2__next__(PyObjec
   goto __pyx_L0;
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_AddTraceback("lib.intbitset.intbitset_iterator.__next__");
+  __Pyx_AddTraceback("intbitset.intbitset_iterator.__next__");
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -8264,7 +9083,7 @@ static PyObject *__pyx_pf_3lib_9intbitset_18intbitset_iterator_2__next__(PyObjec
   return __pyx_r;
 }
 
-/* "lib/intbitset.pyx":766
+/* "intbitset.pyx":886
  *         return self.last
  * 
  *     def __iter__(self):             # <<<<<<<<<<<<<<
@@ -8272,12 +9091,12 @@ static PyObject *__pyx_pf_3lib_9intbitset_18intbitset_iterator_2__next__(PyObjec
  * 
  */
 
-static PyObject *__pyx_pf_3lib_9intbitset_18intbitset_iterator_3__iter__(PyObject *__pyx_v_self); /*proto*/
-static PyObject *__pyx_pf_3lib_9intbitset_18intbitset_iterator_3__iter__(PyObject *__pyx_v_self) {
+static PyObject *__pyx_pf_9intbitset_18intbitset_iterator_3__iter__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pf_9intbitset_18intbitset_iterator_3__iter__(PyObject *__pyx_v_self) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannySetupContext("__iter__");
 
-  /* "lib/intbitset.pyx":767
+  /* "intbitset.pyx":887
  * 
  *     def __iter__(self):
  *         return self             # <<<<<<<<<<<<<<
@@ -8296,154 +9115,2900 @@ static PyObject *__pyx_pf_3lib_9intbitset_18intbitset_iterator_3__iter__(PyObjec
   return __pyx_r;
 }
 
-static PyObject *__pyx_tp_new_3lib_9intbitset_intbitset(PyTypeObject *t, PyObject *a, PyObject *k) {
-  struct __pyx_obj_3lib_9intbitset_intbitset *p;
-  PyObject *o = (*t->tp_alloc)(t, 0);
-  if (!o) return 0;
-  p = ((struct __pyx_obj_3lib_9intbitset_intbitset *)o);
-  p->__weakref__ = 0;
-  if (__pyx_pf_3lib_9intbitset_9intbitset___cinit__(o, a, k) < 0) {
-    Py_DECREF(o); o = 0;
+/* "intbitset.pyx":903
+ *     cdef Py_ssize_t size
+ * 
+ *     def __cinit__(self, path):             # <<<<<<<<<<<<<<
+ *         cdef void *data
+ *         self.data = NULL
+ */
+
+static int __pyx_pf_9intbitset_14intbitset_file___cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static int __pyx_pf_9intbitset_14intbitset_file___cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_path = 0;
+  void *__pyx_v_data;
+  PyObject *__pyx_v_dump_file;
+  PyObject *__pyx_v_size;
+  int __pyx_r;
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  void *__pyx_t_5;
+  size_t __pyx_t_6;
+  int __pyx_t_7;
+  int __pyx_t_8;
+  int __pyx_t_9;
+  Py_ssize_t __pyx_t_10;
+  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__path,0};
+  __Pyx_RefNannySetupContext("__cinit__");
+  if (unlikely(__pyx_kwds)) {
+    Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
+    PyObject* values[1] = {0};
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      case  0: break;
+      default: goto __pyx_L5_argtuple_error;
+    }
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  0:
+      values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__path);
+      if (likely(values[0])) kw_args--;
+      else goto __pyx_L5_argtuple_error;
+    }
+    if (unlikely(kw_args > 0)) {
+      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "__cinit__") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 903; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    }
+    __pyx_v_path = values[0];
+  } else if (PyTuple_GET_SIZE(__pyx_args) != 1) {
+    goto __pyx_L5_argtuple_error;
+  } else {
+    __pyx_v_path = PyTuple_GET_ITEM(__pyx_args, 0);
   }
-  return o;
-}
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("__cinit__", 1, 1, 1, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 903; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("intbitset.intbitset_file.__cinit__");
+  __Pyx_RefNannyFinishContext();
+  return -1;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_v_dump_file = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_size = Py_None; __Pyx_INCREF(Py_None);
+
+  /* "intbitset.pyx":905
+ *     def __cinit__(self, path):
+ *         cdef void *data
+ *         self.data = NULL             # <<<<<<<<<<<<<<
+ *         self.size = 0
+ *         dump_file = open(path, 'rb')
+ */
+  ((struct __pyx_obj_9intbitset_intbitset_file *)__pyx_v_self)->data = NULL;
+
+  /* "intbitset.pyx":906
+ *         cdef void *data
+ *         self.data = NULL
+ *         self.size = 0             # <<<<<<<<<<<<<<
+ *         dump_file = open(path, 'rb')
+ *         try:
+ */
+  ((struct __pyx_obj_9intbitset_intbitset_file *)__pyx_v_self)->size = 0;
 
-static void __pyx_tp_dealloc_3lib_9intbitset_intbitset(PyObject *o) {
-  struct __pyx_obj_3lib_9intbitset_intbitset *p = (struct __pyx_obj_3lib_9intbitset_intbitset *)o;
-  {
-    PyObject *etype, *eval, *etb;
-    PyErr_Fetch(&etype, &eval, &etb);
-    ++Py_REFCNT(o);
-    __pyx_pf_3lib_9intbitset_9intbitset_1__dealloc__(o);
-    if (PyErr_Occurred()) PyErr_WriteUnraisable(o);
-    --Py_REFCNT(o);
-    PyErr_Restore(etype, eval, etb);
+  /* "intbitset.pyx":907
+ *         self.data = NULL
+ *         self.size = 0
+ *         dump_file = open(path, 'rb')             # <<<<<<<<<<<<<<
+ *         try:
+ *             size = os.fstat(dump_file.fileno()).st_size
+ */
+  __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 907; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_t_1));
+  __Pyx_INCREF(__pyx_v_path);
+  PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_path);
+  __Pyx_GIVEREF(__pyx_v_path);
+  __Pyx_INCREF(((PyObject *)__pyx_n_s__rb));
+  PyTuple_SET_ITEM(__pyx_t_1, 1, ((PyObject *)__pyx_n_s__rb));
+  __Pyx_GIVEREF(((PyObject *)__pyx_n_s__rb));
+  __pyx_t_2 = PyObject_Call(__pyx_builtin_open, ((PyObject *)__pyx_t_1), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 907; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(((PyObject *)__pyx_t_1)); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_v_dump_file);
+  __pyx_v_dump_file = __pyx_t_2;
+  __pyx_t_2 = 0;
+
+  /* "intbitset.pyx":908
+ *         self.size = 0
+ *         dump_file = open(path, 'rb')
+ *         try:             # <<<<<<<<<<<<<<
+ *             size = os.fstat(dump_file.fileno()).st_size
+ *             if size:
+ */
+  /*try:*/ {
+
+    /* "intbitset.pyx":909
+ *         dump_file = open(path, 'rb')
+ *         try:
+ *             size = os.fstat(dump_file.fileno()).st_size             # <<<<<<<<<<<<<<
+ *             if size:
+ *                 data = c_mmap(NULL, size, PROT_READ, MAP_SHARED, dump_file.fileno(), 0)
+ */
+    __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s__os); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 909; __pyx_clineno = __LINE__; goto __pyx_L7;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_1 = PyObject_GetAttr(__pyx_t_2, __pyx_n_s__fstat); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 909; __pyx_clineno = __LINE__; goto __pyx_L7;}
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_t_2 = PyObject_GetAttr(__pyx_v_dump_file, __pyx_n_s__fileno); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 909; __pyx_clineno = __LINE__; goto __pyx_L7;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_3 = PyObject_Call(__pyx_t_2, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 909; __pyx_clineno = __LINE__; goto __pyx_L7;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 909; __pyx_clineno = __LINE__; goto __pyx_L7;}
+    __Pyx_GOTREF(((PyObject *)__pyx_t_2));
+    PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_3);
+    __Pyx_GIVEREF(__pyx_t_3);
+    __pyx_t_3 = 0;
+    __pyx_t_3 = PyObject_Call(__pyx_t_1, ((PyObject *)__pyx_t_2), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 909; __pyx_clineno = __LINE__; goto __pyx_L7;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(((PyObject *)__pyx_t_2)); __pyx_t_2 = 0;
+    __pyx_t_2 = PyObject_GetAttr(__pyx_t_3, __pyx_n_s__st_size); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 909; __pyx_clineno = __LINE__; goto __pyx_L7;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_v_size);
+    __pyx_v_size = __pyx_t_2;
+    __pyx_t_2 = 0;
+
+    /* "intbitset.pyx":910
+ *         try:
+ *             size = os.fstat(dump_file.fileno()).st_size
+ *             if size:             # <<<<<<<<<<<<<<
+ *                 data = c_mmap(NULL, size, PROT_READ, MAP_SHARED, dump_file.fileno(), 0)
+ *                 if data == MAP_FAILED:
+ */
+    __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_v_size); if (unlikely(__pyx_t_4 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 910; __pyx_clineno = __LINE__; goto __pyx_L7;}
+    if (__pyx_t_4) {
+
+      /* "intbitset.pyx":911
+ *             size = os.fstat(dump_file.fileno()).st_size
+ *             if size:
+ *                 data = c_mmap(NULL, size, PROT_READ, MAP_SHARED, dump_file.fileno(), 0)             # <<<<<<<<<<<<<<
+ *                 if data == MAP_FAILED:
+ *                     raise EnvironmentError("Cannot map %s" % path)
+ */
+      __pyx_t_5 = NULL;
+      __pyx_t_6 = __Pyx_PyInt_AsSize_t(__pyx_v_size); if (unlikely((__pyx_t_6 == (size_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 911; __pyx_clineno = __LINE__; goto __pyx_L7;}
+      __pyx_t_7 = PROT_READ;
+      __pyx_t_8 = MAP_SHARED;
+      __pyx_t_2 = PyObject_GetAttr(__pyx_v_dump_file, __pyx_n_s__fileno); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 911; __pyx_clineno = __LINE__; goto __pyx_L7;}
+      __Pyx_GOTREF(__pyx_t_2);
+      __pyx_t_3 = PyObject_Call(__pyx_t_2, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 911; __pyx_clineno = __LINE__; goto __pyx_L7;}
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __pyx_t_9 = __Pyx_PyInt_AsInt(__pyx_t_3); if (unlikely((__pyx_t_9 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 911; __pyx_clineno = __LINE__; goto __pyx_L7;}
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __pyx_v_data = mmap(__pyx_t_5, __pyx_t_6, __pyx_t_7, __pyx_t_8, __pyx_t_9, 0);
+
+      /* "intbitset.pyx":912
+ *             if size:
+ *                 data = c_mmap(NULL, size, PROT_READ, MAP_SHARED, dump_file.fileno(), 0)
+ *                 if data == MAP_FAILED:             # <<<<<<<<<<<<<<
+ *                     raise EnvironmentError("Cannot map %s" % path)
+ *                 self.data = <char *> data
+ */
+      __pyx_t_4 = (__pyx_v_data == MAP_FAILED);
+      if (__pyx_t_4) {
+
+        /* "intbitset.pyx":913
+ *                 data = c_mmap(NULL, size, PROT_READ, MAP_SHARED, dump_file.fileno(), 0)
+ *                 if data == MAP_FAILED:
+ *                     raise EnvironmentError("Cannot map %s" % path)             # <<<<<<<<<<<<<<
+ *                 self.data = <char *> data
+ *                 self.size = size
+ */
+        __pyx_t_3 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_68), __pyx_v_path); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 913; __pyx_clineno = __LINE__; goto __pyx_L7;}
+        __Pyx_GOTREF(((PyObject *)__pyx_t_3));
+        __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 913; __pyx_clineno = __LINE__; goto __pyx_L7;}
+        __Pyx_GOTREF(((PyObject *)__pyx_t_2));
+        PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_t_3));
+        __Pyx_GIVEREF(((PyObject *)__pyx_t_3));
+        __pyx_t_3 = 0;
+        __pyx_t_3 = PyObject_Call(__pyx_builtin_EnvironmentError, ((PyObject *)__pyx_t_2), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 913; __pyx_clineno = __LINE__; goto __pyx_L7;}
+        __Pyx_GOTREF(__pyx_t_3);
+        __Pyx_DECREF(((PyObject *)__pyx_t_2)); __pyx_t_2 = 0;
+        __Pyx_Raise(__pyx_t_3, 0, 0);
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        {__pyx_filename = __pyx_f[0]; __pyx_lineno = 913; __pyx_clineno = __LINE__; goto __pyx_L7;}
+        goto __pyx_L10;
+      }
+      __pyx_L10:;
+
+      /* "intbitset.pyx":914
+ *                 if data == MAP_FAILED:
+ *                     raise EnvironmentError("Cannot map %s" % path)
+ *                 self.data = <char *> data             # <<<<<<<<<<<<<<
+ *                 self.size = size
+ *         finally:
+ */
+      ((struct __pyx_obj_9intbitset_intbitset_file *)__pyx_v_self)->data = ((char *)__pyx_v_data);
+
+      /* "intbitset.pyx":915
+ *                     raise EnvironmentError("Cannot map %s" % path)
+ *                 self.data = <char *> data
+ *                 self.size = size             # <<<<<<<<<<<<<<
+ *         finally:
+ *             dump_file.close()
+ */
+      __pyx_t_10 = __Pyx_PyIndex_AsSsize_t(__pyx_v_size); if (unlikely((__pyx_t_10 == (Py_ssize_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 915; __pyx_clineno = __LINE__; goto __pyx_L7;}
+      ((struct __pyx_obj_9intbitset_intbitset_file *)__pyx_v_self)->size = __pyx_t_10;
+      goto __pyx_L9;
+    }
+    __pyx_L9:;
   }
-  if (p->__weakref__) PyObject_ClearWeakRefs(o);
-  (*Py_TYPE(o)->tp_free)(o);
-}
 
-static int __pyx_tp_traverse_3lib_9intbitset_intbitset(PyObject *o, visitproc v, void *a) {
-  return 0;
+  /* "intbitset.pyx":917
+ *                 self.size = size
+ *         finally:
+ *             dump_file.close()             # <<<<<<<<<<<<<<
+ * 
+ *     def __dealloc__(self):
+ */
+  /*finally:*/ {
+    int __pyx_why;
+    PyObject *__pyx_exc_type, *__pyx_exc_value, *__pyx_exc_tb;
+    int __pyx_exc_lineno;
+    __pyx_exc_type = 0; __pyx_exc_value = 0; __pyx_exc_tb = 0; __pyx_exc_lineno = 0;
+    __pyx_why = 0; goto __pyx_L8;
+    __pyx_L7: {
+      __pyx_why = 4;
+      __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __Pyx_ErrFetch(&__pyx_exc_type, &__pyx_exc_value, &__pyx_exc_tb);
+      __pyx_exc_lineno = __pyx_lineno;
+      goto __pyx_L8;
+    }
+    __pyx_L8:;
+    __pyx_t_3 = PyObject_GetAttr(__pyx_v_dump_file, __pyx_n_s__close); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 917; __pyx_clineno = __LINE__; goto __pyx_L11_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_2 = PyObject_Call(__pyx_t_3, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 917; __pyx_clineno = __LINE__; goto __pyx_L11_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    goto __pyx_L12;
+    __pyx_L11_error:;
+    if (__pyx_why == 4) {
+      Py_XDECREF(__pyx_exc_type);
+      Py_XDECREF(__pyx_exc_value);
+      Py_XDECREF(__pyx_exc_tb);
+    }
+    goto __pyx_L1_error;
+    __pyx_L12:;
+    switch (__pyx_why) {
+      case 4: {
+        __Pyx_ErrRestore(__pyx_exc_type, __pyx_exc_value, __pyx_exc_tb);
+        __pyx_lineno = __pyx_exc_lineno;
+        __pyx_exc_type = 0;
+        __pyx_exc_value = 0;
+        __pyx_exc_tb = 0;
+        goto __pyx_L1_error;
+      }
+    }
+  }
+
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("intbitset.intbitset_file.__cinit__");
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_dump_file);
+  __Pyx_DECREF(__pyx_v_size);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
 }
 
-static int __pyx_tp_clear_3lib_9intbitset_intbitset(PyObject *o) {
-  return 0;
+/* "intbitset.pyx":919
+ *             dump_file.close()
+ * 
+ *     def __dealloc__(self):             # <<<<<<<<<<<<<<
+ *         if self.data != NULL:
+ *             munmap(self.data, self.size)
+ */
+
+static void __pyx_pf_9intbitset_14intbitset_file_1__dealloc__(PyObject *__pyx_v_self); /*proto*/
+static void __pyx_pf_9intbitset_14intbitset_file_1__dealloc__(PyObject *__pyx_v_self) {
+  int __pyx_t_1;
+  __Pyx_RefNannySetupContext("__dealloc__");
+
+  /* "intbitset.pyx":920
+ * 
+ *     def __dealloc__(self):
+ *         if self.data != NULL:             # <<<<<<<<<<<<<<
+ *             munmap(self.data, self.size)
+ * 
+ */
+  __pyx_t_1 = (((struct __pyx_obj_9intbitset_intbitset_file *)__pyx_v_self)->data != NULL);
+  if (__pyx_t_1) {
+
+    /* "intbitset.pyx":921
+ *     def __dealloc__(self):
+ *         if self.data != NULL:
+ *             munmap(self.data, self.size)             # <<<<<<<<<<<<<<
+ * 
+ *     def __len__(self):
+ */
+    munmap(((struct __pyx_obj_9intbitset_intbitset_file *)__pyx_v_self)->data, ((struct __pyx_obj_9intbitset_intbitset_file *)__pyx_v_self)->size);
+    goto __pyx_L5;
+  }
+  __pyx_L5:;
+
+  __Pyx_RefNannyFinishContext();
 }
 
-static PyMethodDef __pyx_methods_3lib_9intbitset_intbitset[] = {
-  {__Pyx_NAMESTR("__deepcopy__"), (PyCFunction)__pyx_pf_3lib_9intbitset_9intbitset_10__deepcopy__, METH_O, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("__del__"), (PyCFunction)__pyx_pf_3lib_9intbitset_9intbitset_11__del__, METH_O, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("add"), (PyCFunction)__pyx_pf_3lib_9intbitset_9intbitset_22add, METH_O, __Pyx_DOCSTR(__pyx_doc_3lib_9intbitset_9intbitset_22add)},
-  {__Pyx_NAMESTR("clear"), (PyCFunction)__pyx_pf_3lib_9intbitset_9intbitset_23clear, METH_NOARGS, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("difference"), (PyCFunction)__pyx_pf_3lib_9intbitset_9intbitset_24difference, METH_O, __Pyx_DOCSTR(__pyx_doc_3lib_9intbitset_9intbitset_24difference)},
-  {__Pyx_NAMESTR("difference_update"), (PyCFunction)__pyx_pf_3lib_9intbitset_9intbitset_25difference_update, METH_O, __Pyx_DOCSTR(__pyx_doc_3lib_9intbitset_9intbitset_25difference_update)},
-  {__Pyx_NAMESTR("discard"), (PyCFunction)__pyx_pf_3lib_9intbitset_9intbitset_26discard, METH_O, __Pyx_DOCSTR(__pyx_doc_3lib_9intbitset_9intbitset_26discard)},
-  {__Pyx_NAMESTR("intersection"), (PyCFunction)__pyx_pf_3lib_9intbitset_9intbitset_27intersection, METH_O, __Pyx_DOCSTR(__pyx_doc_3lib_9intbitset_9intbitset_27intersection)},
-  {__Pyx_NAMESTR("intersection_update"), (PyCFunction)__pyx_pf_3lib_9intbitset_9intbitset_28intersection_update, METH_O, __Pyx_DOCSTR(__pyx_doc_3lib_9intbitset_9intbitset_28intersection_update)},
-  {__Pyx_NAMESTR("union"), (PyCFunction)__pyx_pf_3lib_9intbitset_9intbitset_29union, METH_O, __Pyx_DOCSTR(__pyx_doc_3lib_9intbitset_9intbitset_29union)},
-  {__Pyx_NAMESTR("union_update"), (PyCFunction)__pyx_pf_3lib_9intbitset_9intbitset_30union_update, METH_O, __Pyx_DOCSTR(__pyx_doc_3lib_9intbitset_9intbitset_30union_update)},
-  {__Pyx_NAMESTR("issubset"), (PyCFunction)__pyx_pf_3lib_9intbitset_9intbitset_31issubset, METH_O, __Pyx_DOCSTR(__pyx_doc_3lib_9intbitset_9intbitset_31issubset)},
-  {__Pyx_NAMESTR("issuperset"), (PyCFunction)__pyx_pf_3lib_9intbitset_9intbitset_32issuperset, METH_O, __Pyx_DOCSTR(__pyx_doc_3lib_9intbitset_9intbitset_32issuperset)},
-  {__Pyx_NAMESTR("symmetric_difference"), (PyCFunction)__pyx_pf_3lib_9intbitset_9intbitset_33symmetric_difference, METH_O, __Pyx_DOCSTR(__pyx_doc_3lib_9intbitset_9intbitset_33symmetric_difference)},
-  {__Pyx_NAMESTR("symmetric_difference_update"), (PyCFunction)__pyx_pf_3lib_9intbitset_9intbitset_34symmetric_difference_update, METH_O, __Pyx_DOCSTR(__pyx_doc_3lib_9intbitset_9intbitset_34symmetric_difference_update)},
-  {__Pyx_NAMESTR("fastdump"), (PyCFunction)__pyx_pf_3lib_9intbitset_9intbitset_35fastdump, METH_NOARGS, __Pyx_DOCSTR(__pyx_doc_3lib_9intbitset_9intbitset_35fastdump)},
-  {__Pyx_NAMESTR("fastload"), (PyCFunction)__pyx_pf_3lib_9intbitset_9intbitset_36fastload, METH_O, __Pyx_DOCSTR(__pyx_doc_3lib_9intbitset_9intbitset_36fastload)},
-  {__Pyx_NAMESTR("copy"), (PyCFunction)__pyx_pf_3lib_9intbitset_9intbitset_37copy, METH_NOARGS, __Pyx_DOCSTR(__pyx_doc_3lib_9intbitset_9intbitset_37copy)},
-  {__Pyx_NAMESTR("pop"), (PyCFunction)__pyx_pf_3lib_9intbitset_9intbitset_38pop, METH_NOARGS, __Pyx_DOCSTR(__pyx_doc_3lib_9intbitset_9intbitset_38pop)},
-  {__Pyx_NAMESTR("remove"), (PyCFunction)__pyx_pf_3lib_9intbitset_9intbitset_39remove, METH_O, __Pyx_DOCSTR(__pyx_doc_3lib_9intbitset_9intbitset_39remove)},
-  {__Pyx_NAMESTR("strbits"), (PyCFunction)__pyx_pf_3lib_9intbitset_9intbitset_40strbits, METH_NOARGS, __Pyx_DOCSTR(__pyx_doc_3lib_9intbitset_9intbitset_40strbits)},
-  {__Pyx_NAMESTR("update_with_signs"), (PyCFunction)__pyx_pf_3lib_9intbitset_9intbitset_41update_with_signs, METH_O, __Pyx_DOCSTR(__pyx_doc_3lib_9intbitset_9intbitset_41update_with_signs)},
-  {__Pyx_NAMESTR("get_size"), (PyCFunction)__pyx_pf_3lib_9intbitset_9intbitset_42get_size, METH_NOARGS, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("get_allocated"), (PyCFunction)__pyx_pf_3lib_9intbitset_9intbitset_43get_allocated, METH_NOARGS, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("get_sorted_element"), (PyCFunction)__pyx_pf_3lib_9intbitset_9intbitset_44get_sorted_element, METH_O, __Pyx_DOCSTR(__pyx_doc_3lib_9intbitset_9intbitset_44get_sorted_element)},
-  {__Pyx_NAMESTR("to_sorted_list"), (PyCFunction)__pyx_pf_3lib_9intbitset_9intbitset_45to_sorted_list, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_3lib_9intbitset_9intbitset_45to_sorted_list)},
-  {__Pyx_NAMESTR("is_infinite"), (PyCFunction)__pyx_pf_3lib_9intbitset_9intbitset_46is_infinite, METH_NOARGS, __Pyx_DOCSTR(__pyx_doc_3lib_9intbitset_9intbitset_46is_infinite)},
-  {__Pyx_NAMESTR("extract_finite_list"), (PyCFunction)__pyx_pf_3lib_9intbitset_9intbitset_47extract_finite_list, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_3lib_9intbitset_9intbitset_47extract_finite_list)},
-  {__Pyx_NAMESTR("get_wordbitsize"), (PyCFunction)__pyx_pf_3lib_9intbitset_9intbitset_48get_wordbitsize, METH_NOARGS, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("get_wordbytsize"), (PyCFunction)__pyx_pf_3lib_9intbitset_9intbitset_49get_wordbytsize, METH_NOARGS, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("tolist"), (PyCFunction)__pyx_pf_3lib_9intbitset_9intbitset_50tolist, METH_NOARGS, __Pyx_DOCSTR(__pyx_doc_3lib_9intbitset_9intbitset_50tolist)},
-  {0, 0, 0, 0}
-};
+/* "intbitset.pyx":923
+ *             munmap(self.data, self.size)
+ * 
+ *     def __len__(self):             # <<<<<<<<<<<<<<
+ *         return self.size
+ * 
+ */
 
-static PyNumberMethods __pyx_tp_as_number_intbitset = {
-  0, /*nb_add*/
-  __pyx_pf_3lib_9intbitset_9intbitset_15__sub__, /*nb_subtract*/
-  0, /*nb_multiply*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_divide*/
-  #endif
-  0, /*nb_remainder*/
-  0, /*nb_divmod*/
-  0, /*nb_power*/
-  0, /*nb_negative*/
-  0, /*nb_positive*/
-  0, /*nb_absolute*/
-  __pyx_pf_3lib_9intbitset_9intbitset_7__nonzero__, /*nb_nonzero*/
-  0, /*nb_invert*/
-  0, /*nb_lshift*/
-  0, /*nb_rshift*/
-  __pyx_pf_3lib_9intbitset_9intbitset_12__and__, /*nb_and*/
-  __pyx_pf_3lib_9intbitset_9intbitset_14__xor__, /*nb_xor*/
-  __pyx_pf_3lib_9intbitset_9intbitset_13__or__, /*nb_or*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_coerce*/
-  #endif
-  0, /*nb_int*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_long*/
-  #else
-  0, /*reserved*/
-  #endif
-  0, /*nb_float*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_oct*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_hex*/
-  #endif
-  __pyx_pf_3lib_9intbitset_9intbitset_8__iadd__, /*nb_inplace_add*/
-  __pyx_pf_3lib_9intbitset_9intbitset_9__isub__, /*nb_inplace_subtract*/
-  0, /*nb_inplace_multiply*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_inplace_divide*/
-  #endif
-  0, /*nb_inplace_remainder*/
-  0, /*nb_inplace_power*/
-  0, /*nb_inplace_lshift*/
-  0, /*nb_inplace_rshift*/
-  __pyx_pf_3lib_9intbitset_9intbitset_16__iand__, /*nb_inplace_and*/
-  __pyx_pf_3lib_9intbitset_9intbitset_18__ixor__, /*nb_inplace_xor*/
-  __pyx_pf_3lib_9intbitset_9intbitset_17__ior__, /*nb_inplace_or*/
-  0, /*nb_floor_divide*/
-  0, /*nb_true_divide*/
-  0, /*nb_inplace_floor_divide*/
-  0, /*nb_inplace_true_divide*/
-  #if PY_VERSION_HEX >= 0x02050000
-  0, /*nb_index*/
-  #endif
-};
+static Py_ssize_t __pyx_pf_9intbitset_14intbitset_file_2__len__(PyObject *__pyx_v_self); /*proto*/
+static Py_ssize_t __pyx_pf_9intbitset_14intbitset_file_2__len__(PyObject *__pyx_v_self) {
+  Py_ssize_t __pyx_r;
+  __Pyx_RefNannySetupContext("__len__");
 
-static PySequenceMethods __pyx_tp_as_sequence_intbitset = {
-  __pyx_pf_3lib_9intbitset_9intbitset_5__len__, /*sq_length*/
-  0, /*sq_concat*/
-  0, /*sq_repeat*/
-  0, /*sq_item*/
-  0, /*sq_slice*/
-  0, /*sq_ass_item*/
-  0, /*sq_ass_slice*/
-  __pyx_pf_3lib_9intbitset_9intbitset_2__contains__, /*sq_contains*/
-  0, /*sq_inplace_concat*/
-  0, /*sq_inplace_repeat*/
-};
+  /* "intbitset.pyx":924
+ * 
+ *     def __len__(self):
+ *         return self.size             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int _check_range(self, Py_ssize_t offset, Py_ssize_t length) except -1:
+ */
+  __pyx_r = ((struct __pyx_obj_9intbitset_intbitset_file *)__pyx_v_self)->size;
+  goto __pyx_L0;
 
-static PyMappingMethods __pyx_tp_as_mapping_intbitset = {
-  __pyx_pf_3lib_9intbitset_9intbitset_5__len__, /*mp_length*/
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "intbitset.pyx":926
+ *         return self.size
+ * 
+ *     cdef int _check_range(self, Py_ssize_t offset, Py_ssize_t length) except -1:             # <<<<<<<<<<<<<<
+ *         if offset < 0 or length < 0 or offset > self.size or length > self.size - offset:
+ *             raise ValueError("%s bytes at offset %s are out of the file" % (length, offset))
+ */
+
+static  int __pyx_f_9intbitset_14intbitset_file__check_range(struct __pyx_obj_9intbitset_intbitset_file *__pyx_v_self, Py_ssize_t __pyx_v_offset, Py_ssize_t __pyx_v_length) {
+  int __pyx_r;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  __Pyx_RefNannySetupContext("_check_range");
+
+  /* "intbitset.pyx":927
+ * 
+ *     cdef int _check_range(self, Py_ssize_t offset, Py_ssize_t length) except -1:
+ *         if offset < 0 or length < 0 or offset > self.size or length > self.size - offset:             # <<<<<<<<<<<<<<
+ *             raise ValueError("%s bytes at offset %s are out of the file" % (length, offset))
+ *         return 0
+ */
+  __pyx_t_1 = (__pyx_v_offset < 0);
+  if (!__pyx_t_1) {
+    __pyx_t_2 = (__pyx_v_length < 0);
+    if (!__pyx_t_2) {
+      __pyx_t_3 = (__pyx_v_offset > __pyx_v_self->size);
+      if (!__pyx_t_3) {
+        __pyx_t_4 = (__pyx_v_length > (__pyx_v_self->size - __pyx_v_offset));
+        __pyx_t_5 = __pyx_t_4;
+      } else {
+        __pyx_t_5 = __pyx_t_3;
+      }
+      __pyx_t_3 = __pyx_t_5;
+    } else {
+      __pyx_t_3 = __pyx_t_2;
+    }
+    __pyx_t_2 = __pyx_t_3;
+  } else {
+    __pyx_t_2 = __pyx_t_1;
+  }
+  if (__pyx_t_2) {
+
+    /* "intbitset.pyx":928
+ *     cdef int _check_range(self, Py_ssize_t offset, Py_ssize_t length) except -1:
+ *         if offset < 0 or length < 0 or offset > self.size or length > self.size - offset:
+ *             raise ValueError("%s bytes at offset %s are out of the file" % (length, offset))             # <<<<<<<<<<<<<<
+ *         return 0
+ * 
+ */
+    __pyx_t_6 = PyInt_FromSsize_t(__pyx_v_length); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 928; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_6);
+    __pyx_t_7 = PyInt_FromSsize_t(__pyx_v_offset); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 928; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_7);
+    __pyx_t_8 = PyTuple_New(2); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 928; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(((PyObject *)__pyx_t_8));
+    PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_6);
+    __Pyx_GIVEREF(__pyx_t_6);
+    PyTuple_SET_ITEM(__pyx_t_8, 1, __pyx_t_7);
+    __Pyx_GIVEREF(__pyx_t_7);
+    __pyx_t_6 = 0;
+    __pyx_t_7 = 0;
+    __pyx_t_7 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_69), ((PyObject *)__pyx_t_8)); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 928; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(((PyObject *)__pyx_t_7));
+    __Pyx_DECREF(((PyObject *)__pyx_t_8)); __pyx_t_8 = 0;
+    __pyx_t_8 = PyTuple_New(1); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 928; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(((PyObject *)__pyx_t_8));
+    PyTuple_SET_ITEM(__pyx_t_8, 0, ((PyObject *)__pyx_t_7));
+    __Pyx_GIVEREF(((PyObject *)__pyx_t_7));
+    __pyx_t_7 = 0;
+    __pyx_t_7 = PyObject_Call(__pyx_builtin_ValueError, ((PyObject *)__pyx_t_8), NULL); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 928; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_7);
+    __Pyx_DECREF(((PyObject *)__pyx_t_8)); __pyx_t_8 = 0;
+    __Pyx_Raise(__pyx_t_7, 0, 0);
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 928; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    goto __pyx_L3;
+  }
+  __pyx_L3:;
+
+  /* "intbitset.pyx":929
+ *         if offset < 0 or length < 0 or offset > self.size or length > self.size - offset:
+ *             raise ValueError("%s bytes at offset %s are out of the file" % (length, offset))
+ *         return 0             # <<<<<<<<<<<<<<
+ * 
+ *     def read(self, Py_ssize_t offset, Py_ssize_t length):
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_AddTraceback("intbitset.intbitset_file._check_range");
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "intbitset.pyx":931
+ *         return 0
+ * 
+ *     def read(self, Py_ssize_t offset, Py_ssize_t length):             # <<<<<<<<<<<<<<
+ *         """Return the length bytes of the file at offset as a str."""
+ *         self._check_range(offset, length)
+ */
+
+static PyObject *__pyx_pf_9intbitset_14intbitset_file_3read(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_9intbitset_14intbitset_file_3read[] = "Return the length bytes of the file at offset as a str.";
+static PyObject *__pyx_pf_9intbitset_14intbitset_file_3read(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  Py_ssize_t __pyx_v_offset;
+  Py_ssize_t __pyx_v_length;
+  PyObject *__pyx_r = NULL;
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__offset,&__pyx_n_s__length,0};
+  __Pyx_RefNannySetupContext("read");
+  if (unlikely(__pyx_kwds)) {
+    Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
+    PyObject* values[2] = {0,0};
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      case  0: break;
+      default: goto __pyx_L5_argtuple_error;
+    }
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  0:
+      values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__offset);
+      if (likely(values[0])) kw_args--;
+      else goto __pyx_L5_argtuple_error;
+      case  1:
+      values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__length);
+      if (likely(values[1])) kw_args--;
+      else {
+        __Pyx_RaiseArgtupleInvalid("read", 1, 2, 2, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 931; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+    }
+    if (unlikely(kw_args > 0)) {
+      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "read") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 931; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    }
+    __pyx_v_offset = __Pyx_PyIndex_AsSsize_t(values[0]); if (unlikely((__pyx_v_offset == (Py_ssize_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 931; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_length = __Pyx_PyIndex_AsSsize_t(values[1]); if (unlikely((__pyx_v_length == (Py_ssize_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 931; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
+    goto __pyx_L5_argtuple_error;
+  } else {
+    __pyx_v_offset = __Pyx_PyIndex_AsSsize_t(PyTuple_GET_ITEM(__pyx_args, 0)); if (unlikely((__pyx_v_offset == (Py_ssize_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 931; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_length = __Pyx_PyIndex_AsSsize_t(PyTuple_GET_ITEM(__pyx_args, 1)); if (unlikely((__pyx_v_length == (Py_ssize_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 931; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("read", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 931; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("intbitset.intbitset_file.read");
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+
+  /* "intbitset.pyx":933
+ *     def read(self, Py_ssize_t offset, Py_ssize_t length):
+ *         """Return the length bytes of the file at offset as a str."""
+ *         self._check_range(offset, length)             # <<<<<<<<<<<<<<
+ *         return PyString_FromStringAndSize(self.data + offset, length)
+ * 
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_9intbitset_intbitset_file *)((struct __pyx_obj_9intbitset_intbitset_file *)__pyx_v_self)->__pyx_vtab)->_check_range(((struct __pyx_obj_9intbitset_intbitset_file *)__pyx_v_self), __pyx_v_offset, __pyx_v_length); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 933; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "intbitset.pyx":934
+ *         """Return the length bytes of the file at offset as a str."""
+ *         self._check_range(offset, length)
+ *         return PyString_FromStringAndSize(self.data + offset, length)             # <<<<<<<<<<<<<<
+ * 
+ *     def load(self, Py_ssize_t offset, Py_ssize_t length):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_2 = PyString_FromStringAndSize((((struct __pyx_obj_9intbitset_intbitset_file *)__pyx_v_self)->data + __pyx_v_offset), __pyx_v_length); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 934; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("intbitset.intbitset_file.read");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "intbitset.pyx":936
+ *         return PyString_FromStringAndSize(self.data + offset, length)
+ * 
+ *     def load(self, Py_ssize_t offset, Py_ssize_t length):             # <<<<<<<<<<<<<<
+ *         """Return the intbitset dumped in the length bytes of the file at
+ *         offset.  The containers of a container dump are not copied."""
+ */
+
+static PyObject *__pyx_pf_9intbitset_14intbitset_file_4load(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_9intbitset_14intbitset_file_4load[] = "Return the intbitset dumped in the length bytes of the file at\n        offset.  The containers of a container dump are not copied.";
+static PyObject *__pyx_pf_9intbitset_14intbitset_file_4load(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  Py_ssize_t __pyx_v_offset;
+  Py_ssize_t __pyx_v_length;
+  struct __pyx_obj_9intbitset_intbitset *__pyx_v_ret;
+  PyObject *__pyx_r = NULL;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__offset,&__pyx_n_s__length,0};
+  __Pyx_RefNannySetupContext("load");
+  if (unlikely(__pyx_kwds)) {
+    Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
+    PyObject* values[2] = {0,0};
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      case  0: break;
+      default: goto __pyx_L5_argtuple_error;
+    }
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  0:
+      values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__offset);
+      if (likely(values[0])) kw_args--;
+      else goto __pyx_L5_argtuple_error;
+      case  1:
+      values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__length);
+      if (likely(values[1])) kw_args--;
+      else {
+        __Pyx_RaiseArgtupleInvalid("load", 1, 2, 2, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 936; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+    }
+    if (unlikely(kw_args > 0)) {
+      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "load") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 936; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    }
+    __pyx_v_offset = __Pyx_PyIndex_AsSsize_t(values[0]); if (unlikely((__pyx_v_offset == (Py_ssize_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 936; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_length = __Pyx_PyIndex_AsSsize_t(values[1]); if (unlikely((__pyx_v_length == (Py_ssize_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 936; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
+    goto __pyx_L5_argtuple_error;
+  } else {
+    __pyx_v_offset = __Pyx_PyIndex_AsSsize_t(PyTuple_GET_ITEM(__pyx_args, 0)); if (unlikely((__pyx_v_offset == (Py_ssize_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 936; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_length = __Pyx_PyIndex_AsSsize_t(PyTuple_GET_ITEM(__pyx_args, 1)); if (unlikely((__pyx_v_length == (Py_ssize_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 936; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("load", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 936; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("intbitset.intbitset_file.load");
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_v_ret = ((struct __pyx_obj_9intbitset_intbitset *)Py_None); __Pyx_INCREF(Py_None);
+
+  /* "intbitset.pyx":940
+ *         offset.  The containers of a container dump are not copied."""
+ *         cdef intbitset ret
+ *         self._check_range(offset, length)             # <<<<<<<<<<<<<<
+ *         if not intBitSetIsContainerBuffer(self.data + offset, length):
+ *             return intbitset(self.read(offset, length))
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_9intbitset_intbitset_file *)((struct __pyx_obj_9intbitset_intbitset_file *)__pyx_v_self)->__pyx_vtab)->_check_range(((struct __pyx_obj_9intbitset_intbitset_file *)__pyx_v_self), __pyx_v_offset, __pyx_v_length); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 940; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "intbitset.pyx":941
+ *         cdef intbitset ret
+ *         self._check_range(offset, length)
+ *         if not intBitSetIsContainerBuffer(self.data + offset, length):             # <<<<<<<<<<<<<<
+ *             return intbitset(self.read(offset, length))
+ *         ret = intbitset(no_allocate=1)
+ */
+  __pyx_t_2 = (!intBitSetIsContainerBuffer((((struct __pyx_obj_9intbitset_intbitset_file *)__pyx_v_self)->data + __pyx_v_offset), __pyx_v_length));
+  if (__pyx_t_2) {
+
+    /* "intbitset.pyx":942
+ *         self._check_range(offset, length)
+ *         if not intBitSetIsContainerBuffer(self.data + offset, length):
+ *             return intbitset(self.read(offset, length))             # <<<<<<<<<<<<<<
+ *         ret = intbitset(no_allocate=1)
+ *         ret.bitset = intBitSetCreateFromContainerBuffer(self.data + offset, length, 1)
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_3 = PyObject_GetAttr(__pyx_v_self, __pyx_n_s__read); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 942; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = PyInt_FromSsize_t(__pyx_v_offset); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 942; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_5 = PyInt_FromSsize_t(__pyx_v_length); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 942; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_6 = PyTuple_New(2); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 942; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(((PyObject *)__pyx_t_6));
+    PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_4);
+    __Pyx_GIVEREF(__pyx_t_4);
+    PyTuple_SET_ITEM(__pyx_t_6, 1, __pyx_t_5);
+    __Pyx_GIVEREF(__pyx_t_5);
+    __pyx_t_4 = 0;
+    __pyx_t_5 = 0;
+    __pyx_t_5 = PyObject_Call(__pyx_t_3, ((PyObject *)__pyx_t_6), NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 942; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(((PyObject *)__pyx_t_6)); __pyx_t_6 = 0;
+    __pyx_t_6 = PyTuple_New(1); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 942; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(((PyObject *)__pyx_t_6));
+    PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_5);
+    __Pyx_GIVEREF(__pyx_t_5);
+    __pyx_t_5 = 0;
+    __pyx_t_5 = PyObject_Call(((PyObject *)((PyObject*)__pyx_ptype_9intbitset_intbitset)), ((PyObject *)__pyx_t_6), NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 942; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(((PyObject *)__pyx_t_6)); __pyx_t_6 = 0;
+    __pyx_r = __pyx_t_5;
+    __pyx_t_5 = 0;
+    goto __pyx_L0;
+    goto __pyx_L6;
+  }
+  __pyx_L6:;
+
+  /* "intbitset.pyx":943
+ *         if not intBitSetIsContainerBuffer(self.data + offset, length):
+ *             return intbitset(self.read(offset, length))
+ *         ret = intbitset(no_allocate=1)             # <<<<<<<<<<<<<<
+ *         ret.bitset = intBitSetCreateFromContainerBuffer(self.data + offset, length, 1)
+ *         if ret.bitset == NULL:
+ */
+  __pyx_t_5 = PyDict_New(); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 943; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_t_5));
+  if (PyDict_SetItem(__pyx_t_5, ((PyObject *)__pyx_n_s__no_allocate), __pyx_int_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 943; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_6 = PyEval_CallObjectWithKeywords(((PyObject *)((PyObject*)__pyx_ptype_9intbitset_intbitset)), ((PyObject *)__pyx_empty_tuple), ((PyObject *)__pyx_t_5)); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 943; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(((PyObject *)__pyx_t_5)); __pyx_t_5 = 0;
+  __Pyx_DECREF(((PyObject *)__pyx_v_ret));
+  __pyx_v_ret = ((struct __pyx_obj_9intbitset_intbitset *)__pyx_t_6);
+  __pyx_t_6 = 0;
+
+  /* "intbitset.pyx":944
+ *             return intbitset(self.read(offset, length))
+ *         ret = intbitset(no_allocate=1)
+ *         ret.bitset = intBitSetCreateFromContainerBuffer(self.data + offset, length, 1)             # <<<<<<<<<<<<<<
+ *         if ret.bitset == NULL:
+ *             raise ValueError("rhs is corrupted: Corrupted container dump")
+ */
+  __pyx_v_ret->bitset = intBitSetCreateFromContainerBuffer((((struct __pyx_obj_9intbitset_intbitset_file *)__pyx_v_self)->data + __pyx_v_offset), __pyx_v_length, 1);
+
+  /* "intbitset.pyx":945
+ *         ret = intbitset(no_allocate=1)
+ *         ret.bitset = intBitSetCreateFromContainerBuffer(self.data + offset, length, 1)
+ *         if ret.bitset == NULL:             # <<<<<<<<<<<<<<
+ *             raise ValueError("rhs is corrupted: Corrupted container dump")
+ *         ret.dump = self
+ */
+  __pyx_t_2 = (__pyx_v_ret->bitset == NULL);
+  if (__pyx_t_2) {
+
+    /* "intbitset.pyx":946
+ *         ret.bitset = intBitSetCreateFromContainerBuffer(self.data + offset, length, 1)
+ *         if ret.bitset == NULL:
+ *             raise ValueError("rhs is corrupted: Corrupted container dump")             # <<<<<<<<<<<<<<
+ *         ret.dump = self
+ *         return ret
+ */
+    __pyx_t_6 = PyObject_Call(__pyx_builtin_ValueError, ((PyObject *)__pyx_k_tuple_71), NULL); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 946; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_Raise(__pyx_t_6, 0, 0);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 946; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    goto __pyx_L7;
+  }
+  __pyx_L7:;
+
+  /* "intbitset.pyx":947
+ *         if ret.bitset == NULL:
+ *             raise ValueError("rhs is corrupted: Corrupted container dump")
+ *         ret.dump = self             # <<<<<<<<<<<<<<
+ *         return ret
+ * 
+ */
+  __Pyx_INCREF(__pyx_v_self);
+  __Pyx_GIVEREF(__pyx_v_self);
+  __Pyx_GOTREF(__pyx_v_ret->dump);
+  __Pyx_DECREF(__pyx_v_ret->dump);
+  __pyx_v_ret->dump = __pyx_v_self;
+
+  /* "intbitset.pyx":948
+ *             raise ValueError("rhs is corrupted: Corrupted container dump")
+ *         ret.dump = self
+ *         return ret             # <<<<<<<<<<<<<<
+ * 
+ * cdef IntBitSet **_get_bitsets(sets) except NULL:
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(((PyObject *)__pyx_v_ret));
+  __pyx_r = ((PyObject *)__pyx_v_ret);
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_AddTraceback("intbitset.intbitset_file.load");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_DECREF((PyObject *)__pyx_v_ret);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "intbitset.pyx":950
+ *         return ret
+ * 
+ * cdef IntBitSet **_get_bitsets(sets) except NULL:             # <<<<<<<<<<<<<<
+ *     """Return the array of the bitsets of the list of intbitsets sets,
+ *     to be freed with PyMem_Free."""
+ */
+
+static  IntBitSet **__pyx_f_9intbitset__get_bitsets(PyObject *__pyx_v_sets) {
+  IntBitSet **__pyx_v_ret;
+  int __pyx_v_i;
+  PyObject *__pyx_v_rhs;
+  IntBitSet **__pyx_r;
+  Py_ssize_t __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  PyObject *__pyx_t_6 = NULL;
+  __Pyx_RefNannySetupContext("_get_bitsets");
+  __pyx_v_rhs = Py_None; __Pyx_INCREF(Py_None);
+
+  /* "intbitset.pyx":955
+ *     cdef IntBitSet **ret
+ *     cdef int i
+ *     for rhs in sets:             # <<<<<<<<<<<<<<
+ *         if not isinstance(rhs, intbitset):
+ *             raise TypeError("intbitset expected, got %s" % type(rhs).__name__)
+ */
+  if (PyList_CheckExact(__pyx_v_sets) || PyTuple_CheckExact(__pyx_v_sets)) {
+    __pyx_t_1 = 0; __pyx_t_2 = __pyx_v_sets; __Pyx_INCREF(__pyx_t_2);
+  } else {
+    __pyx_t_1 = -1; __pyx_t_2 = PyObject_GetIter(__pyx_v_sets); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 955; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+  }
+  for (;;) {
+    if (likely(PyList_CheckExact(__pyx_t_2))) {
+      if (__pyx_t_1 >= PyList_GET_SIZE(__pyx_t_2)) break;
+      __pyx_t_3 = PyList_GET_ITEM(__pyx_t_2, __pyx_t_1); __Pyx_INCREF(__pyx_t_3); __pyx_t_1++;
+    } else if (likely(PyTuple_CheckExact(__pyx_t_2))) {
+      if (__pyx_t_1 >= PyTuple_GET_SIZE(__pyx_t_2)) break;
+      __pyx_t_3 = PyTuple_GET_ITEM(__pyx_t_2, __pyx_t_1); __Pyx_INCREF(__pyx_t_3); __pyx_t_1++;
+    } else {
+      __pyx_t_3 = PyIter_Next(__pyx_t_2);
+      if (!__pyx_t_3) {
+        if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 955; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        break;
+      }
+      __Pyx_GOTREF(__pyx_t_3);
+    }
+    __Pyx_DECREF(__pyx_v_rhs);
+    __pyx_v_rhs = __pyx_t_3;
+    __pyx_t_3 = 0;
+
+    /* "intbitset.pyx":956
+ *     cdef int i
+ *     for rhs in sets:
+ *         if not isinstance(rhs, intbitset):             # <<<<<<<<<<<<<<
+ *             raise TypeError("intbitset expected, got %s" % type(rhs).__name__)
+ *     ret = <IntBitSet **> PyMem_Malloc((len(sets) + 1) * sizeof(IntBitSet *))
+ */
+    __pyx_t_3 = ((PyObject *)((PyObject*)__pyx_ptype_9intbitset_intbitset));
+    __Pyx_INCREF(__pyx_t_3);
+    __pyx_t_4 = __Pyx_TypeCheck(__pyx_v_rhs, __pyx_t_3); 
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_t_5 = (!__pyx_t_4);
+    if (__pyx_t_5) {
+
+      /* "intbitset.pyx":957
+ *     for rhs in sets:
+ *         if not isinstance(rhs, intbitset):
+ *             raise TypeError("intbitset expected, got %s" % type(rhs).__name__)             # <<<<<<<<<<<<<<
+ *     ret = <IntBitSet **> PyMem_Malloc((len(sets) + 1) * sizeof(IntBitSet *))
+ *     if ret == NULL:
+ */
+      __pyx_t_3 = PyObject_GetAttr(((PyObject *)Py_TYPE(__pyx_v_rhs)), __pyx_n_s____name__); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 957; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_6 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_72), __pyx_t_3); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 957; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(((PyObject *)__pyx_t_6));
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 957; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(((PyObject *)__pyx_t_3));
+      PyTuple_SET_ITEM(__pyx_t_3, 0, ((PyObject *)__pyx_t_6));
+      __Pyx_GIVEREF(((PyObject *)__pyx_t_6));
+      __pyx_t_6 = 0;
+      __pyx_t_6 = PyObject_Call(__pyx_builtin_TypeError, ((PyObject *)__pyx_t_3), NULL); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 957; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_6);
+      __Pyx_DECREF(((PyObject *)__pyx_t_3)); __pyx_t_3 = 0;
+      __Pyx_Raise(__pyx_t_6, 0, 0);
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 957; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      goto __pyx_L5;
+    }
+    __pyx_L5:;
+  }
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "intbitset.pyx":958
+ *         if not isinstance(rhs, intbitset):
+ *             raise TypeError("intbitset expected, got %s" % type(rhs).__name__)
+ *     ret = <IntBitSet **> PyMem_Malloc((len(sets) + 1) * sizeof(IntBitSet *))             # <<<<<<<<<<<<<<
+ *     if ret == NULL:
+ *         raise MemoryError()
+ */
+  __pyx_t_2 = __pyx_v_sets;
+  __Pyx_INCREF(__pyx_t_2);
+  __pyx_t_1 = PyObject_Length(__pyx_t_2); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 958; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_v_ret = ((IntBitSet **)PyMem_Malloc(((__pyx_t_1 + 1) * (sizeof(IntBitSet *)))));
+
+  /* "intbitset.pyx":959
+ *             raise TypeError("intbitset expected, got %s" % type(rhs).__name__)
+ *     ret = <IntBitSet **> PyMem_Malloc((len(sets) + 1) * sizeof(IntBitSet *))
+ *     if ret == NULL:             # <<<<<<<<<<<<<<
+ *         raise MemoryError()
+ *     for i from 0 <= i < len(sets):
+ */
+  __pyx_t_5 = (__pyx_v_ret == NULL);
+  if (__pyx_t_5) {
+
+    /* "intbitset.pyx":960
+ *     ret = <IntBitSet **> PyMem_Malloc((len(sets) + 1) * sizeof(IntBitSet *))
+ *     if ret == NULL:
+ *         raise MemoryError()             # <<<<<<<<<<<<<<
+ *     for i from 0 <= i < len(sets):
+ *         ret[i] = (<intbitset> sets[i]).bitset
+ */
+    PyErr_NoMemory(); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 960; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    goto __pyx_L6;
+  }
+  __pyx_L6:;
+
+  /* "intbitset.pyx":961
+ *     if ret == NULL:
+ *         raise MemoryError()
+ *     for i from 0 <= i < len(sets):             # <<<<<<<<<<<<<<
+ *         ret[i] = (<intbitset> sets[i]).bitset
+ *     return ret
+ */
+  __pyx_t_2 = __pyx_v_sets;
+  __Pyx_INCREF(__pyx_t_2);
+  __pyx_t_1 = PyObject_Length(__pyx_t_2); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 961; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  for (__pyx_v_i = 0; __pyx_v_i < __pyx_t_1; __pyx_v_i++) {
+
+    /* "intbitset.pyx":962
+ *         raise MemoryError()
+ *     for i from 0 <= i < len(sets):
+ *         ret[i] = (<intbitset> sets[i]).bitset             # <<<<<<<<<<<<<<
+ *     return ret
+ * 
+ */
+    __pyx_t_2 = __Pyx_GetItemInt(__pyx_v_sets, __pyx_v_i, sizeof(int), PyInt_FromLong); if (!__pyx_t_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 962; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    (__pyx_v_ret[__pyx_v_i]) = ((struct __pyx_obj_9intbitset_intbitset *)__pyx_t_2)->bitset;
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  }
+
+  /* "intbitset.pyx":963
+ *     for i from 0 <= i < len(sets):
+ *         ret[i] = (<intbitset> sets[i]).bitset
+ *     return ret             # <<<<<<<<<<<<<<
+ * 
+ * def union_many(sets):
+ */
+  __pyx_r = __pyx_v_ret;
+  goto __pyx_L0;
+
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_AddTraceback("intbitset._get_bitsets");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_rhs);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "intbitset.pyx":965
+ *     return ret
+ * 
+ * def union_many(sets):             # <<<<<<<<<<<<<<
+ *     """Return the union of the intbitsets of the iterable sets as a new
+ *     intbitset, computed in a single pass over the elements of up to
+ */
+
+static PyObject *__pyx_pf_9intbitset_union_many(PyObject *__pyx_self, PyObject *__pyx_v_sets); /*proto*/
+static char __pyx_doc_9intbitset_union_many[] = "Return the union of the intbitsets of the iterable sets as a new\n    intbitset, computed in a single pass over the elements of up to\n    _MANY_BATCH sets at a time rather than one pair of sets at a time.\n    The iterable is consumed batch by batch, so that no more than\n    _MANY_BATCH of its sets need to be held in memory at once.";
+static PyMethodDef __pyx_mdef_9intbitset_union_many = {__Pyx_NAMESTR("union_many"), (PyCFunction)__pyx_pf_9intbitset_union_many, METH_O, __Pyx_DOCSTR(__pyx_doc_9intbitset_union_many)};
+static PyObject *__pyx_pf_9intbitset_union_many(PyObject *__pyx_self, PyObject *__pyx_v_sets) {
+  IntBitSet **__pyx_v_bitsets;
+  PyObject *__pyx_v_ret;
+  PyObject *__pyx_v_batch;
+  PyObject *__pyx_r = NULL;
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  IntBitSet **__pyx_t_7;
+  Py_ssize_t __pyx_t_8;
+  __Pyx_RefNannySetupContext("union_many");
+  __pyx_self = __pyx_self;
+  __Pyx_INCREF(__pyx_v_sets);
+  __pyx_v_ret = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_batch = Py_None; __Pyx_INCREF(Py_None);
+
+  /* "intbitset.pyx":972
+ *     _MANY_BATCH of its sets need to be held in memory at once."""
+ *     cdef IntBitSet **bitsets
+ *     sets = iter(sets)             # <<<<<<<<<<<<<<
+ *     ret = None
+ *     batch = list(islice(sets, _MANY_BATCH))
+ */
+  __pyx_t_1 = __pyx_v_sets;
+  __Pyx_INCREF(__pyx_t_1);
+  __pyx_t_2 = PyObject_GetIter(__pyx_t_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 972; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_v_sets);
+  __pyx_v_sets = __pyx_t_2;
+  __pyx_t_2 = 0;
+
+  /* "intbitset.pyx":973
+ *     cdef IntBitSet **bitsets
+ *     sets = iter(sets)
+ *     ret = None             # <<<<<<<<<<<<<<
+ *     batch = list(islice(sets, _MANY_BATCH))
+ *     while ret is None or batch:
+ */
+  __Pyx_INCREF(Py_None);
+  __Pyx_DECREF(__pyx_v_ret);
+  __pyx_v_ret = Py_None;
+
+  /* "intbitset.pyx":974
+ *     sets = iter(sets)
+ *     ret = None
+ *     batch = list(islice(sets, _MANY_BATCH))             # <<<<<<<<<<<<<<
+ *     while ret is None or batch:
+ *         if ret is not None:
+ */
+  __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s__islice); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 974; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s___MANY_BATCH); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 974; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_3 = PyTuple_New(2); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 974; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_t_3));
+  __Pyx_INCREF(__pyx_v_sets);
+  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_v_sets);
+  __Pyx_GIVEREF(__pyx_v_sets);
+  PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_1);
+  __pyx_t_1 = 0;
+  __pyx_t_1 = PyObject_Call(__pyx_t_2, ((PyObject *)__pyx_t_3), NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 974; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(((PyObject *)__pyx_t_3)); __pyx_t_3 = 0;
+  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 974; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_t_3));
+  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_1);
+  __pyx_t_1 = 0;
+  __pyx_t_1 = PyObject_Call(((PyObject *)((PyObject*)(&PyList_Type))), ((PyObject *)__pyx_t_3), NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 974; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(((PyObject *)__pyx_t_3)); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_v_batch);
+  __pyx_v_batch = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "intbitset.pyx":975
+ *     ret = None
+ *     batch = list(islice(sets, _MANY_BATCH))
+ *     while ret is None or batch:             # <<<<<<<<<<<<<<
+ *         if ret is not None:
+ *             batch.append(ret)
+ */
+  while (1) {
+    __pyx_t_4 = (__pyx_v_ret == Py_None);
+    if (!__pyx_t_4) {
+      __pyx_t_5 = __Pyx_PyObject_IsTrue(__pyx_v_batch); if (unlikely(__pyx_t_5 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 975; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_6 = __pyx_t_5;
+    } else {
+      __pyx_t_6 = __pyx_t_4;
+    }
+    if (!__pyx_t_6) break;
+
+    /* "intbitset.pyx":976
+ *     batch = list(islice(sets, _MANY_BATCH))
+ *     while ret is None or batch:
+ *         if ret is not None:             # <<<<<<<<<<<<<<
+ *             batch.append(ret)
+ *         bitsets = _get_bitsets(batch)
+ */
+    __pyx_t_6 = (__pyx_v_ret != Py_None);
+    if (__pyx_t_6) {
+
+      /* "intbitset.pyx":977
+ *     while ret is None or batch:
+ *         if ret is not None:
+ *             batch.append(ret)             # <<<<<<<<<<<<<<
+ *         bitsets = _get_bitsets(batch)
+ *         ret = intbitset(no_allocate=1)
+ */
+      __pyx_t_1 = __Pyx_PyObject_Append(__pyx_v_batch, __pyx_v_ret); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 977; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      goto __pyx_L7;
+    }
+    __pyx_L7:;
+
+    /* "intbitset.pyx":978
+ *         if ret is not None:
+ *             batch.append(ret)
+ *         bitsets = _get_bitsets(batch)             # <<<<<<<<<<<<<<
+ *         ret = intbitset(no_allocate=1)
+ *         (<intbitset>ret).bitset = intBitSetUnionMany(bitsets, len(batch))
+ */
+    __pyx_t_7 = __pyx_f_9intbitset__get_bitsets(__pyx_v_batch); if (unlikely(__pyx_t_7 == NULL)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 978; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_v_bitsets = __pyx_t_7;
+
+    /* "intbitset.pyx":979
+ *             batch.append(ret)
+ *         bitsets = _get_bitsets(batch)
+ *         ret = intbitset(no_allocate=1)             # <<<<<<<<<<<<<<
+ *         (<intbitset>ret).bitset = intBitSetUnionMany(bitsets, len(batch))
+ *         PyMem_Free(bitsets)
+ */
+    __pyx_t_1 = PyDict_New(); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 979; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(((PyObject *)__pyx_t_1));
+    if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__no_allocate), __pyx_int_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 979; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = PyEval_CallObjectWithKeywords(((PyObject *)((PyObject*)__pyx_ptype_9intbitset_intbitset)), ((PyObject *)__pyx_empty_tuple), ((PyObject *)__pyx_t_1)); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 979; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(((PyObject *)__pyx_t_1)); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_v_ret);
+    __pyx_v_ret = __pyx_t_3;
+    __pyx_t_3 = 0;
+
+    /* "intbitset.pyx":980
+ *         bitsets = _get_bitsets(batch)
+ *         ret = intbitset(no_allocate=1)
+ *         (<intbitset>ret).bitset = intBitSetUnionMany(bitsets, len(batch))             # <<<<<<<<<<<<<<
+ *         PyMem_Free(bitsets)
+ *         batch = None
+ */
+    __pyx_t_8 = PyObject_Length(__pyx_v_batch); if (unlikely(__pyx_t_8 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 980; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    ((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_ret)->bitset = intBitSetUnionMany(__pyx_v_bitsets, __pyx_t_8);
+
+    /* "intbitset.pyx":981
+ *         ret = intbitset(no_allocate=1)
+ *         (<intbitset>ret).bitset = intBitSetUnionMany(bitsets, len(batch))
+ *         PyMem_Free(bitsets)             # <<<<<<<<<<<<<<
+ *         batch = None
+ *         batch = list(islice(sets, _MANY_BATCH))
+ */
+    PyMem_Free(__pyx_v_bitsets);
+
+    /* "intbitset.pyx":982
+ *         (<intbitset>ret).bitset = intBitSetUnionMany(bitsets, len(batch))
+ *         PyMem_Free(bitsets)
+ *         batch = None             # <<<<<<<<<<<<<<
+ *         batch = list(islice(sets, _MANY_BATCH))
+ *     return ret
+ */
+    __Pyx_INCREF(Py_None);
+    __Pyx_DECREF(__pyx_v_batch);
+    __pyx_v_batch = Py_None;
+
+    /* "intbitset.pyx":983
+ *         PyMem_Free(bitsets)
+ *         batch = None
+ *         batch = list(islice(sets, _MANY_BATCH))             # <<<<<<<<<<<<<<
+ *     return ret
+ * 
+ */
+    __pyx_t_3 = __Pyx_GetName(__pyx_m, __pyx_n_s__islice); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 983; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s___MANY_BATCH); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 983; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 983; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(((PyObject *)__pyx_t_2));
+    __Pyx_INCREF(__pyx_v_sets);
+    PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v_sets);
+    __Pyx_GIVEREF(__pyx_v_sets);
+    PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_t_1);
+    __Pyx_GIVEREF(__pyx_t_1);
+    __pyx_t_1 = 0;
+    __pyx_t_1 = PyObject_Call(__pyx_t_3, ((PyObject *)__pyx_t_2), NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 983; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(((PyObject *)__pyx_t_2)); __pyx_t_2 = 0;
+    __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 983; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(((PyObject *)__pyx_t_2));
+    PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_1);
+    __Pyx_GIVEREF(__pyx_t_1);
+    __pyx_t_1 = 0;
+    __pyx_t_1 = PyObject_Call(((PyObject *)((PyObject*)(&PyList_Type))), ((PyObject *)__pyx_t_2), NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 983; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(((PyObject *)__pyx_t_2)); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_v_batch);
+    __pyx_v_batch = __pyx_t_1;
+    __pyx_t_1 = 0;
+  }
+
+  /* "intbitset.pyx":984
+ *         batch = None
+ *         batch = list(islice(sets, _MANY_BATCH))
+ *     return ret             # <<<<<<<<<<<<<<
+ * 
+ * def intersection_many(sets):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_ret);
+  __pyx_r = __pyx_v_ret;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("intbitset.union_many");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_ret);
+  __Pyx_DECREF(__pyx_v_batch);
+  __Pyx_DECREF(__pyx_v_sets);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "intbitset.pyx":986
+ *     return ret
+ * 
+ * def intersection_many(sets):             # <<<<<<<<<<<<<<
+ *     """Return the intersection of the intbitsets of the iterable sets as
+ *     a new intbitset, computed in a single pass over the elements of up to
+ */
+
+static PyObject *__pyx_pf_9intbitset_1intersection_many(PyObject *__pyx_self, PyObject *__pyx_v_sets); /*proto*/
+static char __pyx_doc_9intbitset_1intersection_many[] = "Return the intersection of the intbitsets of the iterable sets as\n    a new intbitset, computed in a single pass over the elements of up to\n    _MANY_BATCH sets at a time rather than one pair of sets at a time.\n    The iterable is consumed batch by batch, as by union_many().  The\n    intersection of no set is empty.";
+static PyMethodDef __pyx_mdef_9intbitset_1intersection_many = {__Pyx_NAMESTR("intersection_many"), (PyCFunction)__pyx_pf_9intbitset_1intersection_many, METH_O, __Pyx_DOCSTR(__pyx_doc_9intbitset_1intersection_many)};
+static PyObject *__pyx_pf_9intbitset_1intersection_many(PyObject *__pyx_self, PyObject *__pyx_v_sets) {
+  IntBitSet **__pyx_v_bitsets;
+  PyObject *__pyx_v_ret;
+  PyObject *__pyx_v_batch;
+  PyObject *__pyx_r = NULL;
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  IntBitSet **__pyx_t_7;
+  Py_ssize_t __pyx_t_8;
+  __Pyx_RefNannySetupContext("intersection_many");
+  __pyx_self = __pyx_self;
+  __Pyx_INCREF(__pyx_v_sets);
+  __pyx_v_ret = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_batch = Py_None; __Pyx_INCREF(Py_None);
+
+  /* "intbitset.pyx":993
+ *     intersection of no set is empty."""
+ *     cdef IntBitSet **bitsets
+ *     sets = iter(sets)             # <<<<<<<<<<<<<<
+ *     ret = None
+ *     batch = list(islice(sets, _MANY_BATCH))
+ */
+  __pyx_t_1 = __pyx_v_sets;
+  __Pyx_INCREF(__pyx_t_1);
+  __pyx_t_2 = PyObject_GetIter(__pyx_t_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 993; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_v_sets);
+  __pyx_v_sets = __pyx_t_2;
+  __pyx_t_2 = 0;
+
+  /* "intbitset.pyx":994
+ *     cdef IntBitSet **bitsets
+ *     sets = iter(sets)
+ *     ret = None             # <<<<<<<<<<<<<<
+ *     batch = list(islice(sets, _MANY_BATCH))
+ *     while ret is None or batch:
+ */
+  __Pyx_INCREF(Py_None);
+  __Pyx_DECREF(__pyx_v_ret);
+  __pyx_v_ret = Py_None;
+
+  /* "intbitset.pyx":995
+ *     sets = iter(sets)
+ *     ret = None
+ *     batch = list(islice(sets, _MANY_BATCH))             # <<<<<<<<<<<<<<
+ *     while ret is None or batch:
+ *         if ret is not None:
+ */
+  __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s__islice); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 995; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s___MANY_BATCH); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 995; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_3 = PyTuple_New(2); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 995; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_t_3));
+  __Pyx_INCREF(__pyx_v_sets);
+  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_v_sets);
+  __Pyx_GIVEREF(__pyx_v_sets);
+  PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_1);
+  __pyx_t_1 = 0;
+  __pyx_t_1 = PyObject_Call(__pyx_t_2, ((PyObject *)__pyx_t_3), NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 995; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(((PyObject *)__pyx_t_3)); __pyx_t_3 = 0;
+  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 995; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_t_3));
+  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_1);
+  __pyx_t_1 = 0;
+  __pyx_t_1 = PyObject_Call(((PyObject *)((PyObject*)(&PyList_Type))), ((PyObject *)__pyx_t_3), NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 995; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(((PyObject *)__pyx_t_3)); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_v_batch);
+  __pyx_v_batch = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "intbitset.pyx":996
+ *     ret = None
+ *     batch = list(islice(sets, _MANY_BATCH))
+ *     while ret is None or batch:             # <<<<<<<<<<<<<<
+ *         if ret is not None:
+ *             batch.append(ret)
+ */
+  while (1) {
+    __pyx_t_4 = (__pyx_v_ret == Py_None);
+    if (!__pyx_t_4) {
+      __pyx_t_5 = __Pyx_PyObject_IsTrue(__pyx_v_batch); if (unlikely(__pyx_t_5 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 996; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_6 = __pyx_t_5;
+    } else {
+      __pyx_t_6 = __pyx_t_4;
+    }
+    if (!__pyx_t_6) break;
+
+    /* "intbitset.pyx":997
+ *     batch = list(islice(sets, _MANY_BATCH))
+ *     while ret is None or batch:
+ *         if ret is not None:             # <<<<<<<<<<<<<<
+ *             batch.append(ret)
+ *         bitsets = _get_bitsets(batch)
+ */
+    __pyx_t_6 = (__pyx_v_ret != Py_None);
+    if (__pyx_t_6) {
+
+      /* "intbitset.pyx":998
+ *     while ret is None or batch:
+ *         if ret is not None:
+ *             batch.append(ret)             # <<<<<<<<<<<<<<
+ *         bitsets = _get_bitsets(batch)
+ *         ret = intbitset(no_allocate=1)
+ */
+      __pyx_t_1 = __Pyx_PyObject_Append(__pyx_v_batch, __pyx_v_ret); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 998; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      goto __pyx_L7;
+    }
+    __pyx_L7:;
+
+    /* "intbitset.pyx":999
+ *         if ret is not None:
+ *             batch.append(ret)
+ *         bitsets = _get_bitsets(batch)             # <<<<<<<<<<<<<<
+ *         ret = intbitset(no_allocate=1)
+ *         (<intbitset>ret).bitset = intBitSetIntersectionMany(bitsets, len(batch))
+ */
+    __pyx_t_7 = __pyx_f_9intbitset__get_bitsets(__pyx_v_batch); if (unlikely(__pyx_t_7 == NULL)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 999; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_v_bitsets = __pyx_t_7;
+
+    /* "intbitset.pyx":1000
+ *             batch.append(ret)
+ *         bitsets = _get_bitsets(batch)
+ *         ret = intbitset(no_allocate=1)             # <<<<<<<<<<<<<<
+ *         (<intbitset>ret).bitset = intBitSetIntersectionMany(bitsets, len(batch))
+ *         PyMem_Free(bitsets)
+ */
+    __pyx_t_1 = PyDict_New(); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1000; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(((PyObject *)__pyx_t_1));
+    if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__no_allocate), __pyx_int_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1000; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = PyEval_CallObjectWithKeywords(((PyObject *)((PyObject*)__pyx_ptype_9intbitset_intbitset)), ((PyObject *)__pyx_empty_tuple), ((PyObject *)__pyx_t_1)); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1000; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(((PyObject *)__pyx_t_1)); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_v_ret);
+    __pyx_v_ret = __pyx_t_3;
+    __pyx_t_3 = 0;
+
+    /* "intbitset.pyx":1001
+ *         bitsets = _get_bitsets(batch)
+ *         ret = intbitset(no_allocate=1)
+ *         (<intbitset>ret).bitset = intBitSetIntersectionMany(bitsets, len(batch))             # <<<<<<<<<<<<<<
+ *         PyMem_Free(bitsets)
+ *         batch = None
+ */
+    __pyx_t_8 = PyObject_Length(__pyx_v_batch); if (unlikely(__pyx_t_8 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1001; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    ((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_ret)->bitset = intBitSetIntersectionMany(__pyx_v_bitsets, __pyx_t_8);
+
+    /* "intbitset.pyx":1002
+ *         ret = intbitset(no_allocate=1)
+ *         (<intbitset>ret).bitset = intBitSetIntersectionMany(bitsets, len(batch))
+ *         PyMem_Free(bitsets)             # <<<<<<<<<<<<<<
+ *         batch = None
+ *         batch = list(islice(sets, _MANY_BATCH))
+ */
+    PyMem_Free(__pyx_v_bitsets);
+
+    /* "intbitset.pyx":1003
+ *         (<intbitset>ret).bitset = intBitSetIntersectionMany(bitsets, len(batch))
+ *         PyMem_Free(bitsets)
+ *         batch = None             # <<<<<<<<<<<<<<
+ *         batch = list(islice(sets, _MANY_BATCH))
+ *     return ret
+ */
+    __Pyx_INCREF(Py_None);
+    __Pyx_DECREF(__pyx_v_batch);
+    __pyx_v_batch = Py_None;
+
+    /* "intbitset.pyx":1004
+ *         PyMem_Free(bitsets)
+ *         batch = None
+ *         batch = list(islice(sets, _MANY_BATCH))             # <<<<<<<<<<<<<<
+ *     return ret
+ * 
+ */
+    __pyx_t_3 = __Pyx_GetName(__pyx_m, __pyx_n_s__islice); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1004; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s___MANY_BATCH); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1004; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1004; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(((PyObject *)__pyx_t_2));
+    __Pyx_INCREF(__pyx_v_sets);
+    PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v_sets);
+    __Pyx_GIVEREF(__pyx_v_sets);
+    PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_t_1);
+    __Pyx_GIVEREF(__pyx_t_1);
+    __pyx_t_1 = 0;
+    __pyx_t_1 = PyObject_Call(__pyx_t_3, ((PyObject *)__pyx_t_2), NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1004; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(((PyObject *)__pyx_t_2)); __pyx_t_2 = 0;
+    __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1004; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(((PyObject *)__pyx_t_2));
+    PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_1);
+    __Pyx_GIVEREF(__pyx_t_1);
+    __pyx_t_1 = 0;
+    __pyx_t_1 = PyObject_Call(((PyObject *)((PyObject*)(&PyList_Type))), ((PyObject *)__pyx_t_2), NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1004; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(((PyObject *)__pyx_t_2)); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_v_batch);
+    __pyx_v_batch = __pyx_t_1;
+    __pyx_t_1 = 0;
+  }
+
+  /* "intbitset.pyx":1005
+ *         batch = None
+ *         batch = list(islice(sets, _MANY_BATCH))
+ *     return ret             # <<<<<<<<<<<<<<
+ * 
+ * def count_many(sets, weights=None):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_ret);
+  __pyx_r = __pyx_v_ret;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("intbitset.intersection_many");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_ret);
+  __Pyx_DECREF(__pyx_v_batch);
+  __Pyx_DECREF(__pyx_v_sets);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "intbitset.pyx":1007
+ *     return ret
+ * 
+ * def count_many(sets, weights=None):             # <<<<<<<<<<<<<<
+ *     """Return a tuple (union, counts), where union is the union of the
+ *     finite intbitsets of the iterable sets and counts the list of the
+ */
+
+static PyObject *__pyx_pf_9intbitset_2count_many(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_9intbitset_2count_many[] = "Return a tuple (union, counts), where union is the union of the\n    finite intbitsets of the iterable sets and counts the list of the\n    number of sets containing each element of union, in increasing order\n    of the elements.  If weights, an iterable of numbers as long as sets,\n    is given, counts holds for each element the sum of the weights of the\n    sets containing it instead.  The iterables are consumed batch by\n    batch, as by union_many().";
+static PyMethodDef __pyx_mdef_9intbitset_2count_many = {__Pyx_NAMESTR("count_many"), (PyCFunction)__pyx_pf_9intbitset_2count_many, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_9intbitset_2count_many)};
+static PyObject *__pyx_pf_9intbitset_2count_many(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_sets = 0;
+  PyObject *__pyx_v_weights = 0;
+  IntBitSet **__pyx_v_bitsets;
+  double *__pyx_v_cweights;
+  double *__pyx_v_counts;
+  double *__pyx_v_batch_counts;
+  int __pyx_v_i;
+  int __pyx_v_n;
+  int __pyx_v_tot;
+  PyObject *__pyx_v_ret;
+  PyObject *__pyx_v_nsets;
+  PyObject *__pyx_v_batch;
+  PyObject *__pyx_v_rhs;
+  PyObject *__pyx_v_batch_weights;
+  PyObject *__pyx_v_nweights;
+  PyObject *__pyx_v_batch_ret;
+  PyObject *__pyx_v_weight;
+  PyObject *__pyx_v_ret_counts;
+  PyObject *__pyx_r = NULL;
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  Py_ssize_t __pyx_t_7;
+  PyObject *__pyx_t_8 = NULL;
+  double __pyx_t_9;
+  IntBitSet **__pyx_t_10;
+  int __pyx_t_11;
+  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__sets,&__pyx_n_s__weights,0};
+  __Pyx_RefNannySetupContext("count_many");
+  __pyx_self = __pyx_self;
+  if (unlikely(__pyx_kwds)) {
+    Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
+    PyObject* values[2] = {0,0};
+    values[1] = ((PyObject *)Py_None);
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      case  0: break;
+      default: goto __pyx_L5_argtuple_error;
+    }
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  0:
+      values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__sets);
+      if (likely(values[0])) kw_args--;
+      else goto __pyx_L5_argtuple_error;
+      case  1:
+      if (kw_args > 0) {
+        PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s__weights);
+        if (value) { values[1] = value; kw_args--; }
+      }
+    }
+    if (unlikely(kw_args > 0)) {
+      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "count_many") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1007; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    }
+    __pyx_v_sets = values[0];
+    __pyx_v_weights = values[1];
+  } else {
+    __pyx_v_weights = ((PyObject *)Py_None);
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  2: __pyx_v_weights = PyTuple_GET_ITEM(__pyx_args, 1);
+      case  1: __pyx_v_sets = PyTuple_GET_ITEM(__pyx_args, 0);
+      break;
+      default: goto __pyx_L5_argtuple_error;
+    }
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("count_many", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1007; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("intbitset.count_many");
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __Pyx_INCREF(__pyx_v_sets);
+  __Pyx_INCREF(__pyx_v_weights);
+  __pyx_v_ret = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_nsets = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_batch = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_rhs = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_batch_weights = ((PyObject*)Py_None); __Pyx_INCREF(Py_None);
+  __pyx_v_nweights = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_batch_ret = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_weight = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_ret_counts = ((PyObject*)Py_None); __Pyx_INCREF(Py_None);
+
+  /* "intbitset.pyx":1022
+ *     cdef int n
+ *     cdef int tot
+ *     sets = iter(sets)             # <<<<<<<<<<<<<<
+ *     if weights is not None:
+ *         weights = iter(weights)
+ */
+  __pyx_t_1 = __pyx_v_sets;
+  __Pyx_INCREF(__pyx_t_1);
+  __pyx_t_2 = PyObject_GetIter(__pyx_t_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1022; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_v_sets);
+  __pyx_v_sets = __pyx_t_2;
+  __pyx_t_2 = 0;
+
+  /* "intbitset.pyx":1023
+ *     cdef int tot
+ *     sets = iter(sets)
+ *     if weights is not None:             # <<<<<<<<<<<<<<
+ *         weights = iter(weights)
+ *     ret = None
+ */
+  __pyx_t_3 = (__pyx_v_weights != Py_None);
+  if (__pyx_t_3) {
+
+    /* "intbitset.pyx":1024
+ *     sets = iter(sets)
+ *     if weights is not None:
+ *         weights = iter(weights)             # <<<<<<<<<<<<<<
+ *     ret = None
+ *     counts = NULL
+ */
+    __pyx_t_2 = __pyx_v_weights;
+    __Pyx_INCREF(__pyx_t_2);
+    __pyx_t_1 = PyObject_GetIter(__pyx_t_2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1024; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_v_weights);
+    __pyx_v_weights = __pyx_t_1;
+    __pyx_t_1 = 0;
+    goto __pyx_L6;
+  }
+  __pyx_L6:;
+
+  /* "intbitset.pyx":1025
+ *     if weights is not None:
+ *         weights = iter(weights)
+ *     ret = None             # <<<<<<<<<<<<<<
+ *     counts = NULL
+ *     nsets = 0
+ */
+  __Pyx_INCREF(Py_None);
+  __Pyx_DECREF(__pyx_v_ret);
+  __pyx_v_ret = Py_None;
+
+  /* "intbitset.pyx":1026
+ *         weights = iter(weights)
+ *     ret = None
+ *     counts = NULL             # <<<<<<<<<<<<<<
+ *     nsets = 0
+ *     try:
+ */
+  __pyx_v_counts = NULL;
+
+  /* "intbitset.pyx":1027
+ *     ret = None
+ *     counts = NULL
+ *     nsets = 0             # <<<<<<<<<<<<<<
+ *     try:
+ *         batch = list(islice(sets, _MANY_BATCH))
+ */
+  __Pyx_INCREF(__pyx_int_0);
+  __Pyx_DECREF(__pyx_v_nsets);
+  __pyx_v_nsets = __pyx_int_0;
+
+  /* "intbitset.pyx":1028
+ *     counts = NULL
+ *     nsets = 0
+ *     try:             # <<<<<<<<<<<<<<
+ *         batch = list(islice(sets, _MANY_BATCH))
+ *         while ret is None or batch:
+ */
+  /*try:*/ {
+
+    /* "intbitset.pyx":1029
+ *     nsets = 0
+ *     try:
+ *         batch = list(islice(sets, _MANY_BATCH))             # <<<<<<<<<<<<<<
+ *         while ret is None or batch:
+ *             nsets += len(batch)
+ */
+    __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__islice); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1029; __pyx_clineno = __LINE__; goto __pyx_L8;}
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s___MANY_BATCH); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1029; __pyx_clineno = __LINE__; goto __pyx_L8;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_4 = PyTuple_New(2); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1029; __pyx_clineno = __LINE__; goto __pyx_L8;}
+    __Pyx_GOTREF(((PyObject *)__pyx_t_4));
+    __Pyx_INCREF(__pyx_v_sets);
+    PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_v_sets);
+    __Pyx_GIVEREF(__pyx_v_sets);
+    PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_t_2);
+    __Pyx_GIVEREF(__pyx_t_2);
+    __pyx_t_2 = 0;
+    __pyx_t_2 = PyObject_Call(__pyx_t_1, ((PyObject *)__pyx_t_4), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1029; __pyx_clineno = __LINE__; goto __pyx_L8;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(((PyObject *)__pyx_t_4)); __pyx_t_4 = 0;
+    __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1029; __pyx_clineno = __LINE__; goto __pyx_L8;}
+    __Pyx_GOTREF(((PyObject *)__pyx_t_4));
+    PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_2);
+    __Pyx_GIVEREF(__pyx_t_2);
+    __pyx_t_2 = 0;
+    __pyx_t_2 = PyObject_Call(((PyObject *)((PyObject*)(&PyList_Type))), ((PyObject *)__pyx_t_4), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1029; __pyx_clineno = __LINE__; goto __pyx_L8;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(((PyObject *)__pyx_t_4)); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_v_batch);
+    __pyx_v_batch = __pyx_t_2;
+    __pyx_t_2 = 0;
+
+    /* "intbitset.pyx":1030
+ *     try:
+ *         batch = list(islice(sets, _MANY_BATCH))
+ *         while ret is None or batch:             # <<<<<<<<<<<<<<
+ *             nsets += len(batch)
+ *             for rhs in batch:
+ */
+    while (1) {
+      __pyx_t_3 = (__pyx_v_ret == Py_None);
+      if (!__pyx_t_3) {
+        __pyx_t_5 = __Pyx_PyObject_IsTrue(__pyx_v_batch); if (unlikely(__pyx_t_5 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1030; __pyx_clineno = __LINE__; goto __pyx_L8;}
+        __pyx_t_6 = __pyx_t_5;
+      } else {
+        __pyx_t_6 = __pyx_t_3;
+      }
+      if (!__pyx_t_6) break;
+
+      /* "intbitset.pyx":1031
+ *         batch = list(islice(sets, _MANY_BATCH))
+ *         while ret is None or batch:
+ *             nsets += len(batch)             # <<<<<<<<<<<<<<
+ *             for rhs in batch:
+ *                 if isinstance(rhs, intbitset) and (<intbitset>rhs).bitset.trailing_bits:
+ */
+      __pyx_t_7 = PyObject_Length(__pyx_v_batch); if (unlikely(__pyx_t_7 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1031; __pyx_clineno = __LINE__; goto __pyx_L8;}
+      __pyx_t_2 = PyInt_FromSsize_t(__pyx_t_7); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1031; __pyx_clineno = __LINE__; goto __pyx_L8;}
+      __Pyx_GOTREF(__pyx_t_2);
+      __pyx_t_4 = PyNumber_InPlaceAdd(__pyx_v_nsets, __pyx_t_2); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1031; __pyx_clineno = __LINE__; goto __pyx_L8;}
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __Pyx_DECREF(__pyx_v_nsets);
+      __pyx_v_nsets = __pyx_t_4;
+      __pyx_t_4 = 0;
+
+      /* "intbitset.pyx":1032
+ *         while ret is None or batch:
+ *             nsets += len(batch)
+ *             for rhs in batch:             # <<<<<<<<<<<<<<
+ *                 if isinstance(rhs, intbitset) and (<intbitset>rhs).bitset.trailing_bits:
+ *                     raise OverflowError("It's impossible to count the elements of an infinite set")
+ */
+      if (PyList_CheckExact(__pyx_v_batch) || PyTuple_CheckExact(__pyx_v_batch)) {
+        __pyx_t_7 = 0; __pyx_t_4 = __pyx_v_batch; __Pyx_INCREF(__pyx_t_4);
+      } else {
+        __pyx_t_7 = -1; __pyx_t_4 = PyObject_GetIter(__pyx_v_batch); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1032; __pyx_clineno = __LINE__; goto __pyx_L8;}
+        __Pyx_GOTREF(__pyx_t_4);
+      }
+      for (;;) {
+        if (likely(PyList_CheckExact(__pyx_t_4))) {
+          if (__pyx_t_7 >= PyList_GET_SIZE(__pyx_t_4)) break;
+          __pyx_t_2 = PyList_GET_ITEM(__pyx_t_4, __pyx_t_7); __Pyx_INCREF(__pyx_t_2); __pyx_t_7++;
+        } else if (likely(PyTuple_CheckExact(__pyx_t_4))) {
+          if (__pyx_t_7 >= PyTuple_GET_SIZE(__pyx_t_4)) break;
+          __pyx_t_2 = PyTuple_GET_ITEM(__pyx_t_4, __pyx_t_7); __Pyx_INCREF(__pyx_t_2); __pyx_t_7++;
+        } else {
+          __pyx_t_2 = PyIter_Next(__pyx_t_4);
+          if (!__pyx_t_2) {
+            if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1032; __pyx_clineno = __LINE__; goto __pyx_L8;}
+            break;
+          }
+          __Pyx_GOTREF(__pyx_t_2);
+        }
+        __Pyx_DECREF(__pyx_v_rhs);
+        __pyx_v_rhs = __pyx_t_2;
+        __pyx_t_2 = 0;
+
+        /* "intbitset.pyx":1033
+ *             nsets += len(batch)
+ *             for rhs in batch:
+ *                 if isinstance(rhs, intbitset) and (<intbitset>rhs).bitset.trailing_bits:             # <<<<<<<<<<<<<<
+ *                     raise OverflowError("It's impossible to count the elements of an infinite set")
+ *             n = len(batch)
+ */
+        __pyx_t_2 = ((PyObject *)((PyObject*)__pyx_ptype_9intbitset_intbitset));
+        __Pyx_INCREF(__pyx_t_2);
+        __pyx_t_6 = __Pyx_TypeCheck(__pyx_v_rhs, __pyx_t_2); 
+        __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+        if (__pyx_t_6) {
+          __pyx_t_3 = ((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_rhs)->bitset->trailing_bits;
+        } else {
+          __pyx_t_3 = __pyx_t_6;
+        }
+        if (__pyx_t_3) {
+
+          /* "intbitset.pyx":1034
+ *             for rhs in batch:
+ *                 if isinstance(rhs, intbitset) and (<intbitset>rhs).bitset.trailing_bits:
+ *                     raise OverflowError("It's impossible to count the elements of an infinite set")             # <<<<<<<<<<<<<<
+ *             n = len(batch)
+ *             if weights is not None:
+ */
+          __pyx_t_2 = PyObject_Call(__pyx_builtin_OverflowError, ((PyObject *)__pyx_k_tuple_74), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1034; __pyx_clineno = __LINE__; goto __pyx_L8;}
+          __Pyx_GOTREF(__pyx_t_2);
+          __Pyx_Raise(__pyx_t_2, 0, 0);
+          __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+          {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1034; __pyx_clineno = __LINE__; goto __pyx_L8;}
+          goto __pyx_L14;
+        }
+        __pyx_L14:;
+      }
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+      /* "intbitset.pyx":1035
+ *                 if isinstance(rhs, intbitset) and (<intbitset>rhs).bitset.trailing_bits:
+ *                     raise OverflowError("It's impossible to count the elements of an infinite set")
+ *             n = len(batch)             # <<<<<<<<<<<<<<
+ *             if weights is not None:
+ *                 batch_weights = [float(weight) for weight in islice(weights, n)]
+ */
+      __pyx_t_7 = PyObject_Length(__pyx_v_batch); if (unlikely(__pyx_t_7 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1035; __pyx_clineno = __LINE__; goto __pyx_L8;}
+      __pyx_v_n = __pyx_t_7;
+
+      /* "intbitset.pyx":1036
+ *                     raise OverflowError("It's impossible to count the elements of an infinite set")
+ *             n = len(batch)
+ *             if weights is not None:             # <<<<<<<<<<<<<<
+ *                 batch_weights = [float(weight) for weight in islice(weights, n)]
+ *                 if len(batch_weights) != n:
+ */
+      __pyx_t_3 = (__pyx_v_weights != Py_None);
+      if (__pyx_t_3) {
+
+        /* "intbitset.pyx":1037
+ *             n = len(batch)
+ *             if weights is not None:
+ *                 batch_weights = [float(weight) for weight in islice(weights, n)]             # <<<<<<<<<<<<<<
+ *                 if len(batch_weights) != n:
+ *                     nweights = nsets - n + len(batch_weights)
+ */
+        __pyx_t_4 = PyList_New(0); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1037; __pyx_clineno = __LINE__; goto __pyx_L8;}
+        __Pyx_GOTREF(((PyObject *)__pyx_t_4));
+        __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s__islice); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1037; __pyx_clineno = __LINE__; goto __pyx_L8;}
+        __Pyx_GOTREF(__pyx_t_2);
+        __pyx_t_1 = PyInt_FromLong(__pyx_v_n); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1037; __pyx_clineno = __LINE__; goto __pyx_L8;}
+        __Pyx_GOTREF(__pyx_t_1);
+        __pyx_t_8 = PyTuple_New(2); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1037; __pyx_clineno = __LINE__; goto __pyx_L8;}
+        __Pyx_GOTREF(((PyObject *)__pyx_t_8));
+        __Pyx_INCREF(__pyx_v_weights);
+        PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_v_weights);
+        __Pyx_GIVEREF(__pyx_v_weights);
+        PyTuple_SET_ITEM(__pyx_t_8, 1, __pyx_t_1);
+        __Pyx_GIVEREF(__pyx_t_1);
+        __pyx_t_1 = 0;
+        __pyx_t_1 = PyObject_Call(__pyx_t_2, ((PyObject *)__pyx_t_8), NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1037; __pyx_clineno = __LINE__; goto __pyx_L8;}
+        __Pyx_GOTREF(__pyx_t_1);
+        __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+        __Pyx_DECREF(((PyObject *)__pyx_t_8)); __pyx_t_8 = 0;
+        if (PyList_CheckExact(__pyx_t_1) || PyTuple_CheckExact(__pyx_t_1)) {
+          __pyx_t_7 = 0; __pyx_t_8 = __pyx_t_1; __Pyx_INCREF(__pyx_t_8);
+        } else {
+          __pyx_t_7 = -1; __pyx_t_8 = PyObject_GetIter(__pyx_t_1); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1037; __pyx_clineno = __LINE__; goto __pyx_L8;}
+          __Pyx_GOTREF(__pyx_t_8);
+        }
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        for (;;) {
+          if (likely(PyList_CheckExact(__pyx_t_8))) {
+            if (__pyx_t_7 >= PyList_GET_SIZE(__pyx_t_8)) break;
+            __pyx_t_1 = PyList_GET_ITEM(__pyx_t_8, __pyx_t_7); __Pyx_INCREF(__pyx_t_1); __pyx_t_7++;
+          } else if (likely(PyTuple_CheckExact(__pyx_t_8))) {
+            if (__pyx_t_7 >= PyTuple_GET_SIZE(__pyx_t_8)) break;
+            __pyx_t_1 = PyTuple_GET_ITEM(__pyx_t_8, __pyx_t_7); __Pyx_INCREF(__pyx_t_1); __pyx_t_7++;
+          } else {
+            __pyx_t_1 = PyIter_Next(__pyx_t_8);
+            if (!__pyx_t_1) {
+              if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1037; __pyx_clineno = __LINE__; goto __pyx_L8;}
+              break;
+            }
+            __Pyx_GOTREF(__pyx_t_1);
+          }
+          __Pyx_DECREF(__pyx_v_weight);
+          __pyx_v_weight = __pyx_t_1;
+          __pyx_t_1 = 0;
+          __pyx_t_9 = __Pyx_PyObject_AsDouble(__pyx_v_weight); if (unlikely(__pyx_t_9 == ((double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1037; __pyx_clineno = __LINE__; goto __pyx_L8;}
+          __pyx_t_1 = PyFloat_FromDouble(__pyx_t_9); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1037; __pyx_clineno = __LINE__; goto __pyx_L8;}
+          __Pyx_GOTREF(__pyx_t_1);
+          if (unlikely(PyList_Append(__pyx_t_4, (PyObject*)__pyx_t_1))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1037; __pyx_clineno = __LINE__; goto __pyx_L8;}
+          __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        }
+        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+        __Pyx_INCREF(((PyObject *)__pyx_t_4));
+        __Pyx_DECREF(((PyObject *)__pyx_v_batch_weights));
+        __pyx_v_batch_weights = __pyx_t_4;
+        __Pyx_DECREF(((PyObject *)__pyx_t_4)); __pyx_t_4 = 0;
+
+        /* "intbitset.pyx":1038
+ *             if weights is not None:
+ *                 batch_weights = [float(weight) for weight in islice(weights, n)]
+ *                 if len(batch_weights) != n:             # <<<<<<<<<<<<<<
+ *                     nweights = nsets - n + len(batch_weights)
+ *                     for rhs in sets:
+ */
+        if (unlikely(__pyx_v_batch_weights == Py_None)) {
+          PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()"); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1038; __pyx_clineno = __LINE__; goto __pyx_L8;} 
+        }
+        __pyx_t_7 = PyList_GET_SIZE(((PyObject *)__pyx_v_batch_weights)); 
+        __pyx_t_3 = (__pyx_t_7 != __pyx_v_n);
+        if (__pyx_t_3) {
+
+          /* "intbitset.pyx":1039
+ *                 batch_weights = [float(weight) for weight in islice(weights, n)]
+ *                 if len(batch_weights) != n:
+ *                     nweights = nsets - n + len(batch_weights)             # <<<<<<<<<<<<<<
+ *                     for rhs in sets:
+ *                         nsets += 1
+ */
+          __pyx_t_4 = PyInt_FromLong(__pyx_v_n); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1039; __pyx_clineno = __LINE__; goto __pyx_L8;}
+          __Pyx_GOTREF(__pyx_t_4);
+          __pyx_t_8 = PyNumber_Subtract(__pyx_v_nsets, __pyx_t_4); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1039; __pyx_clineno = __LINE__; goto __pyx_L8;}
+          __Pyx_GOTREF(__pyx_t_8);
+          __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+          if (unlikely(__pyx_v_batch_weights == Py_None)) {
+            PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()"); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1039; __pyx_clineno = __LINE__; goto __pyx_L8;} 
+          }
+          __pyx_t_7 = PyList_GET_SIZE(((PyObject *)__pyx_v_batch_weights)); 
+          __pyx_t_4 = PyInt_FromSsize_t(__pyx_t_7); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1039; __pyx_clineno = __LINE__; goto __pyx_L8;}
+          __Pyx_GOTREF(__pyx_t_4);
+          __pyx_t_1 = PyNumber_Add(__pyx_t_8, __pyx_t_4); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1039; __pyx_clineno = __LINE__; goto __pyx_L8;}
+          __Pyx_GOTREF(__pyx_t_1);
+          __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+          __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+          __Pyx_DECREF(__pyx_v_nweights);
+          __pyx_v_nweights = __pyx_t_1;
+          __pyx_t_1 = 0;
+
+          /* "intbitset.pyx":1040
+ *                 if len(batch_weights) != n:
+ *                     nweights = nsets - n + len(batch_weights)
+ *                     for rhs in sets:             # <<<<<<<<<<<<<<
+ *                         nsets += 1
+ *                     raise ValueError("%s weights given for %s sets" % (nweights, nsets))
+ */
+          if (PyList_CheckExact(__pyx_v_sets) || PyTuple_CheckExact(__pyx_v_sets)) {
+            __pyx_t_7 = 0; __pyx_t_1 = __pyx_v_sets; __Pyx_INCREF(__pyx_t_1);
+          } else {
+            __pyx_t_7 = -1; __pyx_t_1 = PyObject_GetIter(__pyx_v_sets); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1040; __pyx_clineno = __LINE__; goto __pyx_L8;}
+            __Pyx_GOTREF(__pyx_t_1);
+          }
+          for (;;) {
+            if (likely(PyList_CheckExact(__pyx_t_1))) {
+              if (__pyx_t_7 >= PyList_GET_SIZE(__pyx_t_1)) break;
+              __pyx_t_4 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_7); __Pyx_INCREF(__pyx_t_4); __pyx_t_7++;
+            } else if (likely(PyTuple_CheckExact(__pyx_t_1))) {
+              if (__pyx_t_7 >= PyTuple_GET_SIZE(__pyx_t_1)) break;
+              __pyx_t_4 = PyTuple_GET_ITEM(__pyx_t_1, __pyx_t_7); __Pyx_INCREF(__pyx_t_4); __pyx_t_7++;
+            } else {
+              __pyx_t_4 = PyIter_Next(__pyx_t_1);
+              if (!__pyx_t_4) {
+                if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1040; __pyx_clineno = __LINE__; goto __pyx_L8;}
+                break;
+              }
+              __Pyx_GOTREF(__pyx_t_4);
+            }
+            __Pyx_DECREF(__pyx_v_rhs);
+            __pyx_v_rhs = __pyx_t_4;
+            __pyx_t_4 = 0;
+
+            /* "intbitset.pyx":1041
+ *                     nweights = nsets - n + len(batch_weights)
+ *                     for rhs in sets:
+ *                         nsets += 1             # <<<<<<<<<<<<<<
+ *                     raise ValueError("%s weights given for %s sets" % (nweights, nsets))
+ *             if ret is not None:
+ */
+            __pyx_t_4 = PyNumber_InPlaceAdd(__pyx_v_nsets, __pyx_int_1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1041; __pyx_clineno = __LINE__; goto __pyx_L8;}
+            __Pyx_GOTREF(__pyx_t_4);
+            __Pyx_DECREF(__pyx_v_nsets);
+            __pyx_v_nsets = __pyx_t_4;
+            __pyx_t_4 = 0;
+          }
+          __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+          /* "intbitset.pyx":1042
+ *                     for rhs in sets:
+ *                         nsets += 1
+ *                     raise ValueError("%s weights given for %s sets" % (nweights, nsets))             # <<<<<<<<<<<<<<
+ *             if ret is not None:
+ *                 # the union so far, whose counts are added afterwards
+ */
+          __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1042; __pyx_clineno = __LINE__; goto __pyx_L8;}
+          __Pyx_GOTREF(((PyObject *)__pyx_t_1));
+          __Pyx_INCREF(__pyx_v_nweights);
+          PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_nweights);
+          __Pyx_GIVEREF(__pyx_v_nweights);
+          __Pyx_INCREF(__pyx_v_nsets);
+          PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_v_nsets);
+          __Pyx_GIVEREF(__pyx_v_nsets);
+          __pyx_t_4 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_75), ((PyObject *)__pyx_t_1)); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1042; __pyx_clineno = __LINE__; goto __pyx_L8;}
+          __Pyx_GOTREF(((PyObject *)__pyx_t_4));
+          __Pyx_DECREF(((PyObject *)__pyx_t_1)); __pyx_t_1 = 0;
+          __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1042; __pyx_clineno = __LINE__; goto __pyx_L8;}
+          __Pyx_GOTREF(((PyObject *)__pyx_t_1));
+          PyTuple_SET_ITEM(__pyx_t_1, 0, ((PyObject *)__pyx_t_4));
+          __Pyx_GIVEREF(((PyObject *)__pyx_t_4));
+          __pyx_t_4 = 0;
+          __pyx_t_4 = PyObject_Call(__pyx_builtin_ValueError, ((PyObject *)__pyx_t_1), NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1042; __pyx_clineno = __LINE__; goto __pyx_L8;}
+          __Pyx_GOTREF(__pyx_t_4);
+          __Pyx_DECREF(((PyObject *)__pyx_t_1)); __pyx_t_1 = 0;
+          __Pyx_Raise(__pyx_t_4, 0, 0);
+          __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+          {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1042; __pyx_clineno = __LINE__; goto __pyx_L8;}
+          goto __pyx_L18;
+        }
+        __pyx_L18:;
+        goto __pyx_L15;
+      }
+      __pyx_L15:;
+
+      /* "intbitset.pyx":1043
+ *                         nsets += 1
+ *                     raise ValueError("%s weights given for %s sets" % (nweights, nsets))
+ *             if ret is not None:             # <<<<<<<<<<<<<<
+ *                 # the union so far, whose counts are added afterwards
+ *                 batch.append(ret)
+ */
+      __pyx_t_3 = (__pyx_v_ret != Py_None);
+      if (__pyx_t_3) {
+
+        /* "intbitset.pyx":1045
+ *             if ret is not None:
+ *                 # the union so far, whose counts are added afterwards
+ *                 batch.append(ret)             # <<<<<<<<<<<<<<
+ *             bitsets = _get_bitsets(batch)
+ *             cweights = NULL
+ */
+        __pyx_t_4 = __Pyx_PyObject_Append(__pyx_v_batch, __pyx_v_ret); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1045; __pyx_clineno = __LINE__; goto __pyx_L8;}
+        __Pyx_GOTREF(__pyx_t_4);
+        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+        goto __pyx_L21;
+      }
+      __pyx_L21:;
+
+      /* "intbitset.pyx":1046
+ *                 # the union so far, whose counts are added afterwards
+ *                 batch.append(ret)
+ *             bitsets = _get_bitsets(batch)             # <<<<<<<<<<<<<<
+ *             cweights = NULL
+ *             if weights is not None or ret is not None:
+ */
+      __pyx_t_10 = __pyx_f_9intbitset__get_bitsets(__pyx_v_batch); if (unlikely(__pyx_t_10 == NULL)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1046; __pyx_clineno = __LINE__; goto __pyx_L8;}
+      __pyx_v_bitsets = __pyx_t_10;
+
+      /* "intbitset.pyx":1047
+ *                 batch.append(ret)
+ *             bitsets = _get_bitsets(batch)
+ *             cweights = NULL             # <<<<<<<<<<<<<<
+ *             if weights is not None or ret is not None:
+ *                 cweights = <double *> PyMem_Malloc((n + 2) * sizeof(double))
+ */
+      __pyx_v_cweights = NULL;
+
+      /* "intbitset.pyx":1048
+ *             bitsets = _get_bitsets(batch)
+ *             cweights = NULL
+ *             if weights is not None or ret is not None:             # <<<<<<<<<<<<<<
+ *                 cweights = <double *> PyMem_Malloc((n + 2) * sizeof(double))
+ *                 for i from 0 <= i < n:
+ */
+      __pyx_t_3 = (__pyx_v_weights != Py_None);
+      if (!__pyx_t_3) {
+        __pyx_t_6 = (__pyx_v_ret != Py_None);
+        __pyx_t_5 = __pyx_t_6;
+      } else {
+        __pyx_t_5 = __pyx_t_3;
+      }
+      if (__pyx_t_5) {
+
+        /* "intbitset.pyx":1049
+ *             cweights = NULL
+ *             if weights is not None or ret is not None:
+ *                 cweights = <double *> PyMem_Malloc((n + 2) * sizeof(double))             # <<<<<<<<<<<<<<
+ *                 for i from 0 <= i < n:
+ *                     if weights is not None:
+ */
+        __pyx_v_cweights = ((double *)PyMem_Malloc(((__pyx_v_n + 2) * (sizeof(double)))));
+
+        /* "intbitset.pyx":1050
+ *             if weights is not None or ret is not None:
+ *                 cweights = <double *> PyMem_Malloc((n + 2) * sizeof(double))
+ *                 for i from 0 <= i < n:             # <<<<<<<<<<<<<<
+ *                     if weights is not None:
+ *                         cweights[i] = batch_weights[i]
+ */
+        __pyx_t_11 = __pyx_v_n;
+        for (__pyx_v_i = 0; __pyx_v_i < __pyx_t_11; __pyx_v_i++) {
+
+          /* "intbitset.pyx":1051
+ *                 cweights = <double *> PyMem_Malloc((n + 2) * sizeof(double))
+ *                 for i from 0 <= i < n:
+ *                     if weights is not None:             # <<<<<<<<<<<<<<
+ *                         cweights[i] = batch_weights[i]
+ *                     else:
+ */
+          __pyx_t_5 = (__pyx_v_weights != Py_None);
+          if (__pyx_t_5) {
+
+            /* "intbitset.pyx":1052
+ *                 for i from 0 <= i < n:
+ *                     if weights is not None:
+ *                         cweights[i] = batch_weights[i]             # <<<<<<<<<<<<<<
+ *                     else:
+ *                         cweights[i] = 1.0
+ */
+            __pyx_t_4 = __Pyx_GetItemInt_List(((PyObject *)__pyx_v_batch_weights), __pyx_v_i, sizeof(int), PyInt_FromLong); if (!__pyx_t_4) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1052; __pyx_clineno = __LINE__; goto __pyx_L8;}
+            __Pyx_GOTREF(__pyx_t_4);
+            __pyx_t_9 = __pyx_PyFloat_AsDouble(__pyx_t_4); if (unlikely((__pyx_t_9 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1052; __pyx_clineno = __LINE__; goto __pyx_L8;}
+            __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+            (__pyx_v_cweights[__pyx_v_i]) = __pyx_t_9;
+            goto __pyx_L25;
+          }
+          /*else*/ {
+
+            /* "intbitset.pyx":1054
+ *                         cweights[i] = batch_weights[i]
+ *                     else:
+ *                         cweights[i] = 1.0             # <<<<<<<<<<<<<<
+ *                 cweights[n] = 0.0
+ *             batch_ret = intbitset(no_allocate=1)
+ */
+            (__pyx_v_cweights[__pyx_v_i]) = 1.0;
+          }
+          __pyx_L25:;
+        }
+
+        /* "intbitset.pyx":1055
+ *                     else:
+ *                         cweights[i] = 1.0
+ *                 cweights[n] = 0.0             # <<<<<<<<<<<<<<
+ *             batch_ret = intbitset(no_allocate=1)
+ *             (<intbitset>batch_ret).bitset = intBitSetCountMany(bitsets, len(batch), cweights, &batch_counts)
+ */
+        (__pyx_v_cweights[__pyx_v_n]) = 0.0;
+        goto __pyx_L22;
+      }
+      __pyx_L22:;
+
+      /* "intbitset.pyx":1056
+ *                         cweights[i] = 1.0
+ *                 cweights[n] = 0.0
+ *             batch_ret = intbitset(no_allocate=1)             # <<<<<<<<<<<<<<
+ *             (<intbitset>batch_ret).bitset = intBitSetCountMany(bitsets, len(batch), cweights, &batch_counts)
+ *             PyMem_Free(bitsets)
+ */
+      __pyx_t_4 = PyDict_New(); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1056; __pyx_clineno = __LINE__; goto __pyx_L8;}
+      __Pyx_GOTREF(((PyObject *)__pyx_t_4));
+      if (PyDict_SetItem(__pyx_t_4, ((PyObject *)__pyx_n_s__no_allocate), __pyx_int_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1056; __pyx_clineno = __LINE__; goto __pyx_L8;}
+      __pyx_t_1 = PyEval_CallObjectWithKeywords(((PyObject *)((PyObject*)__pyx_ptype_9intbitset_intbitset)), ((PyObject *)__pyx_empty_tuple), ((PyObject *)__pyx_t_4)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1056; __pyx_clineno = __LINE__; goto __pyx_L8;}
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(((PyObject *)__pyx_t_4)); __pyx_t_4 = 0;
+      __Pyx_DECREF(__pyx_v_batch_ret);
+      __pyx_v_batch_ret = __pyx_t_1;
+      __pyx_t_1 = 0;
+
+      /* "intbitset.pyx":1057
+ *                 cweights[n] = 0.0
+ *             batch_ret = intbitset(no_allocate=1)
+ *             (<intbitset>batch_ret).bitset = intBitSetCountMany(bitsets, len(batch), cweights, &batch_counts)             # <<<<<<<<<<<<<<
+ *             PyMem_Free(bitsets)
+ *             PyMem_Free(cweights)
+ */
+      __pyx_t_7 = PyObject_Length(__pyx_v_batch); if (unlikely(__pyx_t_7 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1057; __pyx_clineno = __LINE__; goto __pyx_L8;}
+      ((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_batch_ret)->bitset = intBitSetCountMany(__pyx_v_bitsets, __pyx_t_7, __pyx_v_cweights, (&__pyx_v_batch_counts));
+
+      /* "intbitset.pyx":1058
+ *             batch_ret = intbitset(no_allocate=1)
+ *             (<intbitset>batch_ret).bitset = intBitSetCountMany(bitsets, len(batch), cweights, &batch_counts)
+ *             PyMem_Free(bitsets)             # <<<<<<<<<<<<<<
+ *             PyMem_Free(cweights)
+ *             if ret is not None:
+ */
+      PyMem_Free(__pyx_v_bitsets);
+
+      /* "intbitset.pyx":1059
+ *             (<intbitset>batch_ret).bitset = intBitSetCountMany(bitsets, len(batch), cweights, &batch_counts)
+ *             PyMem_Free(bitsets)
+ *             PyMem_Free(cweights)             # <<<<<<<<<<<<<<
+ *             if ret is not None:
+ *                 intBitSetAddCounts((<intbitset>batch_ret).bitset, (<intbitset>ret).bitset, counts, batch_counts)
+ */
+      PyMem_Free(__pyx_v_cweights);
+
+      /* "intbitset.pyx":1060
+ *             PyMem_Free(bitsets)
+ *             PyMem_Free(cweights)
+ *             if ret is not None:             # <<<<<<<<<<<<<<
+ *                 intBitSetAddCounts((<intbitset>batch_ret).bitset, (<intbitset>ret).bitset, counts, batch_counts)
+ *                 PyMem_Free(counts)
+ */
+      __pyx_t_5 = (__pyx_v_ret != Py_None);
+      if (__pyx_t_5) {
+
+        /* "intbitset.pyx":1061
+ *             PyMem_Free(cweights)
+ *             if ret is not None:
+ *                 intBitSetAddCounts((<intbitset>batch_ret).bitset, (<intbitset>ret).bitset, counts, batch_counts)             # <<<<<<<<<<<<<<
+ *                 PyMem_Free(counts)
+ *             ret = batch_ret
+ */
+        intBitSetAddCounts(((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_batch_ret)->bitset, ((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_ret)->bitset, __pyx_v_counts, __pyx_v_batch_counts);
+
+        /* "intbitset.pyx":1062
+ *             if ret is not None:
+ *                 intBitSetAddCounts((<intbitset>batch_ret).bitset, (<intbitset>ret).bitset, counts, batch_counts)
+ *                 PyMem_Free(counts)             # <<<<<<<<<<<<<<
+ *             ret = batch_ret
+ *             counts = batch_counts
+ */
+        PyMem_Free(__pyx_v_counts);
+        goto __pyx_L26;
+      }
+      __pyx_L26:;
+
+      /* "intbitset.pyx":1063
+ *                 intBitSetAddCounts((<intbitset>batch_ret).bitset, (<intbitset>ret).bitset, counts, batch_counts)
+ *                 PyMem_Free(counts)
+ *             ret = batch_ret             # <<<<<<<<<<<<<<
+ *             counts = batch_counts
+ *             batch = rhs = None
+ */
+      __Pyx_INCREF(__pyx_v_batch_ret);
+      __Pyx_DECREF(__pyx_v_ret);
+      __pyx_v_ret = __pyx_v_batch_ret;
+
+      /* "intbitset.pyx":1064
+ *                 PyMem_Free(counts)
+ *             ret = batch_ret
+ *             counts = batch_counts             # <<<<<<<<<<<<<<
+ *             batch = rhs = None
+ *             batch = list(islice(sets, _MANY_BATCH))
+ */
+      __pyx_v_counts = __pyx_v_batch_counts;
+
+      /* "intbitset.pyx":1065
+ *             ret = batch_ret
+ *             counts = batch_counts
+ *             batch = rhs = None             # <<<<<<<<<<<<<<
+ *             batch = list(islice(sets, _MANY_BATCH))
+ *         if weights is not None:
+ */
+      __Pyx_INCREF(Py_None);
+      __Pyx_DECREF(__pyx_v_batch);
+      __pyx_v_batch = Py_None;
+      __Pyx_INCREF(Py_None);
+      __Pyx_DECREF(__pyx_v_rhs);
+      __pyx_v_rhs = Py_None;
+
+      /* "intbitset.pyx":1066
+ *             counts = batch_counts
+ *             batch = rhs = None
+ *             batch = list(islice(sets, _MANY_BATCH))             # <<<<<<<<<<<<<<
+ *         if weights is not None:
+ *             nweights = nsets
+ */
+      __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__islice); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1066; __pyx_clineno = __LINE__; goto __pyx_L8;}
+      __Pyx_GOTREF(__pyx_t_1);
+      __pyx_t_4 = __Pyx_GetName(__pyx_m, __pyx_n_s___MANY_BATCH); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1066; __pyx_clineno = __LINE__; goto __pyx_L8;}
+      __Pyx_GOTREF(__pyx_t_4);
+      __pyx_t_8 = PyTuple_New(2); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1066; __pyx_clineno = __LINE__; goto __pyx_L8;}
+      __Pyx_GOTREF(((PyObject *)__pyx_t_8));
+      __Pyx_INCREF(__pyx_v_sets);
+      PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_v_sets);
+      __Pyx_GIVEREF(__pyx_v_sets);
+      PyTuple_SET_ITEM(__pyx_t_8, 1, __pyx_t_4);
+      __Pyx_GIVEREF(__pyx_t_4);
+      __pyx_t_4 = 0;
+      __pyx_t_4 = PyObject_Call(__pyx_t_1, ((PyObject *)__pyx_t_8), NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1066; __pyx_clineno = __LINE__; goto __pyx_L8;}
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __Pyx_DECREF(((PyObject *)__pyx_t_8)); __pyx_t_8 = 0;
+      __pyx_t_8 = PyTuple_New(1); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1066; __pyx_clineno = __LINE__; goto __pyx_L8;}
+      __Pyx_GOTREF(((PyObject *)__pyx_t_8));
+      PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_4);
+      __Pyx_GIVEREF(__pyx_t_4);
+      __pyx_t_4 = 0;
+      __pyx_t_4 = PyObject_Call(((PyObject *)((PyObject*)(&PyList_Type))), ((PyObject *)__pyx_t_8), NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1066; __pyx_clineno = __LINE__; goto __pyx_L8;}
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_DECREF(((PyObject *)__pyx_t_8)); __pyx_t_8 = 0;
+      __Pyx_DECREF(__pyx_v_batch);
+      __pyx_v_batch = __pyx_t_4;
+      __pyx_t_4 = 0;
+    }
+
+    /* "intbitset.pyx":1067
+ *             batch = rhs = None
+ *             batch = list(islice(sets, _MANY_BATCH))
+ *         if weights is not None:             # <<<<<<<<<<<<<<
+ *             nweights = nsets
+ *             for weight in weights:
+ */
+    __pyx_t_5 = (__pyx_v_weights != Py_None);
+    if (__pyx_t_5) {
+
+      /* "intbitset.pyx":1068
+ *             batch = list(islice(sets, _MANY_BATCH))
+ *         if weights is not None:
+ *             nweights = nsets             # <<<<<<<<<<<<<<
+ *             for weight in weights:
+ *                 nweights += 1
+ */
+      __Pyx_INCREF(__pyx_v_nsets);
+      __Pyx_DECREF(__pyx_v_nweights);
+      __pyx_v_nweights = __pyx_v_nsets;
+
+      /* "intbitset.pyx":1069
+ *         if weights is not None:
+ *             nweights = nsets
+ *             for weight in weights:             # <<<<<<<<<<<<<<
+ *                 nweights += 1
+ *             if nweights != nsets:
+ */
+      if (PyList_CheckExact(__pyx_v_weights) || PyTuple_CheckExact(__pyx_v_weights)) {
+        __pyx_t_7 = 0; __pyx_t_4 = __pyx_v_weights; __Pyx_INCREF(__pyx_t_4);
+      } else {
+        __pyx_t_7 = -1; __pyx_t_4 = PyObject_GetIter(__pyx_v_weights); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1069; __pyx_clineno = __LINE__; goto __pyx_L8;}
+        __Pyx_GOTREF(__pyx_t_4);
+      }
+      for (;;) {
+        if (likely(PyList_CheckExact(__pyx_t_4))) {
+          if (__pyx_t_7 >= PyList_GET_SIZE(__pyx_t_4)) break;
+          __pyx_t_8 = PyList_GET_ITEM(__pyx_t_4, __pyx_t_7); __Pyx_INCREF(__pyx_t_8); __pyx_t_7++;
+        } else if (likely(PyTuple_CheckExact(__pyx_t_4))) {
+          if (__pyx_t_7 >= PyTuple_GET_SIZE(__pyx_t_4)) break;
+          __pyx_t_8 = PyTuple_GET_ITEM(__pyx_t_4, __pyx_t_7); __Pyx_INCREF(__pyx_t_8); __pyx_t_7++;
+        } else {
+          __pyx_t_8 = PyIter_Next(__pyx_t_4);
+          if (!__pyx_t_8) {
+            if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1069; __pyx_clineno = __LINE__; goto __pyx_L8;}
+            break;
+          }
+          __Pyx_GOTREF(__pyx_t_8);
+        }
+        __Pyx_DECREF(__pyx_v_weight);
+        __pyx_v_weight = __pyx_t_8;
+        __pyx_t_8 = 0;
+
+        /* "intbitset.pyx":1070
+ *             nweights = nsets
+ *             for weight in weights:
+ *                 nweights += 1             # <<<<<<<<<<<<<<
+ *             if nweights != nsets:
+ *                 raise ValueError("%s weights given for %s sets" % (nweights, nsets))
+ */
+        __pyx_t_8 = PyNumber_InPlaceAdd(__pyx_v_nweights, __pyx_int_1); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1070; __pyx_clineno = __LINE__; goto __pyx_L8;}
+        __Pyx_GOTREF(__pyx_t_8);
+        __Pyx_DECREF(__pyx_v_nweights);
+        __pyx_v_nweights = __pyx_t_8;
+        __pyx_t_8 = 0;
+      }
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+      /* "intbitset.pyx":1071
+ *             for weight in weights:
+ *                 nweights += 1
+ *             if nweights != nsets:             # <<<<<<<<<<<<<<
+ *                 raise ValueError("%s weights given for %s sets" % (nweights, nsets))
+ *         tot = intBitSetGetTot((<intbitset>ret).bitset)
+ */
+      __pyx_t_4 = PyObject_RichCompare(__pyx_v_nweights, __pyx_v_nsets, Py_NE); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1071; __pyx_clineno = __LINE__; goto __pyx_L8;}
+      __Pyx_GOTREF(__pyx_t_4);
+      __pyx_t_5 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely(__pyx_t_5 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1071; __pyx_clineno = __LINE__; goto __pyx_L8;}
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      if (__pyx_t_5) {
+
+        /* "intbitset.pyx":1072
+ *                 nweights += 1
+ *             if nweights != nsets:
+ *                 raise ValueError("%s weights given for %s sets" % (nweights, nsets))             # <<<<<<<<<<<<<<
+ *         tot = intBitSetGetTot((<intbitset>ret).bitset)
+ *         if weights is None:
+ */
+        __pyx_t_4 = PyTuple_New(2); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1072; __pyx_clineno = __LINE__; goto __pyx_L8;}
+        __Pyx_GOTREF(((PyObject *)__pyx_t_4));
+        __Pyx_INCREF(__pyx_v_nweights);
+        PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_v_nweights);
+        __Pyx_GIVEREF(__pyx_v_nweights);
+        __Pyx_INCREF(__pyx_v_nsets);
+        PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_v_nsets);
+        __Pyx_GIVEREF(__pyx_v_nsets);
+        __pyx_t_8 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_75), ((PyObject *)__pyx_t_4)); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1072; __pyx_clineno = __LINE__; goto __pyx_L8;}
+        __Pyx_GOTREF(((PyObject *)__pyx_t_8));
+        __Pyx_DECREF(((PyObject *)__pyx_t_4)); __pyx_t_4 = 0;
+        __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1072; __pyx_clineno = __LINE__; goto __pyx_L8;}
+        __Pyx_GOTREF(((PyObject *)__pyx_t_4));
+        PyTuple_SET_ITEM(__pyx_t_4, 0, ((PyObject *)__pyx_t_8));
+        __Pyx_GIVEREF(((PyObject *)__pyx_t_8));
+        __pyx_t_8 = 0;
+        __pyx_t_8 = PyObject_Call(__pyx_builtin_ValueError, ((PyObject *)__pyx_t_4), NULL); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1072; __pyx_clineno = __LINE__; goto __pyx_L8;}
+        __Pyx_GOTREF(__pyx_t_8);
+        __Pyx_DECREF(((PyObject *)__pyx_t_4)); __pyx_t_4 = 0;
+        __Pyx_Raise(__pyx_t_8, 0, 0);
+        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+        {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1072; __pyx_clineno = __LINE__; goto __pyx_L8;}
+        goto __pyx_L30;
+      }
+      __pyx_L30:;
+      goto __pyx_L27;
+    }
+    __pyx_L27:;
+
+    /* "intbitset.pyx":1073
+ *             if nweights != nsets:
+ *                 raise ValueError("%s weights given for %s sets" % (nweights, nsets))
+ *         tot = intBitSetGetTot((<intbitset>ret).bitset)             # <<<<<<<<<<<<<<
+ *         if weights is None:
+ *             ret_counts = [<int> counts[i] for i from 0 <= i < tot]
+ */
+    __pyx_v_tot = intBitSetGetTot(((struct __pyx_obj_9intbitset_intbitset *)__pyx_v_ret)->bitset);
+
+    /* "intbitset.pyx":1074
+ *                 raise ValueError("%s weights given for %s sets" % (nweights, nsets))
+ *         tot = intBitSetGetTot((<intbitset>ret).bitset)
+ *         if weights is None:             # <<<<<<<<<<<<<<
+ *             ret_counts = [<int> counts[i] for i from 0 <= i < tot]
+ *         else:
+ */
+    __pyx_t_5 = (__pyx_v_weights == Py_None);
+    if (__pyx_t_5) {
+
+      /* "intbitset.pyx":1075
+ *         tot = intBitSetGetTot((<intbitset>ret).bitset)
+ *         if weights is None:
+ *             ret_counts = [<int> counts[i] for i from 0 <= i < tot]             # <<<<<<<<<<<<<<
+ *         else:
+ *             ret_counts = [counts[i] for i from 0 <= i < tot]
+ */
+      __pyx_t_8 = PyList_New(0); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1075; __pyx_clineno = __LINE__; goto __pyx_L8;}
+      __Pyx_GOTREF(((PyObject *)__pyx_t_8));
+      __pyx_t_11 = __pyx_v_tot;
+      for (__pyx_v_i = 0; __pyx_v_i < __pyx_t_11; __pyx_v_i++) {
+        __pyx_t_4 = PyInt_FromLong(((int)(__pyx_v_counts[__pyx_v_i]))); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1075; __pyx_clineno = __LINE__; goto __pyx_L8;}
+        __Pyx_GOTREF(__pyx_t_4);
+        if (unlikely(PyList_Append(__pyx_t_8, (PyObject*)__pyx_t_4))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1075; __pyx_clineno = __LINE__; goto __pyx_L8;}
+        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      }
+      __Pyx_INCREF(((PyObject *)__pyx_t_8));
+      __Pyx_DECREF(((PyObject *)__pyx_v_ret_counts));
+      __pyx_v_ret_counts = __pyx_t_8;
+      __Pyx_DECREF(((PyObject *)__pyx_t_8)); __pyx_t_8 = 0;
+      goto __pyx_L31;
+    }
+    /*else*/ {
+
+      /* "intbitset.pyx":1077
+ *             ret_counts = [<int> counts[i] for i from 0 <= i < tot]
+ *         else:
+ *             ret_counts = [counts[i] for i from 0 <= i < tot]             # <<<<<<<<<<<<<<
+ *     finally:
+ *         PyMem_Free(counts)
+ */
+      __pyx_t_8 = PyList_New(0); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1077; __pyx_clineno = __LINE__; goto __pyx_L8;}
+      __Pyx_GOTREF(((PyObject *)__pyx_t_8));
+      __pyx_t_11 = __pyx_v_tot;
+      for (__pyx_v_i = 0; __pyx_v_i < __pyx_t_11; __pyx_v_i++) {
+        __pyx_t_4 = PyFloat_FromDouble((__pyx_v_counts[__pyx_v_i])); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1077; __pyx_clineno = __LINE__; goto __pyx_L8;}
+        __Pyx_GOTREF(__pyx_t_4);
+        if (unlikely(PyList_Append(__pyx_t_8, (PyObject*)__pyx_t_4))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1077; __pyx_clineno = __LINE__; goto __pyx_L8;}
+        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      }
+      __Pyx_INCREF(((PyObject *)__pyx_t_8));
+      __Pyx_DECREF(((PyObject *)__pyx_v_ret_counts));
+      __pyx_v_ret_counts = __pyx_t_8;
+      __Pyx_DECREF(((PyObject *)__pyx_t_8)); __pyx_t_8 = 0;
+    }
+    __pyx_L31:;
+  }
+
+  /* "intbitset.pyx":1079
+ *             ret_counts = [counts[i] for i from 0 <= i < tot]
+ *     finally:
+ *         PyMem_Free(counts)             # <<<<<<<<<<<<<<
+ *     return ret, ret_counts
+ */
+  /*finally:*/ {
+    int __pyx_why;
+    PyObject *__pyx_exc_type, *__pyx_exc_value, *__pyx_exc_tb;
+    int __pyx_exc_lineno;
+    __pyx_exc_type = 0; __pyx_exc_value = 0; __pyx_exc_tb = 0; __pyx_exc_lineno = 0;
+    __pyx_why = 0; goto __pyx_L9;
+    __pyx_L8: {
+      __pyx_why = 4;
+      __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+      __Pyx_ErrFetch(&__pyx_exc_type, &__pyx_exc_value, &__pyx_exc_tb);
+      __pyx_exc_lineno = __pyx_lineno;
+      goto __pyx_L9;
+    }
+    __pyx_L9:;
+    PyMem_Free(__pyx_v_counts);
+    switch (__pyx_why) {
+      case 4: {
+        __Pyx_ErrRestore(__pyx_exc_type, __pyx_exc_value, __pyx_exc_tb);
+        __pyx_lineno = __pyx_exc_lineno;
+        __pyx_exc_type = 0;
+        __pyx_exc_value = 0;
+        __pyx_exc_tb = 0;
+        goto __pyx_L1_error;
+      }
+    }
+  }
+
+  /* "intbitset.pyx":1080
+ *     finally:
+ *         PyMem_Free(counts)
+ *     return ret, ret_counts             # <<<<<<<<<<<<<<
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_8 = PyTuple_New(2); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1080; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_t_8));
+  __Pyx_INCREF(__pyx_v_ret);
+  PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_v_ret);
+  __Pyx_GIVEREF(__pyx_v_ret);
+  __Pyx_INCREF(((PyObject *)__pyx_v_ret_counts));
+  PyTuple_SET_ITEM(__pyx_t_8, 1, ((PyObject *)__pyx_v_ret_counts));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_ret_counts));
+  __pyx_r = ((PyObject *)__pyx_t_8);
+  __pyx_t_8 = 0;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_AddTraceback("intbitset.count_many");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_ret);
+  __Pyx_DECREF(__pyx_v_nsets);
+  __Pyx_DECREF(__pyx_v_batch);
+  __Pyx_DECREF(__pyx_v_rhs);
+  __Pyx_DECREF(__pyx_v_batch_weights);
+  __Pyx_DECREF(__pyx_v_nweights);
+  __Pyx_DECREF(__pyx_v_batch_ret);
+  __Pyx_DECREF(__pyx_v_weight);
+  __Pyx_DECREF(__pyx_v_ret_counts);
+  __Pyx_DECREF(__pyx_v_sets);
+  __Pyx_DECREF(__pyx_v_weights);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_tp_new_9intbitset_intbitset(PyTypeObject *t, PyObject *a, PyObject *k) {
+  struct __pyx_obj_9intbitset_intbitset *p;
+  PyObject *o = (*t->tp_alloc)(t, 0);
+  if (!o) return 0;
+  p = ((struct __pyx_obj_9intbitset_intbitset *)o);
+  p->dump = Py_None; Py_INCREF(Py_None);
+  p->__weakref__ = 0;
+  if (__pyx_pf_9intbitset_9intbitset___cinit__(o, a, k) < 0) {
+    Py_DECREF(o); o = 0;
+  }
+  return o;
+}
+
+static void __pyx_tp_dealloc_9intbitset_intbitset(PyObject *o) {
+  struct __pyx_obj_9intbitset_intbitset *p = (struct __pyx_obj_9intbitset_intbitset *)o;
+  {
+    PyObject *etype, *eval, *etb;
+    PyErr_Fetch(&etype, &eval, &etb);
+    ++Py_REFCNT(o);
+    __pyx_pf_9intbitset_9intbitset_1__dealloc__(o);
+    if (PyErr_Occurred()) PyErr_WriteUnraisable(o);
+    --Py_REFCNT(o);
+    PyErr_Restore(etype, eval, etb);
+  }
+  if (p->__weakref__) PyObject_ClearWeakRefs(o);
+  Py_XDECREF(p->dump);
+  (*Py_TYPE(o)->tp_free)(o);
+}
+
+static int __pyx_tp_traverse_9intbitset_intbitset(PyObject *o, visitproc v, void *a) {
+  int e;
+  struct __pyx_obj_9intbitset_intbitset *p = (struct __pyx_obj_9intbitset_intbitset *)o;
+  if (p->dump) {
+    e = (*v)(p->dump, a); if (e) return e;
+  }
+  return 0;
+}
+
+static int __pyx_tp_clear_9intbitset_intbitset(PyObject *o) {
+  struct __pyx_obj_9intbitset_intbitset *p = (struct __pyx_obj_9intbitset_intbitset *)o;
+  PyObject* tmp;
+  tmp = ((PyObject*)p->dump);
+  p->dump = Py_None; Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  return 0;
+}
+
+static PyMethodDef __pyx_methods_9intbitset_intbitset[] = {
+  {__Pyx_NAMESTR("__deepcopy__"), (PyCFunction)__pyx_pf_9intbitset_9intbitset_10__deepcopy__, METH_O, __Pyx_DOCSTR(0)},
+  {__Pyx_NAMESTR("__del__"), (PyCFunction)__pyx_pf_9intbitset_9intbitset_11__del__, METH_O, __Pyx_DOCSTR(0)},
+  {__Pyx_NAMESTR("add"), (PyCFunction)__pyx_pf_9intbitset_9intbitset_22add, METH_O, __Pyx_DOCSTR(__pyx_doc_9intbitset_9intbitset_22add)},
+  {__Pyx_NAMESTR("clear"), (PyCFunction)__pyx_pf_9intbitset_9intbitset_23clear, METH_NOARGS, __Pyx_DOCSTR(0)},
+  {__Pyx_NAMESTR("difference"), (PyCFunction)__pyx_pf_9intbitset_9intbitset_24difference, METH_O, __Pyx_DOCSTR(__pyx_doc_9intbitset_9intbitset_24difference)},
+  {__Pyx_NAMESTR("difference_update"), (PyCFunction)__pyx_pf_9intbitset_9intbitset_25difference_update, METH_O, __Pyx_DOCSTR(__pyx_doc_9intbitset_9intbitset_25difference_update)},
+  {__Pyx_NAMESTR("discard"), (PyCFunction)__pyx_pf_9intbitset_9intbitset_26discard, METH_O, __Pyx_DOCSTR(__pyx_doc_9intbitset_9intbitset_26discard)},
+  {__Pyx_NAMESTR("intersection"), (PyCFunction)__pyx_pf_9intbitset_9intbitset_27intersection, METH_O, __Pyx_DOCSTR(__pyx_doc_9intbitset_9intbitset_27intersection)},
+  {__Pyx_NAMESTR("intersection_update"), (PyCFunction)__pyx_pf_9intbitset_9intbitset_28intersection_update, METH_O, __Pyx_DOCSTR(__pyx_doc_9intbitset_9intbitset_28intersection_update)},
+  {__Pyx_NAMESTR("union"), (PyCFunction)__pyx_pf_9intbitset_9intbitset_29union, METH_O, __Pyx_DOCSTR(__pyx_doc_9intbitset_9intbitset_29union)},
+  {__Pyx_NAMESTR("union_update"), (PyCFunction)__pyx_pf_9intbitset_9intbitset_30union_update, METH_O, __Pyx_DOCSTR(__pyx_doc_9intbitset_9intbitset_30union_update)},
+  {__Pyx_NAMESTR("issubset"), (PyCFunction)__pyx_pf_9intbitset_9intbitset_31issubset, METH_O, __Pyx_DOCSTR(__pyx_doc_9intbitset_9intbitset_31issubset)},
+  {__Pyx_NAMESTR("issuperset"), (PyCFunction)__pyx_pf_9intbitset_9intbitset_32issuperset, METH_O, __Pyx_DOCSTR(__pyx_doc_9intbitset_9intbitset_32issuperset)},
+  {__Pyx_NAMESTR("symmetric_difference"), (PyCFunction)__pyx_pf_9intbitset_9intbitset_33symmetric_difference, METH_O, __Pyx_DOCSTR(__pyx_doc_9intbitset_9intbitset_33symmetric_difference)},
+  {__Pyx_NAMESTR("symmetric_difference_update"), (PyCFunction)__pyx_pf_9intbitset_9intbitset_34symmetric_difference_update, METH_O, __Pyx_DOCSTR(__pyx_doc_9intbitset_9intbitset_34symmetric_difference_update)},
+  {__Pyx_NAMESTR("fastdump"), (PyCFunction)__pyx_pf_9intbitset_9intbitset_35fastdump, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_9intbitset_9intbitset_35fastdump)},
+  {__Pyx_NAMESTR("fastload"), (PyCFunction)__pyx_pf_9intbitset_9intbitset_36fastload, METH_O, __Pyx_DOCSTR(__pyx_doc_9intbitset_9intbitset_36fastload)},
+  {__Pyx_NAMESTR("copy"), (PyCFunction)__pyx_pf_9intbitset_9intbitset_37copy, METH_NOARGS, __Pyx_DOCSTR(__pyx_doc_9intbitset_9intbitset_37copy)},
+  {__Pyx_NAMESTR("pop"), (PyCFunction)__pyx_pf_9intbitset_9intbitset_38pop, METH_NOARGS, __Pyx_DOCSTR(__pyx_doc_9intbitset_9intbitset_38pop)},
+  {__Pyx_NAMESTR("remove"), (PyCFunction)__pyx_pf_9intbitset_9intbitset_39remove, METH_O, __Pyx_DOCSTR(__pyx_doc_9intbitset_9intbitset_39remove)},
+  {__Pyx_NAMESTR("strbits"), (PyCFunction)__pyx_pf_9intbitset_9intbitset_40strbits, METH_NOARGS, __Pyx_DOCSTR(__pyx_doc_9intbitset_9intbitset_40strbits)},
+  {__Pyx_NAMESTR("update_with_signs"), (PyCFunction)__pyx_pf_9intbitset_9intbitset_41update_with_signs, METH_O, __Pyx_DOCSTR(__pyx_doc_9intbitset_9intbitset_41update_with_signs)},
+  {__Pyx_NAMESTR("get_size"), (PyCFunction)__pyx_pf_9intbitset_9intbitset_42get_size, METH_NOARGS, __Pyx_DOCSTR(0)},
+  {__Pyx_NAMESTR("get_allocated"), (PyCFunction)__pyx_pf_9intbitset_9intbitset_43get_allocated, METH_NOARGS, __Pyx_DOCSTR(0)},
+  {__Pyx_NAMESTR("get_sorted_element"), (PyCFunction)__pyx_pf_9intbitset_9intbitset_44get_sorted_element, METH_O, __Pyx_DOCSTR(__pyx_doc_9intbitset_9intbitset_44get_sorted_element)},
+  {__Pyx_NAMESTR("to_sorted_list"), (PyCFunction)__pyx_pf_9intbitset_9intbitset_45to_sorted_list, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_9intbitset_9intbitset_45to_sorted_list)},
+  {__Pyx_NAMESTR("rank"), (PyCFunction)__pyx_pf_9intbitset_9intbitset_46rank, METH_O, __Pyx_DOCSTR(__pyx_doc_9intbitset_9intbitset_46rank)},
+  {__Pyx_NAMESTR("is_infinite"), (PyCFunction)__pyx_pf_9intbitset_9intbitset_47is_infinite, METH_NOARGS, __Pyx_DOCSTR(__pyx_doc_9intbitset_9intbitset_47is_infinite)},
+  {__Pyx_NAMESTR("extract_finite_list"), (PyCFunction)__pyx_pf_9intbitset_9intbitset_48extract_finite_list, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_9intbitset_9intbitset_48extract_finite_list)},
+  {__Pyx_NAMESTR("get_wordbitsize"), (PyCFunction)__pyx_pf_9intbitset_9intbitset_49get_wordbitsize, METH_NOARGS, __Pyx_DOCSTR(0)},
+  {__Pyx_NAMESTR("get_wordbytsize"), (PyCFunction)__pyx_pf_9intbitset_9intbitset_50get_wordbytsize, METH_NOARGS, __Pyx_DOCSTR(0)},
+  {__Pyx_NAMESTR("tolist"), (PyCFunction)__pyx_pf_9intbitset_9intbitset_51tolist, METH_NOARGS, __Pyx_DOCSTR(__pyx_doc_9intbitset_9intbitset_51tolist)},
+  {0, 0, 0, 0}
+};
+
+static PyNumberMethods __pyx_tp_as_number_intbitset = {
+  0, /*nb_add*/
+  __pyx_pf_9intbitset_9intbitset_15__sub__, /*nb_subtract*/
+  0, /*nb_multiply*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*nb_divide*/
+  #endif
+  0, /*nb_remainder*/
+  0, /*nb_divmod*/
+  0, /*nb_power*/
+  0, /*nb_negative*/
+  0, /*nb_positive*/
+  0, /*nb_absolute*/
+  __pyx_pf_9intbitset_9intbitset_7__nonzero__, /*nb_nonzero*/
+  0, /*nb_invert*/
+  0, /*nb_lshift*/
+  0, /*nb_rshift*/
+  __pyx_pf_9intbitset_9intbitset_12__and__, /*nb_and*/
+  __pyx_pf_9intbitset_9intbitset_14__xor__, /*nb_xor*/
+  __pyx_pf_9intbitset_9intbitset_13__or__, /*nb_or*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*nb_coerce*/
+  #endif
+  0, /*nb_int*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*nb_long*/
+  #else
+  0, /*reserved*/
+  #endif
+  0, /*nb_float*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*nb_oct*/
+  #endif
+  #if PY_MAJOR_VERSION < 3
+  0, /*nb_hex*/
+  #endif
+  __pyx_pf_9intbitset_9intbitset_8__iadd__, /*nb_inplace_add*/
+  __pyx_pf_9intbitset_9intbitset_9__isub__, /*nb_inplace_subtract*/
+  0, /*nb_inplace_multiply*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*nb_inplace_divide*/
+  #endif
+  0, /*nb_inplace_remainder*/
+  0, /*nb_inplace_power*/
+  0, /*nb_inplace_lshift*/
+  0, /*nb_inplace_rshift*/
+  __pyx_pf_9intbitset_9intbitset_16__iand__, /*nb_inplace_and*/
+  __pyx_pf_9intbitset_9intbitset_18__ixor__, /*nb_inplace_xor*/
+  __pyx_pf_9intbitset_9intbitset_17__ior__, /*nb_inplace_or*/
+  0, /*nb_floor_divide*/
+  0, /*nb_true_divide*/
+  0, /*nb_inplace_floor_divide*/
+  0, /*nb_inplace_true_divide*/
+  #if PY_VERSION_HEX >= 0x02050000
+  0, /*nb_index*/
+  #endif
+};
+
+static PySequenceMethods __pyx_tp_as_sequence_intbitset = {
+  __pyx_pf_9intbitset_9intbitset_5__len__, /*sq_length*/
+  0, /*sq_concat*/
+  0, /*sq_repeat*/
+  0, /*sq_item*/
+  0, /*sq_slice*/
+  0, /*sq_ass_item*/
+  0, /*sq_ass_slice*/
+  __pyx_pf_9intbitset_9intbitset_2__contains__, /*sq_contains*/
+  0, /*sq_inplace_concat*/
+  0, /*sq_inplace_repeat*/
+};
+
+static PyMappingMethods __pyx_tp_as_mapping_intbitset = {
+  __pyx_pf_9intbitset_9intbitset_5__len__, /*mp_length*/
+  0, /*mp_subscript*/
+  0, /*mp_ass_subscript*/
+};
+
+static PyBufferProcs __pyx_tp_as_buffer_intbitset = {
+  #if PY_MAJOR_VERSION < 3
+  0, /*bf_getreadbuffer*/
+  #endif
+  #if PY_MAJOR_VERSION < 3
+  0, /*bf_getwritebuffer*/
+  #endif
+  #if PY_MAJOR_VERSION < 3
+  0, /*bf_getsegcount*/
+  #endif
+  #if PY_MAJOR_VERSION < 3
+  0, /*bf_getcharbuffer*/
+  #endif
+  #if PY_VERSION_HEX >= 0x02060000
+  0, /*bf_getbuffer*/
+  #endif
+  #if PY_VERSION_HEX >= 0x02060000
+  0, /*bf_releasebuffer*/
+  #endif
+};
+
+static PyTypeObject __pyx_type_9intbitset_intbitset = {
+  PyVarObject_HEAD_INIT(0, 0)
+  __Pyx_NAMESTR("intbitset.intbitset"), /*tp_name*/
+  sizeof(struct __pyx_obj_9intbitset_intbitset), /*tp_basicsize*/
+  0, /*tp_itemsize*/
+  __pyx_tp_dealloc_9intbitset_intbitset, /*tp_dealloc*/
+  0, /*tp_print*/
+  0, /*tp_getattr*/
+  0, /*tp_setattr*/
+  #if PY_MAJOR_VERSION < 3
+  __pyx_pf_9intbitset_9intbitset_3__cmp__, /*tp_compare*/
+  #else
+  0, /*reserved*/
+  #endif
+  __pyx_pf_9intbitset_9intbitset_19__repr__, /*tp_repr*/
+  &__pyx_tp_as_number_intbitset, /*tp_as_number*/
+  &__pyx_tp_as_sequence_intbitset, /*tp_as_sequence*/
+  &__pyx_tp_as_mapping_intbitset, /*tp_as_mapping*/
+  __pyx_pf_9intbitset_9intbitset_6__hash__, /*tp_hash*/
+  0, /*tp_call*/
+  __pyx_pf_9intbitset_9intbitset_20__str__, /*tp_str*/
+  0, /*tp_getattro*/
+  0, /*tp_setattro*/
+  &__pyx_tp_as_buffer_intbitset, /*tp_as_buffer*/
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
+  __Pyx_DOCSTR("\n    Defines an intbitset data object to hold unordered sets of\n    unsigned integers with ultra fast set operations, implemented via\n    bit vectors and Python C extension to optimize speed and memory\n    usage.\n\n    Emulates the Python built-in set class interface with some\n    additional specific methods such as its own fast dump and load\n    marshalling functions.  Uses real bits to optimize memory usage,\n    so may have issues with endianness if you transport serialized\n    bitsets between various machine architectures.\n\n    A set loaded from a container dump (see fastdump()) is kept\n    compressed: the elements of each chunk of 65536 integers are kept\n    as a sorted array, a bitmap or a list of runs, whichever is the\n    smallest.  Set operations work directly on the compressed form; the\n    set is expanded into bits when single elements are added or removed.\n    The containers of a set loaded from a container dump share the\n    memory of the dump rather than copying it, until the set is\n    expanded, when that memory can neither change nor go away: for a\n    str, a buffer over a str or an intbitset_file.  The containers\n    loaded from a bytearray, an mmap or a buffer over them are copied.\n\n    The constructor accept the following parameters:\n        rhs=0, int preallocate=-1, int trailing_bits=0,\n        bint sanity_checks=CFG_INTBITSET_ENABLE_SANITY_CHECKS,\n        int no_allocate=0:\n\n    where:\n        * rhs can be:\n            - int/long for creating allocating empty intbitset that will hold at least\n            rhs elements, before being resized\n            - intbitset for cloning\n            - str for retrieving an intbitset that was dumped into a string,\n            either compressed by zlib or as a container dump\n            - array for retrieving an intbitset that was dumped into a string stored\n            in an array\n            - buffer, mmap or bytearray for retrieving an intbitset that was\n            dumped into their memory\n            - sequence made of integers for copying all the elements from the\n            sequence. If minsize is specified than it is initially allocated\n            enough space to hold up to minsize integers, otherwise the biggest\n            element of the sequence will be used.\n            - sequence made of tuples: then the first element of each tuple\n            is considered as an integer (as in the sequence made of integers).\n        * preallocate is a suggested initial upper bound on the numbers that will be\n            stored, by looking at rhs a sequence of number.\n        * trailing_bits is 1, then the set will contain \"all\" the positive integers\n        * no_allocate is used internally and should never be set.\n        after the biggest one added with rhs.\n    "), /*tp_doc*/
+  __pyx_tp_traverse_9intbitset_intbitset, /*tp_traverse*/
+  __pyx_tp_clear_9intbitset_intbitset, /*tp_clear*/
+  __pyx_pf_9intbitset_9intbitset_4__richcmp__, /*tp_richcompare*/
+  0, /*tp_weaklistoffset*/
+  __pyx_pf_9intbitset_9intbitset_21__iter__, /*tp_iter*/
+  0, /*tp_iternext*/
+  __pyx_methods_9intbitset_intbitset, /*tp_methods*/
+  0, /*tp_members*/
+  0, /*tp_getset*/
+  0, /*tp_base*/
+  0, /*tp_dict*/
+  0, /*tp_descr_get*/
+  0, /*tp_descr_set*/
+  0, /*tp_dictoffset*/
+  0, /*tp_init*/
+  0, /*tp_alloc*/
+  __pyx_tp_new_9intbitset_intbitset, /*tp_new*/
+  0, /*tp_free*/
+  0, /*tp_is_gc*/
+  0, /*tp_bases*/
+  0, /*tp_mro*/
+  0, /*tp_cache*/
+  0, /*tp_subclasses*/
+  0, /*tp_weaklist*/
+  0, /*tp_del*/
+  #if PY_VERSION_HEX >= 0x02060000
+  0, /*tp_version_tag*/
+  #endif
+};
+
+static PyObject *__pyx_tp_new_9intbitset_intbitset_iterator(PyTypeObject *t, PyObject *a, PyObject *k) {
+  struct __pyx_obj_9intbitset_intbitset_iterator *p;
+  PyObject *o = (*t->tp_alloc)(t, 0);
+  if (!o) return 0;
+  p = ((struct __pyx_obj_9intbitset_intbitset_iterator *)o);
+  p->__weakref__ = 0;
+  if (__pyx_pf_9intbitset_18intbitset_iterator___cinit__(o, a, k) < 0) {
+    Py_DECREF(o); o = 0;
+  }
+  return o;
+}
+
+static void __pyx_tp_dealloc_9intbitset_intbitset_iterator(PyObject *o) {
+  struct __pyx_obj_9intbitset_intbitset_iterator *p = (struct __pyx_obj_9intbitset_intbitset_iterator *)o;
+  {
+    PyObject *etype, *eval, *etb;
+    PyErr_Fetch(&etype, &eval, &etb);
+    ++Py_REFCNT(o);
+    __pyx_pf_9intbitset_18intbitset_iterator_1__dealloc__(o);
+    if (PyErr_Occurred()) PyErr_WriteUnraisable(o);
+    --Py_REFCNT(o);
+    PyErr_Restore(etype, eval, etb);
+  }
+  if (p->__weakref__) PyObject_ClearWeakRefs(o);
+  (*Py_TYPE(o)->tp_free)(o);
+}
+
+static int __pyx_tp_traverse_9intbitset_intbitset_iterator(PyObject *o, visitproc v, void *a) {
+  return 0;
+}
+
+static int __pyx_tp_clear_9intbitset_intbitset_iterator(PyObject *o) {
+  return 0;
+}
+
+static PyMethodDef __pyx_methods_9intbitset_intbitset_iterator[] = {
+  {__Pyx_NAMESTR("__next__"), (PyCFunction)__pyx_pf_9intbitset_18intbitset_iterator_2__next__, METH_NOARGS|METH_COEXIST, __Pyx_DOCSTR(0)},
+  {0, 0, 0, 0}
+};
+
+static PyNumberMethods __pyx_tp_as_number_intbitset_iterator = {
+  0, /*nb_add*/
+  0, /*nb_subtract*/
+  0, /*nb_multiply*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*nb_divide*/
+  #endif
+  0, /*nb_remainder*/
+  0, /*nb_divmod*/
+  0, /*nb_power*/
+  0, /*nb_negative*/
+  0, /*nb_positive*/
+  0, /*nb_absolute*/
+  0, /*nb_nonzero*/
+  0, /*nb_invert*/
+  0, /*nb_lshift*/
+  0, /*nb_rshift*/
+  0, /*nb_and*/
+  0, /*nb_xor*/
+  0, /*nb_or*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*nb_coerce*/
+  #endif
+  0, /*nb_int*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*nb_long*/
+  #else
+  0, /*reserved*/
+  #endif
+  0, /*nb_float*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*nb_oct*/
+  #endif
+  #if PY_MAJOR_VERSION < 3
+  0, /*nb_hex*/
+  #endif
+  0, /*nb_inplace_add*/
+  0, /*nb_inplace_subtract*/
+  0, /*nb_inplace_multiply*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*nb_inplace_divide*/
+  #endif
+  0, /*nb_inplace_remainder*/
+  0, /*nb_inplace_power*/
+  0, /*nb_inplace_lshift*/
+  0, /*nb_inplace_rshift*/
+  0, /*nb_inplace_and*/
+  0, /*nb_inplace_xor*/
+  0, /*nb_inplace_or*/
+  0, /*nb_floor_divide*/
+  0, /*nb_true_divide*/
+  0, /*nb_inplace_floor_divide*/
+  0, /*nb_inplace_true_divide*/
+  #if PY_VERSION_HEX >= 0x02050000
+  0, /*nb_index*/
+  #endif
+};
+
+static PySequenceMethods __pyx_tp_as_sequence_intbitset_iterator = {
+  0, /*sq_length*/
+  0, /*sq_concat*/
+  0, /*sq_repeat*/
+  0, /*sq_item*/
+  0, /*sq_slice*/
+  0, /*sq_ass_item*/
+  0, /*sq_ass_slice*/
+  0, /*sq_contains*/
+  0, /*sq_inplace_concat*/
+  0, /*sq_inplace_repeat*/
+};
+
+static PyMappingMethods __pyx_tp_as_mapping_intbitset_iterator = {
+  0, /*mp_length*/
   0, /*mp_subscript*/
   0, /*mp_ass_subscript*/
 };
 
-static PyBufferProcs __pyx_tp_as_buffer_intbitset = {
+static PyBufferProcs __pyx_tp_as_buffer_intbitset_iterator = {
   #if PY_MAJOR_VERSION < 3
   0, /*bf_getreadbuffer*/
   #endif
@@ -8464,39 +12029,39 @@ static PyBufferProcs __pyx_tp_as_buffer_intbitset = {
   #endif
 };
 
-static PyTypeObject __pyx_type_3lib_9intbitset_intbitset = {
+static PyTypeObject __pyx_type_9intbitset_intbitset_iterator = {
   PyVarObject_HEAD_INIT(0, 0)
-  __Pyx_NAMESTR("lib.intbitset.intbitset"), /*tp_name*/
-  sizeof(struct __pyx_obj_3lib_9intbitset_intbitset), /*tp_basicsize*/
+  __Pyx_NAMESTR("intbitset.intbitset_iterator"), /*tp_name*/
+  sizeof(struct __pyx_obj_9intbitset_intbitset_iterator), /*tp_basicsize*/
   0, /*tp_itemsize*/
-  __pyx_tp_dealloc_3lib_9intbitset_intbitset, /*tp_dealloc*/
+  __pyx_tp_dealloc_9intbitset_intbitset_iterator, /*tp_dealloc*/
   0, /*tp_print*/
   0, /*tp_getattr*/
   0, /*tp_setattr*/
   #if PY_MAJOR_VERSION < 3
-  __pyx_pf_3lib_9intbitset_9intbitset_3__cmp__, /*tp_compare*/
+  0, /*tp_compare*/
   #else
   0, /*reserved*/
   #endif
-  __pyx_pf_3lib_9intbitset_9intbitset_19__repr__, /*tp_repr*/
-  &__pyx_tp_as_number_intbitset, /*tp_as_number*/
-  &__pyx_tp_as_sequence_intbitset, /*tp_as_sequence*/
-  &__pyx_tp_as_mapping_intbitset, /*tp_as_mapping*/
-  __pyx_pf_3lib_9intbitset_9intbitset_6__hash__, /*tp_hash*/
+  0, /*tp_repr*/
+  &__pyx_tp_as_number_intbitset_iterator, /*tp_as_number*/
+  &__pyx_tp_as_sequence_intbitset_iterator, /*tp_as_sequence*/
+  &__pyx_tp_as_mapping_intbitset_iterator, /*tp_as_mapping*/
+  0, /*tp_hash*/
   0, /*tp_call*/
-  __pyx_pf_3lib_9intbitset_9intbitset_20__str__, /*tp_str*/
+  0, /*tp_str*/
   0, /*tp_getattro*/
   0, /*tp_setattro*/
-  &__pyx_tp_as_buffer_intbitset, /*tp_as_buffer*/
+  &__pyx_tp_as_buffer_intbitset_iterator, /*tp_as_buffer*/
   Py_TPFLAGS_DEFAULT|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
-  __Pyx_DOCSTR("\n    Defines an intbitset data object to hold unordered sets of\n    unsigned integers with ultra fast set operations, implemented via\n    bit vectors and Python C extension to optimize speed and memory\n    usage.\n\n    Emulates the Python built-in set class interface with some\n    additional specific methods such as its own fast dump and load\n    marshalling functions.  Uses real bits to optimize memory usage,\n    so may have issues with endianness if you transport serialized\n    bitsets between various machine architectures.\n\n    The constructor accept the following parameters:\n        rhs=0, int preallocate=-1, int trailing_bits=0,\n        bint sanity_checks=CFG_INTBITSET_ENABLE_SANITY_CHECKS,\n        int no_allocate=0:\n\n    where:\n        * rhs can be:\n            - int/long for creating allocating empty intbitset that will hold at least\n            rhs elements, before being resized\n            - intbitset for cloning\n            - str for retrieving an intbitset that was dumped into a string\n            - array for retrieving an intbitset that was dumped into a string stored\n            in an array\n            - sequence made of integers for copying all the elements from the\n            sequence. If minsize is specified than it is initially allocated\n            enough space to hold up to minsize integers, otherwise the biggest\n            element of the sequence will be used.\n            - sequence made of tuples: then the first element of each tuple\n            is considered as an integer (as in the sequence made of integers).\n        * preallocate is a suggested initial upper bound on the numbers that will be\n            stored, by looking at rhs a sequence of number.\n        * trailing_bits is 1, then the set will contain \"all\" the positive integers\n        * no_allocate is used internally and should never be set.\n        after the biggest one added with rhs.\n    "), /*tp_doc*/
-  __pyx_tp_traverse_3lib_9intbitset_intbitset, /*tp_traverse*/
-  __pyx_tp_clear_3lib_9intbitset_intbitset, /*tp_clear*/
-  __pyx_pf_3lib_9intbitset_9intbitset_4__richcmp__, /*tp_richcompare*/
+  0, /*tp_doc*/
+  __pyx_tp_traverse_9intbitset_intbitset_iterator, /*tp_traverse*/
+  __pyx_tp_clear_9intbitset_intbitset_iterator, /*tp_clear*/
+  0, /*tp_richcompare*/
   0, /*tp_weaklistoffset*/
-  __pyx_pf_3lib_9intbitset_9intbitset_21__iter__, /*tp_iter*/
-  0, /*tp_iternext*/
-  __pyx_methods_3lib_9intbitset_intbitset, /*tp_methods*/
+  __pyx_pf_9intbitset_18intbitset_iterator_3__iter__, /*tp_iter*/
+  __pyx_pf_9intbitset_18intbitset_iterator_2__next__, /*tp_iternext*/
+  __pyx_methods_9intbitset_intbitset_iterator, /*tp_methods*/
   0, /*tp_members*/
   0, /*tp_getset*/
   0, /*tp_base*/
@@ -8506,7 +12071,7 @@ static PyTypeObject __pyx_type_3lib_9intbitset_intbitset = {
   0, /*tp_dictoffset*/
   0, /*tp_init*/
   0, /*tp_alloc*/
-  __pyx_tp_new_3lib_9intbitset_intbitset, /*tp_new*/
+  __pyx_tp_new_9intbitset_intbitset_iterator, /*tp_new*/
   0, /*tp_free*/
   0, /*tp_is_gc*/
   0, /*tp_bases*/
@@ -8519,48 +12084,40 @@ static PyTypeObject __pyx_type_3lib_9intbitset_intbitset = {
   0, /*tp_version_tag*/
   #endif
 };
+static struct __pyx_vtabstruct_9intbitset_intbitset_file __pyx_vtable_9intbitset_intbitset_file;
 
-static PyObject *__pyx_tp_new_3lib_9intbitset_intbitset_iterator(PyTypeObject *t, PyObject *a, PyObject *k) {
-  struct __pyx_obj_3lib_9intbitset_intbitset_iterator *p;
+static PyObject *__pyx_tp_new_9intbitset_intbitset_file(PyTypeObject *t, PyObject *a, PyObject *k) {
+  struct __pyx_obj_9intbitset_intbitset_file *p;
   PyObject *o = (*t->tp_alloc)(t, 0);
   if (!o) return 0;
-  p = ((struct __pyx_obj_3lib_9intbitset_intbitset_iterator *)o);
-  p->__weakref__ = 0;
-  if (__pyx_pf_3lib_9intbitset_18intbitset_iterator___cinit__(o, a, k) < 0) {
+  p = ((struct __pyx_obj_9intbitset_intbitset_file *)o);
+  p->__pyx_vtab = __pyx_vtabptr_9intbitset_intbitset_file;
+  if (__pyx_pf_9intbitset_14intbitset_file___cinit__(o, a, k) < 0) {
     Py_DECREF(o); o = 0;
   }
   return o;
 }
 
-static void __pyx_tp_dealloc_3lib_9intbitset_intbitset_iterator(PyObject *o) {
-  struct __pyx_obj_3lib_9intbitset_intbitset_iterator *p = (struct __pyx_obj_3lib_9intbitset_intbitset_iterator *)o;
+static void __pyx_tp_dealloc_9intbitset_intbitset_file(PyObject *o) {
   {
     PyObject *etype, *eval, *etb;
     PyErr_Fetch(&etype, &eval, &etb);
     ++Py_REFCNT(o);
-    __pyx_pf_3lib_9intbitset_18intbitset_iterator_1__dealloc__(o);
+    __pyx_pf_9intbitset_14intbitset_file_1__dealloc__(o);
     if (PyErr_Occurred()) PyErr_WriteUnraisable(o);
     --Py_REFCNT(o);
     PyErr_Restore(etype, eval, etb);
   }
-  if (p->__weakref__) PyObject_ClearWeakRefs(o);
   (*Py_TYPE(o)->tp_free)(o);
 }
 
-static int __pyx_tp_traverse_3lib_9intbitset_intbitset_iterator(PyObject *o, visitproc v, void *a) {
-  return 0;
-}
-
-static int __pyx_tp_clear_3lib_9intbitset_intbitset_iterator(PyObject *o) {
-  return 0;
-}
-
-static PyMethodDef __pyx_methods_3lib_9intbitset_intbitset_iterator[] = {
-  {__Pyx_NAMESTR("__next__"), (PyCFunction)__pyx_pf_3lib_9intbitset_18intbitset_iterator_2__next__, METH_NOARGS|METH_COEXIST, __Pyx_DOCSTR(0)},
+static PyMethodDef __pyx_methods_9intbitset_intbitset_file[] = {
+  {__Pyx_NAMESTR("read"), (PyCFunction)__pyx_pf_9intbitset_14intbitset_file_3read, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_9intbitset_14intbitset_file_3read)},
+  {__Pyx_NAMESTR("load"), (PyCFunction)__pyx_pf_9intbitset_14intbitset_file_4load, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_9intbitset_14intbitset_file_4load)},
   {0, 0, 0, 0}
 };
 
-static PyNumberMethods __pyx_tp_as_number_intbitset_iterator = {
+static PyNumberMethods __pyx_tp_as_number_intbitset_file = {
   0, /*nb_add*/
   0, /*nb_subtract*/
   0, /*nb_multiply*/
@@ -8618,8 +12175,8 @@ static PyNumberMethods __pyx_tp_as_number_intbitset_iterator = {
   #endif
 };
 
-static PySequenceMethods __pyx_tp_as_sequence_intbitset_iterator = {
-  0, /*sq_length*/
+static PySequenceMethods __pyx_tp_as_sequence_intbitset_file = {
+  __pyx_pf_9intbitset_14intbitset_file_2__len__, /*sq_length*/
   0, /*sq_concat*/
   0, /*sq_repeat*/
   0, /*sq_item*/
@@ -8631,13 +12188,13 @@ static PySequenceMethods __pyx_tp_as_sequence_intbitset_iterator = {
   0, /*sq_inplace_repeat*/
 };
 
-static PyMappingMethods __pyx_tp_as_mapping_intbitset_iterator = {
-  0, /*mp_length*/
+static PyMappingMethods __pyx_tp_as_mapping_intbitset_file = {
+  __pyx_pf_9intbitset_14intbitset_file_2__len__, /*mp_length*/
   0, /*mp_subscript*/
   0, /*mp_ass_subscript*/
 };
 
-static PyBufferProcs __pyx_tp_as_buffer_intbitset_iterator = {
+static PyBufferProcs __pyx_tp_as_buffer_intbitset_file = {
   #if PY_MAJOR_VERSION < 3
   0, /*bf_getreadbuffer*/
   #endif
@@ -8658,12 +12215,12 @@ static PyBufferProcs __pyx_tp_as_buffer_intbitset_iterator = {
   #endif
 };
 
-static PyTypeObject __pyx_type_3lib_9intbitset_intbitset_iterator = {
+static PyTypeObject __pyx_type_9intbitset_intbitset_file = {
   PyVarObject_HEAD_INIT(0, 0)
-  __Pyx_NAMESTR("lib.intbitset.intbitset_iterator"), /*tp_name*/
-  sizeof(struct __pyx_obj_3lib_9intbitset_intbitset_iterator), /*tp_basicsize*/
+  __Pyx_NAMESTR("intbitset.intbitset_file"), /*tp_name*/
+  sizeof(struct __pyx_obj_9intbitset_intbitset_file), /*tp_basicsize*/
   0, /*tp_itemsize*/
-  __pyx_tp_dealloc_3lib_9intbitset_intbitset_iterator, /*tp_dealloc*/
+  __pyx_tp_dealloc_9intbitset_intbitset_file, /*tp_dealloc*/
   0, /*tp_print*/
   0, /*tp_getattr*/
   0, /*tp_setattr*/
@@ -8673,24 +12230,24 @@ static PyTypeObject __pyx_type_3lib_9intbitset_intbitset_iterator = {
   0, /*reserved*/
   #endif
   0, /*tp_repr*/
-  &__pyx_tp_as_number_intbitset_iterator, /*tp_as_number*/
-  &__pyx_tp_as_sequence_intbitset_iterator, /*tp_as_sequence*/
-  &__pyx_tp_as_mapping_intbitset_iterator, /*tp_as_mapping*/
+  &__pyx_tp_as_number_intbitset_file, /*tp_as_number*/
+  &__pyx_tp_as_sequence_intbitset_file, /*tp_as_sequence*/
+  &__pyx_tp_as_mapping_intbitset_file, /*tp_as_mapping*/
   0, /*tp_hash*/
   0, /*tp_call*/
   0, /*tp_str*/
   0, /*tp_getattro*/
   0, /*tp_setattro*/
-  &__pyx_tp_as_buffer_intbitset_iterator, /*tp_as_buffer*/
-  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
-  0, /*tp_doc*/
-  __pyx_tp_traverse_3lib_9intbitset_intbitset_iterator, /*tp_traverse*/
-  __pyx_tp_clear_3lib_9intbitset_intbitset_iterator, /*tp_clear*/
+  &__pyx_tp_as_buffer_intbitset_file, /*tp_as_buffer*/
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE, /*tp_flags*/
+  __Pyx_DOCSTR("\n    Read-only memory map of a file holding container dumps (see\n    intbitset.fastdump()) at known offsets, e.g. the dumps of many sets\n    written one after the other.  The sets loaded from the file share\n    the mapped memory instead of copying their containers.  The map can\n    not be closed: the file is unmapped when neither the intbitset_file\n    nor any set loaded from it is in use anymore.\n    "), /*tp_doc*/
+  0, /*tp_traverse*/
+  0, /*tp_clear*/
   0, /*tp_richcompare*/
   0, /*tp_weaklistoffset*/
-  __pyx_pf_3lib_9intbitset_18intbitset_iterator_3__iter__, /*tp_iter*/
-  __pyx_pf_3lib_9intbitset_18intbitset_iterator_2__next__, /*tp_iternext*/
-  __pyx_methods_3lib_9intbitset_intbitset_iterator, /*tp_methods*/
+  0, /*tp_iter*/
+  0, /*tp_iternext*/
+  __pyx_methods_9intbitset_intbitset_file, /*tp_methods*/
   0, /*tp_members*/
   0, /*tp_getset*/
   0, /*tp_base*/
@@ -8700,7 +12257,7 @@ static PyTypeObject __pyx_type_3lib_9intbitset_intbitset_iterator = {
   0, /*tp_dictoffset*/
   0, /*tp_init*/
   0, /*tp_alloc*/
-  __pyx_tp_new_3lib_9intbitset_intbitset_iterator, /*tp_new*/
+  __pyx_tp_new_9intbitset_intbitset_file, /*tp_new*/
   0, /*tp_free*/
   0, /*tp_is_gc*/
   0, /*tp_bases*/
@@ -8734,52 +12291,62 @@ static struct PyModuleDef __pyx_moduledef = {
 
 static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_kp_s_10, __pyx_k_10, sizeof(__pyx_k_10), 0, 0, 1, 0},
-  {&__pyx_kp_s_14, __pyx_k_14, sizeof(__pyx_k_14), 0, 0, 1, 0},
-  {&__pyx_kp_s_15, __pyx_k_15, sizeof(__pyx_k_15), 0, 0, 1, 0},
+  {&__pyx_kp_s_11, __pyx_k_11, sizeof(__pyx_k_11), 0, 0, 1, 0},
+  {&__pyx_kp_s_13, __pyx_k_13, sizeof(__pyx_k_13), 0, 0, 1, 0},
   {&__pyx_kp_s_17, __pyx_k_17, sizeof(__pyx_k_17), 0, 0, 1, 0},
   {&__pyx_kp_s_18, __pyx_k_18, sizeof(__pyx_k_18), 0, 0, 1, 0},
   {&__pyx_kp_s_2, __pyx_k_2, sizeof(__pyx_k_2), 0, 0, 1, 0},
+  {&__pyx_kp_s_20, __pyx_k_20, sizeof(__pyx_k_20), 0, 0, 1, 0},
   {&__pyx_kp_s_21, __pyx_k_21, sizeof(__pyx_k_21), 0, 0, 1, 0},
-  {&__pyx_kp_s_27, __pyx_k_27, sizeof(__pyx_k_27), 0, 0, 1, 0},
-  {&__pyx_kp_s_28, __pyx_k_28, sizeof(__pyx_k_28), 0, 0, 1, 0},
+  {&__pyx_kp_s_24, __pyx_k_24, sizeof(__pyx_k_24), 0, 0, 1, 0},
   {&__pyx_kp_s_30, __pyx_k_30, sizeof(__pyx_k_30), 0, 0, 1, 0},
   {&__pyx_kp_s_31, __pyx_k_31, sizeof(__pyx_k_31), 0, 0, 1, 0},
-  {&__pyx_kp_s_32, __pyx_k_32, sizeof(__pyx_k_32), 0, 0, 1, 0},
+  {&__pyx_kp_s_33, __pyx_k_33, sizeof(__pyx_k_33), 0, 0, 1, 0},
   {&__pyx_kp_s_34, __pyx_k_34, sizeof(__pyx_k_34), 0, 0, 1, 0},
   {&__pyx_kp_s_35, __pyx_k_35, sizeof(__pyx_k_35), 0, 0, 1, 0},
-  {&__pyx_kp_s_36, __pyx_k_36, sizeof(__pyx_k_36), 0, 0, 1, 0},
+  {&__pyx_kp_s_37, __pyx_k_37, sizeof(__pyx_k_37), 0, 0, 1, 0},
+  {&__pyx_kp_s_38, __pyx_k_38, sizeof(__pyx_k_38), 0, 0, 1, 0},
+  {&__pyx_kp_s_39, __pyx_k_39, sizeof(__pyx_k_39), 0, 0, 1, 0},
   {&__pyx_kp_s_4, __pyx_k_4, sizeof(__pyx_k_4), 0, 0, 1, 0},
-  {&__pyx_kp_s_40, __pyx_k_40, sizeof(__pyx_k_40), 0, 0, 1, 0},
-  {&__pyx_kp_s_42, __pyx_k_42, sizeof(__pyx_k_42), 0, 0, 1, 0},
+  {&__pyx_kp_s_43, __pyx_k_43, sizeof(__pyx_k_43), 0, 0, 1, 0},
   {&__pyx_kp_s_45, __pyx_k_45, sizeof(__pyx_k_45), 0, 0, 1, 0},
-  {&__pyx_kp_s_47, __pyx_k_47, sizeof(__pyx_k_47), 0, 0, 1, 0},
-  {&__pyx_kp_s_49, __pyx_k_49, sizeof(__pyx_k_49), 0, 0, 1, 0},
+  {&__pyx_kp_s_48, __pyx_k_48, sizeof(__pyx_k_48), 0, 0, 1, 0},
   {&__pyx_kp_s_50, __pyx_k_50, sizeof(__pyx_k_50), 0, 0, 1, 0},
   {&__pyx_kp_s_52, __pyx_k_52, sizeof(__pyx_k_52), 0, 0, 1, 0},
-  {&__pyx_kp_s_54, __pyx_k_54, sizeof(__pyx_k_54), 0, 0, 1, 0},
+  {&__pyx_kp_s_53, __pyx_k_53, sizeof(__pyx_k_53), 0, 0, 1, 0},
   {&__pyx_kp_s_55, __pyx_k_55, sizeof(__pyx_k_55), 0, 0, 1, 0},
   {&__pyx_kp_s_57, __pyx_k_57, sizeof(__pyx_k_57), 0, 0, 1, 0},
-  {&__pyx_kp_s_59, __pyx_k_59, sizeof(__pyx_k_59), 0, 0, 1, 0},
+  {&__pyx_kp_s_58, __pyx_k_58, sizeof(__pyx_k_58), 0, 0, 1, 0},
   {&__pyx_kp_s_6, __pyx_k_6, sizeof(__pyx_k_6), 0, 0, 1, 0},
   {&__pyx_kp_s_60, __pyx_k_60, sizeof(__pyx_k_60), 0, 0, 1, 0},
-  {&__pyx_kp_s_61, __pyx_k_61, sizeof(__pyx_k_61), 0, 0, 1, 0},
-  {&__pyx_n_s_63, __pyx_k_63, sizeof(__pyx_k_63), 0, 0, 1, 1},
+  {&__pyx_kp_s_62, __pyx_k_62, sizeof(__pyx_k_62), 0, 0, 1, 0},
   {&__pyx_kp_s_64, __pyx_k_64, sizeof(__pyx_k_64), 0, 0, 1, 0},
-  {&__pyx_n_s_65, __pyx_k_65, sizeof(__pyx_k_65), 0, 0, 1, 1},
-  {&__pyx_kp_s_7, __pyx_k_7, sizeof(__pyx_k_7), 0, 0, 1, 0},
-  {&__pyx_kp_s_8, __pyx_k_8, sizeof(__pyx_k_8), 0, 0, 1, 0},
+  {&__pyx_kp_s_65, __pyx_k_65, sizeof(__pyx_k_65), 0, 0, 1, 0},
+  {&__pyx_n_s_67, __pyx_k_67, sizeof(__pyx_k_67), 0, 0, 1, 1},
+  {&__pyx_kp_s_68, __pyx_k_68, sizeof(__pyx_k_68), 0, 0, 1, 0},
+  {&__pyx_kp_s_69, __pyx_k_69, sizeof(__pyx_k_69), 0, 0, 1, 0},
+  {&__pyx_kp_s_70, __pyx_k_70, sizeof(__pyx_k_70), 0, 0, 1, 0},
+  {&__pyx_kp_s_72, __pyx_k_72, sizeof(__pyx_k_72), 0, 0, 1, 0},
+  {&__pyx_kp_s_73, __pyx_k_73, sizeof(__pyx_k_73), 0, 0, 1, 0},
+  {&__pyx_kp_s_75, __pyx_k_75, sizeof(__pyx_k_75), 0, 0, 1, 0},
+  {&__pyx_kp_s_76, __pyx_k_76, sizeof(__pyx_k_76), 0, 0, 1, 0},
+  {&__pyx_n_s_77, __pyx_k_77, sizeof(__pyx_k_77), 0, 0, 1, 1},
+  {&__pyx_kp_s_9, __pyx_k_9, sizeof(__pyx_k_9), 0, 0, 1, 0},
   {&__pyx_kp_s__0, __pyx_k__0, sizeof(__pyx_k__0), 0, 0, 1, 0},
   {&__pyx_kp_s__1, __pyx_k__1, sizeof(__pyx_k__1), 0, 0, 1, 0},
   {&__pyx_n_s__AttributeError, __pyx_k__AttributeError, sizeof(__pyx_k__AttributeError), 0, 0, 1, 1},
+  {&__pyx_n_s__EnvironmentError, __pyx_k__EnvironmentError, sizeof(__pyx_k__EnvironmentError), 0, 0, 1, 1},
   {&__pyx_n_s__Error, __pyx_k__Error, sizeof(__pyx_k__Error), 0, 0, 1, 1},
   {&__pyx_n_s__Exception, __pyx_k__Exception, sizeof(__pyx_k__Exception), 0, 0, 1, 1},
   {&__pyx_n_s__IndexError, __pyx_k__IndexError, sizeof(__pyx_k__IndexError), 0, 0, 1, 1},
   {&__pyx_n_s__KeyError, __pyx_k__KeyError, sizeof(__pyx_k__KeyError), 0, 0, 1, 1},
   {&__pyx_n_s__MemoryError, __pyx_k__MemoryError, sizeof(__pyx_k__MemoryError), 0, 0, 1, 1},
+  {&__pyx_n_s__NameError, __pyx_k__NameError, sizeof(__pyx_k__NameError), 0, 0, 1, 1},
   {&__pyx_n_s__OverflowError, __pyx_k__OverflowError, sizeof(__pyx_k__OverflowError), 0, 0, 1, 1},
   {&__pyx_n_s__StopIteration, __pyx_k__StopIteration, sizeof(__pyx_k__StopIteration), 0, 0, 1, 1},
   {&__pyx_n_s__TypeError, __pyx_k__TypeError, sizeof(__pyx_k__TypeError), 0, 0, 1, 1},
   {&__pyx_n_s__ValueError, __pyx_k__ValueError, sizeof(__pyx_k__ValueError), 0, 0, 1, 1},
+  {&__pyx_n_s___MANY_BATCH, __pyx_k___MANY_BATCH, sizeof(__pyx_k___MANY_BATCH), 0, 0, 1, 1},
   {&__pyx_n_s____all__, __pyx_k____all__, sizeof(__pyx_k____all__), 0, 0, 1, 1},
   {&__pyx_n_s____and__, __pyx_k____and__, sizeof(__pyx_k____and__), 0, 0, 1, 1},
   {&__pyx_n_s____apilevel__, __pyx_k____apilevel__, sizeof(__pyx_k____apilevel__), 0, 0, 1, 1},
@@ -8792,50 +12359,84 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s____le__, __pyx_k____le__, sizeof(__pyx_k____le__), 0, 0, 1, 1},
   {&__pyx_n_s____main__, __pyx_k____main__, sizeof(__pyx_k____main__), 0, 0, 1, 1},
   {&__pyx_n_s____maxelem__, __pyx_k____maxelem__, sizeof(__pyx_k____maxelem__), 0, 0, 1, 1},
+  {&__pyx_n_s____name__, __pyx_k____name__, sizeof(__pyx_k____name__), 0, 0, 1, 1},
   {&__pyx_n_s____or__, __pyx_k____or__, sizeof(__pyx_k____or__), 0, 0, 1, 1},
   {&__pyx_n_s____repr__, __pyx_k____repr__, sizeof(__pyx_k____repr__), 0, 0, 1, 1},
   {&__pyx_n_s____revision__, __pyx_k____revision__, sizeof(__pyx_k____revision__), 0, 0, 1, 1},
   {&__pyx_n_s____sub__, __pyx_k____sub__, sizeof(__pyx_k____sub__), 0, 0, 1, 1},
   {&__pyx_n_s____test__, __pyx_k____test__, sizeof(__pyx_k____test__), 0, 0, 1, 1},
   {&__pyx_n_s____xor__, __pyx_k____xor__, sizeof(__pyx_k____xor__), 0, 0, 1, 1},
+  {&__pyx_n_s___buffer_types, __pyx_k___buffer_types, sizeof(__pyx_k___buffer_types), 0, 0, 1, 1},
+  {&__pyx_n_s___check_range, __pyx_k___check_range, sizeof(__pyx_k___check_range), 0, 0, 1, 1},
   {&__pyx_n_s__allocated, __pyx_k__allocated, sizeof(__pyx_k__allocated), 0, 0, 1, 1},
   {&__pyx_n_s__append, __pyx_k__append, sizeof(__pyx_k__append), 0, 0, 1, 1},
   {&__pyx_n_s__array, __pyx_k__array, sizeof(__pyx_k__array), 0, 0, 1, 1},
+  {&__pyx_n_s__b_base, __pyx_k__b_base, sizeof(__pyx_k__b_base), 0, 0, 1, 1},
   {&__pyx_n_s__bitset, __pyx_k__bitset, sizeof(__pyx_k__bitset), 0, 0, 1, 1},
+  {&__pyx_n_s__buffer, __pyx_k__buffer, sizeof(__pyx_k__buffer), 0, 0, 1, 1},
+  {&__pyx_n_s__bytearray, __pyx_k__bytearray, sizeof(__pyx_k__bytearray), 0, 0, 1, 1},
+  {&__pyx_n_s__close, __pyx_k__close, sizeof(__pyx_k__close), 0, 0, 1, 1},
   {&__pyx_n_s__compress, __pyx_k__compress, sizeof(__pyx_k__compress), 0, 0, 1, 1},
+  {&__pyx_n_s__containers, __pyx_k__containers, sizeof(__pyx_k__containers), 0, 0, 1, 1},
+  {&__pyx_n_s__count_many, __pyx_k__count_many, sizeof(__pyx_k__count_many), 0, 0, 1, 1},
+  {&__pyx_n_s__data, __pyx_k__data, sizeof(__pyx_k__data), 0, 0, 1, 1},
   {&__pyx_n_s__decompress, __pyx_k__decompress, sizeof(__pyx_k__decompress), 0, 0, 1, 1},
+  {&__pyx_n_s__dump, __pyx_k__dump, sizeof(__pyx_k__dump), 0, 0, 1, 1},
   {&__pyx_n_s__extract_finite_list, __pyx_k__extract_finite_list, sizeof(__pyx_k__extract_finite_list), 0, 0, 1, 1},
+  {&__pyx_n_s__fileno, __pyx_k__fileno, sizeof(__pyx_k__fileno), 0, 0, 1, 1},
+  {&__pyx_n_s__fstat, __pyx_k__fstat, sizeof(__pyx_k__fstat), 0, 0, 1, 1},
   {&__pyx_n_s__i, __pyx_k__i, sizeof(__pyx_k__i), 0, 0, 1, 1},
   {&__pyx_n_s__intbitset, __pyx_k__intbitset, sizeof(__pyx_k__intbitset), 0, 0, 1, 1},
+  {&__pyx_n_s__intbitset_file, __pyx_k__intbitset_file, sizeof(__pyx_k__intbitset_file), 0, 0, 1, 1},
+  {&__pyx_n_s__intersection_many, __pyx_k__intersection_many, sizeof(__pyx_k__intersection_many), 0, 0, 1, 1},
+  {&__pyx_n_s__islice, __pyx_k__islice, sizeof(__pyx_k__islice), 0, 0, 1, 1},
   {&__pyx_n_s__iteritems, __pyx_k__iteritems, sizeof(__pyx_k__iteritems), 0, 0, 1, 1},
+  {&__pyx_n_s__itertools, __pyx_k__itertools, sizeof(__pyx_k__itertools), 0, 0, 1, 1},
   {&__pyx_n_s__j, __pyx_k__j, sizeof(__pyx_k__j), 0, 0, 1, 1},
   {&__pyx_n_s__join, __pyx_k__join, sizeof(__pyx_k__join), 0, 0, 1, 1},
   {&__pyx_n_s__last, __pyx_k__last, sizeof(__pyx_k__last), 0, 0, 1, 1},
+  {&__pyx_n_s__length, __pyx_k__length, sizeof(__pyx_k__length), 0, 0, 1, 1},
   {&__pyx_n_s__max, __pyx_k__max, sizeof(__pyx_k__max), 0, 0, 1, 1},
+  {&__pyx_n_s__mmap, __pyx_k__mmap, sizeof(__pyx_k__mmap), 0, 0, 1, 1},
   {&__pyx_n_s__no_allocate, __pyx_k__no_allocate, sizeof(__pyx_k__no_allocate), 0, 0, 1, 1},
+  {&__pyx_n_s__offset, __pyx_k__offset, sizeof(__pyx_k__offset), 0, 0, 1, 1},
+  {&__pyx_n_s__open, __pyx_k__open, sizeof(__pyx_k__open), 0, 0, 1, 1},
+  {&__pyx_n_s__os, __pyx_k__os, sizeof(__pyx_k__os), 0, 0, 1, 1},
+  {&__pyx_n_s__path, __pyx_k__path, sizeof(__pyx_k__path), 0, 0, 1, 1},
   {&__pyx_n_s__preallocate, __pyx_k__preallocate, sizeof(__pyx_k__preallocate), 0, 0, 1, 1},
+  {&__pyx_n_s__rb, __pyx_k__rb, sizeof(__pyx_k__rb), 0, 0, 1, 1},
+  {&__pyx_n_s__read, __pyx_k__read, sizeof(__pyx_k__read), 0, 0, 1, 1},
   {&__pyx_n_s__rhs, __pyx_k__rhs, sizeof(__pyx_k__rhs), 0, 0, 1, 1},
   {&__pyx_n_s__sanity_checks, __pyx_k__sanity_checks, sizeof(__pyx_k__sanity_checks), 0, 0, 1, 1},
+  {&__pyx_n_s__sets, __pyx_k__sets, sizeof(__pyx_k__sets), 0, 0, 1, 1},
   {&__pyx_n_s__size, __pyx_k__size, sizeof(__pyx_k__size), 0, 0, 1, 1},
+  {&__pyx_n_s__st_size, __pyx_k__st_size, sizeof(__pyx_k__st_size), 0, 0, 1, 1},
   {&__pyx_n_s__sys, __pyx_k__sys, sizeof(__pyx_k__sys), 0, 0, 1, 1},
   {&__pyx_n_s__to_sorted_list, __pyx_k__to_sorted_list, sizeof(__pyx_k__to_sorted_list), 0, 0, 1, 1},
   {&__pyx_n_s__tostring, __pyx_k__tostring, sizeof(__pyx_k__tostring), 0, 0, 1, 1},
   {&__pyx_n_s__trailing_bits, __pyx_k__trailing_bits, sizeof(__pyx_k__trailing_bits), 0, 0, 1, 1},
+  {&__pyx_n_s__union_many, __pyx_k__union_many, sizeof(__pyx_k__union_many), 0, 0, 1, 1},
   {&__pyx_n_s__up_to, __pyx_k__up_to, sizeof(__pyx_k__up_to), 0, 0, 1, 1},
+  {&__pyx_n_s__weights, __pyx_k__weights, sizeof(__pyx_k__weights), 0, 0, 1, 1},
   {&__pyx_n_s__zlib, __pyx_k__zlib, sizeof(__pyx_k__zlib), 0, 0, 1, 1},
   {0, 0, 0, 0, 0, 0, 0}
 };
 static int __Pyx_InitCachedBuiltins(void) {
-  __pyx_builtin_ValueError = __Pyx_GetName(__pyx_b, __pyx_n_s__ValueError); if (!__pyx_builtin_ValueError) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 172; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_builtin_Exception = __Pyx_GetName(__pyx_b, __pyx_n_s__Exception); if (!__pyx_builtin_Exception) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 182; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_builtin_max = __Pyx_GetName(__pyx_b, __pyx_n_s__max); if (!__pyx_builtin_max) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 194; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_builtin_OverflowError = __Pyx_GetName(__pyx_b, __pyx_n_s__OverflowError); if (!__pyx_builtin_OverflowError) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 199; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_builtin_TypeError = __Pyx_GetName(__pyx_b, __pyx_n_s__TypeError); if (!__pyx_builtin_TypeError) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 264; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_builtin_KeyError = __Pyx_GetName(__pyx_b, __pyx_n_s__KeyError); if (!__pyx_builtin_KeyError) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 583; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_builtin_AttributeError = __Pyx_GetName(__pyx_b, __pyx_n_s__AttributeError); if (!__pyx_builtin_AttributeError) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 637; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_builtin_IndexError = __Pyx_GetName(__pyx_b, __pyx_n_s__IndexError); if (!__pyx_builtin_IndexError) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 664; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_builtin_StopIteration = __Pyx_GetName(__pyx_b, __pyx_n_s__StopIteration); if (!__pyx_builtin_StopIteration) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 757; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_builtin_MemoryError = __Pyx_GetName(__pyx_b, __pyx_n_s__MemoryError); if (!__pyx_builtin_MemoryError) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 760; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_builtin_buffer = __Pyx_GetName(__pyx_b, __pyx_n_s__buffer); if (!__pyx_builtin_buffer) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 51; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_builtin_bytearray = __Pyx_GetName(__pyx_b, __pyx_n_s__bytearray); if (!__pyx_builtin_bytearray) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 51; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_builtin_NameError = __Pyx_GetName(__pyx_b, __pyx_n_s__NameError); if (!__pyx_builtin_NameError) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 52; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_builtin_ValueError = __Pyx_GetName(__pyx_b, __pyx_n_s__ValueError); if (!__pyx_builtin_ValueError) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 244; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_builtin_Exception = __Pyx_GetName(__pyx_b, __pyx_n_s__Exception); if (!__pyx_builtin_Exception) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 253; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_builtin_max = __Pyx_GetName(__pyx_b, __pyx_n_s__max); if (!__pyx_builtin_max) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 276; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_builtin_OverflowError = __Pyx_GetName(__pyx_b, __pyx_n_s__OverflowError); if (!__pyx_builtin_OverflowError) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 281; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_builtin_TypeError = __Pyx_GetName(__pyx_b, __pyx_n_s__TypeError); if (!__pyx_builtin_TypeError) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 346; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_builtin_KeyError = __Pyx_GetName(__pyx_b, __pyx_n_s__KeyError); if (!__pyx_builtin_KeyError) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 693; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_builtin_AttributeError = __Pyx_GetName(__pyx_b, __pyx_n_s__AttributeError); if (!__pyx_builtin_AttributeError) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 747; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_builtin_IndexError = __Pyx_GetName(__pyx_b, __pyx_n_s__IndexError); if (!__pyx_builtin_IndexError) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 770; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_builtin_StopIteration = __Pyx_GetName(__pyx_b, __pyx_n_s__StopIteration); if (!__pyx_builtin_StopIteration) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 877; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_builtin_MemoryError = __Pyx_GetName(__pyx_b, __pyx_n_s__MemoryError); if (!__pyx_builtin_MemoryError) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 880; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_builtin_open = __Pyx_GetName(__pyx_b, __pyx_n_s__open); if (!__pyx_builtin_open) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 907; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_builtin_EnvironmentError = __Pyx_GetName(__pyx_b, __pyx_n_s__EnvironmentError); if (!__pyx_builtin_EnvironmentError) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 913; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   return 0;
   __pyx_L1_error:;
   return -1;
@@ -8844,417 +12445,487 @@ static int __Pyx_InitCachedBuiltins(void) {
 static int __Pyx_InitCachedConstants(void) {
   __Pyx_RefNannySetupContext("__Pyx_InitCachedConstants");
 
-  /* "lib/intbitset.pyx":172
+  /* "intbitset.pyx":244
  *             if type(rhs) in (int, long):
  *                 if rhs < 0:
  *                     raise ValueError("rhs can't be negative")             # <<<<<<<<<<<<<<
  *                 self.bitset = intBitSetCreate(rhs, trailing_bits)
  *             elif type(rhs) is intbitset:
  */
-  __pyx_k_tuple_3 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 172; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_k_tuple_3 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 244; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(((PyObject *)__pyx_k_tuple_3));
   __Pyx_INCREF(((PyObject *)__pyx_kp_s_2));
   PyTuple_SET_ITEM(__pyx_k_tuple_3, 0, ((PyObject *)__pyx_kp_s_2));
   __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_2));
   __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_3));
 
-  /* "lib/intbitset.pyx":182
- *                     tmp = zlib.decompress(rhs)
- *                     if PyObject_AsReadBuffer(tmp, &buf, &size) < 0:
+  /* "intbitset.pyx":253
+ *                         rhs = rhs.tostring()
+ *                     if PyObject_AsReadBuffer(rhs, &buf, &size) < 0:
  *                         raise Exception("Buffer error!!!")             # <<<<<<<<<<<<<<
- *                     if (size % wordbytesize):
- *                         ## Wrong size!
+ *                     if intBitSetIsContainerBuffer(buf, size):
+ *                         borrow = _is_immutable_buffer(rhs)
  */
-  __pyx_k_tuple_5 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 182; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_k_tuple_5 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 253; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(((PyObject *)__pyx_k_tuple_5));
   __Pyx_INCREF(((PyObject *)__pyx_kp_s_4));
   PyTuple_SET_ITEM(__pyx_k_tuple_5, 0, ((PyObject *)__pyx_kp_s_4));
   __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_4));
   __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_5));
 
-  /* "lib/intbitset.pyx":208
+  /* "intbitset.pyx":258
+ *                         self.bitset = intBitSetCreateFromContainerBuffer(buf, size, borrow)
+ *                         if self.bitset == NULL:
+ *                             raise Exception("Corrupted container dump")             # <<<<<<<<<<<<<<
+ *                         if borrow:
+ *                             self.dump = rhs
+ */
+  __pyx_k_tuple_7 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 258; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_k_tuple_7));
+  __Pyx_INCREF(((PyObject *)__pyx_kp_s_6));
+  PyTuple_SET_ITEM(__pyx_k_tuple_7, 0, ((PyObject *)__pyx_kp_s_6));
+  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_6));
+  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_7));
+
+  /* "intbitset.pyx":264
+ *                         tmp = zlib.decompress(rhs)
+ *                         if PyObject_AsReadBuffer(tmp, &buf, &size) < 0:
+ *                             raise Exception("Buffer error!!!")             # <<<<<<<<<<<<<<
+ *                         if (size % wordbytesize):
+ *                             ## Wrong size!
+ */
+  __pyx_k_tuple_8 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 264; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_k_tuple_8));
+  __Pyx_INCREF(((PyObject *)__pyx_kp_s_4));
+  PyTuple_SET_ITEM(__pyx_k_tuple_8, 0, ((PyObject *)__pyx_kp_s_4));
+  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_4));
+  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_8));
+
+  /* "intbitset.pyx":290
  *                                     elem = tmp_tuple[0]
  *                                     if elem < 0:
  *                                         raise ValueError("Negative numbers, not allowed")             # <<<<<<<<<<<<<<
  *                                     elif elem > maxelem:
  *                                         raise OverflowError("Elements must be <= %s" % maxelem)
  */
-  __pyx_k_tuple_9 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 208; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_k_tuple_9));
-  __Pyx_INCREF(((PyObject *)__pyx_kp_s_8));
-  PyTuple_SET_ITEM(__pyx_k_tuple_9, 0, ((PyObject *)__pyx_kp_s_8));
-  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_8));
-  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_9));
+  __pyx_k_tuple_12 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_12)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 290; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_k_tuple_12));
+  __Pyx_INCREF(((PyObject *)__pyx_kp_s_11));
+  PyTuple_SET_ITEM(__pyx_k_tuple_12, 0, ((PyObject *)__pyx_kp_s_11));
+  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_11));
+  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_12));
 
-  /* "lib/intbitset.pyx":217
+  /* "intbitset.pyx":299
  *                                 for elem in rhs:
  *                                     if elem < 0:
  *                                         raise ValueError("Negative numbers, not allowed")             # <<<<<<<<<<<<<<
  *                                     elif elem > maxelem:
  *                                         raise OverflowError("Elements must be <= %s" % maxelem)
  */
-  __pyx_k_tuple_11 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_11)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 217; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_k_tuple_11));
-  __Pyx_INCREF(((PyObject *)__pyx_kp_s_8));
-  PyTuple_SET_ITEM(__pyx_k_tuple_11, 0, ((PyObject *)__pyx_kp_s_8));
-  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_8));
-  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_11));
+  __pyx_k_tuple_14 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_14)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 299; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_k_tuple_14));
+  __Pyx_INCREF(((PyObject *)__pyx_kp_s_11));
+  PyTuple_SET_ITEM(__pyx_k_tuple_14, 0, ((PyObject *)__pyx_kp_s_11));
+  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_11));
+  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_14));
 
-  /* "lib/intbitset.pyx":242
+  /* "intbitset.pyx":324
  *                                     elem = tmp_tuple[0]
  *                                     if elem < 0:
  *                                         raise ValueError("Negative numbers, not allowed")             # <<<<<<<<<<<<<<
  *                                     elif elem > maxelem:
  *                                         raise OverflowError("Elements must be <= %s" % maxelem)
  */
-  __pyx_k_tuple_12 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_12)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 242; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_k_tuple_12));
-  __Pyx_INCREF(((PyObject *)__pyx_kp_s_8));
-  PyTuple_SET_ITEM(__pyx_k_tuple_12, 0, ((PyObject *)__pyx_kp_s_8));
-  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_8));
-  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_12));
+  __pyx_k_tuple_15 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_15)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 324; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_k_tuple_15));
+  __Pyx_INCREF(((PyObject *)__pyx_kp_s_11));
+  PyTuple_SET_ITEM(__pyx_k_tuple_15, 0, ((PyObject *)__pyx_kp_s_11));
+  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_11));
+  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_15));
 
-  /* "lib/intbitset.pyx":249
+  /* "intbitset.pyx":331
  *                                 for elem in rhs:
  *                                     if elem < 0:
  *                                         raise ValueError("Negative numbers, not allowed")             # <<<<<<<<<<<<<<
  *                                     elif elem > maxelem:
  *                                         raise OverflowError("Elements must be <= %s" % maxelem)
  */
-  __pyx_k_tuple_13 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_13)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 249; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_k_tuple_13));
-  __Pyx_INCREF(((PyObject *)__pyx_kp_s_8));
-  PyTuple_SET_ITEM(__pyx_k_tuple_13, 0, ((PyObject *)__pyx_kp_s_8));
-  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_8));
-  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_13));
+  __pyx_k_tuple_16 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_16)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 331; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_k_tuple_16));
+  __Pyx_INCREF(((PyObject *)__pyx_kp_s_11));
+  PyTuple_SET_ITEM(__pyx_k_tuple_16, 0, ((PyObject *)__pyx_kp_s_11));
+  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_11));
+  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_16));
 
-  /* "lib/intbitset.pyx":276
+  /* "intbitset.pyx":358
  *         if self.sanity_checks:
  *             if elem < 0:
  *                 raise ValueError("Negative numbers, not allowed")             # <<<<<<<<<<<<<<
  *             elif elem > maxelem:
  *                 raise OverflowError("Element must be <= %s" % maxelem)
  */
-  __pyx_k_tuple_16 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_16)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 276; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_k_tuple_16));
-  __Pyx_INCREF(((PyObject *)__pyx_kp_s_8));
-  PyTuple_SET_ITEM(__pyx_k_tuple_16, 0, ((PyObject *)__pyx_kp_s_8));
-  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_8));
-  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_16));
+  __pyx_k_tuple_19 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_19)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 358; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_k_tuple_19));
+  __Pyx_INCREF(((PyObject *)__pyx_kp_s_11));
+  PyTuple_SET_ITEM(__pyx_k_tuple_19, 0, ((PyObject *)__pyx_kp_s_11));
+  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_11));
+  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_19));
 
-  /* "lib/intbitset.pyx":282
+  /* "intbitset.pyx":364
  * 
  *     def __cmp__(self, intbitset rhs not None):
  *         raise TypeError("cannot compare intbitset using cmp()")             # <<<<<<<<<<<<<<
  * 
  *     def __richcmp__(self, intbitset rhs not None, int op):
  */
-  __pyx_k_tuple_19 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_19)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 282; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_k_tuple_19));
-  __Pyx_INCREF(((PyObject *)__pyx_kp_s_18));
-  PyTuple_SET_ITEM(__pyx_k_tuple_19, 0, ((PyObject *)__pyx_kp_s_18));
-  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_18));
-  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_19));
+  __pyx_k_tuple_22 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_22)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 364; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_k_tuple_22));
+  __Pyx_INCREF(((PyObject *)__pyx_kp_s_21));
+  PyTuple_SET_ITEM(__pyx_k_tuple_22, 0, ((PyObject *)__pyx_kp_s_21));
+  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_21));
+  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_22));
 
-  /* "lib/intbitset.pyx":314
+  /* "intbitset.pyx":397
  *             if self.sanity_checks:
  *                 if rhs < 0:
  *                     raise ValueError("Negative numbers, not allowed")             # <<<<<<<<<<<<<<
  *                 elif rhs > maxelem:
  *                     raise OverflowError("rhs must be <= %s" % maxelem)
  */
-  __pyx_k_tuple_20 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_20)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 314; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_k_tuple_20));
-  __Pyx_INCREF(((PyObject *)__pyx_kp_s_8));
-  PyTuple_SET_ITEM(__pyx_k_tuple_20, 0, ((PyObject *)__pyx_kp_s_8));
-  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_8));
-  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_20));
+  __pyx_k_tuple_23 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_23)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 397; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_k_tuple_23));
+  __Pyx_INCREF(((PyObject *)__pyx_kp_s_11));
+  PyTuple_SET_ITEM(__pyx_k_tuple_23, 0, ((PyObject *)__pyx_kp_s_11));
+  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_11));
+  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_23));
 
-  /* "lib/intbitset.pyx":324
+  /* "intbitset.pyx":407
  *                 for elem in rhs:
  *                     if elem < 0:
  *                         raise ValueError("Negative numbers, not allowed")             # <<<<<<<<<<<<<<
  *                     elif elem > maxelem:
  *                         raise OverflowError("Elements must be <= %s" % maxelem)
  */
-  __pyx_k_tuple_22 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_22)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 324; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_k_tuple_22));
-  __Pyx_INCREF(((PyObject *)__pyx_kp_s_8));
-  PyTuple_SET_ITEM(__pyx_k_tuple_22, 0, ((PyObject *)__pyx_kp_s_8));
-  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_8));
-  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_22));
+  __pyx_k_tuple_25 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_25)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 407; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_k_tuple_25));
+  __Pyx_INCREF(((PyObject *)__pyx_kp_s_11));
+  PyTuple_SET_ITEM(__pyx_k_tuple_25, 0, ((PyObject *)__pyx_kp_s_11));
+  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_11));
+  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_25));
 
-  /* "lib/intbitset.pyx":331
+  /* "intbitset.pyx":414
  *                 for elem in rhs:
  *                     if elem < 0:
  *                         raise ValueError("Negative numbers, not allowed")             # <<<<<<<<<<<<<<
  *                     elif elem > maxelem:
  *                         raise OverflowError("Elements must be <= %s" % maxelem)
  */
-  __pyx_k_tuple_23 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_23)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 331; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_k_tuple_23));
-  __Pyx_INCREF(((PyObject *)__pyx_kp_s_8));
-  PyTuple_SET_ITEM(__pyx_k_tuple_23, 0, ((PyObject *)__pyx_kp_s_8));
-  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_8));
-  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_23));
+  __pyx_k_tuple_26 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_26)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 414; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_k_tuple_26));
+  __Pyx_INCREF(((PyObject *)__pyx_kp_s_11));
+  PyTuple_SET_ITEM(__pyx_k_tuple_26, 0, ((PyObject *)__pyx_kp_s_11));
+  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_11));
+  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_26));
 
-  /* "lib/intbitset.pyx":342
+  /* "intbitset.pyx":425
  *             if self.sanity_checks:
  *                 if rhs < 0:
  *                     raise ValueError("Negative numbers, not allowed")             # <<<<<<<<<<<<<<
  *                 elif rhs > maxelem:
  *                     raise OverflowError("rhs must be <= %s" % maxelem)
  */
-  __pyx_k_tuple_24 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_24)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 342; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_k_tuple_24));
-  __Pyx_INCREF(((PyObject *)__pyx_kp_s_8));
-  PyTuple_SET_ITEM(__pyx_k_tuple_24, 0, ((PyObject *)__pyx_kp_s_8));
-  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_8));
-  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_24));
+  __pyx_k_tuple_27 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_27)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 425; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_k_tuple_27));
+  __Pyx_INCREF(((PyObject *)__pyx_kp_s_11));
+  PyTuple_SET_ITEM(__pyx_k_tuple_27, 0, ((PyObject *)__pyx_kp_s_11));
+  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_11));
+  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_27));
 
-  /* "lib/intbitset.pyx":352
+  /* "intbitset.pyx":435
  *                 for elem in rhs:
  *                     if elem < 0:
  *                         raise ValueError("Negative numbers, not allowed")             # <<<<<<<<<<<<<<
  *                     elif elem > maxelem:
  *                         raise OverflowError("Elements must be <= %s" % maxelem)
  */
-  __pyx_k_tuple_25 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_25)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 352; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_k_tuple_25));
-  __Pyx_INCREF(((PyObject *)__pyx_kp_s_8));
-  PyTuple_SET_ITEM(__pyx_k_tuple_25, 0, ((PyObject *)__pyx_kp_s_8));
-  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_8));
-  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_25));
+  __pyx_k_tuple_28 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_28)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 435; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_k_tuple_28));
+  __Pyx_INCREF(((PyObject *)__pyx_kp_s_11));
+  PyTuple_SET_ITEM(__pyx_k_tuple_28, 0, ((PyObject *)__pyx_kp_s_11));
+  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_11));
+  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_28));
 
-  /* "lib/intbitset.pyx":367
+  /* "intbitset.pyx":450
  *         if self.sanity_checks:
  *             if elem < 0:
  *                 raise ValueError("Negative numbers, not allowed")             # <<<<<<<<<<<<<<
  *             elif elem > maxelem:
  *                 raise OverflowError("Element must be <= %s" % maxelem)
  */
-  __pyx_k_tuple_26 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_26)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 367; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_k_tuple_26));
-  __Pyx_INCREF(((PyObject *)__pyx_kp_s_8));
-  PyTuple_SET_ITEM(__pyx_k_tuple_26, 0, ((PyObject *)__pyx_kp_s_8));
-  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_8));
-  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_26));
+  __pyx_k_tuple_29 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_29)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 450; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_k_tuple_29));
+  __Pyx_INCREF(((PyObject *)__pyx_kp_s_11));
+  PyTuple_SET_ITEM(__pyx_k_tuple_29, 0, ((PyObject *)__pyx_kp_s_11));
+  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_11));
+  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_29));
 
-  /* "lib/intbitset.pyx":418
+  /* "intbitset.pyx":501
  *         tot = intBitSetGetTot(self.bitset)
  *         if tot < 0:
  *             begin_list = self.to_sorted_list(0, 10)             # <<<<<<<<<<<<<<
  *             ret = "intbitset(["
  *             for n in begin_list:
  */
-  __pyx_k_tuple_29 = PyTuple_New(2); if (unlikely(!__pyx_k_tuple_29)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 418; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_k_tuple_29));
+  __pyx_k_tuple_32 = PyTuple_New(2); if (unlikely(!__pyx_k_tuple_32)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 501; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_k_tuple_32));
   __Pyx_INCREF(__pyx_int_0);
-  PyTuple_SET_ITEM(__pyx_k_tuple_29, 0, __pyx_int_0);
+  PyTuple_SET_ITEM(__pyx_k_tuple_32, 0, __pyx_int_0);
   __Pyx_GIVEREF(__pyx_int_0);
   __Pyx_INCREF(__pyx_int_10);
-  PyTuple_SET_ITEM(__pyx_k_tuple_29, 1, __pyx_int_10);
+  PyTuple_SET_ITEM(__pyx_k_tuple_32, 1, __pyx_int_10);
   __Pyx_GIVEREF(__pyx_int_10);
-  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_29));
+  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_32));
 
-  /* "lib/intbitset.pyx":425
+  /* "intbitset.pyx":508
  *             return ret
  *         elif tot > 10:
  *             begin_list = self.to_sorted_list(0, 5)             # <<<<<<<<<<<<<<
  *             end_list = self.to_sorted_list(tot - 5, tot)
  *             ret = "intbitset(["
  */
-  __pyx_k_tuple_33 = PyTuple_New(2); if (unlikely(!__pyx_k_tuple_33)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 425; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_k_tuple_33));
+  __pyx_k_tuple_36 = PyTuple_New(2); if (unlikely(!__pyx_k_tuple_36)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 508; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_k_tuple_36));
   __Pyx_INCREF(__pyx_int_0);
-  PyTuple_SET_ITEM(__pyx_k_tuple_33, 0, __pyx_int_0);
+  PyTuple_SET_ITEM(__pyx_k_tuple_36, 0, __pyx_int_0);
   __Pyx_GIVEREF(__pyx_int_0);
   __Pyx_INCREF(__pyx_int_5);
-  PyTuple_SET_ITEM(__pyx_k_tuple_33, 1, __pyx_int_5);
+  PyTuple_SET_ITEM(__pyx_k_tuple_36, 1, __pyx_int_5);
   __Pyx_GIVEREF(__pyx_int_5);
-  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_33));
+  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_36));
 
-  /* "lib/intbitset.pyx":466
+  /* "intbitset.pyx":549
  *     def __iter__(self):
  *         if self.bitset.trailing_bits:
  *             raise OverflowError("It's impossible to iterate over an infinite set.")             # <<<<<<<<<<<<<<
  *         return intbitset_iterator(self)
  * 
  */
-  __pyx_k_tuple_37 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_37)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 466; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_k_tuple_37));
-  __Pyx_INCREF(((PyObject *)__pyx_kp_s_36));
-  PyTuple_SET_ITEM(__pyx_k_tuple_37, 0, ((PyObject *)__pyx_kp_s_36));
-  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_36));
-  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_37));
+  __pyx_k_tuple_40 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_40)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 549; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_k_tuple_40));
+  __Pyx_INCREF(((PyObject *)__pyx_kp_s_39));
+  PyTuple_SET_ITEM(__pyx_k_tuple_40, 0, ((PyObject *)__pyx_kp_s_39));
+  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_39));
+  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_40));
 
-  /* "lib/intbitset.pyx":475
+  /* "intbitset.pyx":558
  *         if self.sanity_checks:
  *             if elem < 0:
  *                 raise ValueError("Negative numbers, not allowed")             # <<<<<<<<<<<<<<
  *             elif elem > maxelem:
  *                 raise OverflowError("Element must be <= %s" % maxelem)
  */
-  __pyx_k_tuple_38 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_38)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 475; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_k_tuple_38));
-  __Pyx_INCREF(((PyObject *)__pyx_kp_s_8));
-  PyTuple_SET_ITEM(__pyx_k_tuple_38, 0, ((PyObject *)__pyx_kp_s_8));
-  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_8));
-  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_38));
+  __pyx_k_tuple_41 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_41)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 558; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_k_tuple_41));
+  __Pyx_INCREF(((PyObject *)__pyx_kp_s_11));
+  PyTuple_SET_ITEM(__pyx_k_tuple_41, 0, ((PyObject *)__pyx_kp_s_11));
+  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_11));
+  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_41));
 
-  /* "lib/intbitset.pyx":498
+  /* "intbitset.pyx":581
  *         if self.sanity_checks:
  *             if elem < 0:
  *                 raise ValueError("Negative numbers, not allowed")             # <<<<<<<<<<<<<<
  *             elif elem > maxelem:
  *                 raise OverflowError("Element must be <= %s" % maxelem)
  */
-  __pyx_k_tuple_39 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_39)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 498; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_k_tuple_39));
-  __Pyx_INCREF(((PyObject *)__pyx_kp_s_8));
-  PyTuple_SET_ITEM(__pyx_k_tuple_39, 0, ((PyObject *)__pyx_kp_s_8));
-  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_8));
-  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_39));
+  __pyx_k_tuple_42 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_42)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 581; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_k_tuple_42));
+  __Pyx_INCREF(((PyObject *)__pyx_kp_s_11));
+  PyTuple_SET_ITEM(__pyx_k_tuple_42, 0, ((PyObject *)__pyx_kp_s_11));
+  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_11));
+  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_42));
 
-  /* "lib/intbitset.pyx":571
+  /* "intbitset.pyx":681
  *             intBitSetResetFromBuffer((<intbitset> self).bitset, buf, size)
  *         except:
  *             raise ValueError("strdump is corrupted")             # <<<<<<<<<<<<<<
  *         return self
  * 
  */
-  __pyx_k_tuple_41 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_41)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 571; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_k_tuple_41));
-  __Pyx_INCREF(((PyObject *)__pyx_kp_s_40));
-  PyTuple_SET_ITEM(__pyx_k_tuple_41, 0, ((PyObject *)__pyx_kp_s_40));
-  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_40));
-  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_41));
+  __pyx_k_tuple_44 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_44)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 681; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_k_tuple_44));
+  __Pyx_INCREF(((PyObject *)__pyx_kp_s_43));
+  PyTuple_SET_ITEM(__pyx_k_tuple_44, 0, ((PyObject *)__pyx_kp_s_43));
+  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_43));
+  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_44));
 
-  /* "lib/intbitset.pyx":583
+  /* "intbitset.pyx":693
  *         ret = intBitSetGetNext(self.bitset, -1)
  *         if ret < 0:
  *             raise KeyError("pop from an empty intbitset")             # <<<<<<<<<<<<<<
  *         intBitSetDelElem(self.bitset, ret)
  *         return ret
  */
-  __pyx_k_tuple_43 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_43)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 583; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_k_tuple_43));
-  __Pyx_INCREF(((PyObject *)__pyx_kp_s_42));
-  PyTuple_SET_ITEM(__pyx_k_tuple_43, 0, ((PyObject *)__pyx_kp_s_42));
-  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_42));
-  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_43));
+  __pyx_k_tuple_46 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_46)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 693; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_k_tuple_46));
+  __Pyx_INCREF(((PyObject *)__pyx_kp_s_45));
+  PyTuple_SET_ITEM(__pyx_k_tuple_46, 0, ((PyObject *)__pyx_kp_s_45));
+  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_45));
+  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_46));
 
-  /* "lib/intbitset.pyx":593
+  /* "intbitset.pyx":703
  *         if self.sanity_checks:
  *             if elem < 0:
  *                 raise ValueError("Negative numbers, not allowed")             # <<<<<<<<<<<<<<
  *             elif elem > maxelem:
  *                 raise OverflowError("Elements must be <= %s" % maxelem)
  */
-  __pyx_k_tuple_44 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_44)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 593; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_k_tuple_44));
-  __Pyx_INCREF(((PyObject *)__pyx_kp_s_8));
-  PyTuple_SET_ITEM(__pyx_k_tuple_44, 0, ((PyObject *)__pyx_kp_s_8));
-  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_8));
-  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_44));
+  __pyx_k_tuple_47 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_47)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 703; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_k_tuple_47));
+  __Pyx_INCREF(((PyObject *)__pyx_kp_s_11));
+  PyTuple_SET_ITEM(__pyx_k_tuple_47, 0, ((PyObject *)__pyx_kp_s_11));
+  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_11));
+  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_47));
 
-  /* "lib/intbitset.pyx":608
+  /* "intbitset.pyx":718
  *         cdef int last
  *         if (<intbitset> self).bitset.trailing_bits:
  *             raise OverflowError("It's impossible to print an infinite set.")             # <<<<<<<<<<<<<<
  *         last = 0
  *         ret = []
  */
-  __pyx_k_tuple_46 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_46)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 608; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_k_tuple_46));
-  __Pyx_INCREF(((PyObject *)__pyx_kp_s_45));
-  PyTuple_SET_ITEM(__pyx_k_tuple_46, 0, ((PyObject *)__pyx_kp_s_45));
-  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_45));
-  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_46));
+  __pyx_k_tuple_49 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_49)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 718; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_k_tuple_49));
+  __Pyx_INCREF(((PyObject *)__pyx_kp_s_48));
+  PyTuple_SET_ITEM(__pyx_k_tuple_49, 0, ((PyObject *)__pyx_kp_s_48));
+  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_48));
+  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_49));
 
-  /* "lib/intbitset.pyx":624
+  /* "intbitset.pyx":734
  *                 for value, sign in rhs.iteritems():
  *                     if value < 0:
  *                         raise ValueError("Negative numbers, not allowed")             # <<<<<<<<<<<<<<
  *                     elif value > maxelem:
  *                         raise OverflowError("Elements must <= %s" % maxelem)
  */
-  __pyx_k_tuple_48 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_48)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 624; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_k_tuple_48));
-  __Pyx_INCREF(((PyObject *)__pyx_kp_s_8));
-  PyTuple_SET_ITEM(__pyx_k_tuple_48, 0, ((PyObject *)__pyx_kp_s_8));
-  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_8));
-  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_48));
+  __pyx_k_tuple_51 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_51)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 734; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_k_tuple_51));
+  __Pyx_INCREF(((PyObject *)__pyx_kp_s_11));
+  PyTuple_SET_ITEM(__pyx_k_tuple_51, 0, ((PyObject *)__pyx_kp_s_11));
+  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_11));
+  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_51));
 
-  /* "lib/intbitset.pyx":638
+  /* "intbitset.pyx":748
  *                         intBitSetAddElem(self.bitset, value)
  *         except AttributeError:
  *             raise TypeError("rhs should be a valid dictionary with integers keys and integer values")             # <<<<<<<<<<<<<<
  * 
  *     def get_size(self):
  */
-  __pyx_k_tuple_51 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_51)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 638; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_k_tuple_51));
-  __Pyx_INCREF(((PyObject *)__pyx_kp_s_50));
-  PyTuple_SET_ITEM(__pyx_k_tuple_51, 0, ((PyObject *)__pyx_kp_s_50));
-  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_50));
-  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_51));
+  __pyx_k_tuple_54 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_54)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 748; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_k_tuple_54));
+  __Pyx_INCREF(((PyObject *)__pyx_kp_s_53));
+  PyTuple_SET_ITEM(__pyx_k_tuple_54, 0, ((PyObject *)__pyx_kp_s_53));
+  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_53));
+  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_54));
 
-  /* "lib/intbitset.pyx":655
+  /* "intbitset.pyx":763
  *         if index < 0:
  *             if self.bitset.trailing_bits:
  *                 raise OverflowError("It's impossible to retrieve a negative item from an infinite set.")             # <<<<<<<<<<<<<<
  *             index = index + l
  *         elif index > maxelem:
  */
-  __pyx_k_tuple_53 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_53)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 655; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_k_tuple_53));
-  __Pyx_INCREF(((PyObject *)__pyx_kp_s_52));
-  PyTuple_SET_ITEM(__pyx_k_tuple_53, 0, ((PyObject *)__pyx_kp_s_52));
-  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_52));
-  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_53));
-
-  /* "lib/intbitset.pyx":664
- *                 last = intBitSetGetNext(self.bitset, last)
- *         else:
- *             raise IndexError("intbitset index out of range")             # <<<<<<<<<<<<<<
- *         return last
- * 
- */
-  __pyx_k_tuple_56 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_56)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 664; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_k_tuple_56 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_56)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 763; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(((PyObject *)__pyx_k_tuple_56));
   __Pyx_INCREF(((PyObject *)__pyx_kp_s_55));
   PyTuple_SET_ITEM(__pyx_k_tuple_56, 0, ((PyObject *)__pyx_kp_s_55));
   __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_55));
   __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_56));
 
-  /* "lib/intbitset.pyx":674
+  /* "intbitset.pyx":770
+ *             return intBitSetSelect(self.bitset, index)
+ *         else:
+ *             raise IndexError("intbitset index out of range")             # <<<<<<<<<<<<<<
+ * 
+ *     def to_sorted_list(self, int i, int j):
+ */
+  __pyx_k_tuple_59 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_59)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 770; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_k_tuple_59));
+  __Pyx_INCREF(((PyObject *)__pyx_kp_s_58));
+  PyTuple_SET_ITEM(__pyx_k_tuple_59, 0, ((PyObject *)__pyx_kp_s_58));
+  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_58));
+  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_59));
+
+  /* "intbitset.pyx":779
  *         cdef int cnt
  *         if self.bitset.trailing_bits and (i < 0 or j < 0):
  *             raise OverflowError("It's impossible to retrieve a sublist using negative indices from an infinite set.")             # <<<<<<<<<<<<<<
  *         elif (i > maxelem or j > maxelem):
  *             raise OverflowError("Indexes must be <= %s" % maxelem)
  */
-  __pyx_k_tuple_58 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_58)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 674; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_k_tuple_58));
-  __Pyx_INCREF(((PyObject *)__pyx_kp_s_57));
-  PyTuple_SET_ITEM(__pyx_k_tuple_58, 0, ((PyObject *)__pyx_kp_s_57));
-  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_57));
-  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_58));
+  __pyx_k_tuple_61 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_61)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 779; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_k_tuple_61));
+  __Pyx_INCREF(((PyObject *)__pyx_kp_s_60));
+  PyTuple_SET_ITEM(__pyx_k_tuple_61, 0, ((PyObject *)__pyx_kp_s_60));
+  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_60));
+  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_61));
+
+  /* "intbitset.pyx":808
+ *         if self.sanity_checks:
+ *             if elem < 0:
+ *                 raise ValueError("Negative numbers, not allowed")             # <<<<<<<<<<<<<<
+ *             elif elem > maxelem:
+ *                 raise OverflowError("Element must be <= %s" % maxelem)
+ */
+  __pyx_k_tuple_63 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_63)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 808; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_k_tuple_63));
+  __Pyx_INCREF(((PyObject *)__pyx_kp_s_11));
+  PyTuple_SET_ITEM(__pyx_k_tuple_63, 0, ((PyObject *)__pyx_kp_s_11));
+  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_11));
+  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_63));
 
-  /* "lib/intbitset.pyx":733
+  /* "intbitset.pyx":853
  *         """
  *         if self.bitset.trailing_bits:
  *             raise OverflowError("It's impossible to retrieve a list of an infinite set")             # <<<<<<<<<<<<<<
  *         return self.extract_finite_list()
  * 
  */
-  __pyx_k_tuple_62 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_62)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 733; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_k_tuple_62));
-  __Pyx_INCREF(((PyObject *)__pyx_kp_s_61));
-  PyTuple_SET_ITEM(__pyx_k_tuple_62, 0, ((PyObject *)__pyx_kp_s_61));
-  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_61));
-  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_62));
+  __pyx_k_tuple_66 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_66)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 853; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_k_tuple_66));
+  __Pyx_INCREF(((PyObject *)__pyx_kp_s_65));
+  PyTuple_SET_ITEM(__pyx_k_tuple_66, 0, ((PyObject *)__pyx_kp_s_65));
+  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_65));
+  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_66));
+
+  /* "intbitset.pyx":946
+ *         ret.bitset = intBitSetCreateFromContainerBuffer(self.data + offset, length, 1)
+ *         if ret.bitset == NULL:
+ *             raise ValueError("rhs is corrupted: Corrupted container dump")             # <<<<<<<<<<<<<<
+ *         ret.dump = self
+ *         return ret
+ */
+  __pyx_k_tuple_71 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_71)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 946; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_k_tuple_71));
+  __Pyx_INCREF(((PyObject *)__pyx_kp_s_70));
+  PyTuple_SET_ITEM(__pyx_k_tuple_71, 0, ((PyObject *)__pyx_kp_s_70));
+  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_70));
+  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_71));
+
+  /* "intbitset.pyx":1034
+ *             for rhs in batch:
+ *                 if isinstance(rhs, intbitset) and (<intbitset>rhs).bitset.trailing_bits:
+ *                     raise OverflowError("It's impossible to count the elements of an infinite set")             # <<<<<<<<<<<<<<
+ *             n = len(batch)
+ *             if weights is not None:
+ */
+  __pyx_k_tuple_74 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_74)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1034; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_k_tuple_74));
+  __Pyx_INCREF(((PyObject *)__pyx_kp_s_73));
+  PyTuple_SET_ITEM(__pyx_k_tuple_74, 0, ((PyObject *)__pyx_kp_s_73));
+  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_73));
+  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_74));
   __Pyx_RefNannyFinishContext();
   return 0;
   __pyx_L1_error:;
@@ -9268,6 +12939,7 @@ static int __Pyx_InitGlobals(void) {
   __pyx_int_1 = PyInt_FromLong(1); if (unlikely(!__pyx_int_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
   __pyx_int_5 = PyInt_FromLong(5); if (unlikely(!__pyx_int_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
   __pyx_int_10 = PyInt_FromLong(10); if (unlikely(!__pyx_int_10)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
+  __pyx_int_64 = PyInt_FromLong(64); if (unlikely(!__pyx_int_64)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
   return 0;
   __pyx_L1_error:;
   return -1;
@@ -9283,7 +12955,12 @@ PyMODINIT_FUNC PyInit_intbitset(void)
 {
   PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
-  int __pyx_t_3;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  int __pyx_t_8;
   #if CYTHON_REFNANNY
   void* __pyx_refnanny = NULL;
   __Pyx_RefNanny = __Pyx_RefNannyImportAPI("refnanny");
@@ -9322,7 +12999,7 @@ PyMODINIT_FUNC PyInit_intbitset(void)
   if (__Pyx_SetAttrString(__pyx_m, "__builtins__", __pyx_b) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
   /*--- Initialize various global constants etc. ---*/
   if (unlikely(__Pyx_InitGlobals() < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__pyx_module_is_main_lib__intbitset) {
+  if (__pyx_module_is_main_intbitset) {
     if (__Pyx_SetAttrString(__pyx_m, "__name__", __pyx_n_s____main__) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
   }
   /*--- Builtin init code ---*/
@@ -9332,146 +13009,379 @@ PyMODINIT_FUNC PyInit_intbitset(void)
   /*--- Global init code ---*/
   /*--- Function export code ---*/
   /*--- Type init code ---*/
-  if (PyType_Ready(&__pyx_type_3lib_9intbitset_intbitset) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 95; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__Pyx_SetAttrString(__pyx_m, "intbitset", (PyObject *)&__pyx_type_3lib_9intbitset_intbitset) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 95; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__pyx_type_3lib_9intbitset_intbitset.tp_weaklistoffset == 0) __pyx_type_3lib_9intbitset_intbitset.tp_weaklistoffset = offsetof(struct __pyx_obj_3lib_9intbitset_intbitset, __weakref__);
-  __pyx_ptype_3lib_9intbitset_intbitset = &__pyx_type_3lib_9intbitset_intbitset;
-  if (PyType_Ready(&__pyx_type_3lib_9intbitset_intbitset_iterator) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 738; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__Pyx_SetAttrString(__pyx_m, "intbitset_iterator", (PyObject *)&__pyx_type_3lib_9intbitset_intbitset_iterator) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 738; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__pyx_type_3lib_9intbitset_intbitset_iterator.tp_weaklistoffset == 0) __pyx_type_3lib_9intbitset_intbitset_iterator.tp_weaklistoffset = offsetof(struct __pyx_obj_3lib_9intbitset_intbitset_iterator, __weakref__);
-  __pyx_ptype_3lib_9intbitset_intbitset_iterator = &__pyx_type_3lib_9intbitset_intbitset_iterator;
+  if (PyType_Ready(&__pyx_type_9intbitset_intbitset) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 148; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__Pyx_SetAttrString(__pyx_m, "intbitset", (PyObject *)&__pyx_type_9intbitset_intbitset) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 148; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__pyx_type_9intbitset_intbitset.tp_weaklistoffset == 0) __pyx_type_9intbitset_intbitset.tp_weaklistoffset = offsetof(struct __pyx_obj_9intbitset_intbitset, __weakref__);
+  __pyx_ptype_9intbitset_intbitset = &__pyx_type_9intbitset_intbitset;
+  if (PyType_Ready(&__pyx_type_9intbitset_intbitset_iterator) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 858; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__Pyx_SetAttrString(__pyx_m, "intbitset_iterator", (PyObject *)&__pyx_type_9intbitset_intbitset_iterator) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 858; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__pyx_type_9intbitset_intbitset_iterator.tp_weaklistoffset == 0) __pyx_type_9intbitset_intbitset_iterator.tp_weaklistoffset = offsetof(struct __pyx_obj_9intbitset_intbitset_iterator, __weakref__);
+  __pyx_ptype_9intbitset_intbitset_iterator = &__pyx_type_9intbitset_intbitset_iterator;
+  __pyx_vtabptr_9intbitset_intbitset_file = &__pyx_vtable_9intbitset_intbitset_file;
+  __pyx_vtable_9intbitset_intbitset_file._check_range = (int (*)(struct __pyx_obj_9intbitset_intbitset_file *, Py_ssize_t, Py_ssize_t))__pyx_f_9intbitset_14intbitset_file__check_range;
+  if (PyType_Ready(&__pyx_type_9intbitset_intbitset_file) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 891; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__Pyx_SetVtable(__pyx_type_9intbitset_intbitset_file.tp_dict, __pyx_vtabptr_9intbitset_intbitset_file) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 891; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__Pyx_SetAttrString(__pyx_m, "intbitset_file", (PyObject *)&__pyx_type_9intbitset_intbitset_file) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 891; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_ptype_9intbitset_intbitset_file = &__pyx_type_9intbitset_intbitset_file;
   /*--- Type import code ---*/
   /*--- Function import code ---*/
   /*--- Execution code ---*/
 
-  /* "lib/intbitset.pyx":18
+  /* "intbitset.pyx":18
  * ## 59 Temple Place, Suite 330, Boston, MA 02111-1307, USA.
  * 
  * __revision__ = "$Id$"             # <<<<<<<<<<<<<<
- * __apilevel__ = 1.03
+ * __apilevel__ = 1.07
  * 
  */
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s____revision__, ((PyObject *)__pyx_kp_s_64)) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 18; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s____revision__, ((PyObject *)__pyx_kp_s_76)) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 18; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-  /* "lib/intbitset.pyx":19
+  /* "intbitset.pyx":19
  * 
  * __revision__ = "$Id$"
- * __apilevel__ = 1.03             # <<<<<<<<<<<<<<
+ * __apilevel__ = 1.07             # <<<<<<<<<<<<<<
  * 
  * """
  */
-  __pyx_t_1 = PyFloat_FromDouble(1.03); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 19; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyFloat_FromDouble(1.07); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 19; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   if (PyObject_SetAttr(__pyx_m, __pyx_n_s____apilevel__, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 19; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "lib/intbitset.pyx":42
+  /* "intbitset.pyx":42
  * """
  * 
+ * import os             # <<<<<<<<<<<<<<
+ * import zlib
+ * import sys
+ */
+  __pyx_t_1 = __Pyx_Import(((PyObject *)__pyx_n_s__os), 0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 42; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s__os, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 42; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "intbitset.pyx":43
+ * 
+ * import os
  * import zlib             # <<<<<<<<<<<<<<
  * import sys
  * from array import array
  */
-  __pyx_t_1 = __Pyx_Import(((PyObject *)__pyx_n_s__zlib), 0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 42; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_Import(((PyObject *)__pyx_n_s__zlib), 0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 43; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s__zlib, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 42; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s__zlib, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 43; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "lib/intbitset.pyx":43
- * 
+  /* "intbitset.pyx":44
+ * import os
  * import zlib
  * import sys             # <<<<<<<<<<<<<<
  * from array import array
- * from invenio.config import CFG_INTBITSET_ENABLE_SANITY_CHECKS
+ * from mmap import mmap
  */
-  __pyx_t_1 = __Pyx_Import(((PyObject *)__pyx_n_s__sys), 0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 43; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_Import(((PyObject *)__pyx_n_s__sys), 0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 44; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s__sys, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 43; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s__sys, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 44; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "lib/intbitset.pyx":44
+  /* "intbitset.pyx":45
  * import zlib
  * import sys
  * from array import array             # <<<<<<<<<<<<<<
- * from invenio.config import CFG_INTBITSET_ENABLE_SANITY_CHECKS
- * 
+ * from mmap import mmap
+ * from itertools import islice
  */
-  __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 44; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 45; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(((PyObject *)__pyx_t_1));
   __Pyx_INCREF(((PyObject *)__pyx_n_s__array));
   PyList_SET_ITEM(__pyx_t_1, 0, ((PyObject *)__pyx_n_s__array));
   __Pyx_GIVEREF(((PyObject *)__pyx_n_s__array));
-  __pyx_t_2 = __Pyx_Import(((PyObject *)__pyx_n_s__array), ((PyObject *)__pyx_t_1)); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 44; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = __Pyx_Import(((PyObject *)__pyx_n_s__array), ((PyObject *)__pyx_t_1)); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 45; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(((PyObject *)__pyx_t_1)); __pyx_t_1 = 0;
-  __pyx_t_1 = PyObject_GetAttr(__pyx_t_2, __pyx_n_s__array); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 44; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyObject_GetAttr(__pyx_t_2, __pyx_n_s__array); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 45; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s__array, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 44; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s__array, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 45; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "lib/intbitset.pyx":45
+  /* "intbitset.pyx":46
  * import sys
  * from array import array
+ * from mmap import mmap             # <<<<<<<<<<<<<<
+ * from itertools import islice
+ * from invenio.config import CFG_INTBITSET_ENABLE_SANITY_CHECKS
+ */
+  __pyx_t_2 = PyList_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 46; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_t_2));
+  __Pyx_INCREF(((PyObject *)__pyx_n_s__mmap));
+  PyList_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_n_s__mmap));
+  __Pyx_GIVEREF(((PyObject *)__pyx_n_s__mmap));
+  __pyx_t_1 = __Pyx_Import(((PyObject *)__pyx_n_s__mmap), ((PyObject *)__pyx_t_2)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 46; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(((PyObject *)__pyx_t_2)); __pyx_t_2 = 0;
+  __pyx_t_2 = PyObject_GetAttr(__pyx_t_1, __pyx_n_s__mmap); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 46; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s__mmap, __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 46; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "intbitset.pyx":47
+ * from array import array
+ * from mmap import mmap
+ * from itertools import islice             # <<<<<<<<<<<<<<
+ * from invenio.config import CFG_INTBITSET_ENABLE_SANITY_CHECKS
+ * 
+ */
+  __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 47; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_t_1));
+  __Pyx_INCREF(((PyObject *)__pyx_n_s__islice));
+  PyList_SET_ITEM(__pyx_t_1, 0, ((PyObject *)__pyx_n_s__islice));
+  __Pyx_GIVEREF(((PyObject *)__pyx_n_s__islice));
+  __pyx_t_2 = __Pyx_Import(((PyObject *)__pyx_n_s__itertools), ((PyObject *)__pyx_t_1)); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 47; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(((PyObject *)__pyx_t_1)); __pyx_t_1 = 0;
+  __pyx_t_1 = PyObject_GetAttr(__pyx_t_2, __pyx_n_s__islice); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 47; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s__islice, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 47; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "intbitset.pyx":48
+ * from mmap import mmap
+ * from itertools import islice
  * from invenio.config import CFG_INTBITSET_ENABLE_SANITY_CHECKS             # <<<<<<<<<<<<<<
  * 
- * __all__ = ['intbitset']
+ * try:
  */
-  __pyx_t_2 = PyList_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 45; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyList_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 48; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(((PyObject *)__pyx_t_2));
-  __Pyx_INCREF(((PyObject *)__pyx_n_s_63));
-  PyList_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_n_s_63));
-  __Pyx_GIVEREF(((PyObject *)__pyx_n_s_63));
-  __pyx_t_1 = __Pyx_Import(((PyObject *)__pyx_n_s_65), ((PyObject *)__pyx_t_2)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 45; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_INCREF(((PyObject *)__pyx_n_s_67));
+  PyList_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_n_s_67));
+  __Pyx_GIVEREF(((PyObject *)__pyx_n_s_67));
+  __pyx_t_1 = __Pyx_Import(((PyObject *)__pyx_n_s_77), ((PyObject *)__pyx_t_2)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 48; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(((PyObject *)__pyx_t_2)); __pyx_t_2 = 0;
-  __pyx_t_2 = PyObject_GetAttr(__pyx_t_1, __pyx_n_s_63); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 45; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyObject_GetAttr(__pyx_t_1, __pyx_n_s_67); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 48; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_63, __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 45; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_67, __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 48; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "lib/intbitset.pyx":47
+  /* "intbitset.pyx":50
  * from invenio.config import CFG_INTBITSET_ENABLE_SANITY_CHECKS
  * 
- * __all__ = ['intbitset']             # <<<<<<<<<<<<<<
+ * try:             # <<<<<<<<<<<<<<
+ *     _buffer_types = (str, array, buffer, mmap, bytearray)
+ * except NameError:
+ */
+  {
+    PyObject *__pyx_save_exc_type, *__pyx_save_exc_value, *__pyx_save_exc_tb;
+    __Pyx_ExceptionSave(&__pyx_save_exc_type, &__pyx_save_exc_value, &__pyx_save_exc_tb);
+    __Pyx_XGOTREF(__pyx_save_exc_type);
+    __Pyx_XGOTREF(__pyx_save_exc_value);
+    __Pyx_XGOTREF(__pyx_save_exc_tb);
+    /*try:*/ {
+
+      /* "intbitset.pyx":51
+ * 
+ * try:
+ *     _buffer_types = (str, array, buffer, mmap, bytearray)             # <<<<<<<<<<<<<<
+ * except NameError:
+ *     ## Python < 2.6
+ */
+      __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__array); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 51; __pyx_clineno = __LINE__; goto __pyx_L2_error;}
+      __Pyx_GOTREF(__pyx_t_1);
+      __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s__mmap); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 51; __pyx_clineno = __LINE__; goto __pyx_L2_error;}
+      __Pyx_GOTREF(__pyx_t_2);
+      __pyx_t_3 = PyTuple_New(5); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 51; __pyx_clineno = __LINE__; goto __pyx_L2_error;}
+      __Pyx_GOTREF(((PyObject *)__pyx_t_3));
+      __Pyx_INCREF(((PyObject *)((PyObject*)(&PyString_Type))));
+      PyTuple_SET_ITEM(__pyx_t_3, 0, ((PyObject *)((PyObject*)(&PyString_Type))));
+      __Pyx_GIVEREF(((PyObject *)((PyObject*)(&PyString_Type))));
+      PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_t_1);
+      __Pyx_GIVEREF(__pyx_t_1);
+      __Pyx_INCREF(__pyx_builtin_buffer);
+      PyTuple_SET_ITEM(__pyx_t_3, 2, __pyx_builtin_buffer);
+      __Pyx_GIVEREF(__pyx_builtin_buffer);
+      PyTuple_SET_ITEM(__pyx_t_3, 3, __pyx_t_2);
+      __Pyx_GIVEREF(__pyx_t_2);
+      __Pyx_INCREF(__pyx_builtin_bytearray);
+      PyTuple_SET_ITEM(__pyx_t_3, 4, __pyx_builtin_bytearray);
+      __Pyx_GIVEREF(__pyx_builtin_bytearray);
+      __pyx_t_1 = 0;
+      __pyx_t_2 = 0;
+      if (PyObject_SetAttr(__pyx_m, __pyx_n_s___buffer_types, ((PyObject *)__pyx_t_3)) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 51; __pyx_clineno = __LINE__; goto __pyx_L2_error;}
+      __Pyx_DECREF(((PyObject *)__pyx_t_3)); __pyx_t_3 = 0;
+    }
+    __Pyx_XDECREF(__pyx_save_exc_type); __pyx_save_exc_type = 0;
+    __Pyx_XDECREF(__pyx_save_exc_value); __pyx_save_exc_value = 0;
+    __Pyx_XDECREF(__pyx_save_exc_tb); __pyx_save_exc_tb = 0;
+    goto __pyx_L9_try_end;
+    __pyx_L2_error:;
+    __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+    /* "intbitset.pyx":52
+ * try:
+ *     _buffer_types = (str, array, buffer, mmap, bytearray)
+ * except NameError:             # <<<<<<<<<<<<<<
+ *     ## Python < 2.6
+ *     _buffer_types = (str, array, buffer, mmap)
+ */
+    __pyx_t_4 = PyErr_ExceptionMatches(__pyx_builtin_NameError);
+    if (__pyx_t_4) {
+      __Pyx_AddTraceback("intbitset");
+      if (__Pyx_GetException(&__pyx_t_3, &__pyx_t_2, &__pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 52; __pyx_clineno = __LINE__; goto __pyx_L4_except_error;}
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_GOTREF(__pyx_t_1);
+
+      /* "intbitset.pyx":54
+ * except NameError:
+ *     ## Python < 2.6
+ *     _buffer_types = (str, array, buffer, mmap)             # <<<<<<<<<<<<<<
  * 
- * cdef extern from "intbitset.h":
+ * __all__ = ['intbitset', 'union_many', 'intersection_many', 'count_many',
  */
-  __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 47; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_5 = __Pyx_GetName(__pyx_m, __pyx_n_s__array); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 54; __pyx_clineno = __LINE__; goto __pyx_L4_except_error;}
+      __Pyx_GOTREF(__pyx_t_5);
+      __pyx_t_6 = __Pyx_GetName(__pyx_m, __pyx_n_s__mmap); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 54; __pyx_clineno = __LINE__; goto __pyx_L4_except_error;}
+      __Pyx_GOTREF(__pyx_t_6);
+      __pyx_t_7 = PyTuple_New(4); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 54; __pyx_clineno = __LINE__; goto __pyx_L4_except_error;}
+      __Pyx_GOTREF(((PyObject *)__pyx_t_7));
+      __Pyx_INCREF(((PyObject *)((PyObject*)(&PyString_Type))));
+      PyTuple_SET_ITEM(__pyx_t_7, 0, ((PyObject *)((PyObject*)(&PyString_Type))));
+      __Pyx_GIVEREF(((PyObject *)((PyObject*)(&PyString_Type))));
+      PyTuple_SET_ITEM(__pyx_t_7, 1, __pyx_t_5);
+      __Pyx_GIVEREF(__pyx_t_5);
+      __Pyx_INCREF(__pyx_builtin_buffer);
+      PyTuple_SET_ITEM(__pyx_t_7, 2, __pyx_builtin_buffer);
+      __Pyx_GIVEREF(__pyx_builtin_buffer);
+      PyTuple_SET_ITEM(__pyx_t_7, 3, __pyx_t_6);
+      __Pyx_GIVEREF(__pyx_t_6);
+      __pyx_t_5 = 0;
+      __pyx_t_6 = 0;
+      if (PyObject_SetAttr(__pyx_m, __pyx_n_s___buffer_types, ((PyObject *)__pyx_t_7)) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 54; __pyx_clineno = __LINE__; goto __pyx_L4_except_error;}
+      __Pyx_DECREF(((PyObject *)__pyx_t_7)); __pyx_t_7 = 0;
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      goto __pyx_L3_exception_handled;
+    }
+    __pyx_L4_except_error:;
+    __Pyx_XGIVEREF(__pyx_save_exc_type);
+    __Pyx_XGIVEREF(__pyx_save_exc_value);
+    __Pyx_XGIVEREF(__pyx_save_exc_tb);
+    __Pyx_ExceptionReset(__pyx_save_exc_type, __pyx_save_exc_value, __pyx_save_exc_tb);
+    goto __pyx_L1_error;
+    __pyx_L3_exception_handled:;
+    __Pyx_XGIVEREF(__pyx_save_exc_type);
+    __Pyx_XGIVEREF(__pyx_save_exc_value);
+    __Pyx_XGIVEREF(__pyx_save_exc_tb);
+    __Pyx_ExceptionReset(__pyx_save_exc_type, __pyx_save_exc_value, __pyx_save_exc_tb);
+    __pyx_L9_try_end:;
+  }
+
+  /* "intbitset.pyx":56
+ *     _buffer_types = (str, array, buffer, mmap)
+ * 
+ * __all__ = ['intbitset', 'union_many', 'intersection_many', 'count_many',             # <<<<<<<<<<<<<<
+ *            'intbitset_file']
+ * 
+ */
+  __pyx_t_1 = PyList_New(5); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 56; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(((PyObject *)__pyx_t_1));
   __Pyx_INCREF(((PyObject *)__pyx_n_s__intbitset));
   PyList_SET_ITEM(__pyx_t_1, 0, ((PyObject *)__pyx_n_s__intbitset));
   __Pyx_GIVEREF(((PyObject *)__pyx_n_s__intbitset));
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s____all__, ((PyObject *)__pyx_t_1)) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 47; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_INCREF(((PyObject *)__pyx_n_s__union_many));
+  PyList_SET_ITEM(__pyx_t_1, 1, ((PyObject *)__pyx_n_s__union_many));
+  __Pyx_GIVEREF(((PyObject *)__pyx_n_s__union_many));
+  __Pyx_INCREF(((PyObject *)__pyx_n_s__intersection_many));
+  PyList_SET_ITEM(__pyx_t_1, 2, ((PyObject *)__pyx_n_s__intersection_many));
+  __Pyx_GIVEREF(((PyObject *)__pyx_n_s__intersection_many));
+  __Pyx_INCREF(((PyObject *)__pyx_n_s__count_many));
+  PyList_SET_ITEM(__pyx_t_1, 3, ((PyObject *)__pyx_n_s__count_many));
+  __Pyx_GIVEREF(((PyObject *)__pyx_n_s__count_many));
+  __Pyx_INCREF(((PyObject *)__pyx_n_s__intbitset_file));
+  PyList_SET_ITEM(__pyx_t_1, 4, ((PyObject *)__pyx_n_s__intbitset_file));
+  __Pyx_GIVEREF(((PyObject *)__pyx_n_s__intbitset_file));
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s____all__, ((PyObject *)__pyx_t_1)) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 56; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(((PyObject *)__pyx_t_1)); __pyx_t_1 = 0;
 
-  /* "lib/intbitset.pyx":93
+  /* "intbitset.pyx":61
+ * ## how many sets union_many(), intersection_many() and count_many()
+ * ## take at once from their iterable:
+ * _MANY_BATCH = 64             # <<<<<<<<<<<<<<
+ * 
+ * cdef extern from "intbitset.h":
+ */
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s___MANY_BATCH, __pyx_int_64) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 61; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "intbitset.pyx":132
  *     unsigned char intBitSetCmp(IntBitSet *x, IntBitSet *y)
  * 
  * __maxelem__ = maxelem             # <<<<<<<<<<<<<<
  * 
- * cdef class intbitset:
+ * cdef bint _is_immutable_buffer(rhs) except -1:
  */
-  __pyx_t_1 = PyInt_FromLong(maxelem); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 93; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyInt_FromLong(maxelem); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 132; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s____maxelem__, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 93; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s____maxelem__, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 132; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "lib/intbitset.pyx":136
- *     cdef bint sanity_checks
+  /* "intbitset.pyx":205
+ *     cdef object dump
  * 
  *     def __cinit__(self, rhs=0, int preallocate=-1, int trailing_bits=0, bint sanity_checks=CFG_INTBITSET_ENABLE_SANITY_CHECKS, int no_allocate=0):             # <<<<<<<<<<<<<<
  *         """
  *         Initialize intbitset.
  */
-  __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s_63); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 136; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s_67); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 205; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_8 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely((__pyx_t_8 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 205; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_k_1 = __pyx_t_8;
+
+  /* "intbitset.pyx":965
+ *     return ret
+ * 
+ * def union_many(sets):             # <<<<<<<<<<<<<<
+ *     """Return the union of the intbitsets of the iterable sets as a new
+ *     intbitset, computed in a single pass over the elements of up to
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_9intbitset_union_many, NULL, __pyx_n_s__intbitset); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 965; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely((__pyx_t_3 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 136; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s__union_many, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 965; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_k_1 = __pyx_t_3;
 
-  /* "lib/intbitset.pyx":1
+  /* "intbitset.pyx":986
+ *     return ret
+ * 
+ * def intersection_many(sets):             # <<<<<<<<<<<<<<
+ *     """Return the intersection of the intbitsets of the iterable sets as
+ *     a new intbitset, computed in a single pass over the elements of up to
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_9intbitset_1intersection_many, NULL, __pyx_n_s__intbitset); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 986; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s__intersection_many, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 986; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "intbitset.pyx":1007
+ *     return ret
+ * 
+ * def count_many(sets, weights=None):             # <<<<<<<<<<<<<<
+ *     """Return a tuple (union, counts), where union is the union of the
+ *     finite intbitsets of the iterable sets and counts the list of the
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_9intbitset_2count_many, NULL, __pyx_n_s__intbitset); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1007; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s__count_many, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1007; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "intbitset.pyx":1
  * ## This file is part of Invenio.             # <<<<<<<<<<<<<<
  * ## Copyright (C) 2007, 2008, 2009, 2010, 2011 CERN.
  * ##
@@ -9484,11 +13394,15 @@ PyMODINIT_FUNC PyInit_intbitset(void)
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
   if (__pyx_m) {
-    __Pyx_AddTraceback("init lib.intbitset");
+    __Pyx_AddTraceback("init intbitset");
     Py_DECREF(__pyx_m); __pyx_m = 0;
   } else if (!PyErr_Occurred()) {
-    PyErr_SetString(PyExc_ImportError, "init lib.intbitset");
+    PyErr_SetString(PyExc_ImportError, "init intbitset");
   }
   __pyx_L0:;
   __Pyx_RefNannyFinishContext();
@@ -9890,6 +13804,33 @@ static int __Pyx_EndUnpack(PyObject *iter, Py_ssize_t expected) {
         return -1;
 }
 
+static double __Pyx__PyObject_AsDouble(PyObject* obj) {
+    PyObject* float_value;
+    if (Py_TYPE(obj)->tp_as_number && Py_TYPE(obj)->tp_as_number->nb_float) {
+        return PyFloat_AsDouble(obj);
+    } else if (PyUnicode_CheckExact(obj) || PyBytes_CheckExact(obj)) {
+#if PY_MAJOR_VERSION >= 3
+        float_value = PyFloat_FromString(obj);
+#else
+        float_value = PyFloat_FromString(obj, 0);
+#endif
+    } else {
+        PyObject* args = PyTuple_New(1);
+        if (unlikely(!args)) goto bad;
+        PyTuple_SET_ITEM(args, 0, obj);
+        float_value = PyObject_Call((PyObject*)&PyFloat_Type, args, 0);
+        PyTuple_SET_ITEM(args, 0, 0);
+        Py_DECREF(args);
+    }
+    if (likely(float_value)) {
+        double value = PyFloat_AS_DOUBLE(float_value);
+        Py_DECREF(float_value);
+        return value;
+    }
+bad:
+    return (double)-1;
+}
+
 static CYTHON_INLINE void __Pyx_ExceptionSave(PyObject **type, PyObject **value, PyObject **tb) {
     PyThreadState *tstate = PyThreadState_GET();
     *type = tstate->exc_type;
@@ -10372,6 +14313,23 @@ static CYTHON_INLINE signed PY_LONG_LONG __Pyx_PyInt_AsSignedLongLong(PyObject*
     }
 }
 
+static int __Pyx_SetVtable(PyObject *dict, void *vtable) {
+#if PY_VERSION_HEX >= 0x02070000 && !(PY_MAJOR_VERSION==3&&PY_MINOR_VERSION==0)
+    PyObject *ob = PyCapsule_New(vtable, 0, 0);
+#else
+    PyObject *ob = PyCObject_FromVoidPtr(vtable, 0);
+#endif
+    if (!ob)
+        goto bad;
+    if (PyDict_SetItemString(dict, "__pyx_vtable__", ob) < 0)
+        goto bad;
+    Py_DECREF(ob);
+    return 0;
+bad:
+    Py_XDECREF(ob);
+    return -1;
+}
+
 #include "compile.h"
 #include "frameobject.h"
 #include "traceback.h"
@@ -35,23 +35,65 @@ extern const int wordbytesize;
 extern const int wordbitsize;
 extern const int maxelem;
 
+// Compressed representation: the elements of each chunk of 65536
+// integers are kept in a container, as a sorted array of their lower 16
+// bits, as a bitmap, or as a sorted list of runs, whichever is smallest.
+#define CONTAINER_ARRAY 0
+#define CONTAINER_BITMAP 1
+#define CONTAINER_RUN 2
+#define CONTAINER_WORDS 1024
+#define CONTAINER_MAX_ARRAY 4096
+
+typedef struct {
+    int key;
+    int type;
+    int size;
+    int cardinality;
+    // The data belongs to the buffer the container was loaded from and
+    // is not to be freed.
+    int borrowed;
+    void *data;
+} IntBitSetContainer;
+
+// The head of the Python 2 buffer objects, which do not otherwise
+// expose the object whose memory they give access to.
+typedef struct {
+    PyObject_HEAD
+    PyObject *b_base;
+} IntBitSetBufferObject;
+
 typedef struct {
     int size;
     int allocated;
     word_t trailing_bits;
     int tot;
     word_t *bitset;
+    // Rank directory: rank[i] is the number of elements in the words
+    // before block i, rankblocks the number of blocks, or -1 when the
+    // directory is out of date and is to be rebuilt when needed.
+    int *rank;
+    int rankblocks;
+    // Compressed representation, used instead of the words when bitset
+    // is NULL: the non empty containers of the set, sorted by key.
+    int ncontainers;
+    IntBitSetContainer *containers;
 } IntBitSet;
 
 IntBitSet *intBitSetCreate(register const int size, const bool_t trailing_bits);
 IntBitSet *intBitSetCreateNoAllocate(void);
 IntBitSet *intBitSetCreateFromBuffer(const void * const buf, const Py_ssize_t bufsize);
+IntBitSet *intBitSetCreateFromContainerBuffer(const void * const buf, const Py_ssize_t bufsize, const bool_t borrow);
+bool_t intBitSetIsContainerBuffer(const void * const buf, const Py_ssize_t bufsize);
 IntBitSet *intBitSetResetFromBuffer(IntBitSet *const bitset, const void *const buf, const Py_ssize_t bufsize);
 IntBitSet *intBitSetReset(IntBitSet *const bitset);
 void intBitSetDestroy(IntBitSet *const bitset);
 IntBitSet *intBitSetClone(const IntBitSet * const bitset);
+IntBitSet *intBitSetCompress(IntBitSet * const bitset);
+void intBitSetExpand(IntBitSet * const bitset);
+Py_ssize_t intBitSetGetContainerDumpSize(const IntBitSet * const bitset);
+void intBitSetContainerDump(const IntBitSet * const bitset, void * const buf);
 int intBitSetGetSize(IntBitSet * const bitset);
-int intBitSetGetAllocated(const IntBitSet * const bitset);
+int intBitSetGetAllocated(IntBitSet * const bitset);
 int intBitSetGetTot(IntBitSet * const bitset);
 void intBitSetResize(IntBitSet *const bitset, register const int allocated);
 bool_t intBitSetIsInElem(const IntBitSet * const bitset, register const int elem);
@@ -68,7 +110,25 @@ IntBitSet *intBitSetIIntersection(IntBitSet *const dst, IntBitSet *const src);
 IntBitSet *intBitSetISub(IntBitSet *const x, IntBitSet *const y);
 int intBitSetAdaptMax(IntBitSet *const x, IntBitSet *const y);
 int intBitSetAdaptMin(IntBitSet *const x, IntBitSet *const y);
+IntBitSet *intBitSetUnionMany(IntBitSet *const *const sets, const int n);
+IntBitSet *intBitSetIntersectionMany(IntBitSet *const *const sets, const int n);
+/** Count many.
+ * Returns the union of the n finite sets and stores in counts, for
+ * each element of the union in increasing order, the sum of the
+ * weights of the sets containing it, or their number if weights is
+ * NULL.  counts is allocated with PyMem_Malloc and is to be freed by
+ * the caller.
+ */
+IntBitSet *intBitSetCountMany(IntBitSet *const *const sets, const int n, const double *const weights, double **const counts);
+/** Add counts.
+ * Adds to counts, the counts of the elements of index as returned by
+ * intBitSetCountMany, the counts subcounts of the elements of the
+ * finite set subset, which must be a subset of index.
+ */
+void intBitSetAddCounts(IntBitSet *const index, IntBitSet *const subset, const double *const subcounts, double *const counts);
 int intBitSetGetNext(const IntBitSet *const x, register int last);
+int intBitSetRank(IntBitSet *const bitset, register const int elem);
+int intBitSetSelect(IntBitSet *const bitset, register int index);
 /** Compare.
  * Compare two intbitset.
  * Returns 0 if the two bitset are equals.
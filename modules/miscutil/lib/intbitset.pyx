@@ -16,7 +16,7 @@
 ## 59 Temple Place, Suite 330, Boston, MA 02111-1307, USA.
 
 __revision__ = "$Id$"
-__apilevel__ = 1.03
+__apilevel__ = 1.07
 
 """
 Defines an intbitset data object to hold unordered sets of unsigned
@@ -39,19 +39,44 @@ have to manually regenerate intbitset.c by running:
 and then commit generated intbitset.c to CVS.
 """
 
+import os
 import zlib
 import sys
 from array import array
+from mmap import mmap
+from itertools import islice
 from invenio.config import CFG_INTBITSET_ENABLE_SANITY_CHECKS
 
-__all__ = ['intbitset']
+try:
+    _buffer_types = (str, array, buffer, mmap, bytearray)
+except NameError:
+    ## Python < 2.6
+    _buffer_types = (str, array, buffer, mmap)
+
+__all__ = ['intbitset', 'union_many', 'intersection_many', 'count_many',
+           'intbitset_file']
+
+## how many sets union_many(), intersection_many() and count_many()
+## take at once from their iterable:
+_MANY_BATCH = 64
 
 cdef extern from "intbitset.h":
     ctypedef int Py_ssize_t
 
 cdef extern from "Python.h":
     object PyString_FromStringAndSize(char *s, Py_ssize_t len)
+    char *PyString_AsString(object string)
     int PyObject_AsReadBuffer(object obj, void **buf, Py_ssize_t *buf_len)
+    void *PyMem_Malloc(size_t n)
+    void PyMem_Free(void *p)
+
+cdef extern from "sys/mman.h":
+    ctypedef long off_t
+    int PROT_READ
+    int MAP_SHARED
+    void *MAP_FAILED
+    void *c_mmap "mmap"(void *addr, size_t length, int prot, int flags, int fd, off_t offset)
+    int munmap(void *addr, size_t length)
 
 cdef extern from "intbitset.h":
     ctypedef unsigned long long int word_t
@@ -67,11 +92,19 @@ cdef extern from "intbitset.h":
     int maxelem
     IntBitSet *intBitSetCreate(int size, bint trailing_bits)
     IntBitSet *intBitSetCreateFromBuffer(void *buf, int bufsize)
+    IntBitSet *intBitSetCreateFromContainerBuffer(void *buf, Py_ssize_t bufsize, bint borrow)
+    ctypedef struct IntBitSetBufferObject:
+        void *b_base
+    bint intBitSetIsContainerBuffer(void *buf, Py_ssize_t bufsize)
     IntBitSet *intBitSetCreateNoAllocate()
     IntBitSet *intBitSetResetFromBuffer(IntBitSet *bitset, void *buf, int bufsize)
     IntBitSet *intBitSetReset(IntBitSet *bitset)
     void intBitSetDestroy(IntBitSet *bitset)
     IntBitSet *intBitSetClone(IntBitSet *bitset)
+    IntBitSet *intBitSetCompress(IntBitSet *bitset)
+    void intBitSetExpand(IntBitSet *bitset)
+    Py_ssize_t intBitSetGetContainerDumpSize(IntBitSet *bitset)
+    void intBitSetContainerDump(IntBitSet *bitset, void *buf)
     int intBitSetGetSize(IntBitSet *bitset)
     int intBitSetGetAllocated(IntBitSet *bitset)
     int intBitSetGetTot(IntBitSet * bitset)
@@ -87,11 +120,31 @@ cdef extern from "intbitset.h":
     IntBitSet *intBitSetIIntersection(IntBitSet *dst, IntBitSet *src)
     IntBitSet *intBitSetISub(IntBitSet *x, IntBitSet *y)
     IntBitSet *intBitSetIXor(IntBitSet *x, IntBitSet *y)
+    IntBitSet *intBitSetUnionMany(IntBitSet **sets, int n)
+    IntBitSet *intBitSetIntersectionMany(IntBitSet **sets, int n)
+    IntBitSet *intBitSetCountMany(IntBitSet **sets, int n, double *weights, double **counts)
+    void intBitSetAddCounts(IntBitSet *index, IntBitSet *subset, double *subcounts, double *counts)
     int intBitSetGetNext(IntBitSet *x, int last)
+    int intBitSetRank(IntBitSet *bitset, int elem)
+    int intBitSetSelect(IntBitSet *bitset, int index)
     unsigned char intBitSetCmp(IntBitSet *x, IntBitSet *y)
 
 __maxelem__ = maxelem
 
+cdef bint _is_immutable_buffer(rhs) except -1:
+    """Return whether the memory of the buffer object rhs can neither
+    change nor go away while rhs is alive, so that containers can be
+    loaded from it without copying them."""
+    cdef void *base
+    if type(rhs) is str:
+        return True
+    if type(rhs) is buffer:
+        # a buffer reads the memory of its base object when accessed
+        base = (<IntBitSetBufferObject *> <void *> rhs).b_base
+        return base != NULL and _is_immutable_buffer(<object> base)
+    # a bytearray can be resized, an mmap, even a read-only one, closed
+    return False
+
 cdef class intbitset:
     """
     Defines an intbitset data object to hold unordered sets of
@@ -105,6 +158,17 @@ cdef class intbitset:
     so may have issues with endianness if you transport serialized
     bitsets between various machine architectures.
 
+    A set loaded from a container dump (see fastdump()) is kept
+    compressed: the elements of each chunk of 65536 integers are kept
+    as a sorted array, a bitmap or a list of runs, whichever is the
+    smallest.  Set operations work directly on the compressed form; the
+    set is expanded into bits when single elements are added or removed.
+    The containers of a set loaded from a container dump share the
+    memory of the dump rather than copying it, until the set is
+    expanded, when that memory can neither change nor go away: for a
+    str, a buffer over a str or an intbitset_file.  The containers
+    loaded from a bytearray, an mmap or a buffer over them are copied.
+
     The constructor accept the following parameters:
         rhs=0, int preallocate=-1, int trailing_bits=0,
         bint sanity_checks=CFG_INTBITSET_ENABLE_SANITY_CHECKS,
@@ -115,9 +179,12 @@ cdef class intbitset:
             - int/long for creating allocating empty intbitset that will hold at least
             rhs elements, before being resized
             - intbitset for cloning
-            - str for retrieving an intbitset that was dumped into a string
+            - str for retrieving an intbitset that was dumped into a string,
+            either compressed by zlib or as a container dump
             - array for retrieving an intbitset that was dumped into a string stored
             in an array
+            - buffer, mmap or bytearray for retrieving an intbitset that was
+            dumped into their memory
             - sequence made of integers for copying all the elements from the
             sequence. If minsize is specified than it is initially allocated
             enough space to hold up to minsize integers, otherwise the biggest
@@ -132,6 +199,8 @@ cdef class intbitset:
     """
     cdef IntBitSet *bitset
     cdef bint sanity_checks
+    # the container dump whose memory is shared by the containers of bitset
+    cdef object dump
 
     def __cinit__(self, rhs=0, int preallocate=-1, int trailing_bits=0, bint sanity_checks=CFG_INTBITSET_ENABLE_SANITY_CHECKS, int no_allocate=0):
         """
@@ -143,6 +212,8 @@ cdef class intbitset:
          - str for retrieving an intbitset that was dumped into a string
          - array for retrieving an intbitset that was dumped into a string stored
             in an array
+         - buffer, mmap or bytearray for retrieving an intbitset that was
+            dumped into their memory
          - sequence made of integers for copying all the elements from the
             sequence. If minsize is specified than it is initially allocated
             enough space to hold up to minsize integers, otherwise the biggest
@@ -160,6 +231,7 @@ cdef class intbitset:
         cdef int last
         cdef int remelem
         cdef bint tuple_of_tuples
+        cdef bint borrow
         self.sanity_checks = sanity_checks
         #print >> sys.stderr, "intbitset.__cinit__ is called"
         msg = "Error"
@@ -173,17 +245,27 @@ cdef class intbitset:
                 self.bitset = intBitSetCreate(rhs, trailing_bits)
             elif type(rhs) is intbitset:
                 self.bitset = intBitSetClone((<intbitset>rhs).bitset)
-            elif type(rhs) in (str, array):
+            elif type(rhs) in _buffer_types:
                 try:
                     if type(rhs) is array:
                         rhs = rhs.tostring()
-                    tmp = zlib.decompress(rhs)
-                    if PyObject_AsReadBuffer(tmp, &buf, &size) < 0:
+                    if PyObject_AsReadBuffer(rhs, &buf, &size) < 0:
                         raise Exception("Buffer error!!!")
-                    if (size % wordbytesize):
-                        ## Wrong size!
-                        raise Exception()
-                    self.bitset = intBitSetCreateFromBuffer(buf, size)
+                    if intBitSetIsContainerBuffer(buf, size):
+                        borrow = _is_immutable_buffer(rhs)
+                        self.bitset = intBitSetCreateFromContainerBuffer(buf, size, borrow)
+                        if self.bitset == NULL:
+                            raise Exception("Corrupted container dump")
+                        if borrow:
+                            self.dump = rhs
+                    else:
+                        tmp = zlib.decompress(rhs)
+                        if PyObject_AsReadBuffer(tmp, &buf, &size) < 0:
+                            raise Exception("Buffer error!!!")
+                        if (size % wordbytesize):
+                            ## Wrong size!
+                            raise Exception()
+                        self.bitset = intBitSetCreateFromBuffer(buf, size)
                 except Exception, msg:
                     raise ValueError("rhs is corrupted: %s" % msg)
             elif hasattr(rhs, '__iter__'):
@@ -301,6 +383,7 @@ cdef class intbitset:
         return intBitSetGetTot(self.bitset)
 
     def __hash__(self):
+        intBitSetExpand(self.bitset)
         return hash(PyString_FromStringAndSize(<char *>self.bitset.bitset, wordbytesize * (intBitSetGetTot(self.bitset) / wordbitsize + 1)))
 
     def __nonzero__(self):
@@ -540,10 +623,22 @@ cdef class intbitset:
         self.__ixor__(rhs)
 
     # Dumping & Loading
-    def fastdump(self):
+    def fastdump(self, bint containers=False):
         """Return a compressed string representation suitable to be saved
-        somewhere."""
+        somewhere.  If containers is True and the set is finite, the
+        representation is a container dump, that is loaded without zlib
+        decompression into a compressed set."""
         cdef Py_ssize_t size
+        cdef IntBitSet *compressed
+        if containers and not self.bitset.trailing_bits:
+            compressed = self.bitset
+            if compressed.bitset != NULL:
+                compressed = intBitSetCompress(self.bitset)
+            tmp = PyString_FromStringAndSize(NULL, intBitSetGetContainerDumpSize(compressed))
+            intBitSetContainerDump(compressed, PyString_AsString(tmp))
+            if compressed != self.bitset:
+                intBitSetDestroy(compressed)
+            return tmp
         size = intBitSetGetSize((<intbitset> self).bitset)
         tmp = PyString_FromStringAndSize(<char *>self.bitset.bitset, ( size + 1) * wordbytesize)
         return zlib.compress(tmp)
@@ -554,11 +649,26 @@ cdef class intbitset:
         will be replaced."""
         cdef Py_ssize_t size
         cdef void *buf
+        cdef IntBitSet *tmpbitset
+        cdef bint borrow
         buf = NULL
         size = 0
         try:
             if type(strdump) is array:
                 strdump = strdump.tostring()
+            if PyObject_AsReadBuffer(strdump, &buf, &size) < 0:
+                raise Exception()
+            if intBitSetIsContainerBuffer(buf, size):
+                borrow = _is_immutable_buffer(strdump)
+                tmpbitset = intBitSetCreateFromContainerBuffer(buf, size, borrow)
+                if tmpbitset == NULL:
+                    raise Exception()
+                intBitSetDestroy(self.bitset)
+                self.bitset = tmpbitset
+                self.dump = None
+                if borrow:
+                    self.dump = strdump
+                return self
             # tmp needed to not be garbage collected
             tmp = zlib.decompress(strdump)
             if PyObject_AsReadBuffer(tmp, &buf, &size) < 0:
@@ -647,8 +757,6 @@ cdef class intbitset:
         """Return element at position index in the sorted representation of the
         set. Note that index must be less than len(self)"""
         cdef int l
-        cdef int last
-        cdef int i
         l = intBitSetGetTot(self.bitset)
         if index < 0:
             if self.bitset.trailing_bits:
@@ -657,12 +765,9 @@ cdef class intbitset:
         elif index > maxelem:
             raise OverflowError("Index must be <= %s" % maxelem)
         if 0 <= index < l:
-            last = intBitSetGetNext(self.bitset, -1)
-            for i from 0 <= i < index:
-                last = intBitSetGetNext(self.bitset, last)
+            return intBitSetSelect(self.bitset, index)
         else:
             raise IndexError("intbitset index out of range")
-        return last
 
     def to_sorted_list(self, int i, int j):
         """Return a sublist of the sorted representation of the set.
@@ -687,13 +792,24 @@ cdef class intbitset:
         if j >= l:
             j = l
         last = -1
-        for cnt from 0 <= cnt < i:
-            last = intBitSetGetNext(self.bitset, last)
+        if i > 0:
+            last = intBitSetSelect(self.bitset, i - 1)
         for cnt from i <= cnt < j:
             last = intBitSetGetNext(self.bitset, last)
             intBitSetAddElem((<intbitset> ret).bitset, last)
         return ret
 
+    def rank(self, int elem):
+        """Return the number of elements of the set smaller than elem,
+        i.e. the position of elem in the sorted representation of the set
+        if elem is in the set."""
+        if self.sanity_checks:
+            if elem < 0:
+                raise ValueError("Negative numbers, not allowed")
+            elif elem > maxelem:
+                raise OverflowError("Element must be <= %s" % maxelem)
+        return intBitSetRank(self.bitset, elem)
+
     def is_infinite(self):
         """Return True if the intbitset is infinite. (i.e. trailing_bits=True
         was used in the constructor.)"""
@@ -710,7 +826,11 @@ cdef class intbitset:
         if self.sanity_checks and up_to > maxelem:
             raise OverflowError("up_to must be <= %s" % maxelem)
         ret = []
-        true_up_to = max(up_to, (intBitSetGetSize(self.bitset)) * wordbitsize)
+        if self.bitset.bitset == NULL:
+            # compressed sets are finite
+            true_up_to = maxelem
+        else:
+            true_up_to = max(up_to, (intBitSetGetSize(self.bitset)) * wordbitsize)
         last = -1
         while last < true_up_to:
             last = intBitSetGetNext(self.bitset, last)
@@ -766,4 +886,195 @@ cdef class intbitset_iterator:
     def __iter__(self):
         return self
 
-    cdef object __weakref__
\ No newline at end of file
+    cdef object __weakref__
+
+cdef class intbitset_file:
+    """
+    Read-only memory map of a file holding container dumps (see
+    intbitset.fastdump()) at known offsets, e.g. the dumps of many sets
+    written one after the other.  The sets loaded from the file share
+    the mapped memory instead of copying their containers.  The map can
+    not be closed: the file is unmapped when neither the intbitset_file
+    nor any set loaded from it is in use anymore.
+    """
+    cdef char *data
+    cdef Py_ssize_t size
+
+    def __cinit__(self, path):
+        cdef void *data
+        self.data = NULL
+        self.size = 0
+        dump_file = open(path, 'rb')
+        try:
+            size = os.fstat(dump_file.fileno()).st_size
+            if size:
+                data = c_mmap(NULL, size, PROT_READ, MAP_SHARED, dump_file.fileno(), 0)
+                if data == MAP_FAILED:
+                    raise EnvironmentError("Cannot map %s" % path)
+                self.data = <char *> data
+                self.size = size
+        finally:
+            dump_file.close()
+
+    def __dealloc__(self):
+        if self.data != NULL:
+            munmap(self.data, self.size)
+
+    def __len__(self):
+        return self.size
+
+    cdef int _check_range(self, Py_ssize_t offset, Py_ssize_t length) except -1:
+        if offset < 0 or length < 0 or offset > self.size or length > self.size - offset:
+            raise ValueError("%s bytes at offset %s are out of the file" % (length, offset))
+        return 0
+
+    def read(self, Py_ssize_t offset, Py_ssize_t length):
+        """Return the length bytes of the file at offset as a str."""
+        self._check_range(offset, length)
+        return PyString_FromStringAndSize(self.data + offset, length)
+
+    def load(self, Py_ssize_t offset, Py_ssize_t length):
+        """Return the intbitset dumped in the length bytes of the file at
+        offset.  The containers of a container dump are not copied."""
+        cdef intbitset ret
+        self._check_range(offset, length)
+        if not intBitSetIsContainerBuffer(self.data + offset, length):
+            return intbitset(self.read(offset, length))
+        ret = intbitset(no_allocate=1)
+        ret.bitset = intBitSetCreateFromContainerBuffer(self.data + offset, length, 1)
+        if ret.bitset == NULL:
+            raise ValueError("rhs is corrupted: Corrupted container dump")
+        ret.dump = self
+        return ret
+
+cdef IntBitSet **_get_bitsets(sets) except NULL:
+    """Return the array of the bitsets of the list of intbitsets sets,
+    to be freed with PyMem_Free."""
+    cdef IntBitSet **ret
+    cdef int i
+    for rhs in sets:
+        if not isinstance(rhs, intbitset):
+            raise TypeError("intbitset expected, got %s" % type(rhs).__name__)
+    ret = <IntBitSet **> PyMem_Malloc((len(sets) + 1) * sizeof(IntBitSet *))
+    if ret == NULL:
+        raise MemoryError()
+    for i from 0 <= i < len(sets):
+        ret[i] = (<intbitset> sets[i]).bitset
+    return ret
+
+def union_many(sets):
+    """Return the union of the intbitsets of the iterable sets as a new
+    intbitset, computed in a single pass over the elements of up to
+    _MANY_BATCH sets at a time rather than one pair of sets at a time.
+    The iterable is consumed batch by batch, so that no more than
+    _MANY_BATCH of its sets need to be held in memory at once."""
+    cdef IntBitSet **bitsets
+    sets = iter(sets)
+    ret = None
+    batch = list(islice(sets, _MANY_BATCH))
+    while ret is None or batch:
+        if ret is not None:
+            batch.append(ret)
+        bitsets = _get_bitsets(batch)
+        ret = intbitset(no_allocate=1)
+        (<intbitset>ret).bitset = intBitSetUnionMany(bitsets, len(batch))
+        PyMem_Free(bitsets)
+        batch = None
+        batch = list(islice(sets, _MANY_BATCH))
+    return ret
+
+def intersection_many(sets):
+    """Return the intersection of the intbitsets of the iterable sets as
+    a new intbitset, computed in a single pass over the elements of up to
+    _MANY_BATCH sets at a time rather than one pair of sets at a time.
+    The iterable is consumed batch by batch, as by union_many().  The
+    intersection of no set is empty."""
+    cdef IntBitSet **bitsets
+    sets = iter(sets)
+    ret = None
+    batch = list(islice(sets, _MANY_BATCH))
+    while ret is None or batch:
+        if ret is not None:
+            batch.append(ret)
+        bitsets = _get_bitsets(batch)
+        ret = intbitset(no_allocate=1)
+        (<intbitset>ret).bitset = intBitSetIntersectionMany(bitsets, len(batch))
+        PyMem_Free(bitsets)
+        batch = None
+        batch = list(islice(sets, _MANY_BATCH))
+    return ret
+
+def count_many(sets, weights=None):
+    """Return a tuple (union, counts), where union is the union of the
+    finite intbitsets of the iterable sets and counts the list of the
+    number of sets containing each element of union, in increasing order
+    of the elements.  If weights, an iterable of numbers as long as sets,
+    is given, counts holds for each element the sum of the weights of the
+    sets containing it instead.  The iterables are consumed batch by
+    batch, as by union_many()."""
+    cdef IntBitSet **bitsets
+    cdef double *cweights
+    cdef double *counts
+    cdef double *batch_counts
+    cdef int i
+    cdef int n
+    cdef int tot
+    sets = iter(sets)
+    if weights is not None:
+        weights = iter(weights)
+    ret = None
+    counts = NULL
+    nsets = 0
+    try:
+        batch = list(islice(sets, _MANY_BATCH))
+        while ret is None or batch:
+            nsets += len(batch)
+            for rhs in batch:
+                if isinstance(rhs, intbitset) and (<intbitset>rhs).bitset.trailing_bits:
+                    raise OverflowError("It's impossible to count the elements of an infinite set")
+            n = len(batch)
+            if weights is not None:
+                batch_weights = [float(weight) for weight in islice(weights, n)]
+                if len(batch_weights) != n:
+                    nweights = nsets - n + len(batch_weights)
+                    for rhs in sets:
+                        nsets += 1
+                    raise ValueError("%s weights given for %s sets" % (nweights, nsets))
+            if ret is not None:
+                # the union so far, whose counts are added afterwards
+                batch.append(ret)
+            bitsets = _get_bitsets(batch)
+            cweights = NULL
+            if weights is not None or ret is not None:
+                cweights = <double *> PyMem_Malloc((n + 2) * sizeof(double))
+                for i from 0 <= i < n:
+                    if weights is not None:
+                        cweights[i] = batch_weights[i]
+                    else:
+                        cweights[i] = 1.0
+                cweights[n] = 0.0
+            batch_ret = intbitset(no_allocate=1)
+            (<intbitset>batch_ret).bitset = intBitSetCountMany(bitsets, len(batch), cweights, &batch_counts)
+            PyMem_Free(bitsets)
+            PyMem_Free(cweights)
+            if ret is not None:
+                intBitSetAddCounts((<intbitset>batch_ret).bitset, (<intbitset>ret).bitset, counts, batch_counts)
+                PyMem_Free(counts)
+            ret = batch_ret
+            counts = batch_counts
+            batch = rhs = None
+            batch = list(islice(sets, _MANY_BATCH))
+        if weights is not None:
+            nweights = nsets
+            for weight in weights:
+                nweights += 1
+            if nweights != nsets:
+                raise ValueError("%s weights given for %s sets" % (nweights, nsets))
+        tot = intBitSetGetTot((<intbitset>ret).bitset)
+        if weights is None:
+            ret_counts = [<int> counts[i] for i from 0 <= i < tot]
+        else:
+            ret_counts = [counts[i] for i from 0 <= i < tot]
+    finally:
+        PyMem_Free(counts)
+    return ret, ret_counts
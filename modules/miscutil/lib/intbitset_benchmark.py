@@ -0,0 +1,273 @@
+# -*- coding: utf-8 -*-
+##
+## This file is part of Invenio.
+## Copyright (C) 2011 CERN.
+##
+## Invenio is free software; you can redistribute it and/or
+## modify it under the terms of the GNU General Public License as
+## published by the Free Software Foundation; either version 2 of the
+## License, or (at your option) any later version.
+##
+## Invenio is distributed in the hope that it will be useful, but
+## WITHOUT ANY WARRANTY; without even the implied warranty of
+## MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+## General Public License for more details.
+##
+## You should have received a copy of the GNU General Public License
+## along with Invenio; if not, write to the Free Software Foundation, Inc.,
+## 59 Temple Place, Suite 330, Boston, MA 02111-1307, USA.
+
+"""
+Micro-benchmark of the positional access to intbitset elements. Run this
+module directly to time, on random hitsets of the given sizes, the access to
+the element at a given position of the sorted hitset and to the page of
+records starting there, as the search engine does for jrec, together with the
+rank of an element:
+
+   $ python intbitset_benchmark.py [-s 100000,1000000,5000000] [-j] [-d] [-m]
+
+The positions are at 1%, 50% and 99% of the hitset.  The walk column times
+reaching the position by iterating over the hitset, i.e. the linear walk that
+get_sorted_element() and to_sorted_list() did before the rank directory; the
+build column times the first positional access to a hitset, which builds the
+directory.  With -j the results are printed as one JSON object per line.
+
+With -d the dumps of the hitsets are timed instead: the size and loading time
+of the zlib dump and of the container dump of dense hitsets and of sparse ones,
+spread over 10 million records, together with the intersection of the loaded
+hitset with itself.
+
+With -m the union, the intersection and the counting of the elements of
+MANY hitsets of the given sizes, loaded from container dumps as the word
+indexes store them, are timed instead, one pair of hitsets at a time and
+in a single pass over all of them.
+"""
+
+__revision__ = "$Id$"
+
+import sys
+import time
+import getopt
+import random
+from itertools import islice
+import simplejson as json
+
+from invenio.intbitset import intbitset, union_many, intersection_many, \
+     count_many
+
+SIZES = [100000, 1000000, 5000000]
+POSITIONS = [0.01, 0.5, 0.99]
+PAGE = 10
+REPEATS = 100
+SPARSE_RANGE = 10000000
+MANY = 300
+
+def generate_hitset(size):
+    """Returns a random hitset of about size elements, half of the
+    integers up to 2 * size."""
+    random.seed(size)
+    return intbitset([recid for recid in xrange(2 * size)
+                      if random.random() < 0.5])
+
+def generate_sparse_hitset(size):
+    """Returns a random hitset of size elements up to SPARSE_RANGE."""
+    random.seed(size)
+    return intbitset(random.sample(xrange(SPARSE_RANGE), size))
+
+def time_per_call(function, args, repeats=REPEATS):
+    """Returns the mean time in seconds of function(*args)."""
+    start = time.time()
+    for dummy in xrange(repeats):
+        function(*args)
+    return (time.time() - start) / repeats
+
+def walk_page(hitset, position):
+    """Returns the page at position by iterating over the hitset."""
+    return list(islice(hitset, position, position + PAGE))
+
+def time_directory_build(hitset, repeats=10):
+    """Returns the mean time in seconds of the first positional access
+    to copies of hitset."""
+    copies = [intbitset(hitset) for dummy in xrange(repeats)]
+    start = time.time()
+    for hitset_copy in copies:
+        hitset_copy.get_sorted_element(0)
+    return (time.time() - start) / repeats
+
+def benchmark_hitset(hitset):
+    """
+    Times the positional access to hitset.  Returns the build time and a
+    list of (position, walk, select, page, rank) tuples of times in seconds.
+    """
+    build = time_directory_build(hitset)
+    results = []
+    for fraction in POSITIONS:
+        position = int(len(hitset) * fraction)
+        recid = hitset.get_sorted_element(position)
+        walk = time_per_call(walk_page, (hitset, position), max(1, REPEATS / 10))
+        select = time_per_call(hitset.get_sorted_element, (position,))
+        page = time_per_call(hitset.to_sorted_list, (position, position + PAGE))
+        rank = time_per_call(hitset.rank, (recid,))
+        results.append((position, walk, select, page, rank))
+    return build, results
+
+def benchmark_dumps(hitset):
+    """
+    Times the loading of the dumps of hitset.  Returns a list of (kind,
+    bytes, load, intersection) tuples of sizes and times in seconds, for the
+    zlib and the container dump.
+    """
+    results = []
+    for kind, containers in (('zlib', False), ('containers', True)):
+        dump = hitset.fastdump(containers=containers)
+        load = time_per_call(intbitset, (dump,))
+        loaded = intbitset(dump)
+        intersection = time_per_call(loaded.__and__, (loaded,))
+        results.append((kind, len(dump), load, intersection))
+    return results
+
+def print_dumps(sizes, as_json=False):
+    """
+    Runs the dump benchmark on dense and sparse hitsets of the passed sizes
+    and prints one line per hitset and kind of dump, either as table or as
+    JSON objects.
+    """
+    if not as_json:
+        print "%9s %7s %11s %10s %10s %10s" % ('elements', 'hitset',
+            'dump', 'bytes', 'load us', 'and us')
+    for size in sizes:
+        for density, hitset in (('dense', generate_hitset(size)),
+                                ('sparse', generate_sparse_hitset(size))):
+            for kind, nbytes, load, intersection in benchmark_dumps(hitset):
+                if as_json:
+                    print json.dumps({'elements'     : len(hitset),
+                                      'hitset'       : density,
+                                      'dump'         : kind,
+                                      'bytes'        : nbytes,
+                                      'load'         : round(load, 9),
+                                      'intersection' : round(intersection, 9)})
+                else:
+                    print "%9d %7s %11s %10d %10.1f %10.1f" % (len(hitset),
+                        density, kind, nbytes, load * 1e6, intersection * 1e6)
+
+def pairwise_union(hitsets):
+    """Returns the union of hitsets computed one pair at a time."""
+    ret = intbitset()
+    for hitset in hitsets:
+        ret |= hitset
+    return ret
+
+def pairwise_intersection(hitsets):
+    """Returns the intersection of hitsets computed one pair at a time."""
+    ret = intbitset(hitsets[0])
+    for hitset in hitsets[1:]:
+        ret &= hitset
+    return ret
+
+def pairwise_count(hitsets):
+    """Returns the dictionary of the number of hitsets containing each
+    element."""
+    ret = {}
+    for hitset in hitsets:
+        for recid in hitset:
+            ret[recid] = ret.get(recid, 0) + 1
+    return ret
+
+def benchmark_many(hitsets):
+    """
+    Times the operations on all the hitsets.  Returns a list of (operation,
+    pairwise, many) tuples of times in seconds.
+    """
+    results = []
+    for operation, pairwise, many in (
+            ('union', pairwise_union, union_many),
+            ('intersection', pairwise_intersection, intersection_many),
+            ('count', pairwise_count, count_many)):
+        results.append((operation, time_per_call(pairwise, (hitsets,), 3),
+                        time_per_call(many, (hitsets,), 3)))
+    return results
+
+def print_many(sizes, as_json=False):
+    """
+    Runs the benchmark of the operations on MANY sparse hitsets of each of
+    the passed sizes and prints one line per size and operation, either as
+    table or as JSON objects.
+    """
+    if not as_json:
+        print "%9s %13s %12s %10s" % ('elements', 'operation',
+            'pairwise us', 'many us')
+    for size in sizes:
+        random.seed(size)
+        hitsets = [intbitset(intbitset(random.sample(xrange(SPARSE_RANGE),
+                       size)).fastdump(containers=True))
+                   for dummy in xrange(MANY)]
+        for operation, pairwise, many in benchmark_many(hitsets):
+            if as_json:
+                print json.dumps({'elements'  : size,
+                                  'operation' : operation,
+                                  'pairwise'  : round(pairwise, 9),
+                                  'many'      : round(many, 9)})
+            else:
+                print "%9d %13s %12.1f %10.1f" % (size, operation,
+                    pairwise * 1e6, many * 1e6)
+
+def print_sizes(sizes, as_json=False):
+    """
+    Runs the benchmark on hitsets of the passed sizes and prints one line
+    per size and position, either as table or as JSON objects.
+    """
+    if not as_json:
+        print "%9s %9s %9s %12s %10s %10s %10s" % ('elements', 'position',
+            'build us', 'walk us', 'select us', 'page us', 'rank us')
+    for size in sizes:
+        hitset = generate_hitset(size)
+        build, results = benchmark_hitset(hitset)
+        for position, walk, select, page, rank in results:
+            if as_json:
+                print json.dumps({'elements' : len(hitset),
+                                  'position' : position,
+                                  'build'    : round(build, 9),
+                                  'walk'     : round(walk, 9),
+                                  'select'   : round(select, 9),
+                                  'page'     : round(page, 9),
+                                  'rank'     : round(rank, 9)})
+            else:
+                print "%9d %9d %9.1f %12.1f %10.2f %10.2f %10.2f" % \
+                    (len(hitset), position, build * 1e6, walk * 1e6,
+                     select * 1e6, page * 1e6, rank * 1e6)
+
+def main():
+    """Parses the command line and runs the benchmark."""
+    try:
+        opts, dummy = getopt.getopt(sys.argv[1:], 'hs:jdm',
+                                    ['help', 'sizes=', 'json', 'dumps', 'many'])
+        sizes = SIZES
+        as_json = False
+        dumps = False
+        many = False
+        for opt, value in opts:
+            if opt in ('-h', '--help'):
+                print __doc__
+                return
+            elif opt in ('-s', '--sizes'):
+                sizes = [int(size) for size in value.split(',')]
+            elif opt in ('-j', '--json'):
+                as_json = True
+            elif opt in ('-d', '--dumps'):
+                dumps = True
+            elif opt in ('-m', '--many'):
+                many = True
+    except (getopt.GetoptError, ValueError), err:
+        sys.stderr.write('%s\n' % err)
+        print __doc__
+        sys.exit(1)
+
+    if dumps:
+        print_dumps(sizes, as_json)
+    elif many:
+        print_many(sizes, as_json)
+    else:
+        print_sizes(sizes, as_json)
+
+if __name__ == '__main__':
+    main()
@@ -27,6 +27,819 @@ const int wordbitsize = sizeof(word_t) * 8;
 
 const int maxelem = INT_MAX;
 
+// Number of words of a block of the rank directory.
+static const int rankblocksize = 8;
+
+// Operations between words or containers.
+#define OP_OR 0
+#define OP_AND 1
+#define OP_XOR 2
+#define OP_SUB 3
+
+// Magic string starting the container dump of a set, that is no valid
+// start of a zlib stream.
+static const char containermagic[4] = {'I', 'B', 'C', '1'};
+
+static int wordPopCount(register word_t word) {
+    word = word - ((word >> 1) & (word_t) 0x5555555555555555ULL);
+    word = (word & (word_t) 0x3333333333333333ULL) + ((word >> 2) & (word_t) 0x3333333333333333ULL);
+    word = (word + (word >> 4)) & (word_t) 0x0f0f0f0f0f0f0f0fULL;
+    return (int) ((word * (word_t) 0x0101010101010101ULL) >> 56);
+}
+
+static int wordLowestBit(register word_t word) {
+#ifdef __GNUC__
+    return __builtin_ctzll(word);
+#else
+    register int i = 0;
+    for (; !(word & ((word_t) 1 << i)); ++i);
+    return i;
+#endif
+}
+
+static int wordHighestBit(register word_t word) {
+#ifdef __GNUC__
+    return wordbitsize - 1 - __builtin_clzll(word);
+#else
+    register int i = wordbitsize - 1;
+    for (; !(word & ((word_t) 1 << i)); --i);
+    return i;
+#endif
+}
+
+static word_t wordOp(register const word_t x, register const word_t y, const int op) {
+    switch (op) {
+        case OP_OR: return x | y;
+        case OP_AND: return x & y;
+        case OP_XOR: return x ^ y;
+        default: return x & ~y;
+    }
+}
+
+/** Words operation.
+ * Stores in ret the result of op between the nwords words of x and y.
+ */
+static void wordsOp(word_t *const ret, const word_t *const x, const word_t *const y, const int nwords, const int op) {
+    register int i;
+    switch (op) {
+        case OP_OR:
+            for (i = 0; i < nwords; ++i)
+                ret[i] = x[i] | y[i];
+            break;
+        case OP_AND:
+            for (i = 0; i < nwords; ++i)
+                ret[i] = x[i] & y[i];
+            break;
+        case OP_XOR:
+            for (i = 0; i < nwords; ++i)
+                ret[i] = x[i] ^ y[i];
+            break;
+        default:
+            for (i = 0; i < nwords; ++i)
+                ret[i] = x[i] & ~y[i];
+    }
+}
+
+/** Next bit.
+ * Returns the position of the first bit equal to value at or after
+ * pos in the nwords words, or nwords * wordbitsize if there is none.
+ */
+static int wordsNextBit(const word_t *const words, const int nwords, const int pos, const bool_t value) {
+    register int i = pos / wordbitsize;
+    register word_t word;
+    if (i >= nwords)
+        return nwords * wordbitsize;
+    word = (value ? words[i] : ~words[i]) & ((word_t) ~0 << (pos % wordbitsize));
+    while (!word) {
+        if (++i >= nwords)
+            return nwords * wordbitsize;
+        word = value ? words[i] : ~words[i];
+    }
+    return i * wordbitsize + wordLowestBit(word);
+}
+
+/** Range operation.
+ * Sets (OP_OR), clears (OP_SUB) or flips (OP_XOR) the bits from start
+ * to end excluded of the nwords words.
+ */
+static void wordsRangeOp(word_t *const words, const int nwords, const int start, int end, const int op) {
+    register int i;
+    register word_t mask;
+    if (end > nwords * wordbitsize)
+        end = nwords * wordbitsize;
+    for (i = start / wordbitsize; i * wordbitsize < end; ++i) {
+        mask = (word_t) ~0;
+        if (i == start / wordbitsize)
+            mask &= (word_t) ~0 << (start % wordbitsize);
+        if (i == (end - 1) / wordbitsize)
+            mask &= (word_t) ~0 >> (wordbitsize - 1 - (end - 1) % wordbitsize);
+        words[i] = wordOp(words[i], mask, op);
+    }
+}
+
+static Py_ssize_t containerDataSize(const IntBitSetContainer *const container) {
+    switch (container->type) {
+        case CONTAINER_ARRAY: return container->size * sizeof(unsigned short);
+        case CONTAINER_BITMAP: return CONTAINER_WORDS * wordbytesize;
+        default: return container->size * 2 * sizeof(unsigned short);
+    }
+}
+
+static void containerClone(IntBitSetContainer *const dst, const IntBitSetContainer *const src) {
+    *dst = *src;
+    dst->borrowed = 0;
+    dst->data = PyMem_Malloc(containerDataSize(src));
+    memcpy(dst->data, src->data, containerDataSize(src));
+}
+
+/** Container from words.
+ * Fills container with the elements of the CONTAINER_WORDS words of
+ * chunk key, choosing the smallest type of container.
+ * Returns 0, without filling container, if the words are empty.
+ */
+static int containerFromWords(IntBitSetContainer *const container, const int key, const word_t *const words) {
+    register int i;
+    register int j;
+    register int k;
+    register word_t word;
+    register word_t ends;
+    register int cardinality = wordPopCount(words[0]);
+    register int runs = wordPopCount(words[0] & ~(words[0] << 1));
+    unsigned short *data;
+    for (i = 1; i < CONTAINER_WORDS && 4 * runs < CONTAINER_WORDS * wordbytesize; ++i) {
+        // a run starts at every bit set whose previous bit is not
+        cardinality += wordPopCount(words[i]);
+        runs += wordPopCount(words[i] & ~((words[i] << 1) | (words[i - 1] >> (wordbitsize - 1))));
+    }
+    // too many runs for a run container: count the elements only
+    for (; i < CONTAINER_WORDS; ++i)
+        cardinality += wordPopCount(words[i]);
+    if (!cardinality)
+        return 0;
+    container->key = key;
+    container->cardinality = cardinality;
+    container->borrowed = 0;
+    if (4 * runs < (cardinality <= CONTAINER_MAX_ARRAY ? 2 * cardinality : CONTAINER_WORDS * wordbytesize)) {
+        container->type = CONTAINER_RUN;
+        container->size = runs;
+        data = container->data = PyMem_Malloc(runs * 2 * sizeof(unsigned short));
+        for (i = j = k = 0; i < CONTAINER_WORDS; ++i) {
+            if (!words[i])
+                continue;
+            // the first and the last bits of the runs in the word
+            word = words[i] & ~((words[i] << 1) | (i ? words[i - 1] >> (wordbitsize - 1) : 0));
+            ends = words[i] & ~((words[i] >> 1) | (i + 1 < CONTAINER_WORDS ? words[i + 1] << (wordbitsize - 1) : 0));
+            for (; word; word &= word - 1)
+                data[2 * j++] = (unsigned short) (i * wordbitsize + wordLowestBit(word));
+            for (; ends; ends &= ends - 1, ++k)
+                data[2 * k + 1] = (unsigned short) (i * wordbitsize + wordLowestBit(ends) - data[2 * k]);
+        }
+    } else if (cardinality <= CONTAINER_MAX_ARRAY) {
+        container->type = CONTAINER_ARRAY;
+        container->size = cardinality;
+        data = container->data = PyMem_Malloc(cardinality * sizeof(unsigned short));
+        j = 0;
+        for (i = 0; i < CONTAINER_WORDS; ++i)
+            for (word = words[i]; word; word &= word - 1)
+                data[j++] = (unsigned short) (i * wordbitsize + wordLowestBit(word));
+    } else {
+        container->type = CONTAINER_BITMAP;
+        container->size = CONTAINER_WORDS;
+        container->data = PyMem_Malloc(CONTAINER_WORDS * wordbytesize);
+        memcpy(container->data, words, CONTAINER_WORDS * wordbytesize);
+    }
+    return 1;
+}
+
+/** Container from array.
+ * Fills container with the k sorted elements of data of chunk key,
+ * choosing the smallest type of container.  The array data, allocated
+ * with PyMem_Malloc, is taken over.  Returns 0, without filling
+ * container, if k is 0.
+ */
+static int containerFromArray(IntBitSetContainer *const container, const int key, unsigned short *const data, const int k) {
+    word_t words[CONTAINER_WORDS];
+    register int i;
+    register int j;
+    register int runs = k > 0;
+    unsigned short *rundata;
+    if (k > CONTAINER_MAX_ARRAY) {
+        memset(words, 0, CONTAINER_WORDS * wordbytesize);
+        for (i = 0; i < k; ++i)
+            words[data[i] / wordbitsize] |= (word_t) 1 << (data[i] % wordbitsize);
+        PyMem_Free(data);
+        return containerFromWords(container, key, words);
+    }
+    for (i = 1; i < k; ++i)
+        runs += data[i] != data[i - 1] + 1;
+    if (!k) {
+        PyMem_Free(data);
+        return 0;
+    }
+    container->key = key;
+    container->cardinality = k;
+    container->borrowed = 0;
+    if (4 * runs < 2 * k) {
+        container->type = CONTAINER_RUN;
+        container->size = runs;
+        rundata = container->data = PyMem_Malloc(runs * 2 * sizeof(unsigned short));
+        for (i = 0, j = -1; i < k; ++i)
+            if (i && data[i] == data[i - 1] + 1)
+                ++rundata[2 * j + 1];
+            else {
+                rundata[2 * ++j] = data[i];
+                rundata[2 * j + 1] = 0;
+            }
+        PyMem_Free(data);
+    } else {
+        container->type = CONTAINER_ARRAY;
+        container->size = k;
+        container->data = data;
+    }
+    return 1;
+}
+
+/** Container to words.
+ * Sets (OP_OR), clears (OP_SUB) or flips (OP_XOR) the bits of the
+ * elements of container in the first nwords words of its chunk.
+ */
+static void containerToWords(const IntBitSetContainer *const container, word_t *const words, const int nwords, const int op) {
+    register int i;
+    register const unsigned short *data = container->data;
+    register const word_t *bitmap = container->data;
+    switch (container->type) {
+        case CONTAINER_ARRAY:
+            for (i = 0; i < container->size && data[i] < nwords * wordbitsize; ++i)
+                words[data[i] / wordbitsize] = wordOp(words[data[i] / wordbitsize], (word_t) 1 << (data[i] % wordbitsize), op);
+            break;
+        case CONTAINER_BITMAP:
+            for (i = 0; i < nwords && i < CONTAINER_WORDS; ++i)
+                words[i] = wordOp(words[i], bitmap[i], op);
+            break;
+        default:
+            for (i = 0; i < container->size; ++i)
+                wordsRangeOp(words, nwords, data[2 * i], data[2 * i] + data[2 * i + 1] + 1, op);
+    }
+}
+
+/** Lower bound.
+ * Returns the position of the first element of the sorted array of
+ * size elements, taken every step items, not smaller than value.
+ */
+static int arrayLowerBound(const unsigned short *const data, const int size, const int step, const int value) {
+    register int low = 0;
+    register int high = size;
+    register int middle;
+    while (low < high) {
+        middle = (low + high) / 2;
+        if (data[middle * step] < value)
+            low = middle + 1;
+        else
+            high = middle;
+    }
+    return low;
+}
+
+static bool_t containerContains(const IntBitSetContainer *const container, register const int low) {
+    register const unsigned short *data = container->data;
+    register int i;
+    switch (container->type) {
+        case CONTAINER_ARRAY:
+            i = arrayLowerBound(data, container->size, 1, low);
+            return i < container->size && data[i] == low;
+        case CONTAINER_BITMAP:
+            return (((word_t *) container->data)[low / wordbitsize] & ((word_t) 1 << (low % wordbitsize))) != 0;
+        default:
+            // the last run starting at or before low
+            i = arrayLowerBound(data, container->size, 2, low + 1) - 1;
+            return i >= 0 && low <= data[2 * i] + data[2 * i + 1];
+    }
+}
+
+/** Container next.
+ * Returns the smallest element of container not smaller than low, or
+ * -1 if there is none.
+ */
+static int containerNext(const IntBitSetContainer *const container, register const int low) {
+    register const unsigned short *data = container->data;
+    register int i;
+    switch (container->type) {
+        case CONTAINER_ARRAY:
+            i = arrayLowerBound(data, container->size, 1, low);
+            return i < container->size ? data[i] : -1;
+        case CONTAINER_BITMAP:
+            i = wordsNextBit(container->data, CONTAINER_WORDS, low, 1);
+            return i < CONTAINER_WORDS * wordbitsize ? i : -1;
+        default:
+            i = arrayLowerBound(data, container->size, 2, low + 1) - 1;
+            if (i >= 0 && low <= data[2 * i] + data[2 * i + 1])
+                return low;
+            return i + 1 < container->size ? data[2 * i + 2] : -1;
+    }
+}
+
+static int containerLast(const IntBitSetContainer *const container) {
+    register const unsigned short *data = container->data;
+    register const word_t *bitmap = container->data;
+    register int i;
+    switch (container->type) {
+        case CONTAINER_ARRAY:
+            return data[container->size - 1];
+        case CONTAINER_BITMAP:
+            for (i = CONTAINER_WORDS - 1; !bitmap[i]; --i);
+            return i * wordbitsize + wordHighestBit(bitmap[i]);
+        default:
+            return data[2 * container->size - 2] + data[2 * container->size - 1];
+    }
+}
+
+/** Container rank.
+ * Returns the number of elements of container smaller than low.
+ */
+static int containerRank(const IntBitSetContainer *const container, register const int low) {
+    register const unsigned short *data = container->data;
+    register const word_t *bitmap = container->data;
+    register int i;
+    register int ret = 0;
+    switch (container->type) {
+        case CONTAINER_ARRAY:
+            return arrayLowerBound(data, container->size, 1, low);
+        case CONTAINER_BITMAP:
+            for (i = 0; i < low / wordbitsize; ++i)
+                ret += wordPopCount(bitmap[i]);
+            if (low % wordbitsize)
+                ret += wordPopCount(bitmap[i] & (((word_t) 1 << (low % wordbitsize)) - 1));
+            return ret;
+        default:
+            for (i = 0; i < container->size && data[2 * i] < low; ++i)
+                if (data[2 * i] + data[2 * i + 1] < low)
+                    ret += data[2 * i + 1] + 1;
+                else
+                    ret += low - data[2 * i];
+            return ret;
+    }
+}
+
+/** Container select.
+ * Returns the element at position index in container.
+ */
+static int containerSelect(const IntBitSetContainer *const container, register int index) {
+    register const unsigned short *data = container->data;
+    register const word_t *bitmap = container->data;
+    register word_t word;
+    register int i;
+    switch (container->type) {
+        case CONTAINER_ARRAY:
+            return data[index];
+        case CONTAINER_BITMAP:
+            for (i = 0; wordPopCount(bitmap[i]) <= index; ++i)
+                index -= wordPopCount(bitmap[i]);
+            for (word = bitmap[i]; index > 0; --index)
+                word &= word - 1;
+            return i * wordbitsize + wordLowestBit(word);
+        default:
+            for (i = 0; data[2 * i + 1] < index; ++i)
+                index -= data[2 * i + 1] + 1;
+            return data[2 * i] + index;
+    }
+}
+
+/** Container operation.
+ * Fills ret with the result of op between containers x and y of the
+ * same chunk.  Returns 0, without filling ret, if the result is empty.
+ */
+static int containerOp(IntBitSetContainer *const ret, const IntBitSetContainer *const x, const IntBitSetContainer *const y, const int op) {
+    word_t xwords[CONTAINER_WORDS];
+    word_t ywords[CONTAINER_WORDS];
+    register const unsigned short *xdata = x->data;
+    register const unsigned short *ydata = y->data;
+    register unsigned short *data;
+    register int i;
+    register int j;
+    register int k;
+    if (op == OP_AND && y->type == CONTAINER_ARRAY && x->type != CONTAINER_ARRAY)
+        return containerOp(ret, y, x, op);
+    if (x->type == CONTAINER_ARRAY && y->type == CONTAINER_ARRAY) {
+        // merge of the elements of x and y
+        data = PyMem_Malloc((x->size + y->size) * sizeof(unsigned short));
+        for (i = j = k = 0; i < x->size || (j < y->size && (op == OP_OR || op == OP_XOR));) {
+            if (j == y->size || (i < x->size && xdata[i] < ydata[j])) {
+                if (op != OP_AND)
+                    data[k++] = xdata[i];
+                ++i;
+            } else if (i == x->size || ydata[j] < xdata[i]) {
+                if (op == OP_OR || op == OP_XOR)
+                    data[k++] = ydata[j];
+                ++j;
+            } else {
+                if (op == OP_OR || op == OP_AND)
+                    data[k++] = xdata[i];
+                ++i;
+                ++j;
+            }
+        }
+        return containerFromArray(ret, x->key, data, k);
+    }
+    if (x->type == CONTAINER_ARRAY && (op == OP_AND || op == OP_SUB)) {
+        // the elements of x that are (not) in y
+        data = PyMem_Malloc(x->size * sizeof(unsigned short));
+        for (i = k = 0; i < x->size; ++i)
+            if (containerContains(y, xdata[i]) == (op == OP_AND))
+                data[k++] = xdata[i];
+        return containerFromArray(ret, x->key, data, k);
+    }
+    if (x->type != CONTAINER_BITMAP) {
+        memset(xwords, 0, CONTAINER_WORDS * wordbytesize);
+        containerToWords(x, xwords, CONTAINER_WORDS, OP_OR);
+    }
+    if (y->type != CONTAINER_BITMAP) {
+        memset(ywords, 0, CONTAINER_WORDS * wordbytesize);
+        containerToWords(y, ywords, CONTAINER_WORDS, OP_OR);
+    }
+    wordsOp(xwords, x->type == CONTAINER_BITMAP ? x->data : xwords, y->type == CONTAINER_BITMAP ? y->data : ywords, CONTAINER_WORDS, op);
+    return containerFromWords(ret, x->key, xwords);
+}
+
+static void intBitSetFreeContainers(IntBitSet *const bitset) {
+    register int i;
+    if (bitset->containers) {
+        for (i = 0; i < bitset->ncontainers; ++i)
+            if (!bitset->containers[i].borrowed)
+                PyMem_Free(bitset->containers[i].data);
+        PyMem_Free(bitset->containers);
+        bitset->containers = NULL;
+    }
+    bitset->ncontainers = 0;
+}
+
+/** Create compressed.
+ * Returns an empty compressed set with room for ncontainers containers.
+ */
+static IntBitSet *intBitSetCreateCompressed(const int ncontainers) {
+    IntBitSet *ret = PyMem_Malloc(sizeof(IntBitSet));
+    ret->size = -1;
+    ret->allocated = 0;
+    ret->trailing_bits = 0;
+    ret->tot = 0;
+    ret->bitset = NULL;
+    ret->rank = NULL;
+    ret->rankblocks = -1;
+    ret->ncontainers = 0;
+    ret->containers = PyMem_Malloc((ncontainers ? ncontainers : 1) * sizeof(IntBitSetContainer));
+    return ret;
+}
+
+/** Move.
+ * Replaces the content of dst with the content of src, that is
+ * destroyed.
+ */
+static IntBitSet *intBitSetMove(IntBitSet *const dst, IntBitSet *const src) {
+    if (dst->bitset)
+        PyMem_Free(dst->bitset);
+    if (dst->rank)
+        PyMem_Free(dst->rank);
+    intBitSetFreeContainers(dst);
+    *dst = *src;
+    PyMem_Free(src);
+    return dst;
+}
+
+/** Find container.
+ * Returns the position of the first container of the compressed
+ * bitset whose key is not smaller than key.
+ */
+static int intBitSetFindContainer(const IntBitSet *const bitset, register const int key) {
+    register int low = 0;
+    register int high = bitset->ncontainers;
+    register int middle;
+    while (low < high) {
+        middle = (low + high) / 2;
+        if (bitset->containers[middle].key < key)
+            low = middle + 1;
+        else
+            high = middle;
+    }
+    return low;
+}
+
+static int intBitSetGetLast(const IntBitSet *const bitset) {
+    const IntBitSetContainer *container;
+    if (!bitset->ncontainers)
+        return -1;
+    container = bitset->containers + bitset->ncontainers - 1;
+    return (container->key << 16) + containerLast(container);
+}
+
+/** Containers operation.
+ * Returns the compressed set result of op between the compressed sets
+ * x and y.
+ */
+static IntBitSet *intBitSetContainersOp(const IntBitSet *const x, const IntBitSet *const y, const int op) {
+    register int i = 0;
+    register int j = 0;
+    register IntBitSetContainer *container;
+    IntBitSet *ret = intBitSetCreateCompressed(x->ncontainers + y->ncontainers);
+    container = ret->containers;
+    while (i < x->ncontainers || j < y->ncontainers) {
+        if (j == y->ncontainers || (i < x->ncontainers && x->containers[i].key < y->containers[j].key)) {
+            if (op != OP_AND)
+                containerClone(container++, x->containers + i);
+            ++i;
+        } else if (i == x->ncontainers || y->containers[j].key < x->containers[i].key) {
+            if (op == OP_OR || op == OP_XOR)
+                containerClone(container++, y->containers + j);
+            ++j;
+        } else {
+            if (containerOp(container, x->containers + i, y->containers + j, op))
+                ++container;
+            ++i;
+            ++j;
+        }
+    }
+    ret->ncontainers = container - ret->containers;
+    for (i = 0; i < ret->ncontainers; ++i)
+        ret->tot += ret->containers[i].cardinality;
+    return ret;
+}
+
+/** Filter containers.
+ * Returns the compressed set of the elements of the compressed set x
+ * that are in (OP_AND) or not in (OP_SUB) the uncompressed set y.
+ */
+static IntBitSet *intBitSetFilterContainers(const IntBitSet *const x, const IntBitSet *const y, const int op) {
+    word_t words[CONTAINER_WORDS];
+    register int i;
+    register int j;
+    register int k;
+    register word_t yword;
+    register const unsigned short *xdata;
+    unsigned short *data;
+    register IntBitSetContainer *container;
+    IntBitSet *ret = intBitSetCreateCompressed(x->ncontainers);
+    container = ret->containers;
+    for (i = 0; i < x->ncontainers; ++i) {
+        if (x->containers[i].type == CONTAINER_ARRAY) {
+            xdata = x->containers[i].data;
+            data = PyMem_Malloc(x->containers[i].size * sizeof(unsigned short));
+            for (j = k = 0; j < x->containers[i].size; ++j)
+                if (intBitSetIsInElem(y, (x->containers[i].key << 16) + xdata[j]) == (op == OP_AND))
+                    data[k++] = xdata[j];
+            if (containerFromArray(container, x->containers[i].key, data, k))
+                ++container;
+        } else {
+            memset(words, 0, CONTAINER_WORDS * wordbytesize);
+            containerToWords(x->containers + i, words, CONTAINER_WORDS, OP_OR);
+            for (j = 0; j < CONTAINER_WORDS; ++j) {
+                k = x->containers[i].key * CONTAINER_WORDS + j;
+                yword = k < y->allocated ? y->bitset[k] : y->trailing_bits;
+                words[j] = wordOp(words[j], yword, op);
+            }
+            if (containerFromWords(container, x->containers[i].key, words))
+                ++container;
+        }
+    }
+    ret->ncontainers = container - ret->containers;
+    for (i = 0; i < ret->ncontainers; ++i)
+        ret->tot += ret->containers[i].cardinality;
+    return ret;
+}
+
+/** Apply containers.
+ * Adds (OP_OR), removes (OP_SUB) or flips (OP_XOR) the elements of the
+ * compressed set src in the uncompressed set dst.
+ */
+static IntBitSet *intBitSetApplyContainers(IntBitSet *const dst, const IntBitSet *const src, const int op) {
+    register int i;
+    register int start;
+    if (!src->ncontainers)
+        return dst;
+    if (op != OP_SUB || dst->trailing_bits)
+        intBitSetResize(dst, intBitSetGetLast(src) / wordbitsize + 2);
+    for (i = 0; i < src->ncontainers; ++i) {
+        start = src->containers[i].key * CONTAINER_WORDS;
+        if (start >= dst->allocated)
+            break;
+        containerToWords(src->containers + i, dst->bitset + start, dst->allocated - start < CONTAINER_WORDS ? dst->allocated - start : CONTAINER_WORDS, op);
+    }
+    dst->size = -1;
+    dst->tot = -1;
+    dst->rankblocks = -1;
+    return dst;
+}
+
+/** Compressed operation.
+ * Returns the result of op between x and y, one of which at least is
+ * compressed.  The result is compressed if it cannot be larger than a
+ * compressed operand.
+ */
+static IntBitSet *intBitSetCompressedOp(IntBitSet *const x, IntBitSet *const y, const int op) {
+    if (!x->bitset && !y->bitset)
+        return intBitSetContainersOp(x, y, op);
+    if (op == OP_AND)
+        return x->bitset ? intBitSetFilterContainers(y, x, op) : intBitSetFilterContainers(x, y, op);
+    if (op == OP_SUB && !x->bitset)
+        return intBitSetFilterContainers(x, y, op);
+    if (x->bitset)
+        return intBitSetApplyContainers(intBitSetClone(x), y, op);
+    return intBitSetApplyContainers(intBitSetClone(y), x, op);
+}
+
+/** In-place compressed operation.
+ * Replaces dst with the result of op between dst and src, one of which
+ * at least is compressed.
+ */
+static IntBitSet *intBitSetICompressedOp(IntBitSet *const dst, IntBitSet *const src, const int op) {
+    if (dst->bitset && op != OP_AND)
+        return intBitSetApplyContainers(dst, src, op);
+    return intBitSetMove(dst, intBitSetCompressedOp(dst, src, op));
+}
+
+/** Compress.
+ * Returns the compressed copy of the set bitset, that must not have
+ * trailing bits.
+ */
+IntBitSet *intBitSetCompress(IntBitSet *const bitset) {
+    word_t words[CONTAINER_WORDS];
+    register int key;
+    register int nwords;
+    register IntBitSetContainer *container;
+    IntBitSet *ret;
+    int nchunks;
+    if (!bitset->bitset)
+        return intBitSetClone(bitset);
+    nchunks = (bitset->allocated + CONTAINER_WORDS - 1) / CONTAINER_WORDS;
+    ret = intBitSetCreateCompressed(nchunks);
+    container = ret->containers;
+    for (key = 0; key < nchunks; ++key) {
+        nwords = bitset->allocated - key * CONTAINER_WORDS;
+        if (nwords >= CONTAINER_WORDS) {
+            if (containerFromWords(container, key, bitset->bitset + key * CONTAINER_WORDS))
+                ret->tot += (container++)->cardinality;
+        } else {
+            memset(words, 0, CONTAINER_WORDS * wordbytesize);
+            memcpy(words, bitset->bitset + key * CONTAINER_WORDS, nwords * wordbytesize);
+            if (containerFromWords(container, key, words))
+                ret->tot += (container++)->cardinality;
+        }
+    }
+    ret->ncontainers = container - ret->containers;
+    return ret;
+}
+
+/** Expand.
+ * Replaces the compressed representation of bitset with words.
+ */
+void intBitSetExpand(IntBitSet *const bitset) {
+    register int i;
+    register int start;
+    if (bitset->bitset)
+        return;
+    bitset->allocated = intBitSetGetLast(bitset) / wordbitsize + 2;
+    bitset->bitset = PyMem_Malloc(bitset->allocated * wordbytesize);
+    memset(bitset->bitset, 0, bitset->allocated * wordbytesize);
+    for (i = 0; i < bitset->ncontainers; ++i) {
+        start = bitset->containers[i].key * CONTAINER_WORDS;
+        containerToWords(bitset->containers + i, bitset->bitset + start, bitset->allocated - start < CONTAINER_WORDS ? bitset->allocated - start : CONTAINER_WORDS, OP_OR);
+    }
+    intBitSetFreeContainers(bitset);
+    bitset->size = -1;
+    bitset->trailing_bits = 0;
+    bitset->rankblocks = -1;
+}
+
+/* Container dump: the magic string, the number of containers, the
+ * headers of the containers and their data, each padded to a multiple
+ * of 8 bytes.  A header is made of the key and the type of the
+ * container as unsigned shorts and of its size and cardinality as
+ * unsigned ints.  The data of a run container is the list of the
+ * starts and lengths minus one of its runs.
+ */
+#define CONTAINER_HEADER_SIZE 12
+#define PADDED(size) (((size) + 7) / 8 * 8)
+
+Py_ssize_t intBitSetGetContainerDumpSize(const IntBitSet *const bitset) {
+    register int i;
+    register Py_ssize_t ret = PADDED(8 + bitset->ncontainers * CONTAINER_HEADER_SIZE);
+    for (i = 0; i < bitset->ncontainers; ++i)
+        ret += PADDED(containerDataSize(bitset->containers + i));
+    return ret;
+}
+
+void intBitSetContainerDump(const IntBitSet *const bitset, void *const buf) {
+    register int i;
+    register char *header = buf;
+    register char *data = (char *) buf + PADDED(8 + bitset->ncontainers * CONTAINER_HEADER_SIZE);
+    unsigned short key_type[2];
+    unsigned int size_cardinality[2];
+    memset(buf, 0, intBitSetGetContainerDumpSize(bitset));
+    memcpy(header, containermagic, 4);
+    size_cardinality[0] = bitset->ncontainers;
+    memcpy(header + 4, size_cardinality, 4);
+    header += 8;
+    for (i = 0; i < bitset->ncontainers; ++i) {
+        key_type[0] = (unsigned short) bitset->containers[i].key;
+        key_type[1] = (unsigned short) bitset->containers[i].type;
+        size_cardinality[0] = bitset->containers[i].size;
+        size_cardinality[1] = bitset->containers[i].cardinality;
+        memcpy(header, key_type, 4);
+        memcpy(header + 4, size_cardinality, 8);
+        header += CONTAINER_HEADER_SIZE;
+        memcpy(data, bitset->containers[i].data, containerDataSize(bitset->containers + i));
+        data += PADDED(containerDataSize(bitset->containers + i));
+    }
+}
+
+bool_t intBitSetIsContainerBuffer(const void *const buf, const Py_ssize_t bufsize) {
+    return bufsize >= 8 && !memcmp(buf, containermagic, 4);
+}
+
+/** Check container.
+ * Returns the cardinality of container if its data is valid, -1
+ * otherwise.
+ */
+static int containerCheck(const IntBitSetContainer *const container) {
+    register const unsigned short *data = container->data;
+    register int i;
+    register int cardinality = 0;
+    switch (container->type) {
+        case CONTAINER_ARRAY:
+            for (i = 1; i < container->size; ++i)
+                if (data[i - 1] >= data[i])
+                    return -1;
+            return container->size;
+        case CONTAINER_BITMAP:
+            for (i = 0; i < CONTAINER_WORDS; ++i)
+                cardinality += wordPopCount(((word_t *) container->data)[i]);
+            return cardinality;
+        default:
+            for (i = 0; i < container->size; ++i) {
+                if (data[2 * i] + data[2 * i + 1] > 0xffff || (i && data[2 * i - 2] + data[2 * i - 1] + 1 >= data[2 * i]))
+                    return -1;
+                cardinality += data[2 * i + 1] + 1;
+            }
+            return cardinality;
+    }
+}
+
+/** Create from container buffer.
+ * Returns the compressed set of the container dump buf, or NULL if buf
+ * is corrupted.  If borrow is true, the containers whose data is
+ * suitably aligned in buf reference it instead of copying it: buf must
+ * then stay unchanged until the set is expanded or destroyed.
+ */
+IntBitSet *intBitSetCreateFromContainerBuffer(const void *const buf, const Py_ssize_t bufsize, const bool_t borrow) {
+    register int i;
+    register const char *header = buf;
+    register const char *data;
+    register IntBitSetContainer *container;
+    unsigned short key_type[2];
+    unsigned int size_cardinality[2];
+    unsigned int ncontainers;
+    IntBitSet *ret;
+    if (!intBitSetIsContainerBuffer(buf, bufsize))
+        return NULL;
+    memcpy(&ncontainers, header + 4, 4);
+    if (ncontainers > 0x8000 || PADDED(8 + ncontainers * CONTAINER_HEADER_SIZE) > bufsize)
+        return NULL;
+    data = (const char *) buf + PADDED(8 + ncontainers * CONTAINER_HEADER_SIZE);
+    header += 8;
+    ret = intBitSetCreateCompressed(ncontainers);
+    for (i = 0; i < (int) ncontainers; ++i, header += CONTAINER_HEADER_SIZE) {
+        container = ret->containers + i;
+        memcpy(key_type, header, 4);
+        memcpy(size_cardinality, header + 4, 8);
+        container->key = key_type[0];
+        container->type = key_type[1];
+        container->size = size_cardinality[0];
+        container->cardinality = size_cardinality[1];
+        if (container->key > 0x7fff || (i && container->key <= container[-1].key) ||
+            container->size < 1 ||
+            (container->type == CONTAINER_ARRAY && container->size > CONTAINER_MAX_ARRAY) ||
+            (container->type == CONTAINER_BITMAP && container->size != CONTAINER_WORDS) ||
+            (container->type == CONTAINER_RUN && container->size > 0x8000) ||
+            container->type > CONTAINER_RUN ||
+            data + PADDED(containerDataSize(container)) > (const char *) buf + bufsize)
+            break;
+        container->borrowed = borrow && !((Py_uintptr_t) data % (container->type == CONTAINER_BITMAP ? sizeof(word_t) : sizeof(unsigned short)));
+        if (container->borrowed)
+            container->data = (void *) data;
+        else {
+            container->data = PyMem_Malloc(containerDataSize(container));
+            memcpy(container->data, data, containerDataSize(container));
+        }
+        data += PADDED(containerDataSize(container));
+        ret->ncontainers = i + 1;
+        if (!container->cardinality || containerCheck(container) != container->cardinality)
+            break;
+        ret->tot += container->cardinality;
+    }
+    if (ret->ncontainers != (int) ncontainers || i != (int) ncontainers) {
+        intBitSetDestroy(ret);
+        return NULL;
+    }
+    return ret;
+}
+
 IntBitSet *intBitSetCreate(register const int size, const bool_t trailing_bits) {
     register word_t *base;
     register word_t *end;
@@ -36,6 +849,10 @@ IntBitSet *intBitSetCreate(register const int size, const bool_t trailing_bits)
     ret->allocated = (size / wordbitsize + 1);
     ret->size = 0; // trailing_bits
     ret->trailing_bits = trailing_bits ? (word_t) ~0 : 0;
+    ret->rank = NULL;
+    ret->rankblocks = -1;
+    ret->ncontainers = 0;
+    ret->containers = NULL;
     if (trailing_bits) {
         base = ret->bitset = PyMem_Malloc(ret->allocated * wordbytesize);
         end = base + ret->allocated;
@@ -59,15 +876,21 @@ IntBitSet *intBitSetCreateNoAllocate() {
     ret->size = -1;
     ret->trailing_bits = 0;
     ret->bitset = NULL;
+    ret->rank = NULL;
+    ret->rankblocks = -1;
+    ret->ncontainers = 0;
+    ret->containers = NULL;
     return ret;
 }
 
 IntBitSet *intBitSetResetFromBuffer(IntBitSet *const bitset, const void *const buf, const Py_ssize_t bufsize) {
     // fprintf(stderr, "intBitSetResetFromBuffer called\n");
+    intBitSetFreeContainers(bitset);
     bitset->allocated = bufsize/wordbytesize;
     PyMem_Free(bitset->bitset);
     bitset->bitset = PyMem_Malloc(bufsize);
     bitset->tot = -1;
+    bitset->rankblocks = -1;
     bitset->size = bitset->allocated - 1;
     memcpy(bitset->bitset, buf, bufsize);
     bitset->trailing_bits = *(bitset->bitset + bitset->allocated - 1) ? (word_t) ~0 : 0;
@@ -76,11 +899,17 @@ IntBitSet *intBitSetResetFromBuffer(IntBitSet *const bitset, const void *const b
 
 IntBitSet *intBitSetReset(IntBitSet *const bitset) {
     // fprintf(stderr, "intBitSetReset called\n");
+    if (!bitset->bitset) {
+        intBitSetFreeContainers(bitset);
+        bitset->tot = 0;
+        return bitset;
+    }
     bitset->allocated = 1;
     bitset->size = 0;
     *bitset->bitset = 0;
     bitset->trailing_bits = 0;
     bitset->tot = 0;
+    bitset->rankblocks = -1;
     return bitset;
 }
 
@@ -92,6 +921,10 @@ IntBitSet *intBitSetCreateFromBuffer(const void *const buf, const Py_ssize_t buf
     ret->bitset = PyMem_Malloc(bufsize);
     ret->size = ret->allocated - 1;;
     ret->tot = -1;
+    ret->rank = NULL;
+    ret->rankblocks = -1;
+    ret->ncontainers = 0;
+    ret->containers = NULL;
     memcpy(ret->bitset, buf, bufsize);
     ret->trailing_bits = *(ret->bitset + ret->allocated - 1) ? (word_t) ~0 : 0;
     return ret;
@@ -103,17 +936,34 @@ void intBitSetDestroy(IntBitSet *const bitset) {
     if (bitset) {
         if (bitset->bitset)
             PyMem_Free(bitset->bitset);
+        if (bitset->rank)
+            PyMem_Free(bitset->rank);
+        intBitSetFreeContainers(bitset);
         PyMem_Free(bitset);
     }
 }
 
 IntBitSet *intBitSetClone(const IntBitSet * const bitset) {
     // fprintf(stderr, "intBitSetClone called\n");
-    IntBitSet *ret = PyMem_Malloc(sizeof(IntBitSet));
+    register int i;
+    IntBitSet *ret;
+    if (!bitset->bitset) {
+        ret = intBitSetCreateCompressed(bitset->ncontainers);
+        for (i = 0; i < bitset->ncontainers; ++i)
+            containerClone(ret->containers + i, bitset->containers + i);
+        ret->ncontainers = bitset->ncontainers;
+        ret->tot = bitset->tot;
+        return ret;
+    }
+    ret = PyMem_Malloc(sizeof(IntBitSet));
     ret->size = bitset->size;
     ret->tot = bitset->tot;
     ret->trailing_bits = bitset->trailing_bits;
     ret->allocated = bitset->allocated;
+    ret->rank = NULL;
+    ret->rankblocks = -1;
+    ret->ncontainers = 0;
+    ret->containers = NULL;
     ret->bitset = PyMem_Malloc(bitset->allocated * wordbytesize);
     memcpy(ret->bitset, bitset->bitset, bitset->allocated * wordbytesize);
     return ret;
@@ -124,6 +974,7 @@ int intBitSetGetSize(IntBitSet * const bitset) {
     register word_t *end;
     if (bitset->size >= 0)
         return bitset->size;
+    intBitSetExpand(bitset);
     base = bitset->bitset;
     end = bitset->bitset + bitset->allocated - 2;
     for (; base < end && *end == bitset->trailing_bits; --end);
@@ -152,7 +1003,8 @@ int intBitSetGetTot(IntBitSet *const bitset) {
     return bitset->tot;
 }
 
-int intBitSetGetAllocated(const IntBitSet * const bitset) {
+int intBitSetGetAllocated(IntBitSet * const bitset) {
+    intBitSetExpand(bitset);
     return bitset->allocated;
 }
 
@@ -160,6 +1012,7 @@ void intBitSetResize(IntBitSet *const bitset, register const int allocated) {
     // fprintf(stderr, "intBitSetResize called\n");
     register word_t *base;
     register word_t *end;
+    intBitSetExpand(bitset);
     if (allocated > bitset->allocated) {
         bitset->bitset = PyMem_Realloc(bitset->bitset, allocated * wordbytesize);
         base = bitset->bitset + bitset->allocated;
@@ -167,15 +1020,23 @@ void intBitSetResize(IntBitSet *const bitset, register const int allocated) {
         for (; base<end; ++base)
             *(base) = bitset->trailing_bits;
         bitset->allocated = allocated;
+        bitset->rankblocks = -1;
     }
 }
 
 bool_t intBitSetIsInElem(const IntBitSet * const bitset, register const int elem) {
+    register int i;
+    if (!bitset->bitset) {
+        i = intBitSetFindContainer(bitset, elem >> 16);
+        return i < bitset->ncontainers && bitset->containers[i].key == elem >> 16 &&
+            containerContains(bitset->containers + i, elem & 0xffff);
+    }
     return ((elem < bitset->allocated * wordbitsize) ?
             (bitset->bitset[elem / wordbitsize] & ((word_t) 1 << ((word_t)elem % (word_t)wordbitsize))) != 0 : bitset->trailing_bits != 0);
 }
 
 void intBitSetAddElem(IntBitSet *const bitset, register const int elem) {
+    intBitSetExpand(bitset);
     if (elem >= (bitset->allocated - 1) * wordbitsize) {
         if (bitset->trailing_bits)
             return;
@@ -185,9 +1046,11 @@ void intBitSetAddElem(IntBitSet *const bitset, register const int elem) {
     bitset->bitset[elem / wordbitsize] |= ((word_t) 1 << (elem % wordbitsize));
     bitset->tot = -1;
     bitset->size = -1;
+    bitset->rankblocks = -1;
 }
 
 void intBitSetDelElem(IntBitSet *const bitset, register const int elem) {
+    intBitSetExpand(bitset);
     if (elem >= (bitset->allocated - 1) * wordbitsize) {
         if (!bitset->trailing_bits)
             return;
@@ -197,6 +1060,7 @@ void intBitSetDelElem(IntBitSet *const bitset, register const int elem) {
     bitset->bitset[elem / wordbitsize] &= (word_t) ~((word_t) 1 << (elem % wordbitsize));
     bitset->tot = -1;
     bitset->size = -1;
+    bitset->rankblocks = -1;
 }
 
 bool_t intBitSetEmpty(const IntBitSet *const bitset) {
@@ -204,6 +1068,7 @@ bool_t intBitSetEmpty(const IntBitSet *const bitset) {
     register word_t *base;
     if (bitset->trailing_bits) return 0;
     if (bitset->tot == 0) return 1;
+    if (!bitset->bitset) return 0;
     end = bitset->bitset + bitset->allocated;
     for (base = bitset->bitset; base < end; ++base)
         if (*base) return 0;
@@ -220,7 +1085,10 @@ int intBitSetAdaptMax(IntBitSet *const x, IntBitSet *const y) {
     // if (sizemax > y->allocated)
     //     intBitSetResize(y, sizemax);
     // return sizemax;*/
-    register int allocated = (x->allocated > y->allocated) ? x->allocated : y->allocated;
+    register int allocated;
+    intBitSetExpand(x);
+    intBitSetExpand(y);
+    allocated = (x->allocated > y->allocated) ? x->allocated : y->allocated;
     if (allocated > x->allocated)
         intBitSetResize(x, allocated);
     if (allocated > y->allocated)
@@ -231,6 +1099,8 @@ int intBitSetAdaptMax(IntBitSet *const x, IntBitSet *const y) {
 int intBitSetAdaptMin(IntBitSet *const x, IntBitSet *const y) {
     register int sizex;
     register int sizey;
+    intBitSetExpand(x);
+    intBitSetExpand(y);
     if (x->trailing_bits || y->trailing_bits)
         return intBitSetAdaptMax(x, y);
     sizex = intBitSetGetSize(x);
@@ -243,7 +1113,10 @@ IntBitSet *intBitSetUnion(IntBitSet *const x, IntBitSet *const y) {
     register word_t *xend;
     register word_t *ybase;
     register word_t *retbase;
-    register IntBitSet * ret = PyMem_Malloc(sizeof (IntBitSet));
+    register IntBitSet * ret;
+    if (!x->bitset || !y->bitset)
+        return intBitSetCompressedOp(x, y, OP_OR);
+    ret = PyMem_Malloc(sizeof (IntBitSet));
     ret->allocated = intBitSetAdaptMax(x, y);
     xbase = x->bitset;
     xend = x->bitset+ret->allocated;
@@ -251,6 +1124,10 @@ IntBitSet *intBitSetUnion(IntBitSet *const x, IntBitSet *const y) {
     retbase = ret->bitset = PyMem_Malloc(wordbytesize * ret->allocated);
     ret->size = -1;
     ret->tot = -1;
+    ret->rank = NULL;
+    ret->rankblocks = -1;
+    ret->ncontainers = 0;
+    ret->containers = NULL;
     for (; xbase < xend; ++xbase, ++ybase, ++retbase)
         *(retbase) = *(xbase) | *(ybase);
     ret->trailing_bits = x->trailing_bits | y->trailing_bits;
@@ -262,7 +1139,10 @@ IntBitSet *intBitSetXor(IntBitSet *const x, IntBitSet *const y) {
     register word_t *xend;
     register word_t *ybase;
     register word_t *retbase;
-    register IntBitSet * ret = PyMem_Malloc(sizeof (IntBitSet));
+    register IntBitSet * ret;
+    if (!x->bitset || !y->bitset)
+        return intBitSetCompressedOp(x, y, OP_XOR);
+    ret = PyMem_Malloc(sizeof (IntBitSet));
     ret->allocated = intBitSetAdaptMax(x, y);
     xbase = x->bitset;
     xend = x->bitset+ret->allocated;
@@ -270,6 +1150,10 @@ IntBitSet *intBitSetXor(IntBitSet *const x, IntBitSet *const y) {
     retbase = ret->bitset = PyMem_Malloc(wordbytesize * ret->allocated);
     ret->size = -1;
     ret->tot = -1;
+    ret->rank = NULL;
+    ret->rankblocks = -1;
+    ret->ncontainers = 0;
+    ret->containers = NULL;
     for (; xbase < xend; ++xbase, ++ybase, ++retbase)
         *(retbase) = *(xbase) ^ *(ybase);
     ret->trailing_bits = x->trailing_bits ^ y->trailing_bits;
@@ -281,7 +1165,10 @@ IntBitSet *intBitSetIntersection(IntBitSet *const x, IntBitSet *const y) {
     register word_t *xend;
     register word_t *ybase;
     register word_t *retbase;
-    register IntBitSet * ret = PyMem_Malloc(sizeof (IntBitSet));
+    register IntBitSet * ret;
+    if (!x->bitset || !y->bitset)
+        return intBitSetCompressedOp(x, y, OP_AND);
+    ret = PyMem_Malloc(sizeof (IntBitSet));
     ret->allocated = intBitSetAdaptMin(x, y);
     xbase = x->bitset;
     xend = x->bitset+ret->allocated;
@@ -289,6 +1176,10 @@ IntBitSet *intBitSetIntersection(IntBitSet *const x, IntBitSet *const y) {
     retbase = ret->bitset = PyMem_Malloc(wordbytesize * ret->allocated);
     ret->size = -1;
     ret->tot = -1;
+    ret->rank = NULL;
+    ret->rankblocks = -1;
+    ret->ncontainers = 0;
+    ret->containers = NULL;
     for (; xbase < xend; ++xbase, ++ybase, ++retbase)
         *(retbase) = *(xbase) & *(ybase);
     ret->trailing_bits = x->trailing_bits & y->trailing_bits;
@@ -300,8 +1191,12 @@ IntBitSet *intBitSetSub(IntBitSet *const x, IntBitSet *const y) {
     register word_t *ybase;
     register word_t *retbase;
     register word_t *retend;
-    register IntBitSet * ret = PyMem_Malloc(sizeof (IntBitSet));
-    register int tmpsize = intBitSetAdaptMin(x, y);
+    register IntBitSet * ret;
+    register int tmpsize;
+    if (!x->bitset || !y->bitset)
+        return intBitSetCompressedOp(x, y, OP_SUB);
+    ret = PyMem_Malloc(sizeof (IntBitSet));
+    tmpsize = intBitSetAdaptMin(x, y);
     ret->allocated = x->allocated > tmpsize ? x->allocated : tmpsize;
     xbase = x->bitset;
     ybase = y->bitset;
@@ -309,6 +1204,10 @@ IntBitSet *intBitSetSub(IntBitSet *const x, IntBitSet *const y) {
     retend = ret->bitset+tmpsize;
     ret->size = -1;
     ret->tot = -1;
+    ret->rank = NULL;
+    ret->rankblocks = -1;
+    ret->ncontainers = 0;
+    ret->containers = NULL;
     for (; retbase < retend; ++xbase, ++ybase, ++retbase)
         *(retbase) = *(xbase) & ~*(ybase);
     retend = ret->bitset+ret->allocated;
@@ -322,7 +1221,10 @@ IntBitSet *intBitSetIUnion(IntBitSet *const dst, IntBitSet *const src) {
     register word_t *dstbase;
     register word_t *srcbase;
     register word_t *srcend;
-    register int allocated = intBitSetAdaptMax(dst, src);
+    register int allocated;
+    if (!dst->bitset || !src->bitset)
+        return intBitSetICompressedOp(dst, src, OP_OR);
+    allocated = intBitSetAdaptMax(dst, src);
     dstbase = dst->bitset;
     srcbase = src->bitset;
     srcend = src->bitset + allocated;
@@ -330,6 +1232,7 @@ IntBitSet *intBitSetIUnion(IntBitSet *const dst, IntBitSet *const src) {
         *dstbase |= *srcbase;
     dst->size = -1;
     dst->tot = -1;
+    dst->rankblocks = -1;
     dst->trailing_bits |= src->trailing_bits;
     return dst;
 }
@@ -338,7 +1241,10 @@ IntBitSet *intBitSetIXor(IntBitSet *const dst, IntBitSet *const src) {
     register word_t *dstbase;
     register word_t *srcbase;
     register word_t *srcend;
-    register int allocated = intBitSetAdaptMax(dst, src);
+    register int allocated;
+    if (!dst->bitset || !src->bitset)
+        return intBitSetICompressedOp(dst, src, OP_XOR);
+    allocated = intBitSetAdaptMax(dst, src);
     dstbase = dst->bitset;
     srcbase = src->bitset;
     srcend = src->bitset + allocated;
@@ -346,6 +1252,7 @@ IntBitSet *intBitSetIXor(IntBitSet *const dst, IntBitSet *const src) {
         *dstbase ^= *srcbase;
     dst->size = -1;
     dst->tot = -1;
+    dst->rankblocks = -1;
     dst->trailing_bits ^= src->trailing_bits;
     return dst;
 }
@@ -354,6 +1261,8 @@ IntBitSet *intBitSetIIntersection(IntBitSet *const dst, IntBitSet *const src) {
     register word_t *dstbase;
     register word_t *srcbase;
     register word_t *dstend;
+    if (!dst->bitset || !src->bitset)
+        return intBitSetICompressedOp(dst, src, OP_AND);
     dst->allocated = intBitSetAdaptMin(dst, src);
     dstbase = dst->bitset;
     srcbase = src->bitset;
@@ -362,6 +1271,7 @@ IntBitSet *intBitSetIIntersection(IntBitSet *const dst, IntBitSet *const src) {
         *dstbase &= *srcbase;
     dst->size = -1;
     dst->tot = -1;
+    dst->rankblocks = -1;
     dst->trailing_bits &= src->trailing_bits;
     return dst;
 }
@@ -370,7 +1280,10 @@ IntBitSet *intBitSetISub(IntBitSet *const dst, IntBitSet *const src) {
     register word_t *dstbase;
     register word_t *srcbase;
     register word_t *dstend;
-    register int allocated = intBitSetAdaptMin(dst, src);
+    register int allocated;
+    if (!dst->bitset || !src->bitset)
+        return intBitSetICompressedOp(dst, src, OP_SUB);
+    allocated = intBitSetAdaptMin(dst, src);
     dstbase = dst->bitset;
     srcbase = src->bitset;
     dstend = dst->bitset + allocated;
@@ -381,14 +1294,28 @@ IntBitSet *intBitSetISub(IntBitSet *const dst, IntBitSet *const src) {
         *dstbase &= ~src->trailing_bits;
     dst->size = -1;
     dst->tot = -1;
+    dst->rankblocks = -1;
     dst->trailing_bits &= ~src->trailing_bits;
     return dst;
 }
 
 int intBitSetGetNext(const IntBitSet *const x, register int last) {
-    register word_t* base = x->bitset + (++last / wordbitsize);
-    register int i = last % wordbitsize;
-    register word_t *end = x->bitset + x->allocated;
+    register word_t* base;
+    register int i;
+    register word_t *end;
+    if (!x->bitset) {
+        i = intBitSetFindContainer(x, ++last >> 16);
+        if (i < x->ncontainers && x->containers[i].key == last >> 16) {
+            last = containerNext(x->containers + i, last & 0xffff);
+            if (last >= 0)
+                return (x->containers[i].key << 16) + last;
+            ++i;
+        }
+        return i < x->ncontainers ? (x->containers[i].key << 16) + containerNext(x->containers + i, 0) : -2;
+    }
+    base = x->bitset + (++last / wordbitsize);
+    i = last % wordbitsize;
+    end = x->bitset + x->allocated;
     while(base < end) {
         if (*base)
             for (; i<wordbitsize; ++i)
@@ -400,12 +1327,522 @@ int intBitSetGetNext(const IntBitSet *const x, register int last) {
     return x->trailing_bits ? last : -2;
 }
 
+static void intBitSetBuildRank(IntBitSet *const bitset) {
+    // fprintf(stderr, "intBitSetBuildRank called\n");
+    register word_t *base = bitset->bitset;
+    register word_t *end = bitset->bitset + bitset->allocated;
+    register word_t *blockend;
+    register int tot = 0;
+    register int block;
+    int blocks = (bitset->allocated + rankblocksize - 1) / rankblocksize;
+    bitset->rank = PyMem_Realloc(bitset->rank, (blocks + 1) * sizeof(int));
+    for (block = 0; block < blocks; ++block) {
+        bitset->rank[block] = tot;
+        blockend = base + rankblocksize < end ? base + rankblocksize : end;
+        for (; base < blockend; ++base)
+            tot += wordPopCount(*base);
+    }
+    bitset->rank[blocks] = tot;
+    bitset->rankblocks = blocks;
+    if (!bitset->trailing_bits)
+        bitset->tot = tot;
+}
+
+/** Rank.
+ * Returns the number of elements of bitset smaller than elem.
+ */
+int intBitSetRank(IntBitSet *const bitset, register const int elem) {
+    register word_t *base;
+    register word_t *end;
+    register int ret;
+    register int i;
+    if (!bitset->bitset) {
+        ret = 0;
+        for (i = 0; i < bitset->ncontainers && bitset->containers[i].key < elem >> 16; ++i)
+            ret += bitset->containers[i].cardinality;
+        if (i < bitset->ncontainers && bitset->containers[i].key == elem >> 16)
+            ret += containerRank(bitset->containers + i, elem & 0xffff);
+        return ret;
+    }
+    if (bitset->rankblocks < 0)
+        intBitSetBuildRank(bitset);
+    if (elem >= bitset->allocated * wordbitsize) {
+        ret = bitset->rank[bitset->rankblocks];
+        if (bitset->trailing_bits)
+            ret += elem - bitset->allocated * wordbitsize;
+        return ret;
+    }
+    ret = bitset->rank[elem / wordbitsize / rankblocksize];
+    base = bitset->bitset + elem / wordbitsize / rankblocksize * rankblocksize;
+    end = bitset->bitset + elem / wordbitsize;
+    for (; base < end; ++base)
+        ret += wordPopCount(*base);
+    return ret + wordPopCount(*end & (((word_t) 1 << (elem % wordbitsize)) - 1));
+}
+
+/** Select.
+ * Returns the element at position index in the sorted representation
+ * of bitset, or -2 if bitset has not so many elements.
+ */
+int intBitSetSelect(IntBitSet *const bitset, register int index) {
+    register int low = 0;
+    register int high;
+    register int middle;
+    register word_t *base;
+    register word_t word;
+    register int i;
+    if (index < 0)
+        return -2;
+    if (!bitset->bitset) {
+        for (i = 0; i < bitset->ncontainers && bitset->containers[i].cardinality <= index; ++i)
+            index -= bitset->containers[i].cardinality;
+        if (i == bitset->ncontainers)
+            return -2;
+        return (bitset->containers[i].key << 16) + containerSelect(bitset->containers + i, index);
+    }
+    if (bitset->rankblocks < 0)
+        intBitSetBuildRank(bitset);
+    if (index >= bitset->rank[bitset->rankblocks]) {
+        if (bitset->trailing_bits)
+            return bitset->allocated * wordbitsize + index - bitset->rank[bitset->rankblocks];
+        return -2;
+    }
+    // Binary search of the last block starting before the element.
+    high = bitset->rankblocks - 1;
+    while (low < high) {
+        middle = (low + high + 1) / 2;
+        if (bitset->rank[middle] <= index)
+            low = middle;
+        else
+            high = middle - 1;
+    }
+    index -= bitset->rank[low];
+    base = bitset->bitset + low * rankblocksize;
+    for (; (i = wordPopCount(*base)) <= index; ++base)
+        index -= i;
+    word = *base;
+    for (; index > 0; --index)
+        word &= word - 1;
+    for (i = 0; !(word & ((word_t) 1 << i)); ++i);
+    return i + (int) (base - bitset->bitset) * wordbitsize;
+}
+
+// Number of words of the union of compressed sets per container of the
+// sets above which the union is compressed: merging the containers of
+// a chunk costs several times more than clearing its words.
+#define UNION_WORDS_PER_CONTAINER (4 * CONTAINER_WORDS)
+
+/** Containers union of many.
+ * Returns the compressed union of the n compressed sets, merging their
+ * containers chunk by chunk.
+ */
+static IntBitSet *intBitSetContainersUnionMany(IntBitSet *const *const sets, const int n, const int ncontainers) {
+    word_t words[CONTAINER_WORDS];
+    register int i;
+    register int size;
+    register int count;
+    register word_t word;
+    register const IntBitSetContainer *container;
+    register IntBitSetContainer *retcontainer;
+    const IntBitSetContainer *single = NULL;
+    int *positions = PyMem_Malloc(n * sizeof(int));
+    unsigned short *data;
+    int key;
+    int next = -1;
+    int last = -1;
+    IntBitSet *ret;
+    for (i = 0; i < n; ++i) {
+        positions[i] = 0;
+        if (sets[i]->ncontainers) {
+            if (next < 0 || sets[i]->containers[0].key < next)
+                next = sets[i]->containers[0].key;
+            if (sets[i]->containers[sets[i]->ncontainers - 1].key > last)
+                last = sets[i]->containers[sets[i]->ncontainers - 1].key;
+        }
+    }
+    ret = intBitSetCreateCompressed(ncontainers < last - next + 1 ? ncontainers : last - next + 1);
+    retcontainer = ret->containers;
+    memset(words, 0, CONTAINER_WORDS * wordbytesize);
+    while (next >= 0) {
+        key = next;
+        next = -1;
+        count = 0;
+        // the number of elements of the containers if they are arrays
+        size = 0;
+        for (i = 0; i < n; ++i) {
+            if (positions[i] < sets[i]->ncontainers && sets[i]->containers[positions[i]].key == key) {
+                container = sets[i]->containers + positions[i]++;
+                if (!count++)
+                    single = container;
+                size = size >= 0 && container->type == CONTAINER_ARRAY ? size + container->size : -1;
+                containerToWords(container, words, CONTAINER_WORDS, OP_OR);
+            }
+            if (positions[i] < sets[i]->ncontainers && (next < 0 || sets[i]->containers[positions[i]].key < next))
+                next = sets[i]->containers[positions[i]].key;
+        }
+        if (count == 1) {
+            containerClone(retcontainer++, single);
+            containerToWords(single, words, CONTAINER_WORDS, OP_SUB);
+        } else if (size >= 0 && size <= CONTAINER_MAX_ARRAY) {
+            // few elements: they are taken from the words that are set
+            data = PyMem_Malloc(size * sizeof(unsigned short));
+            for (i = size = 0; i < CONTAINER_WORDS; ++i)
+                if (words[i]) {
+                    for (word = words[i]; word; word &= word - 1)
+                        data[size++] = (unsigned short) (i * wordbitsize + wordLowestBit(word));
+                    words[i] = 0;
+                }
+            if (containerFromArray(retcontainer, key, data, size))
+                ++retcontainer;
+        } else {
+            if (containerFromWords(retcontainer, key, words))
+                ++retcontainer;
+            memset(words, 0, CONTAINER_WORDS * wordbytesize);
+        }
+    }
+    PyMem_Free(positions);
+    ret->ncontainers = retcontainer - ret->containers;
+    for (i = 0; i < ret->ncontainers; ++i)
+        ret->tot += ret->containers[i].cardinality;
+    return ret;
+}
+
+/** Union of many.
+ * Returns the union of the n sets, adding the words or the containers
+ * of each set to the words of the result.
+ */
+IntBitSet *intBitSetUnionMany(IntBitSet *const *const sets, const int n) {
+    register int i;
+    register int j;
+    register word_t *retbase;
+    register word_t *base;
+    register word_t *end;
+    register int start;
+    int allocated = 1;
+    int ncontainers = 0;
+    bool_t compressed = n > 0;
+    IntBitSet *ret;
+    for (i = 0; i < n; ++i) {
+        if (sets[i]->bitset) {
+            compressed = 0;
+            if (sets[i]->allocated > allocated)
+                allocated = sets[i]->allocated;
+        } else if (sets[i]->ncontainers) {
+            ncontainers += sets[i]->ncontainers;
+            if (intBitSetGetLast(sets[i]) / wordbitsize + 2 > allocated)
+                allocated = intBitSetGetLast(sets[i]) / wordbitsize + 2;
+        }
+    }
+    // the union of very sparse compressed sets is kept compressed
+    if (compressed && ncontainers < allocated / UNION_WORDS_PER_CONTAINER)
+        return intBitSetContainersUnionMany(sets, n, ncontainers);
+    ret = intBitSetCreate((allocated - 1) * wordbitsize, 0);
+    for (i = 0; i < n; ++i) {
+        if (sets[i]->bitset) {
+            retbase = ret->bitset;
+            base = sets[i]->bitset;
+            end = sets[i]->bitset + sets[i]->allocated;
+            for (; base < end; ++base, ++retbase)
+                *retbase |= *base;
+            if (sets[i]->trailing_bits) {
+                end = ret->bitset + allocated;
+                for (; retbase < end; ++retbase)
+                    *retbase = (word_t) ~0;
+                ret->trailing_bits = (word_t) ~0;
+            }
+        } else
+            for (j = 0; j < sets[i]->ncontainers; ++j) {
+                start = sets[i]->containers[j].key * CONTAINER_WORDS;
+                containerToWords(sets[i]->containers + j, ret->bitset + start, allocated - start < CONTAINER_WORDS ? allocated - start : CONTAINER_WORDS, OP_OR);
+            }
+    }
+    ret->size = -1;
+    ret->tot = -1;
+    return ret;
+}
+
+/** Containers intersection of many.
+ * Returns the compressed intersection of the n sets, the smallest-th
+ * of which is compressed.  Chunk by chunk, the elements of its
+ * container are intersected with each other set in turn, as an array
+ * as soon as one of the containers is, as words otherwise, until none
+ * is left.
+ */
+static IntBitSet *intBitSetContainersIntersectionMany(IntBitSet *const *const sets, const int n, const int smallest) {
+    word_t words[CONTAINER_WORDS];
+    word_t tmp[CONTAINER_WORDS];
+    register int i;
+    register int j;
+    register int k;
+    register int l;
+    register word_t *base;
+    register const unsigned short *otherdata;
+    register IntBitSetContainer *retcontainer;
+    const IntBitSet *const x = sets[smallest];
+    const IntBitSetContainer *container;
+    const IntBitSetContainer *other;
+    unsigned short *data;
+    int key;
+    int c;
+    IntBitSet *ret = intBitSetCreateCompressed(x->ncontainers);
+    retcontainer = ret->containers;
+    for (c = 0; c < x->ncontainers; ++c) {
+        container = x->containers + c;
+        key = container->key;
+        // the elements left are either the k elements of data or the
+        // words if data is NULL
+        data = NULL;
+        k = container->cardinality;
+        if (container->type == CONTAINER_ARRAY) {
+            data = PyMem_Malloc(container->size * sizeof(unsigned short));
+            memcpy(data, container->data, container->size * sizeof(unsigned short));
+        } else if (container->type == CONTAINER_BITMAP)
+            memcpy(words, container->data, CONTAINER_WORDS * wordbytesize);
+        else {
+            memset(words, 0, CONTAINER_WORDS * wordbytesize);
+            containerToWords(container, words, CONTAINER_WORDS, OP_OR);
+        }
+        for (i = 0; i < n && k; ++i) {
+            if (i == smallest)
+                continue;
+            other = NULL;
+            if (!sets[i]->bitset) {
+                j = intBitSetFindContainer(sets[i], key);
+                if (j == sets[i]->ncontainers || sets[i]->containers[j].key != key) {
+                    k = 0;
+                    break;
+                }
+                other = sets[i]->containers + j;
+            }
+            if (data) {
+                for (j = l = 0; j < k; ++j)
+                    if (other ? containerContains(other, data[j]) : intBitSetIsInElem(sets[i], (key << 16) + data[j]))
+                        data[l++] = data[j];
+                k = l;
+            } else if (other && other->type == CONTAINER_ARRAY) {
+                // from now on the elements left are an array
+                otherdata = other->data;
+                data = PyMem_Malloc(other->size * sizeof(unsigned short));
+                for (j = k = 0; j < other->size; ++j)
+                    if (words[otherdata[j] / wordbitsize] & ((word_t) 1 << (otherdata[j] % wordbitsize)))
+                        data[k++] = otherdata[j];
+            } else if (other && other->type == CONTAINER_BITMAP)
+                wordsOp(words, words, other->data, CONTAINER_WORDS, OP_AND);
+            else if (other) {
+                memset(tmp, 0, CONTAINER_WORDS * wordbytesize);
+                containerToWords(other, tmp, CONTAINER_WORDS, OP_OR);
+                wordsOp(words, words, tmp, CONTAINER_WORDS, OP_AND);
+            } else {
+                l = key * CONTAINER_WORDS;
+                base = sets[i]->bitset + l;
+                for (j = 0; j < CONTAINER_WORDS; ++j, ++base)
+                    words[j] &= l + j < sets[i]->allocated ? *base : sets[i]->trailing_bits;
+            }
+        }
+        if (data) {
+            if (containerFromArray(retcontainer, key, data, k))
+                ++retcontainer;
+        } else if (k && containerFromWords(retcontainer, key, words))
+            ++retcontainer;
+    }
+    ret->ncontainers = retcontainer - ret->containers;
+    for (i = 0; i < ret->ncontainers; ++i)
+        ret->tot += ret->containers[i].cardinality;
+    return ret;
+}
+
+/** Intersection of many.
+ * Returns the intersection of the n sets, or the empty set if n is 0.
+ * The result is compressed if a set is, and it is then computed from
+ * the containers of the compressed set with the fewest elements.
+ */
+IntBitSet *intBitSetIntersectionMany(IntBitSet *const *const sets, const int n) {
+    register int i;
+    register word_t *retbase;
+    register word_t *base;
+    register word_t *end;
+    int allocated = -1;
+    int smallest = -1;
+    IntBitSet *ret;
+    if (!n)
+        return intBitSetCreate(0, 0);
+    for (i = 0; i < n; ++i) {
+        if (!sets[i]->bitset) {
+            if (smallest < 0 || sets[i]->tot < sets[smallest]->tot)
+                smallest = i;
+        } else if (!sets[i]->trailing_bits && (allocated < 0 || intBitSetGetSize(sets[i]) + 1 < allocated))
+            allocated = intBitSetGetSize(sets[i]) + 1;
+    }
+    if (smallest >= 0)
+        return intBitSetContainersIntersectionMany(sets, n, smallest);
+    if (allocated < 0)
+        // infinite sets only
+        for (i = 0; i < n; ++i)
+            if (sets[i]->allocated > allocated)
+                allocated = sets[i]->allocated;
+    ret = intBitSetCreate((allocated - 1) * wordbitsize, 1);
+    for (i = 0; i < n; ++i) {
+        retbase = ret->bitset;
+        base = sets[i]->bitset;
+        end = sets[i]->bitset + (sets[i]->allocated < allocated ? sets[i]->allocated : allocated);
+        for (; base < end; ++base, ++retbase)
+            *retbase &= *base;
+        // the words after the end of an infinite set are kept
+        ret->trailing_bits &= sets[i]->trailing_bits;
+    }
+    ret->size = -1;
+    return ret;
+}
+
+/** Count words.
+ * Adds weight to the counts of the elements of the nwords words of a
+ * chunk.  indexwords are the words of the chunk in the union of the
+ * sets, wordranks the rank in the union of their first bits, and
+ * counts holds a value per element of the union, in increasing order.
+ */
+static void countWords(const word_t *const indexwords, const int *const wordranks, double *const counts, const word_t *const words, const int nwords, const double weight) {
+    register int i;
+    register word_t word;
+    for (i = 0; i < nwords; ++i)
+        for (word = words[i]; word; word &= word - 1)
+            counts[wordranks[i] + wordPopCount(indexwords[i] & ((word & -word) - 1))] += weight;
+}
+
+IntBitSet *intBitSetCountMany(IntBitSet *const *const sets, const int n, const double *const weights, double **const counts) {
+    word_t words[CONTAINER_WORDS];
+    int wordranks[CONTAINER_WORDS];
+    register int i;
+    register int k;
+    register int rank;
+    register const unsigned short *data;
+    register const IntBitSetContainer *container;
+    register const word_t *indexwords;
+    int *positions = PyMem_Malloc((n ? n : 1) * sizeof(int));
+    int key;
+    int first;
+    int nwords;
+    int nchunks;
+    double weight;
+    IntBitSet *index;
+    IntBitSet *ret = intBitSetUnionMany(sets, n);
+    // the elements are looked up in the words of the union
+    index = ret;
+    if (!ret->bitset) {
+        index = intBitSetClone(ret);
+        intBitSetExpand(index);
+    }
+    if (index->rankblocks < 0)
+        intBitSetBuildRank(index);
+    k = index->rank[index->rankblocks];
+    *counts = PyMem_Malloc((k ? k : 1) * sizeof(double));
+    for (i = 0; i < k; ++i)
+        (*counts)[i] = 0.0;
+    for (i = 0; i < n; ++i)
+        positions[i] = 0;
+    // The sets are counted chunk by chunk, so that the counts being
+    // updated stay in the cache.
+    nchunks = (index->allocated + CONTAINER_WORDS - 1) / CONTAINER_WORDS;
+    for (key = 0; key < nchunks; ++key) {
+        first = key * CONTAINER_WORDS;
+        nwords = index->allocated - first < CONTAINER_WORDS ? index->allocated - first : CONTAINER_WORDS;
+        indexwords = index->bitset + first;
+        rank = index->rank[first / rankblocksize];
+        for (i = 0; i < nwords; ++i) {
+            wordranks[i] = rank;
+            rank += wordPopCount(indexwords[i]);
+        }
+        if (rank == wordranks[0])
+            // no element of the union in the chunk
+            continue;
+        for (i = 0; i < n; ++i) {
+            weight = weights ? weights[i] : 1.0;
+            if (sets[i]->bitset) {
+                if (first < sets[i]->allocated)
+                    countWords(indexwords, wordranks, *counts, sets[i]->bitset + first, sets[i]->allocated - first < nwords ? sets[i]->allocated - first : nwords, weight);
+                continue;
+            }
+            if (positions[i] == sets[i]->ncontainers || sets[i]->containers[positions[i]].key != key)
+                continue;
+            container = sets[i]->containers + positions[i]++;
+            if (container->type == CONTAINER_ARRAY) {
+                data = container->data;
+                for (k = 0; k < container->size; ++k)
+                    (*counts)[wordranks[data[k] / wordbitsize] + wordPopCount(indexwords[data[k] / wordbitsize] & (((word_t) 1 << (data[k] % wordbitsize)) - 1))] += weight;
+            } else if (container->type == CONTAINER_BITMAP)
+                countWords(indexwords, wordranks, *counts, container->data, nwords, weight);
+            else {
+                memset(words, 0, CONTAINER_WORDS * wordbytesize);
+                containerToWords(container, words, CONTAINER_WORDS, OP_OR);
+                countWords(indexwords, wordranks, *counts, words, nwords, weight);
+            }
+        }
+    }
+    PyMem_Free(positions);
+    if (index != ret)
+        intBitSetDestroy(index);
+    return ret;
+}
+
+void intBitSetAddCounts(IntBitSet *const index, IntBitSet *const subset, const double *const subcounts, double *const counts) {
+    register int elem = -1;
+    register int last = -1;
+    register int i = 0;
+    register int j = -1;
+    // both sets are walked in increasing order, j being the position
+    // of last in index
+    while ((elem = intBitSetGetNext(subset, elem)) >= 0) {
+        while (last < elem && last != -2) {
+            last = intBitSetGetNext(index, last);
+            ++j;
+        }
+        if (last != elem)
+            return;
+        counts[j] += subcounts[i++];
+    }
+}
+
+static unsigned char intBitSetCmpContainers(const IntBitSet *const x, const IntBitSet *const y) {
+    word_t xwords[CONTAINER_WORDS];
+    word_t ywords[CONTAINER_WORDS];
+    register int i = 0;
+    register int j = 0;
+    register int k;
+    register unsigned char ret = 0;
+    while (ret != 3 && (i < x->ncontainers || j < y->ncontainers)) {
+        if (j == y->ncontainers || (i < x->ncontainers && x->containers[i].key < y->containers[j].key)) {
+            ret |= 2;
+            ++i;
+        } else if (i == x->ncontainers || y->containers[j].key < x->containers[i].key) {
+            ret |= 1;
+            ++j;
+        } else if (x->containers[i].type == y->containers[j].type && x->containers[i].size == y->containers[j].size &&
+                   !memcmp(x->containers[i].data, y->containers[j].data, containerDataSize(x->containers + i))) {
+            // identical containers
+            ++i;
+            ++j;
+        } else {
+            memset(xwords, 0, CONTAINER_WORDS * wordbytesize);
+            memset(ywords, 0, CONTAINER_WORDS * wordbytesize);
+            containerToWords(x->containers + i, xwords, CONTAINER_WORDS, OP_OR);
+            containerToWords(y->containers + j, ywords, CONTAINER_WORDS, OP_OR);
+            for (k = 0; ret != 3 && k < CONTAINER_WORDS; ++k)
+                ret |= (ywords[k] != (xwords[k] | ywords[k])) * 2 + (xwords[k] != (xwords[k] | ywords[k]));
+            ++i;
+            ++j;
+        }
+    }
+    return ret;
+}
+
 unsigned char intBitSetCmp(IntBitSet *const x, IntBitSet *const y) {
     register word_t *xbase;
     register word_t *xend;
     register word_t *ybase;
     register unsigned char ret = 0;
-    register int allocated = intBitSetAdaptMax(x, y);
+    register int allocated;
+    if (!x->bitset && !y->bitset)
+        return intBitSetCmpContainers(x, y);
+    allocated = intBitSetAdaptMax(x, y);
     xbase = x->bitset;
     xend = x->bitset+allocated;
     ybase = y->bitset;
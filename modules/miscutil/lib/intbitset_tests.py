@@ -25,13 +25,18 @@ import unittest
 import sys
 import zlib
 import os
+import mmap
+import tempfile
+import weakref
 
 if sys.hexversion < 0x2040000:
     # pylint: disable=W0622
     from sets import Set as set
     # pylint: enable=W0622
 
-from invenio.intbitset import intbitset
+from invenio import intbitset as intbitset_module
+from invenio.intbitset import intbitset, union_many, intersection_many, \
+     count_many, intbitset_file
 from invenio.testutils import make_test_suite, run_test_suite
 from invenio.config import CFG_TMPDIR
 
@@ -74,6 +79,16 @@ class IntBitSetTest(unittest.TestCase):
 
         self.big_examples = [list(intbitset(CFG_INTBITSET_BIG_EXAMPLE))]
 
+        ## Sets spanning several chunks of 65536 integers, stored as
+        ## arrays, bitmaps and runs when compressed
+        self.container_examples = [
+            range(60000, 140000),
+            range(0, 200000, 3),
+            [5, 65536 * 3 + 1, 65536 * 3 + 7],
+            range(0, 65536, 2) + range(65536, 70000) + [131072 * 4],
+            range(100, 600) + range(1000, 7000, 7) + range(70000, 72000) + range(131072, 196608),
+        ]
+
         self.corrupted_strdumps = [
             "ciao",
             intbitset([2, 6000000]).strbits(),
@@ -82,6 +97,7 @@ class IntBitSetTest(unittest.TestCase):
 
     def tearDown(self):
         del self.big_examples
+        del self.container_examples
         del self.corrupted_strdumps
 
     def _helper_sanity_test(self, intbitset1, msg=''):
@@ -377,6 +393,41 @@ class IntBitSetTest(unittest.TestCase):
                 else:
                     self.failIf(i in intbitset1, "%s was not correctly updated from %s by %s" % (repr(intbitset1), repr(set1), repr(dict1)))
 
+    def test_set_rank(self):
+        """intbitset - rank of elements"""
+        for set1 in self.sets + [[]] + self.big_examples:
+            intbitset1 = intbitset(set1)
+            for i in range(0, len(set1), len(set1) / 100 + 1):
+                self.assertEqual(intbitset1.rank(set1[i]), i)
+                self.assertEqual(intbitset1.rank(set1[i] + 1), i + 1)
+            self.assertEqual(intbitset1.rank(0), 0)
+            self.assertEqual(intbitset1.rank(set1 and set1[-1] + 1000 or 1000), len(set1))
+        for set1 in self.sets:
+            intbitset1 = intbitset(set1, trailing_bits=True)
+            self.assertEqual(intbitset1.rank(set1[-1] + 1), len(set1))
+            self.assertEqual(intbitset1.rank(set1[-1] + 1000), len(set1) + 999)
+        intbitset1 = intbitset([10, 20, 30])
+        self.assertEqual(intbitset1.rank(25), 2)
+        intbitset1.add(15)
+        self.assertEqual(intbitset1.rank(25), 3)
+        intbitset1 &= intbitset([20, 30])
+        self.assertEqual(intbitset1.rank(25), 1)
+
+    def test_set_sorted_elements(self):
+        """intbitset - elements by position in the sorted representation"""
+        for set1 in self.sets + [[]] + self.big_examples:
+            intbitset1 = intbitset(set1)
+            for i in range(0, len(set1), len(set1) / 100 + 1):
+                self.assertEqual(intbitset1.get_sorted_element(i), set1[i])
+                self.assertEqual(intbitset1.get_sorted_element(-i - 1), set1[-i - 1])
+            self.assertRaises(IndexError, intbitset1.get_sorted_element, len(set1))
+            for i in range(0, len(set1) + 2, len(set1) / 100 + 3):
+                self.assertEqual(list(intbitset1.to_sorted_list(i, i + 5)), set1[i:i + 5])
+        intbitset1 = intbitset([10, 20, 30])
+        self.assertEqual(intbitset1.get_sorted_element(1), 20)
+        intbitset1.discard(10)
+        self.assertEqual(intbitset1.get_sorted_element(1), 30)
+
     def test_set_cloning(self):
         """intbitset - set cloning"""
         import copy
@@ -418,9 +469,258 @@ class IntBitSetTest(unittest.TestCase):
                 tmp_set1.append(recid)
             self.assertEqual(set1, tmp_set1)
 
+    def test_container_marshalling(self):
+        """intbitset - marshalling as container dump"""
+        for set1 in self.sets + [[]] + self.container_examples + self.big_examples:
+            intbitset1 = intbitset(set1)
+            strdump = intbitset1.fastdump(containers=True)
+            self.assertEqual(intbitset(strdump), intbitset1)
+            self.assertEqual(intbitset().fastload(strdump), intbitset1)
+            self.assertEqual(intbitset(strdump).fastdump(containers=True), strdump)
+            self.assertEqual(list(intbitset(strdump)), set1)
+            self.assertEqual(len(intbitset(strdump)), len(set1))
+        for set1 in self.sets + [[]]:
+            ## Infinite sets are dumped compressed by zlib
+            intbitset1 = intbitset(set1, trailing_bits=True)
+            self.assertEqual(intbitset(intbitset1.fastdump(containers=True)), intbitset1)
+
+    def test_container_buffers(self):
+        """intbitset - sets sharing the memory of container dumps"""
+        for set1 in self.container_examples:
+            strdump = intbitset(set1).fastdump(containers=True)
+            refcount = sys.getrefcount(strdump)
+            intbitset1 = intbitset(strdump)
+            self.assertEqual(sys.getrefcount(strdump), refcount + 1)
+            self.assertEqual(list(intbitset1), set1)
+            ## Copy on write
+            intbitset1.add(65535)
+            intbitset1 -= intbitset([set1[0]])
+            self.assertEqual(list(intbitset(strdump)), set1)
+            for offset in range(9):
+                ## Whatever the alignment of the dump in the buffer
+                self.assertEqual(list(intbitset(buffer('x' * offset + strdump, offset))), set1)
+            if sys.hexversion >= 0x2060000:
+                dump_bytes = bytearray(strdump)
+                intbitset1 = intbitset(dump_bytes)
+                intbitset1.discard(set1[-1])
+                self.assertEqual(str(dump_bytes), strdump)
+            path = tempfile.mktemp()
+            dump_file = open(path, 'wb')
+            dump_file.write(strdump)
+            dump_file.close()
+            dump_file = open(path, 'rb')
+            intbitset1 = intbitset(mmap.mmap(dump_file.fileno(), 0, access=mmap.ACCESS_READ))
+            dump_file.close()
+            os.remove(path)
+            self.assertEqual(list(intbitset1), set1)
+
+    def test_mutable_container_buffers(self):
+        """intbitset - sets loaded from mutable container dumps"""
+        for set1 in self.container_examples:
+            strdump = intbitset(set1).fastdump(containers=True)
+            if sys.hexversion >= 0x2060000:
+                dump_bytes = bytearray(strdump)
+                intbitset1 = intbitset(dump_bytes)
+                intbitset2 = intbitset(buffer(dump_bytes))
+                intbitset3 = intbitset()
+                intbitset3.fastload(dump_bytes)
+                ## Overwritten and moved
+                dump_bytes[:] = '\0' * len(strdump)
+                dump_bytes.extend('\0' * (1 << 20))
+                for intbitset4 in (intbitset1, intbitset2, intbitset3):
+                    self.assertEqual(list(intbitset4), set1)
+            path = tempfile.mktemp()
+            dump_file = open(path, 'w+b')
+            dump_file.write(strdump)
+            dump_file.flush()
+            dump_map = mmap.mmap(dump_file.fileno(), 0)
+            intbitset1 = intbitset(dump_map)
+            intbitset2 = intbitset(buffer(dump_map))
+            dump_map[:] = '\0' * len(strdump)
+            dump_map.close()
+            dump_file.close()
+            os.remove(path)
+            for intbitset4 in (intbitset1, intbitset2):
+                self.assertEqual(list(intbitset4), set1)
+
+    def test_closed_read_only_map(self):
+        """intbitset - sets loaded from a closed read-only mmap"""
+        for set1 in self.container_examples:
+            intbitset1 = intbitset(set1)
+            strdump = intbitset1.fastdump(containers=True)
+            path = tempfile.mktemp()
+            dump_file = open(path, 'wb')
+            dump_file.write(strdump)
+            dump_file.close()
+            dump_file = open(path, 'rb')
+            dump_map = mmap.mmap(dump_file.fileno(), 0, access=mmap.ACCESS_READ)
+            dump_file.close()
+            os.remove(path)
+            intbitset2 = intbitset(dump_map)
+            intbitset3 = intbitset(buffer(dump_map))
+            intbitset4 = intbitset()
+            intbitset4.fastload(dump_map)
+            dump_map.close()
+            for intbitset5 in (intbitset2, intbitset3, intbitset4):
+                self.assertEqual(intbitset5, intbitset1)
+                self.assertEqual(list(intbitset5), set1)
+
+    def test_intbitset_file(self):
+        """intbitset - sets sharing the memory of a mapped file"""
+        path = tempfile.mktemp()
+        dump_file = open(path, 'wb')
+        dump_file.write('header')
+        offsets = []
+        for set1 in self.container_examples + [[1, 2, 3]]:
+            strdump = intbitset(set1).fastdump(containers=set1 != [1, 2, 3])
+            offsets.append((dump_file.tell(), len(strdump)))
+            dump_file.write(strdump)
+        dump_file.close()
+        mapped_file = intbitset_file(path)
+        os.remove(path)
+        self.assertEqual(mapped_file.read(0, 6), 'header')
+        self.assertRaises(ValueError, mapped_file.read, 0, len(mapped_file) + 1)
+        self.assertRaises(ValueError, mapped_file.load, -1, 8)
+        intbitsets = [mapped_file.load(offset, length) for offset, length in offsets]
+        ## The map outlives the file object as long as the sets are in use
+        del mapped_file
+        for set1, intbitset1 in zip(self.container_examples + [[1, 2, 3]], intbitsets):
+            self.assertEqual(list(intbitset1), set1)
+            intbitset1.add(65535)
+            self.failUnless(65535 in intbitset1)
+
+    def test_set_operations_compressed(self):
+        """intbitset - set operations on compressed sets"""
+        sets = self.sets + [[]] + self.container_examples
+        intbitsets = [intbitset(set1) for set1 in sets]
+        strdumps = [intbitset1.fastdump(containers=True) for intbitset1 in intbitsets]
+        for fncs in self.fncs_list:
+            for set1, intbitset1, strdump1 in zip(sets, intbitsets, strdumps):
+                for set2, intbitset2, strdump2 in zip(sets, intbitsets, strdumps):
+                    expected = fncs[0](intbitset(intbitset1), intbitset2)
+                    for operand1, operand2 in (
+                            (intbitset(strdump1), intbitset(strdump2)),
+                            (intbitset(strdump1), intbitset2),
+                            (intbitset(intbitset1), intbitset(strdump2))):
+                        result = fncs[0](operand1, operand2)
+                        self.assertEqual(result, expected, "%s of %s and %s" % (fncs[0].__name__, set1[:10], set2[:10]))
+                        self.assertEqual(len(result), len(expected))
+        sets = [set(set1) for set1 in sets]
+        for cmp_fncs in self.cmp_list:
+            for set1, strdump1 in zip(sets, strdumps):
+                for set2, strdump2 in zip(sets, strdumps):
+                    self.assertEqual(cmp_fncs[0](intbitset(strdump1), intbitset(strdump2)),
+                                     cmp_fncs[1](set1, set2))
+
+    def test_compressed_set_access(self):
+        """intbitset - element access on compressed sets"""
+        for set1 in self.container_examples:
+            intbitset1 = intbitset(intbitset(set1).fastdump(True))
+            for i in range(0, len(set1), len(set1) / 100 + 1):
+                self.failUnless(set1[i] in intbitset1)
+                self.failIf(set1[i] - 1 in intbitset1 and set1[i] - 1 not in set1)
+                self.assertEqual(intbitset1.get_sorted_element(i), set1[i])
+                self.assertEqual(intbitset1.rank(set1[i]), i)
+            self.assertEqual(intbitset1.extract_finite_list(), set1)
+            self.assertEqual(hash(intbitset1), hash(intbitset(set1)))
+            intbitset1.add(65535)
+            intbitset1.discard(set1[0])
+            self.assertEqual(list(intbitset1), sorted(set(set1[1:] + [65535])))
+
+    def test_set_operations_many(self):
+        """intbitset - set operations on many sets"""
+        sets = self.sets + [[]] + self.container_examples
+        intbitsets = [intbitset(set1) for set1 in sets]
+        intbitsets += [intbitset(intbitset1.fastdump(containers=True)) for intbitset1 in intbitsets]
+        intbitsets += [intbitset(set1, trailing_bits=True) for set1 in sets[:4]]
+        for start in range(len(intbitsets)):
+            for end in range(start, len(intbitsets) + 1, 5):
+                operands = intbitsets[start:end]
+                copies = [intbitset(intbitset1) for intbitset1 in operands]
+                expected_union = intbitset()
+                for intbitset1 in operands:
+                    expected_union |= intbitset1
+                expected_intersection = intbitset()
+                if operands:
+                    expected_intersection = intbitset(operands[0])
+                    for intbitset1 in operands[1:]:
+                        expected_intersection &= intbitset1
+                self.assertEqual(union_many(operands), expected_union)
+                self.assertEqual(union_many(iter(operands)), expected_union)
+                self.assertEqual(intersection_many(operands), expected_intersection)
+                self.assertEqual(len(intersection_many(operands)), len(expected_intersection))
+                self.assertEqual(operands, copies)
+        sparse = [intbitset(intbitset([i, 65536 * 1000 + i]).fastdump(containers=True)) for i in range(5)]
+        self.assertEqual(list(union_many(sparse)), range(5) + range(65536 * 1000, 65536 * 1000 + 5))
+        self.assertRaises(TypeError, union_many, [intbitset(), [1, 2]])
+        self.assertRaises(TypeError, intersection_many, [None])
+
+    def test_set_count_many(self):
+        """intbitset - counting the sets containing each element"""
+        sets = self.sets + [[]] + self.container_examples
+        intbitsets = [intbitset(set1) for set1 in sets]
+        intbitsets += [intbitset(intbitset1.fastdump(containers=True)) for intbitset1 in intbitsets]
+        weights = [i % 7 + 0.5 for i in range(len(intbitsets))]
+        counts = {}
+        weighted_counts = {}
+        for intbitset1, weight in zip(intbitsets, weights):
+            for elem in intbitset1:
+                counts[elem] = counts.get(elem, 0) + 1
+                weighted_counts[elem] = weighted_counts.get(elem, 0) + weight
+        elems = sorted(counts.keys())
+        union, result = count_many(intbitsets)
+        self.assertEqual(list(union), elems)
+        self.assertEqual(result, [counts[elem] for elem in elems])
+        union, result = count_many(iter(intbitsets), weights)
+        self.assertEqual(list(union), elems)
+        self.assertEqual(result, [weighted_counts[elem] for elem in elems])
+        self.assertEqual(count_many([]), (intbitset(), []))
+        self.assertRaises(ValueError, count_many, intbitsets, weights[1:])
+        self.assertRaises(OverflowError, count_many, [intbitset(trailing_bits=True)])
+
+    def test_set_many_batches(self):
+        """intbitset - operations on many sets hold a batch of them at once"""
+        live = []
+        def generate_sets(count):
+            """Yields count sets, keeping track of the live ones."""
+            for i in xrange(count):
+                intbitset1 = intbitset([i, i + 1, 1000 + i % 7, 100000 * (i % 3)])
+                live.append(weakref.ref(intbitset1))
+                yield intbitset1
+                live[:] = [ref for ref in live if ref() is not None]
+                self.failUnless(len(live) <= intbitset_module._MANY_BATCH + 1)
+        count = 5 * intbitset_module._MANY_BATCH + 3
+        self.assertEqual(union_many(generate_sets(count)),
+                         intbitset(range(count + 1) + [1000 + i for i in range(7)] +
+                                   [0, 100000, 200000]))
+        self.assertEqual(intersection_many(generate_sets(count)), intbitset())
+        counts = {}
+        weighted_counts = {}
+        for i, intbitset1 in enumerate(generate_sets(count)):
+            for elem in intbitset1:
+                counts[elem] = counts.get(elem, 0) + 1
+                weighted_counts[elem] = weighted_counts.get(elem, 0) + i % 4 + 0.5
+        elems = sorted(counts.keys())
+        union, result = count_many(generate_sets(count))
+        self.assertEqual(list(union), elems)
+        self.assertEqual(result, [counts[elem] for elem in elems])
+        union, result = count_many(generate_sets(count),
+                                   (i % 4 + 0.5 for i in xrange(count)))
+        self.assertEqual(list(union), elems)
+        self.assertEqual(result, [weighted_counts[elem] for elem in elems])
+        self.assertRaises(ValueError, count_many, generate_sets(count),
+                          [1] * (count - 1))
+        self.assertRaises(ValueError, count_many, generate_sets(count),
+                          [1] * (count + 1))
+
     def test_set_corruption(self):
         """intbitset - set corruption"""
         set1 = intbitset()
+        strdump = intbitset(self.container_examples[-1]).fastdump(containers=True)
+        for corrupted in (strdump[:-8], strdump[:20], strdump[:4] + '\xff' * 4 + strdump[8:],
+                          strdump[:8] + '\x00\x00\x07' + strdump[11:]):
+            self.assertRaises(ValueError, intbitset, corrupted)
+            self.assertRaises(ValueError, set1.fastload, corrupted)
         for strdump in self.corrupted_strdumps:
             ## These should fail because they are not compressed
             self.assertRaises(ValueError, intbitset, strdump)
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+
+## This file is part of Invenio.
+## Copyright (C) 2011 CERN.
+##
+## Invenio is free software; you can redistribute it and/or
+## modify it under the terms of the GNU General Public License as
+## published by the Free Software Foundation; either version 2 of the
+## License, or (at your option) any later version.
+##
+## Invenio is distributed in the hope that it will be useful, but
+## WITHOUT ANY WARRANTY; without even the implied warranty of
+## MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+## General Public License for more details.
+##
+## You should have received a copy of the GNU General Public License
+## along with Invenio; if not, write to the Free Software Foundation, Inc.,
+## 59 Temple Place, Suite 330, Boston, MA 02111-1307, USA.
+
+"""
+Least recently used cache, the building block of the in memory caches
+that have to forget entries once they grow too big.
+"""
+
+__revision__ = "$Id$"
+
+class LRUCache:
+    """
+    Dictionary remembering the order in which its keys were used.
+    Reading or storing a key makes it the most recently used one, and
+    storing more than max_entries keys, if set, forgets the least
+    recently used ones.  Every operation takes constant time.  Not
+    thread safe: callers sharing a cache between threads lock it.
+    """
+    def __init__(self, max_entries=0):
+        self.max_entries = max_entries
+        self.clear()
+
+    def clear(self):
+        """Forget all the keys."""
+        # circular doubly linked list of [prev, next, key, value] nodes,
+        # from the least to the most recently used one:
+        self.root = [None, None, None, None]
+        self.root[0] = self.root[1] = self.root
+        self.nodes = {}
+
+    def _unlink(self, node):
+        """Remove the node from the linked list."""
+        node[0][1] = node[1]
+        node[1][0] = node[0]
+
+    def _append(self, node):
+        """Add the node as most recently used one."""
+        last = self.root[0]
+        node[0] = last
+        node[1] = self.root
+        last[1] = node
+        self.root[0] = node
+
+    def get(self, key, default=None):
+        """Return the value of key, making it the most recently used
+           one, or default if it is not known."""
+        node = self.nodes.get(key)
+        if node is None:
+            return default
+        self._unlink(node)
+        self._append(node)
+        return node[3]
+
+    def set(self, key, value):
+        """Store the value of key as most recently used one, forgetting
+           the least recently used keys beyond max_entries."""
+        node = self.nodes.get(key)
+        if node is None:
+            node = [None, None, key, value]
+            self.nodes[key] = node
+        else:
+            self._unlink(node)
+            node[3] = value
+        self._append(node)
+        while self.max_entries and len(self.nodes) > self.max_entries:
+            self.pop_oldest()
+
+    def pop(self, key, default=None):
+        """Forget key and return its value, or default if unknown."""
+        node = self.nodes.pop(key, None)
+        if node is None:
+            return default
+        self._unlink(node)
+        return node[3]
+
+    def pop_oldest(self):
+        """Forget the least recently used key and return the (key,
+           value) pair.  Raises KeyError if the cache is empty."""
+        node = self.root[1]
+        if node is self.root:
+            raise KeyError('pop_oldest(): cache is empty')
+        self._unlink(node)
+        del self.nodes[node[2]]
+        return node[2], node[3]
+
+    def items(self):
+        """Return the list of (key, value) pairs, most recently used
+           first, without changing the order."""
+        out = []
+        node = self.root[0]
+        while node is not self.root:
+            out.append((node[2], node[3]))
+            node = node[0]
+        return out
+
+    def __contains__(self, key):
+        return key in self.nodes
+
+    def __len__(self):
+        return len(self.nodes)
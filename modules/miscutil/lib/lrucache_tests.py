@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+
+## This file is part of Invenio.
+## Copyright (C) 2011 CERN.
+##
+## Invenio is free software; you can redistribute it and/or
+## modify it under the terms of the GNU General Public License as
+## published by the Free Software Foundation; either version 2 of the
+## License, or (at your option) any later version.
+##
+## Invenio is distributed in the hope that it will be useful, but
+## WITHOUT ANY WARRANTY; without even the implied warranty of
+## MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+## General Public License for more details.
+##
+## You should have received a copy of the GNU General Public License
+## along with Invenio; if not, write to the Free Software Foundation, Inc.,
+## 59 Temple Place, Suite 330, Boston, MA 02111-1307, USA.
+
+"""Unit tests for the least recently used cache."""
+
+__revision__ = "$Id$"
+
+import unittest
+
+from invenio.lrucache import LRUCache
+from invenio.testutils import make_test_suite, run_test_suite
+
+class TestLRUCache(unittest.TestCase):
+    """Test the least recently used cache."""
+
+    def test_get_and_set(self):
+        """lrucache - values are remembered by key"""
+        cache = LRUCache()
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.set('a', 3)
+        self.assertEqual(cache.get('a'), 3)
+        self.assertEqual(cache.get('c'), None)
+        self.assertEqual(cache.get('c', 4), 4)
+        self.failUnless('b' in cache)
+        self.assertEqual(len(cache), 2)
+
+    def test_least_recently_used_forgotten(self):
+        """lrucache - the least recently used keys are forgotten first"""
+        cache = LRUCache(2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+        self.assertEqual(cache.items(), [('c', 3), ('a', 1)])
+        cache.set('a', 4)
+        cache.set('d', 5)
+        self.assertEqual(cache.items(), [('d', 5), ('a', 4)])
+
+    def test_pop(self):
+        """lrucache - keys are forgotten on demand"""
+        cache = LRUCache()
+        for key in 'abc':
+            cache.set(key, key.upper())
+        self.assertEqual(cache.pop('b'), 'B')
+        self.assertEqual(cache.pop('b', 'X'), 'X')
+        self.assertEqual(cache.pop_oldest(), ('a', 'A'))
+        self.assertEqual(cache.pop_oldest(), ('c', 'C'))
+        self.assertRaises(KeyError, cache.pop_oldest)
+        self.assertEqual(len(cache), 0)
+
+    def test_clear(self):
+        """lrucache - clearing forgets all the keys"""
+        cache = LRUCache(3)
+        cache.set('a', 1)
+        cache.clear()
+        self.assertEqual(cache.items(), [])
+        self.assertEqual(cache.get('a'), None)
+
+TEST_SUITE = make_test_suite(TestLRUCache)
+
+if __name__ == "__main__":
+    run_test_suite(TEST_SUITE)
@@ -2646,6 +2646,13 @@ CREATE TABLE IF NOT EXISTS collection (
   KEY dbquery (dbquery(50))
 ) ENGINE=MyISAM;
 
+CREATE TABLE IF NOT EXISTS sortindex (
+  tags varchar(255) NOT NULL,
+  ranks longblob,
+  last_updated datetime NOT NULL default '0000-00-00',
+  PRIMARY KEY  (tags)
+) ENGINE=MyISAM;
+
 CREATE TABLE IF NOT EXISTS collectionname (
   id_collection mediumint(9) unsigned NOT NULL,
   ln char(5) NOT NULL default '',
@@ -4003,7 +4010,12 @@ CREATE TABLE IF NOT EXISTS `aulPAPERS` (
   `collaboration` varchar(255) NOT NULL,
   `experiment_number` varchar(255) NOT NULL,
   `last_modified` int unsigned NOT NULL,
-  PRIMARY KEY (`id`)
+  `parent_id` int(15) unsigned NOT NULL default '0',
+  PRIMARY KEY (`id`),
+  KEY `parent_id` (`parent_id`),
+  KEY `last_modified` (`last_modified`, `id`),
+  KEY `collaboration` (`collaboration`, `last_modified`, `id`),
+  KEY `experiment_number` (`experiment_number`, `last_modified`, `id`)
 ) ENGINE=MyISAM;
 
 CREATE TABLE IF NOT EXISTS `aulREFERENCES` (
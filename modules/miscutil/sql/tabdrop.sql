@@ -336,6 +336,7 @@ DROP TABLE IF EXISTS rnkCITATIONDATAEXT;
 DROP TABLE IF EXISTS rnkAUTHORDATA;
 DROP TABLE IF EXISTS collection_rnkMETHOD;
 DROP TABLE IF EXISTS collection;
+DROP TABLE IF EXISTS sortindex;
 DROP TABLE IF EXISTS collectionname;
 DROP TABLE IF EXISTS oaiREPOSITORY;
 DROP TABLE IF EXISTS oaiHARVEST;
@@ -37,6 +37,7 @@ import urllib
 import urlparse
 import zlib
 import sys
+from array import array
 
 if sys.hexversion < 0x2040000:
     # pylint: disable=W0622
@@ -54,6 +55,13 @@ from invenio.config import \
      CFG_WEBSEARCH_FIELDS_CONVERT, \
      CFG_WEBSEARCH_NB_RECORDS_TO_SORT, \
      CFG_WEBSEARCH_SEARCH_CACHE_SIZE, \
+     CFG_WEBSEARCH_SEARCH_CACHE_MAX_BYTES, \
+     CFG_WEBSEARCH_SEARCH_CACHE_MEMCACHED_SERVERS, \
+     CFG_WEBSEARCH_SEARCH_PLAN_CACHE_SIZE, \
+     CFG_WEBSEARCH_FACETS_MIN_RECORDS, \
+     CFG_WEBSEARCH_SEARCH_THREADS, \
+     CFG_WEBSEARCH_TERM_DICTIONARY_MAX_TERMS, \
+     CFG_WEBSEARCH_QUERY_TRANSLATION_CACHE_SIZE, \
      CFG_WEBSEARCH_USE_MATHJAX_FOR_FORMATS, \
      CFG_WEBSEARCH_USE_ALEPH_SYSNOS, \
      CFG_WEBSEARCH_DEF_RECORDS_IN_GROUPS, \
@@ -75,12 +83,20 @@ from invenio.config import \
 
 from invenio.search_engine_config import InvenioWebSearchUnknownCollectionError, InvenioWebSearchWildcardLimitError
 from invenio.search_engine_utils import get_fieldvalues
+from invenio.search_engine_cache import SearchResultsCache
+from invenio.search_engine_query_planner import SearchQueryPlanner
+from invenio.search_engine_facets import FacetEngine
+from invenio.search_engine_executor import SearchExecutor, BufferedRequest, \
+     cancel_search_tasks
+from invenio.search_engine_term_dictionary import TermDictionaryCache, get_term_hitlists
+from invenio.search_engine_reclist_file import open_reclist_file
 from invenio.bibrecord import create_record
 from invenio.bibrank_record_sorter import get_bibrank_methods, rank_records, is_method_valid
 from invenio.bibrank_downloads_similarity import register_page_view_event, calculate_reading_similarity_list
 from invenio.bibindex_engine_stemmer import stem
 from invenio.bibindex_engine_tokenizer import wash_author_name, author_name_requires_phrase_search
-from invenio.bibformat import format_record, format_records, get_output_format_content_type, create_excel
+from invenio.bibformat import format_record, format_records, iterate_formatted_records, \
+     get_output_format_content_type, create_excel
 from invenio.bibformat_config import CFG_BIBFORMAT_USE_OLD_BIBFORMAT
 from invenio.bibrank_downloads_grapher import create_download_history_graph_and_box
 from invenio.bibknowledge import get_kbr_values
@@ -90,7 +106,7 @@ from invenio.access_control_admin import acc_get_action_id
 from invenio.access_control_config import VIEWRESTRCOLL, \
     CFG_ACC_GRANT_AUTHOR_RIGHTS_TO_EMAILS_IN_TAGS
 from invenio.websearchadminlib import get_detailed_page_tabs, get_detailed_page_tabs_counts
-from invenio.intbitset import intbitset as HitSet
+from invenio.intbitset import intbitset as HitSet, union_many
 from invenio.dbquery import DatabaseError, deserialize_via_marshal, InvenioDbQueryWildcardLimitError
 from invenio.access_control_engine import acc_authorize_action
 from invenio.errorlib import register_exception
@@ -113,8 +129,7 @@ from invenio.dbquery import run_sql, run_sql_with_limit, \
 from invenio.webuser import getUid, collect_user_info, session_param_set
 from invenio.webpage import pageheaderonly, pagefooteronly, create_error_box
 from invenio.messages import gettext_set_language
-from invenio.search_engine_query_parser import SearchQueryParenthesisedParser, \
-    SpiresToInvenioSyntaxConverter
+from invenio.search_engine_query_parser import SearchQueryTranslator
 
 from invenio import webinterface_handler_config as apache
 from invenio.solrutils import solr_get_bitset
@@ -392,17 +407,20 @@ class CollectionRecListDataCacher(DataCacher):
         def cache_filler():
             ret = {}
             try:
-                res = run_sql("SELECT name,reclist FROM collection")
+                res = run_sql("SELECT name FROM collection")
+                # the reclists exported by webcoll, if up to date:
+                self.reclist_file = open_reclist_file(get_table_update_time('collection'))
             except Exception:
                 # database problems, return empty cache
                 return {}
-            for name, reclist in res:
+            for name, in res:
                 ret[name] = None # this will be filled later during runtime by calling get_collection_reclist(coll)
             return ret
 
         def timestamp_verifier():
             return get_table_update_time('collection')
 
+        self.reclist_file = None
         DataCacher.__init__(self, cache_filler, timestamp_verifier)
 
 try:
@@ -417,18 +435,72 @@ def get_collection_reclist(coll, recreate_cache_if_needed=True):
         collection_reclist_cache.recreate_cache_if_needed()
     if not collection_reclist_cache.cache[coll]:
         # not yet it the cache, so calculate it and fill the cache:
-        set = HitSet()
-        query = "SELECT nbrecs,reclist FROM collection WHERE name=%s"
-        res = run_sql(query, (coll, ), 1)
-        if res:
-            try:
-                set = HitSet(res[0][1])
-            except:
-                pass
+        set = None
+        if collection_reclist_cache.reclist_file is not None:
+            set = collection_reclist_cache.reclist_file.get_reclist(coll)
+        if set is None:
+            set = HitSet()
+            query = "SELECT nbrecs,reclist FROM collection WHERE name=%s"
+            res = run_sql(query, (coll, ), 1)
+            if res:
+                try:
+                    set = HitSet(res[0][1])
+                except:
+                    pass
         collection_reclist_cache.cache[coll] = set
     # finally, return reclist:
     return collection_reclist_cache.cache[coll]
 
+class SortIndexDataCacher(DataCacher):
+    """
+    Provides cache for the sort indexes maintained by webcoll.  This
+    class is not to be used directly; use function get_sort_index()
+    instead.
+    """
+    def __init__(self):
+        def cache_filler():
+            ret = {}
+            try:
+                res = run_sql("SELECT tags FROM sortindex")
+            except Exception:
+                # database problems, return empty cache
+                return {}
+            for tags, in res:
+                ret[tags] = None # this will be filled later during runtime by calling get_sort_index(tags)
+            return ret
+
+        def timestamp_verifier():
+            return get_table_update_time('sortindex')
+
+        DataCacher.__init__(self, cache_filler, timestamp_verifier)
+
+try:
+    if not sort_index_cache.is_ok_p:
+        raise Exception
+except Exception:
+    sort_index_cache = SortIndexDataCacher()
+
+def get_sort_index(tags, recreate_cache_if_needed=True):
+    """Return the sort index for the list of MARC tags 'tags', that
+       is the array mapping each recID to its rank when sorting by
+       these tags, or None if webcoll did not build such an index."""
+    if recreate_cache_if_needed:
+        sort_index_cache.recreate_cache_if_needed()
+    key = string.join(tags, ",")
+    if not sort_index_cache.cache.has_key(key):
+        return None
+    if sort_index_cache.cache[key] is None:
+        # not yet in the cache, so load it and fill the cache:
+        ranks = array('I')
+        res = run_sql("SELECT ranks FROM sortindex WHERE tags=%s", (key, ), 1)
+        if res and res[0][0]:
+            try:
+                ranks.fromstring(zlib.decompress(res[0][0]))
+            except zlib.error:
+                ranks = array('I')
+        sort_index_cache.cache[key] = ranks
+    return sort_index_cache.cache[key]
+
 def get_visible_output_formats():
     """ Return the list of available visible formats """
 
@@ -447,25 +519,58 @@ def get_visible_output_formats():
                        })
     return formats
 
-class SearchResultsCache(DataCacher):
-    """
-    Provides temporary lazy cache for Search Results.
-    Useful when users click on `next page'.
-    """
-    def __init__(self):
-        def cache_filler():
-            return {}
-        def timestamp_verifier():
-            return '1970-01-01 00:00:00' # lazy cache is always okay;
-                                         # its filling is governed by
-                                         # CFG_WEBSEARCH_SEARCH_CACHE_SIZE
-        DataCacher.__init__(self, cache_filler, timestamp_verifier)
+try:
+    if not isinstance(search_results_cache, SearchResultsCache):
+        raise Exception
+except Exception:
+    # temporary LRU cache for search results, useful when users click
+    # on `next page'; its filling is governed by
+    # CFG_WEBSEARCH_SEARCH_CACHE_SIZE and CFG_WEBSEARCH_SEARCH_CACHE_MAX_BYTES
+    search_results_cache = SearchResultsCache(CFG_WEBSEARCH_SEARCH_CACHE_MAX_BYTES,
+                                              CFG_WEBSEARCH_SEARCH_CACHE_SIZE,
+                                              CFG_WEBSEARCH_SEARCH_CACHE_MEMCACHED_SERVERS)
 
 try:
-    if not search_results_cache.is_ok_p:
+    if not isinstance(search_query_planner, SearchQueryPlanner):
         raise Exception
 except Exception:
-    search_results_cache = SearchResultsCache()
+    # memory of the basic search units of queries and of their number
+    # of hits, used to evaluate the most selective units first; its
+    # filling is governed by CFG_WEBSEARCH_SEARCH_PLAN_CACHE_SIZE
+    search_query_planner = SearchQueryPlanner(CFG_WEBSEARCH_SEARCH_PLAN_CACHE_SIZE)
+
+try:
+    if not isinstance(facet_engine, FacetEngine):
+        raise Exception
+except Exception:
+    # posting lists of the values of tags, used to count the most
+    # popular values in large sets of records; governed by
+    # CFG_WEBSEARCH_FACETS_MIN_RECORDS
+    facet_engine = FacetEngine(CFG_WEBSEARCH_FACETS_MIN_RECORDS)
+
+try:
+    if not isinstance(search_executor, SearchExecutor):
+        raise Exception
+except Exception:
+    # pool of threads running independent searches concurrently; its
+    # size is governed by CFG_WEBSEARCH_SEARCH_THREADS
+    search_executor = SearchExecutor(CFG_WEBSEARCH_SEARCH_THREADS)
+
+try:
+    if not isinstance(term_dictionaries, TermDictionaryCache):
+        raise Exception
+except Exception:
+    # sorted terms of the word indexes, used to resolve truncated and
+    # span queries; governed by CFG_WEBSEARCH_TERM_DICTIONARY_MAX_TERMS
+    term_dictionaries = TermDictionaryCache(CFG_WEBSEARCH_TERM_DICTIONARY_MAX_TERMS)
+
+try:
+    if not isinstance(search_query_translator, SearchQueryTranslator):
+        raise Exception
+except Exception:
+    # SPIRES syntax conversions and parenthesised parses of the last
+    # queries; governed by CFG_WEBSEARCH_QUERY_TRANSLATION_CACHE_SIZE
+    search_query_translator = SearchQueryTranslator(CFG_WEBSEARCH_QUERY_TRANSLATION_CACHE_SIZE)
 
 class CollectionI18nNameDataCacher(DataCacher):
     """
@@ -808,6 +913,25 @@ def create_basic_search_units(req, p, f, m=None, of='hb'):
     ## return search units:
     return opfts
 
+def get_basic_search_units(req, p, f, m=None, of='hb'):
+    """Return the basic search units of pattern 'p' in field 'f', like
+       create_basic_search_units() does, but remember them per query in
+       the search query planner; the warnings printed on their creation
+       are printed again when they are reused."""
+    key = (p.strip(), f, m or '', of.startswith("h"))
+    known_units = search_query_planner.get_search_units(key)
+    if known_units is None:
+        output = cStringIO.StringIO()
+        units = create_basic_search_units(output, p, f, m, of)
+        warnings = output.getvalue()
+        search_query_planner.set_search_units(key, units, warnings)
+    else:
+        units, warnings = known_units
+    if req and warnings:
+        req.write(warnings)
+    # the units are modified by search_pattern(), so give a copy:
+    return [list(unit) for unit in units]
+
 def page_start(req, of, cc, aas, ln, uid, title_message=None,
                description='', keywords='', recID=-1, tab='', p=''):
     "Start page according to given output format."
@@ -1907,15 +2031,22 @@ def search_pattern(req=None, p=None, f=None, m=None, ap=0, of="id", verbose=0, l
     # search stage 1: break up arguments into basic search units:
     if verbose and of.startswith("h"):
         t1 = os.times()[4]
-    basic_search_units = create_basic_search_units(req, p, f, m, of)
+    basic_search_units = get_basic_search_units(req, p, f, m, of)
     if verbose and of.startswith("h"):
         t2 = os.times()[4]
         print_warning(req, "Search stage 1: basic search units are: %s" % cgi.escape(repr(basic_search_units)))
         print_warning(req, "Search stage 1: execution took %.2f seconds." % (t2 - t1))
-    # search stage 2: do search for each search unit and verify hit presence:
+    # search stage 2: do search for each search unit and verify hit
+    # presence, and apply boolean query for each search unit at the
+    # same time; the search units are searched following the plan of
+    # the query planner, i.e. the most selective ones first, so that
+    # the search can stop as soon as the result is empty:
     if verbose and of.startswith("h"):
         t1 = os.times()[4]
-    basic_search_units_hitsets = []
+    basic_search_units_hitsets = [None] * len(basic_search_units)
+    # let the initial set be the complete universe:
+    hitset_in_any_collection = HitSet(trailing_bits=1)
+    hitset_in_any_collection.discard(0)
     #prepare hiddenfield-related..
     myhiddens = CFG_BIBFORMAT_HIDDEN_TAGS
     can_see_hidden = False
@@ -1933,8 +2064,35 @@ def search_pattern(req=None, p=None, f=None, m=None, ap=0, of="id", verbose=0, l
         elif 'caption' in fields_to_be_searched:
             print_warning(req, _("Warning: figure caption search is only available for a subset of papers mostly from 2008-2011."))
 
-    for idx_unit in xrange(len(basic_search_units)):
+    search_plan = search_query_planner.plan(basic_search_units, wl)
+    if verbose >= 9 and of.startswith("h"):
+        print_warning(req, "Search stage 2: search units will be searched in the order %s" % search_plan)
+    # the search units are submitted to the search executor in the
+    # order of the plan, at most as many ahead of the one being
+    # combined as there are worker threads; it searches them
+    # concurrently if enabled, or else when their hitset is asked for
+    # below.  Once the result is empty, the units not started yet are
+    # cancelled:
+    search_unit_tasks = [None] * len(basic_search_units)
+    def submit_search_unit(idx_unit):
+        """Submit the search unit unless done, and return its task."""
+        if search_unit_tasks[idx_unit] is None:
+            bsu_o, bsu_p, bsu_f, bsu_m = basic_search_units[idx_unit]
+            if bsu_f and len(bsu_f) < 2:
+                bsu_f = ''
+                bsu_m = 'w'
+            search_unit_tasks[idx_unit] = search_executor.submit(search_unit, bsu_p, bsu_f, bsu_m, wl)
+        return search_unit_tasks[idx_unit]
+    search_order = [idx_unit for step in search_plan for idx_unit in step]
+    for position in range(len(search_order)):
+        idx_unit = search_order[position]
         bsu_o, bsu_p, bsu_f, bsu_m = basic_search_units[idx_unit]
+        if bsu_o in ('+', '-') and len(hitset_in_any_collection) == 0:
+            # the result is empty whatever this unit gives
+            continue
+        for idx_next_unit in search_order[position:position + search_executor.max_workers + 1]:
+            submit_search_unit(idx_next_unit)
+        bsu_unit = basic_search_units[idx_unit][:]
         if bsu_f and len(bsu_f) < 2:
             if of.startswith("h"):
                 print_warning(req, _("There is no index %s.  Searching for %s in all fields." % (bsu_f, bsu_p)))
@@ -1943,11 +2101,12 @@ def search_pattern(req=None, p=None, f=None, m=None, ap=0, of="id", verbose=0, l
             if of.startswith("h") and verbose:
                 print_warning(req, _('Instead searching %s.' % str([bsu_o, bsu_p, bsu_f, bsu_m])))
         try:
-            basic_search_unit_hitset = search_unit(bsu_p, bsu_f, bsu_m, wl)
+            basic_search_unit_hitset = search_unit_tasks[idx_unit].result()
         except InvenioWebSearchWildcardLimitError, excp:
             basic_search_unit_hitset = excp.res
             if of.startswith("h"):
                 print_warning(req, _("Search term too generic, displaying only partial results..."))
+        search_query_planner.set_search_unit_size(bsu_unit, wl, len(basic_search_unit_hitset))
         # FIXME: print warning if we use native full-text indexing
         if bsu_f == 'fulltext' and bsu_m != 'w' and of.startswith('h') and not CFG_SOLR_URL:
             print_warning(req, _("No phrase index available for fulltext yet, looking for word combination..."))
@@ -1976,7 +2135,7 @@ def search_pattern(req=None, p=None, f=None, m=None, ap=0, of="id", verbose=0, l
             # pattern treatment is switched off, or the search unit
             # was joined by an OR operator to preceding/following
             # units so we do not require that it exists
-            basic_search_units_hitsets.append(basic_search_unit_hitset)
+            basic_search_units_hitsets[idx_unit] = basic_search_unit_hitset
         else:
             # stage 2-2: no hits found for this search unit, try to replace non-alphanumeric chars inside pattern:
             if re.search(r'[^a-zA-Z0-9\s\:]', bsu_p) and bsu_f != 'refersto' and bsu_f != 'citedby':
@@ -1994,7 +2153,7 @@ def search_pattern(req=None, p=None, f=None, m=None, ap=0, of="id", verbose=0, l
                                       {'x_query1': "<em>" + cgi.escape(bsu_p) + "</em>",
                                        'x_query2': "<em>" + cgi.escape(bsu_pn) + "</em>"})
                     basic_search_units[idx_unit][1] = bsu_pn
-                    basic_search_units_hitsets.append(basic_search_unit_hitset)
+                    basic_search_units_hitsets[idx_unit] = basic_search_unit_hitset
                 else:
                     # stage 2-3: no hits found either, propose nearest indexed terms:
                     if of.startswith('h') and display_nearest_terms_box:
@@ -2003,6 +2162,7 @@ def search_pattern(req=None, p=None, f=None, m=None, ap=0, of="id", verbose=0, l
                                 print_warning(req, _("Requested record does not seem to exist."))
                             else:
                                 print_warning(req, create_nearest_terms_box(req.argd, bsu_p, bsu_f, bsu_m, ln=ln))
+                    cancel_search_tasks(search_unit_tasks)
                     return hitset_empty
             else:
                 # stage 2-3: no hits found either, propose nearest indexed terms:
@@ -2012,37 +2172,42 @@ def search_pattern(req=None, p=None, f=None, m=None, ap=0, of="id", verbose=0, l
                             print_warning(req, _("Requested record does not seem to exist."))
                         else:
                             print_warning(req, create_nearest_terms_box(req.argd, bsu_p, bsu_f, bsu_m, ln=ln))
+                cancel_search_tasks(search_unit_tasks)
                 return hitset_empty
+        # search stage 3: apply boolean query for this search unit:
+        if bsu_o == '+':
+            hitset_in_any_collection.intersection_update(basic_search_units_hitsets[idx_unit])
+        elif bsu_o == '-':
+            hitset_in_any_collection.difference_update(basic_search_units_hitsets[idx_unit])
+        elif bsu_o == '|':
+            hitset_in_any_collection.union_update(basic_search_units_hitsets[idx_unit])
+        else:
+            if of.startswith("h"):
+                print_warning(req, "Invalid set operation %s." % cgi.escape(bsu_o), "Error")
+        if len(hitset_in_any_collection) == 0:
+            cancel_search_tasks(search_unit_tasks)
     if verbose and of.startswith("h"):
         t2 = os.times()[4]
         for idx_unit in range(0, len(basic_search_units)):
-            print_warning(req, "Search stage 2: basic search unit %s gave %d hits." %
-                          (basic_search_units[idx_unit][1:], len(basic_search_units_hitsets[idx_unit])))
-        print_warning(req, "Search stage 2: execution took %.2f seconds." % (t2 - t1))
-    # search stage 3: apply boolean query for each search unit:
-    if verbose and of.startswith("h"):
-        t1 = os.times()[4]
-    # let the initial set be the complete universe:
-    hitset_in_any_collection = HitSet(trailing_bits=1)
-    hitset_in_any_collection.discard(0)
-    for idx_unit in xrange(len(basic_search_units)):
-        this_unit_operation = basic_search_units[idx_unit][0]
-        this_unit_hitset = basic_search_units_hitsets[idx_unit]
-        if this_unit_operation == '+':
-            hitset_in_any_collection.intersection_update(this_unit_hitset)
-        elif this_unit_operation == '-':
-            hitset_in_any_collection.difference_update(this_unit_hitset)
-        elif this_unit_operation == '|':
-            hitset_in_any_collection.union_update(this_unit_hitset)
-        else:
-            if of.startswith("h"):
-                print_warning(req, "Invalid set operation %s." % cgi.escape(this_unit_operation), "Error")
+            if basic_search_units_hitsets[idx_unit] is None:
+                print_warning(req, "Search stage 2: basic search unit %s was not searched, the result being already empty." %
+                              (basic_search_units[idx_unit][1:],))
+            else:
+                print_warning(req, "Search stage 2: basic search unit %s gave %d hits." %
+                              (basic_search_units[idx_unit][1:], len(basic_search_units_hitsets[idx_unit])))
+        print_warning(req, "Search stage 2-3: execution took %.2f seconds." % (t2 - t1))
     if len(hitset_in_any_collection) == 0:
         # no hits found, propose alternative boolean query:
         if of.startswith('h') and display_nearest_terms_box:
             nearestterms = []
             for idx_unit in range(0, len(basic_search_units)):
                 bsu_o, bsu_p, bsu_f, bsu_m = basic_search_units[idx_unit]
+                if basic_search_units_hitsets[idx_unit] is None:
+                    # not searched since the result was already empty
+                    try:
+                        basic_search_units_hitsets[idx_unit] = submit_search_unit(idx_unit).result()
+                    except InvenioWebSearchWildcardLimitError, excp:
+                        basic_search_units_hitsets[idx_unit] = excp.res
                 if bsu_p.startswith("%") and bsu_p.endswith("%"):
                     bsu_p = "'" + bsu_p[1:-1] + "'"
                 bsu_nbhits = len(basic_search_units_hitsets[idx_unit])
@@ -2060,9 +2225,7 @@ def search_pattern(req=None, p=None, f=None, m=None, ap=0, of="id", verbose=0, l
                      ln=ln,  nearestterms=nearestterms)
             print_warning(req, text)
     if verbose and of.startswith("h"):
-        t2 = os.times()[4]
         print_warning(req, "Search stage 3: boolean query gave %d hits." % len(hitset_in_any_collection))
-        print_warning(req, "Search stage 3: execution took %.2f seconds." % (t2 - t1))
     return hitset_in_any_collection
 
 def search_pattern_parenthesised(req=None, p=None, f=None, m=None, ap=0, of="id", verbose=0, ln=CFG_SITE_LANG, display_nearest_terms_box=True, wl=0):
@@ -2072,13 +2235,9 @@ def search_pattern_parenthesised(req=None, p=None, f=None, m=None, ap=0, of="id"
        For more details on the parameters see 'search_pattern'
     """
     _ = gettext_set_language(ln)
-    spires_syntax_converter = SpiresToInvenioSyntaxConverter()
-    spires_syntax_query = False
 
     # if the pattern uses SPIRES search syntax, convert it to Invenio syntax
-    if spires_syntax_converter.is_applicable(p):
-        spires_syntax_query = True
-        p = spires_syntax_converter.convert_query(p)
+    spires_syntax_query, p = search_query_translator.convert_query(p)
 
     # sanity check: do not call parenthesised parser for search terms
     # like U(1):
@@ -2087,13 +2246,11 @@ def search_pattern_parenthesised(req=None, p=None, f=None, m=None, ap=0, of="id"
 
     # Try searching with parentheses
     try:
-        parser = SearchQueryParenthesisedParser()
-
         # get a hitset with all recids
         result_hitset = HitSet(trailing_bits=1)
 
         # parse the query. The result is list of [op1, expr1, op2, expr2, ..., opN, exprN]
-        parsing_result = parser.parse_query(p)
+        parsing_result = search_query_translator.parse_query(p)
         if verbose  and of.startswith("h"):
             print_warning(req, "Search stage 1: search_pattern_parenthesised() searched %s." % repr(p))
             print_warning(req, "Search stage 1: search_pattern_parenthesised() returned %s." % repr(parsing_result))
@@ -2141,6 +2298,20 @@ def search_pattern_parenthesised(req=None, p=None, f=None, m=None, ap=0, of="id"
 
         return search_pattern(req, p, f, m, ap, of, verbose, ln, display_nearest_terms_box=display_nearest_terms_box, wl=wl)
 
+def submit_search_pattern_parenthesised(req=None, p=None, f=None, m=None, ap=0, of="id", verbose=0, ln=CFG_SITE_LANG, wl=0):
+    """Submit the search_pattern_parenthesised() call with these
+       arguments to the search executor and return its task, whose
+       result() is the hitset.  When the search may run in another
+       thread, what it writes is kept and written to 'req' when its
+       result is asked for, so that the output of several searches
+       comes in the order their results are used.
+    """
+    if req is None or not search_executor.parallel_p():
+        return search_executor.submit(search_pattern_parenthesised, req, p, f, m, ap=ap, of=of, verbose=verbose, ln=ln, wl=wl)
+    # collect the user information here, once for all the searches:
+    collect_user_info(req)
+    output = BufferedRequest(req)
+    return search_executor.submit_with_output(output, search_pattern_parenthesised, output, p, f, m, ap=ap, of=of, verbose=verbose, ln=ln, wl=wl)
 
 def search_unit(p, f=None, m=None, wl=0):
     """Search for basic search unit defined by pattern 'p' and field
@@ -2216,18 +2387,18 @@ def search_unit(p, f=None, m=None, wl=0):
 def search_unit_in_bibwords(word, f, m=None, decompress=zlib.decompress, wl=0):
     """Searches for 'word' inside bibwordsX table for field 'f' and returns hitset of recIDs."""
     set = HitSet() # will hold output result set
-    set_used = 0 # not-yet-used flag, to be able to circumvent set operations
     limit_reached = 0 # flag for knowing if the query limit has been reached
     # deduce into which bibwordsX table we will search:
-    stemming_language = get_index_stemming_language(get_index_id_from_field("anyfield"))
-    bibwordsX = "idxWORD%02dF" % get_index_id_from_field("anyfield")
+    index_id = get_index_id_from_field("anyfield")
     if f:
         index_id = get_index_id_from_field(f)
-        if index_id:
-            bibwordsX = "idxWORD%02dF" % index_id
-            stemming_language = get_index_stemming_language(index_id)
-        else:
+        if not index_id:
             return HitSet() # word index f does not exist
+    bibwordsX = "idxWORD%02dF" % index_id
+    stemming_language = get_index_stemming_language(index_id)
+    # truncated and span queries are resolved by the term dictionary
+    # of the index if it is kept in memory:
+    term_dictionary = None
 
     # wash 'word' argument and run query:
     word = string.replace(word, '*', '%') # we now use '*' as the truncation character
@@ -2240,12 +2411,17 @@ def search_unit_in_bibwords(word, f, m=None, decompress=zlib.decompress, wl=0):
             word1 = lower_index_term(word1)
             word0 = stem(word0, stemming_language)
             word1 = stem(word1, stemming_language)
-        try:
-            res = run_sql_with_limit("SELECT term,hitlist FROM %s WHERE term BETWEEN %%s AND %%s" % bibwordsX,
-                          (wash_index_term(word0), wash_index_term(word1)), wildcard_limit = wl)
-        except InvenioDbQueryWildcardLimitError, excp:
-            res = excp.res
-            limit_reached = 1 # set the limit reached flag to true
+        term_dictionary = term_dictionaries.get_term_dictionary(index_id)
+        if term_dictionary is not None:
+            term_ids = term_dictionary.get_span_term_ids(strip_accents(wash_index_term(word0)),
+                                                         strip_accents(wash_index_term(word1)))
+        else:
+            try:
+                res = run_sql_with_limit("SELECT term,hitlist FROM %s WHERE term BETWEEN %%s AND %%s" % bibwordsX,
+                              (wash_index_term(word0), wash_index_term(word1)), wildcard_limit = wl)
+            except InvenioDbQueryWildcardLimitError, excp:
+                res = excp.res
+                limit_reached = 1 # set the limit reached flag to true
     else:
         if f == 'journal':
             pass # FIXME: quick hack for the journal index
@@ -2260,24 +2436,31 @@ def search_unit_in_bibwords(word, f, m=None, decompress=zlib.decompress, wl=0):
                 # FIXME: we can run a sanity check here for all indexes
                 res = ()
             else:
-                try:
-                    res = run_sql_with_limit("SELECT term,hitlist FROM %s WHERE term LIKE %%s" % bibwordsX,
-                                  (wash_index_term(word),), wildcard_limit = wl)
-                except InvenioDbQueryWildcardLimitError, excp:
-                    res = excp.res
-                    limit_reached = 1 # set the limit reached flag to true
+                term_dictionary = term_dictionaries.get_term_dictionary(index_id)
+                if term_dictionary is not None:
+                    term_ids = term_dictionary.get_pattern_term_ids(strip_accents(wash_index_term(word)))
+                else:
+                    try:
+                        res = run_sql_with_limit("SELECT term,hitlist FROM %s WHERE term LIKE %%s" % bibwordsX,
+                                      (wash_index_term(word),), wildcard_limit = wl)
+                    except InvenioDbQueryWildcardLimitError, excp:
+                        res = excp.res
+                        limit_reached = 1 # set the limit reached flag to true
         else:
             res = run_sql("SELECT term,hitlist FROM %s WHERE term=%%s" % bibwordsX,
                           (wash_index_term(word),))
-    # fill the result set:
-    for word, hitlist in res:
-        hitset_bibwrd = HitSet(hitlist)
-        # add the results:
-        if set_used:
-            set.union_update(hitset_bibwrd)
-        else:
-            set = hitset_bibwrd
-            set_used = 1
+    if term_dictionary is not None:
+        # fetch the hitlists of the matching terms only, at most wl
+        # of them as run_sql_with_limit() would:
+        if wl >= 1 and len(term_ids) >= wl:
+            term_ids = term_ids[:wl]
+            limit_reached = 1 # set the limit reached flag to true
+        res = get_term_hitlists(index_id, term_ids)
+    # fill the result set with the union of the hitlists of all the
+    # matching terms, loading them batch by batch as union_many() takes
+    # them:
+    if res:
+        set = union_many(HitSet(hitlist) for word, hitlist in res)
     #check to see if the query limit was reached
     if limit_reached:
         #raise an exception, so we can print a nice message to the user
@@ -2289,7 +2472,6 @@ def search_unit_in_idxphrases(p, f, type, wl=0):
     """Searches for phrase 'p' inside idxPHRASE*F table for field 'f' and returns hitset of recIDs found.
     The search type is defined by 'type' (e.g. equals to 'r' for a regexp search)."""
     set = HitSet() # will hold output result set
-    set_used = 0 # not-yet-used flag, to be able to circumvent set operations
     limit_reached = 0 # flag for knowing if the query limit has been reached
     use_query_limit = False # flag for knowing if to limit the query results or not
     # deduce in which idxPHRASE table we will search:
@@ -2337,15 +2519,11 @@ def search_unit_in_idxphrases(p, f, type, wl=0):
             limit_reached = 1 # set the limit reached flag to true
     else:
         res = run_sql("SELECT term,hitlist FROM %s WHERE term %s" % (idxphraseX, query_addons), query_params)
-    # fill the result set:
-    for word, hitlist in res:
-        hitset_bibphrase = HitSet(hitlist)
-        # add the results:
-        if set_used:
-            set.union_update(hitset_bibphrase)
-        else:
-            set = hitset_bibphrase
-            set_used = 1
+    # fill the result set with the union of the hitlists of all the
+    # matching phrases, loading them batch by batch as union_many()
+    # takes them:
+    if res:
+        set = union_many(HitSet(hitlist) for word, hitlist in res)
     #check to see if the query limit was reached
     if limit_reached:
         #raise an exception, so we can print a nice message to the user
@@ -3252,6 +3430,30 @@ def record_exists(recID):
             out = 1 # exists fine
     return out
 
+def records_exist(recIDs):
+    """Return dictionary telling for each record ID in RECIDS whether
+       the record exists, as record_exists() does, but using only two
+       queries for all records.
+    """
+    out = {}
+    for recID in recIDs:
+        out[recID] = 0
+    if not recIDs:
+        return out
+    recIDs_sql = ','.join(['%s'] * len(recIDs))
+    res = run_sql("SELECT id FROM bibrec WHERE id IN (%s)" % recIDs_sql,
+                  tuple(recIDs))
+    for row in res:
+        out[row[0]] = 1
+    # now check which ones are marked as deleted:
+    res = run_sql("SELECT bb.id_bibrec, b.value FROM bib98x AS b, bibrec_bib98x AS bb "
+                  "WHERE bb.id_bibrec IN (%s) AND b.id=bb.id_bibxxx AND b.tag LIKE '980__%%'" % recIDs_sql,
+                  tuple(recIDs))
+    for recID, value in res:
+        if out.get(recID) and (value == "DELETED" or (CFG_CERN_SITE and value == "DUMMY")):
+            out[recID] = -1 # exists, but marked as deleted
+    return out
+
 def record_empty(recID):
     """
     Is this record empty, e.g. has only 001, waiting for integration?
@@ -3457,77 +3659,139 @@ def print_hosted_results(url_and_engine, ln=CFG_SITE_LANG, of=None, req=None, no
         limit=limit
         )
 
+def get_sort_field_tags(sort_field):
+    """Return the list of MARC tags to sort by for the sort field
+       'sort_field', which is either a field code like 'author' or a
+       MARC tag like '100__a'.  Return an empty list if the field code
+       is not known."""
+    if sort_field and str(sort_field[0:2]).isdigit():
+        # sort_field starts by two digits, so this is probably a MARC tag already
+        return [sort_field]
+    # let us check the 'field' table
+    query = """SELECT DISTINCT(t.value) FROM tag AS t, field_tag AS ft, field AS f
+                WHERE f.code=%s AND ft.id_field=f.id AND t.id=ft.id_tag
+                ORDER BY ft.score DESC"""
+    return [row[0] for row in run_sql(query, (sort_field, ))]
+
+def wash_sort_field_values(tag, vals):
+    """Return the values 'vals' of the MARC tag 'tag' prepared for
+       sorting."""
+    if CFG_CERN_SITE and tag == '773__c':
+        # CERN hack: journal sorting
+        # 773__c contains page numbers, e.g. 3-13, and we want to sort by 3, and numerically:
+        return ["%050s" % x.split("-", 1)[0] for x in vals]
+    return vals
+
+def get_sort_value(vals, sort_pattern=''):
+    """Return the value according to which a record having the sort
+       field values 'vals' is sorted.  If 'sort_pattern' is given, the
+       first value starting by it is chosen."""
+    val = ""
+    if sort_pattern:
+        # try to pick that tag value that corresponds to sort pattern
+        bingo = 0
+        for v in vals:
+            if v.lower().startswith(sort_pattern.lower()): # bingo!
+                bingo = 1
+                val = v
+                break
+        if not bingo: # sort_pattern not present, so add other vals after spaces
+            val = sort_pattern + "          " + string.join(vals)
+    else:
+        # no sort pattern defined, so join them all together
+        val = string.join(vals)
+    return strip_accents(val.lower()) # sort values regardless of accents and case
+
+def sort_records_by_index(recIDs, ranks, sort_order='d'):
+    """Sort records in 'recIDs' list according to the sort index
+       'ranks' (see get_sort_index()) in order 'sort_order'.  Records
+       unknown to the index, i.e. created since webcoll last built it,
+       are put after the other ones."""
+    nb_ranks = len(ranks)
+    known = list(recIDs)
+    unknown = []
+    if known and (min(known) < 0 or max(known) >= nb_ranks):
+        unknown = [recID for recID in known if not 0 <= recID < nb_ranks]
+        known = [recID for recID in known if 0 <= recID < nb_ranks]
+    # gather the ranks and sort in one go; ranks are unique, so no ties:
+    known.sort(key=ranks.__getitem__)
+    # records without rank, if any, are sorted first now:
+    nb_unranked = 0
+    while nb_unranked < len(known) and not ranks[known[nb_unranked]]:
+        nb_unranked += 1
+    recIDs_out = known[nb_unranked:] + known[:nb_unranked] + unknown
+    # ascending or descending?
+    if sort_order == 'a':
+        recIDs_out.reverse()
+    return recIDs_out
+
+def sort_index_covers_p(recIDs, ranks):
+    """Tell whether all records in 'recIDs' are ranked by the sort
+       index 'ranks'."""
+    nb_ranks = len(ranks)
+    for recID in recIDs:
+        if not 0 <= recID < nb_ranks or not ranks[recID]:
+            return False
+    return True
+
 def sort_records(req, recIDs, sort_field='', sort_order='d', sort_pattern='', verbose=0, of='hb', ln=CFG_SITE_LANG):
     """Sort records in 'recIDs' list according sort field 'sort_field' in order 'sort_order'.
        If more than one instance of 'sort_field' is found for a given record, try to choose that that is given by
        'sort pattern', for example "sort by report number that starts by CERN-PS".
-       Note that 'sort_field' can be field code like 'author' or MARC tag like '100__a' directly."""
+       Note that 'sort_field' can be field code like 'author' or MARC tag like '100__a' directly.
+       Sets of any size are sorted using the sort index built by webcoll if there is one for the
+       sort field and no sort pattern is given."""
 
     _ = gettext_set_language(ln)
 
     ## check arguments:
     if not sort_field:
         return recIDs
-    if len(recIDs) > CFG_WEBSEARCH_NB_RECORDS_TO_SORT:
-        if of.startswith('h'):
-            print_warning(req, _("Sorry, sorting is allowed on sets of up to %d records only. Using default sort order.") % CFG_WEBSEARCH_NB_RECORDS_TO_SORT, "Warning")
-        return recIDs
-
-    sort_fields = string.split(sort_field, ",")
-    recIDs_dict = {}
-    recIDs_out = []
 
     ## first deduce sorting MARC tag out of the 'sort_field' argument:
     tags = []
-    for sort_field in sort_fields:
-        if sort_field and str(sort_field[0:2]).isdigit():
-            # sort_field starts by two digits, so this is probably a MARC tag already
-            tags.append(sort_field)
+    for sort_field in string.split(sort_field, ","):
+        sort_field_tags = get_sort_field_tags(sort_field)
+        if sort_field_tags:
+            tags.extend(sort_field_tags)
         else:
-            # let us check the 'field' table
-            query = """SELECT DISTINCT(t.value) FROM tag AS t, field_tag AS ft, field AS f
-                        WHERE f.code=%s AND ft.id_field=f.id AND t.id=ft.id_tag
-                        ORDER BY ft.score DESC"""
-            res = run_sql(query, (sort_field, ))
-            if res:
-                for row in res:
-                    tags.append(row[0])
-            else:
-                if of.startswith('h'):
-                    print_warning(req, _("Sorry, %s does not seem to be a valid sort option. Choosing title sort instead.") % cgi.escape(sort_field), "Error")
-                tags.append("245__a")
+            if of.startswith('h'):
+                print_warning(req, _("Sorry, %s does not seem to be a valid sort option. Choosing title sort instead.") % cgi.escape(sort_field), "Error")
+            tags.append("245__a")
     if verbose >= 3:
         print_warning(req, "Sorting by tags %s." % cgi.escape(repr(tags)))
         if sort_pattern:
             print_warning(req, "Sorting preferentially by %s." % cgi.escape(sort_pattern))
 
+    ## use the sort index if there is one:
+    if not sort_pattern:
+        ranks = get_sort_index(tags)
+        # small sets containing records the index does not rank, for
+        # instance records added since webcoll built it, are sorted on
+        # their field values instead; records modified since then keep
+        # their old rank, as in big sets:
+        if ranks and (len(recIDs) > CFG_WEBSEARCH_NB_RECORDS_TO_SORT or
+                      sort_index_covers_p(recIDs, ranks)):
+            if verbose >= 3:
+                print_warning(req, "Sorting by the sort index.")
+            return sort_records_by_index(recIDs, ranks, sort_order)
+
+    if len(recIDs) > CFG_WEBSEARCH_NB_RECORDS_TO_SORT:
+        if of.startswith('h'):
+            print_warning(req, _("Sorry, sorting is allowed on sets of up to %d records only. Using default sort order.") % CFG_WEBSEARCH_NB_RECORDS_TO_SORT, "Warning")
+        return recIDs
+
+    recIDs_dict = {}
+    recIDs_out = []
+
     ## check if we have sorting tag defined:
     if tags:
         # fetch the necessary field values:
         for recID in recIDs:
-            val = "" # will hold value for recID according to which sort
             vals = [] # will hold all values found in sorting tag for recID
             for tag in tags:
-                if CFG_CERN_SITE and tag == '773__c':
-                    # CERN hack: journal sorting
-                    # 773__c contains page numbers, e.g. 3-13, and we want to sort by 3, and numerically:
-                    vals.extend(["%050s" % x.split("-",1)[0] for x in get_fieldvalues(recID, tag)])
-                else:
-                    vals.extend(get_fieldvalues(recID, tag))
-            if sort_pattern:
-                # try to pick that tag value that corresponds to sort pattern
-                bingo = 0
-                for v in vals:
-                    if v.lower().startswith(sort_pattern.lower()): # bingo!
-                        bingo = 1
-                        val = v
-                        break
-                if not bingo: # sort_pattern not present, so add other vals after spaces
-                    val = sort_pattern + "          " + string.join(vals)
-            else:
-                # no sort pattern defined, so join them all together
-                val = string.join(vals)
-            val = strip_accents(val.lower()) # sort values regardless of accents and case
+                vals.extend(wash_sort_field_values(tag, get_fieldvalues(recID, tag)))
+            val = get_sort_value(vals, sort_pattern)
             if recIDs_dict.has_key(val):
                 recIDs_dict[val].append(recID)
             else:
@@ -3607,6 +3871,9 @@ def print_records(req, recIDs, jrec=1, rg=10, format='hb', ot='', ln=CFG_SITE_LA
 
         #req.write("%s:%d-%d" % (recIDs, irec_min, irec_max))
 
+        if verbose and format.startswith("h"):
+            t1 = os.times()[4]
+
         if format.startswith('x'):
 
             # print header if needed
@@ -3629,9 +3896,9 @@ def print_records(req, recIDs, jrec=1, rg=10, format='hb', ot='', ln=CFG_SITE_LA
 
         elif format.startswith('t') or str(format[0:3]).isdigit():
             # we are doing plain text output:
-            for irec in range(irec_max, irec_min, -1):
-                x = print_record(recIDs[irec], format, ot, ln, search_pattern=search_pattern,
-                                 user_info=user_info, verbose=verbose, sf=sf, so=so, sp=sp, rm=rm)
+            recIDs_to_print = [recIDs[x] for x in range(irec_max, irec_min, -1)]
+            for x in iterate_printed_records(recIDs_to_print, format, ot, ln, search_pattern=search_pattern,
+                                             user_info=user_info, verbose=verbose, sf=sf, so=so, sp=sp, rm=rm):
                 req.write(x)
                 if x:
                     req.write('\n')
@@ -3642,9 +3909,10 @@ def print_records(req, recIDs, jrec=1, rg=10, format='hb', ot='', ln=CFG_SITE_LA
             # we are doing HTML output:
             if format == 'hp' or format.startswith("hb_") or format.startswith("hd_"):
                 # portfolio and on-the-fly formats:
-                for irec in range(irec_max, irec_min, -1):
-                    req.write(print_record(recIDs[irec], format, ot, ln, search_pattern=search_pattern,
-                                           user_info=user_info, verbose=verbose, sf=sf, so=so, sp=sp, rm=rm))
+                recIDs_to_print = [recIDs[x] for x in range(irec_max, irec_min, -1)]
+                for record in iterate_printed_records(recIDs_to_print, format, ot, ln, search_pattern=search_pattern,
+                                                      user_info=user_info, verbose=verbose, sf=sf, so=so, sp=sp, rm=rm):
+                    req.write(record)
             elif format.startswith("hb"):
                 # HTML brief format:
 
@@ -3658,6 +3926,9 @@ def print_records(req, recIDs, jrec=1, rg=10, format='hb', ot='', ln=CFG_SITE_LA
                             display_add_to_basket = False
                 req.write(websearch_templates.tmpl_record_format_htmlbrief_header(
                     ln = ln))
+                recIDs_to_print = [recIDs[x] for x in range(irec_max, irec_min, -1)]
+                records = iterate_printed_records(recIDs_to_print, format, ot, ln, search_pattern=search_pattern,
+                                                  user_info=user_info, verbose=verbose, sf=sf, so=so, sp=sp, rm=rm)
                 for irec in range(irec_max, irec_min, -1):
                     row_number = jrec+irec_max-irec
                     recid = recIDs[irec]
@@ -3665,8 +3936,7 @@ def print_records(req, recIDs, jrec=1, rg=10, format='hb', ot='', ln=CFG_SITE_LA
                         relevance = relevances[irec]
                     else:
                         relevance = ''
-                    record = print_record(recIDs[irec], format, ot, ln, search_pattern=search_pattern,
-                                                  user_info=user_info, verbose=verbose, sf=sf, so=so, sp=sp, rm=rm)
+                    record = records.next()
 
                     req.write(websearch_templates.tmpl_record_format_htmlbrief_body(
                         ln = ln,
@@ -3878,11 +4148,17 @@ def print_records(req, recIDs, jrec=1, rg=10, format='hb', ot='', ln=CFG_SITE_LA
                                                                                     actions=actions))
             else:
                 # Other formats
-                for irec in range(irec_max, irec_min, -1):
-                    req.write(print_record(recIDs[irec], format, ot, ln,
-                                           search_pattern=search_pattern,
-                                           user_info=user_info, verbose=verbose,
-                                           sf=sf, so=so, sp=sp, rm=rm))
+                recIDs_to_print = [recIDs[x] for x in range(irec_max, irec_min, -1)]
+                for record in iterate_printed_records(recIDs_to_print, format, ot, ln,
+                                                      search_pattern=search_pattern,
+                                                      user_info=user_info, verbose=verbose,
+                                                      sf=sf, so=so, sp=sp, rm=rm):
+                    req.write(record)
+
+        if verbose and format.startswith("h"):
+            t2 = os.times()[4]
+            print_warning(req, "Print stage: printing %d records took %.2f seconds." % \
+                          (irec_max - irec_min, t2 - t1))
 
     else:
         print_warning(req, _("Use different search terms."))
@@ -3947,6 +4223,24 @@ def get_record(recid):
                 pass
     return create_record(print_record(recid, 'xm'))[0]
 
+def get_records(recIDs):
+    """Return dictionary of the record objects corresponding to the
+       recids, fetching the serialized ones in one query."""
+    out = {}
+    if CFG_BIBUPLOAD_SERIALIZE_RECORD_STRUCTURE and recIDs:
+        res = run_sql("SELECT id_bibrec, value FROM bibfmt WHERE FORMAT='recstruct' AND id_bibrec IN (%s)" % \
+                      ','.join(['%s'] * len(recIDs)), tuple(recIDs))
+        for recID, value in res:
+            try:
+                out[recID] = deserialize_via_marshal(value)
+            except:
+                ### In case of corruption, let's rebuild it!
+                pass
+    for recID in recIDs:
+        if not out.has_key(recID):
+            out[recID] = get_record(recID)
+    return out
+
 def print_record(recID, format='hb', ot='', ln=CFG_SITE_LANG, decompress=zlib.decompress,
                  search_pattern=None, user_info=None, verbose=0, sf='', so='d', sp='', rm=''):
     """
@@ -4304,6 +4598,86 @@ def print_record(recID, format='hb', ot='', ln=CFG_SITE_LANG, decompress=zlib.de
 
     return out
 
+def iterate_printed_records(recIDs, format='hb', ot='', ln=CFG_SITE_LANG, decompress=zlib.decompress,
+                            search_pattern=None, user_info=None, verbose=0, sf='', so='d', sp='', rm=''):
+    """
+    Yield records 'recIDs' printed according to 'format', one after
+    the other, exactly as print_record() would print them.
+
+    For the formats handled by BibFormat, the record existence, the
+    preformatted outputs and the record structures are fetched for all
+    records at once instead of record by record; other formats are
+    printed by print_record().
+    """
+    if CFG_BIBFORMAT_USE_OLD_BIBFORMAT \
+           or format.lower().startswith('t') \
+           or format.lower().startswith('hm') \
+           or str(format[0:3]).isdigit() \
+           or ot or format == 'recstruct':
+        for recID in recIDs:
+            yield print_record(recID, format, ot, ln, decompress, search_pattern=search_pattern,
+                               user_info=user_info, verbose=verbose, sf=sf, so=so, sp=sp, rm=rm)
+        return
+
+    from invenio.bibformat_utils import get_pdf_snippets
+
+    _ = gettext_set_language(ln)
+
+    try:
+        display_claim_this_paper = user_info["precached_viewclaimlink"]
+    except (KeyError, TypeError):
+        display_claim_this_paper = False
+
+    # Unspecified format is hd
+    if format == '':
+        format = 'hd'
+
+    keywords = []
+    if search_pattern is not None:
+        units = create_basic_search_units(None, str(search_pattern), None)
+        keywords = [unit[1] for unit in units if (unit[0] != '-' and unit[2] in [None, 'fulltext'])]
+    print_snippets_p = CFG_WEBSEARCH_FULLTEXT_SNIPPETS and keywords and \
+                       user_info and 'fulltext' in user_info['uri']
+    print_brief_links_p = format.lower().startswith('hb') and \
+                          format.lower() != 'hb_p'
+
+    record_existence = records_exist(recIDs)
+    # HTML output displays a default value for deleted records.
+    # Other format have to deal with it.
+    print_deleted_p = get_output_format_content_type(format) == 'text/html'
+    recIDs_to_format = [recID for recID in recIDs
+                        if record_existence[recID] == 1 or \
+                        (record_existence[recID] == -1 and not print_deleted_p)]
+    formatted_records = iterate_formatted_records(recIDs_to_format,
+                                                  of=format,
+                                                  ln=ln,
+                                                  verbose=verbose,
+                                                  search_pattern=keywords,
+                                                  user_info=user_info,
+                                                  record_existence=record_existence)
+
+    for recID in recIDs:
+        if record_existence[recID] == 0: # doesn't exist
+            yield ""
+        elif record_existence[recID] == -1 and print_deleted_p:
+            yield _("The record has been deleted.")
+        else:
+            out = formatted_records.next()
+            if print_snippets_p:
+                snippets = get_pdf_snippets(recID, keywords)
+                if snippets:
+                    out += snippets
+            # at the end of HTML brief mode, print the "Detailed record" functionality:
+            if print_brief_links_p:
+                out += websearch_templates.tmpl_print_record_brief_links(ln=ln,
+                                                                         recID=recID,
+                                                                         sf=sf,
+                                                                         so=so,
+                                                                         sp=sp,
+                                                                         rm=rm,
+                                                                         display_claim_link=display_claim_this_paper)
+            yield out
+
 def call_bibformat(recID, format="HD", ln=CFG_SITE_LANG, search_pattern=None, user_info=None, verbose=0):
     """
     Calls BibFormat and returns formatted record.
@@ -4858,7 +5232,13 @@ def perform_request_search(req=None, cc=CFG_SITE_NAME, c=None, p="", f="", rg=CF
         if aas == 1 or (p1 or p2 or p3):
             ## 3A - advanced search
             try:
-                results_in_any_collection = search_pattern_parenthesised(req, p1, f1, m1, ap=ap, of=of, verbose=verbose, ln=ln, wl=wl)
+                # the fields are searched concurrently if the search
+                # executor allows, and their results combined in order:
+                search_tasks = {}
+                for idx_field, p_field, f_field, m_field in ((1, p1, f1, m1), (2, p2, f2, m2), (3, p3, f3, m3)):
+                    if idx_field == 1 or p_field:
+                        search_tasks[idx_field] = submit_search_pattern_parenthesised(req, p_field, f_field, m_field, ap=ap, of=of, verbose=verbose, ln=ln, wl=wl)
+                results_in_any_collection = search_tasks[1].result()
                 if len(results_in_any_collection) == 0:
                     if of.startswith("h"):
                         perform_external_collection_search(req, cc, [p, p1, p2, p3], f, ec, verbose, ln, selected_external_collections_infos)
@@ -4868,7 +5248,7 @@ def perform_request_search(req=None, cc=CFG_SITE_NAME, c=None, p="", f="", rg=CF
                         print_records_epilogue(req, of)
                     return page_end(req, of, ln)
                 if p2:
-                    results_tmp = search_pattern_parenthesised(req, p2, f2, m2, ap=ap, of=of, verbose=verbose, ln=ln, wl=wl)
+                    results_tmp = search_tasks[2].result()
                     if op1 == "a": # add
                         results_in_any_collection.intersection_update(results_tmp)
                     elif op1 == "o": # or
@@ -4887,7 +5267,7 @@ def perform_request_search(req=None, cc=CFG_SITE_NAME, c=None, p="", f="", rg=CF
                             print_records_epilogue(req, of)
                         return page_end(req, of, ln)
                 if p3:
-                    results_tmp = search_pattern_parenthesised(req, p3, f3, m3, ap=ap, of=of, verbose=verbose, ln=ln, wl=wl)
+                    results_tmp = search_tasks[3].result()
                     if op2 == "a": # add
                         results_in_any_collection.intersection_update(results_tmp)
                     elif op2 == "o": # or
@@ -4910,10 +5290,12 @@ def perform_request_search(req=None, cc=CFG_SITE_NAME, c=None, p="", f="", rg=CF
                 return page_end(req, of, ln)
         else:
             ## 3B - simple search
-            if search_results_cache.cache.has_key(query_representation_in_cache):
-                # query is not in the cache already, so reuse it:
-                query_in_cache = True
-                results_in_any_collection = search_results_cache.cache[query_representation_in_cache]
+            if CFG_WEBSEARCH_SEARCH_CACHE_SIZE:
+                results_in_cache = search_results_cache.get(query_representation_in_cache)
+                query_in_cache = results_in_cache is not None
+            if query_in_cache:
+                # query is in the cache already, so reuse it:
+                results_in_any_collection = results_in_cache
                 if verbose and of.startswith("h"):
                     print_warning(req, "Search stage 0: query found in cache, reusing cached results.")
             else:
@@ -4941,9 +5323,7 @@ def perform_request_search(req=None, cc=CFG_SITE_NAME, c=None, p="", f="", rg=CF
 
         # store this search query results into search results cache if needed:
         if CFG_WEBSEARCH_SEARCH_CACHE_SIZE and not query_in_cache:
-            if len(search_results_cache.cache) > CFG_WEBSEARCH_SEARCH_CACHE_SIZE:
-                search_results_cache.clear()
-            search_results_cache.cache[query_representation_in_cache] = results_in_any_collection
+            search_results_cache.set(query_representation_in_cache, results_in_any_collection)
             if verbose and of.startswith("h"):
                 print_warning(req, "Search stage 3: storing query results in cache.")
 
@@ -5049,9 +5429,7 @@ def perform_request_search(req=None, cc=CFG_SITE_NAME, c=None, p="", f="", rg=CF
             results_final_nb_total = results_final_nb.values()[0]
         else:
             # okay, some work ahead to union hits across collections:
-            results_final_for_all_selected_colls = HitSet()
-            for coll in results_final.keys():
-                results_final_for_all_selected_colls.union_update(results_final[coll])
+            results_final_for_all_selected_colls = union_many(results_final.values())
             results_final_nb_total = len(results_final_for_all_selected_colls)
 
         #if hosted_colls and (of.startswith("h") or of.startswith("x")):
@@ -5313,12 +5691,14 @@ def perform_request_cache(req, action="show"):
     req.write(out)
     # show search results cache:
     out = "<h3>Search Cache</h3>"
-    out += "- search cache usage: %d queries cached (max. ~%d)" % \
-           (len(search_results_cache.cache), CFG_WEBSEARCH_SEARCH_CACHE_SIZE)
-    if len(search_results_cache.cache):
+    out += "- search cache usage: %d queries cached (max. ~%d), %d bytes (max. %d)" % \
+           (len(search_results_cache), CFG_WEBSEARCH_SEARCH_CACHE_SIZE,
+            search_results_cache.nbytes, CFG_WEBSEARCH_SEARCH_CACHE_MAX_BYTES)
+    out += "<br />- search data timestamp: %s" % search_results_cache.timestamp
+    if len(search_results_cache):
         out += "<br />- search cache contents:"
         out += "<blockquote>"
-        for query, hitset in search_results_cache.cache.items():
+        for query, hitset in search_results_cache.items():
             out += "<br />%s ... %s" % (query, hitset)
         out += """<p><a href="%s/search/cache?action=clear">clear search results cache</a>""" % CFG_SITE_URL
         out += "</blockquote>"
@@ -5390,7 +5770,7 @@ def perform_request_log(req, date=""):
     return "\n"
 
 
-def get_most_popular_field_values(recids, tags, exclude_values=None, count_repetitive_values=True):
+def get_most_popular_field_values(recids, tags, exclude_values=None, count_repetitive_values=True, limit=0):
     """
     Analyze RECIDS and look for TAGS and return most popular values
     and the frequency with which they occur sorted according to
@@ -5404,6 +5784,9 @@ def get_most_popular_field_values(recids, tags, exclude_values=None, count_repet
     (But, if the same value occurs in another record, we count it, of
     course.)
 
+    If LIMIT is set, then return only the LIMIT most popular values,
+    which is much faster for large sets of records.
+
     Example:
      >>> get_most_popular_field_values(range(11,20), '980__a')
      (('PREPRINT', 10), ('THESIS', 7), ...)
@@ -5411,63 +5794,16 @@ def get_most_popular_field_values(recids, tags, exclude_values=None, count_repet
      (('Ellis, J', 10), ('Ellis, N', 7), ...)
      >>> get_most_popular_field_values(range(11,20), ('100__a', '700__a'), ('Ellis, J'))
      (('Ellis, N', 7), ...)
+     >>> get_most_popular_field_values(range(11,20), ('100__a', '700__a'), limit=1)
+     (('Ellis, J', 10),)
     """
-
-    def _get_most_popular_field_values_helper_sorter(val1, val2):
-        "Compare VAL1 and VAL2 according to, firstly, frequency, then secondly, alphabetically."
-        compared_via_frequencies = cmp(valuefreqdict[val2], valuefreqdict[val1])
-        if compared_via_frequencies == 0:
-            return cmp(val1.lower(), val2.lower())
-        else:
-            return compared_via_frequencies
-
-    valuefreqdict = {}
     ## sanity check:
     if not exclude_values:
         exclude_values = []
     if isinstance(tags, str):
         tags = (tags,)
-    ## find values to count:
-    vals_to_count = []
-    displaytmp = {}
-    if count_repetitive_values:
-        # counting technique A: can look up many records at once: (very fast)
-        for tag in tags:
-            vals_to_count.extend(get_fieldvalues(recids, tag))
-    else:
-        # counting technique B: must count record-by-record: (slow)
-        for recid in recids:
-            vals_in_rec = []
-            for tag in tags:
-                for val in get_fieldvalues(recid, tag, False):
-                    vals_in_rec.append(val)
-            # do not count repetitive values within this record
-            # (even across various tags, so need to unify again):
-            dtmp = {}
-            for val in vals_in_rec:
-                dtmp[val.lower()] = 1
-                displaytmp[val.lower()] = val
-            vals_in_rec = dtmp.keys()
-            vals_to_count.extend(vals_in_rec)
-    ## are we to exclude some of found values?
-    for val in vals_to_count:
-        if val not in exclude_values:
-            if valuefreqdict.has_key(val):
-                valuefreqdict[val] += 1
-            else:
-                valuefreqdict[val] = 1
-    ## sort by descending frequency of values:
-    out = ()
-    vals = valuefreqdict.keys()
-    vals.sort(_get_most_popular_field_values_helper_sorter)
-    for val in vals:
-        tmpdisplv = ''
-        if displaytmp.has_key(val):
-            tmpdisplv = displaytmp[val]
-        else:
-            tmpdisplv = val
-        out += (tmpdisplv, valuefreqdict[val]),
-    return out
+    return facet_engine.get_most_popular_values(recids, tags, exclude_values,
+                                                count_repetitive_values, limit)
 
 def profile(p="", f="", c=CFG_SITE_NAME):
     """Profile search time."""
@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+##
+## This file is part of Invenio.
+## Copyright (C) 2011 CERN.
+##
+## Invenio is free software; you can redistribute it and/or
+## modify it under the terms of the GNU General Public License as
+## published by the Free Software Foundation; either version 2 of the
+## License, or (at your option) any later version.
+##
+## Invenio is distributed in the hope that it will be useful, but
+## WITHOUT ANY WARRANTY; without even the implied warranty of
+## MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+## General Public License for more details.
+##
+## You should have received a copy of the GNU General Public License
+## along with Invenio; if not, write to the Free Software Foundation, Inc.,
+## 59 Temple Place, Suite 330, Boston, MA 02111-1307, USA.
+
+"""
+Benchmarks for the Invenio search engine. Run this module directly to time
+queries against the configured Invenio database, searching their basic search
+units and their advanced search fields serially and then concurrently with
+each of the given numbers of threads:
+
+   $ python search_engine_benchmark.py [-t 2,4,8] [-r 5] [-j] [query ...]
+
+A query is either a simple search pattern, or fields of an advanced search
+separated by ' || ', e.g. 'ellis || muon || 2010', searched in the 'author',
+'title' and 'year' fields. The best of the given number of runs is reported
+for each query, together with whether the results agree with the serial
+search. With -j the results are printed as one JSON object per line.
+"""
+
+__revision__ = "$Id$"
+
+import sys
+import time
+import getopt
+import simplejson as json
+
+from invenio import search_engine
+from invenio.intbitset import intbitset
+from invenio.search_engine_executor import SearchExecutor
+
+THREADS = [2, 4, 8]
+RUNS = 5
+QUERIES = ['ellis muon',
+           'author:ellis and title:muon and not year:2010',
+           'ellis or higgs or boson or muon',
+           'ellis || muon || 2010']
+ADVANCED_SEARCH_FIELDS = ['author', 'title', 'year']
+
+def search(query):
+    """
+    Searches the passed query and returns its hitset, with
+    perform_request_search() for the advanced ones and with
+    search_pattern_parenthesised() for the simple ones, so that the
+    search results cache is not involved.
+    """
+    patterns = query.split(' || ')
+    if len(patterns) == 1:
+        return search_engine.search_pattern_parenthesised(p=query)
+    arguments = {}
+    for index in range(len(patterns)):
+        arguments['p%d' % (index + 1)] = patterns[index]
+        arguments['f%d' % (index + 1)] = ADVANCED_SEARCH_FIELDS[index]
+        arguments['op%d' % (index + 1)] = 'a'
+    return intbitset(search_engine.perform_request_search(
+        **arguments))
+
+def time_search(query, max_workers, runs=RUNS):
+    """
+    Searches the passed query the given number of times with a search
+    executor of max_workers threads, 0 meaning serially. Returns a tuple
+    of the best wall time in seconds and of the hitset.
+    """
+    original = search_engine.search_executor
+    search_engine.search_executor = SearchExecutor(max_workers)
+    try:
+        # a first search to fill the caches of the search engine:
+        hitset = search(query)
+        best = None
+        for dummy in range(runs):
+            start = time.time()
+            hitset = search(query)
+            elapsed = time.time() - start
+            if best is None or elapsed < best:
+                best = elapsed
+    finally:
+        search_engine.search_executor = original
+    return best, hitset
+
+def benchmark_queries(queries, threads, runs=RUNS):
+    """
+    Times each of the passed queries serially and with each of the given
+    numbers of threads. Returns a list of (query, threads, seconds, number
+    of hits, same results as serially) tuples.
+    """
+    results = []
+    for query in queries:
+        serial_time, serial_hitset = time_search(query, 0, runs)
+        results.append((query, 0, serial_time, len(serial_hitset), True))
+        for max_workers in threads:
+            elapsed, hitset = time_search(query, max_workers, runs)
+            results.append((query, max_workers, elapsed, len(hitset),
+                            hitset == serial_hitset))
+    return results
+
+def print_queries(queries, threads, runs=RUNS, as_json=False):
+    """
+    Runs the benchmark of the passed queries and prints one line per query
+    and number of threads, either as table or as JSON objects.
+    """
+    if not as_json:
+        print "%-50s %7s %10s %8s %5s" % ('query', 'threads', 'seconds',
+                                          'hits', 'same')
+    for query, max_workers, elapsed, hits, same in \
+            benchmark_queries(queries, threads, runs):
+        if as_json:
+            print json.dumps({'query'   : query,
+                              'threads' : max_workers,
+                              'seconds' : round(elapsed, 6),
+                              'hits'    : hits,
+                              'same'    : same})
+        else:
+            print "%-50s %7d %10.4f %8d %5s" % (query[:50], max_workers,
+                                                elapsed, hits, same)
+        sys.stdout.flush()
+
+def main():
+    """Parses the command line and runs the benchmark."""
+    try:
+        opts, args = getopt.getopt(sys.argv[1:], 'ht:r:j',
+                                   ['help', 'threads=', 'runs=', 'json'])
+        threads = THREADS
+        runs = RUNS
+        as_json = False
+        for opt, value in opts:
+            if opt in ('-h', '--help'):
+                print __doc__
+                return
+            elif opt in ('-t', '--threads'):
+                threads = [int(number) for number in value.split(',')]
+            elif opt in ('-r', '--runs'):
+                runs = int(value)
+            elif opt in ('-j', '--json'):
+                as_json = True
+    except (getopt.GetoptError, ValueError), err:
+        sys.stderr.write('%s\n' % err)
+        print __doc__
+        sys.exit(1)
+
+    print_queries(args or QUERIES, threads, runs, as_json)
+
+if __name__ == '__main__':
+    main()
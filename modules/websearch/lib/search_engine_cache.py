@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+
+## This file is part of Invenio.
+## Copyright (C) 2011 CERN.
+##
+## Invenio is free software; you can redistribute it and/or
+## modify it under the terms of the GNU General Public License as
+## published by the Free Software Foundation; either version 2 of the
+## License, or (at your option) any later version.
+##
+## Invenio is distributed in the hope that it will be useful, but
+## WITHOUT ANY WARRANTY; without even the implied warranty of
+## MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+## General Public License for more details.
+##
+## You should have received a copy of the GNU General Public License
+## along with Invenio; if not, write to the Free Software Foundation, Inc.,
+## 59 Temple Place, Suite 330, Boston, MA 02111-1307, USA.
+
+"""Invenio search results cache."""
+
+__revision__ = "$Id$"
+
+import sys
+import time
+import marshal
+import threading
+
+if sys.hexversion < 0x2050000:
+    from md5 import md5
+else:
+    from hashlib import md5
+
+try:
+    import memcache
+    MEMCACHE_AVAILABLE = True
+except ImportError:
+    MEMCACHE_AVAILABLE = False
+
+from invenio.dbquery import get_table_update_time
+from invenio.intbitset import intbitset
+from invenio.lrucache import LRUCache
+
+def get_search_data_timestamp():
+    """Return the last update time of the tables search results depend
+       on, i.e. the word, pair and phrase indexes and the collections."""
+    return max(get_table_update_time('idx%'),
+               get_table_update_time('collection'))
+
+class SearchResultsCache:
+    """
+    Least recently used cache of search results, i.e. of hitsets by
+    query representation.  The hitsets are kept serialised by
+    fastdump(), so that the cache size is bounded in bytes: when the
+    cache grows over max_bytes or max_entries (if set), the least
+    recently used queries are evicted one by one.
+
+    Cached results are invalidated when the search data they were
+    computed from change, as told by timestamp_verifier, which is
+    called at most every check_interval seconds.  If memcached servers
+    are given and the memcache module is available, results are also
+    shared with the other processes through memcached.
+    """
+    def __init__(self, max_bytes, max_entries=0, memcached_servers=None,
+                 timestamp_verifier=get_search_data_timestamp,
+                 check_interval=10, prefix='invenio_search_cache'):
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.timestamp_verifier = timestamp_verifier
+        self.check_interval = check_interval
+        self.prefix = prefix
+        self.shared = None
+        if memcached_servers and MEMCACHE_AVAILABLE:
+            self.shared = memcache.Client(memcached_servers)
+        self.lock = threading.Lock()
+        self.timestamp = ''
+        self.generation = 0
+        self.last_check = 0
+        self._reset()
+
+    def _reset(self):
+        """Drop all the cached queries of this process."""
+        # (dump, timestamp) pairs by query representation:
+        self.entries = LRUCache()
+        self.nbytes = 0
+
+    def _shared_key(self, key):
+        """Return the memcached key of the query representation."""
+        return '%s_%d_%s' % (self.prefix, self.generation,
+                             md5(key).hexdigest())
+
+    def _check_timestamp(self):
+        """Fetch the search data timestamp and, if shared, the cache
+           generation unless done less than check_interval ago."""
+        now = time.time()
+        if now - self.last_check < self.check_interval:
+            return
+        self.last_check = now
+        self.timestamp = self.timestamp_verifier()
+        if self.shared is not None:
+            generation = self.shared.get(self.prefix + '_generation')
+            if generation is None:
+                self.shared.add(self.prefix + '_generation', 0)
+                generation = 0
+            if generation != self.generation:
+                self._reset()
+                self.generation = generation
+
+    def _store(self, key, dump, timestamp):
+        """Store the serialised hitset locally, evicting least recently
+           used queries as needed."""
+        entry = self.entries.pop(key)
+        if entry is not None:
+            self.nbytes -= len(entry[0])
+        if len(dump) > self.max_bytes:
+            return
+        self.entries.set(key, (dump, timestamp))
+        self.nbytes += len(dump)
+        while self.nbytes > self.max_bytes or \
+              (self.max_entries and len(self.entries) > self.max_entries):
+            self.nbytes -= len(self.entries.pop_oldest()[1][0])
+
+    def get(self, key):
+        """Return the cached hitset of the query representation 'key'
+           or None if it is not cached or outdated."""
+        self.lock.acquire()
+        try:
+            self._check_timestamp()
+            entry = self.entries.get(key)
+            if entry is not None:
+                dump, timestamp = entry
+                if timestamp < self.timestamp:
+                    self.entries.pop(key)
+                    self.nbytes -= len(dump)
+                else:
+                    return intbitset(dump)
+            if self.shared is not None:
+                value = self.shared.get(self._shared_key(key))
+                if value:
+                    timestamp, dump = marshal.loads(value)
+                    if timestamp >= self.timestamp:
+                        self._store(key, dump, timestamp)
+                        return intbitset(dump)
+            return None
+        finally:
+            self.lock.release()
+
+    def set(self, key, hitset):
+        """Cache the hitset of the query representation 'key'."""
+        dump = hitset.fastdump()
+        self.lock.acquire()
+        try:
+            self._check_timestamp()
+            self._store(key, dump, self.timestamp)
+            if self.shared is not None:
+                self.shared.set(self._shared_key(key),
+                                marshal.dumps((self.timestamp, dump)))
+        finally:
+            self.lock.release()
+
+    def clear(self):
+        """Drop all the cached queries, in all processes if shared."""
+        self.lock.acquire()
+        try:
+            self._reset()
+            if self.shared is not None:
+                generation = self.shared.incr(self.prefix + '_generation')
+                if generation is not None:
+                    self.generation = generation
+        finally:
+            self.lock.release()
+
+    def items(self):
+        """Return the list of cached (query representation, hitset)
+           pairs of this process, most recently used first."""
+        self.lock.acquire()
+        try:
+            return [(key, intbitset(dump))
+                    for key, (dump, timestamp) in self.entries.items()]
+        finally:
+            self.lock.release()
+
+    def __len__(self):
+        return len(self.entries)
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+##
+## This file is part of Invenio.
+## Copyright (C) 2011 CERN.
+##
+## Invenio is free software; you can redistribute it and/or
+## modify it under the terms of the GNU General Public License as
+## published by the Free Software Foundation; either version 2 of the
+## License, or (at your option) any later version.
+##
+## Invenio is distributed in the hope that it will be useful, but
+## WITHOUT ANY WARRANTY; without even the implied warranty of
+## MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+## General Public License for more details.
+##
+## You should have received a copy of the GNU General Public License
+## along with Invenio; if not, write to the Free Software Foundation, Inc.,
+## 59 Temple Place, Suite 330, Boston, MA 02111-1307, USA.
+
+"""Unit tests for the search results cache."""
+
+__revision__ = "$Id$"
+
+import unittest
+
+from invenio.intbitset import intbitset
+from invenio.search_engine_cache import SearchResultsCache
+from invenio.testutils import make_test_suite, run_test_suite
+
+class TestSearchResultsCache(unittest.TestCase):
+    """Test the LRU search results cache."""
+
+    def setUp(self):
+        self.timestamp = '2011-01-01 00:00:00'
+        self.hitsets = [intbitset(range(i, 1000 * (i + 1), i + 1))
+                        for i in range(3)]
+        self.size = len(self.hitsets[0].fastdump())
+        self.cache = SearchResultsCache(2 * self.size + 1,
+                                        timestamp_verifier=lambda: self.timestamp,
+                                        check_interval=0)
+
+    def test_get_and_set(self):
+        """search engine cache - cached hitsets are returned as copies"""
+        self.assertEqual(self.cache.get('q0'), None)
+        self.cache.set('q0', self.hitsets[0])
+        hitset = self.cache.get('q0')
+        self.assertEqual(hitset, self.hitsets[0])
+        hitset.add(1000000)
+        self.assertEqual(self.cache.get('q0'), self.hitsets[0])
+        self.assertEqual(len(self.cache), 1)
+
+    def test_least_recently_used_evicted(self):
+        """search engine cache - least recently used query is evicted"""
+        self.cache.set('q0', self.hitsets[0])
+        self.cache.set('q1', self.hitsets[0])
+        self.cache.get('q0')
+        self.cache.set('q2', self.hitsets[0])
+        self.assertEqual(self.cache.get('q1'), None)
+        self.assertEqual([query for query, hitset in self.cache.items()],
+                         ['q2', 'q0'])
+        self.failIf(self.cache.nbytes > 2 * self.size + 1)
+
+    def test_max_entries(self):
+        """search engine cache - number of cached queries is bounded"""
+        self.cache.max_bytes = 1000000
+        self.cache.max_entries = 2
+        for i in range(3):
+            self.cache.set('q%d' % i, self.hitsets[i])
+        self.assertEqual(len(self.cache), 2)
+        self.assertEqual(self.cache.get('q0'), None)
+        self.assertEqual(self.cache.get('q2'), self.hitsets[2])
+
+    def test_invalidation(self):
+        """search engine cache - results are invalidated by index updates"""
+        self.cache.set('q0', self.hitsets[0])
+        self.timestamp = '2011-01-01 00:00:01'
+        self.assertEqual(self.cache.get('q0'), None)
+        self.assertEqual(len(self.cache), 0)
+        self.assertEqual(self.cache.nbytes, 0)
+
+    def test_clear(self):
+        """search engine cache - clearing drops all queries"""
+        self.cache.set('q0', self.hitsets[0])
+        self.cache.clear()
+        self.assertEqual(self.cache.get('q0'), None)
+        self.assertEqual(self.cache.items(), [])
+
+TEST_SUITE = make_test_suite(TestSearchResultsCache)
+
+if __name__ == "__main__":
+    run_test_suite(TEST_SUITE)
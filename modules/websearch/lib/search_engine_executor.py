@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+
+## This file is part of Invenio.
+## Copyright (C) 2011 CERN.
+##
+## Invenio is free software; you can redistribute it and/or
+## modify it under the terms of the GNU General Public License as
+## published by the Free Software Foundation; either version 2 of the
+## License, or (at your option) any later version.
+##
+## Invenio is distributed in the hope that it will be useful, but
+## WITHOUT ANY WARRANTY; without even the implied warranty of
+## MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+## General Public License for more details.
+##
+## You should have received a copy of the GNU General Public License
+## along with Invenio; if not, write to the Free Software Foundation, Inc.,
+## 59 Temple Place, Suite 330, Boston, MA 02111-1307, USA.
+
+"""Invenio search executor.
+
+Runs independent searches, such as the basic search units of a query,
+concurrently on a bounded pool of worker threads.  The worker threads
+live as long as the process, and dbquery keeps one database connection
+per thread, so each worker reuses its own connection from one search
+to the next.
+"""
+
+__revision__ = "$Id$"
+
+import sys
+import threading
+import Queue
+
+class SearchTask:
+    """
+    A function call submitted to the search executor.  The result of
+    the call is obtained by result(), which waits for the call to be
+    done, or makes it if no worker thread took care of it.  A call
+    that is not needed anymore can be cancelled, so that no worker
+    thread makes it if it did not start yet.
+    """
+    def __init__(self, function, args, kwargs, output=None):
+        self.function = function
+        self.args = args
+        self.kwargs = kwargs
+        self.output = output
+        self.lock = threading.Lock()
+        self.started = False
+        self.cancelled = False
+        self.done = threading.Event()
+        self.value = None
+        self.exc_info = None
+
+    def run(self, queued=False):
+        """Make the function call, unless it was started already, or if
+           run by a worker thread from the queue, cancelled."""
+        self.lock.acquire()
+        try:
+            if self.started or (queued and self.cancelled):
+                return
+            self.started = True
+        finally:
+            self.lock.release()
+        try:
+            self.value = self.function(*self.args, **self.kwargs)
+        except:
+            self.exc_info = sys.exc_info()
+        self.done.set()
+
+    def cancel(self):
+        """Keep the worker threads from making the function call if it
+           did not start yet.  result() still makes it if asked for."""
+        self.lock.acquire()
+        try:
+            self.cancelled = True
+        finally:
+            self.lock.release()
+
+    def result(self):
+        """Return the result of the function call or raise its
+           exception.  If the call wrote on a BufferedRequest, what it
+           wrote is written to the real request first."""
+        self.run()
+        self.done.wait()
+        if self.output is not None:
+            self.output.flush()
+        if self.exc_info is not None:
+            raise self.exc_info[0], self.exc_info[1], self.exc_info[2]
+        return self.value
+
+def cancel_search_tasks(tasks):
+    """Cancel the SearchTask objects of the list that are not None."""
+    for task in tasks:
+        if task is not None:
+            task.cancel()
+
+class SearchExecutor:
+    """
+    Pool of at most max_workers threads making the function calls
+    submitted to it.  With max_workers set to 0, or when submitting
+    from a worker thread, the calls are made by result() in the
+    calling thread instead, i.e. serially and only if needed.
+    """
+    def __init__(self, max_workers):
+        self.max_workers = max_workers
+        self.queue = Queue.Queue()
+        self.workers = []
+        self.lock = threading.Lock()
+
+    def _work(self):
+        """Make the submitted function calls, forever."""
+        while True:
+            self.queue.get().run(queued=True)
+
+    def _start_workers(self):
+        """Start the worker threads if not done yet."""
+        self.lock.acquire()
+        try:
+            while len(self.workers) < self.max_workers:
+                worker = threading.Thread(target=self._work)
+                worker.setDaemon(True)
+                worker.start()
+                self.workers.append(worker)
+        finally:
+            self.lock.release()
+
+    def parallel_p(self):
+        """Tell whether the calls submitted now would run concurrently."""
+        return self.max_workers > 0 and \
+               threading.currentThread() not in self.workers
+
+    def submit(self, function, *args, **kwargs):
+        """Submit the call of function with the arguments and return its
+           SearchTask."""
+        return self.submit_with_output(None, function, *args, **kwargs)
+
+    def submit_with_output(self, output, function, *args, **kwargs):
+        """Submit the call of function with the arguments, which writes
+           on the BufferedRequest output, and return its SearchTask."""
+        task = SearchTask(function, args, kwargs, output)
+        if self.parallel_p():
+            self._start_workers()
+            self.queue.put(task)
+        return task
+
+class BufferedRequest(object):
+    """
+    Stand-in for the request object given to a search that may run in
+    a worker thread: what the search writes is kept, to be written to
+    the real request later, in the order of the searches, and the other
+    attributes are those of the real request.  The user information
+    should have been collected from the real request beforehand, in the
+    main thread, so that the searches find it there.
+    """
+    def __init__(self, req):
+        self._req = req
+        self._output = []
+
+    def write(self, text):
+        """Keep the text to be written to the real request."""
+        self._output.append(text)
+
+    def flush(self):
+        """Write the kept texts to the real request."""
+        if self._output:
+            self._req.write(''.join(self._output))
+            self._output = []
+
+    def __getattr__(self, name):
+        return getattr(self._req, name)
@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+##
+## This file is part of Invenio.
+## Copyright (C) 2011 CERN.
+##
+## Invenio is free software; you can redistribute it and/or
+## modify it under the terms of the GNU General Public License as
+## published by the Free Software Foundation; either version 2 of the
+## License, or (at your option) any later version.
+##
+## Invenio is distributed in the hope that it will be useful, but
+## WITHOUT ANY WARRANTY; without even the implied warranty of
+## MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+## General Public License for more details.
+##
+## You should have received a copy of the GNU General Public License
+## along with Invenio; if not, write to the Free Software Foundation, Inc.,
+## 59 Temple Place, Suite 330, Boston, MA 02111-1307, USA.
+
+"""Unit tests for the search executor."""
+
+__revision__ = "$Id$"
+
+import unittest
+import threading
+import time
+
+from invenio.search_engine_executor import SearchExecutor, BufferedRequest
+from invenio.testutils import make_test_suite, run_test_suite
+
+class FakeRequest:
+    """Request object remembering what was written to it."""
+    def __init__(self):
+        self.output = []
+        self.uri = '/search'
+
+    def write(self, text):
+        self.output.append(text)
+
+def slow_square(number):
+    """Return the square of number, slowly for the small ones."""
+    time.sleep(0.01 * (5 - number))
+    return number * number
+
+class TestSearchExecutor(unittest.TestCase):
+    """Test running searches concurrently."""
+
+    def test_results_in_order(self):
+        """search executor - results independent of completion order"""
+        for max_workers in (0, 1, 4):
+            executor = SearchExecutor(max_workers)
+            tasks = [executor.submit(slow_square, number)
+                     for number in range(5)]
+            self.assertEqual([task.result() for task in tasks],
+                             [0, 1, 4, 9, 16])
+
+    def test_exception(self):
+        """search executor - exceptions raised by result()"""
+        executor = SearchExecutor(2)
+        task = executor.submit(int, 'not a number')
+        self.assertRaises(ValueError, task.result)
+        self.assertRaises(ValueError, task.result)
+
+    def test_serial_calls_are_lazy(self):
+        """search executor - serial calls made only when needed"""
+        calls = []
+        executor = SearchExecutor(0)
+        self.failIf(executor.parallel_p())
+        task = executor.submit(calls.append, 1)
+        self.assertEqual(calls, [])
+        task.result()
+        task.result()
+        self.assertEqual(calls, [1])
+
+    def test_nested_calls(self):
+        """search executor - calls submitted from a worker thread"""
+        executor = SearchExecutor(1)
+        started = threading.Event()
+
+        def sum_of_squares(numbers):
+            started.set()
+            self.failIf(executor.parallel_p())
+            tasks = [executor.submit(slow_square, number)
+                     for number in numbers]
+            return sum([task.result() for task in tasks])
+
+        self.assert_(executor.parallel_p())
+        task = executor.submit(sum_of_squares, range(5))
+        # let the worker thread take the call:
+        started.wait()
+        self.assertEqual(task.result(), 30)
+
+    def test_concurrent_calls(self):
+        """search executor - calls made in worker threads"""
+        executor = SearchExecutor(3)
+        started = threading.Event()
+
+        def current_thread():
+            started.set()
+            return threading.currentThread()
+
+        task = executor.submit(current_thread)
+        started.wait()
+        self.assert_(task.result() in executor.workers)
+        self.assertEqual(len(executor.workers), 3)
+
+    def test_cancelled_calls(self):
+        """search executor - cancelled calls left to result()"""
+        executor = SearchExecutor(1)
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def blocker():
+            started.set()
+            release.wait()
+            return threading.currentThread()
+
+        def record(number):
+            calls.append(number)
+            return threading.currentThread()
+
+        blocking = executor.submit(blocker)
+        started.wait()
+        tasks = [executor.submit(record, number) for number in range(3)]
+        tasks[1].cancel()
+        release.set()
+        self.assert_(blocking.result() in executor.workers)
+        self.assert_(tasks[2].result() in executor.workers)
+        self.assertEqual(calls, [0, 2])
+        self.assertEqual(tasks[1].result(), threading.currentThread())
+        self.assertEqual(calls, [0, 2, 1])
+        tasks[0].cancel()
+        self.assert_(tasks[0].result() in executor.workers)
+
+class TestBufferedRequest(unittest.TestCase):
+    """Test the output of concurrent searches."""
+
+    def test_output_in_order(self):
+        """search executor - output written in the order of the results"""
+        req = FakeRequest()
+        executor = SearchExecutor(2)
+
+        def search(req, number):
+            req.write('searching %d;' % number)
+            return slow_square(number)
+
+        tasks = []
+        for number in range(4):
+            output = BufferedRequest(req)
+            tasks.append(executor.submit_with_output(output, search, output,
+                                                     number))
+        self.assertEqual([task.result() for task in tasks], [0, 1, 4, 9])
+        self.assertEqual(req.output, ['searching 0;', 'searching 1;',
+                                      'searching 2;', 'searching 3;'])
+
+    def test_attributes(self):
+        """search executor - attributes of the real request"""
+        req = FakeRequest()
+        output = BufferedRequest(req)
+        self.assertEqual(output.uri, '/search')
+        output.write('a')
+        output.write('b')
+        self.assertEqual(req.output, [])
+        output.flush()
+        output.flush()
+        self.assertEqual(req.output, ['ab'])
+
+TEST_SUITE = make_test_suite(TestSearchExecutor,
+                             TestBufferedRequest)
+
+if __name__ == "__main__":
+    run_test_suite(TEST_SUITE)
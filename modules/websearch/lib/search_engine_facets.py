@@ -0,0 +1,307 @@
+# -*- coding: utf-8 -*-
+
+## This file is part of Invenio.
+## Copyright (C) 2011 CERN.
+##
+## Invenio is free software; you can redistribute it and/or
+## modify it under the terms of the GNU General Public License as
+## published by the Free Software Foundation; either version 2 of the
+## License, or (at your option) any later version.
+##
+## Invenio is distributed in the hope that it will be useful, but
+## WITHOUT ANY WARRANTY; without even the implied warranty of
+## MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+## General Public License for more details.
+##
+## You should have received a copy of the GNU General Public License
+## along with Invenio; if not, write to the Free Software Foundation, Inc.,
+## 59 Temple Place, Suite 330, Boston, MA 02111-1307, USA.
+
+"""Invenio search engine facets.
+
+Counts how many times the values of some MARC tags occur in a set of
+records, e.g. to find the most popular authors or collections of a
+list of search results.  Small sets of records are looked up in the
+bibXXx tables.  For large ones, the facet engine keeps in memory the
+posting lists of the values of each tag, i.e. the records having each
+value, and intersects them with the set of records, the most frequent
+values first, so that the most popular values can be found without
+counting all of them.
+"""
+
+__revision__ = "$Id$"
+
+import heapq
+from array import array
+
+from invenio.data_cacher import IntervalDataCacher
+from invenio.dbquery import run_sql, get_table_update_time
+from invenio.intbitset import intbitset
+
+def get_tag_rows(tag, recids=None):
+    """Return the list of (recID, value) pairs of tag TAG, for the
+       records RECIDS or for all records if RECIDS is None."""
+    if tag == "001___":
+        # We have asked for tag 001 (=recID) that is not stored in bibXXx
+        # tables.
+        if recids is None:
+            recids = [row[0] for row in run_sql("SELECT id FROM bibrec")]
+        return [(recid, str(recid)) for recid in recids]
+    digits = tag[0:2]
+    try:
+        intdigits = int(digits)
+        if intdigits < 0 or intdigits > 99:
+            raise ValueError
+    except ValueError:
+        # invalid tag value asked for
+        return []
+    bx = "bib%sx" % digits
+    bibx = "bibrec_bib%sx" % digits
+    query = "SELECT bibx.id_bibrec, bx.value FROM %s AS bx, %s AS bibx " \
+            "WHERE bx.id=bibx.id_bibxxx AND bx.tag LIKE %%s" % (bx, bibx)
+    if recids is None:
+        return run_sql(query, (tag,))
+    if not recids:
+        return []
+    query += " AND bibx.id_bibrec IN (%s)" % ','.join(['%s'] * len(recids))
+    return run_sql(query, (tag,) + tuple(recids))
+
+def get_tag_update_time(tag):
+    """Return the last update time of the tables storing tag TAG."""
+    return get_table_update_time('%%bib%sx' % tag[0:2])
+
+def count_posting(posting, hitset):
+    """Return the number of records of the posting list that are in
+       HITSET."""
+    if isinstance(posting, intbitset):
+        return len(posting & hitset)
+    count = 0
+    for recid in posting:
+        if recid in hitset:
+            count += 1
+    return count
+
+def intersect_posting(posting, hitset):
+    """Return the intbitset of the records of the posting list that are
+       in HITSET."""
+    if isinstance(posting, intbitset):
+        return posting & hitset
+    return intbitset([recid for recid in posting if recid in hitset])
+
+class TagPostings:
+    """
+    Posting lists of the values of a tag.  The posting list of a value
+    is the set of records having the value, kept as an intbitset if
+    this takes less memory than an array of record IDs, which is the
+    case for frequent values only.  The records having the value
+    several times are remembered apart, with the number of additional
+    occurrences, for counting repetitive values.
+    """
+    def __init__(self, rows):
+        recids_by_value = {}
+        for recid, value in rows:
+            if recids_by_value.has_key(value):
+                recids_by_value[value].append(recid)
+            else:
+                recids_by_value[value] = [recid]
+        max_recid = 0
+        for recid, value in rows:
+            if recid > max_recid:
+                max_recid = recid
+        self.postings = {}
+        self.repeats = {}
+        for value, recids in recids_by_value.iteritems():
+            recids.sort()
+            unique_recids = []
+            repeats = {}
+            last_recid = None
+            for recid in recids:
+                if recid == last_recid:
+                    repeats[recid] = repeats.get(recid, 0) + 1
+                else:
+                    unique_recids.append(recid)
+                    last_recid = recid
+            if len(unique_recids) * 32 > max_recid:
+                self.postings[value] = intbitset(unique_recids)
+            else:
+                self.postings[value] = array('I', unique_recids)
+            if repeats:
+                self.repeats[value] = repeats
+        self.keys = {}
+
+    def get_keys(self, count_repetitive_values):
+        """Return the (values by key, keys sorted by size) pair, where
+           the keys are the values when counting repetitive values and
+           the lowercased values otherwise, the values by key is the
+           dictionary of the list of values of each key, and the size
+           of a key is the number of times its values occur."""
+        if not self.keys.has_key(count_repetitive_values):
+            values_by_key = {}
+            sizes = {}
+            for value, posting in self.postings.iteritems():
+                size = len(posting)
+                if count_repetitive_values:
+                    key = value
+                    size += sum(self.repeats.get(value, {}).values())
+                else:
+                    key = value.lower()
+                if values_by_key.has_key(key):
+                    values_by_key[key].append(value)
+                    sizes[key] += size
+                else:
+                    values_by_key[key] = [value]
+                    sizes[key] = size
+            keys_by_size = [(size, key) for key, size in sizes.iteritems()]
+            keys_by_size.sort()
+            keys_by_size.reverse()
+            self.keys[count_repetitive_values] = (values_by_key, keys_by_size)
+        return self.keys[count_repetitive_values]
+
+def sort_value_counts(value_counts, limit=0):
+    """Return the tuple of (value, count) pairs of the list
+       VALUE_COUNTS sorted by descending count, then alphabetically,
+       limited to the LIMIT first ones if LIMIT is set."""
+    decorated = [(-count, value.lower(), value) for value, count in value_counts]
+    if limit:
+        decorated = heapq.nsmallest(limit, decorated)
+    else:
+        decorated.sort()
+    return tuple([(value, -count) for count, dummy, value in decorated])
+
+def count_values_in_postings(hitset, tags_postings, exclude_values=(),
+                             count_repetitive_values=True, limit=0):
+    """Return the most popular values of the TagPostings objects
+       TAGS_POSTINGS in the records of HITSET, as
+       get_most_popular_field_values() does.
+
+       The keys are counted in descending order of size, stopping when
+       LIMIT values were counted and the keys remaining cannot occur
+       more often than the least popular of them.
+    """
+    keys = [tag_postings.get_keys(count_repetitive_values)
+            for tag_postings in tags_postings]
+    positions = [0] * len(keys)
+    # the k largest counts found so far:
+    largest_counts = []
+    counted = {}
+    value_counts = []
+    while True:
+        # pick the biggest key not counted yet and the maximum number
+        # of occurrences of any key not counted yet:
+        next_key = None
+        next_size = 0
+        threshold = 0
+        for i in xrange(len(keys)):
+            keys_by_size = keys[i][1]
+            while positions[i] < len(keys_by_size) and \
+                  counted.has_key(keys_by_size[positions[i]][1]):
+                positions[i] += 1
+            if positions[i] < len(keys_by_size):
+                size, key = keys_by_size[positions[i]]
+                threshold += size
+                if size > next_size:
+                    next_key, next_size = key, size
+        if next_key is None:
+            break
+        if limit and len(largest_counts) >= limit and \
+           largest_counts[0] > threshold:
+            break
+        counted[next_key] = 1
+        if next_key in exclude_values:
+            continue
+        # count the occurrences of the key in all tags:
+        count = 0
+        display_value = None
+        display_size = -1
+        hits = None
+        for tag_postings, (values_by_key, dummy) in zip(tags_postings, keys):
+            for value in values_by_key.get(next_key, ()):
+                posting = tag_postings.postings[value]
+                if len(posting) > display_size or \
+                   (len(posting) == display_size and value < display_value):
+                    display_value, display_size = value, len(posting)
+                if count_repetitive_values:
+                    count += count_posting(posting, hitset)
+                    for recid, repeats in tag_postings.repeats.get(value, {}).iteritems():
+                        if recid in hitset:
+                            count += repeats
+                elif hits is None:
+                    hits = intersect_posting(posting, hitset)
+                else:
+                    hits.union_update(intersect_posting(posting, hitset))
+        if hits is not None:
+            count = len(hits)
+        if count:
+            value_counts.append((display_value, count))
+            if len(largest_counts) < limit:
+                heapq.heappush(largest_counts, count)
+            elif limit and count > largest_counts[0]:
+                heapq.heapreplace(largest_counts, count)
+    return sort_value_counts(value_counts, limit)
+
+def count_values_in_rows(tags_rows, exclude_values=(),
+                         count_repetitive_values=True, limit=0):
+    """Return the most popular values of the lists of (recID, value)
+       pairs TAGS_ROWS, as get_most_popular_field_values() does."""
+    counts = {}
+    display_values = {}
+    seen = {}
+    for rows in tags_rows:
+        for recid, value in rows:
+            if count_repetitive_values:
+                key = value
+            else:
+                # do not count repetitive values within this record
+                # (even across various tags):
+                key = value.lower()
+                if seen.has_key((recid, key)):
+                    continue
+                seen[(recid, key)] = 1
+            if key in exclude_values:
+                continue
+            display_values[key] = value
+            counts[key] = counts.get(key, 0) + 1
+    return sort_value_counts([(display_values[key], count)
+                              for key, count in counts.iteritems()], limit)
+
+class FacetEngine:
+    """
+    Counts the values of tags in sets of records.  Sets of records
+    smaller than min_records are looked up in the database, larger
+    ones are counted with the posting lists of the tags, which are
+    loaded when first needed and reloaded when the tables of the tag
+    were updated, as checked at most every check_interval seconds.
+    """
+    def __init__(self, min_records, check_interval=60):
+        self.min_records = min_records
+        self.check_interval = check_interval
+        self.tags_postings = {}
+
+    def get_tag_postings(self, tag):
+        """Return the TagPostings object of tag TAG."""
+        cacher = self.tags_postings.get(tag)
+        if cacher is None:
+            cacher = IntervalDataCacher(lambda: TagPostings(get_tag_rows(tag)),
+                                        lambda: get_tag_update_time(tag),
+                                        self.check_interval)
+            self.tags_postings[tag] = cacher
+        else:
+            cacher.recreate_cache_if_needed()
+        return cacher.cache
+
+    def get_most_popular_values(self, recids, tags, exclude_values=(),
+                                count_repetitive_values=True, limit=0):
+        """Return the most popular values of tags TAGS in the records
+           RECIDS, see get_most_popular_field_values()."""
+        hitset = intbitset(recids)
+        if not hitset:
+            return ()
+        if self.min_records and len(hitset) >= self.min_records:
+            return count_values_in_postings(hitset,
+                                            [self.get_tag_postings(tag) for tag in tags],
+                                            exclude_values, count_repetitive_values,
+                                            limit)
+        recids = hitset.tolist()
+        return count_values_in_rows([get_tag_rows(tag, recids) for tag in tags],
+                                    exclude_values, count_repetitive_values,
+                                    limit)
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+##
+## This file is part of Invenio.
+## Copyright (C) 2011 CERN.
+##
+## Invenio is free software; you can redistribute it and/or
+## modify it under the terms of the GNU General Public License as
+## published by the Free Software Foundation; either version 2 of the
+## License, or (at your option) any later version.
+##
+## Invenio is distributed in the hope that it will be useful, but
+## WITHOUT ANY WARRANTY; without even the implied warranty of
+## MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+## General Public License for more details.
+##
+## You should have received a copy of the GNU General Public License
+## along with Invenio; if not, write to the Free Software Foundation, Inc.,
+## 59 Temple Place, Suite 330, Boston, MA 02111-1307, USA.
+
+"""Unit tests for the search engine facets."""
+
+__revision__ = "$Id$"
+
+import unittest
+from array import array
+
+from invenio.intbitset import intbitset
+from invenio.search_engine_facets import TagPostings, \
+     count_values_in_postings, count_values_in_rows
+from invenio.testutils import make_test_suite, run_test_suite
+
+AUTHOR_ROWS = [(1, 'Ellis, J'), (2, 'Ellis, J'), (3, 'Ellis, J'),
+               (1, 'Ross, G G'), (3, 'ross, g g'), (4, 'Enqvist, K'),
+               (5, 'Ellis, N'), (5, 'Ellis, N')] + \
+              [(recid, 'Nanopoulos, D V') for recid in range(2, 200)]
+COAUTHOR_ROWS = [(2, 'Ellis, N'), (3, 'Ibanez, L E'), (4, 'Ellis, J')]
+
+class TestTagPostings(unittest.TestCase):
+    """Test the posting lists of values."""
+
+    def test_postings(self):
+        """search engine facets - posting lists of values"""
+        postings = TagPostings(AUTHOR_ROWS)
+        self.assertEqual(list(postings.postings['Ellis, J']), [1, 2, 3])
+        self.assert_(isinstance(postings.postings['Ellis, J'], array))
+        self.assert_(isinstance(postings.postings['Nanopoulos, D V'], intbitset))
+        self.assertEqual(postings.repeats, {'Ellis, N': {5: 1}})
+
+    def test_keys(self):
+        """search engine facets - values sorted by number of occurrences"""
+        postings = TagPostings(AUTHOR_ROWS)
+        values_by_key, keys_by_size = postings.get_keys(False)
+        self.assertEqual(keys_by_size[:2], [(198, 'nanopoulos, d v'),
+                                            (3, 'ellis, j')])
+        self.assertEqual(values_by_key['ross, g g'], ['Ross, G G', 'ross, g g'])
+        values_by_key, keys_by_size = postings.get_keys(True)
+        self.assert_((2, 'Ellis, N') in keys_by_size)
+
+class TestCountValues(unittest.TestCase):
+    """Test counting the most popular values."""
+
+    def setUp(self):
+        self.postings = [TagPostings(AUTHOR_ROWS), TagPostings(COAUTHOR_ROWS)]
+        self.rows = [AUTHOR_ROWS, COAUTHOR_ROWS]
+
+    def test_count_repetitive_values(self):
+        """search engine facets - counting repetitive values"""
+        hitset = intbitset([1, 3, 4, 5])
+        expected = (('Ellis, J', 3), ('Nanopoulos, D V', 3), ('Ellis, N', 2),
+                    ('Enqvist, K', 1), ('Ibanez, L E', 1), ('Ross, G G', 1),
+                    ('ross, g g', 1))
+        self.assertEqual(count_values_in_postings(hitset, self.postings), expected)
+        self.assertEqual(count_values_in_rows([[row for row in rows if row[0] in hitset]
+                                               for rows in self.rows]), expected)
+
+    def test_count_values_once(self):
+        """search engine facets - counting values once per record"""
+        hitset = intbitset([1, 3, 4, 5])
+        self.assertEqual(count_values_in_postings(hitset, self.postings,
+                                                  count_repetitive_values=False),
+                         (('Ellis, J', 3), ('Nanopoulos, D V', 3),
+                          ('Ross, G G', 2), ('Ellis, N', 1), ('Enqvist, K', 1),
+                          ('Ibanez, L E', 1)))
+
+    def test_exclude_values(self):
+        """search engine facets - excluded values are not counted"""
+        hitset = intbitset([1, 3, 4, 5])
+        self.assertEqual(count_values_in_postings(hitset, self.postings,
+                                                  ('Ellis, J', 'Ellis, N'), limit=2),
+                         (('Nanopoulos, D V', 3), ('Enqvist, K', 1)))
+
+    def test_limit(self):
+        """search engine facets - most popular values only"""
+        hitset = intbitset(range(1, 100))
+        expected = count_values_in_postings(hitset, self.postings)
+        for limit in range(1, len(expected) + 1):
+            self.assertEqual(count_values_in_postings(hitset, self.postings,
+                                                      limit=limit),
+                             expected[:limit])
+            self.assertEqual(count_values_in_rows(self.rows, limit=limit)[:1],
+                             (('Nanopoulos, D V', 198),))
+
+TEST_SUITE = make_test_suite(TestTagPostings,
+                             TestCountValues)
+
+if __name__ == "__main__":
+    run_test_suite(TEST_SUITE)
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+##
+## This file is part of Invenio.
+## Copyright (C) 2011 CERN.
+##
+## Invenio is free software; you can redistribute it and/or
+## modify it under the terms of the GNU General Public License as
+## published by the Free Software Foundation; either version 2 of the
+## License, or (at your option) any later version.
+##
+## Invenio is distributed in the hope that it will be useful, but
+## WITHOUT ANY WARRANTY; without even the implied warranty of
+## MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+## General Public License for more details.
+##
+## You should have received a copy of the GNU General Public License
+## along with Invenio; if not, write to the Free Software Foundation, Inc.,
+## 59 Temple Place, Suite 330, Boston, MA 02111-1307, USA.
+
+"""
+Benchmarks the printing of pages of search results. Run this module directly
+to time printing the given records against the configured Invenio database in
+each of the given output formats, record by record with print_record() and at
+once with iterate_printed_records():
+
+   $ python search_engine_print_benchmark.py [-f hb,hd,xm] [-l en] [-r 5] [-j] [recid ...]
+
+The records default to the first 25 records of the site. The best of the given
+number of runs is reported for each output format, together with whether both
+ways printed the same records. With -j the results are printed as one JSON
+object per line.
+"""
+
+__revision__ = "$Id$"
+
+import sys
+import time
+import getopt
+import simplejson as json
+
+from invenio.config import CFG_SITE_LANG
+from invenio.search_engine import print_record, iterate_printed_records
+
+FORMATS = ['hb', 'hd', 'xm', 'hx']
+RUNS = 5
+RECIDS = range(1, 26)
+
+def print_one_by_one(recids, of, ln=CFG_SITE_LANG):
+    """Prints the records one after the other with print_record()."""
+    return [print_record(recid, of, ln=ln) for recid in recids]
+
+def print_at_once(recids, of, ln=CFG_SITE_LANG):
+    """Prints the records with iterate_printed_records()."""
+    return list(iterate_printed_records(recids, of, ln=ln))
+
+def time_printing(printer, recids, of, ln=CFG_SITE_LANG, runs=RUNS):
+    """
+    Prints the records the given number of times with the passed printer
+    function. Returns a tuple of the best wall time in seconds and of the
+    printed records.
+    """
+    best = None
+    printed = None
+    for dummy in range(runs):
+        start = time.time()
+        printed = printer(recids, of, ln)
+        elapsed = time.time() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best, printed
+
+def benchmark_formats(recids, formats, ln=CFG_SITE_LANG, runs=RUNS):
+    """
+    Times printing the records in each of the passed output formats one by
+    one and at once. Returns a list of (format, seconds one by one, seconds
+    at once, same records printed) tuples.
+    """
+    results = []
+    for of in formats:
+        # a first printing to fill the caches of BibFormat:
+        print_one_by_one(recids[:1], of, ln)
+        single_time, single_printed = time_printing(print_one_by_one, recids,
+                                                    of, ln, runs)
+        batch_time, batch_printed = time_printing(print_at_once, recids,
+                                                  of, ln, runs)
+        results.append((of, single_time, batch_time,
+                        single_printed == batch_printed))
+    return results
+
+def print_formats(recids, formats, ln=CFG_SITE_LANG, runs=RUNS,
+                  as_json=False):
+    """
+    Runs the benchmark of the passed output formats and prints one line per
+    format, either as table or as JSON objects.
+    """
+    if not as_json:
+        print "%-8s %8s %12s %10s %5s" % ('format', 'records', 'one by one',
+                                          'at once', 'same')
+    for of, single_time, batch_time, same in \
+            benchmark_formats(recids, formats, ln, runs):
+        if as_json:
+            print json.dumps({'format'     : of,
+                              'records'    : len(recids),
+                              'one_by_one' : round(single_time, 6),
+                              'at_once'    : round(batch_time, 6),
+                              'same'       : same})
+        else:
+            print "%-8s %8d %12.4f %10.4f %5s" % (of, len(recids),
+                                                  single_time, batch_time,
+                                                  same)
+        sys.stdout.flush()
+
+def main():
+    """Parses the command line and runs the benchmark."""
+    try:
+        opts, args = getopt.getopt(sys.argv[1:], 'hf:l:r:j',
+                                   ['help', 'formats=', 'ln=', 'runs=',
+                                    'json'])
+        formats = FORMATS
+        ln = CFG_SITE_LANG
+        runs = RUNS
+        as_json = False
+        for opt, value in opts:
+            if opt in ('-h', '--help'):
+                print __doc__
+                return
+            elif opt in ('-f', '--formats'):
+                formats = value.split(',')
+            elif opt in ('-l', '--ln'):
+                ln = value
+            elif opt in ('-r', '--runs'):
+                runs = int(value)
+            elif opt in ('-j', '--json'):
+                as_json = True
+        recids = [int(recid) for recid in args] or RECIDS
+    except (getopt.GetoptError, ValueError), err:
+        sys.stderr.write('%s\n' % err)
+        print __doc__
+        sys.exit(1)
+
+    print_formats(recids, formats, ln, runs, as_json)
+
+if __name__ == '__main__':
+    main()
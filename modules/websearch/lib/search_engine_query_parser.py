@@ -23,6 +23,7 @@
 
 import re
 import string
+import threading
 from datetime import datetime
 
 try:
@@ -36,6 +37,7 @@ except ImportError:
 
 from invenio.bibindex_engine_tokenizer import BibIndexFuzzyNameTokenizer as FNT
 from invenio.logicutils import to_cnf
+from invenio.lrucache import LRUCache
 
 
 NameScanner = FNT()
@@ -70,6 +72,14 @@ class SearchQueryParenthesisedParser(object):
     as words.
     """
 
+    # quoted strings, kept together by tokenize():
+    _re_quotes_match = re.compile(r'(?![\\])(".*?[^\\]")' + r"|(?![\\])('.*?[^\\]')")
+    # words like U(1) or SL(2,Z), whose parentheses are not operators:
+    _re_word_with_parens = re.compile(r'[a-zA-Z0-9_,=:]+\((?P<inside>[a-zA-Z0-9_,+\-./]*)\)')
+    # and within which '+' is part of the word if it is a number sign:
+    _re_numeric_plus = re.compile(r'[.0-9/-]*\+[.0-9/-]*$')
+    _whitespace = ' \t\n\r\x0b\x0c'
+
     def __init__(self, substitution_dict = {'and': '+', 'or': '|', 'not': '-'}):
         self.substitution_dict = substitution_dict
         self.specials = set(['(', ')', '+', '|', '-', '+ -'])
@@ -253,37 +263,53 @@ class SearchQueryParenthesisedParser(object):
             """
             Given string s, return a list of s's tokens.
 
-            Adds space around special punctuation, then splits on whitespace.
+            Splits s on whitespace and around special punctuation, in one
+            pass: ( ) + | are tokens of their own, and so is - at the start
+            of a word, except within '->' and within words like U(1),
+            SL(2,Z) or e(+).
             """
-            s = ' '+s
-            s = s.replace('->', '####DATE###RANGE##OP#') # XXX: Save '->'
-            s = re.sub('(?P<outside>[a-zA-Z0-9_,=:]+)\((?P<inside>[a-zA-Z0-9_,+-/]*)\)',
-                       '#####\g<outside>####PAREN###\g<inside>##PAREN#', s) # XXX: Save U(1) and SL(2,Z)
-            s = re.sub('####PAREN###(?P<content0>[.0-9/-]*)(?P<plus>[+])(?P<content1>[.0-9/-]*)##PAREN#',
-                       '####PAREN###\g<content0>##PLUS##\g<content1>##PAREN#', s)
-            s = re.sub('####PAREN###(?P<content0>([.0-9/]|##PLUS##)*)(?P<minus>[-])' +\
-                                   '(?P<content1>([.0-9/]|##PLUS##)*)##PAREN#',
-                       '####PAREN###\g<content0>##MINUS##\g<content1>##PAREN#', s) # XXX: Save e(+)e(-)
-            for char in self.specials:
-                if char == '-':
-                    s = s.replace(' -', ' - ')
-                    s = s.replace(')-', ') - ')
-                    s = s.replace('-(', ' - (')
+            tokens = []
+            token = ''
+            # is a '-' found here at the start of a word?
+            minus_starts_word = True
+            position = 0
+            while position < len(s):
+                char = s[position]
+                if char == '-' and s[position + 1:position + 2] == '>':
+                    token += '->'
+                    position += 2
+                    minus_starts_word = False
+                    continue
+                match = self._re_word_with_parens.match(s, position)
+                if match and ('+' not in match.group('inside') or \
+                              self._re_numeric_plus.match(match.group('inside'))):
+                    token += match.group()
+                    position = match.end()
+                    minus_starts_word = False
+                    continue
+                if char in self._whitespace:
+                    if token:
+                        tokens.append(token)
+                        token = ''
+                    minus_starts_word = char == ' '
+                elif char in '()+|' or (char == '-' and minus_starts_word):
+                    if token:
+                        tokens.append(token)
+                        token = ''
+                    tokens.append(char)
+                    minus_starts_word = char in '()+'
                 else:
-                    s = s.replace(char, ' '+char+' ')
-            s = re.sub('##PLUS##', '+', s)
-            s = re.sub('##MINUS##', '-', s) # XXX: Restore e(+)e(-)
-            s = re.sub('#####(?P<outside>[a-zA-Z0-9_,=:]+)####PAREN###(?P<inside>[a-zA-Z0-9_,+-/]*)##PAREN#',
-                       '\g<outside>(\g<inside>)', s) # XXX: Restore U(1) and SL(2,Z)
-            s = s.replace('####DATE###RANGE##OP#', '->') # XXX: Restore '->'
-            return s.split()
+                    token += char
+                    minus_starts_word = False
+                position += 1
+            if token:
+                tokens.append(token)
+            return tokens
 
         querytokens = []
         current_position = 0
 
-        re_quotes_match = re.compile(r'(?![\\])(".*?[^\\]")' + r"|(?![\\])('.*?[^\\]')")
-
-        for match in re_quotes_match.finditer(query):
+        for match in self._re_quotes_match.finditer(query):
             match_start = match.start()
             quoted_region = match.group(0).strip()
 
@@ -418,6 +444,13 @@ class SpiresToInvenioSyntaxConverter:
     _DATE_UPDATED_FIELD = 'datemodified:'
     _DATE_FIELD = 'year:'
 
+    # compiled regular expressions of the keywords, see
+    # _compile_keyword_regular_expressions()
+    _re_spires_keywords = None
+    _re_second_order_keywords = None
+    _re_invenio_keywords = None
+    _re_colon_spaces = re.compile(r':\s+')
+
     _A_TAG = 'author:'
     _EA_TAG = 'exactauthor:'
 
@@ -716,6 +749,51 @@ class SpiresToInvenioSyntaxConverter:
         self._re_pattern_space = re.compile("__SPACE__")
         self._re_pattern_equals = re.compile("__EQUALS__")
 
+        # for replacing the SPIRES keywords with Invenio keywords; there are
+        # too many of them for the cache of the re module, so they are
+        # compiled once per process instead of at each replacement
+        if SpiresToInvenioSyntaxConverter._re_invenio_keywords is None:
+            self._compile_keyword_regular_expressions()
+
+    def _compile_keyword_regular_expressions(self):
+        """Compiles the regular expressions of the SPIRES and Invenio
+        keywords, shared by all the instances of the class."""
+
+        re_spires_keywords = {}
+        for spires_keyword in self._SPIRES_TO_INVENIO_KEYWORDS_MATCHINGS:
+            re_spires_keywords[spires_keyword] = \
+                re.compile(r'(?P<operator>(^find|\band|\bor|\bnot|\brefersto|\bcitedby|^)\b[:\s\(]*)' + \
+                           spires_keyword + r'(?P<end>[\s\(]+|$)', re.IGNORECASE)
+        re_second_order_keywords = {}
+        for spires_keyword in self._SECOND_ORDER_KEYWORD_MATCHINGS:
+            re_second_order_keywords[spires_keyword] = \
+                re.compile(r'''(?ix)  # verbose, ignorecase
+                            (?P<operator>
+                                 (^find|\band|\bor|\bnot|\brefersto|\bcitedby|^)\b  # operator preceding our operator
+                                 [:\s\(]*   # trailing colon, spaces, parens, etc. for that operator
+                            )
+                             %s  # the keyword we're searching for
+                            (?P<endorop>
+                                 \s*[a-z]+:|  # either an operator (like author:)
+                                 [\s\(]+|     # or a paren opening
+                                 $            # or the end of the string
+                            )''' % spires_keyword)
+
+        # for standardizing the Invenio keywords already in the query
+        unique_invenio_keywords = set(self._SPIRES_TO_INVENIO_KEYWORDS_MATCHINGS.values()) |\
+                                  set(self._SECOND_ORDER_KEYWORD_MATCHINGS.values())
+        unique_invenio_keywords.remove('') # for the ones that don't have invenio equivalents
+        re_invenio_keywords = []
+        for invenio_keyword in unique_invenio_keywords:
+            re_invenio_keywords.append((invenio_keyword,
+                re.compile("(?<!... \+|... -| and |. or | not |....:)"+invenio_keyword),
+                re.compile("\+"+invenio_keyword),
+                re.compile("-"+invenio_keyword)))
+
+        SpiresToInvenioSyntaxConverter._re_spires_keywords = re_spires_keywords
+        SpiresToInvenioSyntaxConverter._re_second_order_keywords = re_second_order_keywords
+        SpiresToInvenioSyntaxConverter._re_invenio_keywords = re_invenio_keywords
+
     def is_applicable(self, query):
         """Is this converter applicable to this query?
 
@@ -1105,14 +1183,10 @@ class SpiresToInvenioSyntaxConverter:
         """Replaces invenio keywords kw with "and kw" in order to
            parse them correctly further down the line."""
 
-        unique_invenio_keywords = set(self._SPIRES_TO_INVENIO_KEYWORDS_MATCHINGS.values()) |\
-                                  set(self._SECOND_ORDER_KEYWORD_MATCHINGS.values())
-        unique_invenio_keywords.remove('') # for the ones that don't have invenio equivalents
-
-        for invenio_keyword in unique_invenio_keywords:
-            query = re.sub("(?<!... \+|... -| and |. or | not |....:)"+invenio_keyword, "and "+invenio_keyword, query)
-            query = re.sub("\+"+invenio_keyword, "and "+invenio_keyword, query)
-            query = re.sub("-"+invenio_keyword, "and not "+invenio_keyword, query)
+        for invenio_keyword, re_keyword, re_plus_keyword, re_minus_keyword in self._re_invenio_keywords:
+            query = re_keyword.sub("and "+invenio_keyword, query)
+            query = re_plus_keyword.sub("and "+invenio_keyword, query)
+            query = re_minus_keyword.sub("and not "+invenio_keyword, query)
 
         return query
 
@@ -1165,30 +1239,17 @@ class SpiresToInvenioSyntaxConverter:
     def _replace_keyword(self, query, old_keyword, new_keyword):
         """Replaces old keyword in the query with a new keyword"""
 
-        regex_string = r'(?P<operator>(^find|\band|\bor|\bnot|\brefersto|\bcitedby|^)\b[:\s\(]*)' + \
-                       old_keyword + r'(?P<end>[\s\(]+|$)'
-        regular_expression = re.compile(regex_string, re.IGNORECASE)
+        regular_expression = self._re_spires_keywords[old_keyword]
         result = regular_expression.sub(r'\g<operator>' + new_keyword + r'\g<end>', query)
-        result = re.sub(':\s+', ':', result)
+        result = self._re_colon_spaces.sub(':', result)
         return result
 
     def _replace_second_order_keyword(self, query, old_keyword, new_keyword):
         """Replaces old second-order keyword in the query with a new keyword"""
 
-        regular_expression =\
-                re.compile(r'''(?ix)  # verbose, ignorecase
-                            (?P<operator>
-                                 (^find|\band|\bor|\bnot|\brefersto|\bcitedby|^)\b  # operator preceding our operator
-                                 [:\s\(]*   # trailing colon, spaces, parens, etc. for that operator
-                            )
-                             %s  # the keyword we're searching for
-                            (?P<endorop>
-                                 \s*[a-z]+:|  # either an operator (like author:)
-                                 [\s\(]+|     # or a paren opening
-                                 $            # or the end of the string
-                            )''' % old_keyword)
+        regular_expression = self._re_second_order_keywords[old_keyword]
         result = regular_expression.sub(r'\g<operator>' + new_keyword + r'\g<endorop>', query)
-        result = re.sub(':\s+', ':', result)
+        result = self._re_colon_spaces.sub(':', result)
 
         return result
 
@@ -1220,3 +1281,77 @@ class SpiresToInvenioSyntaxConverter:
             query = self._re_second_order_op_no_index_match.sub(create_replacement_pattern, query)
         query = re.sub(r'\s+', ' ', query)
         return query
+
+
+class SearchQueryTranslator:
+    """Memoising front end of SpiresToInvenioSyntaxConverter and
+    SearchQueryParenthesisedParser.
+
+    Remembers the translations of the last max_entries raw queries, and
+    forgets the least recently used ones first.  SPIRES translations are
+    remembered for the day only, since relative dates like 'yesterday'
+    are translated to absolute ones.  Safe to use from several threads.
+    """
+
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self.converter = SpiresToInvenioSyntaxConverter()
+        self.lock = threading.Lock()
+        self.clear()
+
+    def clear(self):
+        """Forget all the translations."""
+        self.translations = LRUCache(self.max_entries)
+
+    def __len__(self):
+        return len(self.translations)
+
+    def _get(self, key):
+        """Return the translation of key, or None if not known."""
+        self.lock.acquire()
+        try:
+            return self.translations.get(key)
+        finally:
+            self.lock.release()
+
+    def _set(self, key, value):
+        """Remember the translation of key, forgetting the least recently
+        used one if there are too many."""
+        if not self.max_entries:
+            return
+        self.lock.acquire()
+        try:
+            if key not in self.translations:
+                self.translations.set(key, value)
+        finally:
+            self.lock.release()
+
+    def convert_query(self, query):
+        """Return the (SPIRES syntax p, Invenio syntax query) pair, where
+        SPIRES syntax p tells whether query is in SPIRES syntax, in which
+        case it is converted to Invenio syntax."""
+        key = ('convert', query, datetime.today().date())
+        translation = self._get(key)
+        if translation is None:
+            if self.converter.is_applicable(query):
+                translation = (True, self.converter.convert_query(query))
+            else:
+                translation = (False, query)
+            self._set(key, translation)
+        return translation
+
+    def parse_query(self, query):
+        """Return SearchQueryParenthesisedParser().parse_query(query),
+        raising the same SyntaxError if the query cannot be parsed."""
+        key = ('parse', query)
+        translation = self._get(key)
+        if translation is None:
+            try:
+                translation = (SearchQueryParenthesisedParser().parse_query(query), None)
+            except SyntaxError, err:
+                translation = (None, err)
+            self._set(key, translation)
+        parsed_query, err = translation
+        if err is not None:
+            raise err
+        return list(parsed_query)
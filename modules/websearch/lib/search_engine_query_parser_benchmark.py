@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+##
+## This file is part of Invenio.
+## Copyright (C) 2011 CERN.
+##
+## Invenio is free software; you can redistribute it and/or
+## modify it under the terms of the GNU General Public License as
+## published by the Free Software Foundation; either version 2 of the
+## License, or (at your option) any later version.
+##
+## Invenio is distributed in the hope that it will be useful, but
+## WITHOUT ANY WARRANTY; without even the implied warranty of
+## MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+## General Public License for more details.
+##
+## You should have received a copy of the GNU General Public License
+## along with Invenio; if not, write to the Free Software Foundation, Inc.,
+## 59 Temple Place, Suite 330, Boston, MA 02111-1307, USA.
+
+"""
+Micro-benchmark of the Invenio search query parsers. Run this module directly
+to time the translation of a corpus of INSPIRE-style queries - SPIRES syntax
+conversion and parenthesised parsing, as search_pattern_parenthesised() does
+it - once without and once with the memoising SearchQueryTranslator:
+
+   $ python search_engine_query_parser_benchmark.py [-n 1000] [-j] [file]
+
+The queries are read one per line from the given file, or else taken from a
+built-in corpus. Each query is translated the given number of times; the mean
+time per query is reported. No database is needed.
+"""
+
+__revision__ = "$Id$"
+
+import sys
+import time
+import getopt
+import simplejson as json
+
+from invenio.search_engine_query_parser import SearchQueryParenthesisedParser, \
+     SpiresToInvenioSyntaxConverter, SearchQueryTranslator
+
+REPEATS = 1000
+QUERIES = ['find a ellis, j and t muon',
+           'find a ellis and date > 2005',
+           'find t quark and (a witten or a maldacena)',
+           'find j phys.rev.lett.,105,* and t higgs',
+           'find eprint arxiv:1007.5048',
+           'find topcite 500+ and date after 2010',
+           'find refersto:recid:1234 and a parke, s j',
+           'find exactauthor j.r.ellis.1 and t supersymmetry',
+           'find k "lattice qcd" and not t review',
+           'find date yesterday and a smith',
+           'f a hawking, s w and t black hole and date before 1980',
+           'author:"Ellis, J" (muon or kaon) and year:2010',
+           'title:U(1) and (title:SL(2,Z) or title:e(+)e(-))',
+           'ellis and (kaluza-klein or r-parity)',
+           '(title:muon or title:kaon) not (author:ellis or author:witten)',
+           'higgs boson',
+           'refersto:recid:12345']
+
+def translate(converter, parser, query):
+    """Translates the query as search_pattern_parenthesised() does."""
+    if converter.is_applicable(query):
+        query = converter.convert_query(query)
+    if '(' in query or ')' in query:
+        try:
+            parser.parse_query(query)
+        except SyntaxError:
+            pass
+
+def translate_uncached(query):
+    """Translates the query with a new converter and parser, without
+       memoisation, as search_pattern_parenthesised() used to do."""
+    translate(SpiresToInvenioSyntaxConverter(),
+              SearchQueryParenthesisedParser(), query)
+
+def translate_cached(translator, query):
+    """Translates the query with the memoising translator."""
+    dummy, query = translator.convert_query(query)
+    if '(' in query or ')' in query:
+        try:
+            translator.parse_query(query)
+        except SyntaxError:
+            pass
+
+def time_per_query(function, args, repeats):
+    """Returns the mean time in seconds of function(*args)."""
+    start = time.time()
+    for dummy in xrange(repeats):
+        function(*args)
+    return (time.time() - start) / repeats
+
+def benchmark_queries(queries, repeats=REPEATS):
+    """
+    Times the translation of each of the passed queries without and with
+    memoisation. Returns a list of (query, uncached seconds, cached seconds)
+    tuples.
+    """
+    translator = SearchQueryTranslator(len(queries))
+    results = []
+    for query in queries:
+        uncached = time_per_query(translate_uncached, (query,), repeats)
+        translate_cached(translator, query)
+        cached = time_per_query(translate_cached, (translator, query), repeats)
+        results.append((query, uncached, cached))
+    return results
+
+def print_queries(queries, repeats=REPEATS, as_json=False):
+    """
+    Runs the benchmark of the passed queries and prints one line per query
+    and a total, either as table or as JSON objects.
+    """
+    if not as_json:
+        print "%-60s %12s %12s" % ('query', 'uncached us', 'cached us')
+    total_uncached = total_cached = 0.0
+    for query, uncached, cached in benchmark_queries(queries, repeats):
+        total_uncached += uncached
+        total_cached += cached
+        if as_json:
+            print json.dumps({'query'    : query,
+                              'uncached' : round(uncached, 9),
+                              'cached'   : round(cached, 9)})
+        else:
+            print "%-60s %12.1f %12.1f" % (query[:60], uncached * 1e6,
+                                           cached * 1e6)
+    if not as_json and queries:
+        print "%-60s %12.1f %12.1f" % ('mean per query',
+                                       total_uncached / len(queries) * 1e6,
+                                       total_cached / len(queries) * 1e6)
+
+def main():
+    """Parses the command line and runs the benchmark."""
+    try:
+        opts, args = getopt.getopt(sys.argv[1:], 'hn:j',
+                                   ['help', 'repeats=', 'json'])
+        repeats = REPEATS
+        as_json = False
+        for opt, value in opts:
+            if opt in ('-h', '--help'):
+                print __doc__
+                return
+            elif opt in ('-n', '--repeats'):
+                repeats = int(value)
+            elif opt in ('-j', '--json'):
+                as_json = True
+    except (getopt.GetoptError, ValueError), err:
+        sys.stderr.write('%s\n' % err)
+        print __doc__
+        sys.exit(1)
+
+    queries = QUERIES
+    if args:
+        queries = [line.strip() for line in open(args[0]) if line.strip()]
+    print_queries(queries, repeats, as_json)
+
+if __name__ == '__main__':
+    main()
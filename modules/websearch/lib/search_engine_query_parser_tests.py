@@ -953,9 +953,49 @@ class TestSpiresToInvenioSyntaxConverter(unittest.TestCase):
         inv_search = "author:ellis and not title:hadronic and not title:collisions"
         self._compare_searches(inv_search, inv_search)
 
+class TestSearchQueryTranslator(unittest.TestCase):
+    """Test the memoised translation of queries."""
+
+    def setUp(self):
+        self.translator = search_engine_query_parser.SearchQueryTranslator(2)
+
+    def test_same_translations(self):
+        """SearchQueryTranslator - same results as the parser and converter"""
+        parser = search_engine_query_parser.SearchQueryParenthesisedParser()
+        converter = search_engine_query_parser.SpiresToInvenioSyntaxConverter()
+        for query in ('find a ellis and t muon', 'author:ellis (muon or kaon)'):
+            for dummy in range(2):
+                self.assertEqual(self.translator.convert_query(query),
+                                 (converter.is_applicable(query),
+                                  converter.convert_query(query)))
+                self.assertEqual(self.translator.parse_query(query),
+                                 parser.parse_query(query))
+
+    def test_syntax_error(self):
+        """SearchQueryTranslator - parse errors raised again"""
+        for dummy in range(2):
+            self.assertRaises(SyntaxError, self.translator.parse_query,
+                              '(expr1 or expr2')
+
+    def test_least_recently_used(self):
+        """SearchQueryTranslator - least recently used queries forgotten"""
+        self.translator.parse_query('a (b)')
+        self.translator.parse_query('c (d)')
+        self.translator.parse_query('a (b)')
+        self.translator.parse_query('e (f)')
+        self.assertEqual(len(self.translator), 2)
+        self.failUnless(('parse', 'a (b)') in self.translator.translations)
+        self.failIf(('parse', 'c (d)') in self.translator.translations)
+
+    def test_copies(self):
+        """SearchQueryTranslator - remembered parses not altered by callers"""
+        self.translator.parse_query('a (b)').append('c')
+        self.assertEqual(self.translator.parse_query('a (b)'), ['+', 'a', '+', 'b'])
+
 TEST_SUITE = make_test_suite(TestSearchQueryParenthesisedParser,
                              TestSpiresToInvenioSyntaxConverter,
-                             TestParserUtilityFunctions)
+                             TestParserUtilityFunctions,
+                             TestSearchQueryTranslator)
 
 if __name__ == "__main__":
     run_test_suite(TEST_SUITE)
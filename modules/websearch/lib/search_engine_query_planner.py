@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+
+## This file is part of Invenio.
+## Copyright (C) 2011 CERN.
+##
+## Invenio is free software; you can redistribute it and/or
+## modify it under the terms of the GNU General Public License as
+## published by the Free Software Foundation; either version 2 of the
+## License, or (at your option) any later version.
+##
+## Invenio is distributed in the hope that it will be useful, but
+## WITHOUT ANY WARRANTY; without even the implied warranty of
+## MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+## General Public License for more details.
+##
+## You should have received a copy of the GNU General Public License
+## along with Invenio; if not, write to the Free Software Foundation, Inc.,
+## 59 Temple Place, Suite 330, Boston, MA 02111-1307, USA.
+
+"""Invenio search query planner.
+
+Decides in which order search_pattern() evaluates the basic search
+units of a query, so that the most selective units come first and the
+evaluation can stop as soon as the intermediate result is empty.  The
+planner remembers the basic search units of the queries it has seen
+and the number of hits of their units, which serve as term statistics
+for later queries.
+"""
+
+__revision__ = "$Id$"
+
+import sys
+import threading
+
+from invenio.data_cacher import IntervalDataCacher
+from invenio.dbquery import get_table_update_time
+from invenio.lrucache import LRUCache
+
+# estimated sizes of the search units whose number of hits is unknown:
+UNKNOWN_UNIT_SIZE = sys.maxint - 1
+GENERIC_UNIT_SIZE = sys.maxint # wildcard, substring, regexp, range
+
+def get_search_plan_timestamp():
+    """Return the last update time of the tables the search units and
+       their number of hits depend on, i.e. the indexes and the fields."""
+    return max(get_table_update_time('idx%'),
+               get_table_update_time('field%'))
+
+def is_generic_search_unit(unit):
+    """Tell whether the basic search unit (operator, pattern, field,
+       type) is likely to match many records, e.g. a wildcard query."""
+    pattern, unit_type = unit[1], unit[3]
+    return unit_type == 'r' or '*' in pattern or '%' in pattern or \
+           '->' in pattern
+
+def plan_search_units(units, estimate):
+    """Return the evaluation plan of the basic search units 'units'.
+
+       The plan is a list of steps, each one being a list of indexes
+       into 'units'.  A step starts either with the first unit or with
+       a unit of another operator than '+' and '-', e.g. an OR unit,
+       that keeps its place; its other units are intersected ('+')
+       with or subtracted ('-') from the result in any order, hence
+       they are sorted by their estimated size, as given by the
+       function 'estimate', the intersections first.
+    """
+    plan = []
+    for idx_unit in xrange(len(units)):
+        operator = units[idx_unit][0]
+        if not plan or operator not in ('+', '-'):
+            plan.append([idx_unit])
+        else:
+            plan[-1].append(idx_unit)
+    for step in plan:
+        if units[step[0]][0] in ('+', '-'):
+            start = 0
+        else:
+            start = 1
+        decorated = []
+        for idx_unit in step[start:]:
+            decorated.append((units[idx_unit][0] != '+',
+                              estimate(units[idx_unit]), idx_unit))
+        decorated.sort()
+        step[start:] = [idx_unit for dummy1, dummy2, idx_unit in decorated]
+    return plan
+
+class SearchQueryPlanner:
+    """
+    Memory of the basic search units of queries and of the number of
+    hits of basic search units, per process.  Both are forgotten when
+    the indexes or the fields are updated, as told by
+    timestamp_verifier, which is called at most every check_interval
+    seconds.  Each one remembers at most max_entries queries or units,
+    and forgets the least recently used ones first.  Safe to use from
+    several threads.
+    """
+    def __init__(self, max_entries,
+                 timestamp_verifier=get_search_plan_timestamp,
+                 check_interval=10):
+        self.max_entries = max_entries
+        self.lock = threading.Lock()
+        # the (units by query, sizes by unit) pair, forgotten on updates:
+        self.memory = IntervalDataCacher(lambda: (LRUCache(max_entries),
+                                                  LRUCache(max_entries)),
+                                         timestamp_verifier, check_interval)
+
+    def clear(self):
+        """Forget all the queries and the numbers of hits."""
+        self.memory.create_cache()
+
+    def get_search_units(self, key):
+        """Return the (basic search units, warnings) pair of the
+           normalised query 'key' or None if it is not known."""
+        self.memory.recreate_cache_if_needed()
+        self.lock.acquire()
+        try:
+            return self.memory.cache[0].get(key)
+        finally:
+            self.lock.release()
+
+    def set_search_units(self, key, units, warnings):
+        """Remember the basic search units of the normalised query 'key'
+           and the warnings their creation printed."""
+        if not self.max_entries:
+            return
+        self.lock.acquire()
+        try:
+            self.memory.cache[0].set(key, (units, warnings))
+        finally:
+            self.lock.release()
+
+    def set_search_unit_size(self, unit, wl, size):
+        """Remember the number of hits of the basic search unit 'unit'
+           searched with the wildcard limit 'wl'."""
+        if not self.max_entries:
+            return
+        self.lock.acquire()
+        try:
+            self.memory.cache[1].set((unit[1], unit[2], unit[3], wl), size)
+        finally:
+            self.lock.release()
+
+    def estimate_search_unit_size(self, unit, wl):
+        """Return the estimated number of hits of the basic search unit
+           'unit' searched with the wildcard limit 'wl'."""
+        self.lock.acquire()
+        try:
+            size = self.memory.cache[1].get((unit[1], unit[2], unit[3], wl))
+        finally:
+            self.lock.release()
+        if size is not None:
+            return size
+        if is_generic_search_unit(unit):
+            return GENERIC_UNIT_SIZE
+        return UNKNOWN_UNIT_SIZE
+
+    def plan(self, units, wl):
+        """Return the evaluation plan of the basic search units, see
+           plan_search_units()."""
+        return plan_search_units(units,
+                                 lambda unit: self.estimate_search_unit_size(unit, wl))
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+##
+## This file is part of Invenio.
+## Copyright (C) 2011 CERN.
+##
+## Invenio is free software; you can redistribute it and/or
+## modify it under the terms of the GNU General Public License as
+## published by the Free Software Foundation; either version 2 of the
+## License, or (at your option) any later version.
+##
+## Invenio is distributed in the hope that it will be useful, but
+## WITHOUT ANY WARRANTY; without even the implied warranty of
+## MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+## General Public License for more details.
+##
+## You should have received a copy of the GNU General Public License
+## along with Invenio; if not, write to the Free Software Foundation, Inc.,
+## 59 Temple Place, Suite 330, Boston, MA 02111-1307, USA.
+
+"""Unit tests for the search query planner."""
+
+__revision__ = "$Id$"
+
+import unittest
+
+from invenio.search_engine_query_planner import SearchQueryPlanner, \
+     plan_search_units, GENERIC_UNIT_SIZE, UNKNOWN_UNIT_SIZE
+from invenio.testutils import make_test_suite, run_test_suite
+
+class TestPlanSearchUnits(unittest.TestCase):
+    """Test the evaluation order of basic search units."""
+
+    def test_intersections_by_size(self):
+        """search query planner - most selective units searched first"""
+        units = [['+', 'a', '', 'w'], ['+', 'b', '', 'w'],
+                 ['-', 'c', '', 'w'], ['+', 'd', '', 'w']]
+        sizes = {'a': 30, 'b': 10, 'c': 1, 'd': 20}
+        self.assertEqual(plan_search_units(units, lambda unit: sizes[unit[1]]),
+                         [[1, 3, 0, 2]])
+
+    def test_or_units_keep_their_place(self):
+        """search query planner - OR units start a new step"""
+        units = [['+', 'a', '', 'w'], ['+', 'b', '', 'w'],
+                 ['|', 'c', '', 'w'], ['+', 'd', '', 'w'],
+                 ['+', 'e', '', 'w']]
+        sizes = {'a': 30, 'b': 10, 'c': 1, 'd': 20, 'e': 5}
+        self.assertEqual(plan_search_units(units, lambda unit: sizes[unit[1]]),
+                         [[1, 0], [2, 4, 3]])
+
+    def test_equal_sizes_keep_order(self):
+        """search query planner - units of equal size keep their order"""
+        units = [['+', 'a', '', 'w'], ['+', 'b', '', 'w'], ['+', 'c', '', 'w']]
+        self.assertEqual(plan_search_units(units, lambda unit: 0),
+                         [[0, 1, 2]])
+        self.assertEqual(plan_search_units([], lambda unit: 0), [])
+
+class TestSearchQueryPlanner(unittest.TestCase):
+    """Test the memory of the search query planner."""
+
+    def setUp(self):
+        self.timestamp = '2011-01-01 00:00:00'
+        self.planner = SearchQueryPlanner(2,
+                                          timestamp_verifier=lambda: self.timestamp,
+                                          check_interval=0)
+
+    def test_estimates(self):
+        """search query planner - known sizes preferred to guesses"""
+        unit = ['+', 'muon', 'title', 'w']
+        self.assertEqual(self.planner.estimate_search_unit_size(unit, 0),
+                         UNKNOWN_UNIT_SIZE)
+        self.assertEqual(self.planner.estimate_search_unit_size(['+', 'muon*', '', 'w'], 0),
+                         GENERIC_UNIT_SIZE)
+        self.planner.set_search_unit_size(unit, 0, 12)
+        self.assertEqual(self.planner.estimate_search_unit_size(unit, 0), 12)
+        self.assertEqual(self.planner.estimate_search_unit_size(unit, 100),
+                         UNKNOWN_UNIT_SIZE)
+        self.assertEqual(self.planner.plan([['+', 'muon*', '', 'w'],
+                                            ['+', 'kaon', '', 'w'], unit], 0),
+                         [[2, 1, 0]])
+
+    def test_search_units(self):
+        """search query planner - search units remembered per query"""
+        key = ('ellis muon', '', '', True)
+        self.assertEqual(self.planner.get_search_units(key), None)
+        self.planner.set_search_units(key, [['+', 'ellis', '', 'w']], 'warning')
+        self.assertEqual(self.planner.get_search_units(key),
+                         ([['+', 'ellis', '', 'w']], 'warning'))
+
+    def test_forget(self):
+        """search query planner - everything forgotten on index updates"""
+        unit = ['+', 'muon', 'title', 'w']
+        self.planner.set_search_unit_size(unit, 0, 12)
+        self.planner.set_search_units('q', [unit], '')
+        self.assertEqual(self.planner.get_search_units('q'), ([unit], ''))
+        self.timestamp = '2011-01-02 00:00:00'
+        self.assertEqual(self.planner.get_search_units('q'), None)
+        self.assertEqual(self.planner.estimate_search_unit_size(unit, 0),
+                         UNKNOWN_UNIT_SIZE)
+
+    def test_size_limit(self):
+        """search query planner - memory bounded by the number of entries"""
+        for query in ('q0', 'q1', 'q2'):
+            self.planner.set_search_units(query, [], '')
+        self.assertEqual(self.planner.get_search_units('q0'), None)
+        self.assertEqual(self.planner.get_search_units('q2'), ([], ''))
+        self.assertEqual(self.planner.get_search_units('q1'), ([], ''))
+
+    def test_least_recently_used_forgotten(self):
+        """search query planner - least recently used entries forgotten"""
+        units = [['+', 'muon', '', 'w'], ['+', 'kaon', '', 'w'],
+                 ['+', 'pion', '', 'w']]
+        self.planner.set_search_unit_size(units[0], 0, 1)
+        self.planner.set_search_unit_size(units[1], 0, 2)
+        self.planner.estimate_search_unit_size(units[0], 0)
+        self.planner.set_search_unit_size(units[2], 0, 3)
+        self.assertEqual([self.planner.estimate_search_unit_size(unit, 0)
+                          for unit in units], [1, UNKNOWN_UNIT_SIZE, 3])
+
+TEST_SUITE = make_test_suite(TestPlanSearchUnits,
+                             TestSearchQueryPlanner)
+
+if __name__ == "__main__":
+    run_test_suite(TEST_SUITE)
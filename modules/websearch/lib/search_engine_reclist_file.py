@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+
+## This file is part of Invenio.
+## Copyright (C) 2011 CERN.
+##
+## Invenio is free software; you can redistribute it and/or
+## modify it under the terms of the GNU General Public License as
+## published by the Free Software Foundation; either version 2 of the
+## License, or (at your option) any later version.
+##
+## Invenio is distributed in the hope that it will be useful, but
+## WITHOUT ANY WARRANTY; without even the implied warranty of
+## MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+## General Public License for more details.
+##
+## You should have received a copy of the GNU General Public License
+## along with Invenio; if not, write to the Free Software Foundation, Inc.,
+## 59 Temple Place, Suite 330, Boston, MA 02111-1307, USA.
+
+"""Invenio collection reclist file.
+
+Webcoll exports the reclists of all the collections into one file, that
+the search engine processes map into memory read-only, instead of each
+of them querying the collection table for the reclists they need.  The
+file pages are thus read once and shared by all the processes.
+
+The file starts with a magic string and the offset of its index,
+followed by the reclists and by the index, which is the marshalled
+(timestamp, {collection name: (offset, length)}) pair.  The timestamp
+is the update time of the collection table the reclists were read at,
+so that an outdated file is not used.  The reclists are intbitset
+container dumps, aligned on 8 bytes, so that the reclist hitsets share
+the mapped pages instead of copying them.
+"""
+
+__revision__ = "$Id$"
+
+import os
+import marshal
+import struct
+
+from invenio.config import CFG_CACHEDIR
+from invenio.intbitset import intbitset, intbitset_file
+
+# CFG_RECLIST_FILE -- location of the collection reclist file:
+CFG_RECLIST_FILE = "%s/collections/reclists" % CFG_CACHEDIR
+
+RECLIST_FILE_MAGIC = 'INVRECL2'
+RECLIST_FILE_HEADER = '>8sQ'
+RECLIST_ALIGNMENT = 8
+
+def write_reclist_file(path, timestamp, collections, get_reclist):
+    """Write the reclist file PATH, with the reclists of the
+       COLLECTIONS given by GET_RECLIST(name) as fastdump strings, that
+       are stored as container dumps, and the TIMESTAMP they correspond
+       to.  The file is replaced
+       atomically, so that no process maps it half written."""
+    tmp_path = "%s.%d.tmp" % (path, os.getpid())
+    out = open(tmp_path, 'wb')
+    try:
+        out.write(struct.pack(RECLIST_FILE_HEADER, RECLIST_FILE_MAGIC, 0))
+        offset = struct.calcsize(RECLIST_FILE_HEADER)
+        index = {}
+        for name in collections:
+            reclist = get_reclist(name) or ''
+            if reclist:
+                try:
+                    reclist = intbitset(reclist).fastdump(containers=True)
+                except ValueError:
+                    # corrupted reclist, read as empty
+                    reclist = ''
+            padding = -len(reclist) % RECLIST_ALIGNMENT
+            out.write(reclist + '\0' * padding)
+            index[name] = (offset, len(reclist))
+            offset += len(reclist) + padding
+        out.write(marshal.dumps((timestamp, index)))
+        out.seek(0)
+        out.write(struct.pack(RECLIST_FILE_HEADER, RECLIST_FILE_MAGIC, offset))
+    finally:
+        out.close()
+    os.rename(tmp_path, path)
+
+class RecListFile:
+    """
+    Reclist file mapped into memory read-only, through an
+    intbitset_file, so that the map stays valid as long as reclist
+    hitsets read from it are in use.
+    """
+    def __init__(self, path):
+        self.map = intbitset_file(path)
+        header_size = struct.calcsize(RECLIST_FILE_HEADER)
+        magic, index_offset = struct.unpack(RECLIST_FILE_HEADER,
+                                            self.map.read(0, header_size))
+        if magic != RECLIST_FILE_MAGIC or not index_offset:
+            raise ValueError("%s is not a reclist file" % path)
+        self.timestamp, self.index = marshal.loads(
+            self.map.read(index_offset, len(self.map) - index_offset))
+
+    def get_reclist(self, name):
+        """Return the reclist hitset of collection NAME, or None if the
+           collection is not in the file."""
+        if not self.index.has_key(name):
+            return None
+        offset, length = self.index[name]
+        if not length:
+            return intbitset()
+        try:
+            return self.map.load(offset, length)
+        except ValueError:
+            # corrupted reclist, as in the collection table
+            return intbitset()
+
+def open_reclist_file(timestamp, path=CFG_RECLIST_FILE):
+    """Return the RecListFile object of PATH if the file exists and its
+       reclists correspond to TIMESTAMP, None otherwise."""
+    try:
+        reclist_file = RecListFile(path)
+    except Exception:
+        # no file, or not a valid one
+        return None
+    if reclist_file.timestamp != timestamp:
+        return None
+    return reclist_file
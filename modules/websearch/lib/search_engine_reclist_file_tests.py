@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+##
+## This file is part of Invenio.
+## Copyright (C) 2011 CERN.
+##
+## Invenio is free software; you can redistribute it and/or
+## modify it under the terms of the GNU General Public License as
+## published by the Free Software Foundation; either version 2 of the
+## License, or (at your option) any later version.
+##
+## Invenio is distributed in the hope that it will be useful, but
+## WITHOUT ANY WARRANTY; without even the implied warranty of
+## MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+## General Public License for more details.
+##
+## You should have received a copy of the GNU General Public License
+## along with Invenio; if not, write to the Free Software Foundation, Inc.,
+## 59 Temple Place, Suite 330, Boston, MA 02111-1307, USA.
+
+"""Unit tests for the collection reclist file."""
+
+__revision__ = "$Id$"
+
+import os
+import tempfile
+import unittest
+
+from invenio.intbitset import intbitset
+from invenio.search_engine_reclist_file import write_reclist_file, \
+     open_reclist_file
+from invenio.testutils import make_test_suite, run_test_suite
+
+TIMESTAMP = '2011-11-11 11:11:11'
+
+class TestRecListFile(unittest.TestCase):
+    """Test exporting and mapping collection reclists."""
+
+    def setUp(self):
+        self.path = tempfile.mktemp()
+        self.reclists = {'Articles': intbitset(range(1, 100, 3)).fastdump(),
+                         'Books': intbitset([5, 7000]).fastdump(),
+                         'Empty': None}
+        write_reclist_file(self.path, TIMESTAMP,
+                           ['Articles', 'Books', 'Empty'],
+                           self.reclists.get)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_reclists(self):
+        """reclist file - reclists read back"""
+        reclist_file = open_reclist_file(TIMESTAMP, self.path)
+        self.assertEqual(reclist_file.get_reclist('Articles'),
+                         intbitset(range(1, 100, 3)))
+        self.assertEqual(reclist_file.get_reclist('Books'),
+                         intbitset([5, 7000]))
+        self.assertEqual(reclist_file.get_reclist('Empty'), intbitset())
+        self.assertEqual(reclist_file.get_reclist('Theses'), None)
+
+    def test_shared_reclists(self):
+        """reclist file - reclists aligned and copied on write"""
+        reclist_file = open_reclist_file(TIMESTAMP, self.path)
+        for offset, dummy in reclist_file.index.values():
+            self.assertEqual(offset % 8, 0)
+        reclist = reclist_file.get_reclist('Articles')
+        reclist.add(2)
+        reclist -= intbitset([1])
+        self.assertEqual(reclist_file.get_reclist('Articles'),
+                         intbitset(range(1, 100, 3)))
+
+    def test_outdated_file(self):
+        """reclist file - outdated or missing files not used"""
+        self.assertEqual(open_reclist_file('2011-11-11 11:11:12', self.path),
+                         None)
+        self.assertEqual(open_reclist_file(TIMESTAMP, self.path + '.missing'),
+                         None)
+
+    def test_replaced_file(self):
+        """reclist file - mapped file kept when replaced"""
+        reclist_file = open_reclist_file(TIMESTAMP, self.path)
+        write_reclist_file(self.path, TIMESTAMP, ['Books'],
+                           lambda name: intbitset([1]).fastdump())
+        self.assertEqual(reclist_file.get_reclist('Books'),
+                         intbitset([5, 7000]))
+        self.assertEqual(open_reclist_file(TIMESTAMP, self.path).get_reclist('Books'),
+                         intbitset([1]))
+
+TEST_SUITE = make_test_suite(TestRecListFile)
+
+if __name__ == "__main__":
+    run_test_suite(TEST_SUITE)
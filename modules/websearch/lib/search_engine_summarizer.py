@@ -26,8 +26,11 @@ __lastupdated__ = """$Date$"""
 
 __revision__ = "$Id$"
 
+from bisect import bisect_left, bisect_right
+
 from invenio.config import CFG_INSPIRE_SITE
-from invenio.bibrank_citation_searcher import get_cited_by_list
+from invenio.bibrank_citation_searcher import get_cited_by_list, \
+     get_cited_by_counts
 import search_engine
 import invenio.template
 websearch_templates = invenio.template.load('websearch')
@@ -53,6 +56,30 @@ CFG_CITESUMMARY_FAME_THRESHOLDS = [
                                    (0, 0, 'Unknown papers (0)')
                                    ]
 
+def get_sorted_citation_counts(recids):
+    """Return the sorted list of the numbers of citations of the
+       records RECIDS."""
+    citecounts = get_cited_by_counts(recids)
+    citecounts.sort()
+    return citecounts
+
+def count_records_by_citations(sorted_citecounts, low, high):
+    """Return the number of records cited between LOW and HIGH times,
+       given the sorted list of their numbers of citations."""
+    return bisect_right(sorted_citecounts, high) - \
+           bisect_left(sorted_citecounts, low)
+
+def calculate_h_index(sorted_citecounts):
+    """Return the h-index of records, i.e. the largest number h such
+       that h records are cited at least h times each, given the sorted
+       list of their numbers of citations."""
+    nb_records = len(sorted_citecounts)
+    h_index = 0
+    while h_index < nb_records and \
+          sorted_citecounts[nb_records - h_index - 1] > h_index:
+        h_index += 1
+    return h_index
+
 def summarize_records(recids, of, ln, searchpattern="", searchfield="", req=None):
     """Write summary report for records RECIDS in the format OF in language LN.
        SEARCHPATTERN and SEARCHFIELD are search query that led to RECIDS,
@@ -80,19 +107,13 @@ def summarize_records(recids, of, ln, searchpattern="", searchfield="", req=None
             req.write(prologue)
 
         # 2) hcs overview:
-        d_recid_citers = {}
+        d_citecounts = {}
         d_total_cites = {}
         d_avg_cites = {}
-        d_recid_citecount_l = {}
         for coll, colldef in CFG_CITESUMMARY_COLLECTIONS:
-            d_total_cites[coll] = 0
+            d_citecounts[coll] = get_sorted_citation_counts(d_recids[coll])
+            d_total_cites[coll] = sum(d_citecounts[coll])
             d_avg_cites[coll] = 0
-            d_recid_citecount_l[coll] = []
-            d_recid_citers[coll] =  get_cited_by_list(d_recids[coll])
-            for recid, lciters in d_recid_citers[coll]:
-                if lciters:
-                    d_total_cites[coll] += len(lciters)
-                    d_recid_citecount_l[coll].append((recid, len(lciters)))
             if d_total_cites[coll] != 0:
                 d_avg_cites[coll] = d_total_cites[coll] * 1.0 / d_total_recs[coll]
         overview = websearch_templates.tmpl_citesummary_overview(d_total_cites, d_avg_cites, CFG_CITESUMMARY_COLLECTIONS, ln)
@@ -106,13 +127,7 @@ def summarize_records(recids, of, ln, searchpattern="", searchfield="", req=None
         for low, high, fame in CFG_CITESUMMARY_FAME_THRESHOLDS:
             d_cites = {}
             for coll, colldef in CFG_CITESUMMARY_COLLECTIONS:
-                d_cites[coll] = 0
-                for recid, lciters in d_recid_citers[coll]:
-                    numcites = 0
-                    if lciters:
-                        numcites = len(lciters)
-                    if numcites >= low and numcites <= high:
-                        d_cites[coll] += 1
+                d_cites[coll] = count_records_by_citations(d_citecounts[coll], low, high)
             fame_info = websearch_templates.tmpl_citesummary_breakdown_by_fame(d_cites, low, high, fame, CFG_CITESUMMARY_COLLECTIONS, searchpattern, searchfield, ln)
 
             if not req:
@@ -122,21 +137,8 @@ def summarize_records(recids, of, ln, searchpattern="", searchfield="", req=None
 
         # 4) hcs calculate h index
         d_h_factors = {}
-        def comparator(x, y):
-            if x[1] > y[1]:
-                return -1
-            elif x[1] == y[1]:
-                return 0
-            else: return +1
         for coll, colldef in CFG_CITESUMMARY_COLLECTIONS:
-            d_h_factors[coll] = 0
-            d_recid_citecount_l[coll].sort(cmp=comparator)
-            #req.write(repr(d_recid_citecount_l[coll])) # DEBUG
-            for citecount in d_recid_citecount_l[coll]:
-                d_h_factors[coll] += 1
-                if d_h_factors[coll] > citecount[1]:
-                    d_h_factors[coll] -= 1
-                    break
+            d_h_factors[coll] = calculate_h_index(d_citecounts[coll])
         h_idx = websearch_templates.tmpl_citesummary_h_index(d_h_factors, CFG_CITESUMMARY_COLLECTIONS, ln)
 
         if not req:
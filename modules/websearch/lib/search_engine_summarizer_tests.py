@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+##
+## This file is part of Invenio.
+## Copyright (C) 2011 CERN.
+##
+## Invenio is free software; you can redistribute it and/or
+## modify it under the terms of the GNU General Public License as
+## published by the Free Software Foundation; either version 2 of the
+## License, or (at your option) any later version.
+##
+## Invenio is distributed in the hope that it will be useful, but
+## WITHOUT ANY WARRANTY; without even the implied warranty of
+## MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+## General Public License for more details.
+##
+## You should have received a copy of the GNU General Public License
+## along with Invenio; if not, write to the Free Software Foundation, Inc.,
+## 59 Temple Place, Suite 330, Boston, MA 02111-1307, USA.
+
+"""Unit tests for the search engine summarizer."""
+
+__revision__ = "$Id$"
+
+import unittest
+
+from invenio.search_engine_summarizer import calculate_h_index, \
+     count_records_by_citations, CFG_CITESUMMARY_FAME_THRESHOLDS
+from invenio.testutils import make_test_suite, run_test_suite
+
+class TestCitationSummaryCounts(unittest.TestCase):
+    """Test the sections of the citation summary."""
+
+    def test_h_index_empty(self):
+        """search engine summarizer - h-index of no records"""
+        self.assertEqual(calculate_h_index([]), 0)
+
+    def test_h_index_uncited(self):
+        """search engine summarizer - h-index of uncited records"""
+        self.assertEqual(calculate_h_index([0, 0, 0]), 0)
+
+    def test_h_index_all_records(self):
+        """search engine summarizer - h-index equal to the number of records"""
+        self.assertEqual(calculate_h_index([1]), 1)
+        self.assertEqual(calculate_h_index([3, 3, 3]), 3)
+        self.assertEqual(calculate_h_index([5, 10, 100]), 3)
+
+    def test_h_index_bounds(self):
+        """search engine summarizer - h-index with counts equal to h"""
+        self.assertEqual(calculate_h_index([0, 1, 2, 2, 5]), 2)
+        self.assertEqual(calculate_h_index([1, 2, 3, 3, 4]), 3)
+        self.assertEqual(calculate_h_index([2, 2, 2]), 2)
+        self.assertEqual(calculate_h_index([1, 1, 4, 4, 4, 4]), 4)
+
+    def test_count_empty(self):
+        """search engine summarizer - fame breakdown of no records"""
+        for low, high, dummy in CFG_CITESUMMARY_FAME_THRESHOLDS:
+            self.assertEqual(count_records_by_citations([], low, high), 0)
+
+    def test_count_uncited(self):
+        """search engine summarizer - fame breakdown of uncited records"""
+        counts = [0, 0, 0, 0]
+        self.assertEqual(count_records_by_citations(counts, 0, 0), 4)
+        self.assertEqual(count_records_by_citations(counts, 1, 9), 0)
+
+    def test_count_bounds(self):
+        """search engine summarizer - fame breakdown includes both bounds"""
+        counts = [0, 1, 9, 10, 49, 50, 499, 500, 1000000]
+        self.assertEqual(count_records_by_citations(counts, 0, 0), 1)
+        self.assertEqual(count_records_by_citations(counts, 1, 9), 2)
+        self.assertEqual(count_records_by_citations(counts, 10, 49), 2)
+        self.assertEqual(count_records_by_citations(counts, 50, 99), 1)
+        self.assertEqual(count_records_by_citations(counts, 250, 499), 1)
+        self.assertEqual(count_records_by_citations(counts, 500, 1000000), 2)
+        self.assertEqual(count_records_by_citations(counts, 100, 249), 0)
+
+    def test_count_thresholds_partition(self):
+        """search engine summarizer - fame breakdown counts every record once"""
+        counts = [0, 0, 1, 9, 10, 10, 49, 50, 99, 100, 249, 250, 499, 500,
+                  1000000]
+        self.assertEqual(sum([count_records_by_citations(counts, low, high)
+                              for low, high, dummy in
+                              CFG_CITESUMMARY_FAME_THRESHOLDS]),
+                         len(counts))
+
+TEST_SUITE = make_test_suite(TestCitationSummaryCounts,)
+
+if __name__ == "__main__":
+    run_test_suite(TEST_SUITE)
@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+
+## This file is part of Invenio.
+## Copyright (C) 2011 CERN.
+##
+## Invenio is free software; you can redistribute it and/or
+## modify it under the terms of the GNU General Public License as
+## published by the Free Software Foundation; either version 2 of the
+## License, or (at your option) any later version.
+##
+## Invenio is distributed in the hope that it will be useful, but
+## WITHOUT ANY WARRANTY; without even the implied warranty of
+## MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+## General Public License for more details.
+##
+## You should have received a copy of the GNU General Public License
+## along with Invenio; if not, write to the Free Software Foundation, Inc.,
+## 59 Temple Place, Suite 330, Boston, MA 02111-1307, USA.
+
+"""Invenio search engine term dictionaries.
+
+Resolves truncated (e.g. ellis*) and span (e.g. a->b) queries on the
+word indexes in memory.  The term dictionary of a word index is the
+sorted list of its terms, with their IDs in the idxWORDxxF table, so
+that the terms matching a query are found by binary search instead of
+a LIKE or BETWEEN scan of the table, and only their hitlists are
+fetched from the database.
+
+The terms are compared bytewise, whereas MySQL compares them according
+to the collation of the table.  Both orders agree for the terms the
+indexer produces, which are lowercased and stripped of accents.
+"""
+
+__revision__ = "$Id$"
+
+import re
+from array import array
+from bisect import bisect_left, bisect_right
+
+from invenio.data_cacher import IntervalDataCacher
+from invenio.dbquery import run_sql, get_table_update_time
+
+# how many hitlists to fetch per SQL query:
+HITLISTS_PER_QUERY = 1000
+
+# one character of a UTF-8 string, for the '_' wildcard of LIKE:
+UTF8_CHARACTER = '(?:[\x00-\x7f]|[\xc0-\xff][\x80-\xbf]*)'
+
+def get_word_table(index_id):
+    """Return the name of the table of the terms of word index INDEX_ID."""
+    return "idxWORD%02dF" % index_id
+
+def get_term_dictionary_timestamp(index_id):
+    """Return the timestamp of the terms of word index INDEX_ID, i.e.
+       the last update time of the index and of its table of terms."""
+    res = run_sql("SELECT last_updated FROM idxINDEX WHERE id=%s", (index_id,))
+    if res:
+        last_updated = str(res[0][0])
+    else:
+        last_updated = ''
+    return (last_updated, get_table_update_time(get_word_table(index_id)))
+
+def load_term_dictionary(index_id, max_terms):
+    """Return the TermDictionary object of word index INDEX_ID, or None
+       if the index has more than MAX_TERMS terms."""
+    table = get_word_table(index_id)
+    if run_sql("SELECT COUNT(*) FROM %s" % table)[0][0] > max_terms:
+        return None
+    return TermDictionary(run_sql("SELECT id,term FROM %s" % table))
+
+def compile_like_pattern(pattern):
+    """Return the compiled regular expression matching the same strings
+       as the SQL LIKE pattern PATTERN, with '%' and '_' wildcards."""
+    regexp = []
+    for char in pattern:
+        if char == '%':
+            regexp.append('.*')
+        elif char == '_':
+            regexp.append(UTF8_CHARACTER)
+        else:
+            regexp.append(re.escape(char))
+    regexp.append('$')
+    return re.compile(''.join(regexp), re.S)
+
+class TermDictionary:
+    """
+    Sorted terms of a word index, kept compactly: the terms are
+    concatenated in one string, with an array of their offsets in it
+    and an array of their IDs.  The terms can be read as a sequence,
+    self[i] being the i-th term.
+    """
+    def __init__(self, rows):
+        rows = [(term, term_id) for term_id, term in rows if term]
+        rows.sort()
+        self.terms = ''.join([term for term, dummy in rows])
+        self.offsets = array('I', [0])
+        self.ids = array('I')
+        offset = 0
+        for term, term_id in rows:
+            offset += len(term)
+            self.offsets.append(offset)
+            self.ids.append(term_id)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __getitem__(self, i):
+        return self.terms[self.offsets[i]:self.offsets[i + 1]]
+
+    def get_span_term_ids(self, low, high):
+        """Return the list of the IDs of the terms between LOW and HIGH
+           inclusive, as term BETWEEN low AND high selects them."""
+        return self.ids[bisect_left(self, low):bisect_right(self, high)].tolist()
+
+    def get_pattern_term_ids(self, pattern):
+        """Return the list of the IDs of the terms matching the LIKE
+           pattern PATTERN, in the order of the terms."""
+        first_wildcard = len(pattern)
+        for wildcard in ('%', '_'):
+            position = pattern.find(wildcard)
+            if position >= 0 and position < first_wildcard:
+                first_wildcard = position
+        prefix = pattern[:first_wildcard]
+        # the terms starting with the prefix, as no UTF-8 byte is \xff:
+        start = bisect_left(self, prefix)
+        end = bisect_left(self, prefix + '\xff')
+        if pattern[first_wildcard:] == '%':
+            return self.ids[start:end].tolist()
+        regexp = compile_like_pattern(pattern[first_wildcard:])
+        prefix_length = len(prefix)
+        term_ids = []
+        for i in xrange(start, end):
+            if regexp.match(self[i], prefix_length):
+                term_ids.append(self.ids[i])
+        return term_ids
+
+class TermDictionaryCache:
+    """
+    Term dictionaries of the word indexes having at most max_terms
+    terms, loaded when first needed and reloaded when the index was
+    updated, as checked at most every check_interval seconds.
+    """
+    def __init__(self, max_terms, check_interval=60):
+        self.max_terms = max_terms
+        self.check_interval = check_interval
+        self.term_dictionaries = {}
+
+    def get_term_dictionary(self, index_id):
+        """Return the TermDictionary object of word index INDEX_ID, or
+           None if the index has too many terms to be kept in memory."""
+        if not self.max_terms:
+            return None
+        cacher = self.term_dictionaries.get(index_id)
+        if cacher is None:
+            cacher = IntervalDataCacher(lambda: load_term_dictionary(index_id,
+                                                                     self.max_terms),
+                                        lambda: get_term_dictionary_timestamp(index_id),
+                                        self.check_interval)
+            self.term_dictionaries[index_id] = cacher
+        else:
+            cacher.recreate_cache_if_needed()
+        return cacher.cache
+
+def get_term_hitlists(index_id, term_ids):
+    """Return the list of (term, hitlist) pairs of the terms TERM_IDS of
+       word index INDEX_ID."""
+    table = get_word_table(index_id)
+    res = []
+    for i in xrange(0, len(term_ids), HITLISTS_PER_QUERY):
+        chunk = term_ids[i:i + HITLISTS_PER_QUERY]
+        res.extend(run_sql("SELECT term,hitlist FROM %s WHERE id IN (%s)" % \
+                           (table, ','.join(['%s'] * len(chunk))), tuple(chunk)))
+    return res
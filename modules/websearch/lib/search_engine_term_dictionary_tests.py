@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+##
+## This file is part of Invenio.
+## Copyright (C) 2011 CERN.
+##
+## Invenio is free software; you can redistribute it and/or
+## modify it under the terms of the GNU General Public License as
+## published by the Free Software Foundation; either version 2 of the
+## License, or (at your option) any later version.
+##
+## Invenio is distributed in the hope that it will be useful, but
+## WITHOUT ANY WARRANTY; without even the implied warranty of
+## MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+## General Public License for more details.
+##
+## You should have received a copy of the GNU General Public License
+## along with Invenio; if not, write to the Free Software Foundation, Inc.,
+## 59 Temple Place, Suite 330, Boston, MA 02111-1307, USA.
+
+"""Unit tests for the search engine term dictionaries."""
+
+__revision__ = "$Id$"
+
+import unittest
+
+from invenio.search_engine_term_dictionary import TermDictionary, \
+     compile_like_pattern
+from invenio.testutils import make_test_suite, run_test_suite
+
+TERM_ROWS = [(1, 'ellis'), (2, 'muon'), (3, 'ellipse'), (4, 'ell'),
+             (5, 'elliott'), (6, 'boson'), (7, 'm\xc3\xbcon'), (8, 'emu'),
+             (9, 'zeta'), (10, '')]
+
+class TestLikePatterns(unittest.TestCase):
+    """Test the translation of SQL LIKE patterns."""
+
+    def test_wildcards(self):
+        """search engine term dictionary - LIKE wildcards"""
+        self.assert_(compile_like_pattern('el%s').match('ellis'))
+        self.failIf(compile_like_pattern('el%s').match('ellipse'))
+        self.assert_(compile_like_pattern('m_on').match('muon'))
+        self.assert_(compile_like_pattern('m_on').match('m\xc3\xbcon'))
+        self.failIf(compile_like_pattern('m_on').match('mon'))
+        self.assert_(compile_like_pattern('a.b%').match('a.bc'))
+        self.failIf(compile_like_pattern('a.b%').match('axbc'))
+
+class TestTermDictionary(unittest.TestCase):
+    """Test finding the terms of truncated and span queries."""
+
+    def setUp(self):
+        self.dictionary = TermDictionary(TERM_ROWS)
+
+    def test_sorted_terms(self):
+        """search engine term dictionary - sorted terms"""
+        self.assertEqual(list(self.dictionary),
+                         ['boson', 'ell', 'elliott', 'ellipse', 'ellis',
+                          'emu', 'muon', 'm\xc3\xbcon', 'zeta'])
+
+    def test_truncated_terms(self):
+        """search engine term dictionary - truncated queries"""
+        self.assertEqual(self.dictionary.get_pattern_term_ids('ell%'),
+                         [4, 5, 3, 1])
+        self.assertEqual(self.dictionary.get_pattern_term_ids('elli%'),
+                         [5, 3, 1])
+        self.assertEqual(self.dictionary.get_pattern_term_ids('x%'), [])
+        self.assertEqual(len(self.dictionary.get_pattern_term_ids('%')), 9)
+
+    def test_wildcard_terms(self):
+        """search engine term dictionary - inner and leading wildcards"""
+        self.assertEqual(self.dictionary.get_pattern_term_ids('el%e'), [3])
+        self.assertEqual(self.dictionary.get_pattern_term_ids('%on'),
+                         [6, 2, 7])
+        self.assertEqual(self.dictionary.get_pattern_term_ids('m_on'), [2, 7])
+
+    def test_span_terms(self):
+        """search engine term dictionary - span queries"""
+        self.assertEqual(self.dictionary.get_span_term_ids('ellipse', 'muon'),
+                         [3, 1, 8, 2])
+        self.assertEqual(self.dictionary.get_span_term_ids('a', 'c'), [6])
+        self.assertEqual(self.dictionary.get_span_term_ids('c', 'a'), [])
+
+TEST_SUITE = make_test_suite(TestLikePatterns,
+                             TestTermDictionary)
+
+if __name__ == "__main__":
+    run_test_suite(TEST_SUITE)
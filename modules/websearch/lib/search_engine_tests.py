@@ -23,6 +23,7 @@ __revision__ = \
     "$Id$"
 
 import unittest
+from array import array
 
 from invenio import search_engine
 from invenio.testutils import make_test_suite, run_test_suite
@@ -269,10 +270,41 @@ class TestQueryParser(unittest.TestCase):
                     [['+', 'Ellis, J', 'author', 'a']])
 
 
+class TestSortIndex(unittest.TestCase):
+    """Test sorting of records using the sort index."""
+
+    def setUp(self):
+        """Rank records 1 to 6; record 4 is unknown to the index."""
+        self.ranks = array('I', [0, 3, 1, 5, 0, 2, 4])
+
+    def test_sort_value(self):
+        """search engine - sort value of multiple field values"""
+        self.assertEqual(search_engine.get_sort_value(['Ellis, J', 'Smith']),
+                         'ellis, j smith')
+        self.assertEqual(search_engine.get_sort_value(['CERN-TH-1', 'SLAC-2'], 'slac'),
+                         'slac-2')
+
+    def test_sort_by_index(self):
+        """search engine - sorting by sort index"""
+        self.assertEqual(search_engine.sort_records_by_index([1, 2, 3, 5, 6], self.ranks),
+                         [2, 5, 1, 6, 3])
+        self.assertEqual(search_engine.sort_records_by_index([1, 2, 3, 5, 6], self.ranks, 'a'),
+                         [3, 6, 1, 5, 2])
+
+    def test_sort_by_index_unknown_records(self):
+        """search engine - sorting by sort index with records missing from it"""
+        self.assertEqual(search_engine.sort_records_by_index([1, 2, 4, 6, 9], self.ranks),
+                         [2, 1, 6, 4, 9])
+        self.failIf(search_engine.sort_index_covers_p([1, 4], self.ranks))
+        self.failIf(search_engine.sort_index_covers_p([1, 9], self.ranks))
+        self.failUnless(search_engine.sort_index_covers_p([1, 6], self.ranks))
+
+
 TEST_SUITE = make_test_suite(TestWashQueryParameters,
                              TestStripAccents,
                              TestQueryParser,
-                             TestMiscUtilityFunctions)
+                             TestMiscUtilityFunctions,
+                             TestSortIndex)
 
 
 if __name__ == "__main__":
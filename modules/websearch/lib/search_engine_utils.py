@@ -72,3 +72,31 @@ def get_fieldvalues(recIDs, tag, repetitive_values=True):
         for row in res:
             out.append(row[0])
     return out
+
+def get_fieldvalues_in_range(recid_from, recid_to, tag):
+    """
+    Return list of (record ID, field value) tuples for field TAG of
+    all the records whose IDs are between RECID_FROM and RECID_TO,
+    inclusive.  The values of each record come in the same order as
+    with get_fieldvalues(); records are sorted by ID.
+    """
+    if tag == "001___":
+        res = run_sql("SELECT id FROM bibrec WHERE id BETWEEN %s AND %s "
+                      "ORDER BY id", (recid_from, recid_to))
+        return [(row[0], str(row[0])) for row in res]
+    digits = tag[0:2]
+    try:
+        intdigits = int(digits)
+        if intdigits < 0 or intdigits > 99:
+            raise ValueError
+    except ValueError:
+        # invalid tag value asked for
+        return []
+    bx = "bib%sx" % digits
+    bibx = "bibrec_bib%sx" % digits
+    query = "SELECT bibx.id_bibrec, bx.value FROM %s AS bx, %s AS bibx " \
+            "WHERE bibx.id_bibrec BETWEEN %%s AND %%s AND " \
+            "bx.id=bibx.id_bibxxx AND bx.tag LIKE %%s " \
+            "ORDER BY bibx.id_bibrec, bibx.field_number, bx.tag ASC" % \
+            (bx, bibx)
+    return list(run_sql(query, (recid_from, recid_to, tag)))
@@ -47,8 +47,12 @@ from invenio.search_engine import perform_request_search, \
     guess_primary_collection_of_a_record, guess_collection_of_a_record, \
     collection_restricted_p, get_permitted_restricted_collections, \
     search_pattern, search_unit, search_unit_in_bibrec, \
-    wash_colls
+    wash_colls, print_record, iterate_printed_records, record_exists, \
+    records_exist
 from invenio.search_engine_utils import get_fieldvalues
+from invenio.bibformat_dblayer import get_preformatted_record, \
+    get_preformatted_records
+from invenio.dbquery import run_sql
 
 def parse_url(url):
     parts = urlparse.urlparse(url)
@@ -1886,6 +1890,84 @@ class WebSearchWashCollectionsTest(unittest.TestCase):
             sorted(wash_colls(cc='', c=['Books & Reports', 'Theses'])[2]),
             ['Books & Reports', 'Theses'])
 
+class WebSearchPrintRecordsTest(unittest.TestCase):
+    """Check that pages of records printed at once are printed as
+    print_record() prints each of their records."""
+
+    # the demo records and a missing one
+    recids = range(1, 105) + [1234567809]
+
+    def setUp(self):
+        """Mark demo record 10 as deleted."""
+        self.deleted_recid = 10
+        self.bibxxx_id = run_sql("INSERT INTO bib98x (tag, value) "
+                                 "VALUES ('980__c', 'DELETED')")
+        run_sql("INSERT INTO bibrec_bib98x (id_bibrec, id_bibxxx, field_number) "
+                "VALUES (%s, %s, 1)", (self.deleted_recid, self.bibxxx_id))
+
+    def tearDown(self):
+        """Restore demo record 10."""
+        run_sql("DELETE FROM bibrec_bib98x WHERE id_bibxxx=%s", (self.bibxxx_id,))
+        run_sql("DELETE FROM bib98x WHERE id=%s", (self.bibxxx_id,))
+
+    def assert_printed_as_print_record(self, of, ln=CFG_SITE_LANG, user_info=None):
+        """Compare the records printed at once with print_record()."""
+        expected = [print_record(recid, of, ln=ln, user_info=user_info)
+                    for recid in self.recids]
+        printed = list(iterate_printed_records(self.recids, of, ln=ln,
+                                               user_info=user_info))
+        self.assertEqual(len(printed), len(expected))
+        for recid, record, expected_record in zip(self.recids, printed, expected):
+            self.assertEqual(record, expected_record,
+                             "record %s printed in %s differs" % (recid, of))
+        return printed
+
+    def test_records_exist(self):
+        """websearch - existence of records checked at once"""
+        existence = records_exist(self.recids)
+        self.assertEqual(existence[self.deleted_recid], -1)
+        self.assertEqual(existence[1234567809], 0)
+        for recid in self.recids:
+            self.assertEqual(existence[recid], record_exists(recid))
+
+    def test_get_preformatted_records(self):
+        """websearch - preformatted records fetched at once"""
+        for of in ('hb', 'xm', 'hx'):
+            expected = {}
+            for recid in self.recids:
+                out = get_preformatted_record(recid, of)
+                if out is not None:
+                    expected[recid] = out
+            self.assertEqual(get_preformatted_records(self.recids, of), expected)
+
+    def test_print_preformatted_records(self):
+        """websearch - preformatted records printed at once"""
+        for of in ('hb', 'hd', 'xm'):
+            printed = self.assert_printed_as_print_record(of)
+            self.assertEqual(printed[-1], '')
+
+    def test_print_deleted_record(self):
+        """websearch - deleted records printed at once"""
+        printed = self.assert_printed_as_print_record('hb')
+        self.failUnless('deleted' in printed[self.recids.index(self.deleted_recid)])
+
+    def test_print_records_on_the_fly(self):
+        """websearch - records formatted on the fly printed at once"""
+        self.assert_printed_as_print_record('hb', ln='fr')
+        self.assert_printed_as_print_record('hx')
+        self.assert_printed_as_print_record('xd')
+
+    def test_print_xm_hidden_fields(self):
+        """websearch - hidden fields of records printed at once in MARCXML"""
+        from invenio.webuser import get_uid_from_email, collect_user_info
+        # without user, e.g. from the command line, nothing is hidden
+        printed = self.assert_printed_as_print_record('xm')
+        self.failUnless('<datafield tag="595"' in printed[0])
+        hyde = collect_user_info(get_uid_from_email('hyde@cds.cern.ch'))
+        printed = self.assert_printed_as_print_record('xm', user_info=hyde)
+        for record in printed:
+            self.failIf('<datafield tag="595"' in record)
+
 TEST_SUITE = make_test_suite(WebSearchWebPagesAvailabilityTest,
                              WebSearchTestSearch,
                              WebSearchTestBrowse,
@@ -1923,7 +2005,8 @@ TEST_SUITE = make_test_suite(WebSearchWebPagesAvailabilityTest,
                              WebSearchDateQueryTest,
                              WebSearchTestWildcardLimit,
                              WebSearchSynonymQueryTest,
-                             WebSearchWashCollectionsTest)
+                             WebSearchWashCollectionsTest,
+                             WebSearchPrintRecordsTest)
 
 if __name__ == "__main__":
     run_test_suite(TEST_SUITE, warn_user=True)
@@ -27,6 +27,8 @@ import re
 import os
 import string
 import time
+import zlib
+from array import array
 
 from invenio.config import \
      CFG_CERN_SITE, \
@@ -40,13 +42,16 @@ from invenio.config import \
      CFG_WEBSEARCH_ENABLED_SEARCH_INTERFACES, \
      CFG_WEBSEARCH_DEFAULT_SEARCH_INTERFACE
 from invenio.messages import gettext_set_language, language_list_long
-from invenio.search_engine import HitSet, search_pattern_parenthesised, get_creation_date, get_field_i18nname, collection_restricted_p, sort_records
-from invenio.dbquery import run_sql, Error, get_table_update_time
+from invenio.search_engine import HitSet, search_pattern_parenthesised, get_creation_date, get_field_i18nname, collection_restricted_p, sort_records, \
+     get_sort_field_tags, wash_sort_field_values, get_sort_value
+from invenio.search_engine_utils import get_fieldvalues_in_range
+from invenio.dbquery import run_sql, Error, get_table_update_time, blob_to_string
 from invenio.bibrank_record_sorter import get_bibrank_methods
 from invenio.dateutils import convert_datestruct_to_dategui
 from invenio.bibformat import format_record
 from invenio.shellutils import mymkdir
 from invenio.intbitset import intbitset
+from invenio.search_engine_reclist_file import write_reclist_file, CFG_RECLIST_FILE
 from invenio.websearch_external_collections import \
      external_collection_load_states, \
      dico_collection_external_searches, \
@@ -80,6 +85,10 @@ CFG_CACHE_LAST_UPDATED_TIMESTAMP_FILE = "%s/collections/last_updated" % CFG_CACH
 # timestamp file usef when running webcoll in the fast-mode.
 CFG_CACHE_LAST_FAST_UPDATED_TIMESTAMP_FILE = "%s/collections/last_fast_updated" % CFG_CACHEDIR
 
+# CFG_SORT_INDEX_CHUNK_SIZE -- number of records whose sort field
+# values are fetched at once when building the sort indexes:
+CFG_SORT_INDEX_CHUNK_SIZE = 10000
+
 
 def get_collection(colname):
     """Return collection object from the collection house for given colname.
@@ -820,6 +829,83 @@ class Collection:
         self.update_reclist_run_already = 1
         return 0
 
+def get_sort_index_fields():
+    "Return the list of field codes that are sort options of some collection."
+    res = run_sql("""SELECT DISTINCT(f.code) FROM field AS f, collection_field_fieldvalue AS cff
+                      WHERE cff.type='soo' AND cff.id_field=f.id ORDER BY f.code""")
+    return [row[0] for row in res if row[0] and row[0] != "anyfield"]
+
+def calculate_sort_index(tags):
+    """Return the sort index for the list of MARC tags 'tags': an array
+       mapping every recID to its rank, starting from 1, when sorting
+       all records by these tags the way sort_records() does."""
+    res = run_sql("SELECT MAX(id) FROM bibrec")
+    max_recID = 0
+    if res and res[0][0]:
+        max_recID = res[0][0]
+    values = []
+    for recid_from in range(1, max_recID + 1, CFG_SORT_INDEX_CHUNK_SIZE):
+        recid_to = recid_from + CFG_SORT_INDEX_CHUNK_SIZE - 1
+        vals = {}
+        for row in run_sql("SELECT id FROM bibrec WHERE id BETWEEN %s AND %s",
+                           (recid_from, recid_to)):
+            vals[row[0]] = []
+        for tag in tags:
+            for recID, value in get_fieldvalues_in_range(recid_from, recid_to, tag):
+                if vals.has_key(recID):
+                    vals[recID].extend(wash_sort_field_values(tag, [value]))
+        for recID, recID_vals in vals.items():
+            values.append((get_sort_value(recID_vals), recID))
+        task_sleep_now_if_required()
+    # equal values are ranked by recID, as sort_records() does for hitsets:
+    values.sort()
+    ranks = array('I', [0]) * (max_recID + 1)
+    rank = 0
+    for val, recID in values:
+        rank += 1
+        ranks[recID] = rank
+    return ranks
+
+def update_sort_indexes():
+    "Rebuild the sort indexes of all sort options and drop the unused ones."
+    fields = get_sort_index_fields()
+    keys = []
+    i = 0
+    for field in fields:
+        i += 1
+        tags = get_sort_field_tags(field)
+        if not tags:
+            continue
+        key = string.join(tags, ",")
+        if key in keys:
+            continue
+        keys.append(key)
+        write_message("%s / sort index update" % field)
+        ranks = calculate_sort_index(tags)
+        run_sql("REPLACE INTO sortindex (tags, ranks, last_updated) VALUES (%s, %s, NOW())",
+                (key, zlib.compress(ranks.tostring())))
+        task_update_progress("Part 3/3: done %d/%d" % (i, len(fields)))
+        task_sleep_now_if_required(can_stop_too=True)
+    for row in run_sql("SELECT tags FROM sortindex"):
+        if row[0] not in keys:
+            run_sql("DELETE FROM sortindex WHERE tags=%s", (row[0],))
+
+def update_reclist_file():
+    "Export the reclists of all collections into the reclist file mapped by the search engine."
+    write_message("exporting collection reclists into %s" % CFG_RECLIST_FILE, verbose=3)
+    # the timestamp is read first, so that the file looks outdated if
+    # the reclists change while being exported:
+    timestamp = get_table_update_time('collection')
+    def get_reclist(name):
+        res = run_sql("SELECT reclist FROM collection WHERE name=%s", (name,), 1)
+        if res:
+            return blob_to_string(res[0][0])
+        return None
+    mymkdir(os.path.dirname(CFG_RECLIST_FILE))
+    write_reclist_file(CFG_RECLIST_FILE, timestamp,
+                       [row[0] for row in run_sql("SELECT name FROM collection")],
+                       get_reclist)
+
 def get_datetime(var, format_string="%Y-%m-%d %H:%M:%S"):
     """Returns a date string according to the format string.
        It can handle normal date strings and shifts with respect
@@ -914,14 +1000,16 @@ def main():
     given collection plus web page elements) based on invenio.conf and DB
     configuration parameters. If the collection name is passed as an argument,
     only this collection's cache will be updated. If the recursive option is
-    set as well, the collection's descendants will also be updated.\n""",
+    set as well, the collection's descendants will also be updated.
+    Unless a collection is given, webcoll also rebuilds the sort indexes
+    of the sort options, which let sets of any size be sorted.\n""",
             help_specific_usage="  -c, --collection\t Update cache for the given "
                      "collection only. [all]\n"
                     "  -r, --recursive\t Update cache for the given collection and all its\n"
                     "\t\t\t descendants (to be used in combination with -c). [no]\n"
                     "  -f, --force\t\t Force update even if cache is up to date. [no]\n"
                     "  -p, --part\t\t Update only certain cache parts (1=reclist,"
-                    " 2=webpage). [both]\n"
+                    " 2=webpage, 3=sort index). [all]\n"
                     "  -l, --language\t Update pages in only certain language"
                     " (e.g. fr,it,...). [all]\n",
             version=__revision__,
@@ -1036,8 +1124,9 @@ def task_run_core():
                     coll.calculate_reclist()
                 task_sleep_now_if_required()
                 coll.update_reclist()
-                task_update_progress("Part 1/2: done %d/%d" % (i, len(colls)))
+                task_update_progress("Part 1/3: done %d/%d" % (i, len(colls)))
                 task_sleep_now_if_required(can_stop_too=True)
+            update_reclist_file()
         # thirdly, update collection webpage cache:
         if task_get_option("part", 2) == 2:
             i = 0
@@ -1045,8 +1134,11 @@ def task_run_core():
                 i += 1
                 write_message("%s / webpage cache update" % coll.name)
                 coll.update_webpage_cache()
-                task_update_progress("Part 2/2: done %d/%d" % (i, len(colls)))
+                task_update_progress("Part 2/3: done %d/%d" % (i, len(colls)))
                 task_sleep_now_if_required(can_stop_too=True)
+        # fourthly, update sort indexes, which are not per collection:
+        if task_get_option("part", 3) == 3 and not task_has_option("collection"):
+            update_sort_indexes()
 
         # finally update the cache last updated timestamp:
         # (but only when all collections were updated, not when only
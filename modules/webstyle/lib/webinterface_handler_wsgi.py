@@ -42,6 +42,7 @@ from invenio.webinterface_handler_config import \
 from invenio.config import CFG_WEBDIR, CFG_SITE_LANG, \
     CFG_WEBSTYLE_HTTP_STATUS_ALERT_LIST, CFG_DEVEL_SITE, CFG_SITE_URL
 from invenio.errorlib import register_exception, get_pretty_traceback
+from invenio.dbquery import release_connection
 
 ## Static files are usually handled directly by the webserver (e.g. Apache)
 ## However in case WSGI is required to handle static files too (such
@@ -413,6 +414,8 @@ def application(environ, start_response):
     finally:
         for (callback, data) in req.get_cleanups():
             callback(data)
+        ## give the DB connection of this thread back to the pool:
+        release_connection()
     return []
 
 def generate_error_page(req, admin_was_alerted=True, page_already_started=False):